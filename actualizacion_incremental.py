@@ -0,0 +1,273 @@
+import csv
+import os
+import re
+import sqlite3
+from datetime import date, timedelta
+
+import pandas as pd
+
+from esquema_partidos import crear_indices, tipar_dataframe, tipo_columna
+from fetchers import como_dataframe
+from main import match_logs_filename
+
+# Un partido de un jugador se identifica por (jugador, Fecha, Comp, Equipo, Adversario)
+CLAVE_PARTIDO = ['Fecha', 'Comp', 'Equipo', 'Adversario']
+FECHA_RE = re.compile(r'^\d{4}-\d{2}-\d{2}$')
+
+def nombre_clave(player_name):
+    """Nombre tal como queda en jugadores.nombre_completo (derivado del CSV)"""
+    base = os.path.basename(match_logs_filename(player_name))
+    return base[:-len("_partidos.csv")].replace("_", " ").strip()
+
+def tabla_jugador(player_name):
+    """Tabla <jugador>_partidos, con el mismo nombre que le da guardar_jugadores.py al CSV"""
+    return os.path.basename(match_logs_filename(player_name))[:-len(".csv")]
+
+# ---------------------------------------------------------------------------
+# ÚLTIMA FECHA GUARDADA POR JUGADOR
+# ---------------------------------------------------------------------------
+def ultimas_fechas_db(conn):
+    """{nombre_completo: última Fecha} a partir de la tabla partidos"""
+    try:
+        rows = conn.execute("""
+            SELECT j.nombre_completo, MAX(p."Fecha")
+            FROM partidos p JOIN jugadores j ON j.jugador_id = p.jugador_id
+            WHERE p."Fecha" GLOB '[0-9][0-9][0-9][0-9]-[0-9][0-9]-[0-9][0-9]'
+            GROUP BY j.nombre_completo
+        """).fetchall()
+    except sqlite3.Error:
+        return {}
+    return dict(rows)
+
+def ultima_fecha_csv(filename):
+    """Última Fecha válida de un CSV de partidos, o None"""
+    if not os.path.exists(filename):
+        return None
+    with open(filename, newline='', encoding='utf-8-sig') as f:
+        fechas = [row.get('Fecha', '') for row in csv.DictReader(f)]
+    fechas = [fecha for fecha in fechas if FECHA_RE.match(fecha)]
+    return max(fechas) if fechas else None
+
+def filas_recientes(df, desde, ventana_dias=14):
+    """Filas con fecha válida posteriores a `desde` menos una ventana.
+
+    La ventana vuelve a comparar los últimos partidos ya guardados porque
+    fbref corrige estadísticas unos días después de jugarse.
+    """
+    df = df[df['Fecha'].str.match(FECHA_RE)]
+    if desde:
+        limite = (date.fromisoformat(desde) - timedelta(days=ventana_dias)).isoformat()
+        df = df[df['Fecha'] >= limite]
+    return df
+
+# ---------------------------------------------------------------------------
+# UPSERT EN CSV
+# ---------------------------------------------------------------------------
+def upsert_match_logs_csv(df, player_name, output_dir='partidos_data'):
+    """Añade o corrige filas en <nombre>_partidos.csv sin reescribir lo demás.
+
+    Devuelve (nuevas, cambiadas). Si solo hay filas nuevas con las mismas
+    columnas se añaden al final del archivo; si no, se reescribe.
+    """
+    os.makedirs(output_dir, exist_ok=True)
+    filename = match_logs_filename(player_name, output_dir)
+    if not os.path.exists(filename):
+        df.to_csv(filename, index=False, encoding='utf-8-sig')
+        return len(df), 0
+
+    actual = pd.read_csv(filename, dtype=str, keep_default_na=False, encoding='utf-8-sig')
+    mismas_columnas = all(col in actual.columns for col in df.columns)
+    columnas = list(actual.columns) + [col for col in df.columns if col not in actual.columns]
+    actual = actual.reindex(columns=columnas, fill_value='')
+    df = df.reindex(columns=columnas, fill_value='')
+
+    posiciones = {tuple(row): i for i, row in enumerate(actual[CLAVE_PARTIDO].itertuples(index=False))}
+    nuevas = []
+    cambiadas = 0
+    for row in df.itertuples(index=False):
+        row = list(row)
+        key = tuple(row[columnas.index(col)] for col in CLAVE_PARTIDO)
+        i = posiciones.get(key)
+        if i is None:
+            nuevas.append(row)
+        elif list(actual.iloc[i]) != row:
+            actual.iloc[i] = row
+            cambiadas += 1
+
+    if cambiadas == 0 and mismas_columnas:
+        if nuevas:
+            with open(filename, 'a', newline='', encoding='utf-8') as f:
+                csv.writer(f).writerows(nuevas)
+    elif nuevas or cambiadas:
+        actual = pd.concat([actual, pd.DataFrame(nuevas, columns=columnas)], ignore_index=True)
+        actual.to_csv(filename, index=False, encoding='utf-8-sig')
+    return len(nuevas), cambiadas
+
+# ---------------------------------------------------------------------------
+# UPSERT EN SQLITE
+# ---------------------------------------------------------------------------
+def apartar_duplicados(conn, tabla, clave):
+    """Mueve a <tabla>_duplicados las filas que repiten la clave de otra
+    (se queda en la tabla la primera de cada partido). Devuelve cuántas."""
+    columnas = ", ".join(f'"{col}"' for col in clave)
+    apartadas = f"{tabla}_duplicados"
+    existentes = [col[1] for col in conn.execute(f'PRAGMA table_info("{tabla}")')]
+    conn.execute(f'CREATE TABLE IF NOT EXISTS "{apartadas}" AS SELECT * FROM "{tabla}" WHERE 0')
+    ya_apartadas = {col[1] for col in conn.execute(f'PRAGMA table_info("{apartadas}")')}
+    for col in existentes:
+        if col not in ya_apartadas:
+            conn.execute(f'ALTER TABLE "{apartadas}" ADD COLUMN "{col}"')
+    # Las claves con NULL no chocan en el índice único: esas filas se quedan
+    condicion = (f'rowid NOT IN (SELECT MIN(rowid) FROM "{tabla}" GROUP BY {columnas}) AND '
+                 + " AND ".join(f'"{col}" IS NOT NULL' for col in clave))
+    lista = ", ".join(f'"{col}"' for col in existentes)
+    conn.execute(f'INSERT INTO "{apartadas}" ({lista}) SELECT {lista} FROM "{tabla}" WHERE {condicion}')
+    return conn.execute(f'DELETE FROM "{tabla}" WHERE {condicion}').rowcount
+
+def asegurar_clave_unica(conn, tabla, clave):
+    """Crea el índice único de la clave. Si ya hay filas duplicadas no se
+    borran: pasan a <tabla>_duplicados para revisarlas."""
+    columnas = ", ".join(f'"{col}"' for col in clave)
+    indice = f"idx_{tabla}_clave"
+    try:
+        conn.execute(f'CREATE UNIQUE INDEX IF NOT EXISTS "{indice}" ON "{tabla}" ({columnas})')
+    except sqlite3.IntegrityError:
+        apartadas = apartar_duplicados(conn, tabla, clave)
+        print(f"⚠ {apartadas} filas duplicadas en '{tabla}' movidas a '{tabla}_duplicados'; "
+              f"queda la primera de cada partido")
+        conn.execute(f'CREATE UNIQUE INDEX "{indice}" ON "{tabla}" ({columnas})')
+
+def upsert_rows(conn, tabla, df, clave):
+    """Inserta filas nuevas y actualiza solo las que cambiaron.
+
+    Las columnas que aún no existen en la tabla se añaden con ALTER TABLE
+    usando su tipo del esquema. Devuelve el número de filas insertadas o
+    modificadas.
+    """
+    existentes = {col[1] for col in conn.execute(f'PRAGMA table_info("{tabla}")')}
+    for col in df.columns:
+        if col not in existentes:
+            conn.execute(f'ALTER TABLE "{tabla}" ADD COLUMN "{col}" {tipo_columna(col) or "TEXT"}')
+    asegurar_clave_unica(conn, tabla, clave)
+
+    columnas = list(df.columns)
+    lista = ", ".join(f'"{col}"' for col in columnas)
+    lista_clave = ", ".join(f'"{col}"' for col in clave)
+    placeholders = ", ".join(["?"] * len(columnas))
+    resto = [col for col in columnas if col not in clave]
+    if resto:
+        conflicto = (
+            "DO UPDATE SET " + ", ".join(f'"{col}" = excluded."{col}"' for col in resto)
+            + " WHERE " + " OR ".join(f'"{tabla}"."{col}" IS NOT excluded."{col}"' for col in resto)
+        )
+    else:
+        conflicto = "DO NOTHING"
+    sql = (f'INSERT INTO "{tabla}" ({lista}) VALUES ({placeholders}) '
+           f'ON CONFLICT({lista_clave}) {conflicto}')
+
+    data = [tuple(None if pd.isna(value) or value in ('', 'nan') else value for value in row)
+            for row in df.astype(object).itertuples(index=False, name=None)]
+    antes = conn.total_changes
+    conn.executemany(sql, data)
+    return conn.total_changes - antes
+
+def jugador_id_para(conn, player_name):
+    """jugador_id de un jugador; lo registra en jugadores si no existe"""
+    nombre = nombre_clave(player_name)
+    conn.execute("""
+        CREATE TABLE IF NOT EXISTS jugadores (
+            jugador_id INTEGER PRIMARY KEY AUTOINCREMENT,
+            nombre_completo TEXT UNIQUE
+        )
+    """)
+    conn.execute("INSERT OR IGNORE INTO jugadores (nombre_completo) VALUES (?)", (nombre,))
+    return conn.execute("SELECT jugador_id FROM jugadores WHERE nombre_completo = ?", (nombre,)).fetchone()[0]
+
+# ---------------------------------------------------------------------------
+# REFRESCO INCREMENTAL
+# ---------------------------------------------------------------------------
+class IncrementalWriter:
+    """Escritor para crawl_players que solo guarda partidos nuevos o corregidos.
+
+    En la base escribe en la tabla <jugador>_partidos, que es la fuente de
+    sus filas en 'partidos'; refrescar_jugadores las lleva después a
+    'partidos' con la unión incremental (unir_partidos.py).
+    """
+
+    def __init__(self, db_path='mi_base_de_datos.db', output_dir='partidos_data', ventana_dias=14):
+        self.output_dir = output_dir
+        self.ventana_dias = ventana_dias
+        self.conn = sqlite3.connect(db_path, check_same_thread=False)
+        self.ultimas = ultimas_fechas_db(self.conn)
+        self.tiene_partidos = bool(self.conn.execute(
+            "SELECT 1 FROM sqlite_master WHERE type='table' AND name='partidos'").fetchone())
+        self.totales = {'nuevas': 0, 'cambiadas': 0, 'filas_db': 0}
+
+    def __call__(self, df, player_name):
+        try:
+            df = como_dataframe(df)
+            desde = (self.ultimas.get(nombre_clave(player_name))
+                     or ultima_fecha_csv(match_logs_filename(player_name, self.output_dir)))
+            df = filas_recientes(df, desde, self.ventana_dias)
+            if df.empty:
+                print(f"= Sin partidos nuevos para {player_name}")
+                return True
+
+            nuevas, cambiadas = upsert_match_logs_csv(df, player_name, self.output_dir)
+            self.totales['nuevas'] += nuevas
+            self.totales['cambiadas'] += cambiadas
+
+            if self.tiene_partidos:
+                tabla = tabla_jugador(player_name)
+                df = tipar_dataframe(df).assign(jugador_id=jugador_id_para(self.conn, player_name))
+                columnas = ", ".join(f'"{col}" {tipo_columna(col) or "TEXT"}' for col in df.columns)
+                self.conn.execute(f'CREATE TABLE IF NOT EXISTS "{tabla}" ({columnas})')
+                self.totales['filas_db'] += upsert_rows(self.conn, tabla, df, CLAVE_PARTIDO)
+                crear_indices(self.conn, tabla)
+                self.conn.commit()
+            print(f"+ {player_name}: {nuevas} partidos nuevos, {cambiadas} corregidos")
+            return True
+        except Exception as e:
+            print(f"Error en la actualización incremental de {player_name}: {e}")
+            return False
+
+    def close(self):
+        self.conn.close()
+
+def refrescar_jugadores(csv_path='jugadores_activos_colombianos.csv', num_players=None,
+                        db_path='mi_base_de_datos.db', output_dir='partidos_data',
+                        concurrency=8, ventana_dias=14, fetcher=None, players=None, journal=None):
+    """Trae la temporada actual de cada jugador y guarda solo lo nuevo.
+
+    players: lista de (nombre, href) a refrescar en lugar de los primeros
+    num_players del CSV (p. ej. la que arma planificador_refresco.py).
+    journal: CrawlJournal donde queda registrado cada resultado.
+    """
+    from crawler_async import run_crawl
+    from fetchers import default_fetcher
+
+    if players is None:
+        roster = pd.read_csv(csv_path)
+        if num_players:
+            roster = roster.head(num_players)
+        players = list(zip(roster['nombre'], roster['href']))
+
+    writer = IncrementalWriter(db_path, output_dir, ventana_dias)
+    fetcher = fetcher or default_fetcher(selenium_workers=1)
+    try:
+        results = run_crawl(players, writer, fetcher=fetcher, concurrency=concurrency, journal=journal)
+    finally:
+        fetcher.close()
+        writer.close()
+
+    t = writer.totales
+    print(f"\nActualización incremental: {t['nuevas']} partidos nuevos, {t['cambiadas']} corregidos, "
+          f"{t['filas_db']} filas escritas en las tablas de jugadores")
+    if t['filas_db']:
+        from unir_partidos import crear_tabla_partidos
+
+        crear_tabla_partidos(db_path)
+    return results
+
+if __name__ == "__main__":
+    refrescar_jugadores()
@@ -0,0 +1,282 @@
+import sqlite3
+import time
+
+import numpy as np
+import pandas as pd
+
+from esquema_partidos import rango_temporada, sql_temporada, temporadas_serie
+
+# ---------------------------------------------------------------------------
+# CONFIGURACIÓN
+# ---------------------------------------------------------------------------
+db_path = "mi_base_de_datos.db"
+VENTANA_FORMA = 5            # partidos de la forma reciente
+TODAS = '(todas)'            # Comp de las filas que suman todas las competiciones
+
+# Columna de partidos -> nombre en los resúmenes
+ESTADISTICAS = {
+    'Mín': 'minutos',
+    'Gls.': 'goles',
+    'Ass': 'asistencias',
+    'Dis': 'disparos',
+    'DaP': 'disparos_puerta',
+    'xG': 'xg',
+    'npxG': 'npxg',
+    'xAG': 'xag',
+}
+POR_90 = ['goles', 'asistencias', 'g_a', 'disparos', 'xg', 'npxg', 'xag']
+FORMA = ['minutos', 'goles', 'asistencias', 'g_a', 'xg']
+
+# ---------------------------------------------------------------------------
+# TABLAS MATERIALIZADAS Y SEGUIMIENTO DE CAMBIOS
+# ---------------------------------------------------------------------------
+# resumen_jugador: una fila por (jugador_id, temporada, Comp) más una por
+# temporada con Comp = '(todas)'. forma_jugador: por partido, la suma de los
+# últimos VENTANA_FORMA partidos del jugador; forma_actual es su último
+# partido. Los triggers de partidos apuntan en agregados_pendientes qué
+# (jugador, temporada) cambiaron desde la última actualización. La temporada
+# es la de la competición (esquema_partidos.temporada_partido): 2024 es la
+# 2024-2025 de la Premier League y la 2024 de la Primera A.
+COLUMNAS_RESUMEN = (
+    ['jugador_id', 'temporada', 'Comp', 'partidos', 'titular']
+    + list(ESTADISTICAS.values()) + ['g_a'] + [f"{col}_90" for col in POR_90]
+    + ['partidos_equipo', 'pct_minutos']
+)
+COLUMNAS_FORMA = ['jugador_id', 'Fecha', 'Comp', 'partidos_n'] + [f"{col}_n" for col in FORMA] + ['g_a_90_n']
+TRIGGERS = ['trg_partidos_temporada_ins', 'trg_partidos_temporada_upd', 'trg_partidos_temporada_del']
+# Versión anterior (temporada = año de la fecha): si siguen instalados se
+# borran y los resúmenes se recalculan completos
+TRIGGERS_ANTIGUOS = ['trg_partidos_agregados_ins', 'trg_partidos_agregados_upd', 'trg_partidos_agregados_del']
+
+def crear_tablas(conn):
+    reales = ", ".join(f'"{col}" REAL' for col in COLUMNAS_RESUMEN[5:])
+    conn.execute(f"""
+        CREATE TABLE IF NOT EXISTS resumen_jugador (
+            jugador_id INTEGER, temporada INTEGER, Comp TEXT, partidos INTEGER, titular INTEGER,
+            {reales},
+            PRIMARY KEY (jugador_id, temporada, Comp)
+        )
+    """)
+    conn.execute("CREATE INDEX IF NOT EXISTS idx_resumen_temporada ON resumen_jugador (temporada, Comp)")
+    reales = ", ".join(f'"{col}" REAL' for col in COLUMNAS_FORMA[4:])
+    conn.execute(f"""
+        CREATE TABLE IF NOT EXISTS forma_jugador (
+            jugador_id INTEGER, Fecha TEXT, Comp TEXT, partidos_n INTEGER,
+            {reales}
+        )
+    """)
+    conn.execute("CREATE INDEX IF NOT EXISTS idx_forma_jugador ON forma_jugador (jugador_id, Fecha)")
+    conn.execute("""
+        CREATE VIEW IF NOT EXISTS forma_actual AS
+        SELECT f.* FROM forma_jugador f
+        WHERE f.rowid = (SELECT g.rowid FROM forma_jugador g WHERE g.jugador_id = f.jugador_id
+                         ORDER BY g.Fecha DESC, g.rowid DESC LIMIT 1)
+    """)
+    conn.execute("""
+        CREATE TABLE IF NOT EXISTS agregados_pendientes (
+            jugador_id INTEGER,
+            temporada INTEGER,
+            PRIMARY KEY (jugador_id, temporada)
+        )
+    """)
+
+def instalar_triggers(conn):
+    for nombre in TRIGGERS_ANTIGUOS:
+        conn.execute(f"DROP TRIGGER IF EXISTS {nombre}")
+    for nombre, evento, filas in zip(TRIGGERS, ('INSERT', 'UPDATE', 'DELETE'),
+                                     (['NEW'], ['NEW', 'OLD'], ['OLD'])):
+        inserts = "\n".join(
+            f"INSERT OR IGNORE INTO agregados_pendientes VALUES ({fila}.jugador_id, {sql_temporada(fila)});"
+            for fila in filas)
+        conn.execute(f"""
+            CREATE TRIGGER IF NOT EXISTS {nombre} AFTER {evento} ON partidos
+            BEGIN
+                {inserts}
+            END
+        """)
+
+# ---------------------------------------------------------------------------
+# LECTURA DE PARTIDOS
+# ---------------------------------------------------------------------------
+def cargar_partidos(conn, temporadas=None, jugadores=None):
+    """Filas de partidos con fecha válida y las estadísticas como números.
+
+    temporadas/jugadores limitan la lectura (usa los índices por Fecha y por
+    jugador_id); las columnas que la tabla no tiene llegan como NaN.
+    """
+    existentes = {col[1] for col in conn.execute("PRAGMA table_info(partidos)")}
+    columnas = ['jugador_id', 'Fecha', 'Comp', 'Equipo', 'Arranque'] + list(ESTADISTICAS)
+    seleccion = ", ".join(f'"{col}"' if col in existentes else f'NULL AS "{col}"' for col in columnas)
+    condiciones = ["Fecha GLOB '[0-9][0-9][0-9][0-9]-*'", "jugador_id IS NOT NULL"]
+    parametros = []
+    if temporadas is not None:
+        rangos = " OR ".join("Fecha BETWEEN ? AND ?" for _ in temporadas)
+        condiciones.append(f"({rangos or '0'})")
+        for temporada in temporadas:
+            parametros += list(rango_temporada(temporada))
+    if jugadores is not None:
+        condiciones.append(f"jugador_id IN ({', '.join('?' * len(jugadores)) or 'NULL'})")
+        parametros += list(jugadores)
+    df = pd.read_sql_query(f"SELECT {seleccion} FROM partidos WHERE {' AND '.join(condiciones)}",
+                           conn, params=parametros)
+    df = df.rename(columns=ESTADISTICAS)
+    for col in ESTADISTICAS.values():
+        df[col] = pd.to_numeric(df[col], errors='coerce')
+    df['jugador_id'] = df['jugador_id'].astype('int64')
+    df['temporada'] = temporadas_serie(df['Fecha'], df['Comp']).astype('int64')
+    if temporadas is not None:
+        # El rango de fechas abarca dos temporadas de año calendario
+        df = df[df['temporada'].isin(temporadas)].reset_index(drop=True)
+    df['titular'] = df['Arranque'].astype(str).str.startswith('Sí').astype('int64')
+    df['g_a'] = df['goles'].fillna(0) + df['asistencias'].fillna(0)
+    return df
+
+# ---------------------------------------------------------------------------
+# CÁLCULOS VECTORIZADOS
+# ---------------------------------------------------------------------------
+def partidos_equipo(df):
+    """Partidos distintos (fechas) de cada equipo por temporada y Comp, con
+    los de todas las competiciones en Comp = TODAS"""
+    todas = df.assign(Comp=TODAS)
+    ambos = pd.concat([df, todas], ignore_index=True)
+    return (ambos.groupby(['temporada', 'Comp', 'Equipo'], dropna=False)['Fecha'].nunique()
+            .rename('partidos_equipo').reset_index())
+
+def resumen(df, equipos=None):
+    """Resumen por (jugador_id, temporada, Comp) más los totales de temporada.
+
+    equipos: salida de partidos_equipo() sobre todos los partidos de esas
+    temporadas (por defecto, los de df).
+    """
+    if df.empty:
+        return pd.DataFrame(columns=COLUMNAS_RESUMEN)
+    equipos = partidos_equipo(df) if equipos is None else equipos
+    ambos = pd.concat([df, df.assign(Comp=TODAS)], ignore_index=True)
+    clave = ['jugador_id', 'temporada', 'Comp']
+
+    sumas = {col: (col, 'sum') for col in list(ESTADISTICAS.values()) + ['g_a', 'titular']}
+    res = ambos.groupby(clave).agg(partidos=('Fecha', 'size'), **sumas)
+    # Columnas sin ningún dato (p. ej. xG de jugadores sin estadísticas avanzadas) quedan NULL
+    hay_datos = ambos[list(ESTADISTICAS.values())].notna().groupby([ambos[c] for c in clave]).any()
+    res[list(ESTADISTICAS.values())] = res[list(ESTADISTICAS.values())].where(hay_datos)
+
+    minutos = res['minutos'].to_numpy(dtype=float)
+    with np.errstate(divide='ignore', invalid='ignore'):
+        for col in POR_90:
+            res[f"{col}_90"] = np.where(minutos > 0, res[col].to_numpy(dtype=float) * 90 / minutos, np.nan)
+
+    # % de minutos: minutos jugados / 90 por cada partido de sus equipos en esa Comp y temporada
+    propios = ambos[clave + ['Equipo']].drop_duplicates().merge(equipos, on=['temporada', 'Comp', 'Equipo'])
+    res['partidos_equipo'] = propios.groupby(clave)['partidos_equipo'].sum()
+    with np.errstate(divide='ignore', invalid='ignore'):
+        res['pct_minutos'] = np.where(res['partidos_equipo'] > 0,
+                                      100 * minutos / (90 * res['partidos_equipo'].to_numpy(dtype=float)),
+                                      np.nan)
+    return res.reset_index()[COLUMNAS_RESUMEN]
+
+def forma(df, ventana=VENTANA_FORMA):
+    """Suma móvil de los últimos `ventana` partidos de cada jugador (todas
+    las competiciones, en orden de fecha), con sumas acumuladas por grupo"""
+    if df.empty:
+        return pd.DataFrame(columns=COLUMNAS_FORMA)
+    df = df.sort_values(['jugador_id', 'Fecha'], kind='stable').reset_index(drop=True)
+    grupos = df['jugador_id']
+    salida = df[['jugador_id', 'Fecha', 'Comp']].copy()
+    posicion = df.groupby(grupos).cumcount()
+    salida['partidos_n'] = np.minimum(posicion + 1, ventana)
+    for col in FORMA:
+        acumulado = df[col].fillna(0).groupby(grupos).cumsum()
+        con_datos = df[col].notna().groupby(grupos).cumsum()
+        suma = acumulado - acumulado.groupby(grupos).shift(ventana).fillna(0)
+        datos = con_datos - con_datos.groupby(grupos).shift(ventana).fillna(0)
+        salida[f"{col}_n"] = suma.where(datos > 0)
+    minutos = salida['minutos_n'].to_numpy(dtype=float)
+    with np.errstate(divide='ignore', invalid='ignore'):
+        salida['g_a_90_n'] = np.where(minutos > 0, salida['g_a_n'].to_numpy(dtype=float) * 90 / minutos, np.nan)
+    return salida[COLUMNAS_FORMA]
+
+# ---------------------------------------------------------------------------
+# ACTUALIZACIÓN (COMPLETA O INCREMENTAL)
+# ---------------------------------------------------------------------------
+def _insertar(conn, tabla, df, columnas):
+    df = df[columnas].astype(object).where(df[columnas].notna(), None)
+    lista = ", ".join(f'"{col}"' for col in columnas)
+    conn.executemany(f"INSERT OR REPLACE INTO {tabla} ({lista}) VALUES ({', '.join('?' * len(columnas))})",
+                     df.itertuples(index=False, name=None))
+
+def _recalcular_todo(conn):
+    df = cargar_partidos(conn)
+    conn.execute("DELETE FROM resumen_jugador")
+    conn.execute("DELETE FROM forma_jugador")
+    _insertar(conn, 'resumen_jugador', resumen(df), COLUMNAS_RESUMEN)
+    _insertar(conn, 'forma_jugador', forma(df), COLUMNAS_FORMA)
+    return df['jugador_id'].nunique(), len(df)
+
+def _recalcular_pendientes(conn, pendientes):
+    pendientes = {(jugador, temporada) for jugador, temporada in pendientes
+                  if jugador is not None and temporada is not None}
+    temporadas = sorted({temporada for _, temporada in pendientes})
+    jugadores = sorted({jugador for jugador, _ in pendientes})
+
+    # Resúmenes: las temporadas afectadas bastan para los partidos de cada
+    # equipo; se reescriben los jugadores pendientes y sus compañeros (su %
+    # de minutos depende de los partidos del equipo)
+    temporada_df = cargar_partidos(conn, temporadas=temporadas)
+    pend = pd.DataFrame(list(pendientes), columns=['jugador_id', 'temporada'])
+    equipos_tocados = temporada_df.merge(pend, on=['jugador_id', 'temporada'])[['temporada', 'Comp', 'Equipo']]
+    afectados = temporada_df.merge(equipos_tocados.drop_duplicates(), on=['temporada', 'Comp', 'Equipo'])
+    afectados = pd.concat([afectados[['jugador_id', 'temporada']], pend]).drop_duplicates()
+    filas = temporada_df.merge(afectados, on=['jugador_id', 'temporada'])
+    conn.executemany("DELETE FROM resumen_jugador WHERE jugador_id = ? AND temporada = ?",
+                     afectados.itertuples(index=False, name=None))
+    _insertar(conn, 'resumen_jugador', resumen(filas, partidos_equipo(temporada_df)), COLUMNAS_RESUMEN)
+
+    # Forma: historial completo (vía índice) solo de los jugadores pendientes
+    historial = cargar_partidos(conn, jugadores=jugadores)
+    conn.executemany("DELETE FROM forma_jugador WHERE jugador_id = ?", [(j,) for j in jugadores])
+    _insertar(conn, 'forma_jugador', forma(historial), COLUMNAS_FORMA)
+    return afectados['jugador_id'].nunique(), len(filas)
+
+def actualizar_agregados(db_path=db_path, completo=False):
+    """Pone al día resumen_jugador y forma_jugador.
+
+    Si los triggers de partidos siguen instalados, solo recalcula los
+    (jugador, temporada) que cambiaron; si no (primera vez, o partidos fue
+    recreada por cargar_partidos.py/unir_partidos.py), recalcula todo.
+    """
+    inicio = time.perf_counter()
+    conn = sqlite3.connect(db_path, isolation_level=None)
+    try:
+        conn.execute("BEGIN")
+        existentes = {nombre for (nombre,) in conn.execute("SELECT name FROM sqlite_master")}
+        if 'partidos' not in existentes:
+            print("No existe la tabla 'partidos'.")
+            conn.execute("ROLLBACK")
+            return
+        crear_tablas(conn)
+        if completo or not existentes.issuperset(TRIGGERS + ['resumen_jugador', 'forma_jugador']):
+            modo = 'completo'
+            jugadores, filas = _recalcular_todo(conn)
+        else:
+            modo = 'incremental'
+            pendientes = set(conn.execute("SELECT jugador_id, temporada FROM agregados_pendientes"))
+            jugadores, filas = _recalcular_pendientes(conn, pendientes) if pendientes else (0, 0)
+        conn.execute("DELETE FROM agregados_pendientes")
+        instalar_triggers(conn)
+        conn.execute("COMMIT")
+    except Exception:
+        conn.execute("ROLLBACK")
+        raise
+    finally:
+        conn.close()
+    print(f"✔ Agregados ({modo}): {jugadores} jugadores, {filas} partidos leídos "
+          f"en {time.perf_counter() - inicio:.2f} s")
+
+if __name__ == "__main__":
+    import argparse
+
+    parser = argparse.ArgumentParser(description="Actualiza los resúmenes materializados de partidos")
+    parser.add_argument('--db', default=db_path)
+    parser.add_argument('--completo', action='store_true', help="recalcula todo aunque no haya cambios")
+    args = parser.parse_args()
+    actualizar_agregados(args.db, args.completo)
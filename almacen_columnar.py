@@ -0,0 +1,233 @@
+import glob
+import os
+import re
+import shutil
+import urllib.parse
+
+import pyarrow as pa
+import pyarrow.compute as pc
+import pyarrow.dataset as ds
+import pyarrow.parquet as pq
+
+from esquema_partidos import (
+    COLUMNAS_ENTERAS,
+    COLUMNAS_REALES,
+    COLUMNAS_RESULTADO,
+    COLUMNAS_TEXTO,
+    temporadas_serie,
+    tipar_dataframe,
+    tipo_columna,
+)
+
+# ---------------------------------------------------------------------------
+# ESQUEMA ARROW DE LOS PARTIDOS
+# ---------------------------------------------------------------------------
+# Alternativa a los CSV de save_match_logs: un dataset Parquet particionado
+# por temporada (año en que empieza, según el calendario de la competición;
+# ver esquema_partidos.temporada_partido) y competición:
+#   partidos_parquet/temporada=2025/Comp=Primera%20A/<jugador>-0.parquet
+#   partidos_parquet/temporada=2024/Comp=Premier%20League/<jugador>-0.parquet (2024-2025)
+carpeta_parquet = "partidos_parquet"
+PARTICIONES = ['temporada', 'Comp']
+
+# Columnas con pocos valores distintos: se guardan como diccionario
+COLUMNAS_DICCIONARIO = {'Comp', 'Equipo', 'Adversario', 'Posc', 'Día', 'Sedes', 'Arranque',
+                        'Resultado_tipo', 'jugador'}
+
+TIPOS_ARROW = {'INTEGER': pa.int32(), 'REAL': pa.float64(), 'TEXT': pa.string()}
+DICCIONARIO = pa.dictionary(pa.int32(), pa.string())
+
+def tipo_arrow(col):
+    if col == 'Fecha':
+        return pa.date32()
+    if col in COLUMNAS_DICCIONARIO:
+        return DICCIONARIO
+    return TIPOS_ARROW[tipo_columna(col) or 'TEXT']
+
+def esquema_dataset():
+    """Unión de todas las columnas conocidas. Todos los archivos se escriben
+    con este esquema (nulas las que el jugador no tiene, p. ej. sin
+    estadísticas avanzadas), así los lectores no tienen que unificar nada"""
+    columnas = (['jugador', 'jugador_id', 'Fecha'] + sorted(COLUMNAS_TEXTO)
+                + sorted(COLUMNAS_ENTERAS - {'jugador_id'}) + sorted(COLUMNAS_REALES)
+                + [col for col, _ in COLUMNAS_RESULTADO])
+    campos = [pa.field(col, tipo_arrow(col)) for col in columnas if col not in PARTICIONES]
+    campos += [pa.field('temporada', pa.int32()), pa.field('Comp', DICCIONARIO)]
+    return pa.schema(campos)
+
+PARTICIONADO = ds.HivePartitioning.discover(schema=pa.schema([('temporada', pa.int32()), ('Comp', DICCIONARIO)]))
+
+# ---------------------------------------------------------------------------
+# ESCRITURA
+# ---------------------------------------------------------------------------
+def _nombre_archivo(player_name):
+    clean_name = re.sub(r'[^\w\s-]', '', player_name).strip().replace(' ', '_')
+    return clean_name.lower()
+
+def clave_jugador(player_name):
+    """Valor de la columna jugador: el nombre como queda en el archivo y en
+    jugadores.nombre_completo ('Luis Díaz' y 'luis díaz' dan 'luis díaz'),
+    igual venga del crawl o de exportar_csvs"""
+    return _nombre_archivo(player_name).replace('_', ' ').strip()
+
+def tabla_arrow(df, player_name, jugador_id=None):
+    """Tabla Arrow tipada (misma conversión y filtrado que las tablas SQLite)"""
+    df = tipar_dataframe(df.astype(str))
+    df['jugador'] = clave_jugador(player_name)
+    if jugador_id is not None:
+        df['jugador_id'] = jugador_id
+    fechas = pa.array(df['Fecha'].tolist(), pa.string()).cast(pa.date32())
+    df['temporada'] = temporadas_serie(df['Fecha'], df['Comp'])
+    df = df.drop(columns=['Fecha'])
+    campos = [pa.field(col, tipo_arrow(col) if col != 'temporada' else pa.int32()) for col in df.columns]
+    tabla = pa.Table.from_pandas(df, schema=pa.schema(campos), preserve_index=False)
+    return tabla.add_column(0, pa.field('Fecha', pa.date32()), fechas)
+
+def _unificar(tabla, descartadas=None, origen=''):
+    """Reordena/completa la tabla con el esquema del dataset (columnas
+    desconocidas fuera, las que faltan como nulas).
+
+    Las columnas descartadas se agregan a `descartadas` si se pasa un set;
+    si no, se avisa en el momento.
+    """
+    esquema = esquema_dataset()
+    fuera = [col for col in tabla.column_names if col not in esquema.names]
+    if fuera and descartadas is not None:
+        descartadas.update(fuera)
+    elif fuera:
+        _avisar_descartadas(fuera, origen)
+    columnas = [tabla.column(campo.name).cast(campo.type) if campo.name in tabla.column_names
+                else pa.nulls(tabla.num_rows, campo.type) for campo in esquema]
+    return pa.Table.from_arrays(columnas, schema=esquema)
+
+def _avisar_descartadas(columnas, origen=''):
+    origen = f" ({origen})" if origen else ""
+    print(f"⚠ {len(columnas)} columnas fuera del esquema del dataset, no se guardan{origen}: "
+          + ", ".join(sorted(columnas)))
+
+def _ordenar(tabla):
+    """Por jugador y fecha (sort_by no admite columnas diccionario)"""
+    claves = pa.table({'jugador': tabla.column('jugador').cast(pa.string()), 'Fecha': tabla.column('Fecha')})
+    return tabla.take(pc.sort_indices(claves, [('jugador', 'ascending'), ('Fecha', 'ascending')]))
+
+def _escribir(tabla, output_dir, basename):
+    pq.write_to_dataset(
+        tabla, output_dir, partitioning=PARTICIONES, partitioning_flavor='hive',
+        basename_template=basename, existing_data_behavior='overwrite_or_ignore',
+        compression='zstd', use_dictionary=True,
+    )
+
+def save_match_logs_parquet(df, player_name, output_dir=carpeta_parquet, jugador_id=None):
+    """Guarda los partidos de un jugador en el dataset Parquet.
+
+    Reemplaza los archivos propios del jugador (<jugador>-N.parquet) y, en
+    las particiones ya compactadas que toca, reescribe el archivo compacto
+    sin sus filas. Tras un crawl conviene llamar a compactar().
+    """
+    if df is None:
+        return False
+    try:
+        tabla = _unificar(tabla_arrow(df, player_name, jugador_id), origen=player_name)
+        nombre = _nombre_archivo(player_name)
+        for ruta in glob.glob(os.path.join(glob.escape(output_dir), '*', '*', f"{glob.escape(nombre)}-*.parquet")):
+            os.remove(ruta)
+        if tabla.num_rows == 0:
+            return True
+        particiones = set(zip(tabla.column('temporada').to_pylist(), tabla.column('Comp').to_pylist()))
+        for ruta in _archivos_compactos(output_dir, particiones):
+            compacto = pq.ParquetFile(ruta, memory_map=True).read()
+            # También el nombre tal cual, por si el archivo es de antes de clave_jugador
+            jugador = compacto.column('jugador').cast(pa.string())
+            compacto = compacto.filter(pc.invert(pc.is_in(jugador, pa.array([clave_jugador(player_name), player_name]))))
+            pq.write_table(compacto, ruta + '.tmp', compression='zstd')
+            os.replace(ruta + '.tmp', ruta)
+        _escribir(tabla, output_dir, f"{nombre}-{{i}}.parquet")
+        return True
+    except Exception as e:
+        print(f"Error guardando Parquet: {e}")
+        return False
+
+def _directorio_particion(output_dir, temporada, comp):
+    return os.path.join(output_dir, f"temporada={temporada}", "Comp=" + urllib.parse.quote(comp, safe=''))
+
+def _archivos_compactos(output_dir, particiones):
+    for temporada, comp in particiones:
+        yield from glob.glob(os.path.join(glob.escape(_directorio_particion(output_dir, temporada, comp)),
+                                          'compacto-*.parquet'))
+
+def compactar(output_dir=carpeta_parquet):
+    """Junta los archivos de cada partición en uno solo, ordenado por jugador
+    y fecha (menos archivos y grupos de filas más grandes para leer)"""
+    for directorio in glob.glob(os.path.join(glob.escape(output_dir), 'temporada=*', 'Comp=*')):
+        archivos = sorted(glob.glob(os.path.join(glob.escape(directorio), '*.parquet')))
+        if len(archivos) <= 1:
+            continue
+        tabla = pa.concat_tables(pq.ParquetFile(ruta, memory_map=True).read() for ruta in archivos)
+        tabla = _ordenar(tabla.unify_dictionaries().combine_chunks())
+        destino = os.path.join(directorio, 'compacto-0.parquet')
+        pq.write_table(tabla, destino + '.tmp', compression='zstd')
+        for ruta in archivos:
+            os.remove(ruta)
+        os.replace(destino + '.tmp', destino)
+
+# ---------------------------------------------------------------------------
+# LECTURA
+# ---------------------------------------------------------------------------
+def dataset(output_dir=carpeta_parquet):
+    return ds.dataset(output_dir, format='parquet', partitioning=PARTICIONADO)
+
+def leer_partidos(columnas=None, filtros=None, output_dir=carpeta_parquet):
+    """Lee solo las columnas pedidas; los filtros sobre temporada/Comp
+    descartan carpetas enteras y el resto usa las estadísticas de cada
+    grupo de filas. Los archivos se abren con memory_map.
+
+    filtros: expresión de pyarrow.dataset, p. ej.
+        (ds.field('temporada') == 2025) & (ds.field('Comp') == 'Primera A')
+    o lista de tuplas al estilo pyarrow.parquet: [('temporada', '=', 2025)].
+    """
+    return pq.read_table(output_dir, columns=columnas, filters=filtros, partitioning=PARTICIONADO,
+                         memory_map=True)
+
+def leer_particion(temporada, comp, columnas, output_dir=carpeta_parquet):
+    """Lee las columnas pedidas de una sola partición (temporada, Comp).
+
+    Abre directamente los archivos de la carpeta de la partición, sin
+    descubrir el dataset ni el pool de hilos de pyarrow.dataset: para las
+    consultas más comunes es la lectura que menos memoria usa. Las columnas
+    de partición (temporada, Comp) no se devuelven.
+    """
+    columnas = [col for col in columnas if col not in PARTICIONES]
+    directorio = _directorio_particion(output_dir, temporada, comp)
+    tablas = [pq.ParquetFile(ruta, memory_map=True, pre_buffer=False).read(columns=columnas, use_threads=False)
+              for ruta in sorted(glob.glob(os.path.join(glob.escape(directorio), '*.parquet')))]
+    if not tablas:
+        esquema = esquema_dataset()
+        return pa.schema([esquema.field(col) for col in columnas]).empty_table()
+    return pa.concat_tables(tablas, promote_options='default')
+
+def exportar_csvs(carpeta_csv='partidos_data', output_dir=carpeta_parquet):
+    """Construye el dataset completo desde los CSV de partidos_data, con un
+    solo archivo por partición"""
+    import pandas as pd
+
+    tablas = []
+    descartadas = set()
+    for archivo in sorted(os.listdir(carpeta_csv)):
+        if archivo.endswith("_partidos.csv"):
+            df = pd.read_csv(os.path.join(carpeta_csv, archivo), dtype=str, keep_default_na=False,
+                             encoding='utf-8-sig')
+            nombre = archivo.replace("_partidos.csv", "").replace("_", " ").strip()
+            tablas.append(_unificar(tabla_arrow(df, nombre), descartadas))
+    if descartadas:
+        _avisar_descartadas(descartadas, carpeta_csv)
+    if not tablas:
+        print("No hay archivos de partidos para exportar.")
+        return 0
+    tabla = pa.concat_tables(tablas).unify_dictionaries().combine_chunks()
+    shutil.rmtree(output_dir, ignore_errors=True)
+    _escribir(_ordenar(tabla), output_dir, "compacto-{i}.parquet")
+    print(f"✔ {len(tablas)} jugadores ({tabla.num_rows} partidos) exportados a {output_dir}")
+    return len(tablas)
+
+if __name__ == "__main__":
+    exportar_csvs()
@@ -0,0 +1,290 @@
+import argparse
+import gzip
+import multiprocessing
+import os
+import sqlite3
+import threading
+import time
+import uuid
+import zlib
+from datetime import datetime, timezone
+
+from fetchers import extract_player_id
+
+# ---------------------------------------------------------------------------
+# CONFIGURACIÓN
+# ---------------------------------------------------------------------------
+directorio_archivo = "archivo_paginas"
+MAX_SEGMENTO = 1024 * 1024 * 1024     # bytes por segmento antes de abrir otro
+REGISTROS_POR_COMMIT = 50             # el índice se confirma en lotes
+
+# ---------------------------------------------------------------------------
+# FORMATO DE LOS REGISTROS
+# ---------------------------------------------------------------------------
+# Cada página es un registro WARC 'resource' comprimido como un miembro gzip
+# independiente (igual que los .warc.gz), así que se puede leer cualquier
+# registro con su offset sin descomprimir el resto del segmento.
+def registro_warc(url, html, fecha):
+    cuerpo = html.encode('utf-8')
+    cabecera = (
+        "WARC/1.0\r\n"
+        "WARC-Type: resource\r\n"
+        f"WARC-Record-ID: <urn:uuid:{uuid.uuid4()}>\r\n"
+        f"WARC-Target-URI: {url}\r\n"
+        f"WARC-Date: {fecha}\r\n"
+        "Content-Type: text/html; charset=utf-8\r\n"
+        f"Content-Length: {len(cuerpo)}\r\n"
+        "\r\n"
+    ).encode('utf-8')
+    return gzip.compress(cabecera + cuerpo + b"\r\n\r\n", compresslevel=6)
+
+def leer_registro(datos):
+    """(cabeceras, html) de un registro ya descomprimido"""
+    cabecera, _, resto = datos.partition(b"\r\n\r\n")
+    cabeceras = dict(linea.split(": ", 1) for linea in cabecera.decode('utf-8').split("\r\n")[1:])
+    return cabeceras, resto[:int(cabeceras['Content-Length'])].decode('utf-8')
+
+class ArchivoPaginas:
+    """Archivo de solo escritura al final con todas las páginas descargadas.
+
+    Las páginas van a segmentos .warc.gz (uno por proceso, se rota al pasar
+    de max_segmento) y un índice SQLite (indice.db) guarda por URL y fecha
+    de descarga el segmento, el offset y la longitud comprimida de cada
+    registro, más el id del jugador y si la página trae matchlogs_all.
+    El registro se escribe antes que su entrada en el índice: tras un
+    corte, reconstruir_indice() recupera lo que faltara.
+    """
+
+    def __init__(self, directorio=directorio_archivo, max_segmento=MAX_SEGMENTO):
+        os.makedirs(directorio, exist_ok=True)
+        self.directorio = directorio
+        self.max_segmento = max_segmento
+        self.lock = threading.Lock()
+        self.segmento = None
+        self.f = None
+        self.pendientes = 0
+        self.conn = abrir_indice(directorio)
+
+    def _abrir_segmento(self):
+        if self.f is not None:
+            self.f.close()
+        marca = datetime.now().strftime("%Y%m%d-%H%M%S")
+        self.segmento = f"paginas-{marca}-{os.getpid()}.warc.gz"
+        self.f = open(os.path.join(self.directorio, self.segmento), 'ab')
+
+    def guardar(self, url, html):
+        fecha = datetime.now(timezone.utc).isoformat(timespec='seconds')
+        registro = registro_warc(url, html, fecha)
+        with self.lock:
+            if self.f is None or self.f.tell() + len(registro) > self.max_segmento:
+                self._abrir_segmento()
+            offset = self.f.tell()
+            self.f.write(registro)
+            self.f.flush()
+            self.conn.execute(
+                "INSERT OR IGNORE INTO paginas VALUES (?, ?, ?, ?, ?, ?, ?)",
+                (url, fecha, self.segmento, offset, len(registro), extract_player_id(url),
+                 int('id="matchlogs_all"' in html)))
+            self.pendientes += 1
+            if self.pendientes >= REGISTROS_POR_COMMIT:
+                self.conn.commit()
+                self.pendientes = 0
+
+    def tiene(self, url):
+        """Si el índice ya tiene alguna página de url"""
+        with self.lock:
+            return self.conn.execute("SELECT 1 FROM paginas WHERE url = ? LIMIT 1", (url,)).fetchone() is not None
+
+    def close(self):
+        with self.lock:
+            if self.f is not None:
+                self.f.close()
+                self.f = None
+            self.conn.commit()
+            self.conn.close()
+
+def abrir_indice(directorio=directorio_archivo):
+    conn = sqlite3.connect(os.path.join(directorio, 'indice.db'), check_same_thread=False)
+    conn.execute("PRAGMA journal_mode=WAL")
+    conn.execute("""
+        CREATE TABLE IF NOT EXISTS paginas (
+            url TEXT NOT NULL,
+            fecha TEXT NOT NULL,
+            segmento TEXT NOT NULL,
+            offset INTEGER NOT NULL,
+            longitud INTEGER NOT NULL,
+            jugador_id TEXT,
+            tabla INTEGER NOT NULL,
+            PRIMARY KEY (segmento, offset)
+        )
+    """)
+    conn.execute("CREATE INDEX IF NOT EXISTS idx_paginas_url ON paginas(url, fecha)")
+    conn.execute("CREATE INDEX IF NOT EXISTS idx_paginas_jugador ON paginas(jugador_id, tabla, fecha)")
+    conn.commit()
+    return conn
+
+def leer_pagina(directorio, segmento, offset, longitud):
+    with open(os.path.join(directorio, segmento), 'rb') as f:
+        f.seek(offset)
+        return leer_registro(gzip.decompress(f.read(longitud)))[1]
+
+def reconstruir_indice(directorio=directorio_archivo):
+    """Recorre los segmentos y añade al índice los registros que no estén"""
+    conn = abrir_indice(directorio)
+    nuevos = 0
+    for segmento in sorted(a for a in os.listdir(directorio) if a.endswith('.warc.gz')):
+        with open(os.path.join(directorio, segmento), 'rb') as f:
+            offset = 0
+            while True:
+                f.seek(offset)
+                descompresor = zlib.decompressobj(31)
+                partes, leidos = [], 0
+                try:
+                    while not descompresor.eof:
+                        bloque = f.read(64 * 1024)
+                        if not bloque:
+                            break
+                        partes.append(descompresor.decompress(bloque))
+                        leidos += len(bloque)
+                except zlib.error:
+                    partes = None
+                if not leidos:
+                    break
+                if partes is None or not descompresor.eof:
+                    print(f"⚠ Registro dañado o truncado en {segmento}@{offset}; se ignora el resto")
+                    break
+                longitud = leidos - len(descompresor.unused_data)
+                cabeceras, html = leer_registro(b"".join(partes))
+                url = cabeceras['WARC-Target-URI']
+                cursor = conn.execute(
+                    "INSERT OR IGNORE INTO paginas VALUES (?, ?, ?, ?, ?, ?, ?)",
+                    (url, cabeceras['WARC-Date'], segmento, offset, longitud, extract_player_id(url),
+                     int('id="matchlogs_all"' in html)))
+                nuevos += cursor.rowcount
+                offset += longitud
+    conn.commit()
+    conn.close()
+    print(f"✔ Índice al día: {nuevos} registros añadidos")
+    return nuevos
+
+# ---------------------------------------------------------------------------
+# REPARSEO SIN RED
+# ---------------------------------------------------------------------------
+def ultimas_paginas(directorio=directorio_archivo):
+    """[(jugador_id, segmento, offset, longitud)]: la última página con
+    matchlogs_all de cada jugador, ordenadas por posición en disco"""
+    conn = abrir_indice(directorio)
+    try:
+        filas = conn.execute("""
+            SELECT jugador_id, segmento, offset, longitud FROM (
+                SELECT *, ROW_NUMBER() OVER (
+                    PARTITION BY jugador_id ORDER BY fecha DESC, rowid DESC) AS n
+                FROM paginas
+                WHERE tabla = 1 AND jugador_id IS NOT NULL
+            )
+            WHERE n = 1
+        """).fetchall()
+    finally:
+        conn.close()
+    return sorted(filas, key=lambda fila: (fila[1], fila[2]))
+
+def _reparsear(tarea):
+    """Trabajador: lee y parsea un registro; guarda el CSV o devuelve los
+    lotes tipados para el escritor de la tabla partidos"""
+    from fetchers import parse_match_logs_rows
+    from main import match_logs_filename, save_match_logs
+    from ingesta_paralela import lotes_filas
+
+    directorio, (jugador_id, segmento, offset, longitud), nombre, destino, output_dir = tarea
+    tabla = parse_match_logs_rows(leer_pagina(directorio, segmento, offset, longitud))
+    if tabla is None:
+        return jugador_id, 0, None
+    if destino == 'csv':
+        return jugador_id, len(tabla), save_match_logs(tabla, nombre, output_dir)
+    archivo = os.path.basename(match_logs_filename(nombre))
+    return jugador_id, len(tabla), list(lotes_filas(archivo, tabla.headers, tabla.rows))
+
+def nombres_roster(csv_path):
+    """{jugador_id: nombre} a partir del CSV de jugadores"""
+    import pandas as pd
+
+    roster = pd.read_csv(csv_path)
+    return {extract_player_id(href): nombre for nombre, href in zip(roster['nombre'], roster['href'])}
+
+def reparsear(directorio=directorio_archivo, destino='csv', output_dir='partidos_data',
+              db_path='mi_base_de_datos.db', csv_path='jugadores_activos_colombianos.csv', workers=None):
+    """Reconstruye los CSV de partidos_data (destino='csv') o la tabla partidos
+    (destino='partidos') desde el archivo, sin red y con un proceso por núcleo.
+    Con destino='partidos' se reescriben las tablas <jugador>_partidos y la
+    unión incremental (unir_partidos.py) lleva a 'partidos' las que cambiaron,
+    así cada fila conserva su fuente.
+
+    Usa la última página con matchlogs_all de cada jugador; los nombres
+    salen del CSV de jugadores (o el id si un jugador ya no está en él).
+    Devuelve (jugadores, filas).
+    """
+    from ingesta_paralela import FIN_ARCHIVO, LOTE, EscritorSQLite
+
+    inicio = time.perf_counter()
+    paginas = ultimas_paginas(directorio)
+    if not paginas:
+        print("No hay páginas de partidos en el archivo.")
+        return 0, 0
+    nombres = nombres_roster(csv_path) if os.path.exists(csv_path) else {}
+    faltantes = sum(1 for pagina in paginas if pagina[0] not in nombres)
+    if faltantes:
+        print(f"⚠ {faltantes} jugadores no están en {csv_path}; se nombran por su id")
+    tareas = [(directorio, pagina, nombres.get(pagina[0], pagina[0]), destino, output_dir)
+              for pagina in paginas]
+    workers = workers or os.cpu_count() or 1
+
+    escritor = EscritorSQLite(db_path, destino='tablas') if destino == 'partidos' else None
+    jugadores = filas = sin_tabla = 0
+    ok = False
+    with multiprocessing.get_context().Pool(workers) as pool:
+        try:
+            for jugador_id, n, resultado in pool.imap_unordered(_reparsear, tareas, chunksize=8):
+                if not n:
+                    sin_tabla += 1
+                    continue
+                if escritor is not None:
+                    for tipo, archivo, datos in resultado:
+                        if tipo == LOTE:
+                            escritor.escribir(archivo, *datos)
+                        elif tipo == FIN_ARCHIVO:
+                            escritor.terminar_archivo(archivo, datos)
+                elif not resultado:
+                    print(f"❌ No se pudo guardar el CSV de {jugador_id}")
+                    continue
+                jugadores += 1
+                filas += n
+            ok = True
+        finally:
+            if escritor is not None:
+                escritor.close(ok)
+    if escritor is not None and ok:
+        from unir_partidos import crear_tabla_partidos
+
+        crear_tabla_partidos(db_path)
+
+    duracion = time.perf_counter() - inicio
+    destino_txt = output_dir if destino == 'csv' else f"la tabla partidos de {db_path}"
+    print(f"✔ {jugadores} jugadores, {filas} filas reparseadas en {duracion:.2f} s hacia {destino_txt} "
+          f"({workers} procesos); {sin_tabla} páginas sin tabla")
+    return jugadores, filas
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Archivo de páginas descargadas y reparseo sin red")
+    parser.add_argument('accion', choices=['reparse', 'reindexar'])
+    parser.add_argument('--dir', default=directorio_archivo)
+    parser.add_argument('--destino', choices=['csv', 'partidos'], default='csv',
+                        help="CSV en partidos_data o la tabla partidos")
+    parser.add_argument('--salida', default='partidos_data', help="carpeta de los CSV")
+    parser.add_argument('--db', default='mi_base_de_datos.db')
+    parser.add_argument('--csv', default='jugadores_activos_colombianos.csv', help="CSV de jugadores")
+    parser.add_argument('--workers', type=int, help="procesos (por defecto, uno por núcleo)")
+    args = parser.parse_args()
+    if args.accion == 'reindexar':
+        reconstruir_indice(args.dir)
+    else:
+        reparsear(args.dir, args.destino, args.salida, args.db, args.csv, args.workers)
@@ -0,0 +1,130 @@
+"""Compara una consulta entre jugadores sobre los CSV y sobre el dataset Parquet.
+
+Consulta: todo el xG de una competición en una temporada (por defecto
+"Primera A" en 2025). Cada método corre en un proceso aparte para medir
+cuánta memoria suma la consulta sobre la de las librerías importadas.
+
+Uso (desde la raíz del repositorio):
+    python -m benchmarks.bench_columnar                     # 1000 jugadores sintéticos
+    python -m benchmarks.bench_columnar --csv partidos_data # CSV reales
+"""
+import argparse
+import json
+import os
+import subprocess
+import sys
+import tempfile
+import time
+
+from benchmarks.datos_sinteticos import escribir_csvs
+
+def consulta_csv(carpeta, comp, temporada):
+    import pandas as pd
+    from esquema_partidos import temporadas_serie
+
+    partes = []
+    for archivo in os.listdir(carpeta):
+        if archivo.endswith("_partidos.csv"):
+            df = pd.read_csv(os.path.join(carpeta, archivo), encoding='utf-8-sig')
+            if 'xG' not in df.columns:
+                continue
+            fechas = df['Fecha'].astype(str)
+            df = df[(df['Comp'] == comp) & fechas.str.match(r'\d{4}-\d{2}')]
+            df = df[temporadas_serie(df['Fecha'].astype(str), df['Comp']) == temporada]
+            partes.append(pd.to_numeric(df['xG'], errors='coerce').dropna())
+    serie = pd.concat(partes) if partes else pd.Series(dtype=float)
+    return len(serie), float(serie.sum())
+
+def consulta_parquet(carpeta, comp, temporada):
+    import pyarrow.compute as pc
+    from almacen_columnar import leer_particion
+
+    # Solo la columna xG de la carpeta de la partición
+    xg = leer_particion(temporada, comp, ['xG'], carpeta).column('xG')
+    return len(xg) - xg.null_count, pc.sum(xg).as_py() or 0.0
+
+def _medir(metodo, carpeta, comp, temporada):
+    # Las librerías se importan antes de medir y cada lector se inicializa
+    # con una sola fila de otro archivo: solo cuenta la memoria de la consulta
+    import pandas  # noqa: F401
+    import almacen_columnar  # noqa: F401
+
+    _inicializar(metodo, carpeta)
+    base = memoria('VmRSS')
+    inicio = time.perf_counter()
+    filas, total = (consulta_csv if metodo == 'csv' else consulta_parquet)(carpeta, comp, temporada)
+    duracion = time.perf_counter() - inicio
+    print(json.dumps({'filas': filas, 'xg': round(total, 3), 'segundos': duracion,
+                      'mb': memoria('VmHWM') - base}))
+
+def _inicializar(metodo, carpeta):
+    """Carga el código del lector (el de Parquet ocupa unos 6 MB la primera
+    vez, igual para 1 que para 1000 jugadores) leyendo poco y de otra columna"""
+    import glob
+
+    if metodo == 'csv':
+        import pandas as pd
+
+        archivo = next(iter(glob.glob(os.path.join(glob.escape(carpeta), '*_partidos.csv'))), None)
+        if archivo:
+            pd.read_csv(archivo, encoding='utf-8-sig', nrows=1)
+    else:
+        import pyarrow.parquet as pq
+
+        archivo = next(iter(glob.glob(os.path.join(glob.escape(carpeta), '*', '*', '*.parquet'))), None)
+        if archivo:
+            pq.ParquetFile(archivo, memory_map=True, pre_buffer=False).read_row_group(0, columns=['jugador_id'])
+
+def memoria(campo):
+    """MB de /proc/self/status (VmRSS actual, VmHWM máxima); NaN fuera de Linux"""
+    try:
+        with open('/proc/self/status') as f:
+            for linea in f:
+                if linea.startswith(campo + ':'):
+                    return int(linea.split()[1]) / 1024
+    except OSError:
+        pass
+    return float('nan')
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--csv', help="carpeta con *_partidos.csv (por defecto, sintéticos)")
+    parser.add_argument('--n', type=int, default=1000, help="jugadores sintéticos")
+    parser.add_argument('--comp', default='Primera A')
+    parser.add_argument('--temporada', type=int, default=2025)
+    parser.add_argument('--solo', choices=['csv', 'parquet'], help=argparse.SUPPRESS)
+    parser.add_argument('--carpeta', help=argparse.SUPPRESS)
+    args = parser.parse_args()
+
+    if args.solo:
+        _medir(args.solo, args.carpeta, args.comp, args.temporada)
+        return
+
+    from almacen_columnar import exportar_csvs
+
+    directorio = tempfile.mkdtemp(prefix="columnar_")
+    carpeta_csv = args.csv or os.path.join(directorio, 'csv')
+    if not args.csv:
+        escribir_csvs(carpeta_csv, args.n)
+    carpeta_parquet = os.path.join(directorio, 'parquet')
+    inicio = time.perf_counter()
+    exportar_csvs(carpeta_csv, carpeta_parquet)
+    print(f"Exportación: {time.perf_counter() - inicio:.2f} s\n")
+
+    resultados = {}
+    for metodo, carpeta in (('csv', carpeta_csv), ('parquet', carpeta_parquet)):
+        salida = subprocess.run(
+            [sys.executable, '-m', 'benchmarks.bench_columnar', '--solo', metodo, '--carpeta', carpeta,
+             '--comp', args.comp, '--temporada', str(args.temporada)],
+            capture_output=True, text=True, check=True)
+        resultados[metodo] = json.loads(salida.stdout.strip().splitlines()[-1])
+
+    print(f"{'método':<8} {'filas':>7} {'suma xG':>9} {'segundos':>9} {'MB extra':>9}")
+    for metodo, r in resultados.items():
+        print(f"{metodo:<8} {r['filas']:>7} {r['xg']:>9.1f} {r['segundos']:>9.3f} {r['mb']:>9.1f}")
+    csv_r, pq_r = resultados['csv'], resultados['parquet']
+    print(f"\nParquet: {csv_r['segundos'] / pq_r['segundos']:.0f}x más rápido, "
+          f"{pq_r['mb'] / csv_r['mb']:.0%} de la memoria")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,51 @@
+"""Mide la ingesta de CSV de partidos con distinto número de procesos.
+
+Uso (desde la raíz del repositorio):
+    python -m benchmarks.bench_ingesta                          # 40, 1000 y 10000 jugadores
+    python -m benchmarks.bench_ingesta --tamanos 40 --workers 0 1 2 4
+    python -m benchmarks.bench_ingesta --destino tablas          # una tabla por jugador
+"""
+import argparse
+import os
+import shutil
+import tempfile
+import time
+
+from ingesta_paralela import ingerir_carpeta
+from benchmarks.datos_sinteticos import escribir_csvs
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--tamanos', type=int, nargs='+', default=[40, 1000, 10000],
+                        help="número de archivos de jugador")
+    parser.add_argument('--workers', type=int, nargs='+',
+                        help="procesos a probar (0 = sin pool); por defecto 0, 1, 2, 4... hasta los núcleos")
+    parser.add_argument('--destino', choices=['tablas', 'partidos'], default='partidos')
+    args = parser.parse_args()
+
+    nucleos = os.cpu_count() or 1
+    workers = args.workers or [0] + [2 ** i for i in range(nucleos.bit_length()) if 2 ** i <= nucleos]
+    print(f"{nucleos} núcleos\n")
+
+    resultados = []
+    for tamano in args.tamanos:
+        directorio = tempfile.mkdtemp(prefix=f"ingesta_{tamano}_")
+        try:
+            escribir_csvs(os.path.join(directorio, 'csv'), tamano)
+            for n in workers:
+                db = os.path.join(directorio, f"bench_{n}.db")
+                inicio = time.perf_counter()
+                _, filas = ingerir_carpeta(os.path.join(directorio, 'csv'), db, workers=n, destino=args.destino)
+                resultados.append((tamano, n, filas, time.perf_counter() - inicio))
+        finally:
+            shutil.rmtree(directorio, ignore_errors=True)
+
+    print(f"\n{'archivos':>8} {'procesos':>8} {'filas':>9} {'segundos':>9} {'filas/s':>10} {'vs 0':>6}")
+    base = {}
+    for tamano, n, filas, duracion in resultados:
+        base.setdefault(tamano, duracion)
+        print(f"{tamano:>8} {n:>8} {filas:>9} {duracion:>9.2f} {filas / duracion:>10,.0f} "
+              f"{base[tamano] / duracion:>5.1f}x")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,48 @@
+"""Compara los backends de table_parsers.py sobre páginas de partidos.
+
+Uso (desde la raíz del repositorio):
+    python -m benchmarks.bench_parsers                  # páginas sintéticas
+    python -m benchmarks.bench_parsers --paginas DIR    # páginas guardadas (*.html)
+"""
+import argparse
+import glob
+import os
+import time
+
+from fetchers import parse_match_logs_html
+from table_parsers import PARSERS
+from benchmarks.datos_sinteticos import paginas
+
+def cargar_paginas(directorio):
+    rutas = sorted(glob.glob(os.path.join(directorio, '*.html')))
+    for ruta in rutas:
+        with open(ruta, encoding='utf-8') as f:
+            yield f.read()
+
+def medir(html_paginas, parser, repeticiones):
+    inicio = time.perf_counter()
+    for _ in range(repeticiones):
+        resultados = [parse_match_logs_html(html, parser) for html in html_paginas]
+    return (time.perf_counter() - inicio) / (repeticiones * len(html_paginas)), resultados
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--paginas', help="directorio con páginas de fbref guardadas")
+    parser.add_argument('--n', type=int, default=30, help="páginas sintéticas a generar")
+    parser.add_argument('--repeticiones', type=int, default=3)
+    args = parser.parse_args()
+
+    html_paginas = list(cargar_paginas(args.paginas) if args.paginas else paginas(args.n))
+    tamano = sum(len(html) for html in html_paginas) / len(html_paginas) / 1024
+    print(f"{len(html_paginas)} páginas, {tamano:.0f} KB de media\n")
+
+    base_tiempo, base = medir(html_paginas, 'bs4', args.repeticiones)
+    print(f"{'parser':<8} {'ms/página':>10} {'aceleración':>12}  idéntico")
+    for nombre in PARSERS:
+        tiempo, resultados = (base_tiempo, base) if nombre == 'bs4' else medir(html_paginas, nombre, args.repeticiones)
+        identico = all((a is None and b is None) or (a is not None and b is not None and a.equals(b))
+                       for a, b in zip(base, resultados))
+        print(f"{nombre:<8} {tiempo * 1000:>10.2f} {base_tiempo / tiempo:>11.1f}x  {'sí' if identico else 'NO'}")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,187 @@
+"""Mide cada etapa del pipeline contra el servidor local (sin fbref ni pausas).
+
+Etapas: descarga (HttpFetcher), parseo (parse_match_logs_rows, lo que usa
+procesar_jugador), guardado (save_match_logs), ingesta en tablas por
+jugador con jugador_id (lo de guardar_jugadores.py + ingresar_jugadores_id.py,
+vía ingesta_paralela), unión (unir_partidos.crear_tabla_partidos, completa y
+sin cambios) y agregados.
+
+Uso (desde la raíz del repositorio):
+    python -m benchmarks.bench_pipeline --n 40 1000 --salida resultados.json
+    python -m benchmarks.bench_pipeline --n 40 --comparar resultados.json
+    python -m benchmarks.bench_pipeline --grabaciones benchmarks/grabaciones --latencia 0.05
+"""
+import argparse
+import contextlib
+import io
+import json
+import os
+import platform
+import shutil
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime
+
+from benchmarks.datos_sinteticos import escribir_roster
+from benchmarks.servidor_replay import ServidorReplay
+
+RAIZ = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+UMBRAL_REGRESION = 1.2
+
+def _percentil(valores, p):
+    if not valores:
+        return None
+    ordenados = sorted(valores)
+    return ordenados[min(len(ordenados) - 1, int(round(p / 100 * (len(ordenados) - 1))))]
+
+def _etapa(segundos, elementos, tiempos=None):
+    etapa = {'segundos': round(segundos, 4), 'elementos': elementos,
+             'por_segundo': round(elementos / segundos, 1) if segundos else None}
+    if tiempos:
+        etapa.update({
+            'p50_ms': round(_percentil(tiempos, 50) * 1000, 3),
+            'p95_ms': round(_percentil(tiempos, 95) * 1000, 3),
+            'media_ms': round(statistics.fmean(tiempos) * 1000, 3),
+        })
+    return etapa
+
+def _cronometrar(funcion, items):
+    """Aplica funcion a cada item; devuelve (resultados, total, tiempos por item)"""
+    resultados, tiempos = [], []
+    inicio = time.perf_counter()
+    for item in items:
+        t = time.perf_counter()
+        resultados.append(funcion(item))
+        tiempos.append(time.perf_counter() - t)
+    return resultados, time.perf_counter() - inicio, tiempos
+
+def correr(n, grabaciones=None, concurrencia=8, latencia=0.0):
+    """Corre el pipeline completo con n jugadores en un directorio temporal"""
+    from fetchers import HttpFetcher, parse_match_logs_rows
+    from main import save_match_logs
+    from ingesta_paralela import ingerir_carpeta
+    from agregados import actualizar_agregados
+    from unir_partidos import crear_tabla_partidos
+
+    etapas = {}
+    directorio = tempfile.mkdtemp(prefix=f"pipeline_{n}_")
+    anterior = os.getcwd()
+    os.chdir(directorio)   # partidos_data y la base quedan fuera del repositorio
+    try:
+        escribir_roster('roster.csv', n)
+        import pandas as pd
+        roster = pd.read_csv('roster.csv')
+        jugadores = list(zip(roster['nombre'], roster['href']))
+
+        with ServidorReplay(grabaciones, latencia=latencia) as servidor, \
+                contextlib.redirect_stdout(io.StringIO()):
+            fetcher = HttpFetcher(base_url=servidor.base_url, pool_size=concurrencia)
+            tiempos = []
+
+            def descargar(href):
+                t = time.perf_counter()
+                html = fetcher.fetch_matchlogs_html(href)
+                tiempos.append(time.perf_counter() - t)
+                return html
+
+            inicio = time.perf_counter()
+            with ThreadPoolExecutor(max_workers=concurrencia) as executor:
+                paginas = list(executor.map(descargar, [href for _, href in jugadores]))
+            etapas['descarga'] = _etapa(time.perf_counter() - inicio, len(paginas), tiempos)
+            etapas['descarga']['peticiones'] = servidor.peticiones
+            etapas['descarga']['bytes'] = sum(len(html) for html in paginas if html)
+            fetcher.close()
+
+        with contextlib.redirect_stdout(io.StringIO()):
+            tablas, segundos, tiempos = _cronometrar(
+                lambda html: parse_match_logs_rows(html) if html else None, paginas)
+            etapas['parseo'] = _etapa(segundos, len(paginas), tiempos)
+
+            pares = [(df, nombre) for df, (nombre, _) in zip(tablas, jugadores) if df is not None]
+            _, segundos, tiempos = _cronometrar(lambda par: save_match_logs(*par), pares)
+            etapas['guardado'] = _etapa(segundos, len(pares), tiempos)
+
+            inicio = time.perf_counter()
+            _, filas = ingerir_carpeta('partidos_data', 'bench.db', workers=0, destino='tablas')
+            etapas['ingesta'] = _etapa(time.perf_counter() - inicio, filas)
+
+            for etapa in ('union', 'union_sin_cambios'):
+                inicio = time.perf_counter()
+                crear_tabla_partidos('bench.db')
+                etapas[etapa] = _etapa(time.perf_counter() - inicio, len(pares))
+
+            inicio = time.perf_counter()
+            actualizar_agregados('bench.db')
+            etapas['agregados'] = _etapa(time.perf_counter() - inicio, len(pares))
+    finally:
+        os.chdir(anterior)
+        shutil.rmtree(directorio, ignore_errors=True)
+    return {'jugadores': n, 'concurrencia': concurrencia, 'latencia': latencia, 'etapas': etapas}
+
+def _version():
+    try:
+        return subprocess.run(['git', 'rev-parse', '--short', 'HEAD'], cwd=RAIZ,
+                              capture_output=True, text=True, check=True).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+def comparar(resultado, anterior):
+    """Imprime la razón tiempo nuevo / tiempo anterior por etapa"""
+    previas = {corrida['jugadores']: corrida['etapas'] for corrida in anterior['corridas']}
+    print(f"\nComparación con {anterior.get('version')} ({anterior.get('fecha')}):")
+    for corrida in resultado['corridas']:
+        etapas_previas = previas.get(corrida['jugadores'])
+        if not etapas_previas:
+            continue
+        for nombre, etapa in corrida['etapas'].items():
+            previa = etapas_previas.get(nombre)
+            if not previa or not previa['segundos']:
+                continue
+            razon = etapa['segundos'] / previa['segundos']
+            marca = "⚠ regresión" if razon > UMBRAL_REGRESION else ""
+            print(f"  {corrida['jugadores']:>6} {nombre:<18} {previa['segundos']:>9.3f} -> "
+                  f"{etapa['segundos']:>9.3f} s  ({razon:.2f}x) {marca}")
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--n', type=int, nargs='+', default=[40], help="jugadores (p. ej. 40 1000 10000)")
+    parser.add_argument('--grabaciones', help="directorio de páginas grabadas (servidor_replay.py)")
+    parser.add_argument('--concurrencia', type=int, default=8)
+    parser.add_argument('--latencia', type=float, default=0.0, help="segundos por petición")
+    parser.add_argument('--salida', help="archivo JSON con los resultados")
+    parser.add_argument('--comparar', help="JSON de una corrida anterior")
+    args = parser.parse_args()
+
+    sys.path.insert(0, RAIZ)
+    resultado = {
+        'version': _version(),
+        'fecha': datetime.now().isoformat(timespec='seconds'),
+        'python': platform.python_version(),
+        'plataforma': platform.platform(),
+        'nucleos': os.cpu_count(),
+        'corridas': [],
+    }
+    for n in args.n:
+        corrida = correr(n, args.grabaciones, args.concurrencia, args.latencia)
+        resultado['corridas'].append(corrida)
+        print(f"\n{n} jugadores")
+        print(f"  {'etapa':<18} {'segundos':>9} {'por seg.':>10} {'p50 ms':>9} {'p95 ms':>9}")
+        for nombre, etapa in corrida['etapas'].items():
+            p50 = f"{etapa['p50_ms']:>9.2f}" if 'p50_ms' in etapa else f"{'':>9}"
+            p95 = f"{etapa['p95_ms']:>9.2f}" if 'p95_ms' in etapa else f"{'':>9}"
+            print(f"  {nombre:<18} {etapa['segundos']:>9.3f} {etapa['por_segundo'] or 0:>10.1f} {p50} {p95}")
+
+    if args.salida:
+        with open(args.salida, 'w', encoding='utf-8') as f:
+            json.dump(resultado, f, ensure_ascii=False, indent=2)
+        print(f"\n✔ Resultados guardados en {args.salida}")
+    if args.comparar:
+        with open(args.comparar, encoding='utf-8') as f:
+            comparar(resultado, json.load(f))
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,264 @@
+"""Generador de páginas y datos sintéticos con la forma de los de fbref.
+
+Sirve para medir el pipeline sin conectarse a fbref. Las columnas replican
+las dos variantes que aparecen en partidos_data: jugadores con estadísticas
+avanzadas (xG, Toques, PrgP...) y jugadores sin ellas.
+"""
+import random
+import zlib
+from datetime import date, timedelta
+from html import escape
+
+COLUMNAS_BASICAS = [
+    'Fecha', 'Día', 'Comp', 'Ronda', 'Sedes', 'Resultado', 'Equipo', 'Adversario',
+    'Arranque', 'Posc', 'Mín', 'Gls.', 'Ass', 'TP', 'TPint', 'Dis', 'DaP', 'TA', 'TR',
+    'Fls', 'FR', 'PA', 'Pcz', 'TklG', 'Int', 'GC', 'Penal ejecutado', 'Penal concedido',
+    'Informe del partido',
+]
+COLUMNAS_AVANZADAS = [
+    'Fecha', 'Día', 'Comp', 'Ronda', 'Sedes', 'Resultado', 'Equipo', 'Adversario',
+    'Arranque', 'Posc', 'Mín', 'Gls.', 'Ass', 'TP', 'TPint', 'Dis', 'DaP', 'TA', 'TR',
+    'Toques', 'Tkl', 'Int', 'Bloqueos', 'xG', 'npxG', 'xAG', 'ACT', 'ACG', 'Cmp', 'Int.',
+    '% Cmp', 'PrgP', 'Transportes', 'PrgC', 'Att', 'Succ', 'Informe del partido',
+]
+
+# Tabla de pases que fbref trae comentada en la misma página; repite
+# Cmp/Att/% Cmp para el total y para pases cortos, medios y largos
+COLUMNAS_PASES = ['Cmp', 'Att', '% Cmp', 'Dist. tot.', 'Dist. prg.', 'Cmp', 'Att', '% Cmp',
+                  'Cmp', 'Att', '% Cmp', 'Cmp', 'Att', '% Cmp', 'Ass', 'xAG', 'xA', 'PC',
+                  '1/3', 'PPA', 'CrAP', 'PrgP']
+
+DIAS = ['Lun', 'Mar', 'Mié', 'Jue', 'Vie', 'Sáb', 'Dom']
+EQUIPOS = ['Nacional', 'Junior', 'Millonarios', 'América de Cali', 'Santa Fe', 'Deportivo Cali',
+           'Once Caldas', 'Medellín', 'La Equidad', 'Alianza', 'Bucaramanga', 'Tolima',
+           'Liverpool', 'Crystal Palace', 'Porto', 'Bologna', 'Colombia']
+COMPETICIONES = [('Primera A', 'Apertura — First stage'), ('Primera A', 'Finalización — First stage'),
+                 ('Copa Libertadores', 'Fase de grupos'), ('Premier League', 'Semana 7 de partido'),
+                 ('Copa Colombia', 'Octavos de final'), ('Amistosos (M)', 'Amistosos')]
+POSICIONES = ['GK', 'CB', 'RB', 'LB', 'DM', 'CM', 'AM', 'RW', 'LW', 'FW']
+NOMBRES = ['Juan', 'Luis', 'Carlos', 'Jhon', 'Andrés', 'Daniel', 'Kevin', 'James', 'Yerson',
+           'Jefferson', 'Davinson', 'Jhon Jáder', 'Camilo', 'Sebastián', 'Álvaro', 'Mateus']
+APELLIDOS = ['Díaz', 'Arias', 'Muñoz', 'Rodríguez', 'Sánchez', 'Córdoba', 'Lerma', 'Ríos',
+             'Borré', 'Castaño', 'Mojica', 'Cuesta', 'Gómez', 'Román', 'Ospina', 'Quintero']
+
+def player_id(i):
+    """Id de 8 caracteres hexadecimales como los de fbref"""
+    return f"{(i * 2654435761) & 0xffffffff:08x}"
+
+def roster(n, seed=0):
+    """[(nombre, href)] de n jugadores sintéticos con nombres únicos"""
+    rng = random.Random(seed)
+    jugadores = []
+    for i in range(n):
+        nombre = f"{rng.choice(NOMBRES)} {rng.choice(APELLIDOS)} {i}"
+        slug = nombre.replace(' ', '-')
+        jugadores.append((nombre, f"https://fbref.com/es/jugadores/{player_id(i)}/{slug}"))
+    return jugadores
+
+def _valor(col, rng, minutos):
+    if col in ('xG', 'npxG', 'xAG'):
+        return f"{rng.random() * 0.8:.1f}"
+    if col == '% Cmp':
+        return f"{rng.uniform(50, 100):.1f}"
+    if col in ('Toques', 'Cmp', 'Int.'):
+        return str(rng.randint(0, 80) * minutos // 90)
+    if col == 'Mín':
+        return str(minutos)
+    return str(rng.choice([0, 0, 0, 0, 1, 1, 2]))
+
+def partidos(n, avanzadas, rng, inicio=date(2024, 7, 1)):
+    """Filas de partidos (lista de listas de texto) para un jugador"""
+    columnas = COLUMNAS_AVANZADAS if avanzadas else COLUMNAS_BASICAS
+    equipo = rng.choice(EQUIPOS)
+    fecha = inicio
+    filas = []
+    for _ in range(n):
+        fecha += timedelta(days=rng.randint(3, 10))
+        comp, ronda = rng.choice(COMPETICIONES)
+        gf, gc = rng.randint(0, 4), rng.randint(0, 3)
+        tipo = 'V' if gf > gc else 'E' if gf == gc else 'D'
+        minutos = rng.choice([90, 90, 90, 45, 62, 75, 13, 88])
+        base = {
+            'Fecha': fecha.isoformat(), 'Día': DIAS[fecha.weekday()], 'Comp': comp, 'Ronda': ronda,
+            'Sedes': rng.choice(['Local', 'Visitante']), 'Resultado': f"{tipo} {gf}–{gc}",
+            'Equipo': equipo, 'Adversario': rng.choice([e for e in EQUIPOS if e != equipo]),
+            'Arranque': rng.choice(['Sí', 'Sí', 'No']), 'Posc': rng.choice(POSICIONES),
+            'Informe del partido': 'Informe del partido',
+        }
+        filas.append([base[col] if col in base else _valor(col, rng, minutos) for col in columnas])
+    return columnas, filas
+
+def _fila_html(columnas, fila, match_id):
+    celdas = [f'<th scope="row" class="left" data-stat="date"><a href="/es/partidos/{match_id}/">{fila[0]}</a></th>']
+    for col, valor in zip(columnas[1:], fila[1:]):
+        if col == 'Informe del partido':
+            celdas.append(f'<td class="left" data-stat="match_report"><a href="/es/partidos/{match_id}/">{valor}</a></td>')
+        elif col in ('Equipo', 'Adversario', 'Comp'):
+            celdas.append(f'<td class="left" data-stat="{escape(col)}"><a href="/es/equipos/x/">{escape(valor)}</a></td>')
+        else:
+            celdas.append(f'<td class="right" data-stat="{escape(col)}">{escape(valor)}</td>')
+    return '<tr>' + ''.join(celdas) + '</tr>'
+
+def tabla_html(table_id, columnas, filas, seed=0):
+    """Tabla con doble encabezado y filas de encabezado repetidas cada 20"""
+    encabezado = ''.join(f'<th aria-label="{escape(c)}" data-stat="{escape(c)}" scope="col">{escape(c)}</th>'
+                         for c in columnas)
+    cuerpo = []
+    equipo = columnas.index('Equipo')
+    for i, fila in enumerate(filas):
+        if i and i % 20 == 0:
+            cuerpo.append('<tr class="thead">' + encabezado + '</tr>')
+        cuerpo.append(_fila_html(columnas, fila, partido_id(EQUIPOS.index(fila[equipo]), i)))
+    return (f'<table class="stats_table sortable min_width" id="{table_id}" data-cols-to-freeze=",1">'
+            f'<caption>Registros de partidos</caption><colgroup>{"<col>" * len(columnas)}</colgroup>'
+            f'<thead><tr class="over_header"><th colspan="10"></th><th colspan="{len(columnas) - 10}" '
+            f'class="over_header center">Rendimiento</th></tr><tr>{encabezado}</tr></thead>'
+            f'<tbody>{"".join(cuerpo)}</tbody></table>')
+
+# ---------------------------------------------------------------------------
+# INFORMES DE PARTIDO COMPARTIDOS
+# ---------------------------------------------------------------------------
+# Los jugadores sintéticos de un mismo equipo comparten sus partidos: la
+# fila i de todos ellos enlaza al mismo informe, cuyo id codifica el equipo
+# y la fila para poder generar el informe sin guardar nada.
+COLUMNAS_INFORME = ['Jugador', '#', 'País', 'Posc', 'Edad', 'Mín', 'Gls.', 'Ass', 'TP', 'TPint',
+                    'Dis', 'DaP', 'TA', 'TR', 'Toques', 'Tkl', 'Int', 'Bloqueos', 'xG', 'npxG',
+                    'xAG', 'ACT', 'ACG', 'Cmp', 'Int.', '% Cmp', 'PrgP', 'Transportes', 'PrgC']
+
+def partido_id(equipo, fila):
+    """Id de 8 caracteres: equipo (1 byte), fila (1 byte) y 2 bytes de relleno"""
+    relleno = zlib.crc32(f"{equipo}-{fila}".encode()) & 0xffff
+    return f"{equipo:02x}{fila:02x}{relleno:04x}"
+
+def equipo_y_filas(player_id):
+    """(índice del equipo, partidos) del jugador sintético, como en pagina_para()"""
+    seed = int(player_id, 16)
+    n_partidos = random.Random(seed).randint(10, 60)
+    return EQUIPOS.index(random.Random(seed).choice(EQUIPOS)), n_partidos
+
+def _tabla_informe(table_id, jugadores, rng, columnas=COLUMNAS_INFORME):
+    encabezado = ''.join(f'<th aria-label="{escape(c)}" data-stat="{escape(c)}" scope="col">{escape(c)}</th>'
+                         for c in columnas)
+    cuerpo = []
+    for pid, nombre in jugadores:
+        minutos = rng.choice([90, 90, 90, 45, 62, 75, 13, 88])
+        celdas = [f'<th scope="row" class="left" data-append-csv="{pid}" data-stat="player">'
+                  f'<a href="/es/jugadores/{pid}/{nombre.replace(" ", "-")}">{escape(nombre)}</a></th>',
+                  f'<td data-stat="shirtnumber">{rng.randint(1, 30)}</td>',
+                  '<td data-stat="nationality"><a href="/es/paises/COL/">co COL</a></td>',
+                  f'<td data-stat="position">{rng.choice(POSICIONES)}</td>',
+                  f'<td data-stat="age">{rng.randint(18, 36)}-{rng.randint(0, 364):03d}</td>']
+        celdas += [f'<td class="right" data-stat="{escape(col)}">{escape(_valor(col, rng, minutos))}</td>'
+                   for col in columnas[5:]]
+        cuerpo.append('<tr>' + ''.join(celdas) + '</tr>')
+    return (f'<table class="stats_table sortable min_width" id="{table_id}">'
+            f'<thead><tr class="over_header"><th colspan="5"></th><th colspan="{len(columnas) - 5}" '
+            f'class="over_header center">Rendimiento</th></tr><tr>{encabezado}</tr></thead>'
+            f'<tbody>{"".join(cuerpo)}</tbody><tfoot><tr><th>{len(jugadores)} Jugadores</th></tr></tfoot></table>')
+
+def pagina_informe(match_id, max_jugadores=2000):
+    """Informe de partido con la tabla resumen de cada equipo.
+
+    El equipo local trae a todos los jugadores sintéticos (player_id(i),
+    i < max_jugadores) de ese equipo con al menos fila+1 partidos; el
+    visitante, jugadores que no están en ningún roster.
+    """
+    equipo, fila = int(match_id[:2], 16), int(match_id[2:4], 16)
+    if equipo >= len(EQUIPOS):
+        return None
+    rng = random.Random(int(match_id, 16))
+    local = []
+    for i in range(max_jugadores):
+        equipo_jugador, n_partidos = equipo_y_filas(player_id(i))
+        if equipo_jugador == equipo and n_partidos > fila:
+            local.append((player_id(i), f"Jugador {i}"))
+    visitante = [(f"{rng.getrandbits(32):08x}", f"Rival {k}") for k in range(rng.randint(11, 16))]
+    tablas = ''.join(
+        f'<div id="all_stats_{equipo_id}_summary"><div class="table_container">'
+        f'{_tabla_informe(f"stats_{equipo_id}_summary", jugadores, rng)}</div></div>'
+        f'<div id="all_stats_{equipo_id}_passing"><!--\n'
+        f'{_tabla_informe(f"stats_{equipo_id}_passing", jugadores, rng, COLUMNAS_INFORME[:6] + COLUMNAS_PASES)}'
+        '\n--></div>'
+        for equipo_id, jugadores in ((f"{zlib.crc32(EQUIPOS[equipo].encode()):08x}", local),
+                                     (f"{rng.getrandbits(32):08x}", visitante)))
+    return (
+        '<!DOCTYPE html><html lang="es"><head><meta charset="utf-8"><title>Informe del partido</title></head>'
+        f'<body><div id="wrap"><h1>{escape(EQUIPOS[equipo])} - Informe del partido</h1>{tablas}</div></body></html>'
+    )
+
+def tabla_pases(columnas, filas, seed=0):
+    """Tabla de pases de los mismos partidos (mismas 10 primeras columnas)"""
+    rng = random.Random(seed + 1)
+    columnas_pases = columnas[:10] + ['Mín'] + COLUMNAS_PASES + ['Informe del partido']
+    mins = columnas.index('Mín')
+    filas_pases = [fila[:10] + [fila[mins]] + [_valor(col, rng, int(fila[mins])) for col in COLUMNAS_PASES]
+                   + [fila[-1]] for fila in filas]
+    return tabla_html('matchlogs_passing', columnas_pases, filas_pases, seed)
+
+def pagina_matchlogs(n_partidos=45, avanzadas=True, seed=0):
+    """HTML de una página de registros de partidos con el relleno típico de fbref"""
+    rng = random.Random(seed)
+    columnas, filas = partidos(n_partidos, avanzadas, rng)
+    menu = ''.join(f'<li><a href="/es/comps/{i}/">Competición {i}</a></li>' for i in range(600))
+    script = '<script>var sr_data = {' + ','.join(f'"k{i}":{i}' for i in range(3000)) + '};</script>'
+    tabla_oculta = tabla_html('matchlogs_for', columnas, filas[:10], seed)
+    return (
+        '<!DOCTYPE html><html lang="es"><head><meta charset="utf-8"><title>Registros de partidos</title>'
+        f'{script}</head><body><div id="wrap"><div id="header"><ul class="menu">{menu}</ul></div>'
+        '<div id="info"><h1>Jugador sintético</h1><p>Posición: FW&nbsp;▪&nbsp; Pie: Derecho</p></div>'
+        '<div class="filter"><div class="current"><a href="#">Todas las competencias</a></div></div>'
+        f'<div id="all_matchlogs"><div class="table_container">{tabla_html("matchlogs_all", columnas, filas, seed)}</div></div>'
+        f'<div id="all_matchlogs_for"><!--\n{tabla_oculta}\n--></div>'
+        f'<div id="all_matchlogs_passing"><!--\n{tabla_pases(columnas, filas, seed)}\n--></div>'
+        f'<div id="footer">{menu}</div></div></body></html>'
+    )
+
+def paginas(n, seed=0):
+    """Genera n páginas alternando jugadores con y sin estadísticas avanzadas"""
+    rng = random.Random(seed)
+    for i in range(n):
+        yield pagina_matchlogs(rng.randint(10, 60), avanzadas=rng.random() < 0.5, seed=seed + i)
+
+def escribir_csvs(directorio, n, seed=0):
+    """Escribe n archivos '<Nombre>_partidos.csv' como los de partidos_data"""
+    import csv
+    import os
+
+    os.makedirs(directorio, exist_ok=True)
+    rng = random.Random(seed)
+    for nombre, _ in roster(n, seed):
+        columnas, filas = partidos(rng.randint(10, 60), rng.random() < 0.5, rng)
+        ruta = os.path.join(directorio, f"{nombre.replace(' ', '_')}_partidos.csv")
+        with open(ruta, 'w', newline='', encoding='utf-8-sig') as f:
+            writer = csv.writer(f)
+            writer.writerow(columnas)
+            for i, fila in enumerate(filas):
+                if i and i % 20 == 0:
+                    writer.writerow(columnas)      # encabezado repetido de fbref
+                writer.writerow(fila)
+
+def escribir_roster(csv_path, n, seed=0):
+    """CSV 'nombre,href' como jugadores_activos_colombianos.csv"""
+    import csv
+
+    with open(csv_path, 'w', newline='', encoding='utf-8') as f:
+        writer = csv.writer(f)
+        writer.writerow(['nombre', 'href'])
+        writer.writerows(roster(n, seed))
+
+def pagina_jugador(player_id, temporada):
+    """Perfil con la tabla de estadísticas cuya última fila enlaza a 'Partidos'"""
+    return (
+        '<!DOCTYPE html><html lang="es"><head><meta charset="utf-8"></head><body>'
+        f'<div id="info"><h1>Jugador {player_id}</h1></div>'
+        '<div class="filter"><div class="current"><a href="#">Todas las competencias</a></div></div>'
+        '<table class="stats_table" id="stats_standard_dom_lg"><tbody><tr>'
+        f'<th>{temporada}</th><td>Primera A</td>'
+        f'<td><a href="/es/jugadores/{player_id}/matchlogs/{temporada}/">Partidos</a></td>'
+        '</tr></tbody></table></body></html>'
+    )
+
+def pagina_para(player_id):
+    """Página de partidos determinista para un id (misma forma que paginas())"""
+    rng = random.Random(int(player_id, 16))
+    return pagina_matchlogs(rng.randint(10, 60), avanzadas=rng.random() < 0.5, seed=int(player_id, 16))
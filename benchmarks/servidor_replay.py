@@ -0,0 +1,170 @@
+"""Servidor HTTP local que reproduce páginas de fbref para medir sin conexión.
+
+Sirve primero las páginas grabadas en un directorio (misma ruta que en
+fbref, con index.html para las que terminan en '/') y, para el resto de
+jugadores, genera perfiles, registros de partidos e informes de partido
+sintéticos.
+
+Uso (desde la raíz del repositorio):
+    python -m benchmarks.servidor_replay --grabar jugadores_activos_colombianos.csv --n 5
+    python -m benchmarks.servidor_replay --puerto 8765      # y HttpFetcher(base_url='http://127.0.0.1:8765')
+"""
+import argparse
+import os
+import re
+import threading
+import time
+from datetime import date
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import unquote, urlsplit
+
+from benchmarks.datos_sinteticos import pagina_informe, pagina_jugador, pagina_para
+
+DIRECTORIO_GRABACIONES = os.path.join(os.path.dirname(__file__), 'grabaciones')
+MATCHLOGS_RE = re.compile(r'^/es/jugadores/([0-9a-f]{8})/matchlogs/([^/]+)/$')
+JUGADOR_RE = re.compile(r'^/es/jugadores/([0-9a-f]{8})/[^/]+$')
+INFORME_RE = re.compile(r'^/es/partidos/([0-9a-f]{8})/')
+
+def ruta_grabacion(directorio, path):
+    path = unquote(urlsplit(path).path)
+    relativa = path.lstrip('/') + ('index.html' if path.endswith('/') else '')
+    return os.path.join(directorio, *relativa.split('/'))
+
+class _Manejador(BaseHTTPRequestHandler):
+    protocol_version = 'HTTP/1.1'   # keep-alive, como fbref
+
+    def do_GET(self):
+        servidor = self.server
+        if servidor.latencia:
+            time.sleep(servidor.latencia)
+        cuerpo = self._grabada() or self._sintetica()
+        servidor.contar(cuerpo is not None)
+        estado = 200 if cuerpo is not None else 404
+        cuerpo = (cuerpo or "<html><body>Página no encontrada</body></html>").encode('utf-8')
+        self.send_response(estado)
+        self.send_header('Content-Type', 'text/html; charset=utf-8')
+        self.send_header('Content-Length', str(len(cuerpo)))
+        self.end_headers()
+        self.wfile.write(cuerpo)
+
+    def _grabada(self):
+        if not self.server.directorio:
+            return None
+        ruta = ruta_grabacion(self.server.directorio, self.path)
+        if os.path.isfile(ruta):
+            with open(ruta, encoding='utf-8') as f:
+                return f.read()
+        return None
+
+    def _sintetica(self):
+        if not self.server.sinteticos:
+            return None
+        path = urlsplit(self.path).path
+        match = MATCHLOGS_RE.match(path)
+        if match:
+            return pagina_para(match.group(1)) if match.group(2) == self.server.temporada else None
+        match = JUGADOR_RE.match(path)
+        if match:
+            return pagina_jugador(match.group(1), self.server.temporada)
+        match = INFORME_RE.match(path)
+        if match:
+            return pagina_informe(match.group(1))
+        return None
+
+    def log_message(self, *args):
+        pass
+
+class ServidorReplay:
+    """Servidor en un hilo aparte; usar como contexto y leer .base_url.
+
+    temporada: la única temporada con registros sintéticos (por defecto el
+    año actual), así el fetcher sondea las URLs igual que contra fbref.
+    latencia: segundos de espera por petición para simular la red.
+    """
+
+    def __init__(self, directorio=None, sinteticos=True, latencia=0.0, temporada=None, puerto=0):
+        self.httpd = ThreadingHTTPServer(('127.0.0.1', puerto), _Manejador)
+        self.httpd.daemon_threads = True
+        self.httpd.directorio = directorio
+        self.httpd.sinteticos = sinteticos
+        self.httpd.latencia = latencia
+        self.httpd.temporada = temporada or str(date.today().year)
+        self.httpd.peticiones = {'ok': 0, 'no_encontradas': 0}
+        lock = threading.Lock()
+
+        def contar(ok):
+            with lock:
+                self.httpd.peticiones['ok' if ok else 'no_encontradas'] += 1
+        self.httpd.contar = contar
+        self.hilo = None
+
+    @property
+    def base_url(self):
+        host, puerto = self.httpd.server_address[:2]
+        return f"http://{host}:{puerto}"
+
+    @property
+    def peticiones(self):
+        return dict(self.httpd.peticiones)
+
+    def __enter__(self):
+        self.hilo = threading.Thread(target=self.httpd.serve_forever, daemon=True)
+        self.hilo.start()
+        return self
+
+    def __exit__(self, *exc):
+        self.httpd.shutdown()
+        self.httpd.server_close()
+
+def grabar(csv_path, n=5, directorio=DIRECTORIO_GRABACIONES):
+    """Descarga de fbref el perfil y los registros de partidos de los primeros
+    n jugadores del CSV y los guarda para reproducirlos después"""
+    import pandas as pd
+    from fetchers import HttpFetcher, extract_player_id, temporadas_candidatas, build_matchlogs_url
+    from limitador import DescargaPospuesta
+
+    fetcher = HttpFetcher()
+    guardadas = 0
+    try:
+        for href in pd.read_csv(csv_path)['href'].head(n):
+            player_id = extract_player_id(href)
+            urls = [href] + [build_matchlogs_url(player_id, t) for t in temporadas_candidatas()]
+            for url in urls:
+                # El gobernador del fetcher respeta el límite de peticiones de fbref
+                try:
+                    html = fetcher.get(url, quiet=True)
+                except DescargaPospuesta:
+                    continue
+                if html is None:
+                    continue
+                ruta = ruta_grabacion(directorio, url)
+                os.makedirs(os.path.dirname(ruta), exist_ok=True)
+                with open(ruta, 'w', encoding='utf-8') as f:
+                    f.write(html)
+                guardadas += 1
+    finally:
+        fetcher.close()
+    print(f"✔ {guardadas} páginas guardadas en {directorio}")
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--grabar', metavar='CSV', help="graba páginas reales de los jugadores del CSV")
+    parser.add_argument('--n', type=int, default=5, help="jugadores a grabar")
+    parser.add_argument('--dir', default=DIRECTORIO_GRABACIONES, help="directorio de páginas grabadas")
+    parser.add_argument('--puerto', type=int, default=8765)
+    parser.add_argument('--latencia', type=float, default=0.0)
+    args = parser.parse_args()
+
+    if args.grabar:
+        grabar(args.grabar, args.n, args.dir)
+        return
+    with ServidorReplay(args.dir, latencia=args.latencia, puerto=args.puerto) as servidor:
+        print(f"Sirviendo en {servidor.base_url} (Ctrl-C para terminar)")
+        try:
+            while True:
+                time.sleep(3600)
+        except KeyboardInterrupt:
+            pass
+
+if __name__ == "__main__":
+    main()
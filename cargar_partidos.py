@@ -0,0 +1,172 @@
+import csv
+import os
+import re
+import sqlite3
+import time
+
+from esquema_partidos import COLUMNAS_RESULTADO, crear_indices, fila_tipada, tipo_columna
+
+# ---------------------------------------------------------------------------
+# CONFIGURACIÓN
+# ---------------------------------------------------------------------------
+carpeta_csv = "partidos_data"
+db_path = "mi_base_de_datos.db"
+
+# Valores que pandas.read_csv trata como vacíos (NULL en SQLite)
+VALORES_NULOS = {'', 'nan', 'NaN', 'NA', 'N/A', 'n/a', 'null', 'NULL', 'None', '#N/A', '-nan', '-NaN'}
+ENTERO_RE = re.compile(r'^[+-]?\d+$')
+
+PRAGMAS_CARGA = [
+    "PRAGMA journal_mode=WAL",
+    "PRAGMA synchronous=NORMAL",
+    "PRAGMA temp_store=MEMORY",
+    "PRAGMA cache_size=-200000",
+    "PRAGMA mmap_size=268435456",
+]
+
+# ---------------------------------------------------------------------------
+# INFERENCIA DE TIPOS PARA COLUMNAS FUERA DEL ESQUEMA (como pandas + to_sql)
+# ---------------------------------------------------------------------------
+def _es_real(valor):
+    try:
+        float(valor)
+        return True
+    except ValueError:
+        return False
+
+def inferir_tipo(valores, encabezado=None):
+    """Tipo SQLite que to_sql le daría a una columna leída con read_csv.
+
+    Se ignoran las filas de encabezado que fbref repite dentro de la tabla
+    (el valor es el propio nombre de la columna); unir_partidos.py nunca
+    llegaba a ver esos tipos, así que la tabla final conserva los numéricos.
+    """
+    hay_nulos = False
+    hay_datos = False
+    tipo = "INTEGER"
+    for valor in valores:
+        if valor == encabezado:
+            continue
+        hay_datos = True
+        if valor in VALORES_NULOS:
+            hay_nulos = True
+        elif tipo == "INTEGER" and ENTERO_RE.match(valor):
+            continue
+        elif _es_real(valor):
+            tipo = "REAL"
+        else:
+            return "TEXT"
+    # Una columna que solo repite su nombre (p. ej. 'Informe del partido') es texto
+    if not hay_datos and valores:
+        return "TEXT"
+    # Una columna entera con huecos pasa a float64 en pandas
+    if tipo == "INTEGER" and hay_nulos:
+        return "REAL"
+    return tipo
+
+def leer_csv(ruta):
+    """(encabezados, iterador de filas) de un CSV de partidos"""
+    f = open(ruta, newline='', encoding='utf-8-sig')
+    reader = csv.reader(f)
+    headers = next(reader, [])
+    return f, headers, reader
+
+def nombre_jugador(archivo):
+    """Mismo nombre que crear_tabla_jugadores.py deriva del archivo"""
+    return archivo.replace("_partidos.csv", "").replace("_", " ").strip()
+
+# ---------------------------------------------------------------------------
+# CARGA MASIVA
+# ---------------------------------------------------------------------------
+def cargar_partidos(carpeta_csv=carpeta_csv, db_path=db_path):
+    """Carga todos los CSV de carpeta_csv en una única tabla partidos.
+
+    Equivale a crear_tabla_jugadores.py + ingresar_jugadores_id.py +
+    unir_partidos.py, pero en una sola transacción y sin tablas por
+    jugador. Las columnas conocidas se guardan con su tipo (ver
+    esquema_partidos.py), las filas que no son partidos se descartan y al
+    final se crean los índices. Devuelve el número de filas cargadas.
+    """
+    inicio = time.perf_counter()
+    archivos = [a for a in os.listdir(carpeta_csv) if a.endswith("_partidos.csv")]
+    if not archivos:
+        print("No hay archivos de partidos para cargar.")
+        return 0
+
+    # Paso 1: tipos por archivo y columnas de la tabla final (en orden de aparición)
+    tipos_archivo = {}
+    tipos_columna = {}
+    for archivo in archivos:
+        f, headers, reader = leer_csv(os.path.join(carpeta_csv, archivo))
+        with f:
+            if all(tipo_columna(col) for col in headers):
+                columnas = [()] * len(headers)
+            else:
+                columnas = list(zip(*reader)) or [()] * len(headers)
+        tipos = {col: tipo_columna(col) or inferir_tipo(valores, col)
+                 for col, valores in zip(headers, columnas)}
+        tipos['jugador_id'] = "INTEGER"
+        tipos_archivo[archivo] = (headers, tipos)
+        for col, tipo in tipos.items():
+            tipos_columna.setdefault(col, set()).add(tipo)
+
+    columnas_final = [
+        f'"{col}" {"TEXT" if len(tipos) > 1 else next(iter(tipos))}'
+        for col, tipos in tipos_columna.items()
+    ] + [f'"{col}" {tipo}' for col, tipo in COLUMNAS_RESULTADO]
+
+    conn = sqlite3.connect(db_path, isolation_level=None)
+    for pragma in PRAGMAS_CARGA:
+        conn.execute(pragma)
+    filas = 0
+    descartadas = 0
+    try:
+        conn.execute("BEGIN")
+
+        # Paso 2: jugadores y mapa nombre -> jugador_id cargado una sola vez
+        conn.execute("""
+            CREATE TABLE IF NOT EXISTS jugadores (
+                jugador_id INTEGER PRIMARY KEY AUTOINCREMENT,
+                nombre_completo TEXT UNIQUE
+            )
+        """)
+        conn.executemany("INSERT OR IGNORE INTO jugadores (nombre_completo) VALUES (?)",
+                         [(nombre_jugador(a),) for a in archivos])
+        ids = dict(conn.execute("SELECT nombre_completo, jugador_id FROM jugadores"))
+
+        # Paso 3: tabla partidos y volcado de cada CSV en streaming
+        conn.execute("DROP TABLE IF EXISTS partidos")
+        conn.execute(f'CREATE TABLE partidos ({", ".join(columnas_final)})')
+
+        for archivo in archivos:
+            headers, tipos = tipos_archivo[archivo]
+            jugador_id = ids[nombre_jugador(archivo)]
+            tipos_fila = [tipos[col] for col in headers]
+            columnas = headers + [col for col, _ in COLUMNAS_RESULTADO] + ['jugador_id']
+            lista = ", ".join(f'"{col}"' for col in columnas)
+            placeholders = ", ".join(["?"] * len(columnas))
+            f, _, reader = leer_csv(os.path.join(carpeta_csv, archivo))
+            with f:
+                tipadas = (fila_tipada(headers, tipos_fila, row) for row in reader)
+                cursor = conn.executemany(
+                    f"INSERT INTO partidos ({lista}) VALUES ({placeholders})",
+                    (fila + [jugador_id] for fila in tipadas if fila is not None))
+                filas += cursor.rowcount
+                descartadas += reader.line_num - 1 - cursor.rowcount
+
+        crear_indices(conn)
+        conn.execute("COMMIT")
+    except Exception:
+        conn.execute("ROLLBACK")
+        raise
+    finally:
+        conn.close()
+
+    duracion = time.perf_counter() - inicio
+    print(f"Tabla 'partidos' cargada: {filas} filas de {len(archivos)} archivos, "
+          f"{len(columnas_final)} columnas en {duracion:.2f} s ({filas / duracion:,.0f} filas/s); "
+          f"{descartadas} filas que no eran partidos descartadas")
+    return filas
+
+if __name__ == "__main__":
+    cargar_partidos()
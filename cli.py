@@ -0,0 +1,37 @@
+"""Punto de entrada único del pipeline.
+
+    python cli.py roster  [--paises COL ...]          directorio de fbref -> CSV de jugadores
+    python cli.py scrape  [--num N] [--formato ...]   registros de partidos de cada jugador
+    python cli.py ingest  [--destino partidos]        CSV de partidos -> SQLite
+    python cli.py merge   [--reconstruir]             tablas <jugador>_partidos -> partidos
+    python cli.py query   <consulta> clave=valor      consultas con caché (o 'servir')
+
+Cada subcomando importa su módulo solo al usarse, así que 'merge' o 'query'
+no cargan requests, pandas ni Selenium. Los argumentos que siguen al
+subcomando pasan tal cual a la CLI del módulo (p. ej. python cli.py scrape --help).
+"""
+import argparse
+import importlib
+
+# subcomando: (módulo con cli(argv, prog), descripción)
+SUBCOMANDOS = {
+    'roster': ('webscraping_selenium', "genera el CSV de jugadores desde el directorio de fbref"),
+    'scrape': ('main', "descarga y guarda los registros de partidos (CSV, Parquet o SQLite)"),
+    'ingest': ('ingesta_paralela', "carga los CSV de partidos en SQLite"),
+    'merge': ('unir_partidos', "une las tablas por jugador en la tabla partidos"),
+    'query': ('consultas', "consultas sobre la tabla partidos, en consola o por HTTP"),
+}
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(prog='cli.py', description="Pipeline de partidos de fbref")
+    subparsers = parser.add_subparsers(dest='subcomando', required=True, metavar='subcomando')
+    for nombre, (_, descripcion) in SUBCOMANDOS.items():
+        # Sin -h propio: la ayuda la da el parser del módulo
+        subparsers.add_parser(nombre, help=descripcion, add_help=False)
+    args, resto = parser.parse_known_args(argv)
+
+    modulo = importlib.import_module(SUBCOMANDOS[args.subcomando][0])
+    return modulo.cli(resto, prog=f"cli.py {args.subcomando}")
+
+if __name__ == "__main__":
+    main()
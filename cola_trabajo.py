@@ -0,0 +1,332 @@
+import argparse
+import multiprocessing
+import os
+import socket
+import sqlite3
+import threading
+import time
+from datetime import datetime
+
+from limitador import REENCOLAR_MAX, CircuitoAbierto, DescargaPospuesta
+
+# ---------------------------------------------------------------------------
+# CONFIGURACIÓN
+# ---------------------------------------------------------------------------
+cola_path = "cola_trabajo.db"
+csv_path = "jugadores_activos_colombianos.csv"
+
+LEASE = 300.0          # segundos que un trabajador tiene reservado un jugador
+MAX_INTENTOS = 3       # leases vencidos (trabajador caído) antes de darlo por fallido
+
+PENDIENTE = 'pendiente'
+RECLAMADO = 'reclamado'
+HECHO = 'hecho'
+FALLIDO = 'fallido'
+
+EXITO = "Éxito"
+
+def id_trabajador():
+    return f"{socket.gethostname()}:{os.getpid()}"
+
+class ColaTrabajo:
+    """Cola de jugadores compartida en SQLite para varios procesos y máquinas.
+
+    Cada trabajador reclama jugadores con un lease de `lease` segundos que
+    renueva mientras trabaja; si muere, el lease vence y otro trabajador
+    recupera el jugador. Solo quien tiene el lease vigente puede marcarlo
+    como hecho o fallido. Para varias máquinas la base debe estar en un
+    volumen compartido con bloqueos de archivo fiables (por eso no usa WAL,
+    que requiere memoria compartida en la misma máquina).
+    """
+
+    def __init__(self, db_path=cola_path, lease=LEASE, max_intentos=MAX_INTENTOS):
+        self.lease = lease
+        self.max_intentos = max_intentos
+        self.conn = sqlite3.connect(db_path, timeout=60, isolation_level=None, check_same_thread=False)
+        self.lock = threading.Lock()
+        self.conn.execute("""
+            CREATE TABLE IF NOT EXISTS cola_jugadores (
+                href TEXT PRIMARY KEY,
+                nombre TEXT,
+                estado TEXT NOT NULL,
+                trabajador TEXT,
+                vence_en REAL,
+                intentos INTEGER NOT NULL DEFAULT 0,
+                pospuestos INTEGER NOT NULL DEFAULT 0,
+                ultimo_error TEXT,
+                actualizado_en TEXT
+            )
+        """)
+        self.conn.execute("CREATE INDEX IF NOT EXISTS idx_cola_estado ON cola_jugadores(estado, pospuestos)")
+        self.conn.execute("""
+            CREATE TABLE IF NOT EXISTS cola_trabajadores (
+                trabajador TEXT PRIMARY KEY,
+                maquina TEXT,
+                visto_en REAL
+            )
+        """)
+
+    def _transaccion(self, funcion, *args):
+        # BEGIN IMMEDIATE toma el bloqueo de escritura antes de leer: dos
+        # trabajadores nunca reclaman el mismo jugador
+        with self.lock:
+            self.conn.execute("BEGIN IMMEDIATE")
+            try:
+                resultado = funcion(*args)
+            except BaseException:
+                self.conn.execute("ROLLBACK")
+                raise
+            self.conn.execute("COMMIT")
+            return resultado
+
+    def cargar(self, players, reiniciar=False):
+        """Añade (nombre, href) a la cola; los que ya estaban se respetan salvo
+        con reiniciar, que los vuelve a poner pendientes"""
+        ahora = datetime.now().isoformat(timespec='seconds')
+        conflicto = ("DO UPDATE SET estado = excluded.estado, trabajador = NULL, vence_en = NULL, "
+                     "intentos = 0, pospuestos = 0, ultimo_error = NULL, actualizado_en = excluded.actualizado_en"
+                     if reiniciar else "DO NOTHING")
+
+        def cargar():
+            antes = self.conn.total_changes
+            self.conn.executemany(f"""
+                INSERT INTO cola_jugadores (href, nombre, estado, actualizado_en) VALUES (?, ?, ?, ?)
+                ON CONFLICT(href) {conflicto}
+            """, [(href, nombre, PENDIENTE, ahora) for nombre, href in players])
+            return self.conn.total_changes - antes
+        return self._transaccion(cargar)
+
+    def reclamar(self, trabajador, n=1):
+        """Reserva hasta n jugadores pendientes o con el lease vencido.
+
+        Devuelve [(nombre, href)]. Los que vencieron max_intentos veces
+        pasan a fallido en lugar de volver a repartirse.
+        """
+        def reclamar():
+            ahora = time.time()
+            self.conn.execute("""
+                UPDATE cola_jugadores
+                SET estado = ?, ultimo_error = 'Lease vencido demasiadas veces', trabajador = NULL
+                WHERE estado = ? AND vence_en < ? AND intentos >= ?
+            """, (FALLIDO, RECLAMADO, ahora, self.max_intentos))
+            filas = self.conn.execute("""
+                SELECT href, nombre FROM cola_jugadores
+                WHERE estado = ? OR (estado = ? AND vence_en < ?)
+                ORDER BY pospuestos, rowid
+                LIMIT ?
+            """, (PENDIENTE, RECLAMADO, ahora, n)).fetchall()
+            self.conn.executemany("""
+                UPDATE cola_jugadores
+                SET estado = ?, trabajador = ?, vence_en = ?, intentos = intentos + 1, actualizado_en = ?
+                WHERE href = ?
+            """, [(RECLAMADO, trabajador, ahora + self.lease,
+                   datetime.now().isoformat(timespec='seconds'), href) for href, _ in filas])
+            return [(nombre, href) for href, nombre in filas]
+        return self._transaccion(reclamar)
+
+    def renovar(self, trabajador):
+        """Extiende los leases del trabajador y registra que sigue vivo.
+
+        Devuelve cuántos trabajadores de su misma máquina siguen activos.
+        """
+        maquina = trabajador.rsplit(':', 1)[0]
+
+        def renovar():
+            ahora = time.time()
+            self.conn.execute("UPDATE cola_jugadores SET vence_en = ? WHERE estado = ? AND trabajador = ?",
+                              (ahora + self.lease, RECLAMADO, trabajador))
+            self.conn.execute("""
+                INSERT INTO cola_trabajadores VALUES (?, ?, ?)
+                ON CONFLICT(trabajador) DO UPDATE SET visto_en = excluded.visto_en
+            """, (trabajador, maquina, ahora))
+            return self.conn.execute(
+                "SELECT COUNT(*) FROM cola_trabajadores WHERE maquina = ? AND visto_en > ?",
+                (maquina, ahora - self.lease)).fetchone()[0]
+        return self._transaccion(renovar)
+
+    def completar(self, trabajador, href, status):
+        """Registra el resultado con el texto del resumen; False si el lease ya
+        no era de este trabajador (otro lo recuperó tras vencer)"""
+        estado, error = (HECHO, None) if status == EXITO else (FALLIDO, status)
+
+        def completar():
+            return self.conn.execute("""
+                UPDATE cola_jugadores
+                SET estado = ?, ultimo_error = ?, trabajador = NULL, vence_en = NULL, actualizado_en = ?
+                WHERE href = ? AND trabajador = ? AND estado = ?
+            """, (estado, error, datetime.now().isoformat(timespec='seconds'),
+                  href, trabajador, RECLAMADO)).rowcount == 1
+        return self._transaccion(completar)
+
+    def posponer(self, trabajador, href):
+        """Devuelve el jugador al final de la cola sin contarlo como intento;
+        tras REENCOLAR_MAX veces queda fallido"""
+        def posponer():
+            self.conn.execute("""
+                UPDATE cola_jugadores
+                SET estado = CASE WHEN pospuestos + 1 > ? THEN ? ELSE ? END,
+                    ultimo_error = CASE WHEN pospuestos + 1 > ? THEN 'Error al descargar' END,
+                    pospuestos = pospuestos + 1, intentos = intentos - 1,
+                    trabajador = NULL, vence_en = NULL, actualizado_en = ?
+                WHERE href = ? AND trabajador = ? AND estado = ?
+            """, (REENCOLAR_MAX, FALLIDO, PENDIENTE, REENCOLAR_MAX,
+                  datetime.now().isoformat(timespec='seconds'), href, trabajador, RECLAMADO))
+        self._transaccion(posponer)
+
+    def liberar(self, trabajador):
+        """Devuelve los jugadores aún reservados (al detenerse un trabajador)"""
+        def liberar():
+            self.conn.execute("""
+                UPDATE cola_jugadores SET estado = ?, trabajador = NULL, vence_en = NULL,
+                    intentos = intentos - 1
+                WHERE estado = ? AND trabajador = ?
+            """, (PENDIENTE, RECLAMADO, trabajador))
+            self.conn.execute("DELETE FROM cola_trabajadores WHERE trabajador = ?", (trabajador,))
+        self._transaccion(liberar)
+
+    def proximo_vencimiento(self):
+        """Segundos hasta que venza el próximo lease ajeno; None si no hay ninguno"""
+        with self.lock:
+            vence = self.conn.execute("SELECT MIN(vence_en) FROM cola_jugadores WHERE estado = ?",
+                                      (RECLAMADO,)).fetchone()[0]
+        return None if vence is None else max(0.0, vence - time.time())
+
+    def resumen(self):
+        with self.lock:
+            return dict(self.conn.execute("SELECT estado, COUNT(*) FROM cola_jugadores GROUP BY estado"))
+
+    def close(self):
+        self.conn.close()
+
+# ---------------------------------------------------------------------------
+# TRABAJADOR
+# ---------------------------------------------------------------------------
+def trabajar(db_path=cola_path, fetcher=None, writer=None, lote=1, lease=LEASE,
+             metricas=None, archivo=None, gobernador=None):
+    """Reclama y procesa jugadores de la cola hasta que no quede ninguno.
+
+    Un hilo renueva los leases cada lease/3 segundos y reparte el límite de
+    peticiones del gobernador entre los trabajadores de la misma máquina.
+    Si quedan jugadores reservados por otros, espera a que terminen o a que
+    su lease venza para recuperarlos. Si se pasa un fetcher, gobernador
+    debe ser el suyo. Devuelve {estado: jugadores}.
+    """
+    from fetchers import default_fetcher
+    from limitador import Gobernador
+    from main import procesar_jugador, save_match_logs
+    from metricas import Metricas
+
+    cola = ColaTrabajo(db_path, lease)
+    trabajador = id_trabajador()
+    gobernador = gobernador or Gobernador()
+    fetcher = fetcher or default_fetcher(gobernador=gobernador)
+    writer = writer or save_match_logs
+    metricas = metricas or Metricas()
+    fetcher.usar_metricas(metricas)
+    if archivo is not None:
+        fetcher.usar_archivo(archivo)
+    gobernador.repartir(cola.renovar(trabajador))
+
+    detener = threading.Event()
+
+    def latido():
+        while not detener.wait(lease / 3):
+            try:
+                gobernador.repartir(cola.renovar(trabajador))
+            except sqlite3.Error as e:
+                print(f"⚠ No se pudo renovar el lease: {e}")
+
+    hilo = threading.Thread(target=latido, daemon=True)
+    hilo.start()
+    procesados = 0
+    try:
+        while True:
+            reclamados = cola.reclamar(trabajador, lote)
+            if not reclamados:
+                espera = cola.proximo_vencimiento()
+                if espera is None:
+                    break
+                # Otro trabajador tiene jugadores reservados: esperar a que acabe o caiga
+                time.sleep(min(espera + 1, lease / 3))
+                continue
+            for name, url in reclamados:
+                procesados += 1
+                print(f"\n[{trabajador} #{procesados}] Procesando {name}...")
+                try:
+                    status = procesar_jugador(fetcher, writer, name, url, metricas)
+                except DescargaPospuesta:
+                    print(f"↻ {name} vuelve al final de la cola")
+                    metricas.contar('pospuestos')
+                    cola.posponer(trabajador, url)
+                    continue
+                if not cola.completar(trabajador, url, status):
+                    print(f"⚠ El lease de {name} venció; otro trabajador lo recuperó")
+    except CircuitoAbierto as e:
+        print(f"❌ {e}. El trabajador se detiene")
+    finally:
+        detener.set()
+        hilo.join()
+        cola.liberar(trabajador)
+        fetcher.close()
+        metricas.imprimir_resumen()
+        metricas.close()
+        if archivo is not None:
+            archivo.close()
+        resumen = cola.resumen()
+        cola.close()
+    return resumen
+
+def _proceso_trabajador(db_path, lote, lease, archivo_dir, metricas_dir):
+    from metricas import Metricas
+
+    archivo = None
+    if archivo_dir:
+        from archivo_paginas import ArchivoPaginas
+        archivo = ArchivoPaginas(archivo_dir)
+    trabajador = id_trabajador().replace(':', '-')
+    metricas = Metricas(os.path.join(metricas_dir, f"{trabajador}.jsonl"),
+                        os.path.join(metricas_dir, f"{trabajador}.prom"))
+    trabajar(db_path, lote=lote, lease=lease, metricas=metricas, archivo=archivo)
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(
+        description="Cola compartida de jugadores para varios trabajadores (una o varias máquinas)")
+    parser.add_argument('accion', choices=['cargar', 'trabajar', 'estado'])
+    parser.add_argument('--cola', default=cola_path, help="base SQLite de la cola (en un volumen compartido)")
+    parser.add_argument('--csv', default=csv_path)
+    parser.add_argument('--num', type=int, help="solo los primeros N jugadores del CSV")
+    parser.add_argument('--reiniciar', action='store_true', help="vuelve a poner pendientes los ya cargados")
+    parser.add_argument('--procesos', type=int, default=1, help="trabajadores a lanzar en esta máquina")
+    parser.add_argument('--lote', type=int, default=1, help="jugadores reclamados de una vez")
+    parser.add_argument('--lease', type=float, default=LEASE)
+    parser.add_argument('--archivo', default='archivo_paginas', help="archivo de páginas (archivo_paginas.py)")
+    parser.add_argument('--sin-archivo', action='store_true')
+    parser.add_argument('--metricas', default='metricas', metavar='DIR')
+    args = parser.parse_args()
+
+    if args.accion == 'cargar':
+        import pandas as pd
+
+        roster = pd.read_csv(args.csv)
+        if args.num:
+            roster = roster.head(args.num)
+        cola = ColaTrabajo(args.cola)
+        nuevos = cola.cargar(list(zip(roster['nombre'], roster['href'])), args.reiniciar)
+        print(f"✔ {nuevos} jugadores cargados; cola: {cola.resumen()}")
+        cola.close()
+    elif args.accion == 'estado':
+        cola = ColaTrabajo(args.cola)
+        print(cola.resumen())
+        cola.close()
+    else:
+        archivo_dir = None if args.sin_archivo else args.archivo
+        procesos = [multiprocessing.Process(target=_proceso_trabajador,
+                                            args=(args.cola, args.lote, args.lease, archivo_dir, args.metricas))
+                    for _ in range(args.procesos)]
+        for proceso in procesos:
+            proceso.start()
+        for proceso in procesos:
+            proceso.join()
+        cola = ColaTrabajo(args.cola)
+        print(f"\nCola: {cola.resumen()}")
+        cola.close()
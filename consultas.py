@@ -0,0 +1,307 @@
+import argparse
+import json
+import queue
+import re
+import sqlite3
+import threading
+import time
+from collections import OrderedDict, namedtuple
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import parse_qsl, urlsplit
+
+from esquema_partidos import sql_temporada
+
+# ---------------------------------------------------------------------------
+# CONFIGURACIÓN
+# ---------------------------------------------------------------------------
+db_path = "mi_base_de_datos.db"
+PUERTO = 8089
+CONEXIONES = 4          # conexiones de solo lectura del pool
+CACHE_MAX = 512         # resultados guardados (LRU)
+CACHE_TTL = 300.0       # segundos que vale un resultado aunque la base no cambie
+
+OBLIGATORIO = object()
+
+def nombre_jugador(valor):
+    """Id numérico o nombre tal como queda en jugadores.nombre_completo"""
+    valor = str(valor).strip()
+    if valor.isdigit():
+        return int(valor)
+    return re.sub(r'[^\w\s-]', '', valor).strip().replace(' ', '_').lower().replace('_', ' ')
+
+# ---------------------------------------------------------------------------
+# CONSULTAS
+# ---------------------------------------------------------------------------
+# Cada consulta es SQL con parámetros con nombre. Las columnas entre llaves
+# ({xG}) se cambian por NULL si la tabla partidos no las tiene (los jugadores
+# sin estadísticas avanzadas no las traen).
+Consulta = namedtuple('Consulta', 'sql parametros descripcion')
+
+CONSULTAS = {
+    'jugadores': Consulta(
+        """
+        SELECT jugador_id, nombre_completo FROM jugadores
+        WHERE nombre_completo LIKE '%' || :nombre || '%'
+        ORDER BY nombre_completo LIMIT :limite
+        """,
+        {'nombre': (str.lower, ''), 'limite': (int, 50)},
+        "Busca jugadores por parte del nombre"),
+    'forma': Consulta(
+        """
+        SELECT "Fecha", "Comp", "Equipo", "Adversario", "Resultado", {Arranque} AS titular,
+               {Mín} AS minutos, {Gls.} AS goles, {Ass} AS asistencias, {xG} AS xg, {xAG} AS xag
+        FROM partidos
+        WHERE jugador_id = (SELECT jugador_id FROM jugadores
+                            WHERE nombre_completo = :jugador OR jugador_id = :jugador)
+          AND "Fecha" GLOB '[0-9][0-9][0-9][0-9]-*'
+        ORDER BY "Fecha" DESC LIMIT :n
+        """,
+        {'jugador': (nombre_jugador, OBLIGATORIO), 'n': (int, 5)},
+        "Últimos n partidos de un jugador (id o nombre)"),
+    'totales_equipo': Consulta(
+        """
+        SELECT "Comp", COUNT(DISTINCT "Fecha") AS partidos, COUNT(DISTINCT jugador_id) AS jugadores,
+               SUM({Mín}) AS minutos, SUM({Gls.}) AS goles, SUM({Ass}) AS asistencias, SUM({xG}) AS xg
+        FROM partidos
+        WHERE "Equipo" = :equipo
+          AND (:temporada IS NULL OR ("Fecha" BETWEEN :temporada || '-01-01' AND (:temporada + 1) || '-06-30'
+                                      AND """ + sql_temporada() + """ = :temporada))
+        GROUP BY "Comp" ORDER BY partidos DESC
+        """,
+        {'equipo': (str, OBLIGATORIO), 'temporada': (int, None)},
+        "Totales por competición de los jugadores seguidos en un equipo "
+        "(temporada: año en que empieza; 2024 es la 2024-2025 en Europa)"),
+    'cara_a_cara': Consulta(
+        """
+        SELECT j.nombre_completo AS jugador, COUNT(*) AS partidos,
+               SUM(substr(p."Resultado", 1, 1) = 'V') AS ganados,
+               SUM(substr(p."Resultado", 1, 1) = 'E') AS empatados,
+               SUM(substr(p."Resultado", 1, 1) = 'D') AS perdidos,
+               SUM({p.Mín}) AS minutos, SUM({p.Gls.}) AS goles, SUM({p.Ass}) AS asistencias,
+               MAX(p."Fecha") AS ultimo
+        FROM partidos p JOIN jugadores j ON j.jugador_id = p.jugador_id
+        WHERE p."Adversario" = :adversario
+          AND (:jugador IS NULL OR j.nombre_completo = :jugador OR j.jugador_id = :jugador)
+          AND p."Fecha" GLOB '[0-9][0-9][0-9][0-9]-*'
+        GROUP BY p.jugador_id ORDER BY partidos DESC
+        """,
+        {'adversario': (str, OBLIGATORIO), 'jugador': (nombre_jugador, None)},
+        "Historial de los jugadores seguidos contra un adversario"),
+}
+
+COLUMNA_RE = re.compile(r'\{(?:(\w+)\.)?([^{}]+)\}')
+
+def preparar_sql(sql, existentes):
+    def columna(match):
+        alias, col = match.groups()
+        if col not in existentes:
+            return 'NULL'
+        return f'{alias}."{col}"' if alias else f'"{col}"'
+    return COLUMNA_RE.sub(columna, sql)
+
+# ---------------------------------------------------------------------------
+# SERVICIO
+# ---------------------------------------------------------------------------
+def preparar_base(path=db_path):
+    """Deja la base en WAL (los lectores no bloquean al cargador ni al revés)
+    y crea los índices que usan las consultas. Es lo único que escribe."""
+    from esquema_partidos import crear_indices
+
+    conn = sqlite3.connect(path, timeout=30)
+    try:
+        conn.execute("PRAGMA journal_mode=WAL")
+        if conn.execute("SELECT 1 FROM sqlite_master WHERE type='table' AND name='partidos'").fetchone():
+            crear_indices(conn)
+        conn.commit()
+    finally:
+        conn.close()
+
+class ServicioConsultas:
+    """Consultas con parámetros sobre partidos, con pool y caché.
+
+    Las lecturas usan un pool de conexiones de solo lectura (cada una
+    guarda sus sentencias preparadas) y los resultados quedan en una caché
+    LRU con TTL. La caché se vacía sola cuando otra conexión confirma
+    cambios en la base: antes de cada consulta se mira PRAGMA data_version
+    en una conexión vigía, que cambia con cada commit ajeno.
+    """
+
+    def __init__(self, db_path=db_path, conexiones=CONEXIONES, cache_max=CACHE_MAX, ttl=CACHE_TTL,
+                 preparar=True):
+        if preparar:
+            preparar_base(db_path)
+        self.cache_max = cache_max
+        self.ttl = ttl
+        self.cache = OrderedDict()
+        self.lock = threading.Lock()
+        self.estadisticas = {'aciertos': 0, 'fallos': 0, 'invalidaciones': 0}
+        uri = f"file:{db_path}?mode=ro"
+        self.pool = queue.LifoQueue()
+        for _ in range(conexiones):
+            conn = sqlite3.connect(uri, uri=True, check_same_thread=False, cached_statements=256)
+            conn.execute("PRAGMA query_only=ON")
+            conn.execute("PRAGMA mmap_size=268435456")
+            self.pool.put(conn)
+        self.vigia = sqlite3.connect(uri, uri=True, check_same_thread=False)
+        self.version = None
+        self.sql = {}
+        self.servidor = None
+
+    def _al_dia(self):
+        """Vacía la caché (y rehace el SQL, por si cambiaron las columnas) si
+        la base cambió desde la última consulta. Llamar con self.lock."""
+        version = self.vigia.execute("PRAGMA data_version").fetchone()[0]
+        if version == self.version:
+            return
+        if self.version is not None:
+            self.estadisticas['invalidaciones'] += 1
+        self.version = version
+        self.cache.clear()
+        existentes = {col[1] for col in self.vigia.execute("PRAGMA table_info(partidos)")}
+        self.sql = {nombre: preparar_sql(consulta.sql, existentes) for nombre, consulta in CONSULTAS.items()}
+
+    def _parametros(self, nombre, parametros):
+        if nombre not in CONSULTAS:
+            raise KeyError(f"Consulta desconocida: {nombre}")
+        esperados = CONSULTAS[nombre].parametros
+        sobrantes = set(parametros) - set(esperados)
+        if sobrantes:
+            raise ValueError(f"Parámetros desconocidos para {nombre}: {', '.join(sorted(sobrantes))}")
+        valores = {}
+        for clave, (tipo, defecto) in esperados.items():
+            valor = parametros.get(clave)
+            if valor is None or valor == '':
+                if defecto is OBLIGATORIO:
+                    raise ValueError(f"Falta el parámetro '{clave}'")
+                valores[clave] = defecto
+                continue
+            try:
+                valores[clave] = tipo(valor)
+            except ValueError:
+                raise ValueError(f"Valor no válido para '{clave}': {valor}") from None
+        return valores
+
+    def consultar(self, consulta, **parametros):
+        """{'columnas': [...], 'filas': [[...]]} de la consulta. El resultado
+        puede venir de la caché y se comparte: no modificarlo."""
+        valores = self._parametros(consulta, parametros)
+        clave = (consulta, tuple(sorted(valores.items())))
+        with self.lock:
+            self._al_dia()
+            entrada = self.cache.get(clave)
+            if entrada is not None and time.monotonic() - entrada[0] < self.ttl:
+                self.cache.move_to_end(clave)
+                self.estadisticas['aciertos'] += 1
+                return entrada[1]
+            self.estadisticas['fallos'] += 1
+            sql = self.sql[consulta]
+            version = self.version
+
+        conn = self.pool.get()
+        try:
+            cursor = conn.execute(sql, valores)
+            resultado = {'columnas': [col[0] for col in cursor.description],
+                         'filas': [list(fila) for fila in cursor.fetchall()]}
+        finally:
+            self.pool.put(conn)
+
+        with self.lock:
+            if version == self.version:
+                self.cache[clave] = (time.monotonic(), resultado)
+                self.cache.move_to_end(clave)
+                while len(self.cache) > self.cache_max:
+                    self.cache.popitem(last=False)
+        return resultado
+
+    def catalogo(self):
+        return {nombre: {'descripcion': consulta.descripcion,
+                         'parametros': {clave: ('obligatorio' if defecto is OBLIGATORIO else defecto)
+                                        for clave, (_, defecto) in consulta.parametros.items()}}
+                for nombre, consulta in CONSULTAS.items()}
+
+    def estado(self):
+        with self.lock:
+            return dict(self.estadisticas, en_cache=len(self.cache), data_version=self.version)
+
+    # -----------------------------------------------------------------------
+    # HTTP / JSON
+    # -----------------------------------------------------------------------
+    def servir(self, puerto=PUERTO, bloquear=False):
+        """GET /consultas (catálogo), /consultas/<nombre>?param=valor y /estado"""
+        servicio = self
+
+        class Manejador(BaseHTTPRequestHandler):
+            def do_GET(self):
+                url = urlsplit(self.path)
+                partes = [parte for parte in url.path.split('/') if parte]
+                try:
+                    if partes in ([], ['consultas']):
+                        estado, cuerpo = 200, servicio.catalogo()
+                    elif partes == ['estado']:
+                        estado, cuerpo = 200, servicio.estado()
+                    elif len(partes) == 2 and partes[0] == 'consultas':
+                        estado, cuerpo = 200, servicio.consultar(partes[1], **dict(parse_qsl(url.query)))
+                    else:
+                        estado, cuerpo = 404, {'error': f"Ruta desconocida: {url.path}"}
+                except KeyError as e:
+                    estado, cuerpo = 404, {'error': e.args[0]}
+                except ValueError as e:
+                    estado, cuerpo = 400, {'error': str(e)}
+                except sqlite3.Error as e:
+                    estado, cuerpo = 500, {'error': f"Error de la base: {e}"}
+                datos = json.dumps(cuerpo, ensure_ascii=False).encode('utf-8')
+                self.send_response(estado)
+                self.send_header('Content-Type', 'application/json; charset=utf-8')
+                self.send_header('Content-Length', str(len(datos)))
+                self.end_headers()
+                self.wfile.write(datos)
+
+            def log_message(self, *args):
+                pass
+
+        self.servidor = ThreadingHTTPServer(('127.0.0.1', puerto), Manejador)
+        self.servidor.daemon_threads = True
+        print(f"Consultas en http://127.0.0.1:{self.servidor.server_address[1]}/consultas")
+        if bloquear:
+            self.servidor.serve_forever()
+        else:
+            threading.Thread(target=self.servidor.serve_forever, daemon=True).start()
+
+    def close(self):
+        if self.servidor is not None:
+            self.servidor.shutdown()
+            self.servidor.server_close()
+        while not self.pool.empty():
+            self.pool.get().close()
+        self.vigia.close()
+
+def cli(argv=None, prog=None):
+    parser = argparse.ArgumentParser(prog=prog, description="Consultas con caché sobre la tabla partidos")
+    parser.add_argument('accion', help=f"'servir' o una consulta: {', '.join(CONSULTAS)}")
+    parser.add_argument('parametros', nargs='*', metavar='clave=valor')
+    parser.add_argument('--db', default=db_path)
+    parser.add_argument('--puerto', type=int, default=PUERTO)
+    args = parser.parse_args(argv)
+
+    servicio = ServicioConsultas(args.db)
+    try:
+        if args.accion == 'servir':
+            try:
+                servicio.servir(args.puerto, bloquear=True)
+            except KeyboardInterrupt:
+                pass
+        else:
+            parametros = dict(parametro.split('=', 1) for parametro in args.parametros)
+            try:
+                resultado = servicio.consultar(args.accion, **parametros)
+            except (KeyError, ValueError) as e:
+                print(f"❌ {e.args[0]}")
+            else:
+                print("\t".join(resultado['columnas']))
+                for fila in resultado['filas']:
+                    print("\t".join('' if valor is None else str(valor) for valor in fila))
+    finally:
+        servicio.close()
+
+if __name__ == "__main__":
+    cli()
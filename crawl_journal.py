@@ -0,0 +1,150 @@
+import sqlite3
+import threading
+import time
+from datetime import datetime
+
+# Estados posibles de un jugador en el diario
+PENDIENTE = 'pendiente'
+EN_CURSO = 'en_curso'
+HECHO = 'hecho'
+FALLIDO = 'fallido'
+
+EXITO = "Éxito"
+
+class CrawlJournal:
+    """Diario persistente del crawl en la tabla crawl_journal.
+
+    Guarda por jugador (clave: href) su estado, intentos, último error y
+    marcas de tiempo. Los cambios se acumulan en memoria y se escriben en
+    lotes (cada batch_size cambios o flush_interval segundos), así que
+    apenas añade coste por jugador; tras un corte se pierde como mucho el
+    último lote, que simplemente se vuelve a procesar.
+    """
+
+    def __init__(self, db_path='mi_base_de_datos.db', batch_size=50, flush_interval=10.0):
+        self.batch_size = batch_size
+        self.flush_interval = flush_interval
+        self._pending = {}
+        self._last_flush = time.monotonic()
+        self._lock = threading.Lock()
+        self.conn = sqlite3.connect(db_path, check_same_thread=False)
+        self.conn.execute("""
+            CREATE TABLE IF NOT EXISTS crawl_journal (
+                href TEXT PRIMARY KEY,
+                nombre TEXT,
+                estado TEXT NOT NULL,
+                intentos INTEGER NOT NULL DEFAULT 0,
+                ultimo_error TEXT,
+                creado_en TEXT,
+                actualizado_en TEXT
+            )
+        """)
+        self.conn.commit()
+
+    def prepare(self, players, resume=False):
+        """Registra los jugadores y devuelve los que hay que procesar.
+
+        players: lista de (nombre, href). Sin resume todos vuelven a
+        'pendiente'; con resume se omiten los 'hecho' y los 'fallido' van
+        primero para reintentarlos.
+        """
+        now = datetime.now().isoformat(timespec='seconds')
+        with self._lock:
+            if resume:
+                self.conn.executemany("""
+                    INSERT OR IGNORE INTO crawl_journal (href, nombre, estado, creado_en, actualizado_en)
+                    VALUES (?, ?, ?, ?, ?)
+                """, [(href, name, PENDIENTE, now, now) for name, href in players])
+            else:
+                self.conn.executemany("""
+                    INSERT INTO crawl_journal (href, nombre, estado, creado_en, actualizado_en)
+                    VALUES (?, ?, ?, ?, ?)
+                    ON CONFLICT(href) DO UPDATE SET
+                        estado = excluded.estado, intentos = 0, ultimo_error = NULL,
+                        actualizado_en = excluded.actualizado_en
+                """, [(href, name, PENDIENTE, now, now) for name, href in players])
+            self.conn.commit()
+            estados = self._states([href for _, href in players])
+
+        fallidos = [p for p in players if estados.get(p[1]) == FALLIDO]
+        resto = [p for p in players if estados.get(p[1]) in (PENDIENTE, EN_CURSO)]
+        omitidos = len(players) - len(fallidos) - len(resto)
+        if resume:
+            print(f"Reanudando: {omitidos} ya completados, {len(fallidos)} fallidos a reintentar, "
+                  f"{len(resto)} pendientes")
+        return fallidos + resto
+
+    def _states(self, hrefs):
+        estados = {}
+        for i in range(0, len(hrefs), 500):
+            chunk = hrefs[i:i + 500]
+            placeholders = ", ".join(["?"] * len(chunk))
+            estados.update(self.conn.execute(
+                f"SELECT href, estado FROM crawl_journal WHERE href IN ({placeholders})", chunk))
+        return estados
+
+    def start(self, href):
+        """Marca un jugador como en curso (en el próximo lote)"""
+        self._queue(href, EN_CURSO, None, attempt=True)
+
+    def record(self, href, status):
+        """Registra el resultado final con el mismo texto del resumen"""
+        if status == EXITO:
+            self._queue(href, HECHO, None)
+        else:
+            self._queue(href, FALLIDO, status)
+
+    def _queue(self, href, estado, error, attempt=False):
+        with self._lock:
+            previo = self._pending.get(href)
+            intentos = (previo[2] if previo else 0) + (1 if attempt else 0)
+            self._pending[href] = (estado, error, intentos, datetime.now().isoformat(timespec='seconds'))
+            due = (len(self._pending) >= self.batch_size
+                   or time.monotonic() - self._last_flush >= self.flush_interval)
+        if due:
+            self.flush()
+
+    def flush(self):
+        """Escribe en una sola transacción todos los cambios acumulados"""
+        with self._lock:
+            if not self._pending:
+                return
+            rows = [(estado, error, intentos, ts, href)
+                    for href, (estado, error, intentos, ts) in self._pending.items()]
+            self.conn.executemany("""
+                UPDATE crawl_journal
+                SET estado = ?, ultimo_error = COALESCE(?, ultimo_error),
+                    intentos = intentos + ?, actualizado_en = ?
+                WHERE href = ?
+            """, rows)
+            self.conn.commit()
+            self._pending.clear()
+            self._last_flush = time.monotonic()
+
+    def summary(self, players):
+        """[(nombre, estado)] en el orden de players, leído del diario"""
+        self.flush()
+        with self._lock:
+            filas = {}
+            hrefs = [href for _, href in players]
+            for i in range(0, len(hrefs), 500):
+                chunk = hrefs[i:i + 500]
+                placeholders = ", ".join(["?"] * len(chunk))
+                for href, estado, error in self.conn.execute(
+                        f"SELECT href, estado, ultimo_error FROM crawl_journal WHERE href IN ({placeholders})",
+                        chunk):
+                    filas[href] = (estado, error)
+        results = []
+        for name, href in players:
+            estado, error = filas.get(href, (PENDIENTE, None))
+            if estado == HECHO:
+                results.append((name, EXITO))
+            elif estado == FALLIDO:
+                results.append((name, error or "Error al extraer datos"))
+            else:
+                results.append((name, "Pendiente"))
+        return results
+
+    def close(self):
+        self.flush()
+        self.conn.close()
@@ -0,0 +1,160 @@
+import asyncio
+import os
+from collections import Counter
+from concurrent.futures import ProcessPoolExecutor
+
+from fetchers import default_fetcher, full_player_url, parse_match_logs_rows
+from limitador import REENCOLAR_MAX, CircuitoAbierto, DescargaPospuesta
+from metricas import etapa
+
+# Marca de fin de cola para detener cada etapa
+_FIN = object()
+
+def _set_result(results, journal, i, name, url, status):
+    results[i] = (name, status)
+    if journal is not None:
+        journal.record(url, status)
+
+async def _fetch_stage(fetcher, players, parse_queue, results, concurrency, pausa, journal, metricas):
+    """Etapa 1: descarga hasta `concurrency` páginas a la vez.
+
+    Los jugadores con la descarga pospuesta (limitador.py) vuelven al final
+    de la cola; si el circuito del host se abre del todo se deja de descargar.
+    """
+    pendientes = asyncio.Queue()
+    for item in players:
+        pendientes.put_nowait(item)
+    pospuestos = Counter()
+    detenido = False
+
+    async def worker():
+        nonlocal detenido
+        while not detenido:
+            try:
+                i, name, url = pendientes.get_nowait()
+            except asyncio.QueueEmpty:
+                return
+            print(f"[{i + 1}/{len(players)}] Descargando {name}...")
+            if journal is not None:
+                journal.start(url)
+            try:
+                with etapa(metricas, 'descarga', jugador=name) as evento:
+                    html = await asyncio.to_thread(fetcher.fetch_matchlogs_html, full_player_url(url))
+                    evento['bytes'] = len(html) if html else 0
+            except DescargaPospuesta:
+                pospuestos[url] += 1
+                if pospuestos[url] <= REENCOLAR_MAX:
+                    print(f"↻ {name} vuelve al final de la cola")
+                    if metricas is not None:
+                        metricas.contar('pospuestos')
+                    pendientes.put_nowait((i, name, url))
+                else:
+                    _set_result(results, journal, i, name, url, "Error al descargar")
+                continue
+            except CircuitoAbierto as e:
+                if not detenido:
+                    print(f"❌ {e}. Se detiene el crawl; continúa luego con --resume")
+                detenido = True
+                return
+            except Exception as e:
+                print(f"Error general descargando {name}: {e}")
+                html = None
+            if html is None and metricas is not None:
+                metricas.error('descarga', 'sin_html', jugador=name)
+            await parse_queue.put((i, name, url, html))
+            if pausa:
+                with etapa(metricas, 'pausa'):
+                    await asyncio.sleep(pausa)
+
+    await asyncio.gather(*(worker() for _ in range(concurrency)))
+
+async def _parse_stage(parse_queue, write_queue, results, executor, journal, metricas):
+    """Etapa 2: parsea el HTML fuera del bucle de eventos. Corren tantas
+    copias como procesos tiene el executor, una página en vuelo cada una"""
+    loop = asyncio.get_running_loop()
+    while True:
+        item = await parse_queue.get()
+        if item is _FIN:
+            return
+        i, name, url, html = item
+        tabla = None
+        if html is not None:
+            try:
+                with etapa(metricas, 'parseo', jugador=name) as evento:
+                    tabla = await loop.run_in_executor(executor, parse_match_logs_rows, html)
+                    evento['filas'] = len(tabla) if tabla is not None else 0
+            except Exception as e:
+                print(f"Error parseando {name}: {e}")
+            if tabla is None and metricas is not None:
+                metricas.error('parseo', 'sin_tabla', jugador=name)
+        if tabla is None:
+            _set_result(results, journal, i, name, url, "Error al extraer datos")
+            print(f"✖ No se pudieron extraer datos de partidos para {name}")
+            continue
+        await write_queue.put((i, name, url, tabla))
+
+async def _write_stage(write_queue, results, writer, journal, metricas):
+    """Etapa 3: un único escritor para CSV/SQLite"""
+    while True:
+        item = await write_queue.get()
+        if item is _FIN:
+            return
+        i, name, url, tabla = item
+        try:
+            with etapa(metricas, 'guardado', jugador=name):
+                success = await asyncio.to_thread(writer, tabla, name)
+        except Exception as e:
+            # Si la etapa muriera, el parseo se quedaría esperando en una cola llena
+            print(f"Error guardando {name}: {e}")
+            success = False
+        if success:
+            _set_result(results, journal, i, name, url, "Éxito")
+            print(f"✔ Datos de partidos guardados para {name}")
+            if metricas is not None:
+                metricas.contar('filas_extraidas', len(tabla))
+        else:
+            _set_result(results, journal, i, name, url, "Error al guardar")
+            if metricas is not None:
+                metricas.error('guardado', 'error_guardado', jugador=name)
+
+async def crawl_players(players, writer, fetcher=None, concurrency=8,
+                        parse_workers=None, queue_size=None, pausa=0.0, journal=None, metricas=None):
+    """Descarga, parsea y guarda jugadores en tres etapas solapadas.
+
+    players: lista de (nombre, href). Devuelve [(nombre, estado)] en el
+    mismo orden de entrada, igual que el modo secuencial. Si se pasa un
+    CrawlJournal, cada resultado queda además registrado en él, y si se
+    pasa un Metricas (metricas.py), los tiempos de cada etapa.
+    """
+    own_fetcher = fetcher is None
+    fetcher = fetcher or default_fetcher()
+    queue_size = queue_size or concurrency * 2
+    parse_queue = asyncio.Queue(maxsize=queue_size)
+    write_queue = asyncio.Queue(maxsize=queue_size)
+    indexed = [(i, name, url) for i, (name, url) in enumerate(players)]
+    results = [None] * len(players)
+
+    parse_workers = parse_workers or os.cpu_count() or 1
+    executor = ProcessPoolExecutor(max_workers=parse_workers)
+    try:
+        parse_tasks = [asyncio.create_task(_parse_stage(parse_queue, write_queue, results, executor, journal, metricas))
+                       for _ in range(parse_workers)]
+        write_task = asyncio.create_task(_write_stage(write_queue, results, writer, journal, metricas))
+
+        await _fetch_stage(fetcher, indexed, parse_queue, results, concurrency, pausa, journal, metricas)
+        for _ in parse_tasks:
+            await parse_queue.put(_FIN)
+        await asyncio.gather(*parse_tasks)
+        await write_queue.put(_FIN)
+        await write_task
+    finally:
+        executor.shutdown()
+        if own_fetcher:
+            fetcher.close()
+
+    # Los que quedaron sin procesar (circuito abierto) siguen pendientes
+    return [result or (name, "Pendiente") for result, (name, _) in zip(results, players)]
+
+def run_crawl(players, writer, **kwargs):
+    """Punto de entrada síncrono para crawl_players"""
+    return asyncio.run(crawl_players(players, writer, **kwargs))
@@ -0,0 +1,139 @@
+import queue
+from contextlib import contextmanager
+
+from selenium import webdriver
+from selenium.webdriver.chrome.options import Options
+
+from fetchers import USER_AGENT
+from limitador import DescargaPospuesta
+
+try:
+    import psutil
+except ImportError:  # sin psutil solo se recicla por número de páginas
+    psutil = None
+
+# Recursos que no hacen falta para leer las tablas de fbref
+BLOCKED_URLS = [
+    "*.png", "*.jpg", "*.jpeg", "*.gif", "*.webp", "*.svg", "*.ico",
+    "*.css", "*.woff", "*.woff2", "*.ttf", "*.otf",
+    "*.mp4", "*.webm",
+    "*doubleclick.net*", "*googlesyndication.com*", "*googletagmanager.com*",
+    "*google-analytics.com*", "*adservice.google.com*", "*amazon-adsystem.com*",
+    "*pubmatic.com*", "*rubiconproject.com*", "*criteo.com*", "*quantserve.com*",
+]
+
+def build_chrome_options():
+    """Opciones de Chrome headless sin imágenes y con carga 'eager'"""
+    chrome_options = Options()
+    chrome_options.page_load_strategy = "eager"
+    chrome_options.add_argument("--headless")
+    chrome_options.add_argument("--disable-gpu")
+    chrome_options.add_argument("--window-size=1920,1200")
+    chrome_options.add_argument("--blink-settings=imagesEnabled=false")
+    chrome_options.add_argument("--disable-extensions")
+    chrome_options.add_argument("--disable-dev-shm-usage")
+    chrome_options.add_argument(f"user-agent={USER_AGENT}")
+    chrome_options.add_experimental_option("prefs", {
+        "profile.managed_default_content_settings.images": 2,
+        "profile.managed_default_content_settings.fonts": 2,
+        "profile.managed_default_content_settings.media_stream": 2,
+    })
+    return chrome_options
+
+def create_driver():
+    """Crea un Chrome headless que bloquea imágenes, CSS, fuentes y anuncios"""
+    driver = webdriver.Chrome(options=build_chrome_options())
+    try:
+        driver.execute_cdp_cmd("Network.enable", {})
+        driver.execute_cdp_cmd("Network.setBlockedURLs", {"urls": BLOCKED_URLS})
+    except Exception as e:
+        print(f"No se pudo activar el bloqueo de recursos: {e}")
+    return driver
+
+def driver_rss_mb(driver):
+    """Memoria residente (MB) de chromedriver y todos sus procesos Chrome"""
+    if psutil is None:
+        return 0.0
+    try:
+        root = psutil.Process(driver.service.process.pid)
+        procesos = [root] + root.children(recursive=True)
+    except (psutil.Error, AttributeError):
+        return 0.0
+    total = 0
+    for proceso in procesos:
+        try:
+            total += proceso.memory_info().rss
+        except psutil.Error:
+            pass
+    return total / (1024 * 1024)
+
+class _Worker:
+    """Un Chrome del pool con su contador de páginas"""
+
+    def __init__(self, factory):
+        self.factory = factory
+        self.driver = None
+        self.pages = 0
+
+    def start(self):
+        self.driver = self.factory()
+        self.pages = 0
+
+    def quit(self):
+        if self.driver is not None:
+            try:
+                self.driver.quit()
+            except Exception as e:
+                print(f"Error cerrando Chrome: {e}")
+        self.driver = None
+        self.pages = 0
+
+class DriverPool:
+    """Pool de N Chrome headless que se reciclan por páginas o por memoria.
+
+    Los drivers se crean solo la primera vez que se piden, así que un pool
+    que no se usa no arranca ningún navegador.
+    """
+
+    def __init__(self, size=2, max_pages=50, max_rss_mb=1500, driver_factory=create_driver):
+        self.size = size
+        self.max_pages = max_pages
+        self.max_rss_mb = max_rss_mb
+        self._idle = queue.Queue()
+        self._workers = [_Worker(driver_factory) for _ in range(size)]
+        for worker in self._workers:
+            self._idle.put(worker)
+
+    def _needs_recycle(self, worker):
+        if self.max_pages and worker.pages >= self.max_pages:
+            return True
+        if self.max_rss_mb and driver_rss_mb(worker.driver) > self.max_rss_mb:
+            return True
+        return False
+
+    @contextmanager
+    def driver(self):
+        """Presta un driver libre; al devolverlo se recicla si hace falta"""
+        worker = self._idle.get()
+        try:
+            if worker.driver is None:
+                worker.start()
+            yield worker.driver
+        except DescargaPospuesta:
+            # Página de bloqueo: el Chrome está sano, se sigue usando
+            raise
+        except Exception:
+            # Un driver que falló puede haber quedado colgado: se descarta
+            worker.quit()
+            raise
+        finally:
+            if worker.driver is not None:
+                worker.pages += 1
+                if self._needs_recycle(worker):
+                    print(f"♻ Reciclando Chrome tras {worker.pages} páginas")
+                    worker.quit()
+            self._idle.put(worker)
+
+    def close(self):
+        for worker in self._workers:
+            worker.quit()
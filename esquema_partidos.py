@@ -0,0 +1,202 @@
+import re
+from datetime import datetime
+
+# ---------------------------------------------------------------------------
+# TIPOS DE LAS COLUMNAS DE fbref (versión en español)
+# ---------------------------------------------------------------------------
+COLUMNAS_ENTERAS = {
+    'Mín', 'Gls.', 'Ass', 'TP', 'TPint', 'Dis', 'DaP', 'TA', 'TR', 'Fls', 'FR',
+    'PA', 'Pcz', 'TklG', 'Int', 'GC', 'Penal ejecutado', 'Penal concedido',
+    'Toques', 'Tkl', 'Bloqueos', 'ACT', 'ACG', 'Cmp', 'Int.', 'PrgP',
+    'Transportes', 'PrgC', 'Att', 'Succ', 'jugador_id',
+    # tabla de pases (comentada en la página de partidos)
+    'Dist. tot.', 'Dist. prg.', 'PC', '1/3', 'PPA', 'CrAP',
+}
+COLUMNAS_REALES = {'xG', 'npxG', 'xAG', '% Cmp', 'xA'}
+COLUMNAS_TEXTO = {
+    'Día', 'Comp', 'Ronda', 'Sedes', 'Resultado', 'Equipo', 'Adversario',
+    'Arranque', 'Posc', 'Informe del partido', 'partido_url', 'partido_id',
+}
+
+# 'Resultado' ("V 2–1") se separa en estas columnas
+COLUMNAS_RESULTADO = [
+    ('Resultado_tipo', 'TEXT'),
+    ('Goles_favor', 'INTEGER'),
+    ('Goles_contra', 'INTEGER'),
+]
+
+INDICES_PARTIDOS = {
+    'idx_partidos_jugador': ['jugador_id', 'Fecha'],
+    'idx_partidos_fecha': ['Fecha'],
+    'idx_partidos_comp': ['Comp', 'jugador_id'],
+    'idx_partidos_fuente': ['fuente'],
+    'idx_partidos_partido': ['partido_id'],
+    # consultas.py: totales por equipo y cara a cara contra un adversario
+    'idx_partidos_equipo': ['Equipo', 'Comp'],
+    'idx_partidos_adversario': ['Adversario', 'jugador_id'],
+}
+
+RESULTADO_RE = re.compile(r'^([VED])\s*(\d+)\s*[–—-]\s*(\d+)')
+FORMATOS_FECHA = ('%Y-%m-%d', '%d/%m/%Y', '%d-%m-%Y')
+
+# Encabezados repetidos en una tabla ('Cmp.1', '% Cmp.2'): mismo tipo que el original
+REPETIDA_RE = re.compile(r'\.\d+$')
+
+def tipo_columna(col):
+    """Tipo SQLite de una columna conocida, o None si no está en el esquema.
+    Las que join_tables prefija con su grupo ('defense_Att') toman el tipo
+    de la columna original"""
+    col = REPETIDA_RE.sub('', col)
+    if col == 'Fecha':
+        return 'TEXT'
+    if col in COLUMNAS_ENTERAS:
+        return 'INTEGER'
+    if col in COLUMNAS_REALES:
+        return 'REAL'
+    if col in COLUMNAS_TEXTO:
+        return 'TEXT'
+    tipo = dict(COLUMNAS_RESULTADO).get(col)
+    if tipo is None and '_' in col:
+        return tipo_columna(col.split('_', 1)[1])
+    return tipo
+
+# ---------------------------------------------------------------------------
+# CONVERSIÓN DE VALORES
+# ---------------------------------------------------------------------------
+def _limpiar_numero(valor):
+    return valor.strip().replace(',', '').replace('%', '')
+
+def parse_entero(valor):
+    if valor is None:
+        return None
+    valor = _limpiar_numero(str(valor))
+    if valor in ('', 'nan'):
+        return None
+    try:
+        return int(valor)
+    except ValueError:
+        try:
+            return int(float(valor))
+        except ValueError:
+            return None
+
+def parse_real(valor):
+    if valor is None:
+        return None
+    valor = _limpiar_numero(str(valor))
+    if valor in ('', 'nan'):
+        return None
+    try:
+        return float(valor)
+    except ValueError:
+        return None
+
+def parse_fecha(valor):
+    """Fecha ISO 'YYYY-MM-DD', o None si el valor no es una fecha"""
+    if not isinstance(valor, str):
+        return None
+    valor = valor.strip()
+    for formato in FORMATOS_FECHA:
+        try:
+            return datetime.strptime(valor, formato).date().isoformat()
+        except ValueError:
+            continue
+    return None
+
+def parse_resultado(valor):
+    """'V 2–1' -> ('V', 2, 1); tanda de penales y prórroga se ignoran"""
+    if not isinstance(valor, str):
+        return (None, None, None)
+    match = RESULTADO_RE.match(valor.strip())
+    if not match:
+        return (None, None, None)
+    return (match.group(1), int(match.group(2)), int(match.group(3)))
+
+def convertir_valor(valor, tipo):
+    if tipo == 'INTEGER':
+        return parse_entero(valor)
+    if tipo == 'REAL':
+        return parse_real(valor)
+    if valor is None or valor in ('', 'nan'):
+        return None
+    return valor
+
+def fila_tipada(headers, tipos, row):
+    """Convierte una fila del CSV a valores tipados más las columnas de Resultado.
+
+    Devuelve None para las filas que no son partidos (los encabezados que
+    fbref repite dentro de la tabla, filas sin fecha).
+    """
+    valores = dict(zip(headers, row))
+    fecha = parse_fecha(valores.get('Fecha'))
+    if fecha is None:
+        return None
+    salida = []
+    for col, tipo in zip(headers, tipos):
+        salida.append(fecha if col == 'Fecha' else convertir_valor(valores[col], tipo))
+    salida.extend(parse_resultado(valores.get('Resultado')))
+    return salida
+
+def tipar_dataframe(df):
+    """Versión pandas de fila_tipada: mismas columnas, tipos y filtrado"""
+    import pandas as pd
+
+    headers = list(df.columns)
+    tipos = [tipo_columna(col) or 'TEXT' for col in headers]
+    filas = [fila for fila in (fila_tipada(headers, tipos, row)
+                                for row in df.astype(object).itertuples(index=False, name=None))
+             if fila is not None]
+    return pd.DataFrame(filas, columns=headers + [col for col, _ in COLUMNAS_RESULTADO])
+
+# ---------------------------------------------------------------------------
+# TEMPORADA DE UN PARTIDO
+# ---------------------------------------------------------------------------
+# fbref usa temporadas de año calendario ("2025") en las competiciones de
+# América y de selecciones, y partidas ("2024-2025", de julio a junio) en las
+# europeas y el resto. La temporada se guarda como el año en que empieza:
+# 2024 es la 2024-2025 de la Premier League y la 2024 de la Primera A.
+COMPS_ANIO_CALENDARIO = {
+    'Primera A', 'Primera B', 'Copa Colombia', 'Superliga', 'Liga Argentina',
+    'Copa de la Liga', 'Série A', 'Série B', 'Copa do Brasil', 'MLS', 'Liga MX',
+    'Libertadores', 'Sudamericana', 'Copa Sudamericana', 'Copa América', 'WCQ',
+    'Amistosos', 'Copa Mundial',
+}
+MES_INICIO_TEMPORADA = 7
+
+def temporada_partido(fecha, comp):
+    """Año en que empieza la temporada del partido, o None sin fecha ISO"""
+    if not isinstance(fecha, str) or not fecha[:4].isdigit() or not fecha[5:7].isdigit():
+        return None
+    anio = int(fecha[:4])
+    if comp in COMPS_ANIO_CALENDARIO or int(fecha[5:7]) >= MES_INICIO_TEMPORADA:
+        return anio
+    return anio - 1
+
+def temporadas_serie(fechas, comps):
+    """Versión pandas de temporada_partido (Fecha ya en ISO, sin nulos)"""
+    anio = fechas.str.slice(0, 4).astype(int)
+    mes = fechas.str.slice(5, 7).astype(int)
+    return anio.where(comps.isin(COMPS_ANIO_CALENDARIO) | (mes >= MES_INICIO_TEMPORADA), anio - 1)
+
+def sql_temporada(tabla=None):
+    """Versión SQL de temporada_partido sobre "Fecha" y "Comp" (tabla: NEW, OLD o un alias)"""
+    p = f"{tabla}." if tabla else ""
+    comps = ", ".join("'" + comp.replace("'", "''") + "'" for comp in sorted(COMPS_ANIO_CALENDARIO))
+    anio = f'CAST(substr({p}"Fecha", 1, 4) AS INTEGER)'
+    return (f'(CASE WHEN {p}"Comp" IN ({comps}) '
+            f'OR CAST(substr({p}"Fecha", 6, 2) AS INTEGER) >= {MES_INICIO_TEMPORADA} '
+            f'THEN {anio} ELSE {anio} - 1 END)')
+
+def rango_temporada(temporada):
+    """Fechas que puede abarcar una temporada (para filtrar antes de calcularla)"""
+    return f"{temporada}-01-01", f"{temporada + 1}-06-30"
+
+def crear_indices(conn, tabla='partidos'):
+    """Índices de consulta sobre jugador_id, Fecha y Comp"""
+    existentes = {col[1] for col in conn.execute(f'PRAGMA table_info("{tabla}")')}
+    for nombre, columnas in INDICES_PARTIDOS.items():
+        if tabla != 'partidos':
+            nombre = f"{nombre}_{tabla}"
+        if all(col in existentes for col in columnas):
+            lista = ", ".join(f'"{col}"' for col in columnas)
+            conn.execute(f'CREATE INDEX IF NOT EXISTS "{nombre}" ON "{tabla}" ({lista})')
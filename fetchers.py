@@ -0,0 +1,539 @@
+import re
+import time
+from datetime import date
+from urllib.parse import urljoin
+
+import requests
+from requests.adapters import HTTPAdapter
+
+from limitador import DescargaPospuesta, Gobernador, pagina_bloqueada, segundos_retry_after
+from metricas import etapa
+from table_parsers import extract_tables, join_tables
+
+FBREF_BASE_URL = "https://fbref.com"
+USER_AGENT = "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36"
+
+# ---------------------------------------------------------------------------
+# UTILIDADES DE URL
+# ---------------------------------------------------------------------------
+def extract_player_id(href):
+    """Extrae el id de fbref (p. ej. '32b32e92') de la columna href"""
+    if not isinstance(href, str):
+        return None
+    match = re.search(r'/(?:jugadores|players)/([0-9a-f]{8})(?:/|$)', href)
+    return match.group(1) if match else None
+
+def extract_match_id(href):
+    """Id del informe de partido (p. ej. '0bedea50') de un enlace /partidos/"""
+    if not isinstance(href, str):
+        return None
+    match = re.search(r'/(?:partidos|matches)/([0-9a-f]{8})(?:/|$)', href)
+    return match.group(1) if match else None
+
+def full_player_url(href, base_url=FBREF_BASE_URL):
+    """Convierte un href relativo del CSV en una URL absoluta"""
+    return href if href.startswith('http') else f"{base_url}{href}"
+
+def temporadas_candidatas(hoy=None):
+    """Temporadas a probar, de la más reciente a la más antigua.
+
+    Las ligas colombianas usan temporadas de año calendario ("2025") y las
+    europeas temporadas partidas ("2024-2025"), así que se prueban ambas.
+    """
+    hoy = hoy or date.today()
+    anio = hoy.year
+    if hoy.month >= 7:
+        return [f"{anio}-{anio + 1}", f"{anio}", f"{anio - 1}-{anio}"]
+    return [f"{anio}", f"{anio - 1}-{anio}"]
+
+def build_matchlogs_url(player_id, temporada, base_url=FBREF_BASE_URL):
+    """Construye la URL de partidos (todas las competencias) de una temporada"""
+    return f"{base_url}/es/jugadores/{player_id}/matchlogs/{temporada}/"
+
+# ---------------------------------------------------------------------------
+# PARSEO DE LA TABLA matchlogs_all
+# ---------------------------------------------------------------------------
+# Tablas de estadísticas de la página de partidos: matchlogs_all y las que
+# fbref trae en la misma página (algunas dentro de comentarios HTML)
+TABLAS_PARTIDOS = r'matchlogs_\w+'
+ENLACES_PARTIDOS = {'match_report': 'partido_url'}
+# Columnas que cada tabla de la página repite para identificar el partido;
+# de las tablas unidas a matchlogs_all no se copian
+COLUMNAS_FILA_PARTIDO = {
+    'Fecha', 'Día', 'Comp', 'Ronda', 'Sedes', 'Resultado', 'Equipo', 'Adversario',
+    'Arranque', 'Posc', 'Mín', 'Informe del partido', 'partido_url',
+}
+
+def match_key(row):
+    """Clave de un partido en cualquiera de las tablas: el id del informe o,
+    si la fila no lo tiene, fecha y adversario. None en los encabezados repetidos."""
+    partido_id = extract_match_id(row.get('partido_url'))
+    if partido_id:
+        return partido_id
+    fecha = row.get('Fecha') or ''
+    if not re.match(r'\d{4}-\d{2}-\d{2}', fecha):
+        return None
+    return fecha, row.get('Adversario')
+
+class TablaPartidos:
+    """Filas recién parseadas de una página de partidos: encabezados y listas
+    de textos, tal como salen de table_parsers.py.
+
+    Es lo que pasa del parser a los escritores (CSV con csv.writer, SQLite
+    con lotes_filas) sin construir un DataFrame; los escritores que trabajan
+    con pandas (Parquet, actualización incremental) usan to_dataframe().
+    """
+    __slots__ = ('headers', 'rows')
+
+    def __init__(self, headers, rows):
+        self.headers = headers
+        self.rows = rows
+
+    def __len__(self):
+        return len(self.rows)
+
+    def columna(self, nombre):
+        i = self.headers.index(nombre)
+        return [row[i] for row in self.rows]
+
+    def to_dataframe(self):
+        import pandas as pd
+
+        return pd.DataFrame(self.rows, columns=self.headers)
+
+def como_dataframe(tabla):
+    """DataFrame de una TablaPartidos (los DataFrame y None pasan tal cual)"""
+    return tabla.to_dataframe() if isinstance(tabla, TablaPartidos) else tabla
+
+def parse_match_logs_rows(html, parser=None):
+    """Extrae las tablas de partidos del HTML como TablaPartidos, sin pandas.
+
+    La base es matchlogs_all; las demás tablas de estadísticas de la página
+    (también las comentadas) se unen por partido y aportan las columnas que
+    falten, así que un solo parseo da la fila completa de cada partido.
+    parser: backend de table_parsers.py ('lxml', 'stream' o 'bs4'); por
+    defecto el más rápido disponible.
+    Además de las columnas de las tablas trae 'partido_url' (el enlace de
+    'Informe del partido') y 'partido_id', vacíos si la fila no tiene informe.
+    """
+    tables = extract_tables(html, TABLAS_PARTIDOS, parser, links=ENLACES_PARTIDOS)
+    if 'matchlogs_all' not in tables:
+        print("No se encontró la tabla de partidos")
+        return None
+
+    principal = tables.pop('matchlogs_all')
+    if not principal[1]:
+        return None
+    grupos = [None] + [table_id.removeprefix('matchlogs_') for table_id in tables]
+    headers, data = join_tables([principal, *tables.values()], match_key, grupos, COLUMNAS_FILA_PARTIDO)
+    url = headers.index('partido_url')
+    for row in data:
+        row.append(extract_match_id(row[url]) or '')
+    return TablaPartidos(headers + ['partido_id'], data)
+
+def parse_match_logs_html(html, parser=None):
+    """Lo mismo que parse_match_logs_rows, pero como DataFrame"""
+    return como_dataframe(parse_match_logs_rows(html, parser))
+
+def find_all_comps_href(html):
+    """Devuelve el href del filtro 'Todas las competencias' si no está activo"""
+    from bs4 import BeautifulSoup
+
+    soup = BeautifulSoup(html, 'html.parser')
+    for filtro in soup.select("div.filter a"):
+        if 'Todas las competencias' in filtro.get_text():
+            if "current" in (filtro.parent.get('class') or []):
+                return None
+            return filtro.get('href')
+    return None
+
+def find_matches_href(html):
+    """Devuelve el enlace 'Partidos' de la última fila de table.stats_table"""
+    from bs4 import BeautifulSoup
+
+    soup = BeautifulSoup(html, 'html.parser')
+    rows = soup.select("table.stats_table tbody tr")
+    if not rows:
+        return None
+    cells = rows[-1].find_all('td')
+    if not cells:
+        return None
+    link = cells[-1].find('a')
+    return link.get('href') if link else None
+
+# ---------------------------------------------------------------------------
+# BACKENDS DE DESCARGA
+# ---------------------------------------------------------------------------
+class MatchLogFetcher:
+    """Interfaz común de los backends que descargan registros de partidos"""
+    name = "base"
+    metricas = None
+    archivo = None
+
+    def usar_metricas(self, metricas):
+        """Registra peticiones, bytes, reintentos y pasos en metricas (metricas.py)"""
+        self.metricas = metricas
+
+    def usar_archivo(self, archivo):
+        """Guarda cada página descargada en archivo (ArchivoPaginas, archivo_paginas.py)"""
+        self.archivo = archivo
+
+    def fetch_matchlogs_html(self, player_url):
+        """Devuelve el HTML de la página con table#matchlogs_all, o None"""
+        raise NotImplementedError
+
+    def fetch_report_html(self, report_url):
+        """Devuelve el HTML del informe de un partido ('/es/partidos/<id>/...'), o None"""
+        raise NotImplementedError
+
+    def get_match_logs_table(self, player_url):
+        """Descarga y parsea la tabla de partidos de un jugador"""
+        html = self.fetch_matchlogs_html(player_url)
+        if html is None:
+            return None
+        return parse_match_logs_html(html)
+
+    def close(self):
+        pass
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+class HttpFetcher(MatchLogFetcher):
+    """Backend sin navegador: cliente HTTP con conexiones keep-alive reutilizadas.
+
+    Todas las peticiones pasan por el gobernador (limitador.py), que marca
+    el ritmo y decide los reintentos; si una página sigue bloqueada o
+    fallando se lanza DescargaPospuesta para volver a encolar al jugador.
+    """
+    name = "http"
+
+    def __init__(self, base_url=FBREF_BASE_URL, pool_size=10, timeout=20, temporadas=None, cache=None,
+                 gobernador=None, verbose=False):
+        self.base_url = base_url.rstrip('/')
+        self.verbose = verbose
+        self.timeout = timeout
+        self.temporadas = temporadas
+        self.cache = cache
+        self.gobernador = gobernador or Gobernador()
+        self.session = requests.Session()
+        self.session.headers.update({
+            "User-Agent": USER_AGENT,
+            "Accept-Language": "es-ES,es;q=0.9",
+        })
+        adapter = HTTPAdapter(pool_connections=pool_size, pool_maxsize=pool_size)
+        self.session.mount("http://", adapter)
+        self.session.mount("https://", adapter)
+
+    def get(self, url, quiet=False):
+        """GET sobre la sesión compartida (y la caché, si hay); devuelve el texto o None.
+
+        Lanza DescargaPospuesta si el sitio sigue bloqueando o fallando tras
+        los reintentos que permite el gobernador.
+        """
+        entry = self.cache.get(url) if self.cache else None
+        if entry is not None and entry.fresh:
+            if self.metricas is not None:
+                self.metricas.contar('cache_aciertos')
+            status, text, red = entry.status, entry.text, False
+        else:
+            response = self._pedir(url, headers=self.cache.conditional_headers(entry) if self.cache else None)
+            if response.status_code == 304 and entry is not None:
+                self.cache.revalidated(url)
+                if self.metricas is not None:
+                    self.metricas.contar('cache_revalidadas')
+                status, text, red = entry.status, entry.text, False
+            else:
+                if self.cache:
+                    self.cache.put(url, response.status_code, response.text, response.headers)
+                status, text, red = response.status_code, response.text, True
+
+        # Se archiva lo que llega de la red y, de la caché, solo lo que el
+        # archivo aún no tiene (reparsear necesita una página de cada jugador)
+        if self.archivo is not None and status == 200 and (red or not self.archivo.tiene(url)):
+            self.archivo.guardar(url, text)
+        if status != 200:
+            if red and not quiet:
+                print(f"Respuesta {status} en {url}")
+            return None
+        return text
+
+    def _pedir(self, url, headers=None):
+        """GET con el ritmo y los reintentos del gobernador; devuelve la respuesta
+        o lanza DescargaPospuesta si sigue bloqueada/fallando"""
+        intento = 0
+        while True:
+            espera = self.gobernador.adquirir(url)
+            if self.metricas is not None and espera:
+                self.metricas.observar('espera_limitador', espera)
+            inicio = time.perf_counter()
+            try:
+                with etapa(self.metricas, 'http_get'):
+                    response = self.session.get(url, timeout=self.timeout, headers=headers)
+            except requests.RequestException as e:
+                self.gobernador.registrar(url)
+                motivo = f"error de red: {e}"
+            else:
+                if 'charset' not in response.headers.get('Content-Type', ''):
+                    response.encoding = 'utf-8'
+                bloqueada = pagina_bloqueada(response.status_code, response.text)
+                resultado = self.gobernador.registrar(
+                    url, response.status_code, time.perf_counter() - inicio,
+                    segundos_retry_after(response.headers.get('Retry-After')), bloqueada)
+                if self.metricas is not None:
+                    self._contar_respuesta(response)
+                if resultado == 'ok':
+                    return response
+                motivo = "página de bloqueo" if bloqueada else f"respuesta {response.status_code}"
+            if self.metricas is not None:
+                self.metricas.contar('bloqueos' if motivo == "página de bloqueo" else 'errores_transitorios')
+            if not self.gobernador.puede_reintentar(url, intento):
+                print(f"⚠ Descarga pospuesta ({motivo}): {url}")
+                raise DescargaPospuesta(f"{motivo}: {url}")
+            intento += 1
+            if self.metricas is not None:
+                self.metricas.contar('reintentos')
+
+    def _contar_respuesta(self, response):
+        self.metricas.contar('http_respuestas', estado=response.status_code)
+        self.metricas.contar('bytes_descargados', len(response.content))
+
+    def _local_url(self, url):
+        """Reescribe URLs absolutas de fbref hacia base_url (servidores locales)"""
+        if url.startswith(FBREF_BASE_URL):
+            return self.base_url + url[len(FBREF_BASE_URL):]
+        return urljoin(self.base_url + "/", url)
+
+    def fetch_matchlogs_html(self, player_url):
+        # 1. URL directa a partir del id del jugador
+        player_id = extract_player_id(player_url)
+        if player_id:
+            for temporada in self.temporadas or temporadas_candidatas():
+                html = self.get(build_matchlogs_url(player_id, temporada, self.base_url), quiet=True)
+                if html and 'id="matchlogs_all"' in html:
+                    return html
+
+        # 2. Mismo recorrido que con Selenium, pero leyendo el HTML crudo
+        html = self.get(self._local_url(player_url))
+        if html is None:
+            return None
+        all_comps_href = find_all_comps_href(html)
+        if all_comps_href:
+            html = self.get(self._local_url(all_comps_href))
+            if html is None:
+                return None
+        match_href = find_matches_href(html)
+        if not match_href:
+            print("No se encontró enlace de Partidos")
+            return None
+        html = self.get(self._local_url(match_href))
+        if html and 'id="matchlogs_all"' in html:
+            return html
+        return None
+
+    def fetch_report_html(self, report_url):
+        return self.get(self._local_url(report_url))
+
+    def close(self):
+        self.session.close()
+        if self.cache:
+            # Los aciertos y revalidaciones ya van a las métricas a medida que ocurren
+            if self.metricas is not None and self.cache.stats['evicted']:
+                self.metricas.contar('cache_expulsadas', self.cache.stats['evicted'])
+            if self.verbose:
+                print(self.cache.summary())
+            self.cache.close()
+
+def setup_driver():
+    """Configura y retorna el driver de Chrome (headless, sin recursos pesados)"""
+    from driver_pool import create_driver
+    return create_driver()
+
+def cargar_con_gobernador(driver, url, gobernador):
+    """driver.get(url) al ritmo del gobernador; devuelve el HTML.
+
+    El gobernador se entera siempre del resultado, también cuando driver.get
+    falla (timeout, WebDriverException): si no, con el circuito semiabierto
+    la sonda quedaría tomada y el host no volvería a pedirse. Una página de
+    bloqueo lanza DescargaPospuesta.
+    """
+    gobernador.adquirir(url)
+    inicio = time.perf_counter()
+    try:
+        driver.get(url)
+        html = driver.page_source
+    except Exception:
+        gobernador.registrar(url, None, time.perf_counter() - inicio)
+        raise
+    bloqueada = pagina_bloqueada(200, html)
+    gobernador.registrar(url, 200, time.perf_counter() - inicio, bloqueada=bloqueada)
+    if bloqueada:
+        raise DescargaPospuesta(f"página de bloqueo: {url}")
+    return html
+
+def get_match_logs_html(driver, player_url, timeout=10, metricas=None, gobernador=None):
+    """Recorre perfil -> 'Todas las competencias' -> 'Partidos' con Selenium.
+
+    En lugar de pausas fijas espera a que aparezca cada tabla objetivo.
+    metricas: si se pasa, mide cada paso (perfil, filtro, partidos).
+    gobernador: si se pasa, cada carga de página respeta su ritmo y una
+    página de bloqueo lanza DescargaPospuesta.
+    """
+    from selenium.webdriver.common.by import By
+    from selenium.webdriver.support.ui import WebDriverWait
+    from selenium.webdriver.support import expected_conditions as EC
+
+    stats_rows = (By.CSS_SELECTOR, "table.stats_table tbody tr")
+
+    def cargar(url):
+        if gobernador is None:
+            driver.get(url)
+        else:
+            cargar_con_gobernador(driver, url, gobernador)
+
+    try:
+        # 1. Ir al perfil del jugador
+        with etapa(metricas, 'selenium_perfil'):
+            cargar(player_url)
+
+        # 2. Aplicar filtro "Todas las competencias"
+        try:
+            with etapa(metricas, 'selenium_filtro'):
+                all_comp_btn = WebDriverWait(driver, timeout).until(
+                    EC.presence_of_element_located((By.XPATH, "//div[@class='filter']//a[contains(., 'Todas las competencias')]")))
+
+                if "current" not in all_comp_btn.find_element(By.XPATH, "./..").get_attribute("class"):
+                    old_table = driver.find_element(By.CSS_SELECTOR, "table.stats_table")
+                    driver.execute_script("arguments[0].click();", all_comp_btn)
+                    WebDriverWait(driver, timeout).until(EC.staleness_of(old_table))
+                WebDriverWait(driver, timeout).until(EC.presence_of_element_located(stats_rows))
+        except DescargaPospuesta:
+            raise
+        except Exception as e:
+            print(f"Error al aplicar filtro 'Todas las competencias': {e}")
+            return None
+
+        # 3. Encontrar el enlace "Partidos" en la última celda de la última fila
+        try:
+            rows = driver.find_elements(*stats_rows)
+            if not rows:
+                print("No se encontraron filas en la tabla")
+                return None
+
+            cells = rows[-1].find_elements(By.TAG_NAME, "td")
+            if not cells:
+                print("No se encontraron celdas en la última fila")
+                return None
+
+            match_link = cells[-1].find_element(By.TAG_NAME, "a")
+            match_url = match_link.get_attribute("href")
+
+            if not match_url:
+                print("No se encontró enlace de Partidos")
+                return None
+
+            # 4. Ir a la URL de partidos y esperar a la tabla matchlogs_all
+            with etapa(metricas, 'selenium_partidos'):
+                cargar(match_url)
+                WebDriverWait(driver, timeout).until(
+                    EC.presence_of_element_located((By.CSS_SELECTOR, "table#matchlogs_all tbody tr")))
+                return driver.page_source
+
+        except DescargaPospuesta:
+            raise
+        except Exception as e:
+            print(f"Error al encontrar/enlazar a partidos: {e}")
+            return None
+
+    except DescargaPospuesta:
+        raise
+    except Exception as e:
+        print(f"Error general: {e}")
+        return None
+
+class SeleniumFetcher(MatchLogFetcher):
+    """Backend con Chrome headless sobre un pool de drivers (driver_pool.py).
+
+    Los Chrome se arrancan solo cuando se necesitan y se reciclan tras
+    max_pages jugadores o al superar max_rss_mb de memoria.
+    """
+    name = "selenium"
+
+    def __init__(self, workers=1, max_pages=50, max_rss_mb=1500, driver_factory=setup_driver, gobernador=None):
+        from driver_pool import DriverPool
+        self.gobernador = gobernador or Gobernador()
+        self.pool = DriverPool(size=workers, max_pages=max_pages,
+                               max_rss_mb=max_rss_mb, driver_factory=driver_factory)
+
+    def fetch_matchlogs_html(self, player_url):
+        with self.pool.driver() as driver:
+            html = get_match_logs_html(driver, player_url, metricas=self.metricas, gobernador=self.gobernador)
+            if html is not None and self.archivo is not None:
+                self.archivo.guardar(driver.current_url, html)
+            return html
+
+    def fetch_report_html(self, report_url):
+        url = full_player_url(report_url)
+        with self.pool.driver() as driver:
+            with etapa(self.metricas, 'selenium_informe'):
+                html = cargar_con_gobernador(driver, url, self.gobernador)
+            if self.archivo is not None:
+                self.archivo.guardar(driver.current_url, html)
+            return html
+
+    def close(self):
+        self.pool.close()
+
+class FallbackFetcher(MatchLogFetcher):
+    """Prueba cada backend en orden hasta que uno devuelva la tabla"""
+    name = "fallback"
+
+    def __init__(self, fetchers):
+        self.fetchers = list(fetchers)
+
+    def usar_metricas(self, metricas):
+        self.metricas = metricas
+        for fetcher in self.fetchers:
+            fetcher.usar_metricas(metricas)
+
+    def usar_archivo(self, archivo):
+        self.archivo = archivo
+        for fetcher in self.fetchers:
+            fetcher.usar_archivo(archivo)
+
+    def fetch_matchlogs_html(self, player_url):
+        for fetcher in self.fetchers:
+            html = fetcher.fetch_matchlogs_html(player_url)
+            if html is not None:
+                return html
+            if fetcher is not self.fetchers[-1]:
+                print(f"↻ Backend '{fetcher.name}' sin resultado, probando el siguiente...")
+                if self.metricas is not None:
+                    self.metricas.contar('respaldos', backend=fetcher.name)
+        return None
+
+    def fetch_report_html(self, report_url):
+        for fetcher in self.fetchers:
+            html = fetcher.fetch_report_html(report_url)
+            if html is not None:
+                return html
+        return None
+
+    def close(self):
+        for fetcher in self.fetchers:
+            fetcher.close()
+
+def default_fetcher(base_url=FBREF_BASE_URL, selenium_workers=1, cache_path='.cache_http/cache.db',
+                    gobernador=None):
+    """HTTP directo (con caché en disco) y Selenium solo como respaldo, con un
+    mismo gobernador para que ambos compartan el ritmo de fbref"""
+    from http_cache import HttpCache
+    cache = HttpCache(cache_path) if cache_path else None
+    gobernador = gobernador or Gobernador()
+    return FallbackFetcher([
+        HttpFetcher(base_url=base_url, cache=cache, gobernador=gobernador),
+        SeleniumFetcher(workers=selenium_workers, gobernador=gobernador),
+    ])
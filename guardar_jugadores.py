@@ -1,60 +1,83 @@
+import argparse
 import os
-import pandas as pd
 import sqlite3
 
+from actualizacion_incremental import CLAVE_PARTIDO, upsert_rows
+from esquema_partidos import crear_indices, tipar_dataframe, tipo_columna
+
+# True: solo inserta/actualiza los partidos nuevos o corregidos de cada tabla
+# False: elimina y recrea cada tabla desde el CSV
+MODO_INCREMENTAL = True
+
 # ---------------------------------------------------------------------------
 # CONFIGURACIÓN DE LA BASE DE DATOS SQLITE
 # ---------------------------------------------------------------------------
 # Puedes cambiar el nombre si quieres otra base de datos
 db_path = "mi_base_de_datos.db"
-connection = sqlite3.connect(db_path)
-cursor = connection.cursor()
-print(f"Conectado a SQLite DB en '{db_path}'.")
+carpeta_csv = "partidos_data"
 
 # ---------------------------------------------------------------------------
 # FUNCIÓN PARA CREAR TABLA E INSERTAR DESDE CSV
 # ---------------------------------------------------------------------------
-def crear_tabla_desde_csv(csv_path):
+def crear_tabla_desde_csv(connection, csv_path):
+    import pandas as pd
+
+    cursor = connection.cursor()
     file_name = os.path.basename(csv_path)
     table_name = file_name.replace(".csv", "")
 
-    # Leer el CSV
-    df = pd.read_csv(csv_path, encoding='utf-8')
+    # Leer el CSV como texto y convertir cada columna a su tipo (esquema_partidos.py)
+    df = pd.read_csv(csv_path, encoding='utf-8-sig', dtype=str, keep_default_na=False)
+    df = tipar_dataframe(df)
     print(f"\nLeyendo CSV: {csv_path}")
     print(f"Tabla destino: {table_name}")
 
+    existe = cursor.execute(
+        "SELECT 1 FROM sqlite_master WHERE type='table' AND name = ?", (table_name,)).fetchone()
+    if MODO_INCREMENTAL and existe:
+        cambios = upsert_rows(connection, table_name, df, CLAVE_PARTIDO)
+        connection.commit()
+        print(f"{cambios} registros nuevos o modificados en la tabla '{table_name}'.")
+        return
+
     # Eliminar tabla si ya existe
     cursor.execute(f"DROP TABLE IF EXISTS '{table_name}'")
     print(f"Tabla '{table_name}' eliminada si existía.")
 
-    # Crear la tabla con columnas tipo TEXT
-    columnas_sql = [f"'{col}' TEXT" for col in df.columns]
+    # Crear la tabla con el tipo de cada columna (TEXT si no es conocida)
+    columnas_sql = [f"'{col}' {tipo_columna(col) or 'TEXT'}" for col in df.columns]
     create_sql = f"CREATE TABLE '{table_name}' ({', '.join(columnas_sql)})"
     cursor.execute(create_sql)
     print(f"Tabla '{table_name}' creada.")
 
-    # Insertar los datos
-    df = df.astype(str)  # Convertir todo a texto
+    # Insertar los datos (NaN -> NULL)
+    df = df.astype(object).where(df.notna(), None)
     placeholders = ", ".join(["?"] * len(df.columns))
     insert_sql = f"INSERT INTO '{table_name}' ({', '.join([f'`{col}`' for col in df.columns])}) VALUES ({placeholders})"
     data = list(df.itertuples(index=False, name=None))
     cursor.executemany(insert_sql, data)
+    crear_indices(connection, table_name)
     connection.commit()
     print(f"{len(df)} registros insertados en la tabla '{table_name}'.")
 
 # ---------------------------------------------------------------------------
 # PROCESAR TODOS LOS CSV DE UNA CARPETA
 # ---------------------------------------------------------------------------
-carpeta_csv = r"C:/Users/jupaf/Documents/Proyectos_BI/Proyecto Final/Webscraping/partidos_data"
+def guardar_carpeta(carpeta_csv=carpeta_csv, db_path=db_path):
+    connection = sqlite3.connect(db_path)
+    print(f"Conectado a SQLite DB en '{db_path}'.")
+    try:
+        for archivo in os.listdir(carpeta_csv):
+            if archivo.lower().endswith(".csv"):
+                ruta_csv = os.path.join(carpeta_csv, archivo)
+                crear_tabla_desde_csv(connection, ruta_csv)
+    finally:
+        connection.close()
+        print("\nConexión a SQLite cerrada.")
 
-for archivo in os.listdir(carpeta_csv):
-    if archivo.lower().endswith(".csv"):
-        ruta_csv = os.path.join(carpeta_csv, archivo)
-        crear_tabla_desde_csv(ruta_csv)
-
-# ---------------------------------------------------------------------------
-# CERRAR CONEXIÓN
-# ---------------------------------------------------------------------------
-cursor.close()
-connection.close()
-print("\nConexión a SQLite cerrada.")
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Crea (o actualiza) una tabla por cada CSV de partidos")
+    parser.add_argument('--carpeta', default=carpeta_csv)
+    parser.add_argument('--db', default=db_path)
+    args = parser.parse_args()
+    guardar_carpeta(args.carpeta, args.db)
@@ -0,0 +1,158 @@
+import os
+import sqlite3
+import threading
+import time
+import zlib
+from collections import namedtuple
+
+# TTL por tipo de URL, en segundos
+DEFAULT_TTLS = {
+    'matchlogs': 6 * 3600,       # registros de partidos: cambian tras cada jornada
+    'jugador': 3 * 24 * 3600,    # perfiles de jugador
+    'roster': 7 * 24 * 3600,     # directorios de jugadores por país
+}
+# Solo se guardan respuestas útiles para el scraper (200) y ausencias (404)
+CACHEABLE_STATUS = (200, 404)
+# Los accesos de los aciertos (para el LRU) se escriben en lotes de este tamaño
+ACCESOS_POR_LOTE = 100
+
+CachedResponse = namedtuple('CachedResponse', 'url status text etag last_modified fresh')
+
+def url_type(url):
+    """Clasifica una URL de fbref para elegir su TTL"""
+    if '/matchlogs/' in url:
+        return 'matchlogs'
+    # Directorios por país: /es/country/jugadores/COL/... también lleva /jugadores/
+    if '/country/' in url:
+        return 'roster'
+    if '/jugadores/' in url or '/players/' in url:
+        return 'jugador'
+    return 'roster'
+
+class HttpCache:
+    """Caché en disco de respuestas HTTP indexada por URL.
+
+    Cada entrada guarda el cuerpo comprimido, su ETag/Last-Modified y su
+    vencimiento. Las entradas vencidas se revalidan con peticiones
+    condicionales y el conjunto se mantiene dentro de max_bytes expulsando
+    las menos usadas recientemente (LRU). Los accesos de los aciertos se
+    guardan en memoria y se escriben en lotes (al llegar a ACCESOS_POR_LOTE,
+    antes de expulsar y al cerrar).
+    """
+
+    def __init__(self, path='.cache_http/cache.db', max_bytes=500 * 1024 * 1024, ttls=None):
+        os.makedirs(os.path.dirname(path) or '.', exist_ok=True)
+        self.max_bytes = max_bytes
+        self.ttls = dict(DEFAULT_TTLS, **(ttls or {}))
+        self.stats = {'hits': 0, 'revalidated': 0, 'misses': 0, 'stored': 0, 'evicted': 0}
+        self._lock = threading.Lock()
+        self._accesos = {}
+        self.conn = sqlite3.connect(path, check_same_thread=False)
+        self.conn.execute("PRAGMA journal_mode=WAL")
+        self.conn.execute("""
+            CREATE TABLE IF NOT EXISTS respuestas (
+                url TEXT PRIMARY KEY,
+                status INTEGER,
+                body BLOB,
+                etag TEXT,
+                last_modified TEXT,
+                expires_at REAL,
+                size INTEGER,
+                last_access REAL
+            )
+        """)
+        self.conn.execute("CREATE INDEX IF NOT EXISTS idx_respuestas_acceso ON respuestas(last_access)")
+        self.conn.commit()
+        self._total_bytes = self.conn.execute("SELECT COALESCE(SUM(size), 0) FROM respuestas").fetchone()[0]
+
+    def get(self, url):
+        """Devuelve la entrada guardada (fresca o vencida) o None"""
+        now = time.time()
+        with self._lock:
+            row = self.conn.execute(
+                "SELECT status, body, etag, last_modified, expires_at FROM respuestas WHERE url = ?",
+                (url,)).fetchone()
+            if row is None:
+                return None
+            self._accesos[url] = now
+            if len(self._accesos) >= ACCESOS_POR_LOTE:
+                self._guardar_accesos()
+                self.conn.commit()
+        status, body, etag, last_modified, expires_at = row
+        fresh = expires_at > now
+        if fresh:
+            self.stats['hits'] += 1
+        return CachedResponse(url, status, zlib.decompress(body).decode('utf-8'),
+                              etag, last_modified, fresh)
+
+    @staticmethod
+    def conditional_headers(entry):
+        """Cabeceras If-None-Match / If-Modified-Since para revalidar"""
+        headers = {}
+        if entry is not None and not entry.fresh:
+            if entry.etag:
+                headers['If-None-Match'] = entry.etag
+            if entry.last_modified:
+                headers['If-Modified-Since'] = entry.last_modified
+        return headers
+
+    def revalidated(self, url):
+        """Marca como fresca una entrada tras un 304 Not Modified"""
+        with self._lock:
+            self.conn.execute("UPDATE respuestas SET expires_at = ? WHERE url = ?",
+                              (time.time() + self.ttls[url_type(url)], url))
+            self.conn.commit()
+        self.stats['revalidated'] += 1
+
+    def put(self, url, status, text, headers):
+        """Guarda una respuesta descargada y expulsa entradas LRU si hace falta"""
+        self.stats['misses'] += 1
+        if status not in CACHEABLE_STATUS:
+            return
+        body = zlib.compress(text.encode('utf-8'), 6)
+        now = time.time()
+        with self._lock:
+            self._accesos.pop(url, None)
+            old = self.conn.execute("SELECT size FROM respuestas WHERE url = ?", (url,)).fetchone()
+            self.conn.execute(
+                "INSERT OR REPLACE INTO respuestas VALUES (?, ?, ?, ?, ?, ?, ?, ?)",
+                (url, status, body, headers.get('ETag'), headers.get('Last-Modified'),
+                 now + self.ttls[url_type(url)], len(body), now))
+            self._total_bytes += len(body) - (old[0] if old else 0)
+            self._evict()
+            self.conn.commit()
+        self.stats['stored'] += 1
+
+    def _guardar_accesos(self):
+        """Escribe los last_access pendientes (con el lock tomado, sin commit)"""
+        if self._accesos:
+            self.conn.executemany("UPDATE respuestas SET last_access = ? WHERE url = ?",
+                                  [(acceso, url) for url, acceso in self._accesos.items()])
+            self._accesos.clear()
+
+    def _evict(self):
+        if self._total_bytes > self.max_bytes:
+            self._guardar_accesos()
+        while self._total_bytes > self.max_bytes:
+            victims = self.conn.execute(
+                "SELECT url, size FROM respuestas ORDER BY last_access LIMIT 50").fetchall()
+            if not victims:
+                break
+            for url, size in victims:
+                self.conn.execute("DELETE FROM respuestas WHERE url = ?", (url,))
+                self._total_bytes -= size
+                self.stats['evicted'] += 1
+                if self._total_bytes <= self.max_bytes:
+                    break
+
+    def summary(self):
+        s = self.stats
+        return (f"Caché HTTP: {s['hits']} aciertos, {s['revalidated']} revalidadas (304), "
+                f"{s['misses']} descargas, {s['evicted']} expulsadas, "
+                f"{self._total_bytes / (1024 * 1024):.1f} MB en disco")
+
+    def close(self):
+        with self._lock:
+            self._guardar_accesos()
+            self.conn.commit()
+            self.conn.close()
@@ -0,0 +1,154 @@
+import bisect
+import csv
+import hashlib
+import os
+import pickle
+import unicodedata
+from collections import Counter, defaultdict
+from difflib import SequenceMatcher
+
+INDEX_VERSION = 1
+
+def normalize_text(text):
+    """Normaliza texto para comparación insensible a mayúsculas/acentos"""
+    if not isinstance(text, str):
+        return ""
+    return unicodedata.normalize('NFKD', text.lower()).encode('ascii', errors='ignore').decode('utf-8')
+
+def trigrams(text):
+    """Trigramas de un texto normalizado, con bordes marcados por espacios"""
+    padded = f"  {text} "
+    return {padded[i:i + 3] for i in range(len(padded) - 2)}
+
+def _csv_signature(csv_path):
+    with open(csv_path, 'rb') as f:
+        return hashlib.sha1(f.read()).hexdigest()
+
+class NameIndex:
+    """Índice de nombres del roster construido una sola vez.
+
+    Guarda los nombres normalizados, una lista ordenada para búsquedas por
+    prefijo, un índice invertido de palabras y otro de trigramas para
+    subcadenas y búsquedas aproximadas (tolerantes a errores de tipeo).
+    """
+
+    def __init__(self, players, signature=None):
+        self.signature = signature
+        self.players = list(players)                       # [(nombre, href)]
+        self.normalized = [normalize_text(name) for name, _ in self.players]
+        self.exact_map = defaultdict(list)
+        self.tokens = defaultdict(list)
+        self.grams = defaultdict(list)
+        for i, name in enumerate(self.normalized):
+            self.exact_map[name].append(i)
+            for token in set(name.split()):
+                self.tokens[token].append(i)
+            for gram in trigrams(name):
+                self.grams[gram].append(i)
+        self.sorted_names = sorted((name, i) for i, name in enumerate(self.normalized))
+        self.exact_map = dict(self.exact_map)
+        self.tokens = dict(self.tokens)
+        self.grams = dict(self.grams)
+
+    # -----------------------------------------------------------------------
+    # CONSTRUCCIÓN Y PERSISTENCIA
+    # -----------------------------------------------------------------------
+    @classmethod
+    def build(cls, csv_path):
+        with open(csv_path, newline='', encoding='utf-8') as f:
+            players = [(row['nombre'], row['href']) for row in csv.DictReader(f)]
+        return cls(players, signature=_csv_signature(csv_path))
+
+    @classmethod
+    def load_or_build(cls, csv_path, cache_path=None):
+        """Carga el índice guardado; lo reconstruye solo si el CSV cambió"""
+        cache_path = cache_path or f"{csv_path}.idx"
+        signature = _csv_signature(csv_path)
+        if os.path.exists(cache_path):
+            try:
+                with open(cache_path, 'rb') as f:
+                    version, index = pickle.load(f)
+                if version == INDEX_VERSION and index.signature == signature:
+                    return index
+            except Exception as e:
+                print(f"Índice de nombres inválido, se reconstruye: {e}")
+        index = cls.build(csv_path)
+        with open(cache_path, 'wb') as f:
+            pickle.dump((INDEX_VERSION, index), f, protocol=pickle.HIGHEST_PROTOCOL)
+        return index
+
+    # -----------------------------------------------------------------------
+    # BÚSQUEDAS (devuelven índices de self.players)
+    # -----------------------------------------------------------------------
+    def exact(self, name):
+        return list(self.exact_map.get(normalize_text(name), []))
+
+    def prefix(self, name, limit=None):
+        query = normalize_text(name)
+        start = bisect.bisect_left(self.sorted_names, (query, -1))
+        found = []
+        for candidate, i in self.sorted_names[start:]:
+            if not candidate.startswith(query) or (limit and len(found) >= limit):
+                break
+            found.append(i)
+        return found
+
+    def token(self, name):
+        """Jugadores que contienen todas las palabras de name"""
+        words = normalize_text(name).split()
+        if not words:
+            return []
+        postings = [set(self.tokens.get(word, ())) for word in words]
+        return sorted(set.intersection(*postings))
+
+    def substring(self, name):
+        """Jugadores cuyo nombre normalizado contiene name (como str.contains)"""
+        query = normalize_text(name)
+        if len(query) < 3:
+            return [i for i, candidate in enumerate(self.normalized) if query in candidate]
+        grams = [gram for gram in trigrams(query) if gram.strip() == gram]
+        if not grams:
+            return [i for i, candidate in enumerate(self.normalized) if query in candidate]
+        postings = sorted((self.grams.get(gram, []) for gram in grams), key=len)
+        candidates = set(postings[0]).intersection(*postings[1:])
+        return sorted(i for i in candidates if query in self.normalized[i])
+
+    def fuzzy(self, name, limit=3, threshold=0.75, candidates=20):
+        """Mejores coincidencias aproximadas por similitud de caracteres.
+
+        Los trigramas compartidos preseleccionan unos pocos candidatos y solo
+        a esos se les calcula la similitud completa.
+        """
+        query = normalize_text(name)
+        overlap = Counter()
+        for gram in trigrams(query):
+            overlap.update(self.grams.get(gram, ()))
+        # SequenceMatcher cachea el análisis de seq2: la consulta va ahí
+        matcher = SequenceMatcher(None, '', query)
+        scored = []
+        for i, _ in overlap.most_common(candidates):
+            matcher.set_seq1(self.normalized[i])
+            if matcher.real_quick_ratio() < threshold or matcher.quick_ratio() < threshold:
+                continue
+            score = matcher.ratio()
+            if score >= threshold:
+                scored.append((score, i))
+        scored.sort(key=lambda item: (-item[0], item[1]))
+        return [i for _, i in scored[:limit]]
+
+    def lookup(self, name, fuzzy=True):
+        """Mismo orden que find_players_in_csv: exacta, parcial y, si no hay
+        nada, aproximada. Devuelve (modo, [(nombre, href)])."""
+        for mode, search in (('exacta', self.exact), ('parcial', self.substring)):
+            found = search(name)
+            if found:
+                return mode, [self.players[i] for i in found]
+        if fuzzy:
+            found = self.fuzzy(name, limit=1)
+            if found:
+                return 'aproximada', [self.players[i] for i in found]
+        return None, []
+
+    def lookup_many(self, names, fuzzy=True):
+        """{nombre pedido: (modo, [(nombre, href)])} para una lista completa"""
+        return {name: self.lookup(name, fuzzy) for name in names}
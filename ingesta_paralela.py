@@ -0,0 +1,312 @@
+import argparse
+import multiprocessing
+import os
+import queue
+import sqlite3
+import time
+
+from cargar_partidos import PRAGMAS_CARGA, leer_csv, nombre_jugador
+from esquema_partidos import COLUMNAS_RESULTADO, crear_indices, fila_tipada, tipo_columna
+
+# ---------------------------------------------------------------------------
+# CONFIGURACIÓN
+# ---------------------------------------------------------------------------
+carpeta_csv = "partidos_data"
+db_path = "mi_base_de_datos.db"
+
+FILAS_POR_LOTE = 2000        # filas que un trabajador junta antes de enviarlas
+FILAS_POR_COMMIT = 50000     # el escritor confirma cada tantas filas
+LOTES_EN_COLA = 64           # lotes en vuelo como máximo (memoria acotada)
+ESPERA_TRABAJADORES = 5      # segundos sin mensajes antes de revisar si algún lector murió
+
+# Mensajes de los trabajadores al escritor
+LOTE, FIN_ARCHIVO, ERROR = 'lote', 'fin_archivo', 'error'
+_FIN = None
+
+# ---------------------------------------------------------------------------
+# LECTURA Y CONVERSIÓN (en los procesos trabajadores)
+# ---------------------------------------------------------------------------
+def lotes_filas(archivo, headers, filas_crudas, filas_por_lote=FILAS_POR_LOTE):
+    """Mensajes (tipo, archivo, datos) con las filas ya tipadas de un jugador.
+
+    filas_crudas: listas de textos con las columnas de headers (las filas de
+    un CSV o de una tabla recién parseada). El primer lote lleva las
+    columnas de la tabla; los siguientes solo las filas, como tuplas, para
+    que el envío entre procesos sea pequeño.
+    """
+    tipos = [tipo_columna(col) or 'TEXT' for col in headers]
+    columnas = [(col, tipo) for col, tipo in zip(headers, tipos)] + COLUMNAS_RESULTADO
+    filas = []
+    leidas = 0
+    for row in filas_crudas:
+        leidas += 1
+        fila = fila_tipada(headers, tipos, row) if len(row) == len(headers) else None
+        if fila is not None:
+            filas.append(tuple(fila))
+        if len(filas) >= filas_por_lote:
+            yield LOTE, archivo, (columnas, filas)
+            columnas, filas = None, []
+    if filas or columnas is not None:
+        yield LOTE, archivo, (columnas, filas)
+    yield FIN_ARCHIVO, archivo, leidas
+
+def lotes_archivo(ruta, filas_por_lote=FILAS_POR_LOTE):
+    """Mensajes de lotes_filas para un *_partidos.csv"""
+    archivo = os.path.basename(ruta)
+    try:
+        f, headers, reader = leer_csv(ruta)
+        with f:
+            yield from lotes_filas(archivo, headers, reader, filas_por_lote)
+    except Exception as e:
+        yield ERROR, archivo, str(e)
+
+def _trabajador(tareas, salida, filas_por_lote):
+    for ruta in iter(tareas.get, _FIN):
+        for mensaje in lotes_archivo(ruta, filas_por_lote):
+            salida.put(mensaje)
+    salida.put(_FIN)
+
+# ---------------------------------------------------------------------------
+# ESCRITOR ÚNICO (proceso principal, dueño de la conexión)
+# ---------------------------------------------------------------------------
+class EscritorSQLite:
+    """Único dueño de la conexión: confirma en transacciones grandes en lugar
+    de una por archivo.
+
+    destino='tablas' crea una tabla por jugador (como guardar_jugadores.py +
+    ingresar_jugadores_id.py); destino='partidos' lo vuelca todo en la tabla
+    partidos, añadiendo las columnas nuevas a medida que aparecen. Con miles
+    de jugadores conviene la segunda: en SQLite cada CREATE TABLE/INDEX cuesta
+    más cuanto más grande es el esquema.
+    """
+
+    def __init__(self, db_path=db_path, filas_por_commit=FILAS_POR_COMMIT, destino='tablas'):
+        # Un solo hilo escribe a la vez, pero EscritorJugadores lo usa desde
+        # los hilos de asyncio.to_thread del crawler
+        self.conn = sqlite3.connect(db_path, isolation_level=None, check_same_thread=False)
+        for pragma in PRAGMAS_CARGA:
+            self.conn.execute(pragma)
+        self.conn.execute("""
+            CREATE TABLE IF NOT EXISTS jugadores (
+                jugador_id INTEGER PRIMARY KEY AUTOINCREMENT,
+                nombre_completo TEXT UNIQUE
+            )
+        """)
+        self.destino = destino
+        self.filas_por_commit = filas_por_commit
+        self.sin_confirmar = 0
+        self.inserts = {}            # archivo -> (sql, jugador_id, tabla)
+        self.escritas = {}           # archivo -> filas escritas hasta ahora
+        self.filas = 0
+        self.descartadas = 0
+        self.archivos = 0
+        self.conn.execute("BEGIN")
+        if destino == 'partidos':
+            self.conn.execute("DROP TABLE IF EXISTS partidos")
+            self.conn.execute('CREATE TABLE partidos ("jugador_id" INTEGER)')
+            self.columnas_partidos = {'jugador_id'}
+
+    def _jugador_id(self, archivo):
+        nombre = nombre_jugador(archivo)
+        self.conn.execute("INSERT OR IGNORE INTO jugadores (nombre_completo) VALUES (?)", (nombre,))
+        return self.conn.execute(
+            "SELECT jugador_id FROM jugadores WHERE nombre_completo = ?", (nombre,)).fetchone()[0]
+
+    def _preparar_tabla(self, archivo, columnas):
+        columnas = columnas + [('jugador_id', 'INTEGER')]
+        if self.destino == 'partidos':
+            tabla = 'partidos'
+            for col, tipo in columnas:
+                if col not in self.columnas_partidos:
+                    self.conn.execute(f'ALTER TABLE partidos ADD COLUMN "{col}" {tipo}')
+                    self.columnas_partidos.add(col)
+        else:
+            tabla = archivo.replace(".csv", "")
+            columnas_sql = ", ".join(f'"{col}" {tipo}' for col, tipo in columnas)
+            self.conn.execute(f'DROP TABLE IF EXISTS "{tabla}"')
+            self.conn.execute(f'CREATE TABLE "{tabla}" ({columnas_sql})')
+        lista = ", ".join(f'"{col}"' for col, _ in columnas)
+        placeholders = ", ".join(["?"] * len(columnas))
+        self.inserts[archivo] = (f'INSERT INTO "{tabla}" ({lista}) VALUES ({placeholders})',
+                                 self._jugador_id(archivo), tabla)
+        self.escritas[archivo] = 0
+
+    def escribir(self, archivo, columnas, filas):
+        if columnas is not None:
+            self._preparar_tabla(archivo, columnas)
+        sql, jugador_id, _ = self.inserts[archivo]
+        self.conn.executemany(sql, (fila + (jugador_id,) for fila in filas))
+        self.filas += len(filas)
+        self.escritas[archivo] += len(filas)
+        self.sin_confirmar += len(filas)
+        if self.sin_confirmar >= self.filas_por_commit:
+            self.confirmar()
+
+    def confirmar(self):
+        self.conn.execute("COMMIT")
+        self.conn.execute("BEGIN")
+        self.sin_confirmar = 0
+
+    def descartar(self):
+        """Deshace lo escrito desde la última confirmación"""
+        self.conn.execute("ROLLBACK")
+        self.conn.execute("BEGIN")
+        self.inserts.clear()
+        self.escritas.clear()
+        self.sin_confirmar = 0
+
+    def descartar_archivo(self, archivo):
+        """Quita lo ya escrito de un archivo que falló a mitad, aunque se haya
+        confirmado: sus filas de partidos o su tabla (que ya se había recreado,
+        así que el jugador queda sin tabla hasta la próxima ingesta)"""
+        if archivo not in self.inserts:
+            return
+        _, jugador_id, tabla = self.inserts.pop(archivo)
+        if self.destino == 'partidos':
+            self.conn.execute("DELETE FROM partidos WHERE jugador_id = ?", (jugador_id,))
+        else:
+            self.conn.execute(f'DROP TABLE IF EXISTS "{tabla}"')
+        self.filas -= self.escritas.pop(archivo)
+
+    def terminar_archivo(self, archivo, leidas):
+        _, _, tabla = self.inserts.pop(archivo)
+        self.escritas.pop(archivo)
+        if self.destino != 'partidos':
+            crear_indices(self.conn, tabla)
+        self.archivos += 1
+        self.descartadas += leidas
+
+    def close(self, ok=True):
+        if ok and self.destino == 'partidos':
+            crear_indices(self.conn)
+        self.conn.execute("COMMIT" if ok else "ROLLBACK")
+        self.conn.close()
+
+class EscritorJugadores:
+    """writer del crawl (main.py, crawler_async.py) que lleva las filas
+    recién parseadas (TablaPartidos) directo a SQLite, sin CSV ni DataFrame.
+
+    Cada jugador va a su tabla <jugador>_partidos, igual que al ingerir los
+    CSV con destino='tablas', y se confirma al terminarlo: el diario del
+    crawl nunca da por hecho un jugador que no quedó guardado.
+    """
+
+    def __init__(self, db_path=db_path):
+        self.escritor = EscritorSQLite(db_path, destino='tablas')
+
+    def __call__(self, tabla, player_name):
+        from main import match_logs_filename
+
+        if tabla is None:
+            return False
+        archivo = os.path.basename(match_logs_filename(player_name))
+        try:
+            for tipo, archivo, datos in lotes_filas(archivo, tabla.headers, tabla.rows):
+                if tipo == LOTE:
+                    self.escritor.escribir(archivo, *datos)
+                else:
+                    self.escritor.terminar_archivo(archivo, datos)
+            self.escritor.confirmar()
+            return True
+        except sqlite3.Error as e:
+            print(f"Error guardando {player_name} en SQLite: {e}")
+            self.escritor.descartar()
+            return False
+
+    def close(self):
+        self.escritor.close()
+
+# ---------------------------------------------------------------------------
+# ORQUESTACIÓN
+# ---------------------------------------------------------------------------
+def _mensajes_en_paralelo(rutas, workers, filas_por_lote):
+    contexto = multiprocessing.get_context()
+    tareas = contexto.Queue()
+    salida = contexto.Queue(maxsize=LOTES_EN_COLA)
+    for ruta in rutas:
+        tareas.put(ruta)
+    for _ in range(workers):
+        tareas.put(_FIN)
+    procesos = [contexto.Process(target=_trabajador, args=(tareas, salida, filas_por_lote), daemon=True)
+                for _ in range(workers)]
+    for proceso in procesos:
+        proceso.start()
+    try:
+        activos = workers
+        while activos:
+            try:
+                mensaje = salida.get(timeout=ESPERA_TRABAJADORES)
+            except queue.Empty:
+                # Un lector que muere (OOM, kill) nunca manda _FIN
+                caidos = [proceso for proceso in procesos if proceso.exitcode not in (None, 0)]
+                if caidos:
+                    raise RuntimeError(f"{len(caidos)} proceso(s) lector(es) terminaron de forma inesperada "
+                                       f"(código {caidos[0].exitcode}); se cancela la ingesta")
+                continue
+            if mensaje is _FIN:
+                activos -= 1
+            else:
+                yield mensaje
+        for proceso in procesos:
+            proceso.join()
+    finally:
+        for proceso in procesos:
+            if proceso.is_alive():
+                proceso.terminate()
+
+def ingerir_carpeta(carpeta_csv=carpeta_csv, db_path=db_path, workers=None, destino='tablas',
+                    filas_por_lote=FILAS_POR_LOTE, filas_por_commit=FILAS_POR_COMMIT):
+    """Carga todos los *_partidos.csv de la carpeta (ver EscritorSQLite para destino).
+
+    Un pool de procesos lee y tipa los CSV en paralelo y un único escritor
+    inserta los lotes. workers=0 lo hace todo en el proceso actual.
+    Devuelve (archivos, filas).
+    """
+    inicio = time.perf_counter()
+    rutas = [os.path.join(carpeta_csv, a) for a in sorted(os.listdir(carpeta_csv))
+             if a.endswith("_partidos.csv")]
+    if not rutas:
+        print("No hay archivos de partidos para cargar.")
+        return 0, 0
+    workers = min(os.cpu_count() or 1, len(rutas)) if workers is None else workers
+
+    if workers == 0:
+        mensajes = (m for ruta in rutas for m in lotes_archivo(ruta, filas_por_lote))
+    else:
+        mensajes = _mensajes_en_paralelo(rutas, workers, filas_por_lote)
+
+    escritor = EscritorSQLite(db_path, filas_por_commit, destino)
+    ok = False
+    try:
+        for tipo, archivo, datos in mensajes:
+            if tipo == LOTE:
+                escritor.escribir(archivo, *datos)
+            elif tipo == FIN_ARCHIVO:
+                escritor.terminar_archivo(archivo, datos)
+            else:
+                escritor.descartar_archivo(archivo)
+                print(f"❌ Error leyendo {archivo}: {datos}; se descartan sus filas")
+        ok = True
+    finally:
+        escritor.close(ok)
+        mensajes.close()
+
+    duracion = time.perf_counter() - inicio
+    descartadas = escritor.descartadas - escritor.filas
+    print(f"✔ {escritor.archivos} archivos, {escritor.filas} filas en {duracion:.2f} s "
+          f"({escritor.filas / duracion:,.0f} filas/s, {workers or 'sin'} procesos); "
+          f"{descartadas} filas que no eran partidos descartadas")
+    return escritor.archivos, escritor.filas
+
+def cli(argv=None, prog=None):
+    parser = argparse.ArgumentParser(prog=prog, description="Ingesta paralela de los CSV de partidos en SQLite")
+    parser.add_argument('--carpeta', default=carpeta_csv)
+    parser.add_argument('--db', default=db_path)
+    parser.add_argument('--workers', type=int, help="procesos lectores (por defecto, uno por núcleo)")
+    parser.add_argument('--destino', choices=['tablas', 'partidos'], default='tablas',
+                        help="una tabla por jugador o todo en la tabla partidos")
+    args = parser.parse_args(argv)
+    ingerir_carpeta(args.carpeta, args.db, args.workers, args.destino)
+
+if __name__ == "__main__":
+    cli()
@@ -1,40 +1,63 @@
+import argparse
 import os
 import sqlite3
-import pandas as pd
 
 # Rutas
-carpeta_csv = r"C:/Users/jupaf/Documents/Proyectos_BI/Proyecto Final/Webscraping/partidos_data"
+carpeta_csv = "partidos_data"
 db_path = "mi_base_de_datos.db"
 
-# Conectar a SQLite
-conn = sqlite3.connect(db_path)
-cursor = conn.cursor()
-
-# Procesar cada archivo CSV
-for archivo in os.listdir(carpeta_csv):
-    if archivo.endswith("_partidos.csv"):
-        ruta_csv = os.path.join(carpeta_csv, archivo)
-
-        # 1. Extraer nombre del jugador
-        nombre_jugador = archivo.replace("_partidos.csv", "").replace("_", " ").strip()
-
-        # 2. Obtener el jugador_id
-        cursor.execute("SELECT jugador_id FROM jugadores WHERE nombre_completo = ?", (nombre_jugador,))
-        resultado = cursor.fetchone()
-        if not resultado:
-            print(f"❌ Jugador no encontrado en la tabla: {nombre_jugador}")
-            continue
-        jugador_id = resultado[0]
-
-        # 3. Leer el CSV
-        df = pd.read_csv(ruta_csv)
-
-        # 4. Agregar la columna jugador_id
-        df["jugador_id"] = jugador_id
-
-        # 5. Guardar en SQLite: tabla con el mismo nombre que el archivo
-        nombre_tabla = archivo.replace(".csv", "")
-        df.to_sql(nombre_tabla, conn, if_exists="replace", index=False)
-        print(f"✅ Tabla actualizada: {nombre_tabla} con jugador_id = {jugador_id}")
-
-conn.close()
+def ingresar_jugadores_id(carpeta_csv=carpeta_csv, db_path=db_path):
+    """Añade la columna jugador_id a la tabla de cada <jugador>_partidos.csv.
+
+    La tabla se deja como la creó guardar_jugadores.py (tipos, columnas de
+    Resultado, índices y clave única): solo se añade la columna si falta y
+    se rellena. Si la tabla aún no existe se crea desde el CSV como allí.
+    """
+    from esquema_partidos import crear_indices
+    from guardar_jugadores import crear_tabla_desde_csv
+
+    # Conectar a SQLite
+    conn = sqlite3.connect(db_path)
+    cursor = conn.cursor()
+
+    # Procesar cada archivo CSV
+    for archivo in os.listdir(carpeta_csv):
+        if archivo.endswith("_partidos.csv"):
+            ruta_csv = os.path.join(carpeta_csv, archivo)
+
+            # 1. Extraer nombre del jugador
+            nombre_jugador = archivo.replace("_partidos.csv", "").replace("_", " ").strip()
+
+            # 2. Obtener el jugador_id
+            cursor.execute("SELECT jugador_id FROM jugadores WHERE nombre_completo = ?", (nombre_jugador,))
+            resultado = cursor.fetchone()
+            if not resultado:
+                print(f"❌ Jugador no encontrado en la tabla: {nombre_jugador}")
+                continue
+            jugador_id = resultado[0]
+
+            # 3. Tabla con el mismo nombre que el archivo (tipada por guardar_jugadores.py)
+            nombre_tabla = archivo.replace(".csv", "")
+            existe = cursor.execute(
+                "SELECT 1 FROM sqlite_master WHERE type='table' AND name = ?", (nombre_tabla,)).fetchone()
+            if not existe:
+                crear_tabla_desde_csv(conn, ruta_csv)
+
+            # 4. Agregar la columna jugador_id en su sitio
+            columnas = {col[1] for col in cursor.execute(f'PRAGMA table_info("{nombre_tabla}")')}
+            if "jugador_id" not in columnas:
+                cursor.execute(f'ALTER TABLE "{nombre_tabla}" ADD COLUMN "jugador_id" INTEGER')
+            cursor.execute(f'UPDATE "{nombre_tabla}" SET "jugador_id" = ? WHERE "jugador_id" IS NOT ?',
+                           (jugador_id, jugador_id))
+            crear_indices(conn, nombre_tabla)
+            conn.commit()
+            print(f"✅ Tabla actualizada: {nombre_tabla} con jugador_id = {jugador_id}")
+
+    conn.close()
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Añade jugador_id a las tablas de partidos de cada jugador")
+    parser.add_argument('--carpeta', default=carpeta_csv)
+    parser.add_argument('--db', default=db_path)
+    args = parser.parse_args()
+    ingresar_jugadores_id(args.carpeta, args.db)
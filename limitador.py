@@ -0,0 +1,219 @@
+import random
+import threading
+import time
+from email.utils import parsedate_to_datetime
+from urllib.parse import urlsplit
+
+# Peticiones por segundo permitidas por host (fbref bloquea por una hora a
+# quien pase de 10 peticiones por minuto). Los hosts que no están aquí
+# (servidores locales de prueba) no tienen tope, solo backoff y circuito.
+LIMITES = {'fbref.com': 10 / 60}
+# Veces que un jugador pospuesto vuelve al final de la cola antes de darlo por fallido
+REENCOLAR_MAX = 5
+
+# Respuestas que indican que hay que frenar
+ESTADOS_BLOQUEO = (403, 429)
+ESTADOS_TRANSITORIOS = (500, 502, 503, 504)
+# Textos de las páginas de bloqueo/captcha (llegan con estado 200 o 403)
+MARCAS_BLOQUEO = (
+    'Rate Limited Request',
+    'Just a moment...',
+    'cf-chl-',
+    'g-recaptcha',
+    'h-captcha',
+    'Access Denied',
+)
+
+class DescargaPospuesta(Exception):
+    """La página no se pudo descargar por ahora (bloqueo, 429, 5xx o red);
+    el jugador debe volver a la cola en lugar de darse por perdido"""
+
+class CircuitoAbierto(Exception):
+    """El host sigue bloqueando tras varias pausas largas: hay que parar el crawl"""
+
+def host_de(url):
+    host = urlsplit(url).hostname or ''
+    return host[4:] if host.startswith('www.') else host
+
+def pagina_bloqueada(estado, html):
+    """True si la respuesta es un 403/429 o una página de bloqueo/captcha"""
+    if estado in ESTADOS_BLOQUEO:
+        return True
+    # Las páginas de bloqueo no tienen tablas; así no se revisan las páginas normales enteras
+    return bool(html) and '<table' not in html and any(marca in html for marca in MARCAS_BLOQUEO)
+
+def segundos_retry_after(valor, ahora=None):
+    """Retry-After en segundos (acepta segundos o fecha HTTP); None si no hay"""
+    if not valor:
+        return None
+    valor = valor.strip()
+    if valor.isdigit():
+        return float(valor)
+    try:
+        fecha = parsedate_to_datetime(valor)
+    except (TypeError, ValueError):
+        return None
+    return max(0.0, fecha.timestamp() - (ahora or time.time()))
+
+class _EstadoHost:
+    def __init__(self, tasa_max, rafaga):
+        self.tasa_max = tasa_max
+        self.tasa = tasa_max
+        self.rafaga = rafaga
+        self.tokens = float(rafaga)
+        self.actualizado = time.monotonic()
+        self.reanudar_en = 0.0         # backoff / Retry-After / circuito abierto
+        self.fallos_seguidos = 0       # para el backoff exponencial
+        self.bloqueos_seguidos = 0     # para el circuito
+        self.aperturas = 0             # aperturas del circuito sin un éxito entre medio
+        self.sonda = False             # circuito semiabierto: una sola petición a la vez
+        self.peticiones = 0
+        self.reintentos = 0
+
+class Gobernador:
+    """Limitador adaptativo por host para todas las descargas.
+
+    Cada host tiene un token bucket a su tasa permitida (LIMITES). La tasa
+    baja a la mitad ante bloqueos, 429 y 5xx, un poco si la latencia pasa
+    de latencia_objetivo, y sube de nuevo poco a poco con cada respuesta
+    buena (AIMD). Tras un error todas las peticiones al host esperan lo que
+    pida Retry-After o un backoff exponencial con jitter; los reintentos
+    tienen un tope por petición y un presupuesto global. Con umbral_circuito
+    bloqueos seguidos el circuito se abre y el host descansa enfriamiento
+    segundos (el doble en cada apertura); después pasa una sola petición de
+    prueba y, si tras max_aperturas sigue bloqueado, lanza CircuitoAbierto.
+    """
+
+    def __init__(self, limites=None, rafaga=2, latencia_objetivo=5.0, backoff_base=2.0,
+                 backoff_max=120.0, max_reintentos=3, presupuesto_reintentos=0.2,
+                 umbral_circuito=5, enfriamiento=300.0, max_aperturas=3):
+        self.limites = dict(LIMITES, **(limites or {}))
+        self.rafaga = rafaga
+        self.latencia_objetivo = latencia_objetivo
+        self.backoff_base = backoff_base
+        self.backoff_max = backoff_max
+        self.max_reintentos = max_reintentos
+        self.presupuesto_reintentos = presupuesto_reintentos
+        self.umbral_circuito = umbral_circuito
+        self.enfriamiento = enfriamiento
+        self.max_aperturas = max_aperturas
+        self.procesos = 1
+        self.hosts = {}
+        self.cond = threading.Condition()
+
+    def _estado(self, host):
+        estado = self.hosts.get(host)
+        if estado is None:
+            limite = self.limites.get(host)
+            estado = self.hosts[host] = _EstadoHost(limite and limite / self.procesos, self.rafaga)
+        return estado
+
+    def repartir(self, procesos):
+        """Divide los límites entre los procesos que descargan desde la misma
+        máquina (misma IP), p. ej. los trabajadores de cola_trabajo.py"""
+        with self.cond:
+            self.procesos = max(1, procesos)
+            for host, estado in self.hosts.items():
+                limite = self.limites.get(host)
+                if limite:
+                    estado.tasa_max = limite / self.procesos
+                    estado.tasa = min(estado.tasa, estado.tasa_max)
+            self.cond.notify_all()
+
+    # -----------------------------------------------------------------------
+    # ANTES DE CADA PETICIÓN
+    # -----------------------------------------------------------------------
+    def adquirir(self, url):
+        """Espera hasta poder pedir url; devuelve los segundos esperados"""
+        host = host_de(url)
+        inicio = time.monotonic()
+        with self.cond:
+            estado = self._estado(host)
+            while True:
+                if estado.aperturas > self.max_aperturas:
+                    raise CircuitoAbierto(f"{host} sigue bloqueando tras {self.max_aperturas} pausas")
+                ahora = time.monotonic()
+                espera = estado.reanudar_en - ahora
+                if espera <= 0 and estado.aperturas and estado.sonda:
+                    espera = 1.0   # otra petición está probando el circuito
+                if espera <= 0 and estado.tasa:
+                    estado.tokens = min(estado.rafaga,
+                                        estado.tokens + (ahora - estado.actualizado) * estado.tasa)
+                    estado.actualizado = ahora
+                    if estado.tokens < 1:
+                        espera = (1 - estado.tokens) / estado.tasa
+                if espera <= 0:
+                    if estado.tasa:
+                        estado.tokens -= 1
+                    if estado.aperturas:
+                        estado.sonda = True
+                    estado.peticiones += 1
+                    return time.monotonic() - inicio
+                # registrar() despierta a los que esperan si cambia la situación
+                self.cond.wait(espera)
+
+    def puede_reintentar(self, url, intento):
+        """True si quedan reintentos para esta petición y en el presupuesto global"""
+        with self.cond:
+            estado = self._estado(host_de(url))
+            if intento >= self.max_reintentos:
+                return False
+            if estado.reintentos >= self.presupuesto_reintentos * estado.peticiones + self.max_reintentos:
+                return False
+            estado.reintentos += 1
+            return True
+
+    # -----------------------------------------------------------------------
+    # DESPUÉS DE CADA RESPUESTA
+    # -----------------------------------------------------------------------
+    def registrar(self, url, estado_http=None, latencia=None, retry_after=None, bloqueada=False):
+        """Ajusta la tasa del host según la respuesta.
+
+        estado_http None es un error de red. Devuelve 'ok', 'reintentar'
+        (error transitorio) o 'bloqueada'.
+        """
+        host = host_de(url)
+        with self.cond:
+            estado = self._estado(host)
+            estado.sonda = False
+            if bloqueada or estado_http in ESTADOS_BLOQUEO:
+                resultado = 'bloqueada'
+            elif estado_http is None or estado_http in ESTADOS_TRANSITORIOS:
+                resultado = 'reintentar'
+            else:
+                resultado = 'ok'
+
+            if resultado == 'ok':
+                estado.fallos_seguidos = estado.bloqueos_seguidos = estado.aperturas = 0
+                if estado.tasa_max:
+                    if latencia is not None and latencia > self.latencia_objetivo:
+                        estado.tasa = max(estado.tasa_max / 20, estado.tasa * 0.8)
+                    else:
+                        estado.tasa = min(estado.tasa_max, estado.tasa + estado.tasa_max / 10)
+            else:
+                estado.fallos_seguidos += 1
+                if estado.tasa_max:
+                    estado.tasa = max(estado.tasa_max / 20, estado.tasa / 2)
+                if resultado == 'bloqueada':
+                    estado.bloqueos_seguidos += 1
+                espera = retry_after
+                if espera is None:
+                    # Backoff exponencial con jitter
+                    tope = min(self.backoff_max, self.backoff_base * 2 ** (estado.fallos_seguidos - 1))
+                    espera = random.uniform(tope / 2, tope)
+                else:
+                    espera += random.uniform(0, 1)
+                if estado.bloqueos_seguidos >= self.umbral_circuito:
+                    espera = max(espera, min(3600.0, self.enfriamiento * 2 ** estado.aperturas))
+                    estado.aperturas += 1
+                    estado.bloqueos_seguidos = 0
+                    print(f"⚠ {host} bloquea las peticiones: circuito abierto por {espera:.0f} s")
+                estado.reanudar_en = max(estado.reanudar_en, time.monotonic() + espera)
+            self.cond.notify_all()
+            return resultado
+
+    def resumen(self):
+        with self.cond:
+            return {host: {'tasa_por_minuto': round(estado.tasa * 60, 2) if estado.tasa else None,
+                           'peticiones': estado.peticiones, 'reintentos': estado.reintentos}
+                    for host, estado in self.hosts.items()}
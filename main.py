@@ -1,155 +1,190 @@
-import pandas as pd
+import csv
 import time
-from selenium import webdriver
-from selenium.webdriver.chrome.options import Options
-from selenium.webdriver.common.by import By
-from selenium.webdriver.support.ui import WebDriverWait
-from selenium.webdriver.support import expected_conditions as EC
-from bs4 import BeautifulSoup
 import re
 import os
+import threading
+from collections import Counter, deque
 
-def setup_driver():
-    """Configura y retorna el driver de Chrome"""
-    chrome_options = Options()
-    chrome_options.add_argument("--headless")
-    chrome_options.add_argument("--disable-gpu")
-    chrome_options.add_argument("--window-size=1920,1200")
-    chrome_options.add_argument("user-agent=Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36")
-    return webdriver.Chrome(options=chrome_options)
+from fetchers import (
+    default_fetcher,
+    full_player_url,
+    TablaPartidos,
+    como_dataframe,
+    get_match_logs_html,
+    parse_match_logs_html,
+    parse_match_logs_rows,
+)
+from crawl_journal import CrawlJournal
+from limitador import REENCOLAR_MAX, CircuitoAbierto, DescargaPospuesta
+from metricas import Metricas
 
 def get_match_logs_table(driver, player_url):
     """Extrae la tabla de registro de partidos para un jugador"""
-    try:
-        # 1. Ir al perfil del jugador
-        driver.get(player_url)
-        time.sleep(3)
+    html = get_match_logs_html(driver, player_url)
+    return parse_match_logs_html(html) if html is not None else None
 
-        # 2. Aplicar filtro "Todas las competencias"
-        try:
-            all_comp_btn = WebDriverWait(driver, 10).until(
-                EC.presence_of_element_located((By.XPATH, "//div[@class='filter']//a[contains(., 'Todas las competencias')]")))
-            
-            if "current" not in all_comp_btn.find_element(By.XPATH, "./..").get_attribute("class"):
-                driver.execute_script("arguments[0].click();", all_comp_btn)
-                time.sleep(3)
-        except Exception as e:
-            print(f"Error al aplicar filtro 'Todas las competencias': {e}")
-            return None
-
-        # 3. Encontrar el enlace "Partidos" en la última celda de la última fila
-        try:
-            # Encontrar todas las filas de la tabla
-            rows = driver.find_elements(By.CSS_SELECTOR, "table.stats_table tbody tr")
-            if not rows:
-                print("No se encontraron filas en la tabla")
-                return None
-            
-            # Obtener la última fila
-            last_row = rows[-1]
-            
-            # Encontrar todas las celdas en la última fila
-            cells = last_row.find_elements(By.TAG_NAME, "td")
-            if not cells:
-                print("No se encontraron celdas en la última fila")
-                return None
-            
-            # Obtener la última celda
-            last_cell = cells[-1]
-            
-            # Buscar el enlace "Partidos" dentro de la última celda
-            match_link = last_cell.find_element(By.TAG_NAME, "a")
-            match_url = match_link.get_attribute("href")
-            
-            if not match_url:
-                print("No se encontró enlace de Partidos")
-                return None
-            
-            # 4. Ir a la URL de partidos
-            driver.get(match_url)
-            time.sleep(3)
-            
-            # Extraer la tabla de registro de partidos
-            html = driver.page_source
-            soup = BeautifulSoup(html, 'html.parser')
-            table = soup.find('table', {'id': 'matchlogs_all'})
-            
-            if not table:
-                print("No se encontró la tabla de partidos")
-                return None
-            
-            # Procesar la tabla a DataFrame
-            headers = [th.text.strip() for th in table.find('thead').find_all('tr')[-1].find_all(['th', 'td'])]
-            data = []
-            
-            for row in table.find('tbody').find_all('tr'):
-                row_data = [cell.text.strip() for cell in row.find_all(['th', 'td'])]
-                if len(row_data) == len(headers):
-                    data.append(row_data)
-            
-            return pd.DataFrame(data, columns=headers) if data else None
-            
-        except Exception as e:
-            print(f"Error al encontrar/enlazar a partidos: {e}")
-            return None
+def match_logs_filename(player_name, output_dir='partidos_data'):
+    """Ruta del CSV de partidos de un jugador ('<nombre>_partidos.csv')"""
+    # Limpiar el nombre del jugador para el nombre de archivo
+    clean_name = re.sub(r'[^\w\s-]', '', player_name).strip().replace(' ', '_')
+    return os.path.join(output_dir, f"{clean_name.lower()}_partidos.csv")
 
-    except Exception as e:
-        print(f"Error general: {e}")
-        return None
+def leer_roster(csv_path, num_players=None):
+    """[(nombre, href)] de los primeros num_players del CSV de jugadores (todos si es None)"""
+    with open(csv_path, newline='', encoding='utf-8-sig') as f:
+        reader = csv.DictReader(f)
+        if not {'nombre', 'href'} <= set(reader.fieldnames or ()):
+            raise KeyError("el CSV no tiene las columnas 'nombre' y 'href'")
+        players = []
+        for row in reader:
+            if num_players is not None and len(players) >= num_players:
+                break
+            players.append((row['nombre'], row['href']))
+    return players
 
 def save_match_logs(df, player_name, output_dir='partidos_data'):
-    """Guarda la tabla de partidos en archivo CSV"""
+    """Guarda la tabla de partidos en archivo CSV.
+
+    df: TablaPartidos (parse_match_logs_rows), cuyas filas se escriben tal
+    cual con csv.writer, o un DataFrame.
+    Se escribe a un temporal y se renombra, así que un corte nunca deja un
+    CSV a medias y guardar dos veces el mismo jugador (p. ej. desde dos
+    trabajadores de cola_trabajo.py) solo reemplaza el archivo.
+    """
     if df is None:
         return False
     
     # Crear directorio si no existe
     os.makedirs(output_dir, exist_ok=True)
-    
-    # Limpiar el nombre del jugador para el nombre de archivo
-    clean_name = re.sub(r'[^\w\s-]', '', player_name).strip().replace(' ', '_')
-    filename = os.path.join(output_dir, f"{clean_name.lower()}_partidos.csv")
+    filename = match_logs_filename(player_name, output_dir)
+    temporal = f"{filename}.{os.getpid()}-{threading.get_ident()}.tmp"
     
     try:
-        df.to_csv(filename, index=False, encoding='utf-8-sig')
+        if isinstance(df, TablaPartidos):
+            # Mismo formato que DataFrame.to_csv (BOM, comillas mínimas, os.linesep)
+            with open(temporal, 'w', newline='', encoding='utf-8-sig') as f:
+                writer = csv.writer(f, lineterminator=os.linesep)
+                writer.writerow(df.headers)
+                writer.writerows(df.rows)
+        else:
+            df.to_csv(temporal, index=False, encoding='utf-8-sig')
+        os.replace(temporal, filename)
         return True
     except Exception as e:
         print(f"Error guardando archivo: {e}")
+        if os.path.exists(temporal):
+            os.remove(temporal)
         return False
 
-def process_player_links(csv_path, num_players=10):
-    """Procesa los primeros N jugadores del CSV"""
+def save_match_logs_parquet(df, player_name, output_dir='partidos_parquet'):
+    """Alternativa a save_match_logs: dataset Parquet por temporada y
+    competición (ver almacen_columnar.py, requiere pyarrow)"""
+    from almacen_columnar import save_match_logs_parquet as guardar_parquet
+    return guardar_parquet(como_dataframe(df), player_name, output_dir)
+
+def procesar_jugador(fetcher, writer, name, url, metricas):
+    """Descarga, parsea y guarda un jugador; devuelve el estado para el resumen.
+
+    DescargaPospuesta y CircuitoAbierto (limitador.py) se propagan para que
+    quien reparte el trabajo decida si reencola o se detiene.
+    """
+    with metricas.etapa('jugador', jugador=name):
+        with metricas.etapa('descarga', jugador=name) as evento:
+            html = fetcher.fetch_matchlogs_html(full_player_url(url))
+            evento['bytes'] = len(html) if html else 0
+        match_logs = None
+        if html is not None:
+            with metricas.etapa('parseo', jugador=name) as evento:
+                match_logs = parse_match_logs_rows(html)
+                evento['filas'] = len(match_logs) if match_logs is not None else 0
+        else:
+            metricas.error('descarga', 'sin_html', jugador=name)
+
+        if match_logs is None:
+            if html is not None:
+                metricas.error('parseo', 'sin_tabla', jugador=name)
+            print(f"✖ No se pudieron extraer datos de partidos para {name}")
+            return "Error al extraer datos"
+        with metricas.etapa('guardado', jugador=name):
+            success = writer(match_logs, name)
+        if not success:
+            metricas.error('guardado', 'error_guardado', jugador=name)
+            return "Error al guardar"
+        metricas.contar('filas_extraidas', len(match_logs))
+        print(f"✔ Datos de partidos guardados para {name}")
+        return "Éxito"
+
+def process_player_links(csv_path, num_players=10, fetcher=None, concurrency=None,
+                         resume=False, db_path='mi_base_de_datos.db', writer=save_match_logs,
+                         metricas=None, archivo=None):
+    """Procesa los primeros N jugadores del CSV.
+
+    fetcher: backend de descarga (ver fetchers.py); por defecto HTTP directo
+    con Selenium como respaldo.
+    concurrency: si es mayor que 1 usa el crawler asyncio (crawler_async.py)
+    con ese número de descargas simultáneas.
+    resume: omite los jugadores ya completados según el diario del crawl
+    (tabla crawl_journal) y reintenta primero los fallidos.
+    El ritmo lo marca el gobernador del fetcher (limitador.py): los jugadores
+    cuya descarga se pospone vuelven al final de la cola.
+    writer: save_match_logs (CSV) o save_match_logs_parquet.
+    metricas: Metricas (metricas.py) donde se registran los tiempos por
+    etapa; al terminar se imprime su resumen y se cierra.
+    archivo: ArchivoPaginas (archivo_paginas.py) donde se guarda el HTML de
+    cada página descargada para poder reparsearlo sin red; se cierra al final.
+    """
     try:
-        df = pd.read_csv(csv_path)
-      
+        players = leer_roster(csv_path, num_players)
 
-        player_links = df['href'].head(num_players).tolist()
-        player_names = df['nombre'].head(num_players).tolist()
+        journal = CrawlJournal(db_path)
+        to_process = journal.prepare(players, resume=resume)
         
-        driver = setup_driver()
-        results = []
-        
-        for i, (url, name) in enumerate(zip(player_links, player_names), 1):
-            full_url = f"https://fbref.com{url}" if not url.startswith('http') else url
-            print(f"\n[{i}/{num_players}] Procesando {name}...")
-            
-            match_logs = get_match_logs_table(driver, full_url)
-            if match_logs is not None:
-                success = save_match_logs(match_logs, name)
-                if success:
-                    results.append((name, "Éxito"))
-                    print(f"✔ Datos de partidos guardados para {name}")
-                else:
-                    results.append((name, "Error al guardar"))
+        fetcher = fetcher or default_fetcher(selenium_workers=min(concurrency or 1, 4))
+        metricas = metricas or Metricas()
+        fetcher.usar_metricas(metricas)
+        if archivo is not None:
+            fetcher.usar_archivo(archivo)
+
+        try:
+            if concurrency and concurrency > 1:
+                from crawler_async import run_crawl
+                run_crawl(to_process, writer, fetcher=fetcher,
+                          concurrency=concurrency, journal=journal, metricas=metricas)
             else:
-                results.append((name, "Error al extraer datos"))
-                print(f"✖ No se pudieron extraer datos de partidos para {name}")
-            
-            # Pequeña pausa entre jugadores
-            time.sleep(2)
+                cola = deque(to_process)
+                pospuestos = Counter()
+                i = 0
+                while cola:
+                    name, url = cola.popleft()
+                    i += 1
+                    print(f"\n[{i}/{i + len(cola)}] Procesando {name}...")
+                    journal.start(url)
+                    
+                    try:
+                        journal.record(url, procesar_jugador(fetcher, writer, name, url, metricas))
+                    except DescargaPospuesta:
+                        pospuestos[url] += 1
+                        if pospuestos[url] <= REENCOLAR_MAX:
+                            print(f"↻ {name} vuelve al final de la cola")
+                            metricas.contar('pospuestos')
+                            cola.append((name, url))
+                        else:
+                            journal.record(url, "Error al descargar")
+                    except CircuitoAbierto as e:
+                        print(f"❌ {e}. Se detiene el crawl; continúa luego con --resume")
+                        break
+        finally:
+            # También ante Ctrl-C: el último lote del diario queda guardado
+            fetcher.close()
+            journal.flush()
+            metricas.imprimir_resumen()
+            metricas.close()
+            if archivo is not None:
+                archivo.close()
         
-        driver.quit()
-        
-        # Mostrar resumen
+        # Mostrar resumen (desde el diario, incluye lo hecho en corridas previas)
+        results = journal.summary(players)
+        journal.close()
         print("\nResumen de extracción:")
         for name, status in results:
             print(f"- {name}: {status}")
@@ -161,16 +196,63 @@ def process_player_links(csv_path, num_players=10):
         print("Asegúrate que el CSV tiene las columnas 'nombre' y 'href'")
         return False
 
-if __name__ == "__main__":
-    # Configuración
-    CSV_PATH = 'jugadores_activos_colombianos.csv'
-    NUM_PLAYERS = 1000
+# Configuración
+CSV_PATH = 'jugadores_activos_colombianos.csv'
+NUM_PLAYERS = 1000
+# Descargas simultáneas; 1 conserva el modo secuencial
+CONCURRENCIA = 8
 
+def cli(argv=None, prog=None):
+    import argparse
+
+    parser = argparse.ArgumentParser(prog=prog, description="Extrae los registros de partidos de fbref")
+    parser.add_argument('--resume', action='store_true',
+                        help="continúa una corrida interrumpida según el diario del crawl")
+    parser.add_argument('--csv', default=CSV_PATH, help="CSV de jugadores (columnas nombre y href)")
+    parser.add_argument('--db', default='mi_base_de_datos.db', help="base del diario del crawl (y de --formato sqlite)")
+    parser.add_argument('--num', type=int, default=NUM_PLAYERS, help="número de jugadores del CSV")
+    parser.add_argument('--concurrencia', type=int, default=CONCURRENCIA)
+    parser.add_argument('--formato', choices=['csv', 'parquet', 'sqlite'], default='csv',
+                        help="CSV por jugador, dataset Parquet (partidos_parquet) o tablas "
+                             "<jugador>_partidos de la base, sin pasar por CSV")
+    parser.add_argument('--metricas', default='metricas', metavar='DIR',
+                        help="carpeta para <corrida>.jsonl y scraper.prom (node_exporter)")
+    parser.add_argument('--puerto-metricas', type=int,
+                        help="expone /metrics para Prometheus mientras dura la corrida")
+    parser.add_argument('--archivo', default='archivo_paginas', metavar='DIR',
+                        help="archivo .warc.gz de las páginas descargadas (ver archivo_paginas.py)")
+    parser.add_argument('--sin-archivo', action='store_true', help="no guarda el HTML descargado")
+    args = parser.parse_args(argv)
+    if args.formato == 'sqlite':
+        from ingesta_paralela import EscritorJugadores
+        writer = EscritorJugadores(args.db)
+    else:
+        writer = save_match_logs_parquet if args.formato == 'parquet' else save_match_logs
+    run_id = time.strftime("%Y%m%d-%H%M%S")
+    metricas = Metricas(os.path.join(args.metricas, f"{run_id}.jsonl"),
+                        os.path.join(args.metricas, 'scraper.prom'), run_id)
+    if args.puerto_metricas:
+        metricas.servir(args.puerto_metricas)
+    archivo = None
+    if not args.sin_archivo:
+        from archivo_paginas import ArchivoPaginas
+        archivo = ArchivoPaginas(args.archivo)
     
-    print(f"\nIniciando extracción de registros de partidos para los primeros {NUM_PLAYERS} jugadores...")
-    success = process_player_links(CSV_PATH, NUM_PLAYERS)
+    print(f"\nIniciando extracción de registros de partidos para los primeros {args.num} jugadores...")
+    try:
+        success = process_player_links(args.csv, args.num, concurrency=args.concurrencia, resume=args.resume,
+                                       db_path=args.db, writer=writer, metricas=metricas, archivo=archivo)
+    finally:
+        if args.formato == 'sqlite':
+            writer.close()
+    if success and args.formato == 'parquet':
+        from almacen_columnar import compactar
+        compactar()
     
     if success:
         print("\nProceso completado con éxito")
     else:
-        print("\nEl proceso encontró errores. Revisa los mensajes anteriores.")
\ No newline at end of file
+        print("\nEl proceso encontró errores. Revisa los mensajes anteriores.")
+
+if __name__ == "__main__":
+    cli()
@@ -0,0 +1,194 @@
+import json
+import math
+import os
+import threading
+import time
+from collections import defaultdict
+from contextlib import contextmanager, nullcontext
+from datetime import datetime
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+PREFIJO = "fbref"
+CUANTILES = (0.5, 0.95, 0.99)
+
+def percentil(ordenados, q):
+    """Percentil por rango más cercano de una lista ya ordenada"""
+    if not ordenados:
+        return None
+    return ordenados[max(0, math.ceil(q * len(ordenados)) - 1)]
+
+def _numero(valor):
+    return f"{valor:.0f}" if float(valor).is_integer() else f"{valor:g}"
+
+def etapa(metricas, nombre, **campos):
+    """metricas.etapa(...) o un contexto vacío si no hay métricas"""
+    return metricas.etapa(nombre, **campos) if metricas is not None else nullcontext({})
+
+class Metricas:
+    """Duraciones por etapa y contadores de una corrida del scraper.
+
+    Cada medición es una línea JSON (jsonl_path) y alimenta los cuantiles
+    p50/p95/p99 del resumen y del archivo de texto de Prometheus
+    (prom_path). Es seguro usarla desde varios hilos; las líneas se
+    escriben en bloques para que el costo por medición sea de microsegundos.
+    """
+
+    def __init__(self, jsonl_path=None, prom_path=None, run_id=None, buffer_size=200):
+        self.run_id = run_id or datetime.now().strftime("%Y%m%d-%H%M%S")
+        self.jsonl_path = jsonl_path
+        self.prom_path = prom_path
+        self.buffer_size = buffer_size
+        self.lock = threading.Lock()
+        self.duraciones = defaultdict(list)       # etapa -> [segundos]
+        self.contadores = defaultdict(float)      # (nombre, (etiquetas)) -> valor
+        self.buffer = []
+        self.inicio = time.time()
+        self.servidor = None
+        if jsonl_path:
+            os.makedirs(os.path.dirname(jsonl_path) or '.', exist_ok=True)
+
+    # -----------------------------------------------------------------------
+    # REGISTRO
+    # -----------------------------------------------------------------------
+    @contextmanager
+    def etapa(self, nombre, **campos):
+        """Mide el bloque; si lanza una excepción la cuenta como error de la
+        etapa con el nombre de la excepción como categoría. Dentro del bloque
+        se pueden añadir campos al evento (bytes, filas...) en el dict que
+        devuelve."""
+        extra = {}
+        inicio = time.perf_counter()
+        try:
+            yield extra
+        except BaseException as e:
+            extra.setdefault('error', type(e).__name__)
+            raise
+        finally:
+            self.observar(nombre, time.perf_counter() - inicio, **campos, **extra)
+
+    def observar(self, etapa, segundos, **campos):
+        evento = {'ts': round(time.time(), 3), 'run': self.run_id, 'etapa': etapa,
+                  'segundos': round(segundos, 6), **campos}
+        with self.lock:
+            self.duraciones[etapa].append(segundos)
+            if campos.get('error'):
+                self._contar_error(etapa, campos['error'])
+            self._registrar(evento)
+
+    def contar(self, nombre, valor=1, **etiquetas):
+        with self.lock:
+            self.contadores[(nombre, tuple(sorted(etiquetas.items())))] += valor
+
+    def error(self, etapa, categoria, **campos):
+        """Error sin excepción (p. ej. página sin tabla); no entra en los tiempos"""
+        evento = {'ts': round(time.time(), 3), 'run': self.run_id, 'etapa': etapa,
+                  'error': categoria, **campos}
+        with self.lock:
+            self._contar_error(etapa, categoria)
+            self._registrar(evento)
+
+    def _contar_error(self, etapa, categoria):
+        self.contadores[('errores', (('categoria', categoria), ('etapa', etapa)))] += 1
+
+    def _registrar(self, evento):
+        if self.jsonl_path:
+            self.buffer.append(evento)
+            if len(self.buffer) >= self.buffer_size:
+                self._volcar()
+
+    def _volcar(self):
+        if not self.buffer:
+            return
+        with open(self.jsonl_path, 'a', encoding='utf-8') as f:
+            f.write(''.join(json.dumps(evento, ensure_ascii=False) + '\n' for evento in self.buffer))
+        self.buffer.clear()
+
+    # -----------------------------------------------------------------------
+    # SALIDAS
+    # -----------------------------------------------------------------------
+    def resumen(self):
+        """{etapa: {n, total, p50, p95, p99, max}} en segundos"""
+        with self.lock:
+            duraciones = {etapa: sorted(valores) for etapa, valores in self.duraciones.items()}
+        return {
+            etapa: {
+                'n': len(valores),
+                'total': sum(valores),
+                **{f"p{int(q * 100)}": percentil(valores, q) for q in CUANTILES},
+                'max': valores[-1],
+            }
+            for etapa, valores in duraciones.items() if valores
+        }
+
+    def texto_prometheus(self):
+        lineas = [f"# TYPE {PREFIJO}_etapa_segundos summary"]
+        for etapa, datos in self.resumen().items():
+            for q in CUANTILES:
+                lineas.append(f'{PREFIJO}_etapa_segundos{{etapa="{etapa}",quantile="{q}"}} '
+                              f'{datos[f"p{int(q * 100)}"]:.6f}')
+            lineas.append(f'{PREFIJO}_etapa_segundos_sum{{etapa="{etapa}"}} {datos["total"]:.6f}')
+            lineas.append(f'{PREFIJO}_etapa_segundos_count{{etapa="{etapa}"}} {datos["n"]}')
+        with self.lock:
+            contadores = sorted(self.contadores.items())
+        vistos = set()
+        for (nombre, etiquetas), valor in contadores:
+            if nombre not in vistos:
+                lineas.append(f"# TYPE {PREFIJO}_{nombre}_total counter")
+                vistos.add(nombre)
+            texto = ",".join(f'{clave}="{str(v)}"' for clave, v in etiquetas)
+            lineas.append(f"{PREFIJO}_{nombre}_total{{{texto}}} {_numero(valor)}" if texto
+                          else f"{PREFIJO}_{nombre}_total {_numero(valor)}")
+        lineas.append(f"{PREFIJO}_inicio_corrida_segundos {self.inicio:.0f}")
+        return "\n".join(lineas) + "\n"
+
+    def escribir_prometheus(self, path=None):
+        """Archivo de texto para el textfile collector de node_exporter
+        (se reemplaza de forma atómica)"""
+        path = path or self.prom_path
+        if not path:
+            return
+        os.makedirs(os.path.dirname(path) or '.', exist_ok=True)
+        with open(path + '.tmp', 'w', encoding='utf-8') as f:
+            f.write(self.texto_prometheus())
+        os.replace(path + '.tmp', path)
+
+    def servir(self, puerto=9108):
+        """Expone /metrics por HTTP en un hilo aparte"""
+        metricas = self
+
+        class Manejador(BaseHTTPRequestHandler):
+            def do_GET(self):
+                cuerpo = metricas.texto_prometheus().encode('utf-8')
+                self.send_response(200 if self.path.startswith('/metrics') else 404)
+                self.send_header('Content-Type', 'text/plain; version=0.0.4')
+                self.send_header('Content-Length', str(len(cuerpo)))
+                self.end_headers()
+                self.wfile.write(cuerpo)
+
+            def log_message(self, *args):
+                pass
+
+        self.servidor = ThreadingHTTPServer(('127.0.0.1', puerto), Manejador)
+        threading.Thread(target=self.servidor.serve_forever, daemon=True).start()
+        print(f"Métricas en http://127.0.0.1:{self.servidor.server_address[1]}/metrics")
+
+    def imprimir_resumen(self):
+        print(f"\nTiempos por etapa (corrida {self.run_id}):")
+        print(f"  {'etapa':<20} {'n':>6} {'total s':>9} {'p50 ms':>9} {'p95 ms':>9} {'p99 ms':>9}")
+        for etapa_, datos in self.resumen().items():
+            print(f"  {etapa_:<20} {datos['n']:>6} {datos['total']:>9.2f} {datos['p50'] * 1000:>9.1f} "
+                  f"{datos['p95'] * 1000:>9.1f} {datos['p99'] * 1000:>9.1f}")
+        with self.lock:
+            contadores = sorted(self.contadores.items())
+        for (nombre, etiquetas), valor in contadores:
+            detalle = ", ".join(f"{clave}={v}" for clave, v in etiquetas)
+            print(f"  {nombre}{f' ({detalle})' if detalle else ''}: {_numero(valor)}")
+
+    def close(self):
+        with self.lock:
+            if self.jsonl_path:
+                self._volcar()
+        self.escribir_prometheus()
+        if self.servidor is not None:
+            self.servidor.shutdown()
+            self.servidor.server_close()
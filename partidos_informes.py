@@ -0,0 +1,300 @@
+import argparse
+import re
+import sqlite3
+from collections import Counter, deque
+from datetime import datetime, timezone
+
+import pandas as pd
+
+from esquema_partidos import convertir_valor, parse_fecha, tipo_columna
+from fetchers import TablaPartidos, default_fetcher, extract_player_id
+from limitador import REENCOLAR_MAX, CircuitoAbierto, DescargaPospuesta
+from main import procesar_jugador, save_match_logs
+from metricas import Metricas
+from table_parsers import extract_tables, join_tables
+
+# ---------------------------------------------------------------------------
+# CONFIGURACIÓN
+# ---------------------------------------------------------------------------
+db_path = "mi_base_de_datos.db"
+csv_path = "jugadores_activos_colombianos.csv"
+
+# Tabla resumen de cada equipo en el informe del partido
+RESUMEN_RE = re.compile(r'id="(stats_([0-9a-f]{8})_summary)"')
+# Datos del partido que se guardan una sola vez (vistos desde el primer
+# jugador seguido que lo jugó)
+COLUMNAS_PARTIDO = ['Fecha', 'Comp', 'Ronda', 'Equipo', 'Adversario', 'Resultado']
+# Columnas que cada tabla del informe repite para identificar al jugador;
+# de las tablas unidas al resumen no se copian
+COLUMNAS_FILA_JUGADOR = {'Jugador', '#', 'País', 'Posc', 'Edad', 'Mín', 'jugador_url'}
+# Solo se descarga el informe de los partidos que comparten al menos estos
+# jugadores seguidos
+MIN_SEGUIDOS = 2
+
+def abrir_base(path=db_path):
+    """Crea (si faltan) la tabla de partidos deduplicada y la de líneas"""
+    conn = sqlite3.connect(path)
+    conn.execute("""
+        CREATE TABLE IF NOT EXISTS partidos_informes (
+            partido_id TEXT PRIMARY KEY,
+            partido_url TEXT NOT NULL,
+            Fecha TEXT,
+            Comp TEXT,
+            Ronda TEXT,
+            Equipo TEXT,
+            Adversario TEXT,
+            Resultado TEXT,
+            descargado_en TEXT,
+            lineas INTEGER
+        )
+    """)
+    # Qué jugadores seguidos tienen cada partido en su registro
+    conn.execute("""
+        CREATE TABLE IF NOT EXISTS jugadores_partido (
+            partido_id TEXT NOT NULL,
+            fbref_id TEXT NOT NULL,
+            PRIMARY KEY (partido_id, fbref_id)
+        )
+    """)
+    conn.execute("""
+        CREATE TABLE IF NOT EXISTS lineas_informe (
+            partido_id TEXT NOT NULL,
+            fbref_id TEXT NOT NULL,
+            equipo_id TEXT,
+            PRIMARY KEY (partido_id, fbref_id)
+        )
+    """)
+    conn.execute("CREATE INDEX IF NOT EXISTS idx_lineas_informe_jugador ON lineas_informe(fbref_id)")
+    conn.execute("CREATE INDEX IF NOT EXISTS idx_partidos_informes_pendientes "
+                 "ON partidos_informes(descargado_en, Fecha)")
+    conn.commit()
+    return conn
+
+# ---------------------------------------------------------------------------
+# TABLA DE PARTIDOS
+# ---------------------------------------------------------------------------
+def registrar_partidos(conn, tabla, fbref_id):
+    """Añade los partidos del registro de un jugador (parse_match_logs_rows);
+    los que ya estaban solo se enlazan al jugador. Devuelve los partidos nuevos."""
+    if tabla is None or 'partido_id' not in tabla.headers:
+        return 0
+    filas = []
+    for fila in (dict(zip(tabla.headers, row)) for row in tabla.rows):
+        if not fila['partido_id']:
+            continue   # encabezados repetidos y partidos sin informe
+        datos = [parse_fecha(fila.get('Fecha'))] + [fila.get(col) for col in COLUMNAS_PARTIDO[1:]]
+        filas.append([fila['partido_id'], fila['partido_url']] + datos)
+    antes = conn.total_changes
+    conn.executemany(
+        f"INSERT OR IGNORE INTO partidos_informes (partido_id, partido_url, {', '.join(COLUMNAS_PARTIDO)}) "
+        f"VALUES ({', '.join('?' * (len(COLUMNAS_PARTIDO) + 2))})", filas)
+    nuevos = conn.total_changes - antes
+    conn.executemany("INSERT OR IGNORE INTO jugadores_partido VALUES (?, ?)",
+                     [(fila[0], fbref_id) for fila in filas])
+    conn.commit()
+    return nuevos
+
+def completar_registro(conn, tabla, fbref_id):
+    """Añade al registro del jugador las columnas de lineas_informe que no
+    trae (Edad, estadísticas que solo da el informe...), con el valor de su
+    línea en los partidos cuyo informe ya se descargó y vacías en el resto.
+    Todas las filas del registro se conservan."""
+    if 'partido_id' not in tabla.headers:
+        return tabla
+    columnas = [col[1] for col in conn.execute('PRAGMA table_info("lineas_informe")')
+                if col[1] not in ('partido_id', 'fbref_id') and col[1] not in tabla.headers]
+    if not columnas:
+        return tabla
+    lista = ", ".join(f'"{col}"' for col in columnas)
+    lineas = {row[0]: ['' if valor is None else valor for valor in row[1:]] for row in conn.execute(
+        f'SELECT partido_id, {lista} FROM lineas_informe WHERE fbref_id = ?', (fbref_id,))}
+    partido = tabla.headers.index('partido_id')
+    vacia = [''] * len(columnas)
+    return TablaPartidos(tabla.headers + columnas,
+                         [row + lineas.get(row[partido], vacia) for row in tabla.rows])
+
+# ---------------------------------------------------------------------------
+# INFORMES
+# ---------------------------------------------------------------------------
+def _clave_jugador(fila):
+    return extract_player_id(fila.get('jugador_url'))
+
+def parse_informe(html, seguidos=None):
+    """[{columna: valor}] con la línea de cada jugador en el informe, más
+    'fbref_id' y 'equipo_id'. Por equipo se parte de la tabla resumen y se
+    le unen por jugador las demás tablas stats_<equipo>_* de la página
+    (pases, defensa, posesión...), también las comentadas.
+    seguidos: ids de fbref a conservar (todos si es None)."""
+    lineas = []
+    for table_id, equipo_id in RESUMEN_RE.findall(html):
+        tablas = extract_tables(html, rf'stats_{equipo_id}_\w+', links={'player': 'jugador_url'})
+        if table_id not in tablas:
+            continue
+        resumen = tablas.pop(table_id)
+        grupos = [None] + [tabla_id.removeprefix(f'stats_{equipo_id}_') for tabla_id in tablas]
+        headers, filas = join_tables([resumen, *tablas.values()], _clave_jugador, grupos,
+                                      COLUMNAS_FILA_JUGADOR)
+        for fila in filas:
+            linea = dict(zip(headers, fila))
+            fbref_id = extract_player_id(linea.pop('jugador_url'))
+            if fbref_id is None or (seguidos is not None and fbref_id not in seguidos):
+                continue
+            linea.update(fbref_id=fbref_id, equipo_id=equipo_id)
+            lineas.append(linea)
+    return lineas
+
+def guardar_lineas(conn, partido_id, lineas):
+    """Guarda las líneas de un informe; añade las columnas que falten"""
+    existentes = {col[1] for col in conn.execute('PRAGMA table_info("lineas_informe")')}
+    for linea in lineas:
+        for col in linea:
+            if col not in existentes:
+                conn.execute(f'ALTER TABLE lineas_informe ADD COLUMN "{col}" {tipo_columna(col) or "TEXT"}')
+                existentes.add(col)
+        lista = ", ".join(f'"{col}"' for col in ['partido_id'] + list(linea))
+        valores = [partido_id] + [convertir_valor(valor, tipo_columna(col) or 'TEXT')
+                                  for col, valor in linea.items()]
+        conn.execute(f'INSERT OR REPLACE INTO lineas_informe ({lista}) '
+                     f'VALUES ({", ".join("?" * len(valores))})', valores)
+
+def descargar_informes(conn, fetcher, seguidos, metricas, max_informes=None):
+    """Descarga una sola vez cada informe pendiente de los partidos que
+    jugadores_partido enlaza a MIN_SEGUIDOS o más jugadores y guarda las
+    líneas de los jugadores seguidos. max_informes: tope de informes (una
+    petición cada uno) por corrida; los demás quedan para la siguiente.
+    Devuelve (informes, líneas)."""
+    cola = deque(conn.execute("""
+        SELECT partido_id, partido_url FROM partidos_informes p
+        WHERE descargado_en IS NULL
+          AND (SELECT COUNT(*) FROM jugadores_partido j WHERE j.partido_id = p.partido_id) >= ?
+        ORDER BY Fecha DESC
+        LIMIT ?
+    """, (MIN_SEGUIDOS, -1 if max_informes is None else max_informes)).fetchall())
+    print(f"\n{len(cola)} informes de partido pendientes")
+    pospuestos = Counter()
+    informes = total_lineas = 0
+    while cola:
+        partido_id, url = cola.popleft()
+        try:
+            with metricas.etapa('informe', partido=partido_id) as evento:
+                html = fetcher.fetch_report_html(url)
+                evento['bytes'] = len(html) if html else 0
+        except DescargaPospuesta:
+            pospuestos[partido_id] += 1
+            if pospuestos[partido_id] <= REENCOLAR_MAX:
+                metricas.contar('pospuestos')
+                cola.append((partido_id, url))
+            else:
+                print(f"✖ Informe {partido_id} pospuesto demasiadas veces; queda pendiente")
+            continue
+        except CircuitoAbierto as e:
+            print(f"❌ {e}. Se detiene la descarga; los informes restantes quedan pendientes")
+            break
+        if html is None:
+            metricas.error('informe', 'sin_html', partido=partido_id)
+            print(f"✖ No se pudo descargar el informe {partido_id}")
+            continue
+        lineas = parse_informe(html, seguidos)
+        guardar_lineas(conn, partido_id, lineas)
+        conn.execute("UPDATE partidos_informes SET descargado_en = ?, lineas = ? WHERE partido_id = ?",
+                     (datetime.now(timezone.utc).isoformat(timespec='seconds'), len(lineas), partido_id))
+        conn.commit()
+        metricas.contar('lineas_informe', len(lineas))
+        informes += 1
+        total_lineas += len(lineas)
+    return informes, total_lineas
+
+# ---------------------------------------------------------------------------
+# CRAWL CENTRADO EN PARTIDOS
+# ---------------------------------------------------------------------------
+def crawl_partidos(csv_path=csv_path, num_players=10, db_path=db_path, fetcher=None,
+                   output_dir='partidos_data', metricas=None, solo_informes=False, max_informes=None):
+    """Registros de partidos de los primeros N jugadores del CSV y luego un
+    único informe por partido compartido.
+
+    Cada fila del registro aporta el id y la URL del informe; los partidos
+    van a la tabla partidos_informes sin repetirse aunque los jueguen varios
+    jugadores seguidos (todos los del CSV). El informe de los partidos con
+    MIN_SEGUIDOS o más jugadores seguidos se descarga una vez y se guarda en
+    lineas_informe la línea de cada jugador seguido que aparezca en él; los
+    de un solo jugador no se piden (costarían una petición por partido para
+    una fila que ya trae el registro). Los CSV se escriben al final con
+    todas las filas del registro y las columnas del informe añadidas
+    (completar_registro). solo_informes: omite los registros y descarga los
+    informes que quedaron pendientes. max_informes: ver descargar_informes.
+    """
+    roster = pd.read_csv(csv_path)
+    seguidos = {fbref_id for fbref_id in map(extract_player_id, roster['href']) if fbref_id}
+    players = list(zip(roster['nombre'].head(num_players), roster['href'].head(num_players)))
+
+    conn = abrir_base(db_path)
+    fetcher = fetcher or default_fetcher()
+    metricas = metricas or Metricas()
+    fetcher.usar_metricas(metricas)
+
+    ids = {name: extract_player_id(url) for name, url in players}
+    # Los CSV se escriben cuando ya están las líneas de los informes
+    registros = {}
+
+    def writer(tabla, name):
+        registrar_partidos(conn, tabla, ids[name])
+        registros[name] = tabla
+        return True
+
+    try:
+        cola = deque([] if solo_informes else players)
+        pospuestos = Counter()
+        detenido = False
+        while cola:
+            name, url = cola.popleft()
+            print(f"\n[{len(players) - len(cola)}/{len(players)}] Procesando {name}...")
+            try:
+                procesar_jugador(fetcher, writer, name, url, metricas)
+            except DescargaPospuesta:
+                pospuestos[url] += 1
+                if pospuestos[url] <= REENCOLAR_MAX:
+                    print(f"↻ {name} vuelve al final de la cola")
+                    metricas.contar('pospuestos')
+                    cola.append((name, url))
+                else:
+                    metricas.error('descarga', 'pospuesto', jugador=name)
+                    print(f"✖ {name} pospuesto demasiadas veces; queda sin registro")
+            except CircuitoAbierto as e:
+                print(f"❌ {e}. Se detiene el crawl")
+                detenido = True
+                break
+
+        informes = lineas = 0
+        if not detenido:
+            informes, lineas = descargar_informes(conn, fetcher, seguidos, metricas, max_informes)
+        for name, tabla in registros.items():
+            if not save_match_logs(completar_registro(conn, tabla, ids[name]), name, output_dir):
+                metricas.error('guardado', 'error_guardado', jugador=name)
+                print(f"✖ No se pudo guardar el CSV de {name}")
+    finally:
+        fetcher.close()
+        metricas.imprimir_resumen()
+        metricas.close()
+
+    partidos, pendientes = conn.execute(
+        "SELECT COUNT(*), COUNT(*) - COUNT(descargado_en) FROM partidos_informes").fetchone()
+    apariciones = conn.execute("SELECT COUNT(*) FROM jugadores_partido").fetchone()[0]
+    conn.close()
+    print(f"\n✔ {informes} informes descargados, {lineas} líneas de jugadores seguidos")
+    print(f"  {partidos} partidos distintos para {apariciones} filas de registros "
+          f"({apariciones - partidos} repetidos); {pendientes} sin informe descargado")
+    return informes, lineas
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Crawl centrado en partidos: cada informe se descarga una vez")
+    parser.add_argument('--csv', default=csv_path, help="CSV de jugadores (todos se consideran seguidos)")
+    parser.add_argument('--num', type=int, default=10, help="jugadores cuyos registros se descargan")
+    parser.add_argument('--db', default=db_path)
+    parser.add_argument('--salida', default='partidos_data', help="carpeta de los CSV de partidos")
+    parser.add_argument('--solo-informes', action='store_true',
+                        help="solo descarga los informes pendientes de corridas anteriores")
+    parser.add_argument('--max-informes', type=int, default=None,
+                        help="tope de informes por corrida (una petición cada uno); por defecto todos")
+    args = parser.parse_args()
+    crawl_partidos(args.csv, args.num, args.db, output_dir=args.salida, solo_informes=args.solo_informes,
+                   max_informes=args.max_informes)
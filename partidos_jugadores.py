@@ -1,100 +1,20 @@
-import pandas as pd
-import time
-from selenium import webdriver
-from selenium.webdriver.chrome.options import Options
-from selenium.webdriver.common.by import By
-from selenium.webdriver.support.ui import WebDriverWait
-from selenium.webdriver.support import expected_conditions as EC
-from bs4 import BeautifulSoup
 import re
 import os
-import unicodedata  # Importamos el módulo para normalización de strings
+from collections import Counter, deque
 
-def setup_driver():
-    """Configura y retorna el driver de Chrome"""
-    chrome_options = Options()
-    chrome_options.add_argument("--headless")
-    chrome_options.add_argument("--disable-gpu")
-    chrome_options.add_argument("--window-size=1920,1200")
-    chrome_options.add_argument("user-agent=Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36")
-    return webdriver.Chrome(options=chrome_options)
-
-def normalize_text(text):
-    """Normaliza texto para comparación insensible a mayúsculas/acentos"""
-    if not isinstance(text, str):
-        return ""
-    return unicodedata.normalize('NFKD', text.lower()).encode('ascii', errors='ignore').decode('utf-8')
+from fetchers import (
+    default_fetcher,
+    full_player_url,
+    get_match_logs_html,
+    parse_match_logs_html,
+)
+from indice_nombres import NameIndex
+from limitador import REENCOLAR_MAX, CircuitoAbierto, DescargaPospuesta
 
 def get_match_logs_table(driver, player_url):
     """Extrae la tabla de registro de partidos para un jugador"""
-    try:
-        driver.get(player_url)
-        time.sleep(3)
-
-        # Aplicar filtro "Todas las competencias"
-        try:
-            all_comp_btn = WebDriverWait(driver, 10).until(
-                EC.presence_of_element_located((By.XPATH, "//div[@class='filter']//a[contains(., 'Todas las competencias')]")))
-            
-            if "current" not in all_comp_btn.find_element(By.XPATH, "./..").get_attribute("class"):
-                driver.execute_script("arguments[0].click();", all_comp_btn)
-                time.sleep(3)
-        except Exception as e:
-            print(f"Error al aplicar filtro 'Todas las competencias': {e}")
-            return None
-
-        # Encontrar el enlace "Partidos"
-        try:
-            rows = driver.find_elements(By.CSS_SELECTOR, "table.stats_table tbody tr")
-            if not rows:
-                print("No se encontraron filas en la tabla")
-                return None
-            
-            last_row = rows[-1]
-            cells = last_row.find_elements(By.TAG_NAME, "td")
-            if not cells:
-                print("No se encontraron celdas en la última fila")
-                return None
-            
-            last_cell = cells[-1]
-            match_link = last_cell.find_element(By.TAG_NAME, "a")
-            match_url = match_link.get_attribute("href")
-            
-            if not match_url:
-                print("No se encontró enlace de Partidos")
-                return None
-            
-            # Ir a la URL de partidos
-            driver.get(match_url)
-            time.sleep(3)
-            
-            # Extraer la tabla de partidos
-            html = driver.page_source
-            soup = BeautifulSoup(html, 'html.parser')
-            table = soup.find('table', {'id': 'matchlogs_all'})
-            
-            if not table:
-                print("No se encontró la tabla de partidos")
-                return None
-            
-            # Procesar la tabla
-            headers = [th.text.strip() for th in table.find('thead').find_all('tr')[-1].find_all(['th', 'td'])]
-            data = []
-            
-            for row in table.find('tbody').find_all('tr'):
-                row_data = [cell.text.strip() for cell in row.find_all(['th', 'td'])]
-                if len(row_data) == len(headers):
-                    data.append(row_data)
-            
-            return pd.DataFrame(data, columns=headers) if data else None
-            
-        except Exception as e:
-            print(f"Error al encontrar/enlazar a partidos: {e}")
-            return None
-
-    except Exception as e:
-        print(f"Error general: {e}")
-        return None
+    html = get_match_logs_html(driver, player_url)
+    return parse_match_logs_html(html) if html is not None else None
 
 def save_match_logs(df, player_name, output_dir='partidos_data'):
     """Guarda la tabla de partidos en archivo CSV"""
@@ -113,26 +33,26 @@ def save_match_logs(df, player_name, output_dir='partidos_data'):
         return False
 
 def find_players_in_csv(csv_path, player_names):
-    """Busca los jugadores especificados en el CSV y devuelve sus datos"""
+    """Busca los jugadores especificados en el CSV y devuelve sus datos.
+
+    Usa el índice de nombres (indice_nombres.py), que se reconstruye solo
+    cuando cambia el CSV: coincidencia exacta, si no parcial y, como último
+    recurso, aproximada para tolerar errores de tipeo.
+    """
     try:
-        df = pd.read_csv(csv_path)
-        # Normalizar nombres en el DataFrame
-        df['nombre_normalizado'] = df['nombre'].apply(normalize_text)
+        index = NameIndex.load_or_build(csv_path)
         
+        lookups = index.lookup_many(player_names)
         found_players = []
         for name in player_names:
-            normalized_name = normalize_text(name)
-            # Buscar coincidencias exactas o parciales
-            player_data = df[df['nombre_normalizado'] == normalized_name]
-            
-            if player_data.empty:
-                # Si no hay coincidencia exacta, buscar parcial
-                player_data = df[df['nombre_normalizado'].str.contains(normalized_name, regex=False)]
-            
-            if not player_data.empty:
-                for _, row in player_data.iterrows():
-                    found_players.append((row['nombre'], row['href']))
-                    print(f"✔ Jugador encontrado: {row['nombre']}")
+            mode, matches = lookups[name]
+            if matches:
+                for nombre, href in matches:
+                    found_players.append((nombre, href))
+                    if mode == 'aproximada':
+                        print(f"✔ Jugador encontrado (aproximado): {nombre} para '{name}'")
+                    else:
+                        print(f"✔ Jugador encontrado: {nombre}")
             else:
                 print(f"⚠ Jugador no encontrado en el CSV: {name}")
         
@@ -142,8 +62,12 @@ def find_players_in_csv(csv_path, player_names):
         print(f"\nError al procesar el archivo CSV: {e}")
         return None
 
-def process_specific_players(csv_path, player_names):
-    """Procesa solo los jugadores especificados"""
+def process_specific_players(csv_path, player_names, fetcher=None):
+    """Procesa solo los jugadores especificados.
+
+    fetcher: backend de descarga (ver fetchers.py); por defecto HTTP directo
+    con Selenium como respaldo.
+    """
     if not player_names:
         print("No se proporcionaron nombres de jugadores")
         return False
@@ -154,14 +78,33 @@ def process_specific_players(csv_path, player_names):
         print("No se encontraron jugadores para procesar")
         return False
     
-    driver = setup_driver()
+    fetcher = fetcher or default_fetcher()
     results = []
     
-    for i, (name, url) in enumerate(players_data, 1):
-        print(f"\n[{i}/{len(players_data)}] Procesando {name}...")
-        full_url = f"https://fbref.com{url}" if not url.startswith('http') else url
+    # Sin pausas fijas: el gobernador del fetcher marca el ritmo (limitador.py)
+    cola = deque(players_data)
+    pospuestos = Counter()
+    i = 0
+    while cola:
+        name, url = cola.popleft()
+        i += 1
+        print(f"\n[{i}/{i + len(cola)}] Procesando {name}...")
+        full_url = full_player_url(url)
         
-        match_logs = get_match_logs_table(driver, full_url)
+        try:
+            match_logs = fetcher.get_match_logs_table(full_url)
+        except DescargaPospuesta:
+            pospuestos[url] += 1
+            if pospuestos[url] <= REENCOLAR_MAX:
+                print(f"↻ {name} vuelve al final de la cola")
+                cola.append((name, url))
+            else:
+                results.append((name, "Error al descargar"))
+            continue
+        except CircuitoAbierto as e:
+            print(f"❌ {e}. Se detiene la extracción")
+            results.extend((nombre, "Pendiente") for nombre, _ in [(name, url), *cola])
+            break
         if match_logs is not None:
             success = save_match_logs(match_logs, name)
             if success:
@@ -172,10 +115,8 @@ def process_specific_players(csv_path, player_names):
         else:
             results.append((name, "Error al extraer datos"))
             print(f"✖ No se pudieron extraer datos de partidos para {name}")
-        
-        time.sleep(2)
     
-    driver.quit()
+    fetcher.close()
     
     print("\nResumen de extracción:")
     for name, status in results:
@@ -0,0 +1,276 @@
+import argparse
+import csv
+import re
+import sqlite3
+from collections import namedtuple
+from datetime import date, datetime, timedelta
+
+import pandas as pd
+
+from actualizacion_incremental import FECHA_RE, nombre_clave
+from fetchers import extract_player_id
+from main import match_logs_filename
+
+# ---------------------------------------------------------------------------
+# CONFIGURACIÓN
+# ---------------------------------------------------------------------------
+csv_path = "jugadores_activos_colombianos.csv"
+db_path = "mi_base_de_datos.db"
+
+# Peticiones por corrida: una hora al ritmo que permite fbref (10 por minuto)
+PRESUPUESTO = 600
+# Peticiones que suele costar un jugador (la URL directa de partidos de la
+# temporada en curso y, a veces, la de la temporada anterior)
+PETICIONES_POR_JUGADOR = 2
+# Partidos por año que se suponen para un jugador sin historial
+PARTIDOS_POR_ANIO = 40
+# Días sin jugar antes de empezar a dudar de que el jugador siga activo
+DIAS_GRACIA = 30
+# Límites del intervalo entre revisiones de un mismo jugador
+DIAS_MIN = 1
+DIAS_MAX = 180
+# Espera antes de reintentar a un jugador cuyo refresco falló; se duplica
+# con cada fallo seguido (retirados, jugadores sin página de la temporada)
+DIAS_REINTENTO = 2
+
+Plan = namedtuple('Plan', 'nombre href prioridad vence_en ultima_fecha partidos_anio motivo')
+# Última revisión buena, último intento y fallos seguidos desde la buena
+Revision = namedtuple('Revision', 'exito intento fallos')
+
+# ---------------------------------------------------------------------------
+# DATOS DE CADA JUGADOR
+# ---------------------------------------------------------------------------
+def historial_db(conn, hoy):
+    """{nombre_completo: (última Fecha, partidos del último año)} desde partidos"""
+    desde = (hoy - timedelta(days=365)).isoformat()
+    try:
+        rows = conn.execute("""
+            SELECT j.nombre_completo, MAX(p."Fecha"), SUM(p."Fecha" >= ?)
+            FROM partidos p JOIN jugadores j ON j.jugador_id = p.jugador_id
+            WHERE p."Fecha" GLOB '[0-9][0-9][0-9][0-9]-[0-9][0-9]-[0-9][0-9]'
+            GROUP BY j.nombre_completo
+        """, (desde,)).fetchall()
+    except sqlite3.Error:
+        return {}
+    return {nombre: (ultima, recientes or 0) for nombre, ultima, recientes in rows}
+
+def historial_csv(filename, hoy):
+    """(última Fecha, partidos del último año) de un CSV de partidos, o None"""
+    try:
+        with open(filename, newline='', encoding='utf-8-sig') as f:
+            fechas = [fecha for fecha in (row.get('Fecha', '') for row in csv.DictReader(f))
+                      if FECHA_RE.match(fecha)]
+    except OSError:
+        return None
+    if not fechas:
+        return None
+    desde = (hoy - timedelta(days=365)).isoformat()
+    return max(fechas), sum(fecha >= desde for fecha in fechas)
+
+def preparar_revisiones(conn):
+    conn.execute("""
+        CREATE TABLE IF NOT EXISTS refresco_revisiones (
+            href TEXT PRIMARY KEY,
+            ultimo_exito TEXT,
+            ultimo_intento TEXT NOT NULL,
+            fallos INTEGER NOT NULL DEFAULT 0
+        )
+    """)
+
+def _fecha_hora(ts):
+    return datetime.fromisoformat(ts) if ts else None
+
+def revisiones(conn):
+    """{href: Revision} de refresco_revisiones (la llena refrescar_programado)
+    y, para lo que no esté ahí o sea más reciente, de los 'hecho' del diario
+    del crawl (crawls completos de main.py)"""
+    revisados = {}
+    try:
+        for href, exito, intento, fallos in conn.execute(
+                "SELECT href, ultimo_exito, ultimo_intento, fallos FROM refresco_revisiones"):
+            revisados[href] = Revision(_fecha_hora(exito), _fecha_hora(intento), fallos)
+    except sqlite3.Error:
+        pass
+    try:
+        rows = conn.execute(
+            "SELECT href, actualizado_en FROM crawl_journal WHERE estado = 'hecho'").fetchall()
+    except sqlite3.Error:
+        rows = []
+    for href, ts in rows:
+        hecho = _fecha_hora(ts)
+        previa = revisados.get(href)
+        if hecho and (previa is None or previa.intento is None or hecho > previa.intento):
+            revisados[href] = Revision(hecho, hecho, 0)
+    return revisados
+
+def registrar_resultados(conn, players, results, ahora):
+    """Guarda en refresco_revisiones el resultado de cada jugador refrescado;
+    los que quedaron 'Pendiente' (circuito abierto) no cuentan como intento"""
+    from crawl_journal import EXITO
+
+    preparar_revisiones(conn)
+    ts = ahora.isoformat(timespec='seconds')
+    for (_, href), (_, status) in zip(players, results):
+        if status == "Pendiente":
+            continue
+        exito = status == EXITO
+        conn.execute("""
+            INSERT INTO refresco_revisiones (href, ultimo_exito, ultimo_intento, fallos)
+            VALUES (?, ?, ?, ?)
+            ON CONFLICT(href) DO UPDATE SET
+                ultimo_exito = COALESCE(excluded.ultimo_exito, ultimo_exito),
+                ultimo_intento = excluded.ultimo_intento,
+                fallos = CASE WHEN excluded.fallos = 0 THEN 0 ELSE fallos + 1 END
+        """, (href, ts if exito else None, ts, 0 if exito else 1))
+    conn.commit()
+
+def fin_anios(anios):
+    """Último año de actividad de 'anios' del directorio ('2012-2024'), o None"""
+    anios_validos = re.findall(r'\d{4}', anios) if isinstance(anios, str) else []
+    return int(anios_validos[-1]) if anios_validos else None
+
+def anios_roster(roster, conn):
+    """{href: último año activo}: columna anios del CSV o, si no está, la
+    tabla roster que llena roster_crawler.py"""
+    if 'anios' in roster.columns:
+        return {href: fin_anios(anios) for href, anios in zip(roster['href'], roster['anios'])}
+    try:
+        rows = dict(conn.execute("SELECT fbref_id, anios FROM roster").fetchall())
+    except sqlite3.Error:
+        return {}
+    return {href: fin_anios(rows.get(extract_player_id(href))) for href in roster['href']}
+
+# ---------------------------------------------------------------------------
+# PRIORIDAD Y VENCIMIENTO
+# ---------------------------------------------------------------------------
+def planificar_jugador(nombre, href, historial, revision, fin, ahora):
+    """Plan de un jugador.
+
+    La tasa de partidos sale del último año (o PARTIDOS_POR_ANIO sin
+    historial) y se rebaja si lleva más de DIAS_GRACIA sin jugar o si el
+    directorio dice que dejó de jugar antes del año pasado. La revisión
+    vence cuando ya se espera al menos un partido nuevo desde la última
+    buena; la prioridad son los partidos nuevos esperados. revision:
+    Revision o None; con fallos seguidos vence tras DIAS_REINTENTO,
+    duplicado por fallo, y la prioridad se divide entre 1 + fallos.
+    """
+    hoy = ahora.date()
+    ultima_fecha, partidos_anio = historial or (None, 0)
+    if historial is None:
+        tasa, motivo = PARTIDOS_POR_ANIO / 365, 'sin historial'
+    else:
+        tasa, motivo = max(partidos_anio, 1) / 365, 'activo'
+        dias_sin_jugar = (hoy - date.fromisoformat(ultima_fecha)).days
+        if dias_sin_jugar > DIAS_GRACIA:
+            tasa /= 1 + (dias_sin_jugar - DIAS_GRACIA) / 60
+            motivo = f"{dias_sin_jugar} días sin jugar"
+    if fin is not None and fin < hoy.year - 1:
+        tasa *= 0.1
+        motivo = f"retirado en {fin}"
+
+    intervalo = min(DIAS_MAX, max(DIAS_MIN, 1 / tasa))
+    exito = revision.exito if revision is not None else None
+    if exito is None:
+        vence_en = ahora
+        prioridad = tasa * DIAS_MAX
+        motivo = f"nunca revisado ({motivo})"
+    else:
+        vence_en = exito + timedelta(days=intervalo)
+        prioridad = tasa * (ahora - exito).total_seconds() / 86400
+    if revision is not None and revision.fallos:
+        # Tras un fallo se espera (con back-off) y la prioridad se reparte
+        # entre los intentos: un jugador que siempre falla no gasta el presupuesto
+        espera = min(DIAS_MAX, DIAS_REINTENTO * 2 ** (revision.fallos - 1))
+        vence_en = max(vence_en, revision.intento + timedelta(days=espera))
+        prioridad /= 1 + revision.fallos
+        motivo = f"{motivo}, {revision.fallos} fallos seguidos"
+    return Plan(nombre, href, prioridad, vence_en, ultima_fecha, partidos_anio, motivo)
+
+def planificar(csv_path=csv_path, db_path=db_path, output_dir='partidos_data', ahora=None):
+    """Plan de todos los jugadores del CSV, los vencidos primero y por prioridad"""
+    ahora = ahora or datetime.now()
+    roster = pd.read_csv(csv_path)
+    conn = sqlite3.connect(db_path)
+    try:
+        historiales = historial_db(conn, ahora.date())
+        revisados = revisiones(conn)
+        fines = anios_roster(roster, conn)
+    finally:
+        conn.close()
+
+    planes = []
+    for nombre, href in zip(roster['nombre'], roster['href']):
+        historial = historiales.get(nombre_clave(nombre))
+        if historial is None:
+            historial = historial_csv(match_logs_filename(nombre, output_dir), ahora.date())
+        planes.append(planificar_jugador(nombre, href, historial, revisados.get(href), fines.get(href), ahora))
+    planes.sort(key=lambda plan: (plan.vence_en > ahora, -plan.prioridad))
+    return planes
+
+def seleccionar(planes, presupuesto=PRESUPUESTO, peticiones_por_jugador=PETICIONES_POR_JUGADOR, ahora=None):
+    """Los jugadores vencidos de más prioridad que caben en el presupuesto"""
+    ahora = ahora or datetime.now()
+    cupo = max(0, presupuesto // peticiones_por_jugador)
+    return [plan for plan in planes if plan.vence_en <= ahora][:cupo]
+
+def imprimir_plan(planes, seleccionados, ahora, limite=20):
+    vencidos = sum(plan.vence_en <= ahora for plan in planes)
+    print(f"{len(planes)} jugadores, {vencidos} con revisión vencida, {len(seleccionados)} entran en el presupuesto")
+    for plan in seleccionados[:limite]:
+        print(f"  {plan.prioridad:6.2f}  {plan.nombre:<30} última {plan.ultima_fecha or '-':<10}  "
+              f"{plan.partidos_anio:3d} en el año  {plan.motivo}")
+    if len(seleccionados) > limite:
+        print(f"  ... y {len(seleccionados) - limite} más")
+    siguiente = min((plan.vence_en for plan in planes if plan.vence_en > ahora), default=None)
+    if siguiente is not None:
+        print(f"Próxima revisión que vence: {siguiente:%Y-%m-%d %H:%M}")
+
+# ---------------------------------------------------------------------------
+# CORRIDA PROGRAMADA
+# ---------------------------------------------------------------------------
+def refrescar_programado(csv_path=csv_path, db_path=db_path, output_dir='partidos_data',
+                         presupuesto=PRESUPUESTO, peticiones_por_jugador=PETICIONES_POR_JUGADOR,
+                         concurrency=8, fetcher=None, solo_plan=False):
+    """Refresca (actualizacion_incremental.py) los jugadores vencidos de más
+    prioridad que caben en el presupuesto de peticiones de la corrida.
+
+    Cada resultado, bueno o fallido, queda en refresco_revisiones, de donde
+    salen la última revisión y los fallos seguidos para la siguiente corrida.
+    """
+    from actualizacion_incremental import refrescar_jugadores
+    from crawl_journal import CrawlJournal
+
+    ahora = datetime.now()
+    planes = planificar(csv_path, db_path, output_dir, ahora)
+    seleccionados = seleccionar(planes, presupuesto, peticiones_por_jugador, ahora)
+    imprimir_plan(planes, seleccionados, ahora)
+    if solo_plan or not seleccionados:
+        return []
+
+    players = [(plan.nombre, plan.href) for plan in seleccionados]
+    journal = CrawlJournal(db_path)
+    journal.prepare(players)
+    try:
+        results = refrescar_jugadores(csv_path, db_path=db_path, output_dir=output_dir, concurrency=concurrency,
+                                      fetcher=fetcher, players=players, journal=journal)
+    finally:
+        journal.close()
+    conn = sqlite3.connect(db_path)
+    try:
+        registrar_resultados(conn, players, results, datetime.now())
+    finally:
+        conn.close()
+    return results
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Refresca primero a los jugadores con más probabilidad de datos nuevos")
+    parser.add_argument('--csv', default=csv_path)
+    parser.add_argument('--db', default=db_path)
+    parser.add_argument('--presupuesto', type=int, default=PRESUPUESTO, help="peticiones de esta corrida")
+    parser.add_argument('--peticiones-por-jugador', type=int, default=PETICIONES_POR_JUGADOR)
+    parser.add_argument('--concurrencia', type=int, default=8)
+    parser.add_argument('--plan', action='store_true', help="solo muestra el plan, sin descargar")
+    args = parser.parse_args()
+    refrescar_programado(args.csv, args.db, presupuesto=args.presupuesto,
+                         peticiones_por_jugador=args.peticiones_por_jugador,
+                         concurrency=args.concurrencia, solo_plan=args.plan)
@@ -0,0 +1,236 @@
+import csv
+import queue
+import sqlite3
+import threading
+import time
+from collections import namedtuple
+from concurrent.futures import ThreadPoolExecutor
+from html.parser import HTMLParser
+
+import requests
+
+from fetchers import FBREF_BASE_URL, HttpFetcher, extract_player_id
+from limitador import DescargaPospuesta, pagina_bloqueada, segundos_retry_after
+
+# Códigos de país de fbref -> nombre usado en la URL del directorio
+PAISES = {
+    'COL': 'Colombia',
+    'ARG': 'Argentina',
+    'BRA': 'Brazil',
+    'ECU': 'Ecuador',
+    'PER': 'Peru',
+    'URU': 'Uruguay',
+    'VEN': 'Venezuela',
+    'CHI': 'Chile',
+    'PAR': 'Paraguay',
+    'BOL': 'Bolivia',
+    'MEX': 'Mexico',
+}
+
+Jugador = namedtuple('Jugador', 'nombre href fbref_id anios posiciones clubes activo pais')
+CAMPOS_CSV = ['nombre', 'href', 'fbref_id', 'anios', 'posiciones', 'clubes', 'pais']
+
+def roster_url(pais, base_url=FBREF_BASE_URL):
+    """URL del directorio de jugadores de un país"""
+    return f"{base_url}/es/country/jugadores/{pais}/{PAISES.get(pais, pais)}-Jugadores-de-futbol"
+
+# ---------------------------------------------------------------------------
+# PARSEO INCREMENTAL DEL DIRECTORIO
+# ---------------------------------------------------------------------------
+class _RosterParser(HTMLParser):
+    """Lee entradas '<p><a href=...>[<strong>]Nombre[</strong>]</a> años · pos · clubes</p>'
+
+    Se alimenta por trozos; cada entrada completa queda en self.ready.
+    """
+
+    def __init__(self, pais):
+        super().__init__(convert_charrefs=True)
+        self.pais = pais
+        self.ready = []
+        self._reset()
+
+    def _reset(self):
+        self.in_p = False
+        self.in_a = False
+        self.href = None
+        self.activo = False
+        self.nombre = []
+        self.resto = []
+
+    def handle_starttag(self, tag, attrs):
+        if tag == 'p':
+            # Un <p> sin cerrar termina donde empieza el siguiente
+            if self.in_p:
+                self._emit()
+            self._reset()
+            self.in_p = True
+        elif tag == 'a' and self.in_p and self.href is None:
+            self.href = dict(attrs).get('href')
+            self.in_a = True
+        elif tag == 'strong' and self.in_a:
+            self.activo = True
+
+    def handle_endtag(self, tag):
+        if tag == 'a':
+            self.in_a = False
+        elif tag == 'p' and self.in_p:
+            self._emit()
+            self._reset()
+
+    def handle_data(self, data):
+        if not self.in_p:
+            return
+        (self.nombre if self.in_a else self.resto).append(data)
+
+    def _emit(self):
+        fbref_id = extract_player_id(self.href)
+        if not fbref_id:
+            return
+        partes = [parte.strip() for parte in ''.join(self.resto).replace('\xa0', ' ').split('·')]
+        partes += [''] * (3 - len(partes))
+        href = self.href if self.href.startswith('http') else FBREF_BASE_URL + self.href
+        self.ready.append(Jugador(
+            nombre=''.join(self.nombre).strip(), href=href, fbref_id=fbref_id,
+            anios=partes[0], posiciones=partes[1], clubes=partes[2],
+            activo=self.activo, pais=self.pais))
+
+def parse_roster(chunks, pais='COL'):
+    """Genera los jugadores de un directorio a medida que llegan los trozos de HTML"""
+    parser = _RosterParser(pais)
+    for chunk in chunks:
+        parser.feed(chunk)
+        if parser.ready:
+            yield from parser.ready
+            parser.ready.clear()
+    parser.close()
+    if parser.in_p:
+        parser._emit()
+    yield from parser.ready
+
+# ---------------------------------------------------------------------------
+# DESCARGA CONCURRENTE
+# ---------------------------------------------------------------------------
+def _stream_chunks(fetcher, url, chunk_size=64 * 1024):
+    # También pasa por el gobernador del fetcher; un directorio bloqueado o
+    # que falla se pospone entero (DescargaPospuesta), sin reintentos
+    fetcher.gobernador.adquirir(url)
+    inicio = time.perf_counter()
+    try:
+        response = fetcher.session.get(url, timeout=fetcher.timeout, stream=True)
+    except requests.RequestException as e:
+        fetcher.gobernador.registrar(url)
+        raise DescargaPospuesta(f"error de red: {e}: {url}")
+    try:
+        response.encoding = response.encoding if 'charset' in response.headers.get('Content-Type', '') else 'utf-8'
+        trozos = response.iter_content(chunk_size=chunk_size, decode_unicode=True)
+        # Las páginas de bloqueo son cortas: basta el primer trozo para reconocerlas
+        try:
+            primero = next(trozos, '') if response.status_code == 200 else ''
+        except requests.RequestException as e:
+            fetcher.gobernador.registrar(url)
+            raise DescargaPospuesta(f"error de red: {e}: {url}")
+        bloqueada = pagina_bloqueada(response.status_code, primero)
+        resultado = fetcher.gobernador.registrar(
+            url, response.status_code, time.perf_counter() - inicio,
+            segundos_retry_after(response.headers.get('Retry-After')), bloqueada)
+        if resultado != 'ok':
+            motivo = "página de bloqueo" if bloqueada else f"respuesta {response.status_code}"
+            print(f"⚠ Descarga pospuesta ({motivo}): {url}")
+            raise DescargaPospuesta(f"{motivo}: {url}")
+        response.raise_for_status()
+        yield primero
+        yield from trozos
+    finally:
+        response.close()
+
+_FIN = object()
+
+def crawl_rosters(paises=('COL',), solo_activos=True, base_url=FBREF_BASE_URL,
+                  max_workers=4, buffer_size=1000):
+    """Genera los jugadores de varios países descargando los directorios en paralelo.
+
+    Cada directorio se parsea mientras se descarga y los jugadores pasan
+    por una cola acotada, así que la memoria no crece con el número de
+    países: si el consumidor va lento, las descargas esperan.
+    """
+    fetcher = HttpFetcher(base_url=base_url, pool_size=max_workers)
+    salida = queue.Queue(maxsize=buffer_size)
+    cancelado = threading.Event()
+
+    def trabajador(pais):
+        try:
+            url = fetcher._local_url(roster_url(pais))
+            for jugador in parse_roster(_stream_chunks(fetcher, url), pais):
+                if cancelado.is_set():
+                    return
+                if jugador.activo or not solo_activos:
+                    salida.put(jugador)
+        except Exception as e:
+            print(f"Error descargando el directorio de {pais}: {e}")
+        finally:
+            salida.put(_FIN)
+
+    executor = ThreadPoolExecutor(max_workers=max_workers)
+    for pais in paises:
+        executor.submit(trabajador, pais)
+    pendientes = len(paises)
+    try:
+        while pendientes:
+            item = salida.get()
+            if item is _FIN:
+                pendientes -= 1
+            else:
+                yield item
+    finally:
+        cancelado.set()
+        # Vaciar la cola para que ningún trabajador quede bloqueado en put()
+        while pendientes:
+            if salida.get() is _FIN:
+                pendientes -= 1
+        executor.shutdown()
+        fetcher.close()
+
+# ---------------------------------------------------------------------------
+# SALIDAS
+# ---------------------------------------------------------------------------
+def escribir_csv(jugadores, csv_path='jugadores_activos_colombianos.csv'):
+    """Escribe los jugadores fila a fila; devuelve cuántos se escribieron"""
+    total = 0
+    with open(csv_path, 'w', newline='', encoding='utf-8') as f:
+        writer = csv.writer(f)
+        writer.writerow(CAMPOS_CSV)
+        for jugador in jugadores:
+            writer.writerow([getattr(jugador, campo) for campo in CAMPOS_CSV])
+            total += 1
+    return total
+
+def escribir_db(jugadores, db_path='mi_base_de_datos.db', lote=500):
+    """Inserta o actualiza los jugadores en la tabla roster, en lotes"""
+    conn = sqlite3.connect(db_path)
+    conn.execute("""
+        CREATE TABLE IF NOT EXISTS roster (
+            fbref_id TEXT PRIMARY KEY,
+            nombre TEXT,
+            href TEXT,
+            anios TEXT,
+            posiciones TEXT,
+            clubes TEXT,
+            activo INTEGER,
+            pais TEXT
+        )
+    """)
+    sql = "INSERT OR REPLACE INTO roster VALUES (?, ?, ?, ?, ?, ?, ?, ?)"
+    total = 0
+    buffer = []
+    for jugador in jugadores:
+        buffer.append((jugador.fbref_id, jugador.nombre, jugador.href, jugador.anios,
+                       jugador.posiciones, jugador.clubes, int(jugador.activo), jugador.pais))
+        if len(buffer) >= lote:
+            conn.executemany(sql, buffer)
+            conn.commit()
+            total += len(buffer)
+            buffer.clear()
+    conn.executemany(sql, buffer)
+    conn.commit()
+    conn.close()
+    return total + len(buffer)
@@ -0,0 +1,243 @@
+import re
+from html.parser import HTMLParser
+
+try:
+    import lxml.html
+except ImportError:  # sin lxml se usa el tokenizador de la librería estándar
+    lxml = None
+
+# ---------------------------------------------------------------------------
+# LOCALIZAR LA TABLA SIN PARSEAR LA PÁGINA
+# ---------------------------------------------------------------------------
+TABLE_ID_RE = re.compile(r'<table\b[^>]*\bid\s*=\s*["\']?([^"\'\s/>]+)', re.I)
+
+def _in_comment(html, start):
+    comment = html.rfind('<!--', 0, start)
+    return comment != -1 and html.find('-->', comment, start) == -1
+
+def slice_table(html, table_id, comments=False):
+    """Devuelve solo el fragmento '<table id=...>...</table>' de la página.
+
+    Igual que BeautifulSoup, ignora las tablas que están dentro de un
+    comentario HTML (fbref oculta así algunas tablas secundarias), salvo
+    con comments=True.
+    """
+    pattern = re.compile(r'<table\b[^>]*\bid\s*=\s*["\']?' + re.escape(table_id) + r'["\'\s/>]', re.I)
+    for match in pattern.finditer(html):
+        start = match.start()
+        if not comments and _in_comment(html, start):
+            continue
+        end = html.find('</table>', start)
+        if end == -1:
+            return html[start:]
+        return html[start:end + len('</table>')]
+    return None
+
+def table_ids(html, pattern=None):
+    """ids de las tablas de la página en orden, también las comentadas;
+    pattern: regex que debe cumplir el id completo"""
+    ids = []
+    for match in TABLE_ID_RE.finditer(html):
+        table_id = match.group(1)
+        if table_id not in ids and (pattern is None or re.fullmatch(pattern, table_id)):
+            ids.append(table_id)
+    return ids
+
+# ---------------------------------------------------------------------------
+# BACKENDS: cada uno devuelve (headers, filas) o None
+# ---------------------------------------------------------------------------
+# links: {data-stat: columna}. Por cada una se añade al final de cada fila el
+# href del primer enlace de la celda con ese data-stat ('' si no hay).
+def _rows_bs4(html, table_id, links=None):
+    """Implementación original: árbol completo con html.parser"""
+    from bs4 import BeautifulSoup
+
+    soup = BeautifulSoup(html, 'html.parser')
+    table = soup.find('table', {'id': table_id})
+    if not table:
+        return None
+    headers = [th.text.strip() for th in table.find('thead').find_all('tr')[-1].find_all(['th', 'td'])]
+    rows = []
+    for row in table.find('tbody').find_all('tr'):
+        cells = row.find_all(['th', 'td'])
+        values = [cell.text.strip() for cell in cells]
+        for stat in links or ():
+            link = next((cell.find('a') for cell in cells if cell.get('data-stat') == stat), None)
+            values.append(link.get('href', '') if link else '')
+        rows.append(values)
+    return headers + list((links or {}).values()), rows
+
+def _rows_lxml(html, table_id, links=None):
+    """lxml (C) sobre el fragmento de la tabla, texto de celdas vía XPath"""
+    fragment = slice_table(html, table_id)
+    if fragment is None:
+        return None
+    table = lxml.html.fragment_fromstring(fragment)
+    header_rows = table.xpath('./thead//tr')
+    if not header_rows:
+        return None
+    headers = [cell.text_content().strip() for cell in header_rows[-1].xpath('.//th|.//td')]
+    rows = []
+    for row in table.xpath('./tbody//tr'):
+        cells = row.xpath('.//th|.//td')
+        values = [cell.text_content().strip() for cell in cells]
+        for stat in links or ():
+            hrefs = row.xpath(f'./*[@data-stat="{stat}"]//a/@href')
+            values.append(hrefs[0] if hrefs else '')
+        rows.append(values)
+    return headers + list((links or {}).values()), rows
+
+class _TableTokenizer(HTMLParser):
+    """Tokenizador que solo guarda el texto de las celdas de thead y tbody
+    (y los enlaces de las celdas cuyo data-stat esté en links)"""
+
+    def __init__(self, links=None):
+        super().__init__(convert_charrefs=True)
+        self.links = links or {}
+        self.section = None
+        self.thead_rows = []
+        self.tbody_rows = []
+        self.tbody_links = []
+        self.row = None
+        self.row_links = None
+        self.cell = None
+        self.cell_stat = None
+
+    def handle_starttag(self, tag, attrs):
+        if tag in ('thead', 'tbody'):
+            self.section = tag
+        elif tag == 'tr' and self.section:
+            self.row = []
+            self.row_links = {}
+            (self.thead_rows if self.section == 'thead' else self.tbody_rows).append(self.row)
+            if self.section == 'tbody':
+                self.tbody_links.append(self.row_links)
+        elif tag in ('th', 'td') and self.row is not None:
+            self.cell = []
+            self.row.append(self.cell)
+            self.cell_stat = dict(attrs).get('data-stat') if self.links else None
+        elif tag == 'a' and self.cell_stat in self.links and self.cell_stat not in self.row_links:
+            self.row_links[self.cell_stat] = dict(attrs).get('href') or ''
+
+    def handle_endtag(self, tag):
+        if tag in ('th', 'td'):
+            self.cell = None
+            self.cell_stat = None
+        elif tag == 'tr':
+            self.row = None
+        elif tag in ('thead', 'tbody'):
+            self.section = None
+
+    def handle_data(self, data):
+        if self.cell is not None:
+            self.cell.append(data)
+
+def _rows_stream(html, table_id, links=None):
+    """html.parser de la librería estándar, alimentado solo con la tabla"""
+    fragment = slice_table(html, table_id)
+    if fragment is None:
+        return None
+    tokenizer = _TableTokenizer(links)
+    tokenizer.feed(fragment)
+    tokenizer.close()
+    if not tokenizer.thead_rows:
+        return None
+    headers = [''.join(cell).strip() for cell in tokenizer.thead_rows[-1]]
+    rows = [[''.join(cell).strip() for cell in row] + [row_links.get(stat, '') for stat in links or ()]
+            for row, row_links in zip(tokenizer.tbody_rows, tokenizer.tbody_links)]
+    return headers + list((links or {}).values()), rows
+
+PARSERS = {
+    'bs4': _rows_bs4,
+    'stream': _rows_stream,
+}
+if lxml is not None:
+    PARSERS['lxml'] = _rows_lxml
+
+DEFAULT_PARSER = 'lxml' if lxml is not None else 'stream'
+
+def extract_table(html, table_id='matchlogs_all', parser=None, links=None):
+    """(headers, filas) de la tabla, conservando solo filas con tantas celdas
+    como encabezados. None si la tabla no está en la página.
+
+    links: {data-stat: columna} para añadir como columnas los href de esas
+    celdas (p. ej. {'match_report': 'partido_url'}).
+    """
+    result = PARSERS[parser or DEFAULT_PARSER](html, table_id, links)
+    if result is None:
+        return None
+    headers, rows = result
+    return headers, [row for row in rows if len(row) == len(headers)]
+
+def extract_tables(html, pattern, parser=None, links=None):
+    """{id: (headers, filas)} de todas las tablas cuyo id cumple pattern,
+    incluidas las que fbref deja dentro de comentarios HTML, con una sola
+    descarga de la página"""
+    tables = {}
+    for table_id in table_ids(html, pattern):
+        fragment = slice_table(html, table_id) or slice_table(html, table_id, comments=True)
+        result = extract_table(fragment, table_id, parser, links) if fragment else None
+        if result is not None:
+            tables[table_id] = result
+    return tables
+
+def unique_headers(headers):
+    """Renombra los encabezados repetidos como read_csv ('Cmp', 'Cmp.1', ...)"""
+    seen = {}
+    unique = []
+    for col in headers:
+        name = col
+        while name in seen:
+            seen[col] += 1
+            name = f"{col}.{seen[col]}"
+        seen[name] = 0
+        unique.append(name)
+    return unique
+
+def join_tables(tables, key, grupos=None, comunes=()):
+    """Une varias (headers, filas) en una fila ancha por cada fila de la primera.
+
+    key(fila como dict) devuelve la clave de unión, o None para filas que no
+    se unen (encabezados repetidos). De las demás tablas se añaden todas las
+    columnas salvo las de comunes (las que identifican la fila y se repiten
+    en cada tabla: fecha, rival, minutos, enlace...), siempre con el grupo
+    de su tabla delante ('passing_Cmp', 'passing_Cmp.1', 'defense_Att'),
+    así que las columnas no dependen de los valores de cada página. Las
+    tablas sin columnas que no estén ya en la primera se omiten. Sus filas
+    sin pareja en la primera se descartan.
+    grupos: nombre de cada tabla, en el mismo orden (el de la primera no se usa).
+    """
+    (headers, rows), *others = tables
+    headers = unique_headers(headers)
+    grupos = grupos or [None] * len(tables)
+    extra_headers = []
+    extra = {}
+    for (other_headers, other_rows), grupo in zip(others, grupos[1:]):
+        other_headers = unique_headers(other_headers)
+        if set(other_headers) <= set(headers):
+            continue   # la misma tabla que la primera (p. ej. filtrada por competición)
+        new = [i for i, col in enumerate(other_headers) if col not in comunes]
+        if not new:
+            continue
+        offset = len(extra_headers)
+        for i in new:
+            name = base = f"{grupo}_{other_headers[i]}" if grupo else other_headers[i]
+            n = 0
+            while name in headers or name in extra_headers:
+                n += 1
+                name = f"{base}.{n}"
+            extra_headers.append(name)
+        for row in other_rows:
+            row_key = key(dict(zip(other_headers, row)))
+            if row_key is None:
+                continue
+            values = extra.setdefault(row_key, {})
+            for j, i in enumerate(new):
+                values.setdefault(offset + j, row[i])
+    if not extra_headers:
+        return headers, rows
+    joined = []
+    for row in rows:
+        values = extra.get(key(dict(zip(headers, row))), {})
+        joined.append(row + [values.get(j, '') for j in range(len(extra_headers))])
+    return headers + extra_headers, joined
@@ -1,63 +1,182 @@
+import argparse
 import sqlite3
-import re
-from collections import defaultdict
 
-def crear_tabla_partidos():
-    conn = sqlite3.connect('mi_base_de_datos.db')
+from esquema_partidos import crear_indices
+
+# ---------------------------------------------------------------------------
+# REGISTRO DE ESQUEMA Y DE FUENTES
+# ---------------------------------------------------------------------------
+# partidos_esquema: columnas conocidas de 'partidos' y su tipo.
+# partidos_fuentes: por cada tabla *_partidos, un contador de cambios que
+# mantienen sus triggers, la versión ya copiada y el CREATE TABLE con el que
+# se copió. Si la versión, el esquema o los triggers no cuadran, la tabla
+# se vuelve a copiar; si no, se deja como está.
+def preparar_registro(conn):
+    conn.execute("""
+        CREATE TABLE IF NOT EXISTS partidos_esquema (
+            columna TEXT PRIMARY KEY,
+            tipo TEXT
+        )
+    """)
+    conn.execute("""
+        CREATE TABLE IF NOT EXISTS partidos_fuentes (
+            tabla TEXT PRIMARY KEY,
+            version INTEGER NOT NULL DEFAULT 0,
+            version_copiada INTEGER,
+            esquema TEXT,
+            filas INTEGER
+        )
+    """)
+
+def _q(nombre):
+    return '"' + nombre.replace('"', '""') + '"'
+
+def nombres_triggers(tabla):
+    return [f"trg_{tabla}_{evento}" for evento in ('ins', 'upd', 'del')]
+
+def instalar_triggers(conn, tabla):
+    """Cada INSERT/UPDATE/DELETE en la tabla del jugador suma 1 a su versión"""
+    literal = "'" + tabla.replace("'", "''") + "'"
+    for nombre, evento in zip(nombres_triggers(tabla), ('INSERT', 'UPDATE', 'DELETE')):
+        conn.execute(f"""
+            CREATE TRIGGER IF NOT EXISTS {_q(nombre)} AFTER {evento} ON {_q(tabla)}
+            BEGIN
+                UPDATE partidos_fuentes SET version = version + 1 WHERE tabla = {literal};
+            END
+        """)
+
+def _reiniciar_partidos(conn):
+    """Tabla vacía con la columna fuente y registro a cero (primera vez, o
+    si otro script recreó 'partidos' por su cuenta)"""
+    conn.execute("DROP TABLE IF EXISTS partidos")
+    conn.execute('CREATE TABLE partidos ("fuente" TEXT)')
+    conn.execute("DELETE FROM partidos_esquema")
+    conn.execute("UPDATE partidos_fuentes SET version_copiada = NULL, esquema = NULL, filas = NULL")
+
+def _ensanchar_a_texto(conn, columnas):
+    """Redeclara esas columnas de 'partidos' como TEXT. SQLite no cambia el
+    tipo de una columna: se copia la tabla a una nueva y se reemplaza (los
+    índices se recrean al final de la unión)"""
+    actuales = [(col[1], col[2]) for col in conn.execute("PRAGMA table_info(partidos)")]
+    definicion = ", ".join(f"{_q(nombre)} {'TEXT' if nombre in columnas else tipo}" for nombre, tipo in actuales)
+    conn.execute("DROP TABLE IF EXISTS partidos_nueva")
+    conn.execute(f"CREATE TABLE partidos_nueva ({definicion})")
+    conn.execute("INSERT INTO partidos_nueva SELECT * FROM partidos")
+    conn.execute("DROP TABLE partidos")
+    conn.execute("ALTER TABLE partidos_nueva RENAME TO partidos")
+    conn.executemany("UPDATE partidos_esquema SET tipo = 'TEXT' WHERE columna = ?", [(c,) for c in columnas])
+
+# ---------------------------------------------------------------------------
+# UNIÓN INCREMENTAL
+# ---------------------------------------------------------------------------
+def crear_tabla_partidos(db_path='mi_base_de_datos.db', reconstruir=False):
+    conn = sqlite3.connect(db_path)
     cursor = conn.cursor()
 
     try:
-        # Paso 1: Obtener todas las tablas "_partidos" (excluyendo "jugadores")
-        cursor.execute("SELECT name FROM sqlite_master WHERE type='table'")
-        tablas_partidos = [
-            tabla[0] for tabla in cursor.fetchall()
-            if tabla[0].endswith('_partidos') and tabla[0] != 'jugadores'
-        ]
+        preparar_registro(conn)
 
-        if not tablas_partidos:
+        # Paso 1: tablas "_partidos" y triggers, en una sola consulta a sqlite_master
+        fuentes = {}
+        triggers = set()
+        for tipo, nombre, sql in cursor.execute("SELECT type, name, sql FROM sqlite_master"):
+            if tipo == 'table' and nombre.endswith('_partidos'):
+                fuentes[nombre] = sql
+            elif tipo == 'trigger':
+                triggers.add(nombre)
+
+        if not fuentes:
             print("No hay tablas de jugadores para combinar.")
             return
 
-        # Paso 2: Recopilar todas las columnas únicas de todas las tablas
-        columnas_unicas = defaultdict(set)
-        for tabla in tablas_partidos:
-            if not re.match(r'^[a-zA-Z0-9_]+$', tabla):
-                continue  # Seguridad
-            cursor.execute(f"PRAGMA table_info({tabla})")
-            for col in cursor.fetchall():
-                columnas_unicas[col[1]].add(col[2])  # Nombre y tipo de columna
-
-        # Crear lista de columnas con tipo más común (ej: usar TEXT si hay conflicto)
-        columnas_final = []
-        for nombre, tipos in columnas_unicas.items():
-            tipo = "TEXT" if len(tipos) > 1 else next(iter(tipos))
-            columnas_final.append(f'"{nombre}" {tipo}')
-
-        # Paso 3: Crear tabla 'partidos' con todas las columnas detectadas
-        cursor.execute('DROP TABLE IF EXISTS partidos')
-        create_sql = f'CREATE TABLE partidos ({", ".join(columnas_final)})'
-        cursor.execute(create_sql)
-
-        # Paso 4: Insertar datos (manejar columnas faltantes con NULL)
-        for tabla in tablas_partidos:
-            cursor.execute(f"PRAGMA table_info({tabla})")
-            cols_tabla = [col[1] for col in cursor.fetchall()]
-            cols_seleccion = [
-                f'"{col}"' if col in cols_tabla else 'NULL'
-                for col in columnas_unicas.keys()
-            ]
-            insert_sql = f'''
-                INSERT INTO partidos 
-                SELECT {", ".join(cols_seleccion)} FROM "{tabla}"
-            '''
-            cursor.execute(insert_sql)
+        columnas_partidos = {col[1] for col in cursor.execute("PRAGMA table_info(partidos)")}
+        # Índice único que dejaban versiones anteriores de la actualización
+        # incremental: choca con las filas de la misma clave que copia cada fuente
+        cursor.execute("DROP INDEX IF EXISTS idx_partidos_clave")
+        if reconstruir or 'fuente' not in columnas_partidos:
+            _reiniciar_partidos(conn)
+
+        # Paso 2: qué fuentes cambiaron desde la última unión
+        registro = {tabla: (version, copiada, esquema) for tabla, version, copiada, esquema
+                    in cursor.execute("SELECT tabla, version, version_copiada, esquema FROM partidos_fuentes")}
+        cambiadas = [
+            tabla for tabla, sql in fuentes.items()
+            if tabla not in registro
+            or registro[tabla][1] != registro[tabla][0]
+            or registro[tabla][2] != sql
+            or not triggers.issuperset(nombres_triggers(tabla))
+        ]
+        eliminadas = [tabla for tabla in registro if tabla not in fuentes]
+
+        # Paso 3: tipo de cada columna. Como siempre, TEXT si las fuentes no
+        # coinciden: si una fuente nueva contradice el tipo ya registrado, la
+        # columna se ensancha a TEXT (y así queda aunque esa fuente se borre)
+        esquema = dict(cursor.execute("SELECT columna, tipo FROM partidos_esquema"))
+        columnas_fuente = {
+            tabla: [(col[1], col[2]) for col in cursor.execute(f"PRAGMA table_info({_q(tabla)})")]
+            for tabla in cambiadas
+        }
+        tipos = {}
+        for columnas in columnas_fuente.values():
+            for nombre, tipo in columnas:
+                if nombre != 'fuente':
+                    tipos.setdefault(nombre, {esquema[nombre]} if nombre in esquema else set()).add(tipo)
+        conflictos = [nombre for nombre, vistos in tipos.items()
+                      if len(vistos) > 1 and esquema.get(nombre) != 'TEXT']
+        ensanchadas = [nombre for nombre in conflictos if nombre in esquema]
+        if ensanchadas:
+            _ensanchar_a_texto(conn, ensanchadas)
+            esquema.update((nombre, 'TEXT') for nombre in ensanchadas)
 
+        # Paso 4: copiar solo esas fuentes; las columnas nuevas se añaden con ALTER TABLE
+        nuevas = 0
+        filas = 0
+        for nombre, vistos in tipos.items():
+            if nombre not in esquema:
+                tipo = "TEXT" if len(vistos) > 1 else next(iter(vistos))
+                cursor.execute(f"ALTER TABLE partidos ADD COLUMN {_q(nombre)} {tipo}")
+                cursor.execute("INSERT INTO partidos_esquema (columna, tipo) VALUES (?, ?)", (nombre, tipo))
+                esquema[nombre] = tipo
+                nuevas += 1
+
+        for tabla, columnas in columnas_fuente.items():
+            cursor.execute("INSERT OR IGNORE INTO partidos_fuentes (tabla) VALUES (?)", (tabla,))
+            instalar_triggers(conn, tabla)
+            lista = ", ".join(_q(nombre) for nombre, _ in columnas if nombre != 'fuente')
+            cursor.execute("DELETE FROM partidos WHERE fuente = ?", (tabla,))
+            cursor.execute(f"INSERT INTO partidos ({lista}, fuente) SELECT {lista}, ? FROM {_q(tabla)}", (tabla,))
+            copiadas = cursor.rowcount
+            filas += copiadas
+            cursor.execute("""
+                UPDATE partidos_fuentes SET version_copiada = version, esquema = ?, filas = ?
+                WHERE tabla = ?
+            """, (fuentes[tabla], copiadas, tabla))
+
+        for tabla in eliminadas:
+            cursor.execute("DELETE FROM partidos WHERE fuente = ?", (tabla,))
+            cursor.execute("DELETE FROM partidos_fuentes WHERE tabla = ?", (tabla,))
+
+        # Paso 5: índices para consultas por jugador, fecha, competición y fuente
+        crear_indices(conn)
         conn.commit()
-        print(f"Tabla 'partidos' creada con {len(columnas_final)} columnas!")
+        print(f"Tabla 'partidos' actualizada: {len(cambiadas)} de {len(fuentes)} tablas copiadas "
+              f"({filas} filas), {len(eliminadas)} eliminadas, {nuevas} columnas nuevas, "
+              f"{len(esquema)} columnas en total")
+        if conflictos:
+            print(f"⚠ Tipos distintos entre fuentes, columnas en TEXT: {', '.join(conflictos)}")
 
     except sqlite3.Error as e:
+        conn.rollback()
         print(f"Error: {e}")
     finally:
         conn.close()
 
-crear_tabla_partidos()
\ No newline at end of file
+def cli(argv=None, prog=None):
+    parser = argparse.ArgumentParser(prog=prog, description="Une las tablas <jugador>_partidos en la tabla partidos")
+    parser.add_argument('--db', default='mi_base_de_datos.db')
+    parser.add_argument('--reconstruir', action='store_true', help="vuelve a copiar todas las tablas")
+    args = parser.parse_args(argv)
+    crear_tabla_partidos(args.db, args.reconstruir)
+
+if __name__ == "__main__":
+    cli()
@@ -1,30 +1,40 @@
-from bs4 import BeautifulSoup
+import argparse
 
-html_content = """
-<div class="section_content" id="div_1589662086">
-	    <p><a href="/es/jugadores/32b32e92/Jose-Abad-Cuenu"><strong>José Abad Cuenú</strong></a> 2021-2025&nbsp;· DF&nbsp;· Junior, Bucaramanga, Águilas Doradas, Deportivo Pasto, Millonarios, Deportes Tolima</p><p><a href="/es/jugadores/d8e73502/Diego-Abadia">Diego Abadía</a> 2020-2022&nbsp;· FW&nbsp;· Millonarios</p><p><a href="/es/jugadores/0f3826ce/Carlos-Abella">Carlos Abella</a> 2015&nbsp;· GK&nbsp;· Boyacá Chicó, Atlético Huila, Envigado FC</p><p><a href="/es/jugadores/50b666eb/Joao-Abonia"><strong>Joao Abonia</strong></a> 2025&nbsp;· FW&nbsp;· La Equidad</p><p><a href="/es/jugadores/ff8022eb/Camilo-Acero">Camilo Acero</a> 2015&nbsp;· GK</p><p><a href="/es/jugadores/5bc89762/German-Aceros">Germán Aceros</a> 1962&nbsp;· FW,MF&nbsp;· Colombia</p><p><a href="/es/jugadores/25de95b4/Edson-Acevedo">Edson Acevedo</a> 2022-2023&nbsp;· MF&nbsp;· América de Cali, Resistencia</p><p><a href="/es/jugadores/13b6c09b/Humberto-Acevedo"><strong>Humberto Acevedo</strong></a> 2017-2025&nbsp;· GK&nbsp;· Llaneros, Deportivo Cali, Libertad</p><p><a href="/es/jugadores/9b6c3343/Yainer-Acevedo">Yainer Acevedo</a> 2017&nbsp;· MF&nbsp;· Real Cartagena, Alianza Petrolera</p><p><a href="/es/jugadores/95b20037/Alonso-Acosta">Alonso Acosta</a> 2015&nbsp;· DF&nbsp;· Uniautónoma FC</p><p><a href="/es/jugadores/430847b9/Felipe-Acosta"><strong>Felipe Acosta</strong></a> 2016-2025&nbsp;· MF&nbsp;· La Equidad, Boyacá Chicó</p><p><a href="/es/jugadores/861a4850/Jaime-Acosta"><strong>Jaime Acosta</strong></a> 2022-2025&nbsp;· GK&nbsp;· Junior</p><p><a href="/es/jugadores/4ab0d41c/Onel-Acosta"><strong>Onel Acosta</strong></a> 2022-2024&nbsp;· DF&nbsp;· Deportivo Cali</p><p><a href="/es/jugadores/1f1f20af/Sebastian-Acosta"><strong>Sebastián Acosta</strong></a> 2015-2024&nbsp;· MF&nbsp;· Alianza Petrolera, Deportivo Pereira, Patriotas FC, Deportivo Pasto</p><p><a href="/es/jugadores/4c38a244/Viviana-Acosta"><strong>Viviana Acosta</strong></a> 2021-2024&nbsp;· DF&nbsp;· Real Brasília FC, Colombia</p><p><a href="/es/jugadores/4ed6dfd8/Stiwart-Acuna">Stiwart Acuña</a> 2018-2022&nbsp;· FW&nbsp;· Junior, Alianza Petrolera</p><p><a href="/es/jugadores/4c4a7d92/Jose-Adolfo-Guerra">José Adolfo Guerra</a> 2015-2016&nbsp;· FW&nbsp;· Envigado FC, Boyacá Chicó</p><p><a href="/es/jugadores/c0bc6006/Jose-Adolfo-Valencia">José Adolfo Valencia</a> 2013-2022&nbsp;· FW&nbsp;· Santa Fe, Feirense, Delfín, Portland Timbers, Deportivo Pereira, Club Olimpo, Rosario Central, Indep</p><p><a href="/es/jugadores/6c39a529/Andres-Aedo"><strong>Andres Aedo</strong></a> 2022-2025&nbsp;· MF&nbsp;· Boyacá Chicó</p><p><a href="/es/jugadores/1dabd104/Diego-Agamez">Diego Agamez</a> 2016&nbsp;· GK</p><p><a href="/es/jugadores/9a5930fd/Bleiner-Agron"><strong>Bleiner Agrón</strong></a> 2020-2025&nbsp;· DF&nbsp;· La Equidad, Emelec</p><p><a href="/es/jugadores/c86c0fab/Jonathan-Agudelo"><strong>Jonathan Agudelo</strong></a> 2014-2022&nbsp;· FW&nbsp;· Millonarios, Cúcuta Deportivo, Águilas Doradas, Jaguares de Córdoba, Santa Fe, Gimnasia y Esgrima (L</p><p><a href="/es/jugadores/d6a20144/Juan-Agudelo">Juan Agudelo</a> 2018&nbsp;· FW&nbsp;· Envigado FC</p><p><a href="/es/jugadores/46fa7204/Kevin-Agudelo"><strong>Kevin Agudelo</strong></a> 2018-2023&nbsp;· FW,MF&nbsp;· Spezia, Atlético Huila, Genoa, Fiorentina</p><p><a href="/es/jugadores/1578d4db/Luisa-Agudelo">Luisa Agudelo</a> 2021&nbsp;· GK</p><p><a href="/es/jugadores/6936b41b/Abel-Aguilar">Abel Aguilar</a> 2005-2019&nbsp;· MF&nbsp;· Hércules, Deportivo Cali, Toulouse, Xerez, Unión Magdalena, Colombia, Deportivo La Coruña, Zaragoza,</p><p><a href="/es/jugadores/5dbc631d/Alejandro-Aguilar">Alejandro Aguilar</a> 2021-2022&nbsp;· GK</p><p><a href="/es/jugadores/c285529f/Felipe-Aguilar"><strong>Felipe Aguilar</strong></a> 2015-2025&nbsp;· DF&nbsp;· Águilas Doradas, Atlético Nacional, Alianza Petrolera, Lanús, Santos, Independiente, Athletico Paran</p><p><a href="/es/jugadores/0aef0f1b/Juan-Aguilar">Juan Aguilar</a> 2021&nbsp;· DF</p><p><a href="/es/jugadores/e41db06e/Mateo-Aguilar">Mateo Aguilar</a> 2021&nbsp;· FW</p><p><a href="/es/jugadores/52e3813c/Santiago-Aguilar"><strong>Santiago Aguilar</strong></a> 2021-2025&nbsp;· DF&nbsp;· Deportivo Pereira</p><p><a href="/es/jugadores/931d5350/James-Aguirre"><strong>James Aguirre</strong></a> 2016-2025&nbsp;· GK&nbsp;· Once Caldas, Bucaramanga</p><p><a href="/es/jugadores/e7de02ea/Jorge-Aguirre">Jorge Aguirre</a> 2015-2020&nbsp;· FW,MF&nbsp;· Águilas Doradas, Junior, Envigado FC, Atlético Huila, Santa Fe, Bucaramanga</p><p><a href="/es/jugadores/0c86cbbb/Julio-Agustin-Quinones">Julio Agustín Quiñónes</a> 2015-2018&nbsp;· FW&nbsp;· Deportivo Pasto</p><p><a href="/es/jugadores/6fa3a035/Kevin-Aladesanmi"><strong>Kevin Aladesanmi</strong></a> 2018-2025&nbsp;· FW&nbsp;· FC Universitario, Patriotas FC, Deportivo Pereira, Bucaramanga, Junior</p><p><a href="/es/jugadores/bc54ec4d/Andres-Alarcon"><strong>Andrés Alarcón</strong></a> 2024-2025&nbsp;· DF&nbsp;· Deportivo Pasto, Patriotas FC</p><p><a href="/es/jugadores/dc43a6f9/Cristhian-Alarcon">Cristhian Alarcón</a> 2014-2016&nbsp;· FW&nbsp;· Atlético Huila, Deportes Tolima, Millonarios</p><p><a href="/es/jugadores/e2ec6a76/Argenis-Alba"><strong>Argenis Alba</strong></a> 2015&nbsp;· DF&nbsp;· Cúcuta Deportivo</p><p><a href="/es/jugadores/5a8445e3/Brayner-de-Alba">Brayner de Alba</a> 2017-2023&nbsp;· MF&nbsp;· La Equidad, Jaguares de Córdoba</p><p><a href="/es/jugadores/5abf2810/Israel-Alba"><strong>Israel Alba</strong></a> 2015-2025&nbsp;· DF&nbsp;· Deportivo Pasto, Jaguares de Córdoba, Patriotas FC, Millonarios, La Equidad, Once Caldas</p><p><a href="/es/jugadores/dd2648a3/Dario-Alberto-Bustos">Darío Alberto Bustos</a> 2015&nbsp;· DF&nbsp;· Deportes Tolima, Cúcuta Deportivo, Jaguares de Córdoba, Deportivo Pasto</p><p><a href="/es/jugadores/0f0343f6/Luis-Alberto-Perea">Luis Alberto Perea</a> 2012-2020&nbsp;· FW&nbsp;· Universidad San Martín, León de Huánuco, Atlético Nacional, Sport Huancayo, HFX Wanderers, Deportivo</p><p><a href="/es/jugadores/9162c964/Carlos-Alberto-Uhia"><strong>Carlos Alberto Uhía</strong></a> 2017-2018&nbsp;· FW</p><p><a href="/es/jugadores/8f504f7a/Omar-Albornoz"><strong>Omar Albornoz</strong></a> 2015-2025&nbsp;· DF,MF&nbsp;· Santa Fe, Deportes Tolima, Junior</p><p><a href="/es/jugadores/eb8d303c/Salomon-Alcala">Salomón Alcalá</a> 2021&nbsp;· DF</p><p><a href="/es/jugadores/761f1c3d/Herly-Alcazar">Herly Alcázar</a> 2003-2007&nbsp;· FW&nbsp;· Atlético Huila, La Equidad, Junior, O'Higgins, Chiapas, Universidad de Chile, Universidad San Martín</p><p><a href="/es/jugadores/f53719ce/Oscar-Alcocer">Óscar Alcocer</a> 2020-2023&nbsp;· MF&nbsp;· Bucaramanga</p><p><a href="/es/jugadores/b78bc7f4/Juan-Alegria"><strong>Juan Alegría</strong></a> 2020-2024&nbsp;· FW&nbsp;· FC Honka, Jaguares de Córdoba, Partick Thistle</p><p><a href="/es/jugadores/be205683/David-Alejandro-Gomez">David Alejandro Gómez</a> 2015-2023&nbsp;· DF&nbsp;· Once Caldas, Bucaramanga, Cúcuta Deportivo, Deportivo Pasto</p><p><a href="/es/jugadores/de8fe285/Mario-Alejandro-Gonzalez">Mario Alejandro González</a> 2015-2016&nbsp;· MF&nbsp;· Once Caldas, Santa Fe, Bucaramanga, Fortaleza FC, Millonarios</p><p><a href="/es/jugadores/ac9d641f/Daniel-Alejandro-Hernandez">Daniel Alejandro Hernández</a> 2015-2023&nbsp;· MF&nbsp;· Águilas Doradas, Once Caldas, América de Cali, Athletico Paranaense, Deportivo Pasto, Independiente </p><p><a href="/es/jugadores/85aacb25/Juan-Alejandro-Mahecha">Juan Alejandro Mahecha</a> 2015-2024&nbsp;· MF&nbsp;· Boyacá Chicó, La Equidad, Deportes Tolima</p><p><a href="/es/jugadores/c9819186/Diego-Alejandro-Martinez"><strong>Diego Alejandro Martínez</strong></a> 2015-2025&nbsp;· GK&nbsp;· Deportivo Pasto, Patriotas FC, Jaguares de Córdoba</p><p><a href="/es/jugadores/792aecce/Luis-Alejandro-Paz"><strong>Luis Alejandro Paz</strong></a> 2016-2025&nbsp;· MF&nbsp;· América de Cali, Deportes Quindío, Deportes Tolima</p><p><a href="/es/jugadores/0b3f1dee/Jhonny-Alejandro-Rivera">Jhonny Alejandro Rivera</a> 2017&nbsp;· MF&nbsp;· Expreso Rojo</p><p><a href="/es/jugadores/cdcdac92/Janeth-Aleman"><strong>Janeth Aleman</strong></a> 2025&nbsp;· FW&nbsp;· Unión Magdalena</p><p><a href="/es/jugadores/e366a7d1/Jhon-Alex-Cano">Jhon Alex Cano</a> 2015-2018&nbsp;· DF&nbsp;· Patriotas FC, La Equidad, Deportivo Pasto, Real Cartagena, Santa Fe</p><p><a href="/es/jugadores/2f9d1a6b/Jhon-Alexander-Ramirez">Jhon Alexander Ramirez</a> 2015&nbsp;· MF</p><p><a href="/es/jugadores/034f9627/John-Alexander-Valencia">John Alexander Valencia</a> 2012-2017&nbsp;· DF&nbsp;· Junior, Deportes Tolima, Bucaramanga, Chivas USA, Águilas Doradas, Independiente Medellín</p><p><a href="/es/jugadores/60e242de/Jhonny-Alexander-Vasquez">Jhonny Alexander Vásquez</a> 2015-2024&nbsp;· MF&nbsp;· Deportivo Pereira, Águilas Doradas, Deportivo Cali, Junior, América de Cali</p><p><a href="/es/jugadores/4671bf36/Andres-Alfonso">Andrés Alfonso</a> 2022-2024&nbsp;· FW&nbsp;· Independiente Medellín</p><p><a href="/es/jugadores/a68f60ad/Luis-Alfonso-Paez">Luis Alfonso Páez</a> 2014-2020&nbsp;· FW&nbsp;· Águilas Doradas, Junior, Santa Fe, Atlético Huila, Deportivo Pasto, Deportivo Táchira, NorthEast Uni</p><p><a href="/es/jugadores/f4c56a9f/Jaime-Alfonso-Ruiz">Jaime Alfonso Ruiz</a> 2008-2015&nbsp;· FW&nbsp;· Westerlo, Mechelen, Alianza Atlético, Heist, Cienciano, Deportivo Pasto</p><p><a href="/es/jugadores/b7522f3b/Luis-Alfredo-Gonzalez">Luis Alfredo González</a> 2016&nbsp;· MF&nbsp;· Boyacá Chicó</p><p><a href="/es/jugadores/f5c91a06/Luis-Alfredo-Sierra">Luis Alfredo Sierra</a> 2016-2018&nbsp;· MF&nbsp;· Real Cartagena, Bucaramanga, Deportivo Pasto, Once Caldas</p><p><a href="/es/jugadores/13e8a98c/Ober-Almanza">Ober Almanza</a> 2022&nbsp;· MF&nbsp;· Santa Fe</p><p><a href="/es/jugadores/c590b114/Jhons-Altamiranda"><strong>Jhons Altamiranda</strong></a> 2019-2024&nbsp;· FW&nbsp;· Boyacá Chicó, La Equidad, Jaguares de Córdoba</p><p><a href="/es/jugadores/0cb5f8bb/Jaime-Alvarado"><strong>Jaime Alvarado</strong></a> 2020-2025&nbsp;· MF&nbsp;· Independiente Medellín, Athletico Paranaense</p><p><a href="/es/jugadores/62316756/David-Alvarez-Agudelo">David Álvarez Agudelo</a> 2016-2020&nbsp;· DF&nbsp;· Once Caldas, Monagas, Junior</p><p><a href="/es/jugadores/e8238686/Alejandro-Alvarez"><strong>Alejandro Álvarez</strong></a> 2024-2025&nbsp;· FW&nbsp;· Deportivo Pereira</p><p><a href="/es/jugadores/f177a849/Andres-Alvarez">Andrés Álvarez</a> 2018-2019&nbsp;· MF&nbsp;· América de Cali</p><p><a href="/es/jugadores/8ce30c57/Eder-Alvarez-Balanta"><strong>Éder Álvarez Balanta</strong></a> 2014-2025&nbsp;· DF,MF&nbsp;· América de Cali, Club Brugge, River Plate, Basel, Schalke 04, Colombia</p><p><a href="/es/jugadores/6303b59b/Diego-Alvarez">Diego Álvarez</a> 2008-2020&nbsp;· FW&nbsp;· Independiente Medellín, Patriotas FC, Deportivo Cali, Atlético Nacional, La Equidad, Envigado FC, De</p><p><a href="/es/jugadores/e2e96950/Fernando-Alvarez"><strong>Fernando Álvarez</strong></a> 2021-2025&nbsp;· DF&nbsp;· CF Montréal</p><p><a href="/es/jugadores/b4d914b9/Jonathan-Alvarez">Jonathan Álvarez</a> 2015-2018&nbsp;· MF&nbsp;· Deportivo Cali, Atlético Nacional, Águilas Doradas, América de Cali, Atlético Huila, Once Caldas, Ju</p><p><a href="/es/jugadores/f91b58ac/Jonathan-Alvarez">Jonathan Álvarez</a> 2016&nbsp;· DF</p><p><a href="/es/jugadores/48173656/Juan-Alvarez">Juan Alvarez</a> 2022&nbsp;· FW</p><p><a href="/es/jugadores/a2239af7/Leonel-Alvarez">Leonel Álvarez</a> 1990-2001&nbsp;· MF&nbsp;· Dallas Burn, New England Revolution, Valladolid, Colombia</p><p><a href="/es/jugadores/d152b21e/Mario-Alvarez">Mario Álvarez</a> 2018-2022&nbsp;· FW&nbsp;· Patriotas FC, Internacional de Barinas</p><p><a href="/es/jugadores/9a1b24c2/Miguel-Alvarez"><strong>Miguel Alvarez</strong></a> 2023-2024&nbsp;· MF</p><p><a href="/es/jugadores/f7414cd7/Nestor-Alvarez">Nestor Alvarez</a> 2006-2007&nbsp;· FW&nbsp;· Deportes Tolima, Académica</p><p><a href="/es/jugadores/ea28e9a8/Oswal-Alvarez">Oswal Álvarez</a> 2014-2020&nbsp;· FW&nbsp;· Patriotas FC, Envigado FC, Anderlecht</p><p><a href="/es/jugadores/7af0c107/Pablo-Alvarez">Pablo Alvarez</a> 2023&nbsp;· MF&nbsp;· Envigado FC</p><p><a href="/es/jugadores/bfa30832/Pedro-Alvarez">Pedro Álvarez</a> 2001&nbsp;· MF&nbsp;· MetroStars</p><p><a href="/es/jugadores/71d5fdc4/Julian-Alveiro-Quinones"><strong>Julián Alveiro Quiñones</strong></a> 2015-2025&nbsp;· DF&nbsp;· Deportes Tolima, Santa Fe</p><p><a href="/es/jugadores/6b204c32/Anibal-Alzate">Aníbal Alzate</a> 1962&nbsp;· DF</p><p><a href="/es/jugadores/f8fe0231/Cesar-Alzate">César Alzáte</a> 2016&nbsp;· FW,MF&nbsp;· Cúcuta Deportivo, Estudiantes de Caracas</p><p><a href="/es/jugadores/c4d355e8/Cleider-Alzate">Cleider Alzáte</a> 2014-2021&nbsp;· MF&nbsp;· Águilas Doradas, Alianza Petrolera, Deportes Tolima, Independiente Medellín, Oriente Petrolero, Depo</p><p><a href="/es/jugadores/e6b7e95f/Jhon-Alzate">Jhon Alzate</a> 2023-2024&nbsp;· MF&nbsp;· Chicago House AC</p><p><a href="/es/jugadores/6ce1e3e2/Rodrigo-Alzate">Rodrigo Alzate</a> 2015&nbsp;· MF</p><p><a href="/es/jugadores/ad1f61f3/Steven-Alzate"><strong>Steven Alzate</strong></a> 2016-2025&nbsp;· MF&nbsp;· Hull City, Brighton &amp; Hove Albion, Standard Liège, Swindon Town, Brighton &amp; Hove Albion U23, Leyton </p><p><a href="/es/jugadores/ff1988a5/Luis-Amaranto-Perea">Luis Amaranto Perea</a> 2004-2014&nbsp;· DF&nbsp;· Atlético Madrid, Cruz Azul, Boca Juniors, Colombia</p><p><a href="/es/jugadores/ec3aeda1/Cesar-Amaya">César Amaya</a> 2016-2021&nbsp;· FW&nbsp;· Deportivo Cali, Once Caldas, Águilas Doradas, Deportivo Pasto, Real Cartagena</p><p><a href="/es/jugadores/01cdfe79/Diego-Amaya">Diego Amaya</a> 2015-2016&nbsp;· DF,MF&nbsp;· Once Caldas, Junior, Atlético Huila, Bucaramanga, Deportivo Cali</p><p><a href="/es/jugadores/956cdb7f/Jhojan-Amaya"><strong>Jhojan Amaya</strong></a> 2024&nbsp;· FW&nbsp;· Atlético Nacional</p><p><a href="/es/jugadores/58ee42a4/Jorge-Amaya"><strong>Jorge Amaya</strong></a> 2021-2024&nbsp;· GK</p><p><a href="/es/jugadores/8b325380/Jose-Amaya">José Amaya</a> 2015&nbsp;· MF&nbsp;· Atlético Nacional, Uniautónoma FC, Barcelona, Millonarios, Patriotas FC</p><p><a href="/es/jugadores/0007f973/Miguel-Amaya"><strong>Miguel Amaya</strong></a> 2025&nbsp;· La Equidad</p><p><a href="/es/jugadores/5157cfaa/Jose-Ampudia"><strong>José Ampudia</strong></a> 2020-2025&nbsp;· DF&nbsp;· Boyacá Chicó, Águilas Doradas</p><p><a href="/es/jugadores/7ff608a3/Julian-Anaya"><strong>Julian Anaya</strong></a> 2024&nbsp;· DF&nbsp;· Jaguares de Córdoba</p><p><a href="/es/jugadores/e0cd9ffd/Luis-Anaya">Luis Anaya</a> 2022-2023&nbsp;· DF&nbsp;· Jaguares de Córdoba</p><p><a href="/es/jugadores/22a3e719/Yulian-Anchico">Yulián Anchico</a> 2010-2022&nbsp;· MF&nbsp;· Santa Fe, Deportes Tolima, Jaguares de Córdoba, Bucaramanga, Independiente Medellín, Pachuca</p><p><a href="/es/jugadores/6fe53d33/Andres-Andrade"><strong>Andrés Andrade</strong></a> 2013-2025&nbsp;· MF&nbsp;· Bucaramanga, Atlético Nacional, Deportes Tolima, León, América, Chiapas, Atlas, Atlético Huila, Amér</p><p><a href="/es/jugadores/def69704/Christian-Andrade">Christian Andrade</a> 2021-2023&nbsp;· DF&nbsp;· Envigado FC</p><p><a href="/es/jugadores/69f48782/Darwin-Andrade"><strong>Darwin Andrade</strong></a> 2014-2024&nbsp;· DF&nbsp;· Deportivo Cali, La Equidad, Standard Liège, Jaguares de Córdoba, Colombia</p><p><a href="/es/jugadores/aa73c61f/Jesus-Andrade">Jesús Andrade</a> 2022&nbsp;· DF</p><p><a href="/es/jugadores/31dfd8bb/Jose-Andrade">José Andrade</a> 2021-2022&nbsp;· MF&nbsp;· Patriotas FC</p><p><a href="/es/jugadores/a5130046/Kevin-Andrade"><strong>Kevin Andrade</strong></a> 2019-2024&nbsp;· DF&nbsp;· América de Cali, FC Baltika Kaliningrad, Platense</p><p><a href="/es/jugadores/64dbc61b/Lady-Andrade"><strong>Lady Andrade</strong></a> 2011-2024&nbsp;· FW,MF&nbsp;· Colombia, Real Brasília FC, Western New York Flash, Milan</p><p><a href="/es/jugadores/23e4c21d/Jhoyler-Andrades"><strong>Jhoyler Andrades</strong></a> 2025&nbsp;· GK&nbsp;· Santa Fe</p><p><a href="/es/jugadores/874d9c04/Juan-Andres-Balanta"><strong>Juan Andres Balanta</strong></a> 2015-2018&nbsp;· MF&nbsp;· Deportivo Cali, Jaguares de Córdoba</p><p><a href="/es/jugadores/ce1c0b3e/Omar-Andres-Bertel"><strong>Omar Andres Bertel</strong></a> 2017-2025&nbsp;· DF&nbsp;· América de Cali, Millonarios</p><p><a href="/es/jugadores/d47303e7/Juan-Andres-Bolanos"><strong>Juan Andrés Bolaños</strong></a> 2016&nbsp;· DF&nbsp;· Melgar</p><p><a href="/es/jugadores/908ae979/Victor-Andres-Cordoba">Víctor Andrés Córdoba</a> 2014-2018&nbsp;· MF&nbsp;· Deportivo Táchira, Alianza Petrolera, Once Caldas</p><p><a href="/es/jugadores/9e24a4a8/Pablo-Andres-Escobar">Pablo Andrés Escobar</a> 2010-2016&nbsp;· DF&nbsp;· Deportes Quindío, Deportivo Cali, Cúcuta Deportivo, Atlético Huila, Patriotas FC, Kansas City Wizard</p><p><a href="/es/jugadores/86bd25a3/Carlos-Andres-Gallego">Carlos Andrés Gallego</a> 2018&nbsp;· DF&nbsp;· Atlético Huila, Leones FC, Envigado FC</p><p><a href="/es/jugadores/99181484/German-Andres-Gutierrez">Germán Andrés Gutiérrez</a> 2015-2023&nbsp;· DF&nbsp;· Junior, Independiente Medellín, Bucaramanga, Atlético Huila</p><p><a href="/es/jugadores/08ed58f8/Carlos-Andres-Paez">Carlos Andrés Páez</a> 2016-2023&nbsp;· DF&nbsp;· Jaguares de Córdoba, Envigado FC</p><p><a href="/es/jugadores/7f083ee1/Carlos-Andres-Ramirez"><strong>Carlos Andrés Ramírez</strong></a> 2015-2025&nbsp;· DF&nbsp;· Envigado FC, Deportivo Pereira, Águilas Doradas, Alianza Petrolera, Atlético Huila, Unión Comercio, </p><p><a href="/es/jugadores/9ac0a902/Carlos-Andres-Rivas">Carlos Andrés Rivas</a> 2015-2020&nbsp;· MF&nbsp;· Patriotas FC, Santa Fe, Jaguares de Córdoba</p><p><a href="/es/jugadores/5073fe66/Carlos-Andres-Rodriguez">Carlos Andrés Rodríguez</a> 2016-2017&nbsp;· MF&nbsp;· Patriotas FC</p><p><a href="/es/jugadores/e56a7d4c/Omar-Andres-Rodriguez">Omar Andrés Rodríguez</a> 2017&nbsp;· MF&nbsp;· Millonarios, Deportivo Pasto, Once Caldas, Águilas Doradas, Expreso Rojo</p><p><a href="/es/jugadores/4ec0efc0/Duvan-Angarita">Duván Angarita</a> 2018-2024&nbsp;· DF</p><p><a href="/es/jugadores/df64e45e/Fabian-Angel"><strong>Fabián Ángel</strong></a> 2019-2025&nbsp;· MF&nbsp;· Junior, Deportivo Cali</p><p><a href="/es/jugadores/d802c673/Miguel-Angel-Medina">Miguel Ángel Medina</a> 2015-2019&nbsp;· MF&nbsp;· Cortuluá, Santa Fe</p><p><a href="/es/jugadores/be0ea201/Miguel-Angel-Murillo"><strong>Miguel Ángel Murillo</strong></a> 2014-2022&nbsp;· FW&nbsp;· Deportivo Cali, Peñarol, Mushuc Runa, Águilas Doradas, Veracruz, Royal Parí</p><p><a href="/es/jugadores/c7230a25/Tomas-Angel"><strong>Tomas Ángel</strong></a> 2021-2025&nbsp;· FW&nbsp;· San Diego FC, Atlético Nacional, Phoenix Rising, Los Angeles FC</p><p><a href="/es/jugadores/17e03cdd/Alvaro-Angulo"><strong>Álvaro Angulo</strong></a> 2015-2025&nbsp;· DF&nbsp;· Independiente, Águilas Doradas, Atlético Nacional, Deportivo Pasto</p><p><a href="/es/jugadores/6f7cc442/Anderson-Angulo"><strong>Anderson Angulo</strong></a> 2018-2025&nbsp;· DF&nbsp;· Deportes Tolima, Leones FC, Bucaramanga</p><p><a href="/es/jugadores/7159be2a/Bladimir-Angulo">Bladimir Angulo</a> 2023&nbsp;· MF&nbsp;· Atlético Huila</p><p><a href="/es/jugadores/af31b77b/Brayan-Angulo"><strong>Brayan Angulo</strong></a> 2007-2025&nbsp;· DF,MF&nbsp;· Puebla, Granada, Tijuana, América de Cali, Toluca, Chiapas, Ludogorets Razgrad, Leixões, Boavista, R</p><p><a href="/es/jugadores/7f6b06e9/Emerson-Angulo">Emerson Angulo</a> 2022-2023&nbsp;· FW</p><p><a href="/es/jugadores/55a5d959/Ivan-Angulo"><strong>Iván Angulo</strong></a> 2016-2025&nbsp;· FW,MF&nbsp;· Orlando City, Portimonense, Envigado FC, Botafogo (RJ)</p><p><a href="/es/jugadores/f178ea86/Jan-Angulo"><strong>Jan Ángulo</strong></a> 2025&nbsp;· DF&nbsp;· Llaneros</p><p><a href="/es/jugadores/f71c983d/Jean-Angulo">Jean Angulo</a> 2021&nbsp;· MF</p><p><a href="/es/jugadores/add964c2/Jefferson-Angulo">Jefferson Angulo</a> 2016&nbsp;· MF&nbsp;· Atlético Nacional, Millonarios, Águilas Doradas, Atlético Huila, Vila Nova, Fortaleza FC, Once Calda</p><p><a href="/es/jugadores/7c033200/Jeison-Angulo"><strong>Jeison Angulo</strong></a> 2015-2025&nbsp;· DF&nbsp;· Santa Fe, Deportes Tolima, Deportivo Cali, UNAM, Junior, Cortuluá</p><p><a href="/es/jugadores/cb2f8dec/Jhon-Angulo">Jhon Angulo</a> 2024&nbsp;· MF</p><p><a href="/es/jugadores/840fbd94/Jonathan-Angulo">Jonathan Angulo</a> 2015-2016&nbsp;· FW&nbsp;· Atlético Huila</p><p><a href="/es/jugadores/561af97d/Julian-Angulo"><strong>Julián Angulo</strong></a> 2023-2025&nbsp;· FW&nbsp;· Independiente Medellín, Deportes Tolima</p><p><a href="/es/jugadores/6f02a4d9/Kevin-Angulo">Kévin Angulo</a> 2023-2024&nbsp;· MF&nbsp;· América de Cali</p><p><a href="/es/jugadores/78b859ec/Larry-Angulo"><strong>Larry Angulo</strong></a> 2017-2024&nbsp;· MF&nbsp;· Independiente Medellín, América de Cali, La Equidad, Deportivo Pereira, Patriotas FC</p><p><a href="/es/jugadores/e6df9305/Leandro-Angulo"><strong>Leandro Angulo</strong></a> 2025&nbsp;· MF&nbsp;· Santa Fe</p><p><a href="/es/jugadores/2b437567/Libinton-Angulo"><strong>Libinton Angulo</strong></a> 2024&nbsp;· MF&nbsp;· Libertad</p><p><a href="/es/jugadores/88ad94f7/Luis-Angulo"><strong>Luis Angulo</strong></a> 2021-2025&nbsp;· MF&nbsp;· Central Córdoba–SdE, Alianza Petrolera, Platense, Talleres</p><p><a href="/es/jugadores/b661e058/Brayan-Angulo-Mosquera"><strong>Brayan Angulo Mosquera</strong></a> 2014-2021&nbsp;· MF&nbsp;· Independiente Medellín, América de Cali, Deportivo Pasto, Once Caldas</p><p><a href="/es/jugadores/18f675f6/Neider-Angulo">Neider Angulo</a> 2018&nbsp;· GK</p><p><a href="/es/jugadores/795a902f/Sebastian-Angulo">Sebastián Angulo</a> 2021-2023&nbsp;· GK&nbsp;· Real Santa Cruz</p><p><a href="/es/jugadores/f0ef5448/Yilmar-Angulo">Yilmar Angulo</a> 2015&nbsp;· MF&nbsp;· Envigado FC, Independiente Medellín</p><p><a href="/es/jugadores/092e8ad4/Yony-Angulo">Yony Angulo</a> 2018-2019&nbsp;· FW&nbsp;· Sport Boys Warnes, Nacional Potosí, Royal Parí</p><p><a href="/es/jugadores/a7a8f2fe/Luis-Antonio-Moreno">Luis Antonio Moreno</a> 1998&nbsp;· DF</p><p><a href="/es/jugadores/14ad91d7/Miguel-Antonio-Murillo">Miguel Antonio Murillo</a> 2014-2017&nbsp;· FW&nbsp;· El Tanque Sisley, Juventud de Las Piedras, Atlético Huila, Audax Italiano</p><p><a href="/es/jugadores/676111e9/Miguel-Antonio-Perez">Miguel Antonio Pérez</a> 2015-2017&nbsp;· FW&nbsp;· Cúcuta Deportivo, Expreso Rojo, Envigado FC, Club Deportivo Clan Juvenil</p><p><a href="/es/jugadores/5792f8d1/Jhon-Anyelo-Labastidas">Jhon Ányelo Labastidas</a> 2019-2021&nbsp;· MF&nbsp;· Unión Magdalena, Jaguares de Córdoba</p><p><a href="/es/jugadores/33038547/Carlos-Aponte">Carlos Aponte</a> 1962&nbsp;· DF</p><p><a href="/es/jugadores/9d7ed15d/Elier-Aponza">Elier Aponzá</a> 2023&nbsp;· FW</p><p><a href="/es/jugadores/96a30eca/Robinson-Aponza">Robinson Aponzá</a> 2015-2019&nbsp;· MF&nbsp;· Alianza Atlético, Cortuluá, Junior, Alianza Universidad, Deportes Tolima, Millonarios, Atlético Huil</p><p><a href="/es/jugadores/39e140ab/Sergio-Aponza"><strong>Sergio Aponzá</strong></a> 2024-2025&nbsp;· MF&nbsp;· Alianza Petrolera</p><p><a href="/es/jugadores/6d058717/Wilinton-Aponza"><strong>Wilinton Aponzá</strong></a> 2021-2023&nbsp;· FW&nbsp;· Portimonense</p><p><a href="/es/jugadores/76ee1d56/Yesid-Aponza">Yesid Aponzá</a> 2015-2016&nbsp;· MF&nbsp;· La Equidad, Boyacá Chicó, Independiente Medellín</p><p><a href="/es/jugadores/2cc8e399/Neyder-Aragon">Neyder Aragón</a> 2024&nbsp;· GK</p><p><a href="/es/jugadores/ccfd824e/Orles-Aragon"><strong>Orles Aragón</strong></a> 2018-2025&nbsp;· FW&nbsp;· Unión Magdalena, Millonarios</p><p><a href="/es/jugadores/fea9401e/Cristian-Arango"><strong>Cristian Arango</strong></a> 2015-2025&nbsp;· FW,MF&nbsp;· San Jose Earthquakes, Envigado FC, Millonarios, Los Angeles FC, Real Salt Lake, Aves, Tondela, Pachu</p><p><a href="/es/jugadores/c7cf3a6c/Douglas-Arango">Douglas Arango</a> 2022-2023&nbsp;· FW</p><p><a href="/es/jugadores/317f0fb3/Estefano-Arango"><strong>Estefano Arango</strong></a> 2015-2025&nbsp;· MF&nbsp;· Boyacá Chicó, Alianza Petrolera, Deportes Tolima, Bucaramanga, Cúcuta Deportivo, Atlético Nacional, </p><p><a href="/es/jugadores/df13f195/Hector-Arango"><strong>Hector Arango</strong></a> 2022-2024&nbsp;· GK&nbsp;· Águilas Doradas</p><p><a href="/es/jugadores/c1b7ee9f/Jacobo-Arango">Jacobo Arango</a> 2017&nbsp;· MF</p><p><a href="/es/jugadores/570bc7f6/Johan-Arango">Johan Arango</a> 2015-2022&nbsp;· FW,MF&nbsp;· Once Caldas, Binacional, Santa Fe, Deportivo Pasto, Independiente Medellín, Al-Batin, Jaguares de Có</p><p><a href="/es/jugadores/b4c2a30e/John-Arango"><strong>John Arango</strong></a> 2023-2025&nbsp;· MF&nbsp;· Boyacá Chicó, Alianza Petrolera</p><p><a href="/es/jugadores/fcefe7f2/Juan-Arango"><strong>Juan Arango</strong></a> 2023-2025&nbsp;· FW&nbsp;· Deportivo Cali</p><p><a href="/es/jugadores/6d2fe58d/Niver-Arango">Niver Arango</a> 2015-2016&nbsp;· MF&nbsp;· Alianza Petrolera</p><p><a href="/es/jugadores/a1cbd8f7/Sebastian-Arango">Sebastián Arango</a> 2015-2024&nbsp;· GK&nbsp;· Boyacá Chicó</p><p><a href="/es/jugadores/fbafeb17/Jhon-Araujo"><strong>Jhon Araujo</strong></a> 2021-2025&nbsp;· FW&nbsp;· Envigado FC, Once Caldas</p><p><a href="/es/jugadores/4c7c165f/Sebastian-Araujo">Sebastián Araujo</a> 2021-2022&nbsp;· GK</p><p><a href="/es/jugadores/424b9072/Alejandro-Arbelaez">Alejandro Arbelaez</a> 2024&nbsp;· MF</p><p><a href="/es/jugadores/05a185c7/Carolina-Arbelaez">Carolina Arbeláez</a> 2015-2021&nbsp;· MF</p><p><a href="/es/jugadores/553a187a/Federico-Arbelaez">Federico Arbeláez</a> 2018-2023&nbsp;· DF&nbsp;· Patriotas FC, Libertad, Santa Fe</p><p><a href="/es/jugadores/1b7fbdb8/Juan-Arbelaez">Juan Arbelaez</a> 2013-2014&nbsp;· MF&nbsp;· Richmond Kickers</p><p><a href="/es/jugadores/df418fc0/Danilo-Arboleda">Danilo Arboleda</a> 2015-2024&nbsp;· DF&nbsp;· Patriotas FC, La Equidad, América de Cali, Deportivo Pasto, FC Sheriff Tiraspol, Wuhan Three Towns, </p><p><a href="/es/jugadores/f8cfae1f/Ivan-Arboleda"><strong>Iván Arboleda</strong></a> 2015-2025&nbsp;· GK&nbsp;· Millonarios, Banfield, Newell's Old Boys</p><p><a href="/es/jugadores/9786ee09/Jhon-Arboleda">Jhon Arboleda</a> 2017-2018&nbsp;· FW&nbsp;· Boyacá Chicó</p><p><a href="/es/jugadores/f4218afa/Jordan-Arboleda">Jordan Arboleda</a> 2021&nbsp;· DF&nbsp;· Atlético Huila</p><p><a href="/es/jugadores/ea1f4bad/Manuel-Arboleda">Manuel Arboleda</a> 2005-2014&nbsp;· DF&nbsp;· Lech Poznań, Zagłębie Lubin, Cienciano</p><p><a href="/es/jugadores/db268f16/Luis-Arboleda-Murillo">Luis Arboleda Murillo</a> 2015&nbsp;· DF</p><p><a href="/es/jugadores/4c3f49a7/Victor-Arboleda">Victor Arboleda</a> 2015-2022&nbsp;· FW,MF&nbsp;· Portland Timbers 2, Deportivo Pasto, Portland Timbers, Deportivo Cali, Alianza Petrolera</p><p><a href="/es/jugadores/f7e3f3f9/William-Arboleda">William Arboleda</a> 2017-2019&nbsp;· MF&nbsp;· Independiente Medellín, América de Cali, Real Cartagena</p><p><a href="/es/jugadores/0a4df1c7/Yair-Arboleda"><strong>Yair Arboleda</strong></a> 2015-2025&nbsp;· FW&nbsp;· Deportivo Pasto, Santa Fe, Rio Grande Valley Toros</p><p><a href="/es/jugadores/6f7f3eb0/Yeison-Arboleda">Yeison Arboleda</a> 2017&nbsp;· GK</p><p><a href="/es/jugadores/ef99dcdf/Yilber-Arboleda"><strong>Yilber Arboleda</strong></a> 2023-2024&nbsp;· MF&nbsp;· Jaguares de Córdoba</p><p><a href="/es/jugadores/25d6c15e/Jean-Arce">Jean Arce</a> 2020-2024&nbsp;· MF&nbsp;· Deportivo Cali</p><p><a href="/es/jugadores/2380da33/Juan-Arce"><strong>Juan Arce</strong></a> 2024&nbsp;· DF&nbsp;· Boyacá Chicó, Patriotas FC</p><p><a href="/es/jugadores/736c7efe/O-Arce">Ó. Arce</a> 2014-2015&nbsp;· DF&nbsp;· Atenas de San Carlos</p><p><a href="/es/jugadores/89c4b04b/Oscar-Arce">Óscar Arce</a> 2013-2014&nbsp;· DF&nbsp;· Corona Brașov, La Equidad, Juventud de Las Piedras</p><p><a href="/es/jugadores/e5f7a30a/Andres-Arcila">Andres Arcila</a> 2019&nbsp;· MF&nbsp;· RGV FC Toros</p><p><a href="/es/jugadores/9e34ca95/Daniel-Arcila">Daniel Arcila</a> 2013&nbsp;· DF&nbsp;· Fort Lauderdale Strikers</p><p><a href="/es/jugadores/d6dfc13f/Daniel-Arcila"><strong>Daniel Arcila</strong></a> 2022-2025&nbsp;· MF&nbsp;· Envigado FC</p><p><a href="/es/jugadores/659f2e97/Jehan-Arcila">Jehan Arcíla</a> 2023&nbsp;· MF</p><p><a href="/es/jugadores/fe7658af/Veronica-Arcila">Veronica Arcila</a> 2022&nbsp;· FW</p><p><a href="/es/jugadores/d743d42c/Jhoan-Arenas">Jhoan Arenas</a> 2015-2021&nbsp;· FW&nbsp;· Estudiantes de Mérida, Academia Puerto Cabello, Atlético Venezuela, Boyacá Chicó, Zamora, Cúcuta Dep</p><p><a href="/es/jugadores/19d0e9c6/Nestor-Arenas">Néstor Arenas</a> 2019&nbsp;· FW&nbsp;· Trujillanos</p><p><a href="/es/jugadores/1f102340/Nicolas-Arevalo"><strong>Nicolás Árevalo</strong></a> 2023-2025&nbsp;· MF&nbsp;· Millonarios</p><p><a href="/es/jugadores/50c5301f/Alvaro-Arias">Álvaro Arias</a> 2015&nbsp;· MF</p><p><a href="/es/jugadores/68b79313/Carolina-Arias"><strong>Carolina Arias</strong></a> 2015-2024&nbsp;· DF,MF&nbsp;· Colombia</p><p><a href="/es/jugadores/e615f835/Cesar-Arias">César Arias</a> 2015-2022&nbsp;· FW,MF&nbsp;· Alianza Petrolera, Cúcuta Deportivo, Once Caldas, Real Cartagena, Águilas Doradas, Daejeon Citizen F</p><p><a href="/es/jugadores/24a238da/Daniela-Arias"><strong>Daniela Arias</strong></a> 2018-2024&nbsp;· DF&nbsp;· Colombia, Corinthians</p><p><a href="/es/jugadores/39144ddd/Diego-Arias">Diego Arias</a> 2010-2021&nbsp;· MF&nbsp;· Atlético Nacional, Deportivo Pereira, Once Caldas, Independiente Medellín, PAOK, Atlético Huila</p><p><a href="/es/jugadores/7a48a2cd/Isaac-Arias">Isaac Arias</a> 2015-2016&nbsp;· FW&nbsp;· Deportes Tolima</p><p><a href="/es/jugadores/839c5253/Jairo-Arias">Jairo Arias</a> 1962&nbsp;· FW</p><p><a href="/es/jugadores/86d96066/Jhon-Arias"><strong>Jhon Arias</strong></a> 2017-2026&nbsp;· FW,MF&nbsp;· Fluminense, Patriotas FC, Colombia, Santa Fe, América de Cali</p><p><a href="/es/jugadores/a36efa99/Juan-Arias"><strong>Juan Arias</strong></a> 2022-2025&nbsp;· DF&nbsp;· Atlético Nacional</p><p><a href="/es/jugadores/a2393057/Manuel-Arias">Manuel Arias</a> 2017-2023&nbsp;· GK</p><p><a href="/es/jugadores/2af9dde2/Nataly-Arias">Nataly Arias</a> 2011-2016&nbsp;· DF&nbsp;· Colombia</p><p><a href="/es/jugadores/fdd60087/Santiago-Arias"><strong>Santiago Arias</strong></a> 2011-2026&nbsp;· DF,MF&nbsp;· Bahia, PSV Eindhoven, Colombia, Atlético Madrid, FC Cincinnati, La Equidad, Granada, Sporting CP</p><p><a href="/es/jugadores/eda0f15f/Sebastian-Arias">Sebastián Arias</a> 2015&nbsp;· DF&nbsp;· Real Cartagena, Jaguares de Córdoba</p><p><a href="/es/jugadores/79f3a922/William-Arias">William Arias</a> 2015-2016&nbsp;· GK</p><p><a href="/es/jugadores/baae1540/Andres-Aristizabal">Andrés Aristizabal</a> 2016-2017&nbsp;· MF&nbsp;· Deportivo JBL</p><p><a href="/es/jugadores/268dec15/Emilio-Aristizabal"><strong>Emilio Aristizábal</strong></a> 2023-2025&nbsp;· FW&nbsp;· Fortaleza FC, Atlético Nacional</p><p><a href="/es/jugadores/bc1bc4e5/Juan-Aristizabal"><strong>Juan Aristizábal</strong></a> 2023-2024&nbsp;· MF&nbsp;· Envigado FC</p><p><a href="/es/jugadores/e625892a/Juan-Aristizabal"><strong>Juan Aristizábal</strong></a> 2022-2024&nbsp;· MF&nbsp;· Patriotas FC, Santa Fe</p><p><a href="/es/jugadores/fd43d3d9/Victor-Aristizabal">Víctor Aristizábal</a> 1993-2003&nbsp;· FW&nbsp;· Atlético Nacional, Cruzeiro, Coritiba, Colombia, Valencia</p><p><a href="/es/jugadores/f4eec611/Andres-Ariza"><strong>Andrés Ariza</strong></a> 2019-2024&nbsp;· FW&nbsp;· Atlético Huila, Bucaramanga</p><p><a href="/es/jugadores/b2c954e4/Camilo-Ariza">Camilo Ariza</a> 2018-2019&nbsp;· GK</p><p><a href="/es/jugadores/73b2c032/Natalia-Ariza">Natalia Ariza</a> 2012&nbsp;· DF</p><p><a href="/es/jugadores/8ed923a9/Ronaldo-Ariza">Ronaldo Ariza</a> 2015-2020&nbsp;· MF&nbsp;· Alianza Petrolera, Cúcuta Deportivo</p><p><a href="/es/jugadores/54e98165/Tatiana-Ariza">Tatiana Ariza</a> 2011-2022&nbsp;· FW&nbsp;· Colombia</p><p><a href="/es/jugadores/eb3536b9/Elver-Arizala"><strong>Elver Arizala</strong></a> 2024&nbsp;· DF</p><p><a href="/es/jugadores/9049a40a/Franco-Arizala">Franco Arizala</a> 2010-2022&nbsp;· FW&nbsp;· Chiapas, Deportes Tolima, Boyacá Chicó, León, Atlas, Bucaramanga, Pachuca, Real Tomayapo, Deportivo </p><p><a href="/es/jugadores/64a3fc6d/Juan-Arizala">Juan Arizala</a> 2015&nbsp;· FW&nbsp;· Deportivo Pasto</p><p><a href="/es/jugadores/82f2e5c8/Juan-Arizala"><strong>Juan Arizala</strong></a> 2023-2025&nbsp;· MF&nbsp;· Independiente Medellín</p><p><a href="/es/jugadores/c8af3576/Eduar-Arizalas"><strong>Eduar Arízalas</strong></a> 2025&nbsp;· FW&nbsp;· Deportivo Pereira</p><p><a href="/es/jugadores/502873fc/Mauricio-Armero"><strong>Mauricio Armero</strong></a> 2016-2022&nbsp;· FW,MF&nbsp;· Independiente Medellín, Jaguares de Córdoba, Deportes Quindío, La Equidad, Always Ready, Karpaty Lvi</p><p><a href="/es/jugadores/afabf74e/Pablo-Armero">Pablo Armero</a> 2010-2019&nbsp;· DF,MF&nbsp;· América de Cali, Udinese, Palmeiras, Napoli, Colombia, Milan, West Ham United, Bahia, Flamengo, Guar</p><p><a href="/es/jugadores/0c8eef50/Kevin-Armesto"><strong>Kevin Armesto</strong></a> 2025&nbsp;· GK&nbsp;· Llaneros</p><p><a href="/es/jugadores/bc16b65a/Emmanuel-Arrechea"><strong>Emmanuel Arrechea</strong></a> 2025&nbsp;· DF&nbsp;· Fortaleza FC</p><p><a href="/es/jugadores/a80a8df4/Yair-Arrechea">Yair Arrechea</a> 2015-2017&nbsp;· DF&nbsp;· Deportes Tolima, Deportivo Cali, Cortuluá, Deportivo Pasto, Santa Fe, Atlético Huila</p><p><a href="/es/jugadores/2e367553/Yovanny-Arrechea">Yovanny Arrechea</a> 2012-2016&nbsp;· FW&nbsp;· Santa Fe, Millonarios, América de Cali, Atlético Huila, Deportivo Pasto, Atlético Nacional, Changchu</p><p><a href="/es/jugadores/66b953ed/Eudalio-Arriaga">Eudalio Arriaga</a> 2003-2005&nbsp;· FW&nbsp;· Puebla, Junior, Cúcuta Deportivo, Bucaramanga, Danubio, Universidad San Martín, Colombia</p><p><a href="/es/jugadores/bb5149ee/Cristian-Arrieta"><strong>Cristian Arrieta</strong></a> 2015-2025&nbsp;· DF,MF&nbsp;· Deportes Tolima, Envigado FC, América de Cali, Deportivo Pasto</p><p><a href="/es/jugadores/0183a043/Fredys-Arrieta">Fredys Arrieta</a> 2014-2017&nbsp;· FW&nbsp;· Deportivo La Guaira, Caracas, Atlético Huila, Junior</p><p><a href="/es/jugadores/c787d4ec/Jesus-Arrieta"><strong>Jesús Arrieta</strong></a> 2015-2024&nbsp;· FW&nbsp;· Caracas, Unión Comercio, Patriotas FC, Ayacucho, Deportivo Cali, Jaguares de Córdoba, Fortaleza FC, </p><p><a href="/es/jugadores/37a6c7c1/Andres-Arroyave">Andrés Arroyave</a> 2014&nbsp;· FW&nbsp;· Deportivo Pereira, Ayacucho</p><p><a href="/es/jugadores/7e2e329e/Cristian-Arroyave">Cristian Arroyave</a> 2018&nbsp;· GK</p><p><a href="/es/jugadores/4bd451cb/Anderson-Arroyo"><strong>Anderson Arroyo</strong></a> 2016-2025&nbsp;· DF&nbsp;· Burgos, Mirandés, Alavés, Andorra, Fortaleza FC</p><p><a href="/es/jugadores/f32f115d/Andres-Arroyo"><strong>Andrés Arroyo</strong></a> 2019-2025&nbsp;· MF&nbsp;· Deportes Tolima, Deportivo Cali, Jaguares de Córdoba</p><p><a href="/es/jugadores/d61afc59/Mauricio-Arroyo">Mauricio Arroyo</a> 2009-2010&nbsp;· MF&nbsp;· Real Cartagena</p><p><a href="/es/jugadores/21e21725/Sleater-Arroyo">Sleater Arroyo</a> 2015&nbsp;· FW</p><p><a href="/es/jugadores/27a94349/Felipe-Arteaga">Felipe Arteaga</a> 2024&nbsp;· FW</p><p><a href="/es/jugadores/0434aeeb/Jhonny-Arteaga">Jhonny Arteaga</a> 2011-2014&nbsp;· FW&nbsp;· Pittsburgh Riverhounds, FC New York, New York Red Bulls</p><p><a href="/es/jugadores/fceadb9b/Alejandro-Artunduaga"><strong>Alejandro Artunduaga</strong></a> 2017-2025&nbsp;· DF,MF&nbsp;· Bucaramanga, Águilas Doradas, Once Caldas, Deportivo Pereira, FC Sheriff Tiraspol</p><p><a href="/es/jugadores/983646dc/Ivan-Arturo-Corredor">Iván Arturo Corredor</a> 2015&nbsp;· MF&nbsp;· Independiente Medellín, Patriotas FC, La Equidad, Deportes Tolima</p><p><a href="/es/jugadores/54a66d75/Juan-Arturo">Juan Arturo</a> 2022&nbsp;· GK&nbsp;· Alianza Petrolera</p><p><a href="/es/jugadores/1df05b53/Luis-Arturo-Peralta">Luis Arturo Peralta</a> 2016-2019&nbsp;· FW&nbsp;· Sport Boys, Monagas, Deportes Tolima, Once Caldas, Gimnasia y Esgrima (LP)</p><p><a href="/es/jugadores/09087bd0/Victor-Arzaryus">Victor Arzaryus</a> 2018&nbsp;· FW</p><p><a href="/es/jugadores/94f02233/Martin-Arzuaga">Martín Arzuaga</a> 2003-2015&nbsp;· FW&nbsp;· José Gálvez, Junior, Universidad San Martín, Rosario Central, Godoy Cruz, Alianza Petrolera, Indepen</p><p><a href="/es/jugadores/d07ea180/Jose-Ascanio">José Ascanio</a> 2022&nbsp;· MF&nbsp;· Valour FC</p><p><a href="/es/jugadores/218d336c/Dairon-Asprilla"><strong>Dairon Asprilla</strong></a> 2015-2025&nbsp;· FW,MF&nbsp;· Atlético Nacional, Portland Timbers, Portland Timbers 2, Millonarios, Alianza Petrolera</p><p><a href="/es/jugadores/ec043e74/Faustino-Asprilla">Faustino Asprilla</a> 1992-1999&nbsp;· FW&nbsp;· Parma, Newcastle United, Colombia</p><p><a href="/es/jugadores/19f25826/Jayder-Asprilla">Jayder Asprilla</a> 2022-2024&nbsp;· FW&nbsp;· Atlético Nacional</p><p><a href="/es/jugadores/7efdb892/Jhoiner-Asprilla"><strong>Jhoiner Asprilla</strong></a> 2023&nbsp;· DF&nbsp;· América de Cali</p><p><a href="/es/jugadores/807fc771/Juan-Asprilla"><strong>Juan Asprilla</strong></a> 2018-2023&nbsp;· FW&nbsp;· Bucaramanga, Boyacá Chicó, América de Cali</p><p><a href="/es/jugadores/ec52f124/Julio-Cesar-Murillo-Asprilla"><strong>Julio César Murillo Asprilla</strong></a> 2019-2020&nbsp;· DF&nbsp;· Unión Magdalena</p><p><a href="/es/jugadores/8a2529d3/Samuel-Asprilla">Samuel Asprilla</a> 2022-2023&nbsp;· DF&nbsp;· Millonarios</p><p><a href="/es/jugadores/25f3fca2/Santiago-Asprilla">Santiago Asprilla</a> 2023&nbsp;· GK</p><p><a href="/es/jugadores/05936223/Weimar-Asprilla">Weimar Asprilla</a> 2020-2022&nbsp;· GK</p><p><a href="/es/jugadores/d139daf9/Yaser-Asprilla"><strong>Yaser Asprilla</strong></a> 2020-2026&nbsp;· FW,MF&nbsp;· Girona, Watford, Envigado FC, Colombia</p><p><a href="/es/jugadores/f415a521/Yuber-Asprilla">Yuber Asprilla</a> 2014-2022&nbsp;· FW,MF&nbsp;· Millonarios, Bucaramanga, Deportivo Pasto, Envigado FC, La Equidad, Alianza Petrolera, Atlético Huil</p><p><a href="/es/jugadores/5a4e19fa/Cesar-Assia">César Assia</a> 2016&nbsp;· MF&nbsp;· Boyacá Chicó</p><p><a href="/es/jugadores/60990b81/Eduard-Atuesta"><strong>Eduard Atuesta</strong></a> 2016-2025&nbsp;· MF&nbsp;· Orlando City, Los Angeles FC, Palmeiras, Independiente Medellín</p><p><a href="/es/jugadores/3ddca063/Juan-Avalo"><strong>Juan Ávalo</strong></a> 2022-2025&nbsp;· MF&nbsp;· Águilas Doradas</p><p><a href="/es/jugadores/2693f34c/Sergio-Avellaneda"><strong>Sergio Avellaneda</strong></a> 2024-2025&nbsp;· GK&nbsp;· Rayo Zuliano, Internacional de Barinas</p><p><a href="/es/jugadores/6931de7e/Sergio-Avellaneda">Sergio Avellaneda</a> 2015-2022&nbsp;· GK&nbsp;· Boyacá Chicó, Cúcuta Deportivo, Deportivo Pereira</p><p><a href="/es/jugadores/723c47dc/Edwin-Avila">Edwin Ávila</a> 2015-2018&nbsp;· DF&nbsp;· Jaguares de Córdoba, Boyacá Chicó, Defensor La Bocana</p><p><a href="/es/jugadores/7ec66d21/Felipe-Avila">Felipe Ávila</a> 2017-2024&nbsp;· MF&nbsp;· Patriotas FC, Libertad, Expreso Rojo, Gualaceo Sporting Club</p><p><a href="/es/jugadores/4f30df8e/Jonathan-Avila">Jonathan Ávila</a> 2015-2023&nbsp;· DF&nbsp;· Alianza Petrolera, Junior, Atlético Grau, Patriotas FC, Deportivo Pasto, Alianza Universidad, Bucara</p><p><a href="/es/jugadores/059976ed/Camilo-Ayala">Camilo Ayala</a> 2015-2024&nbsp;· MF&nbsp;· Deportivo Pasto, Deportivo Cali, Atlético Huila, América de Cali, La Equidad, Águilas Doradas</p><p><a href="/es/jugadores/1dd792a1/Sebastian-Ayala">Sebastián Ayala</a> 2014-2024&nbsp;· MF&nbsp;· Jaguares de Córdoba, La Equidad, Patriotas FC, Nacional, Deportivo Pasto, Millonarios</p><p><a href="/es/jugadores/4e068e23/Bryan-Ayovi">Bryan Ayoví</a> 2022&nbsp;· MF</p><p><a href="/es/jugadores/09a9e921/Carlos-Bacca"><strong>Carlos Bacca</strong></a> 2011-2025&nbsp;· FW&nbsp;· Junior, Villarreal, Sevilla, Milan, Club Brugge, Colombia, Granada</p><p><a href="/es/jugadores/0a6666ea/Miller-Bacca"><strong>Miller Bacca</strong></a> 2025&nbsp;· FW&nbsp;· Junior</p><p><a href="/es/jugadores/e5a5e144/Elexa-Bahr">Elexa Bahr</a> 2021-2024&nbsp;· FW&nbsp;· Racing Louisville, Colombia</p><p><a href="/es/jugadores/437b73a6/Andres-Balanta">Andrés Balanta</a> 2018-2022&nbsp;· MF&nbsp;· Deportivo Cali, Atlético Tucumán</p><p><a href="/es/jugadores/91f37c8f/Angelo-Balanta"><strong>Ángelo Balanta</strong></a> 2007-2024&nbsp;· FW,MF&nbsp;· Boreham Wood, Dagenham &amp; Redbridge, Milton Keynes Dons, Queens Park Rangers, Bristol Rovers, Wycombe</p><p><a href="/es/jugadores/017664f9/Deivy-Balanta">Deivy Balanta</a> 2015-2021&nbsp;· DF&nbsp;· Junior, Alianza Petrolera, Once Caldas, Millonarios</p><p><a href="/es/jugadores/6717c887/Gali-Balanta">Gali Balanta</a> 2022-2024&nbsp;· GK</p><p><a href="/es/jugadores/581b267d/Geimer-Balanta"><strong>Geimer Balanta</strong></a> 2017-2025&nbsp;· FW,MF&nbsp;· Universidad Técnica de Cajamarca, Boyacá Chicó, América de Cali, Alianza Petrolera</p><p><a href="/es/jugadores/69f720a0/Jhon-Balanta"><strong>Jhon Balanta</strong></a> 2021-2025&nbsp;· MF&nbsp;· Fortaleza FC, Deportes Quindío</p><p><a href="/es/jugadores/a5737fd0/Kevin-Balanta"><strong>Kevin Balanta</strong></a> 2015-2025&nbsp;· DF,MF&nbsp;· Tijuana, Defensa y Justicia, Deportivo Cali, Querétaro</p><p><a href="/es/jugadores/b4aaf59d/Kevin-Balanta">Kevin Balanta</a> 2024&nbsp;· MF&nbsp;· Fortaleza FC</p><p><a href="/es/jugadores/b062d6fd/Leyvin-Balanta"><strong>Leyvin Balanta</strong></a> 2015-2022&nbsp;· DF,MF&nbsp;· Santa Fe, Deportes Tolima, Once Caldas</p><p><a href="/es/jugadores/c1c62a24/Maicol-Balanta">Maicol Balanta</a> 2015-2023&nbsp;· FW,MF&nbsp;· Bucaramanga, Jaguares de Córdoba, Alianza Petrolera, Cortuluá, Junior, Santa Fe, Academia Puerto Cab</p><p><a href="/es/jugadores/333c2cc0/Marlon-Balanta"><strong>Marlon Balanta</strong></a> 2025&nbsp;· MF&nbsp;· Santa Fe</p><p><a href="/es/jugadores/46f21270/Cristian-Baldovino"><strong>Cristian Baldovino</strong></a> 2018-2025&nbsp;· GK&nbsp;· Boyacá Chicó</p><p><a href="/es/jugadores/ed23d77c/Deiber-Ballesteros">Deiber Ballesteros</a> 2015&nbsp;· FW&nbsp;· Uniautónoma FC</p><p><a href="/es/jugadores/eb3e9c55/Jhon-Balzan-Riascos"><strong>Jhon Balzan Riascos</strong></a> 2024-2025&nbsp;· FW&nbsp;· Stade Briochin</p><p><a href="/es/jugadores/1bdd12eb/Christian-Banguera">Christian Banguera</a> 2015&nbsp;· FW</p><p><a href="/es/jugadores/ae6581fe/Geovanni-Banguera"><strong>Geovanni Banguera</strong></a> 2015-2025&nbsp;· GK&nbsp;· Águilas Doradas, Atlético Huila, Jaguares de Córdoba, Santa Fe, Patriotas FC</p><p><a href="/es/jugadores/8bb4c92e/Jhon-Banguera"><strong>Jhon Banguera</strong></a> 2022-2025&nbsp;· DF&nbsp;· Lommel SK, Envigado FC</p><p><a href="/es/jugadores/de0e9837/Arlen-Banguero"><strong>Arlen Banguero</strong></a> 2025&nbsp;· DF&nbsp;· Boyacá Chicó</p><p><a href="/es/jugadores/731ba146/Danovis-Banguero"><strong>Danovis Banguero</strong></a> 2015-2025&nbsp;· DF,MF&nbsp;· Millonarios, Deportes Tolima, Atlético Nacional, Cúcuta Deportivo, Águilas Doradas, Atlético Huila</p><p><a href="/es/jugadores/ba74aad0/Eduard-Banguero"><strong>Eduard Banguero</strong></a> 2018-2025&nbsp;· DF&nbsp;· Boyacá Chicó</p><p><a href="/es/jugadores/8fcdca93/Fabian-Banguero"><strong>Fabian Banguero</strong></a> 2022-2024&nbsp;· MF&nbsp;· Patriotas FC</p><p><a href="/es/jugadores/42d6a3aa/Felipe-Banguero">Felipe Banguero</a> 2015-2022&nbsp;· DF&nbsp;· Millonarios, Alianza Petrolera, Deportivo Cali, Once Caldas, Águilas Doradas</p><p><a href="/es/jugadores/20a3e543/Cristian-Baquero"><strong>Cristian Baquero</strong></a> 2024&nbsp;· FW&nbsp;· Boyacá Chicó</p><p><a href="/es/jugadores/423aec31/Carlos-Barahona">Carlos Barahona</a> 2014&nbsp;· GK&nbsp;· Deportivo Pasto, Cortuluá, Envigado FC, Atlético Nacional, Cúcuta Deportivo</p><p><a href="/es/jugadores/cbdb8042/Shean-Barbosa">Shean Barbosa</a> 2023-2024&nbsp;· DF&nbsp;· Deportes Tolima</p><p><a href="/es/jugadores/5622ebc4/Angela-Baron"><strong>Ángela Barón</strong></a> 2021-2025&nbsp;· DF&nbsp;· Racing Louisville</p><p><a href="/es/jugadores/28e0dd74/Neider-Barona">Neider Barona</a> 2016-2022&nbsp;· MF&nbsp;· La Equidad</p><p><a href="/es/jugadores/0f9b6922/Michael-Barragan"><strong>Michael Barragán</strong></a> 2024-2025&nbsp;· GK&nbsp;· Fortaleza FC</p><p><a href="/es/jugadores/431d66c3/Miguel-Barragan">Miguel Barragán</a> 2017-2019&nbsp;· FW&nbsp;· Bucaramanga</p><p><a href="/es/jugadores/743d5a0e/Jaine-Barreiro"><strong>Jaine Barreiro</strong></a> 2016-2025&nbsp;· DF,MF&nbsp;· León, Deportes Quindío, Atlas, Pachuca, Santa Fe</p><p><a href="/es/jugadores/d64882b9/Jhon-Barreiro">Jhon Barreiro</a> 2023&nbsp;· DF</p><p><a href="/es/jugadores/7a514f80/Elkin-Barrera">Elkin Barrera</a> 2015-2017&nbsp;· MF&nbsp;· Jaguares de Córdoba, Expreso Rojo</p><p><a href="/es/jugadores/13ff0028/Jarlan-Barrera"><strong>Jarlan Barrera</strong></a> 2015-2025&nbsp;· FW,MF&nbsp;· Deportivo Cali, Atlético Nacional, Junior, Rosario Central</p><p><a href="/es/jugadores/7ce00840/Jeronimo-Barrera"><strong>Jerónimo Barrera</strong></a> 2024-2025&nbsp;· MF&nbsp;· Fortaleza FC</p><p><a href="/es/jugadores/abe7a9c6/Jordan-Barrera"><strong>Jordan Barrera</strong></a> 2023-2025&nbsp;· MF&nbsp;· Junior</p><p><a href="/es/jugadores/2b993895/Jarlinson-Barreto">Jarlinson Barreto</a> 2022&nbsp;· FW</p><p><a href="/es/jugadores/9964fc60/Oscar-Barreto"><strong>Oscar Barreto</strong></a> 2015-2025&nbsp;· MF&nbsp;· Unión Magdalena, Millonarios, Unión Comercio, La Equidad, Sport Huancayo, Rio Ave, Universidad César</p><p><a href="/es/jugadores/dde1bcdd/Stevens-Barreto">Stevens Barreto</a> 2018-2023&nbsp;· DF</p><p><a href="/es/jugadores/69b57d35/Cristian-Barrios"><strong>Cristian Barrios</strong></a> 2017-2025&nbsp;· FW,MF&nbsp;· América de Cali, Patriotas FC</p><p><a href="/es/jugadores/aa080378/Federico-Barrios"><strong>Federico Barrios</strong></a> 2019-2025&nbsp;· GK&nbsp;· Botev Vratsa</p><p><a href="/es/jugadores/c482786d/Javier-Barrios">Javier Barrios</a> 2018&nbsp;· MF</p><p><a href="/es/jugadores/5d19c4d9/Juan-Barrios">Juan Barrios</a> 2020&nbsp;· MF</p><p><a href="/es/jugadores/50c96cba/Mauricio-Barrios">Mauricio Barrios</a> 2016-2017&nbsp;· MF&nbsp;· Lamontville Golden Arrows</p><p><a href="/es/jugadores/df782c79/Michael-Barrios"><strong>Michael Barrios</strong></a> 2015-2025&nbsp;· FW,MF&nbsp;· Once Caldas, FC Dallas, Colorado Rapids, América de Cali, LA Galaxy, Uniautónoma FC</p><p><a href="/es/jugadores/8e7f49d3/Wilmar-Barrios"><strong>Wílmar Barrios</strong></a> 2015-2026&nbsp;· MF&nbsp;· Zenit, Deportes Tolima, Boca Juniors, Colombia</p><p><a href="/es/jugadores/d4fb4ae7/Jose-Barriosnuevo">José Barriosnuevo</a> 2017&nbsp;· DF&nbsp;· Cerro</p><p><a href="/es/jugadores/893441d1/Edwin-Fabricio-Castro-Barros"><strong>Edwin Fabricio Castro Barros</strong></a> 2015-2025&nbsp;· MF&nbsp;· Bucaramanga, Deportivo Cali, PAS Giannina, Apollon Smyrnis</p><p><a href="/es/jugadores/e4fe4f39/Luisbert-Barros">Luisbert Barros</a> 2017-2018&nbsp;· DF&nbsp;· Bucaramanga</p><p><a href="/es/jugadores/3e4722b0/Camilo-Bastidas">Camilo Bastidas</a> 2017&nbsp;· DF</p><p><a href="/es/jugadores/2ca7201b/Enmerson-Batalla"><strong>Enmerson Batalla</strong></a> 2020-2025&nbsp;· FW,MF&nbsp;· Juventude, Alianza Petrolera, América de Cali, Independiente Medellín, Santa Fe, Talleres</p><p><a href="/es/jugadores/b28a51ed/Neider-Batalla">Néider Batalla</a> 2015-2017&nbsp;· FW&nbsp;· Cortuluá</p><p><a href="/es/jugadores/ff625e8a/Andy-Batioja"><strong>Andy Batioja</strong></a> 2025&nbsp;· FW&nbsp;· Houston Dynamo</p><p><a href="/es/jugadores/b61ab3c5/Esteban-Bayona">Esteban Bayona</a> 2012-2013&nbsp;· FW&nbsp;· San Antonio Scorpions</p><p><a href="/es/jugadores/283da796/Julian-Bazan"><strong>Julián Bazán</strong></a> 2023-2025&nbsp;· DF&nbsp;· Deportivo Pereira</p><p><a href="/es/jugadores/6e571781/Elson-Becerra">Elson Becerra</a> 2022&nbsp;· MF</p><p><a href="/es/jugadores/af8e3247/Elson-Becerra">Elson Becerra</a> 2003&nbsp;· FW,MF&nbsp;· Colombia</p><p><a href="/es/jugadores/35b952d0/Jork-Becerra"><strong>Jork Becerra</strong></a> 2022-2023&nbsp;· MF&nbsp;· Bucaramanga, Zamora</p><p><a href="/es/jugadores/7ea4d0e2/Juan-Becerra">Juan Becerra</a> 2018-2023&nbsp;· FW&nbsp;· Envigado FC, Ponferradina</p><p><a href="/es/jugadores/6c34d34d/Luis-Becerra">Luis Becerra</a> 2023&nbsp;· MF</p><p><a href="/es/jugadores/c208e909/Luis-Becerra">Luis Becerra</a> 2021&nbsp;· DF&nbsp;· Atlético Huila</p><p><a href="/es/jugadores/14828662/Dan-Bedoya">Dan Bedoya</a> 2015-2023&nbsp;· MF&nbsp;· FC Tucson, New York Red Bulls II, Hartford Athletic</p><p><a href="/es/jugadores/a8222fd3/Gerardo-Bedoya">Gerardo Bedoya</a> 2003-2015&nbsp;· DF,MF&nbsp;· Millonarios, Santa Fe, Racing Club, Colón, Atlético Nacional, Puebla, Cúcuta Deportivo, Boyacá Chicó</p><p><a href="/es/jugadores/a0238428/Lorena-Bedoya">Lorena Bedoya</a> 2021-2024&nbsp;· MF&nbsp;· Colombia, Real Brasília FC</p><p><a href="/es/jugadores/9b19acce/Yefferson-Bedoya">Yefferson Bedoya</a> 2017-2018&nbsp;· FW&nbsp;· Aragua, Atlético Huila</p><p><a href="/es/jugadores/5c5fddd5/Yhonathan-Bedoya">Yhonathan Bedoya</a> 2017-2019&nbsp;· MF</p><p><a href="/es/jugadores/51ba6d03/Yordy-Bedoya">Yordy Bedoya</a> 2021-2022&nbsp;· MF&nbsp;· Šibenik</p><p><a href="/es/jugadores/4df3e96d/Breiner-Belalcazar">Bréiner Belalcázar</a> 2015-2016&nbsp;· MF&nbsp;· Deportivo Cali, Atlético Huila, Deportivo Pasto, La Equidad, Junior, Deportes Quindío, Deportes Toli</p><p><a href="/es/jugadores/34caca3c/Samuel-Bello"><strong>Samuel Bello</strong></a> 2024&nbsp;· DF&nbsp;· Patriotas FC</p><p><a href="/es/jugadores/4a11cb04/Eduar-Beltran"><strong>Eduar Beltrán</strong></a> 2025&nbsp;· GK&nbsp;· Unión Magdalena</p><p><a href="/es/jugadores/b3782457/Dayron-Benavides"><strong>Dayron Benavides</strong></a> 2017-2020&nbsp;· DF&nbsp;· Boyacá Chicó, Deportivo Pasto</p><p><a href="/es/jugadores/6cdb3f42/Nicolas-Benedetti"><strong>Nicolás Benedetti</strong></a> 2015-2025&nbsp;· FW,MF&nbsp;· Mazatlán, Deportivo Cali, América</p><p><a href="/es/jugadores/4d6e8522/Brayan-Benitez">Brayan Benítez</a> 2023&nbsp;· GK</p><p><a href="/es/jugadores/8f42c6aa/Jair-Benitez">Jair Benítez</a> 2009-2014&nbsp;· DF&nbsp;· FC Dallas, Deportivo Cali, Independiente Medellín, Colón</p><p><a href="/es/jugadores/bdc04731/Royner-Benitez"><strong>Royner Benítez</strong></a> 2023-2025&nbsp;· MF&nbsp;· Águilas Doradas</p><p><a href="/es/jugadores/6daa96b7/Gustavo-Benjumea"><strong>Gustavo Benjumea</strong></a> 2015&nbsp;· DF</p><p><a href="/es/jugadores/58907c8f/Leider-Berdugo"><strong>Leider Berdugo</strong></a> 2021-2025&nbsp;· MF&nbsp;· Junior</p><p><a href="/es/jugadores/5fd4fe62/Jorge-Bermudez">Jorge Bermúdez</a> 1998-2003&nbsp;· DF&nbsp;· Newell's Old Boys, Deportivo Pereira, Santa Fe, Olympiacos, Deportes Quindío, Colombia</p><p><a href="/es/jugadores/6627ce27/Jorge-Bermudez"><strong>Jorge Bermúdez</strong></a> 2020-2025&nbsp;· MF&nbsp;· Deportivo Pereira</p><p><a href="/es/jugadores/1ec154f5/Alejandro-Bernal">Alejandro Bernal</a> 2014-2019&nbsp;· MF&nbsp;· Atlético Nacional, Santa Fe, América de Cali, Bucaramanga, Deportivo Cali, Atlético Huila</p><p><a href="/es/jugadores/5a546ebb/Cristian-Berrio">Cristian Berrío</a> 2024&nbsp;· DF</p><p><a href="/es/jugadores/439397c3/Frey-Berrio"><strong>Frey Berrio</strong></a> 2025&nbsp;· DF&nbsp;· Envigado FC</p><p><a href="/es/jugadores/1987d146/Leider-Berrio"><strong>Léider Berrío</strong></a> 2022-2025&nbsp;· MF&nbsp;· Independiente Medellín, Junior, Deportivo Pereira</p><p><a href="/es/jugadores/7f629ffb/Manuel-Berrio">Manuel Berrio</a> 2015-2018&nbsp;· DF&nbsp;· Atlético Huila</p><p><a href="/es/jugadores/ae7bb5f5/Orlando-Berrio"><strong>Orlando Berrío</strong></a> 2014-2024&nbsp;· FW,MF&nbsp;· Atlético Nacional, Flamengo, Patriotas FC, Tacuary, Águilas Doradas, Millonarios, Colombia</p><p><a href="/es/jugadores/8701b4fd/Jhosuan-Berrios"><strong>Jhosuan Berríos</strong></a> 2024-2025&nbsp;· FW&nbsp;· Carabobo, Cerro</p><p><a href="/es/jugadores/b0756ecf/Diego-Betancourth">Diego Betancourth</a> 2021-2023&nbsp;· MF&nbsp;· Envigado FC</p><p><a href="/es/jugadores/f4f6b26c/Juan-Betancourth">Juan Betancourth</a> 2023&nbsp;· GK</p><p><a href="/es/jugadores/d2d0d100/Juan-Betancur">Juan Betancur</a> 2022&nbsp;· MF</p><p><a href="/es/jugadores/aac913de/Sebastian-Betancur">Sebastián Betancur</a> 2019-2021&nbsp;· MF&nbsp;· Envigado FC</p><p><a href="/es/jugadores/f5c986fb/Esteban-Betancurt">Esteban Betancurt</a> 2017&nbsp;· MF</p><p><a href="/es/jugadores/5e5f8874/Cristian-Blanco">Cristian Blanco</a> 2019-2024&nbsp;· DF&nbsp;· Bucaramanga, Atlético Nacional, Alianza Petrolera, Deportivo Pereira, Envigado FC</p><p><a href="/es/jugadores/b1e3ecb6/Elkin-Blanco">Elkin Blanco</a> 2015-2022&nbsp;· MF&nbsp;· Millonarios, Atlético Nacional, América de Cali, Orense, Oriente Petrolero, Once Caldas, Águilas Dor</p><p><a href="/es/jugadores/0dc4adf9/Camilo-Blanco-Florez">Camilo Blanco Flórez</a> 2016&nbsp;· DF&nbsp;· Fortaleza FC</p><p><a href="/es/jugadores/dcaa797b/Iker-Blanco">Iker Blanco</a> 2023-2024&nbsp;· GK</p><p><a href="/es/jugadores/20f2adb8/Jhonier-Blanco"><strong>Jhonier Blanco</strong></a> 2021-2024&nbsp;· FW&nbsp;· Águilas Doradas</p><p><a href="/es/jugadores/d7661110/Oswaldo-Blanco"><strong>Oswaldo Blanco</strong></a> 2021-2025&nbsp;· FW&nbsp;· Aurora, San Antonio Bulo Bulo, Atlético Palmaflor</p><p><a href="/es/jugadores/ac50e456/Ruyery-Blanco"><strong>Ruyery Blanco</strong></a> 2019-2025&nbsp;· FW&nbsp;· Unión Magdalena, Atlético Nacional, Alianza Petrolera, Delfín</p><p><a href="/es/jugadores/0ecec674/Andres-Blandon">Andrés Blandón</a> 2017&nbsp;· GK</p><p><a href="/es/jugadores/c486b0a0/Brayan-Blandon">Brayan Blandón</a> 2023&nbsp;· DF</p><p><a href="/es/jugadores/fc68b017/Christian-Blandon">Christian Blandon</a> 2015-2016&nbsp;· MF</p><p><a href="/es/jugadores/0422ea9f/Daniel-Bocanegra"><strong>Daniel Bocanegra</strong></a> 2014-2025&nbsp;· DF,MF&nbsp;· América de Cali, Atlético Nacional, Libertad, Atlético Huila, Independiente Medellín, Nacional, Colo</p><p><a href="/es/jugadores/51d3832b/Johan-Bocanegra"><strong>Johan Bocanegra</strong></a> 2018-2025&nbsp;· MF&nbsp;· Nacional Potosí, Deportivo Pereira, Cortuluá, Junior, Bucaramanga</p><p><a href="/es/jugadores/00e58b20/Jorge-Bolano">Jorge Bolaño</a> 1998-2009&nbsp;· MF&nbsp;· Parma, Cúcuta Deportivo, Modena, Lecce</p><p><a href="/es/jugadores/6f0e5a67/Edward-Bolanos"><strong>Edward Bolaños</strong></a> 2019-2022&nbsp;· FW&nbsp;· Patriotas FC</p><p><a href="/es/jugadores/506cd6a6/Hernandez-Bolanos">Hernández Bolaños</a> 2015&nbsp;· GK</p><p><a href="/es/jugadores/85befe3f/Gustavo-Bolivar">Gustavo Bolívar</a> 2014-2017&nbsp;· MF&nbsp;· Deportes Tolima, Envigado FC, Cúcuta Deportivo, Deportivo Pasto, Águilas Doradas, Al-Hilal, Alianza </p><p><a href="/es/jugadores/0d89b44b/Roberto-Bolivar">Roberto Bolívar</a> 2016&nbsp;· FW&nbsp;· Llaneros</p><p><a href="/es/jugadores/8d2f6bfe/Angel-Bonilla">Ángel Bonilla</a> 2017-2019&nbsp;· FW&nbsp;· Expreso Rojo</p><p><a href="/es/jugadores/8714e42d/Arley-Bonilla"><strong>Arley Bonilla</strong></a> 2017-2021&nbsp;· MF&nbsp;· Expreso Rojo, Patriotas FC</p><p><a href="/es/jugadores/21973c69/Breyner-Bonilla">Breyner Bonilla</a> 2015-2016&nbsp;· DF&nbsp;· Deportes Tolima, Bucaramanga, Cúcuta Deportivo, Sporting Cristal, Fortaleza FC, Defensor Sporting, B</p><p><a href="/es/jugadores/d7f032a0/Cristian-Bonilla">Cristian Bonilla</a> 2015-2022&nbsp;· GK&nbsp;· La Equidad, Atlético Nacional, Boyacá Chicó, Al-Fayha, San Antonio FC</p><p><a href="/es/jugadores/5d482ee8/Jafeb-Bonilla">Jafeb Bonilla</a> 2015&nbsp;· GK</p><p><a href="/es/jugadores/c0d5bb7c/Luis-Bonilla">Luis Bonilla</a> 2018&nbsp;· MF&nbsp;· Patriotas FC</p><p><a href="/es/jugadores/5e3bd07a/Victor-Bonilla">Víctor Bonilla</a> 1999-2003&nbsp;· FW&nbsp;· Toulouse, Real Sociedad, Cortuluá, Deportes Quindío, Montpellier, América de Cali, Barcelona, Nantes</p><p><a href="/es/jugadores/17e0417b/Wendy-Bonilla">Wendy Bonilla</a> 2019-2024&nbsp;· MF</p><p><a href="/es/jugadores/2c4f5038/Cristian-Borja"><strong>Cristian Borja</strong></a> 2010-2025&nbsp;· FW&nbsp;· Águilas Doradas, LDU Quito, América de Cali, Veracruz, Universidad Católica, Red Star, Santa Fe, Pat</p><p><a href="/es/jugadores/9d7d5334/Cristian-Borja"><strong>Cristian Borja</strong></a> 2015-2026&nbsp;· DF&nbsp;· América, Braga, Cortuluá, Sporting CP, Santa Fe, Toluca, Alanyaspor, Colombia</p><p><a href="/es/jugadores/22ac0fe6/Hadier-Borja">Hadier Borja</a> 2016-2023&nbsp;· DF&nbsp;· Atlético Nacional, Bucaramanga</p><p><a href="/es/jugadores/211dc5fd/Miguel-Borja"><strong>Miguel Borja</strong></a> 2013-2025&nbsp;· FW&nbsp;· River Plate, Palmeiras, Junior, Santa Fe, Colombia, Atlético Nacional, Grêmio, Cortuluá, Club Olimpo</p><p><a href="/es/jugadores/c68da769/Rafael-Borre"><strong>Rafael Borré</strong></a> 2015-2026&nbsp;· FW&nbsp;· Internacional, River Plate, Eintracht Frankfurt, Colombia, Deportivo Cali, Villarreal, Werder Bremen</p><p><a href="/es/jugadores/a72d14de/Dylan-Borrero"><strong>Dylan Borrero</strong></a> 2019-2025&nbsp;· FW,MF&nbsp;· Fortaleza, New England Revolution, Atlético Mineiro, Santa Fe, Colombia</p><p><a href="/es/jugadores/7f43fafa/Jairo-Borrero">Jairo Borrero</a> 2021&nbsp;· MF&nbsp;· Deportes Quindío</p><p><a href="/es/jugadores/209e188b/Camilo-Botero">Camilo Botero</a> 2017&nbsp;· DF</p><p><a href="/es/jugadores/427df3a6/Wilmer-Boyaca">Wilmer Boyacá</a> 2016-2017&nbsp;· DF&nbsp;· Fortaleza FC, Boyacá Chicó</p><p><a href="/es/jugadores/49c5075f/Gabriel-Bran">Gabriel Bran</a> 2021&nbsp;· GK</p><p><a href="/es/jugadores/860ea3c0/Pedro-Bravo"><strong>Pedro Bravo</strong></a> 2021-2025&nbsp;· MF&nbsp;· Midtjylland, América de Cali</p><p><a href="/es/jugadores/f9cbed7b/John-Breyner-Caicedo">John Breyner Caicedo</a> 2017&nbsp;· GK</p><p><a href="/es/jugadores/b8b53832/Daniel-Briceno">Daniel Briceño</a> 2015-2019&nbsp;· DF&nbsp;· Deportivo Cali, Deportes Tolima, La Equidad, Deportivo Pasto, Junior, Alianza Petrolera, Patriotas F</p><p><a href="/es/jugadores/a8d830ff/Oscar-Briceno">Oscar Briceño</a> 2015-2016&nbsp;· FW&nbsp;· Millonarios, Deportivo Pasto, Deportes Tolima, Alianza Atlético</p><p><a href="/es/jugadores/b578a04d/Victor-Brid"><strong>Victor Brid</strong></a> 2020-2024&nbsp;· GK</p><p><a href="/es/jugadores/d3aa80bc/Ramiro-Brochero">Ramiro Brochero</a> 2023-2024&nbsp;· FW&nbsp;· Millonarios</p><p><a href="/es/jugadores/f399e412/Williams-Buenanos">Williams Buenaños</a> 2015&nbsp;· GK&nbsp;· Jaguares de Córdoba, Cúcuta Deportivo</p><p><a href="/es/jugadores/14777ddd/Didier-Bueno">Didier Bueno</a> 2021-2023&nbsp;· DF&nbsp;· La Equidad, Independiente Medellín</p><p><a href="/es/jugadores/a0c282c0/Jose-Bueno"><strong>José Bueno</strong></a> 2020&nbsp;· DF</p><p><a href="/es/jugadores/75c1b77e/Daniel-Buitrago"><strong>Daniel Buitrago</strong></a> 2011-2024&nbsp;· FW&nbsp;· Cortuluá, Universidad Católica, Santa Fe, América de Cali, Spartak Nalchik, Atlético Venezuela, El F</p><p><a href="/es/jugadores/af143439/Esteban-Buitrago">Esteban Buitrago</a> 2021&nbsp;· MF</p><p><a href="/es/jugadores/96039dec/Julian-Buitrago">Julián Buitrago</a> 2018-2020&nbsp;· MF&nbsp;· Patriotas FC</p><p><a href="/es/jugadores/6ad97389/Christian-Bulla">Christian Bulla</a> 2016&nbsp;· MF</p><p><a href="/es/jugadores/61ba1527/Faider-Burbano">Fáider Burbano</a> 2015-2021&nbsp;· FW,MF&nbsp;· Envigado FC, Independiente Medellín, Santa Fe, Bucaramanga, Once Caldas, Águilas Doradas, Rampla Jun</p><p><a href="/es/jugadores/a0596e4f/Hernan-Burbano">Hernán Burbano</a> 2012-2020&nbsp;· FW,MF&nbsp;· León, UANL, Deportivo Cali, Atlas, Cúcuta Deportivo, Santa Fe, Aldosivi</p><p><a href="/es/jugadores/13d16dcc/Michael-Bustamante">Michael Bustamante</a> 2013-2015&nbsp;· MF&nbsp;· New York Red Bulls, Charlotte Independence</p><p><a href="/es/jugadores/b40d1559/Rafael-Bustamante"><strong>Rafael Bustamante</strong></a> 2018-2025&nbsp;· MF&nbsp;· Deportivo Cali, Jaguares de Córdoba, Vizela</p><p><a href="/es/jugadores/7338dab8/Julian-Bustos">Julian Bustos</a> 2020-2021&nbsp;· MF</p><p><a href="/es/jugadores/59c29871/Jhon-Cabal"><strong>Jhon Cabal</strong></a> 2022-2025&nbsp;· FW&nbsp;· Deportivo Cali</p><p><a href="/es/jugadores/38e62c84/Felipe-Caballero">Felipe Caballero</a> 2023&nbsp;· FW</p><p><a href="/es/jugadores/5cca082c/Johan-Caballero"><strong>Johan Caballero</strong></a> 2018-2025&nbsp;· FW,MF&nbsp;· Águilas Doradas, Bucaramanga, Santa Fe</p><p><a href="/es/jugadores/fd699222/Alvaro-Cabas">Álvaro Cabas</a> 2015&nbsp;· FW</p><p><a href="/es/jugadores/bf3a0cf9/Gian-Cabezas"><strong>Gian Cabezas</strong></a> 2021-2025&nbsp;· MF&nbsp;· Deportivo Cali</p><p><a href="/es/jugadores/9c58e928/James-Cabezas">James Cabezas</a> 2014-2016&nbsp;· FW&nbsp;· Trujillanos, Alianza Atlético, América de Cali, Mineros, Caracas</p><p><a href="/es/jugadores/d4f1cfb5/Jorge-Cabezas">Jorge Cabezas</a> 2023-2024&nbsp;· MF&nbsp;· Independiente Medellín, New York Red Bulls, Gillingham</p><p><a href="/es/jugadores/1fbe2d25/Oscar-Cabezas"><strong>Óscar Cabezas</strong></a> 2017-2023&nbsp;· DF&nbsp;· Patriotas FC, Rosario Central</p><p><a href="/es/jugadores/9ea2208c/Victor-Cabezas"><strong>Víctor Cabezas</strong></a> 2016-2025&nbsp;· GK&nbsp;· Deportivo Pasto, Atlético Huila</p><p><a href="/es/jugadores/09d98c78/David-Cabrera">David Cabrera</a> 2018-2019&nbsp;· MF&nbsp;· Rio Grande Valley Toros</p><p><a href="/es/jugadores/0d6351d9/Norman-Cabrera">Norman Cabrera</a> 2015-2018&nbsp;· FW&nbsp;· Estudiantes de Caracas, Boyacá Chicó, Estudiantes de Mérida, América de Cali, La Equidad</p><p><a href="/es/jugadores/e93154a0/Wilmer-Cabrera">Wílmer Cabrera</a> 1990-1998&nbsp;· DF,MF&nbsp;· Colombia</p><p><a href="/es/jugadores/481168c5/Yesus-Cabrera"><strong>Yesus Cabrera</strong></a> 2016-2025&nbsp;· FW,MF&nbsp;· Deportivo Pereira, América de Cali, Deportivo Pasto, Junior, Once Caldas, Cuiabá, Real Cartagena</p><p><a href="/es/jugadores/005fcf57/Alex-Caceres">Alex Caceres</a> 2013&nbsp;· MF&nbsp;· Atlanta Silverbacks</p><p><a href="/es/jugadores/e78e9ae0/Andres-Cadavid">Andrés Cadavid</a> 2012-2024&nbsp;· DF&nbsp;· Independiente Medellín, Millonarios, Envigado FC, América de Cali, Deportivo Cali, San Luis, Colón, </p><p><a href="/es/jugadores/7cbb6ce7/Julian-Cadavid">Julián Cadavid</a> 2019&nbsp;· MF</p><p><a href="/es/jugadores/a56c747c/Ricardo-Cadavid">Ricardo Cadavid</a> 2015&nbsp;· DF</p><p><a href="/es/jugadores/8196dcc4/Arled-Cadavid-Valencia"><strong>Arled Cadavid Valencia</strong></a> 2018-2024&nbsp;· GK&nbsp;· Leones FC, América de Cali, Águilas Doradas, Jaguares de Córdoba</p><p><a href="/es/jugadores/3dea8df3/Bayron-Caicedo"><strong>Bayron Caicedo</strong></a> 2024-2025&nbsp;· FW&nbsp;· La Equidad</p><p><a href="/es/jugadores/880e4b93/Brandon-Caicedo">Brandon Caicedo</a> 2019-2023&nbsp;· DF&nbsp;· Atlético Huila, Atlético Nacional</p><p><a href="/es/jugadores/83305421/Cesar-Caicedo">César Caicedo</a> 2014-2019&nbsp;· FW&nbsp;· Patriotas FC, General Caballero</p><p><a href="/es/jugadores/9c9898ee/Cristian-Caicedo"><strong>Cristian Caicedo</strong></a> 2024-2025&nbsp;· FW&nbsp;· Perth Glory</p><p><a href="/es/jugadores/9bfa2f52/Deiber-Caicedo"><strong>Deiber Caicedo</strong></a> 2018-2025&nbsp;· FW,MF&nbsp;· Junior, Vancouver Whitecaps FC, Deportivo Cali</p><p><a href="/es/jugadores/7d8dd269/Eduar-Caicedo">Eduar Caicedo</a> 2015-2023&nbsp;· DF&nbsp;· Deportivo Cali, Deportes Tolima, Cortuluá, Cúcuta Deportivo</p><p><a href="/es/jugadores/c53153d1/Jhon-Caicedo">Jhon Caicedo</a> 2022&nbsp;· FW</p><p><a href="/es/jugadores/74ec9f9d/Jhonathan-Caicedo"><strong>Jhonathan Caicedo</strong></a> 2015-2024&nbsp;· MF&nbsp;· Real Santa Cruz, La Equidad, Once Caldas, Atlético Huila, Envigado FC</p><p><a href="/es/jugadores/5f634a30/Johan-Caicedo"><strong>Johan Caicedo</strong></a> 2022-2025&nbsp;· MF&nbsp;· Deportivo Pasto</p><p><a href="/es/jugadores/77bc9c1f/Jorge-Caicedo">Jorge Caicedo</a> 2018-2019&nbsp;· DF&nbsp;· Punjab</p><p><a href="/es/jugadores/4b583a34/Jose-Caicedo"><strong>José Caicedo</strong></a> 2019-2025&nbsp;· MF&nbsp;· Pumas UNAM, Santa Fe</p><p><a href="/es/jugadores/a838f9e9/Juan-Caicedo"><strong>Juan Caicedo</strong></a> 2018-2024&nbsp;· MF&nbsp;· Deportivo Cali, Patriotas FC, Cortuluá, Cúcuta Deportivo</p><p><a href="/es/jugadores/c1438531/Juan-Caicedo">Juan Caicedo</a> 2016-2020&nbsp;· DF&nbsp;· Patriotas FC, Santos Laguna</p><p><a href="/es/jugadores/e8bf2782/Julio-Caicedo">Julio Caicedo</a> 2017-2019&nbsp;· FW&nbsp;· Alianza Atlético, Cobresol, Bucaramanga, Cúcuta Deportivo, Juan Aurich, Trujillanos, Técnico Univers</p><p><a href="/es/jugadores/5c70e603/Kelly-Caicedo">Kelly Caicedo</a> 2019-2024&nbsp;· MF&nbsp;· Colombia</p><p><a href="/es/jugadores/c02c8ad5/Kevin-Caicedo">Kevin Caicedo</a> 2021&nbsp;· FW</p><p><a href="/es/jugadores/3b244ec5/Linda-Caicedo"><strong>Linda Caicedo</strong></a> 2019-2025&nbsp;· FW,MF&nbsp;· Real Madrid, Colombia</p><p><a href="/es/jugadores/008ddeb9/Luis-Caicedo">Luís Caicedo</a> 2015-2023&nbsp;· MF&nbsp;· Cortuluá, New England Revolution, Houston Dynamo</p><p><a href="/es/jugadores/58ea4cad/Luis-Caicedo"><strong>Luis Caicedo</strong></a> 2018-2025&nbsp;· FW&nbsp;· Progreso</p><p><a href="/es/jugadores/2d5855d6/Luis-Caicedo-Mesu">Luis Caicedo Mesu</a> 2024&nbsp;· FW</p><p><a href="/es/jugadores/0b72ba56/Oscar-Caicedo">Óscar Caicedo</a> 2015&nbsp;· FW&nbsp;· Cúcuta Deportivo</p><p><a href="/es/jugadores/f151963c/Rogerio-Caicedo"><strong>Rogerio Caicedo</strong></a> 2018-2025&nbsp;· GK&nbsp;· Boyacá Chicó</p><p><a href="/es/jugadores/b1077f24/Royer-Caicedo"><strong>Royer Caicedo</strong></a> 2024-2025&nbsp;· DF&nbsp;· Atlético Nacional</p><p><a href="/es/jugadores/730ed097/Delman-Cajiao">Delman Cajiao</a> 2015-2017&nbsp;· MF</p><p><a href="/es/jugadores/34fb3326/Jose-Caldera"><strong>José Caldera</strong></a> 2021-2025&nbsp;· DF&nbsp;· Deportivo Cali</p><p><a href="/es/jugadores/fa0f3441/Diego-Calderon-Caicedo">Diego Calderón Caicedo</a> 2018-2019&nbsp;· FW&nbsp;· Al-Faisaly</p><p><a href="/es/jugadores/0282c468/Luis-Calderon">Luis Calderón</a> 2016-2017&nbsp;· DF&nbsp;· Deportivo Cali, Deportivo Municipal</p><p><a href="/es/jugadores/9a179298/Juan-Calero"><strong>Juan Calero</strong></a> 2014-2022&nbsp;· FW&nbsp;· Pachuca, León, Gil Vicente</p><p><a href="/es/jugadores/ca3ddd55/Miguel-Calero">Miguel Calero</a> 1998-2012&nbsp;· GK&nbsp;· Pachuca</p><p><a href="/es/jugadores/947214b0/Miguel-Calero-Ordonez">Miguel Calero Ordóñez</a> 2016&nbsp;· GK</p><p><a href="/es/jugadores/732fa774/Elkin-Calle">Elkin Calle</a> 2014-2015&nbsp;· DF&nbsp;· Atlético Nacional, Deportivo Cali, Once Caldas, Independiente Medellín, Atlético Huila, Deportivo Pe</p><p><a href="/es/jugadores/a3bb73dd/Ignacio-Calle">Ignacio Calle</a> 1962&nbsp;· DF</p><p><a href="/es/jugadores/6e2c64bf/Javier-Calle">Javier Calle</a> 2015-2023&nbsp;· FW,MF&nbsp;· Independiente Medellín, New York City FC, Boyacá Chicó, Destroyers</p><p><a href="/es/jugadores/c3365c6c/Juan-Calle"><strong>Juan Calle</strong></a> 2024&nbsp;· DF</p><p><a href="/es/jugadores/3938c618/Adrian-Camacho">Adrián Camacho</a> 2024&nbsp;· MF</p><p><a href="/es/jugadores/058872e4/David-Camacho"><strong>David Camacho</strong></a> 2017-2025&nbsp;· FW,MF&nbsp;· Fortaleza FC, La Equidad</p><p><a href="/es/jugadores/f5ac4d65/Edgard-Camargo"><strong>Edgard Camargo</strong></a> 2021-2025&nbsp;· MF&nbsp;· Boyacá Chicó, Deportivo Cali</p><p><a href="/es/jugadores/66b1d91e/Isaac-Camargo"><strong>Isaac Camargo</strong></a> 2022-2025&nbsp;· FW&nbsp;· CDC Santa Rosa, Unión Magdalena, Alianza Petrolera, Deportivo Cali</p><p><a href="/es/jugadores/48a6346d/Diber-Cambindo"><strong>Diber Cambindo</strong></a> 2021-2025&nbsp;· FW&nbsp;· Necaxa, Independiente Medellín, Cruz Azul, América de Cali</p><p><a href="/es/jugadores/09d9f0bc/Juan-Camilo-Angulo"><strong>Juan Camilo Angulo</strong></a> 2015-2025&nbsp;· DF&nbsp;· Deportivo Cali, América de Cali, Shanghai Shenhua, Cúcuta Deportivo, Unión Magdalena, Deportes Tolim</p><p><a href="/es/jugadores/cca6ac71/Juan-Camilo-Bolanos">Juan Camilo Bolaños</a> 2015-2017&nbsp;· DF&nbsp;· Cortuluá</p><p><a href="/es/jugadores/f3f4c2e3/Juan-Camilo-Chaverra"><strong>Juan Camilo Chaverra</strong></a> 2017-2025&nbsp;· GK&nbsp;· Alianza Petrolera, Bucaramanga, Cúcuta Deportivo, Deportes Tolima</p><p><a href="/es/jugadores/82cc00b0/Christian-Camilo-Huerfano">Christian Camilo Huérfano</a> 2017-2021&nbsp;· MF&nbsp;· Millonarios, Patriotas FC</p><p><a href="/es/jugadores/479eaff5/Juan-Camilo-Mesa"><strong>Juan Camilo Mesa</strong></a> 2017-2023&nbsp;· DF&nbsp;· Šibenik, América de Cali</p><p><a href="/es/jugadores/10af93d4/Juan-Camilo-Mosquera"><strong>Juan Camilo Mosquera</strong></a> 2022-2025&nbsp;· FW&nbsp;· Bucaramanga, Cortuluá</p><p><a href="/es/jugadores/dd8a7a59/Oscar-Camilo">Oscar Camilo</a> 2016-2017&nbsp;· FW&nbsp;· Cortuluá</p><p><a href="/es/jugadores/ad49f7fb/Juan-Camilo-Portilla"><strong>Juan Camilo Portilla</strong></a> 2019-2026&nbsp;· MF&nbsp;· Talleres, América de Cali, Alianza Petrolera, Colombia</p><p><a href="/es/jugadores/6552476d/Bryan-Camilo-Reyes">Bryan Camilo Reyes</a> 2015-2017&nbsp;· MF&nbsp;· Audax Italiano</p><p><a href="/es/jugadores/b92c19cf/Juan-Camilo-Roa"><strong>Juan Camilo Roa</strong></a> 2015-2024&nbsp;· MF&nbsp;· Deportivo Pasto, Cortuluá, Jaguares de Córdoba, Junior</p><p><a href="/es/jugadores/b4a2baab/Juan-Camilo-Saiz">Juan Camilo Saiz</a> 2015-2022&nbsp;· DF&nbsp;· Independiente Medellín, Envigado FC, Cerro Porteño, Argentinos Juniors, Deportes Tolima</p><p><a href="/es/jugadores/26e0e19d/Juan-Camilo-Vela">Juan Camilo Vela</a> 2016-2021&nbsp;· MF&nbsp;· Deportes Quindío, Boyacá Chicó, Jaguares de Córdoba, Atlético Huila, Real Santa Cruz</p><p><a href="/es/jugadores/832377d2/Juan-Camilo-Zapata"><strong>Juan Camilo Zapata</strong></a> 2015-2025&nbsp;· FW,MF&nbsp;· Universidad Central, Internacional de Barinas, Envigado FC, Cape Town City</p><p><a href="/es/jugadores/b116b406/Johan-Campana"><strong>Johan Campaña</strong></a> 2020-2025&nbsp;· FW&nbsp;· Deportivo Pasto</p><p><a href="/es/jugadores/cded28f9/Brayan-Campaz">Brayan Campáz</a> 2024&nbsp;· FW</p><p><a href="/es/jugadores/8d5ceef2/Jaminton-Campaz"><strong>Jaminton Campaz</strong></a> 2017-2026&nbsp;· FW,MF&nbsp;· Rosario Central, Deportes Tolima, Grêmio, Colombia</p><p><a href="/es/jugadores/a89aaa05/Mike-Campaz">Mike Campaz</a> 2015&nbsp;· MF&nbsp;· Deportes Tolima, Boyacá Chicó, Once Caldas, Santa Fe</p><p><a href="/es/jugadores/d70bbde6/Yunior-Campo">Yunior Campo</a> 2019&nbsp;· MF</p><p><a href="/es/jugadores/5ca52045/Jorman-Campuzano"><strong>Jorman Campuzano</strong></a> 2018-2025&nbsp;· MF&nbsp;· Atlético Nacional, Boca Juniors, Giresunspor, Colombia</p><p><a href="/es/jugadores/4150025f/Roger-Canas"><strong>Roger Cañas</strong></a> 2010-2017&nbsp;· MF&nbsp;· Independiente Medellín, Sibir Novosibirsk, FC Astana, FC Shakhter Karagandy</p><p><a href="/es/jugadores/dc048ab5/Leider-Canate">Leider Cañate</a> 2016&nbsp;· MF</p><p><a href="/es/jugadores/852a3a15/Faber-Canaveral">Faber Cañaveral</a> 2015-2018&nbsp;· MF&nbsp;· Envigado FC, Once Caldas, Bucaramanga, Junior</p><p><a href="/es/jugadores/6d490e7a/Andres-Canchano">Andrés Canchano</a> 2019&nbsp;· DF</p><p><a href="/es/jugadores/eb18a722/Harrison-Canchimbo">Harrison Canchimbo</a> 2015-2019&nbsp;· DF&nbsp;· Deportivo Pasto, Alianza Petrolera, Deportivo Cali, América de Cali</p><p><a href="/es/jugadores/dbbac7a1/Joel-Canchimbo"><strong>Joel Canchimbo</strong></a> 2024-2025&nbsp;· FW&nbsp;· Junior</p><p><a href="/es/jugadores/d5fd0a04/Vincenzo-Candela">Vincenzo Candela</a> 2018-2023&nbsp;· MF&nbsp;· Charleston Battery, South Georgia Tormenta FC, Richmond Kickers</p><p><a href="/es/jugadores/6710d34b/Daniel-Candelo">Daniel Candelo</a> 2022-2023&nbsp;· MF</p><p><a href="/es/jugadores/ab3bfc1c/Mayer-Candelo">Mayer Candelo</a> 2014-2018&nbsp;· MF&nbsp;· Millonarios, Universitario, Deportivo Cali, Juan Aurich, Universidad César Vallejo, Cortuluá, Univer</p><p><a href="/es/jugadores/ea35ffb9/Yerson-Candelo"><strong>Yerson Candelo</strong></a> 2014-2025&nbsp;· DF,MF&nbsp;· América de Cali, Atlético Nacional, Deportivo Cali, Querétaro, Aucas</p><p><a href="/es/jugadores/3b21ee62/Cristian-Canga">Cristian Canga</a> 2015-2021&nbsp;· FW&nbsp;· Atlético Huila, Cúcuta Deportivo, Metropolitanos, Cienciano</p><p><a href="/es/jugadores/ff38f292/Cristhian-Canizales">Cristhian Canizales</a> 2016-2018&nbsp;· MF&nbsp;· Boyacá Chicó</p><p><a href="/es/jugadores/24a1ea8f/Gustavo-Canizalez-Amor">Gustavo Cañizalez Amor</a> 2019&nbsp;· MF</p><p><a href="/es/jugadores/1665cb7c/Nicolas-Canizares-Aldana">Nicolás Cañizares Aldana</a> 2016&nbsp;· MF</p><p><a href="/es/jugadores/6e83c737/Agustin-Cano">Agustín Cano</a> 2020-2024&nbsp;· MF&nbsp;· Atlético Nacional</p><p><a href="/es/jugadores/ce7343b7/Danny-Cano">Danny Cano</a> 2016-2022&nbsp;· DF&nbsp;· Deportivo Pereira, Bucaramanga</p><p><a href="/es/jugadores/bfc7996a/Jesus-Cano"><strong>Jesús Cano</strong></a> 2023&nbsp;· DF</p><p><a href="/es/jugadores/99716a8a/Jhony-Cano">Jhony Cano</a> 2015-2018&nbsp;· FW&nbsp;· La Equidad, Atlético Huila, Bucaramanga, Águilas Doradas, Jaguares de Córdoba, Real Cartagena, Orien</p><p><a href="/es/jugadores/a4b44b7d/Mateo-Cano">Mateo Cano</a> 2020-2022&nbsp;· MF&nbsp;· Deportivo Pereira, Bucaramanga</p><p><a href="/es/jugadores/6281ad90/Sneider-Cano">Sneider Cano</a> 2021&nbsp;· MF</p><p><a href="/es/jugadores/c89f71e2/Manuel-Canon"><strong>Manuel Cañón</strong></a> 2025&nbsp;· DF&nbsp;· Yaracuyanos FC</p><p><a href="/es/jugadores/ea11b08c/Cristian-Canozales"><strong>Cristián Cañozales</strong></a> 2021-2025&nbsp;· FW&nbsp;· Carabobo, Always Ready, Everton</p><p><a href="/es/jugadores/1e070f32/Jorge-Cante">Jorge Cante</a> 2021&nbsp;· MF&nbsp;· Atlético Huila</p><p><a href="/es/jugadores/39fd2c86/Aldair-Cantillo">Aldair Cantillo</a> 2023-2024&nbsp;· DF&nbsp;· Real Tomayapo, Atlético Huila, Bucaramanga</p><p><a href="/es/jugadores/6ba69171/Carlos-Cantillo"><strong>Carlos Cantillo</strong></a> 2024-2025&nbsp;· MF&nbsp;· Junior</p><p><a href="/es/jugadores/0b21eb93/Fabian-Cantillo"><strong>Fabián Cantillo</strong></a> 2019-2025&nbsp;· MF&nbsp;· Unión Magdalena</p><p><a href="/es/jugadores/42496587/Juan-Cantillo"><strong>Juan Cantillo</strong></a> 2024-2025&nbsp;· FW&nbsp;· Deportivo Cali</p><p><a href="/es/jugadores/a86e634e/Nelson-Cantillo"><strong>Nelson Cantillo</strong></a> 2025&nbsp;· DF&nbsp;· Llaneros</p><p><a href="/es/jugadores/45075f2f/Victor-Cantillo"><strong>Víctor Cantillo</strong></a> 2017-2025&nbsp;· MF&nbsp;· Huracán, Junior, Corinthians, Deportivo Pasto, Atlético Nacional</p><p><a href="/es/jugadores/4c982d12/Jonathan-Capacho">Jonathan Capacho</a> 2017-2018&nbsp;· FW</p><p><a href="/es/jugadores/8071321e/Andres-Carabali">Andrés Carabalí</a> 2024&nbsp;· FW&nbsp;· Independiente Petrolero, Academia Puerto Cabello</p><p><a href="/es/jugadores/a31bc204/Brayan-Carabali"><strong>Brayan Carabalí</strong></a> 2019-2025&nbsp;· DF&nbsp;· Deportivo Pasto, Unión Magdalena</p><p><a href="/es/jugadores/aec544bc/Jorelyn-Carabali"><strong>Jorelyn Carabalí</strong></a> 2021-2025&nbsp;· DF&nbsp;· Brighton &amp; Hove Albion, Colombia, CA Mineiro</p><p><a href="/es/jugadores/28959c01/Juan-Carabali">Juan Carabalí</a> 2016-2017&nbsp;· DF&nbsp;· Cortuluá</p><p><a href="/es/jugadores/57051f28/Juan-Carabali">Juan Carabalí</a> 2021-2023&nbsp;· FW&nbsp;· Deportes Tolima</p><p><a href="/es/jugadores/8282a692/Juan-Carabali">Juan Carabali</a> 2024&nbsp;· MF</p><p><a href="/es/jugadores/3e72ef25/Yeison-Carabali"><strong>Yeison Carabali</strong></a> 2019-2021&nbsp;· MF&nbsp;· Deportes Quindío, Cúcuta Deportivo</p><p><a href="/es/jugadores/6cb4ed06/Daniela-Caracas"><strong>Daniela Caracas</strong></a> 2018-2025&nbsp;· DF&nbsp;· Espanyol, Colombia</p><p><a href="/es/jugadores/11af1c57/Carlos-Carbonero">Carlos Carbonero</a> 2014-2019&nbsp;· MF&nbsp;· Arsenal de Sarandí, Atlético Huila, River Plate, Once Caldas, Cesena, Sampdoria, Deportivo Cali, Est</p><p><a href="/es/jugadores/9eca9710/Johan-Carbonero"><strong>Johan Carbonero</strong></a> 2018-2025&nbsp;· FW,MF&nbsp;· Internacional, Racing Club, Once Caldas, Gimnasia y Esgrima (LP)</p><p><a href="/es/jugadores/a8ca65ab/Fernando-Cardenas">Fernando Cárdenas</a> 2012&nbsp;· FW,MF&nbsp;· Deportivo Pereira, New England Revolution, Deportes Tolima, Once Caldas, América de Cali, Santa Fe</p><p><a href="/es/jugadores/d770eded/Michel-Cardenas">Michel Cárdenas</a> 2016&nbsp;· MF</p><p><a href="/es/jugadores/9ff0aa5e/Sherman-Cardenas"><strong>Sherman Cárdenas</strong></a> 2014-2025&nbsp;· MF&nbsp;· Bucaramanga, Junior, Atlético Nacional, La Equidad, Once Caldas, Vitória, Millonarios, LDU Quito, At</p><p><a href="/es/jugadores/83a09853/Braison-Cardona"><strong>Braison Cardona</strong></a> 2019&nbsp;· MF</p><p><a href="/es/jugadores/e82b25f5/Edwin-Cardona"><strong>Edwin Cardona</strong></a> 2014-2025&nbsp;· FW,MF&nbsp;· Atlético Nacional, Monterrey, Boca Juniors, Colombia, Junior, América de Cali, Santa Fe, Racing Club</p><p><a href="/es/jugadores/a98a20fe/Estiven-Cardona">Estiven Cardona</a> 2019-2021&nbsp;· DF</p><p><a href="/es/jugadores/e3dcd115/Jaiber-Cardona">Jaiber Cardona</a> 2014-2017&nbsp;· GK&nbsp;· Deportivo Cali, Cortuluá</p><p><a href="/es/jugadores/be22bb53/Jorge-Cardona"><strong>Jorge Cardona</strong></a> 2018-2025&nbsp;· DF&nbsp;· Once Caldas</p><p><a href="/es/jugadores/41e1b1f3/Jown-Cardona"><strong>Jown Cardona</strong></a> 2016-2024&nbsp;· MF&nbsp;· Guangzhou City, Cortuluá, Deportivo Pasto, Deportivo Cali, Santa Fe, Ceará, León, Once Caldas</p><p><a href="/es/jugadores/f8194275/Juan-Felipe-Santa-Cardona">Juan Felipe Santa Cardona</a> 2016&nbsp;· MF</p><p><a href="/es/jugadores/00a4f3fa/Mateo-Cardona">Mateo Cardona</a> 2015-2023&nbsp;· MF&nbsp;· Envigado FC, Once Caldas, Cúcuta Deportivo</p><p><a href="/es/jugadores/6cbec88e/Luis-Cardoza">Luis Cardoza</a> 2014-2021&nbsp;· DF&nbsp;· Universidad César Vallejo, León de Huánuco, Universidad Técnica de Cajamarca, Universidad San Martín</p><p><a href="/es/jugadores/92fe5c63/Luis-Carlos-Arias">Luis Carlos Arias</a> 2010-2020&nbsp;· FW,MF&nbsp;· Independiente Medellín, Santa Fe, Unión Magdalena, Deportivo Pasto, Toluca, Nacional Potosí</p><p><a href="/es/jugadores/7b55b4a8/Jean-Carlos-Becerra">Jean Carlos Becerra</a> 2015-2021&nbsp;· MF&nbsp;· Atlético Huila, Cortuluá, Trujillanos</p><p><a href="/es/jugadores/5021438a/Jean-Carlos-Blanco"><strong>Jean Carlos Blanco</strong></a> 2015-2025&nbsp;· FW,MF&nbsp;· Bucaramanga, La Equidad, Técnico Universitario, Aucas, Ilves, Atlético Huila, Once Caldas, Cúcuta De</p><p><a href="/es/jugadores/4661f2b8/Luis-Carlos-Cabezas">Luis Carlos Cabezas</a> 2016-2020&nbsp;· FW&nbsp;· Shanghai Port, Jorge Wilstermann, Deportivo La Guaira, Atlético Venezuela, La Equidad, Deportivo Cal</p><p><a href="/es/jugadores/1507cc53/Juan-Carlos-Escobar">Juan Carlos Escobar</a> 2007-2015&nbsp;· MF&nbsp;· Deportes Tolima, Krylia Sovetov Samara, Cúcuta Deportivo, Deportivo Cali, Alianza Petrolera, Patriot</p><p><a href="/es/jugadores/4c529cf1/Juan-Carlos-Guaza">Juan Carlos Guazá</a> 2015&nbsp;· MF&nbsp;· Deportivo Cali</p><p><a href="/es/jugadores/a8d429d8/Juan-Carlos-Henao">Juan Carlos Henao</a> 2003-2016&nbsp;· GK&nbsp;· Once Caldas, Millonarios, Real Cartagena, Maracaibo, Santos</p><p><a href="/es/jugadores/bae1a0ea/Juan-Carlos-Mosquera">Juan Carlos Mosquera</a> 2015-2016&nbsp;· DF&nbsp;· Deportivo Pasto, Atlético Nacional, Cortuluá, Sport Huancayo, Once Caldas, Deportes Quindío</p><p><a href="/es/jugadores/65bd0e79/Yan-Carlos-Mosquera">Yan Carlos Mosquera</a> 2015-2024&nbsp;· MF&nbsp;· Zamora, Fortaleza FC, Deportivo Pasto</p><p><a href="/es/jugadores/28e858c3/Jose-Carlos-Munoz"><strong>José Carlos Muñoz</strong></a> 2018-2025&nbsp;· MF&nbsp;· Alianza Petrolera, Técnico Universitario, Boyacá Chicó, Junior</p><p><a href="/es/jugadores/e37bfa7a/Luis-Carlos-Murillo">Luis Carlos Murillo</a> 2015-2022&nbsp;· DF&nbsp;· Once Caldas, KuPS, HJK Helsinki, Deportivo Pasto, VPS</p><p><a href="/es/jugadores/a5790548/Luis-Carlos-Perea">Luis Carlos Perea</a> 1990-1994&nbsp;· DF&nbsp;· Colombia</p><p><a href="/es/jugadores/7b4c7966/Juan-Carlos-Pereira"><strong>Juan Carlos Pereira</strong></a> 2019-2025&nbsp;· FW,MF&nbsp;· Millonarios, Unión Magdalena</p><p><a href="/es/jugadores/091aed8a/Luis-Carlos-Ruiz">Luis Carlos Ruiz</a> 2014-2023&nbsp;· FW&nbsp;· Junior, Atlético Nacional, Millonarios, Cortuluá, Sport Recife</p><p><a href="/es/jugadores/3acaed4b/Juan-Carlos-Villa">Juan Carlos Villa</a> 2015&nbsp;· FW</p><p><a href="/es/jugadores/e2d09112/Juan-Carlos-Zambrano">Juan Carlos Zambrano</a> 2015&nbsp;· FW</p><p><a href="/es/jugadores/93da5ea8/Jhonatan-Carmona">Jhonatan Carmona</a> 2021-2023&nbsp;· FW&nbsp;· Atlético Huila</p><p><a href="/es/jugadores/bc671aaf/Naisir-Carmona">Naisir Carmona</a> 2016&nbsp;· FW&nbsp;· Independiente Medellín</p><p><a href="/es/jugadores/7e6b7974/Jessica-Caro">Jessica Caro</a> 2018-2021&nbsp;· MF&nbsp;· Colombia</p><p><a href="/es/jugadores/74ee54a2/Pablo-Caro">Pablo Caro</a> 2020&nbsp;· FW</p><p><a href="/es/jugadores/4c884960/Wilson-Carpintero">Wilson Carpintero</a> 2017&nbsp;· FW,MF&nbsp;· La Equidad, Cúcuta Deportivo, Patriotas FC, Millonarios, Envigado FC, Expreso Rojo, Deportes Quindío</p><p><a href="/es/jugadores/3f9f0d62/Jorge-Carrascal"><strong>Jorge Carrascal</strong></a> 2015-2026&nbsp;· FW,MF&nbsp;· Dynamo Moscow, River Plate, Karpaty Lviv, CSKA Moscow, Colombia</p><p><a href="/es/jugadores/5c653950/Rafael-Carrascal"><strong>Rafael Carrascal</strong></a> 2015-2025&nbsp;· MF&nbsp;· América de Cali, Cerro Porteño, Alianza Petrolera, Deportes Tolima, Millonarios, Junior</p><p><a href="/es/jugadores/da4a113a/Marcelino-Carreazo"><strong>Marcelino Carreazo</strong></a> 2018-2025&nbsp;· MF&nbsp;· CSKA Sofia, Once Caldas</p><p><a href="/es/jugadores/b72f9f0d/Andres-Carreno">Andres Carreño</a> 2023&nbsp;· FW&nbsp;· Unión Magdalena</p><p><a href="/es/jugadores/0460c445/Nicolas-Carreno">Nicolás Carreño</a> 2015-2019&nbsp;· DF&nbsp;· Patriotas FC, Deportivo Pasto</p><p><a href="/es/jugadores/d5aec766/Darwin-Carrero"><strong>Darwin Carrero</strong></a> 2015-2024&nbsp;· DF&nbsp;· Cúcuta Deportivo, Patriotas FC, Portuguesa</p><p><a href="/es/jugadores/fa80b444/Armando-Carrillo">Armando Carrillo</a> 2014&nbsp;· FW&nbsp;· Deportivo Cali, Envigado FC, Atlético Huila, Deportes Tolima, Atlético Nacional</p><p><a href="/es/jugadores/a9649bb4/Cesar-Carrillo">César Carrillo</a> 2015-2022&nbsp;· MF&nbsp;· Jaguares de Córdoba, Millonarios</p><p><a href="/es/jugadores/072a96c1/Duvan-Carrillo">Duvan Carrillo</a> 2019-2021&nbsp;· GK</p><p><a href="/es/jugadores/21628cb9/Gustavo-Carvajal">Gustavo Carvajal</a> 2018-2023&nbsp;· MF&nbsp;· América de Cali</p><p><a href="/es/jugadores/ab5939db/Juan-Carvajal"><strong>Juan Carvajal</strong></a> 2023-2024&nbsp;· FW&nbsp;· Millonarios, La Equidad</p><p><a href="/es/jugadores/a4c90bb5/Robert-Carvajal">Robert Carvajal</a> 2019&nbsp;· DF</p><p><a href="/es/jugadores/ece005cf/Mauricio-Casierra">Mauricio Casierra</a> 2015-2020&nbsp;· DF&nbsp;· Once Caldas, Millonarios, San Martín de San Juan, Sarmiento, Estudiantes–LP, Deportivo Pasto, Deport</p><p><a href="/es/jugadores/6e9f4690/Geovanis-Cassiani">Geovanis Cassiani</a> 1990&nbsp;· DF,MF</p><p><a href="/es/jugadores/0f714df2/Mateo-Cassierra"><strong>Mateo Cassierra</strong></a> 2015-2026&nbsp;· FW&nbsp;· Zenit, Belenenses SAD, Jong Ajax, Deportivo Cali, Ajax, PFC Sochi, Groningen, Colombia</p><p><a href="/es/jugadores/8f2653ad/Angie-Castaneda">Angie Castañeda</a> 2019-2022&nbsp;· FW&nbsp;· Colombia</p><p><a href="/es/jugadores/fcea5420/David-Castaneda">David Castañeda</a> 2016&nbsp;· DF</p><p><a href="/es/jugadores/740d079f/Eder-Castaneda">Eder Castañeda</a> 2015-2020&nbsp;· DF&nbsp;· Deportes Quindío, Atlético Huila, América de Cali, Deportivo Pasto</p><p><a href="/es/jugadores/0a396655/Frank-Castaneda"><strong>Frank Castañeda</strong></a> 2021-2025&nbsp;· FW,MF&nbsp;· Bucaramanga, Radomiak Radom, Warta Poznań, Santa Fe, FC Sheriff Tiraspol</p><p><a href="/es/jugadores/eb57e619/Freddy-Castaneda">Freddy Castañeda</a> 2023&nbsp;· FW</p><p><a href="/es/jugadores/ec299158/Esteban-Castaneda-Otalvaro">Esteban Castañeda Otálvaro</a> 2015-2016&nbsp;· FW&nbsp;· Águilas Doradas</p><p><a href="/es/jugadores/48dc2fca/Sergio-Castaneda">Sergio Castañeda</a> 2018-2019&nbsp;· DF</p><p><a href="/es/jugadores/4c0a4347/Tatiana-Castaneda">Tatiana Castañeda</a> 2021&nbsp;· DF</p><p><a href="/es/jugadores/ae630077/Cesar-Castano"><strong>Cesar Castaño</strong></a> 2018-2024&nbsp;· MF&nbsp;· La Equidad, Deportivo Pasto, Patriotas FC</p><p><a href="/es/jugadores/eb376e2a/Esteban-Castano">Esteban Castaño</a> 2022&nbsp;· GK</p><p><a href="/es/jugadores/e6c60bab/Juan-Castano"><strong>Juan Castaño</strong></a> 2024-2025&nbsp;· DF&nbsp;· Once Caldas, Boyacá Chicó</p><p><a href="/es/jugadores/c393c3d9/Kevin-Castano"><strong>Kevin Castaño</strong></a> 2020-2026&nbsp;· MF&nbsp;· Krasnodar, River Plate, Águilas Doradas, Colombia, Cruz Azul</p><p><a href="/es/jugadores/d90e36d6/Mauricio-Castano"><strong>Mauricio Castaño</strong></a> 2021-2025&nbsp;· DF&nbsp;· Deportivo Pasto, Jaguares de Córdoba, Once Caldas</p><p><a href="/es/jugadores/f93af36c/Stefany-Castano"><strong>Stefany Castaño</strong></a> 2015-2024&nbsp;· GK&nbsp;· CA Mineiro, Colombia</p><p><a href="/es/jugadores/3afe3e53/Leandro-Castellanos">Leandro Castellanos</a> 2014-2023&nbsp;· GK&nbsp;· Santa Fe, Cúcuta Deportivo, Independiente Medellín, Deportivo Cali, América de Cali</p><p><a href="/es/jugadores/bd538c54/Juan-Castilla"><strong>Juan Castilla</strong></a> 2021-2025&nbsp;· MF&nbsp;· Deportivo Pasto, Deportivo Cali, Houston Dynamo</p><p><a href="/es/jugadores/308e6dbe/Breiner-Castillo">Bréiner Castillo</a> 2014-2018&nbsp;· GK&nbsp;· Deportes Tolima, Independiente Medellín, Envigado FC, Atlético Huila, Real Cartagena, Deportivo Cali</p><p><a href="/es/jugadores/c0749140/Carlos-Castillo">Carlos Castillo</a> 2017&nbsp;· MF</p><p><a href="/es/jugadores/9b7ad0d4/Diego-Castillo"><strong>Diego Castillo</strong></a> 2023-2025&nbsp;· FW&nbsp;· Deportivo Pasto, La Equidad</p><p><a href="/es/jugadores/99f5d6aa/Fabian-Castillo"><strong>Fabián Castillo</strong></a> 2011-2025&nbsp;· FW,MF&nbsp;· Deportivo Cali, FC Dallas, Tijuana, Trabzonspor, Querétaro, FC Juárez, Colo-Colo, Colombia</p><p><a href="/es/jugadores/4e29fb0c/Fabio-Castillo">Fabio Castillo</a> 2016-2022&nbsp;· DF&nbsp;· Deportes Quindío, Jaguares de Córdoba, Boyacá Chicó</p><p><a href="/es/jugadores/d7a3b09f/Harlen-Castillo"><strong>Harlen Castillo</strong></a> 2020-2025&nbsp;· GK&nbsp;· Atlético Nacional, Deportivo Pereira</p><p><a href="/es/jugadores/cc1b1f77/Jair-Castillo"><strong>Jair Castillo</strong></a> 2020-2025&nbsp;· DF,MF&nbsp;· Alianza Petrolera</p><p><a href="/es/jugadores/01c1b0cf/Jairo-Castillo">Jairo Castillo</a> 2004-2011&nbsp;· FW&nbsp;· Godoy Cruz, Independiente, Millonarios, América de Cali, Valladolid, Defensor Sporting, Boyacá Chicó</p><p><a href="/es/jugadores/013e66bb/Juan-Castillo"><strong>Juan Castillo</strong></a> 2021-2025&nbsp;· DF&nbsp;· Nizhny Novgorod, New York Red Bulls II, Fortaleza FC</p><p><a href="/es/jugadores/73f00ee2/Juan-Castillo"><strong>Juan Castillo</strong></a> 2024-2025&nbsp;· GK&nbsp;· Fortaleza FC</p><p><a href="/es/jugadores/40c4ad77/Mateo-Castillo"><strong>Mateo Castillo</strong></a> 2025&nbsp;· MF&nbsp;· América de Cali</p><p><a href="/es/jugadores/0057a058/Moises-Castillo"><strong>Moises Castillo</strong></a> 2020-2025&nbsp;· DF&nbsp;· FC Juárez, Marítimo</p><p><a href="/es/jugadores/b2ce9e12/Rafael-Castillo">Rafael Castillo</a> 2014-2019&nbsp;· MF&nbsp;· San Antonio FC, San Antonio Scorpions, Independiente Medellín, Atlético Huila, Deportes Tolima, Mill</p><p><a href="/es/jugadores/4be3766c/Henry-Castillo-Riascos">Henry Castillo Riascos</a> 2015-2022&nbsp;· FW&nbsp;· Bucaramanga, Cortuluá, Jaguares de Córdoba</p><p><a href="/es/jugadores/3df3f09c/Victor-Castillo">Víctor Castillo</a> 2015-2018&nbsp;· MF&nbsp;· Alianza Petrolera, Deportivo Pereira, Cúcuta Deportivo, Bucaramanga, Deportes Tolima, Atlético Huila</p><p><a href="/es/jugadores/c7d333ec/Bryan-Castrillon"><strong>Bryan Castrillón</strong></a> 2018-2025&nbsp;· FW,MF&nbsp;· Junior, Independiente Medellín, Unión, Deportivo Pereira, Bucaramanga</p><p><a href="/es/jugadores/62326aad/Jaime-Castrillon">Jaime Castrillón</a> 2012-2016&nbsp;· MF&nbsp;· Independiente Medellín, Once Caldas, Colorado Rapids, Jacksonville Armada, Bucaramanga</p><p><a href="/es/jugadores/6cd3700f/Juan-Castrillon">Juan Castrillón</a> 2020&nbsp;· FW</p><p><a href="/es/jugadores/6c636810/Nilson-Castrillon">Nilson Castrillón</a> 2015-2024&nbsp;· DF&nbsp;· Deportes Tolima, Junior, América de Cali, Deportivo Cali</p><p><a href="/es/jugadores/2645fb27/Venji-Castrillon">Venji Castrillón</a> 2015-2016&nbsp;· MF&nbsp;· Envigado FC</p><p><a href="/es/jugadores/36b1c79f/Alex-Castro"><strong>Alex Castro</strong></a> 2015-2025&nbsp;· FW,MF&nbsp;· Deportes Tolima, Alianza Petrolera, Atlético Nacional, Nacional, Águilas Doradas, Deportivo Cali, Cr</p><p><a href="/es/jugadores/d1ca3243/Beckham-Castro"><strong>Beckham Castro</strong></a> 2023-2025&nbsp;· FW,MF&nbsp;· La Equidad, Millonarios</p><p><a href="/es/jugadores/c942361a/Camilo-Castro">Camilo Castro</a> 2018&nbsp;· MF</p><p><a href="/es/jugadores/a3f386fc/Cristian-Castro"><strong>Cristian Castro</strong></a> 2020-2025&nbsp;· DF&nbsp;· AVS Futebol, Atlético Nacional, Boavista</p><p><a href="/es/jugadores/d8683f69/Daniel-Castro">Daniel Castro</a> 2019-2024&nbsp;· FW&nbsp;· Independiente Medellín</p><p><a href="/es/jugadores/70dc8772/Dario-Castro">Darío Castro</a> 2020&nbsp;· FW&nbsp;· Boyacá Chicó</p><p><a href="/es/jugadores/2fc8ba3c/James-Castro">James Castro</a> 2019-2023&nbsp;· DF,MF&nbsp;· Cúcuta Deportivo, Boyacá Chicó, Unión Magdalena, Deportivo Pasto, Águilas Doradas</p><p><a href="/es/jugadores/c9f62861/Joan-Castro"><strong>Joan Castro</strong></a> 2015-2025&nbsp;· DF,MF&nbsp;· Atlético Nacional, La Equidad, Uniautónoma FC</p><p><a href="/es/jugadores/b53310c1/Leonardo-Castro"><strong>Leonardo Castro</strong></a> 2016-2025&nbsp;· FW,MF&nbsp;· Millonarios, Independiente Medellín, Deportivo Pereira</p><p><a href="/es/jugadores/e756210f/Leonardo-Castro"><strong>Leonardo Castro</strong></a> 2015-2025&nbsp;· FW&nbsp;· Greenville Triumph, Kaizer Chiefs, Mamelodi Sundowns, La Equidad, Cúcuta Deportivo, Millonarios, Col</p><p><a href="/es/jugadores/edbda1ab/Manuel-Castro"><strong>Manuel Castro</strong></a> 2025&nbsp;· MF&nbsp;· Yaracuyanos FC</p><p><a href="/es/jugadores/3c061eea/Daniel-Catano"><strong>Daniel Cataño</strong></a> 2016-2025&nbsp;· MF&nbsp;· Millonarios, Deportes Tolima, Bucaramanga, Independiente Medellín, Deportivo Pasto</p><p><a href="/es/jugadores/6d8e10c7/Jose-Cavadia"><strong>José Cavadía</strong></a> 2025&nbsp;· MF&nbsp;· América de Cali</p><p><a href="/es/jugadores/3fa61ade/Brayan-Ceballos"><strong>Brayan Ceballos</strong></a> 2021-2025&nbsp;· DF&nbsp;· New England Revolution, Dynamo Kyiv, Fortaleza, Junior, Deportes Quindío</p><p><a href="/es/jugadores/722dca6e/Camilo-Ceballos">Camilo Ceballos</a> 2014-2017&nbsp;· DF&nbsp;· Envigado FC, Deportivo Pasto, Deportivo Cali, Junior, Once Caldas</p><p><a href="/es/jugadores/32f6a377/Juan-Ceballos">Juan Ceballos</a> 2023-2024&nbsp;· MF&nbsp;· La Equidad, Alianza Petrolera</p><p><a href="/es/jugadores/784f6b89/Yilmar-Celedon">Yilmar Celedón</a> 2020-2024&nbsp;· DF&nbsp;· Envigado FC</p><p><a href="/es/jugadores/82916325/Diana-Celis">Diana Celis</a> 2021&nbsp;· FW</p><p><a href="/es/jugadores/fae8f607/Guillermo-Celis"><strong>Guillermo Celis</strong></a> 2015-2025&nbsp;· MF&nbsp;· Águilas Doradas, Junior, Vitória Guimarães, Once Caldas, Deportes Tolima, Colón, Colombia, Benfica</p><p><a href="/es/jugadores/744e0eef/Rafael-Cervantes">Rafael Cervantes</a> 2018&nbsp;· FW</p><p><a href="/es/jugadores/137777ad/Paulo-Cesar-Arango">Paulo César Arango</a> 2016&nbsp;· MF&nbsp;· América de Cali, Junior, Caracas, Envigado FC</p><p><a href="/es/jugadores/eade5337/Damir-Ceter"><strong>Damir Ceter</strong></a> 2017-2024&nbsp;· FW&nbsp;· Pescara, Chievo, Santa Fe, Bari, Jaguares de Córdoba, Cagliari</p><p><a href="/es/jugadores/9e81aaf7/Edwuin-Cetre"><strong>Edwuin Cetré</strong></a> 2017-2025&nbsp;· FW,MF&nbsp;· Estudiantes–LP, Junior, Independiente Medellín, Santos Laguna</p><p><a href="/es/jugadores/fde686b3/Ivonne-Chacon"><strong>Ivonne Chacón</strong></a> 2022-2025&nbsp;· FW&nbsp;· Levante, Valencia, Colombia</p><p><a href="/es/jugadores/a0cdb4e5/Sergio-Chacon">Sergio Chacón</a> 2015&nbsp;· DF</p><p><a href="/es/jugadores/138b8723/Fabian-Chalare"><strong>Fabián Chalare</strong></a> 2023-2024&nbsp;· FW&nbsp;· Águilas Doradas</p><p><a href="/es/jugadores/6260cc9d/Diego-Chara"><strong>Diego Chará</strong></a> 2011-2025&nbsp;· MF&nbsp;· Portland Timbers, Deportes Quindío, Deportes Tolima, América de Cali</p><p><a href="/es/jugadores/77871516/Gustavo-Chara"><strong>Gustavo Chará</strong></a> 2017-2020&nbsp;· DF&nbsp;· Bucaramanga, Deportivo Cali</p><p><a href="/es/jugadores/d72b71d7/Ricardo-Chara">Ricardo Chará</a> 2010-2012&nbsp;· DF</p><p><a href="/es/jugadores/9df9baab/Yimmi-Chara"><strong>Yimmi Chará</strong></a> 2014-2025&nbsp;· FW,MF&nbsp;· Junior, Portland Timbers, Deportes Tolima, Atlético Mineiro, Monterrey, Atlético Nacional, Sinaloa, </p><p><a href="/es/jugadores/e36aa82c/Camilo-Charria">Camilo Charria</a> 2019&nbsp;· FW&nbsp;· Santa Fe</p><p><a href="/es/jugadores/61927cea/Camilo-Charris"><strong>Camilo Charris</strong></a> 2021-2024&nbsp;· DF&nbsp;· Patriotas FC</p><p><a href="/es/jugadores/102a620f/Felix-Charrupi"><strong>Felix Charrupí</strong></a> 2019-2025&nbsp;· MF&nbsp;· Millonarios, Envigado FC</p><p><a href="/es/jugadores/862f88a7/Gustavo-Charrupi"><strong>Gustavo Charrupí</strong></a> 2023-2025&nbsp;· MF&nbsp;· Deportivo Pasto</p><p><a href="/es/jugadores/d38e02cf/Eder-Chaux"><strong>Eder Chaux</strong></a> 2015-2025&nbsp;· GK&nbsp;· Independiente Medellín, Once Caldas, Patriotas FC, América de Cali, Boyacá Chicó, Junior</p><p><a href="/es/jugadores/3fff484d/Francisco-Chaverra-Angulo"><strong>Francisco Chaverra Angulo</strong></a> 2019-2025&nbsp;· FW,MF&nbsp;· Independiente Medellín, La Equidad, Santa Fe</p><p><a href="/es/jugadores/00d62924/Fabian-Chaverra"><strong>Fabian Chaverra</strong></a> 2024-2025&nbsp;· MF&nbsp;· La Equidad</p><p><a href="/es/jugadores/9a33f7fa/Felix-Chaverra">Félix Chaverra</a> 2023&nbsp;· FW&nbsp;· Boyacá Chicó</p><p><a href="/es/jugadores/5962ab0b/Leyser-Chaverra"><strong>Leyser Chaverra</strong></a> 2021-2025&nbsp;· DF&nbsp;· Independiente Medellín, Deportes Quindío</p><p><a href="/es/jugadores/5e715216/Carlos-Chavez">Carlos Chávez</a> 2015&nbsp;· GK</p><p><a href="/es/jugadores/bb16f48c/Daladier-Chavez">Daladier Chávez</a> 2015-2016&nbsp;· DF</p><p><a href="/es/jugadores/83b29a3a/Julio-Chavez">Julio Chávez</a> 2015&nbsp;· MF&nbsp;· Cortuluá</p><p><a href="/es/jugadores/4ed40cc2/Yasser-Chavez">Yasser Chávez</a> 2020&nbsp;· GK</p><p><a href="/es/jugadores/414192db/Diego-Chica">Diego Chica</a> 2015-2021&nbsp;· MF&nbsp;· Boyacá Chicó, Cortuluá, Cúcuta Deportivo, Águilas Doradas, Alianza Petrolera, Real Cartagena</p><p><a href="/es/jugadores/48d87b7e/Andres-Chitiva">Andrés Chitiva</a> 2003-2010&nbsp;· FW,MF&nbsp;· Pachuca, Ciudad Juárez, América, Atlas</p><p><a href="/es/jugadores/38bcfdb7/Jefferson-Churi">Jefferson Churi</a> 2021&nbsp;· FW&nbsp;· Deportes Quindío</p><p><a href="/es/jugadores/6e407ed9/Brandon-Chury"><strong>Brandon Chury</strong></a> 2025&nbsp;· MF&nbsp;· Llaneros</p><p><a href="/es/jugadores/39e5eb04/Felipe-Cifuentes"><strong>Felipe Cifuentes</strong></a> 2024-2025&nbsp;· FW&nbsp;· Metropolitanos, Once Caldas</p><p><a href="/es/jugadores/3b3fe0af/Juan-Cifuentes">Juan Cifuentes</a> 2018-2020&nbsp;· DF&nbsp;· América de Cali</p><p><a href="/es/jugadores/602859cc/Duban-Ciro">Duban Ciro</a> 2019&nbsp;· MF</p><p><a href="/es/jugadores/4b96b9e3/Angela-Clavijo">Angela Clavijo</a> 2015-2022&nbsp;· MF&nbsp;· Cruzeiro EC, Colombia</p><p><a href="/es/jugadores/4801084f/Jose-Clavijo">José Clavijo</a> 2018-2021&nbsp;· DF&nbsp;· Once Caldas</p><p><a href="/es/jugadores/2a253d1a/Marcos-Coll">Marcos Coll</a> 1962&nbsp;· MF&nbsp;· Colombia</p><p><a href="/es/jugadores/5a38c29b/Jeferson-Collazos">Jeferson Collazos</a> 2017-2023&nbsp;· FW&nbsp;· Cantolao, Universidad Técnica de Cajamarca, Atlético Grau, Binacional</p><p><a href="/es/jugadores/5482df9c/Sebastian-Colon-Guerra"><strong>Sebastián Colón Guerra</strong></a> 2023-2025&nbsp;· MF&nbsp;· Boyacá Chicó</p><p><a href="/es/jugadores/f3afff11/Andres-Colorado"><strong>Andrés Colorado</strong></a> 2017-2025&nbsp;· MF&nbsp;· Junior, Deportivo Cali, Necaxa, Partizan, São Paulo</p><p><a href="/es/jugadores/e1fe0643/Jean-Colorado"><strong>Jean Colorado</strong></a> 2022-2025&nbsp;· MF&nbsp;· Deportivo Cali, Cortuluá, Unión Magdalena, Bucaramanga</p><p><a href="/es/jugadores/97114c5f/Royscer-Colpa"><strong>Royscer Colpa</strong></a> 2022-2025&nbsp;· MF&nbsp;· Alianza Petrolera</p><p><a href="/es/jugadores/754f3460/Alex-Comas">Alex Comas</a> 2000-2001&nbsp;· FW&nbsp;· MetroStars, La Serena, Santiago Morning, Real Cartagena</p><p><a href="/es/jugadores/123c3e3f/Wilman-Conde">Wilman Conde</a> 2007-2012&nbsp;· DF&nbsp;· Chicago Fire, Millonarios, New York Red Bulls, Atlas, Real Cartagena</p><p><a href="/es/jugadores/08925878/Edwin-Congo">Edwin Congo</a> 1999-2008&nbsp;· FW&nbsp;· Levante, Sporting Gijón, Valladolid, Vitória Guimarães, Toulouse, Recreativo</p><p><a href="/es/jugadores/c4518184/Yimmi-Congo"><strong>Yimmi Congo</strong></a> 2019-2025&nbsp;· MF&nbsp;· Carabobo, Deportivo Cali, Deportivo Pereira, Academia Puerto Cabello</p><p><a href="/es/jugadores/0b5a3edd/David-Contreras">David Contreras</a> 2022-2024&nbsp;· FW&nbsp;· América de Cali, Deportivo Pasto</p><p><a href="/es/jugadores/cdf29191/David-Contreras">David Contreras</a> 2015-2020&nbsp;· MF&nbsp;· Jaguares de Córdoba, Águilas Doradas</p><p><a href="/es/jugadores/4d777c98/Diego-Contreras"><strong>Diego Contreras</strong></a> 2023-2024&nbsp;· MF&nbsp;· Jaguares de Córdoba</p><p><a href="/es/jugadores/5051c723/Joel-Contreras"><strong>Joel Contreras</strong></a> 2019-2025&nbsp;· MF&nbsp;· Once Caldas, Unión Magdalena, Águilas Doradas, Alianza Petrolera</p><p><a href="/es/jugadores/2165a331/Yeferson-Contreras">Yeferson Contreras</a> 2018-2022&nbsp;· FW&nbsp;· Šibenik, Cortuluá</p><p><a href="/es/jugadores/c79de422/Carlos-Copete">Carlos Copete</a> 2021-2023&nbsp;· FW&nbsp;· Jaguares de Córdoba</p><p><a href="/es/jugadores/754440fa/Deyson-Copete"><strong>Deyson Copete</strong></a> 2025&nbsp;· DF&nbsp;· La Equidad</p><p><a href="/es/jugadores/c83fcb0f/Hector-Copete">Hector Copete</a> 2019&nbsp;· DF</p><p><a href="/es/jugadores/ce070a45/Jonathan-Copete">Jonathan Copete</a> 2014-2023&nbsp;· FW,MF&nbsp;· Santos, Atlético Nacional, Vélez Sarsfield, Avaí, Santa Fe, Bahia, Pachuca, CRB</p><p><a href="/es/jugadores/1569aeb7/Andres-Cordoba">Andrés Córdoba</a> 2023&nbsp;· FW&nbsp;· Nacional Potosí</p><p><a href="/es/jugadores/75fd2e07/Andres-Cordoba"><strong>Andrés Córdoba</strong></a> 2016-2022&nbsp;· MF&nbsp;· Envigado FC, Universidad Central</p><p><a href="/es/jugadores/a8581661/Bismar-Cordoba">Bismar Córdoba</a> 2016-2018&nbsp;· MF&nbsp;· Jaguares de Córdoba, Once Caldas</p><p><a href="/es/jugadores/58a0680a/Brayan-Cordoba"><strong>Brayan Córdoba</strong></a> 2018-2025&nbsp;· DF&nbsp;· CSKA Sofia, Atlético Nacional, América de Cali, Once Caldas</p><p><a href="/es/jugadores/62415706/Danilson-Cordoba">Danilson Córdoba</a> 2014-2018&nbsp;· MF&nbsp;· Nagoya Grampus, Independiente Medellín, Hokkaido Consadole Sapporo, Avispa Fukuoka, Jaguares de Córd</p><p><a href="/es/jugadores/45fec9b3/Deiler-Cordoba">Deiler Córdoba</a> 2021-2022&nbsp;· FW&nbsp;· Envigado FC</p><p><a href="/es/jugadores/7d52e0ab/Deiner-Cordoba">Deiner Córdoba</a> 2015-2016&nbsp;· MF&nbsp;· Boyacá Chicó, Deportivo Pereira</p><p><a href="/es/jugadores/d8782160/Elacio-Cordoba">Elacio Córdoba</a> 2015-2022&nbsp;· DF&nbsp;· Atlético Huila, Independiente Medellín, Londrina, Águilas Doradas, Ituano</p><p><a href="/es/jugadores/c247349c/Flavio-Cordoba">Flavio Córdoba</a> 2014-2016&nbsp;· DF&nbsp;· River Plate, La Equidad, Cúcuta Deportivo, Nacional</p><p><a href="/es/jugadores/18968ba4/Francisco-Cordoba">Francisco Córdoba</a> 2015-2020&nbsp;· DF,MF&nbsp;· Deportivo Pereira, Deportivo Pasto, Cúcuta Deportivo, Independiente Medellín, Atlético Huila</p><p><a href="/es/jugadores/853b902b/Ivan-Cordoba">Iván Córdoba</a> 1998-2012&nbsp;· DF&nbsp;· Internazionale, Colombia</p><p><a href="/es/jugadores/d678c86f/Jader-Cordoba"><strong>Jader Cordoba</strong></a> 2025&nbsp;· DF&nbsp;· Yaracuyanos FC</p><p><a href="/es/jugadores/2588da52/Jaime-Cordoba">Jaime Córdoba</a> 2015-2017&nbsp;· MF&nbsp;· América de Cali, Cortuluá, Águilas Doradas, Once Caldas, Atlético Nacional, Junior, Cúcuta Deportivo</p><p><a href="/es/jugadores/82a80903/Jhersson-Cordoba">Jhersson Córdoba</a> 2012-2018&nbsp;· MF&nbsp;· La Equidad, Atlético Nacional, Sport Boys Warnes, Alianza Petrolera, Leones FC, Independiente Medell</p><p><a href="/es/jugadores/9f381d8b/Jhon-Cordoba"><strong>Jhon Córdoba</strong></a> 2012-2026&nbsp;· FW&nbsp;· Krasnodar, Köln, Mainz 05, Envigado FC, Espanyol, Granada, Hertha BSC, Chiapas, Colombia</p><p><a href="/es/jugadores/fdac9284/Jhon-Cordoba"><strong>Jhon Córdoba</strong></a> 2019-2025&nbsp;· FW,MF&nbsp;· Millonarios, Bucaramanga, Atlético Huila</p><p><a href="/es/jugadores/963670fd/Juan-Cordoba"><strong>Juan Córdoba</strong></a> 2021-2025&nbsp;· MF&nbsp;· Dinamo Zagreb, Deportivo Cali</p><p><a href="/es/jugadores/573d531c/Nelson-Cordoba">Nelson Córdoba</a> 2017&nbsp;· DF</p><p><a href="/es/jugadores/d4cdd3cf/Oscar-Cordoba">Óscar Córdoba</a> 1994-2007&nbsp;· GK&nbsp;· Beşiktaş, Deportivo Cali, Antalyaspor, Millonarios, Boca Juniors, Perugia, Colombia</p><p><a href="/es/jugadores/029f9d86/Ramon-Cordoba"><strong>Ramón Córdoba</strong></a> 2015-2024&nbsp;· DF&nbsp;· Jaguares de Córdoba, Binacional</p><p><a href="/es/jugadores/d8554e98/Santiago-Cordoba"><strong>Santiago Córdoba</strong></a> 2024-2025&nbsp;· FW&nbsp;· Fortaleza FC, Patriotas FC</p><p><a href="/es/jugadores/bf10b974/Vanessa-Cordoba">Vanessa Córdoba</a> 2018&nbsp;· GK</p><p><a href="/es/jugadores/f554049a/Willianson-Cordoba">Willianson Córdoba</a> 2015-2019&nbsp;· DF&nbsp;· Técnico Universitario, Boyacá Chicó</p><p><a href="/es/jugadores/e7e84acd/Yanier-Cordoba">Yanier Cordoba</a> 2021&nbsp;· DF</p><p><a href="/es/jugadores/e72011c4/Andres-Correa"><strong>Andrés Correa</strong></a> 2015-2025&nbsp;· DF&nbsp;· La Equidad, Boyacá Chicó, Seattle Sounders FC 2, Independiente Medellín</p><p><a href="/es/jugadores/e17bbde1/Brayan-Correa"><strong>Brayan Correa</strong></a> 2019-2024&nbsp;· DF&nbsp;· Unión Magdalena, Patriotas FC, América de Cali</p><p><a href="/es/jugadores/fe00b4f9/Bryan-Correa">Bryan Correa</a> 2023&nbsp;· DF</p><p><a href="/es/jugadores/a2a4424f/Jeisson-Correa">Jeisson Correa</a> 2017&nbsp;· MF</p><p><a href="/es/jugadores/60dc2b27/Rivaldo-Correa"><strong>Rivaldo Correa</strong></a> 2017-2018&nbsp;· FW&nbsp;· Independiente Medellín, Águilas Doradas</p><p><a href="/es/jugadores/877938e0/Juan-Corredor">Juan Corredor</a> 2023&nbsp;· MF</p><p><a href="/es/jugadores/bde2d869/Andres-Cortabarria">Andrés Cortabarria</a> 2019&nbsp;· FW</p><p><a href="/es/jugadores/2bbe93d9/David-Cortes-Armero">David Cortés Armero</a> 2016-2019&nbsp;· FW&nbsp;· Cantolao, Club Deportivo Quevedo, Cortuluá, Jaguares de Córdoba</p><p><a href="/es/jugadores/4dd5d3e5/Carlos-Cortes"><strong>Carlos Cortes</strong></a> 2020-2024&nbsp;· FW&nbsp;· Deportes Tolima, América de Cali</p><p><a href="/es/jugadores/17f1a378/Darwin-Cortes">Darwin Cortés</a> 2024&nbsp;· DF</p><p><a href="/es/jugadores/1d2bfc2f/Deyman-Cortes">Deyman Cortés</a> 2018-2019&nbsp;· FW&nbsp;· Atlético Huila</p><p><a href="/es/jugadores/abb71b44/Efrain-Cortes">Efraín Cortés</a> 2010-2020&nbsp;· DF&nbsp;· Millonarios, Querétaro, Deportivo Cali, Deportes Quindío, Pachuca, Nacional, América de Cali, Puebla</p><p><a href="/es/jugadores/cd409efd/Jean-Cortes">Jean Cortés</a> 2015&nbsp;· MF&nbsp;· Deportivo Pasto</p><p><a href="/es/jugadores/9893851c/Joan-Cortes">Joan Cortés</a> 2024&nbsp;· MF&nbsp;· Boyacá Chicó</p><p><a href="/es/jugadores/e4ffe9c5/Kevin-Cortes">Kevin Cortés</a> 2023&nbsp;· MF</p><p><a href="/es/jugadores/8a8814d3/Oscar-Cortes">Óscar Cortés</a> 1994&nbsp;· DF</p><p><a href="/es/jugadores/d2c12fe0/Oscar-Cortes"><strong>Oscar Cortés</strong></a> 2022-2025&nbsp;· MF&nbsp;· Rangers, Millonarios, Lens</p><p><a href="/es/jugadores/e86bf699/Santiago-Cortes">Santiago Cortes</a> 2022-2023&nbsp;· MF&nbsp;· Deportivo Cali</p><p><a href="/es/jugadores/9c14cb28/Victor-Cortes">Víctor Cortés</a> 2015&nbsp;· FW,MF&nbsp;· Junior, América de Cali, Deportivo Pereira, Cúcuta Deportivo, Águilas Doradas, Uniautónoma FC</p><p><a href="/es/jugadores/8b5dc5e7/Julian-Corzo">Julián Corzo</a> 2019&nbsp;· DF</p><p><a href="/es/jugadores/39dd17d9/Laura-Cosme">Laura Cosme</a> 2015&nbsp;· FW</p><p><a href="/es/jugadores/41c78ecb/Wilberto-Cosme">Wilberto Cosme</a> 2012-2019&nbsp;· FW&nbsp;· Cusco, Millonarios, Querétaro, Puebla, La Equidad, Deportivo Pasto, Chiapas, Real Cartagena, América</p><p><a href="/es/jugadores/d1baa601/Johan-Cristansho">Johan Cristansho</a> 2021-2022&nbsp;· MF&nbsp;· Bucaramanga</p><p><a href="/es/jugadores/6696358d/Daniel-Cruz">Daniel Cruz</a> 2000-2013&nbsp;· MF&nbsp;· Germinal Beerschot, Lierse, Ajax, FC Dallas, Waasland-Beveren</p><p><a href="/es/jugadores/35340ec2/Juan-Cruz">Juan Cruz</a> 2015&nbsp;· GK</p><p><a href="/es/jugadores/7adf2033/Wilmar-Cruz"><strong>Wilmar Cruz</strong></a> 2018-2025&nbsp;· FW&nbsp;· La Equidad, Boyacá Chicó, Leones FC, Deportivo Pasto</p><p><a href="/es/jugadores/152c8d04/Jose-Cuadrado">José Cuadrado</a> 2014-2020&nbsp;· GK&nbsp;· Once Caldas, Millonarios, Atlético Nacional, Deportivo Pasto, Deportivo Cali, Colombia</p><p><a href="/es/jugadores/0ab1f153/Juan-Cuadrado"><strong>Juan Cuadrado</strong></a> 2009-2026&nbsp;· DF,FW&nbsp;· Juventus, Atalanta, Fiorentina, Colombia, Lecce, Independiente Medellín, Udinese, Chelsea, Internazi</p><p><a href="/es/jugadores/c797a1c3/Diego-Cuadros">Diego Cuadros</a> 2015-2023&nbsp;· MF&nbsp;· Club Vaca Díez, Jaguares de Córdoba, Alianza Petrolera</p><p><a href="/es/jugadores/ba807576/Santiago-Cubides"><strong>Santiago Cubides</strong></a> 2020-2024&nbsp;· FW&nbsp;· Once Caldas</p><p><a href="/es/jugadores/71b47ab9/Cucho"><strong>Cucho</strong></a> 2017-2026&nbsp;· FW,MF&nbsp;· Real Betis, Columbus Crew, Huesca, Watford, Getafe, Mallorca, América de Cali, Colombia</p><p><a href="/es/jugadores/cdd22fcf/Gustavo-Cuellar"><strong>Gustavo Cuellar</strong></a> 2015-2025&nbsp;· MF&nbsp;· Al-Shabab, Flamengo, Deportivo Cali, Al-Hilal, Junior, Colombia</p><p><a href="/es/jugadores/c31f141c/Klieton-Cuellar"><strong>Klieton Cuellar</strong></a> 2025&nbsp;· FW&nbsp;· Deportivo Cali</p><p><a href="/es/jugadores/315e50cd/Edward-Cuernu-Pinto">Edward Cuernú Pinto</a> 2016&nbsp;· FW</p><p><a href="/es/jugadores/132456fb/Cuero-Cuero"><strong>Cuero Cuero</strong></a> 2024-2025&nbsp;· DF&nbsp;· Fortaleza FC, Santa Fe</p><p><a href="/es/jugadores/18ffc292/Fabian-Cuero">Fabián Cuero</a> 2024&nbsp;· MF&nbsp;· Metropolitanos</p><p><a href="/es/jugadores/ead2e89e/Jefferson-Cuero">Jefferson Cuero</a> 2014-2021&nbsp;· FW,MF&nbsp;· Morelia, Once Caldas, Santa Fe, Jaguares de Córdoba, América de Cali, Águilas Doradas, Independiente</p><p><a href="/es/jugadores/ef81fadc/Jesus-Cuero"><strong>Jesus Cuero</strong></a> 2025&nbsp;· FW&nbsp;· Yaracuyanos FC</p><p><a href="/es/jugadores/a153c0bd/Jhan-Cuero">Jhan Cuero</a> 2017-2021&nbsp;· MF&nbsp;· La Equidad</p><p><a href="/es/jugadores/dad91fba/Jose-Cuero">José Cuero</a> 2020-2024&nbsp;· MF&nbsp;· Universidad Técnica de Cajamarca, Ayacucho, Cienciano, Deportivo Garcilaso, Atlético Huila</p><p><a href="/es/jugadores/7e03c92a/Mauricio-Cuero">Mauricio Cuero</a> 2013-2024&nbsp;· FW,MF&nbsp;· Banfield, Deportivo Garcilaso, La Equidad, Club Olimpo, Atlas, Santos Laguna, Club Olimpia, Levante,</p><p><a href="/es/jugadores/0e531376/Wilson-Cuero">Wilson Cuero</a> 2015-2022&nbsp;· FW&nbsp;· Mineros, Alianza Petrolera, Millonarios, Cádiz</p><p><a href="/es/jugadores/9c21e2ea/Gendry-Cuervo"><strong>Gendry Cuervo </strong></a> 2023-2025&nbsp;· DF&nbsp;· Envigado FC</p><p><a href="/es/jugadores/574fff8c/Carlos-Cuesta"><strong>Carlos Cuesta</strong></a> 2016-2026&nbsp;· DF&nbsp;· Genk, Galatasaray, Atlético Nacional, Colombia</p><p><a href="/es/jugadores/39c83069/Juan-Cuesta"><strong>Juan Cuesta</strong></a> 2019-2025&nbsp;· FW,MF&nbsp;· Universidad Central, Independiente Medellín, Envigado FC, Aldosivi, Arsenal de Sarandí, Internaciona</p><p><a href="/es/jugadores/13137b39/Kevin-Cuesta"><strong>Kevin Cuesta</strong></a> 2024-2025&nbsp;· DF&nbsp;· Santa Fe, Bucaramanga</p><p><a href="/es/jugadores/8fe9c26d/Luis-Cuesta">Luis Cuesta</a> 2015-2017&nbsp;· FW&nbsp;· La Equidad</p><p><a href="/es/jugadores/359e02ea/William-Cuesta"><strong>William Cuesta</strong></a> 2015-2025&nbsp;· GK&nbsp;· Deportes Tolima</p><p><a href="/es/jugadores/6c90365d/Yamith-Cuesta">Yamith Cuesta</a> 2009-2016&nbsp;· DF&nbsp;· Santa Fe, Chicago Fire, Chivas USA, Deportivo Pasto</p><p><a href="/es/jugadores/87b62ac8/Yisela-Cuesta">Yisela Cuesta</a> 2015-2024&nbsp;· FW&nbsp;· CA Mineiro, Colombia, Ferroviária</p><p><a href="/es/jugadores/9640c22b/Andres-Cuevas">Andrés Cuevas</a> 2017&nbsp;· GK</p><p><a href="/es/jugadores/a5897347/Gustavo-Culma">Gustavo Culma</a> 2015-2018&nbsp;· MF&nbsp;· CSKA Sofia, Once Caldas, Necaxa</p><p><a href="/es/jugadores/d2017dbe/Jhon-Culma">Jhon Culma</a> 2009-2013&nbsp;· MF&nbsp;· Brest, Maccabi Haifa FC</p><p><a href="/es/jugadores/4311284f/Brayan-Cundumi">Brayan Cundumi</a> 2022&nbsp;· MF</p><p><a href="/es/jugadores/d37045c0/David-Cuperman"><strong>David Cuperman</strong></a> 2021&nbsp;· DF&nbsp;· Alianza Petrolera</p><p><a href="/es/jugadores/a065e877/Cristian-Dajome"><strong>Cristián Dajome</strong></a> 2015-2025&nbsp;· DF,FW&nbsp;· Santos Laguna, Vancouver Whitecaps FC, D.C. United, Independiente del Valle, América de Cali, Atléti</p><p><a href="/es/jugadores/9a5bf492/Anthony-Dallos">Anthony Dallos</a> 2021&nbsp;· FW</p><p><a href="/es/jugadores/04b301ec/Carlos-Daniel-Hidalgo">Carlos Daniel Hidalgo</a> 2007-2023&nbsp;· FW&nbsp;· Deportivo Pasto, Independiente Medellín, Santa Fe, Guaraní, Real Potosí, Sporting Gijón</p><p><a href="/es/jugadores/77c25432/Jesus-Daniel-Martinez"><strong>Jesús Daniel Martínez</strong></a> 2019-2024&nbsp;· DF&nbsp;· Envigado FC, El Farolito</p><p><a href="/es/jugadores/f28b2576/Juan-Daniel-Murillo">Juan Daniel Murillo</a> 2015&nbsp;· DF&nbsp;· Cúcuta Deportivo, Bucaramanga, Águilas Doradas</p><p><a href="/es/jugadores/06c488d3/Juan-Daniel-Roa">Juan Daniel Roa</a> 2015-2023&nbsp;· MF&nbsp;· Santa Fe, Deportivo Cali, Alianza Petrolera</p><p><a href="/es/jugadores/993bc193/Ruben-Dario-Hernandez">Rubén Darío Hernández</a> 1990-1996&nbsp;· FW&nbsp;· NY/NJ MetroStars</p><p><a href="/es/jugadores/57119ecd/Oscar-Dario-Martinez">Óscar Darío Martínez</a> 2015&nbsp;· FW&nbsp;· Deportivo Pasto, La Equidad, Patriotas FC, Uniautónoma FC</p><p><a href="/es/jugadores/2acf4d99/Ruben-Dario-Velazquez">Rubén Darío Velázquez</a> 2003&nbsp;· MF&nbsp;· Boyacá Chicó, Deportivo Cali, Real Cartagena, Colombia</p><p><a href="/es/jugadores/ef6eef89/Juan-David-Cabal"><strong>Juan David Cabal</strong></a> 2019-2026&nbsp;· DF&nbsp;· Juventus, Atlético Nacional, Hellas Verona</p><p><a href="/es/jugadores/4ea22d91/Juan-David-Cabezas">Juan David Cabezas</a> 2014-2023&nbsp;· MF&nbsp;· RGV FC Toros, Deportivo Cali, Houston Dynamo, Independiente Medellín, Once Caldas, Cúcuta Deportivo</p><p><a href="/es/jugadores/9a95edf9/Juan-David-Campo">Juan David Campo</a> 2015-2019&nbsp;· MF&nbsp;· Cortuluá, Atlético Venezuela</p><p><a href="/es/jugadores/cddf5142/Juan-David-Castaneda"><strong>Juan David Castañeda</strong></a> 2016-2025&nbsp;· FW&nbsp;· Sreenidi Deccan FC, Patriotas FC, Cortuluá, Atlético Nacional</p><p><a href="/es/jugadores/915e4322/Juan-David-Cuesta"><strong>Juan David Cuesta</strong></a> 2022-2025&nbsp;· DF&nbsp;· Once Caldas, Carabobo</p><p><a href="/es/jugadores/e0278278/Juan-David-Duque">Juan David Duque</a> 2018&nbsp;· DF&nbsp;· Atlético Nacional, Boyacá Chicó</p><p><a href="/es/jugadores/bf9cf6da/Juan-David-Gomez">Juan David Gómez</a> 2015&nbsp;· GK</p><p><a href="/es/jugadores/ac3c530c/Juan-David-Gonzalez">Juan David González</a> 2021&nbsp;· FW</p><p><a href="/es/jugadores/174f728e/Jose-David-Leudo">José David Leudo</a> 2015-2023&nbsp;· MF&nbsp;· Patriotas FC, Deportivo Pasto, NorthEast United, Atlético Huila, Once Caldas, Águilas Doradas</p><p><a href="/es/jugadores/e86a19c1/Jose-David-Lloreda"><strong>José David Lloreda</strong></a> 2015-2024&nbsp;· FW,MF&nbsp;· La Equidad, Jaguares de Córdoba, Unión Magdalena, Deportivo Cali, Deportes Tolima, Cúcuta Deportivo,</p><p><a href="/es/jugadores/2e3dbaa5/Alvaro-David-Montero"><strong>Álvaro David Montero</strong></a> 2018-2026&nbsp;· GK&nbsp;· Millonarios, Deportes Tolima, Colombia</p><p><a href="/es/jugadores/bb18b3b6/Juan-David-Mosquera"><strong>Juan David Mosquera</strong></a> 2020-2026&nbsp;· DF&nbsp;· Portland Timbers, Independiente Medellín</p><p><a href="/es/jugadores/68d48a71/Jesus-David-Murillo"><strong>Jesús David Murillo</strong></a> 2015-2025&nbsp;· DF&nbsp;· FC Juárez, Los Angeles FC, Patriotas FC, Independiente Medellín, Deportivo Pasto</p><p><a href="/es/jugadores/87ffd1e4/Juan-David-Obando">Juan David Obando</a> 2024&nbsp;· MF</p><p><a href="/es/jugadores/17991890/Juan-David-Perez"><strong>Juan David Pérez</strong></a> 2015-2024&nbsp;· FW,MF&nbsp;· Boyacá Chicó, América de Cali, Once Caldas, Millonarios, Independiente Medellín, Junior, Jaguares de</p><p><a href="/es/jugadores/a5517528/Juan-David-Ramirez">Juan David Ramírez</a> 2018-2019&nbsp;· GK&nbsp;· Austin Bold</p><p><a href="/es/jugadores/5cad3c91/Juan-David-Rios"><strong>Juan David Ríos</strong></a> 2016-2025&nbsp;· MF&nbsp;· Deportivo Pereira, Alianza Petrolera, Deportes Tolima</p><p><a href="/es/jugadores/29b45b86/Juan-David-Rodriguez"><strong>Juan David Rodríguez</strong></a> 2017-2024&nbsp;· MF&nbsp;· Once Caldas, Junior, Cortuluá, Bucaramanga, Jaguares de Córdoba, Atlético Huila, Águilas Doradas</p><p><a href="/es/jugadores/5912c2fc/Juan-David-Rueda">Juan David Rueda</a> 2024&nbsp;· FW&nbsp;· Alianza Petrolera</p><p><a href="/es/jugadores/7147dad6/Juan-David-Valencia"><strong>Juan David Valencia</strong></a> 2015-2025&nbsp;· GK&nbsp;· Ayacucho, Águilas Doradas, Patriotas FC</p><p><a href="/es/jugadores/90b32e51/Juan-David-Valencia">Juan David Valencia</a> 2014-2019&nbsp;· DF&nbsp;· Independiente Medellín, Atlético Nacional, Santa Fe, Junior, Atlético Huila</p><p><a href="/es/jugadores/06c5a86f/Andres-Davila">Andrés Dávila</a> 2023-2024&nbsp;· DF&nbsp;· Independiente Medellín</p><p><a href="/es/jugadores/871577e5/Darlyn-Davila">Darlyn Dávila</a> 2017&nbsp;· MF</p><p><a href="/es/jugadores/a6c877f8/William-Davila"><strong>William Dávila</strong></a> 2022-2024&nbsp;· MF</p><p><a href="/es/jugadores/ca03fef1/Hugo-Daza">Hugo Daza</a> 2018&nbsp;· DF</p><p><a href="/es/jugadores/3d93fcff/Jose-De-Arco">José De Arco</a> 2016&nbsp;· MF</p><p><a href="/es/jugadores/a4214df0/Andres-De-Armas">Andrés De Armas</a> 2019&nbsp;· MF&nbsp;· La Equidad</p><p><a href="/es/jugadores/f4e10dc7/Antony-de-Avila">Antony de Ávila</a> 1994-1998&nbsp;· FW&nbsp;· NY/NJ MetroStars, América de Cali, Colombia</p><p><a href="/es/jugadores/7d4bdf0f/Carlos-De-Las-Salas"><strong>Carlos De Las Salas</strong></a> 2017-2024&nbsp;· DF&nbsp;· Patriotas FC, Expreso Rojo</p><p><a href="/es/jugadores/4e6c4374/Isabel-Dehakiz"><strong>Isabel Dehakiz</strong></a> 2023-2025&nbsp;· MF&nbsp;· Western United</p><p><a href="/es/jugadores/1d253235/Camilo-del-Castillo">Camilo del Castillo</a> 2015&nbsp;· DF&nbsp;· Cortuluá</p><p><a href="/es/jugadores/bc3514f3/Juan-Del-Rio">Juan Del Rio</a> 2022-2023&nbsp;· MF&nbsp;· Unión Magdalena</p><p><a href="/es/jugadores/0cedda69/Ayron-del-Valle"><strong>Ayron del Valle</strong></a> 2016-2025&nbsp;· FW,MF&nbsp;· La Equidad, Millonarios, Once Caldas, Atlético Huila, Independiente Medellín, Real Cartagena, Querét</p><p><a href="/es/jugadores/5dbfaa24/Didier-Delgado"><strong>Didier Delgado</strong></a> 2015-2023&nbsp;· DF,MF&nbsp;· Deportes Tolima, Deportivo Cali, Independiente Medellín, Atlético Huila</p><p><a href="/es/jugadores/135cb3ec/Fabio-Delgado">Fabio Delgado</a> 2017-2024&nbsp;· DF&nbsp;· Santa Fe, Cortuluá</p><p><a href="/es/jugadores/e324049a/Juan-Delgado">Juan Delgado</a> 2021&nbsp;· DF</p><p><a href="/es/jugadores/64b5a0b0/Ricardo-Delgado">Ricardo Delgado</a> 2015-2023&nbsp;· MF&nbsp;· Jaguares de Córdoba, Deportivo Pasto, Internacional de Barinas</p><p><a href="/es/jugadores/18522016/Vladimir-Delgado">Vladimir Delgado</a> 2015&nbsp;· MF&nbsp;· Cortuluá</p><p><a href="/es/jugadores/cd4cbf05/Wanerge-Delgado">Wanerge Delgado</a> 2015&nbsp;· GK</p><p><a href="/es/jugadores/fed656d0/Guillermo-Denis">Guillermo Denis</a> 2022-2023&nbsp;· FW&nbsp;· Real Santa Cruz</p><p><a href="/es/jugadores/0ec1841b/Nelson-Deossa"><strong>Nelson Deossa</strong></a> 2021-2025&nbsp;· MF&nbsp;· Pachuca, Monterrey, Atlético Nacional, Junior, Atlético Huila, Estudiantes–LP</p><p><a href="/es/jugadores/f15a3ceb/Juan-Deusa"><strong>Juan Deusa</strong></a> 2023-2024&nbsp;· DF,MF&nbsp;· Internacional de Barinas, Boyacá Chicó</p><p><a href="/es/jugadores/698958f4/Juan-Diaz"><strong>Juan Díaz </strong></a> 2020-2025&nbsp;· MF&nbsp;· Fortaleza FC, Águilas Doradas</p><p><a href="/es/jugadores/3bbcc4be/Alex-Diaz">Alex Díaz</a> 2014-2018&nbsp;· DF&nbsp;· Millonarios, Deportivo Pasto, La Equidad, Bucaramanga</p><p><a href="/es/jugadores/b02d0a9e/Oscar-Diaz-Asprilla">Óscar Díaz Asprilla</a> 2003&nbsp;· MF&nbsp;· Boyacá Chicó, Cortuluá, Deportivo Cali, Deportes Quindío</p><p><a href="/es/jugadores/d3bb486e/Camilo-Diaz">Camilo Díaz</a> 2019&nbsp;· DF</p><p><a href="/es/jugadores/58386f04/Carlos-Diaz">Carlos Díaz</a> 2015-2018&nbsp;· DF&nbsp;· Boyacá Chicó, Atlético Huila</p><p><a href="/es/jugadores/8e2cbe06/Carlos-Diaz">Carlos Díaz</a> 2024&nbsp;· FW</p><p><a href="/es/jugadores/e9e38c86/Cristian-Diaz">Cristian Díaz</a> 2021&nbsp;· MF</p><p><a href="/es/jugadores/6d13d1df/Duvier-Diaz">Duvier Díaz</a> 2023&nbsp;· DF</p><p><a href="/es/jugadores/f009a6a9/Eber-Diaz">Eber Díaz</a> 2017-2018&nbsp;· FW&nbsp;· Jaguares de Córdoba</p><p><a href="/es/jugadores/f0b22f67/Farid-Diaz">Farid Díaz</a> 2014-2021&nbsp;· DF&nbsp;· Atlético Nacional, Envigado FC, Nacional Asunción, Deportivo Pereira, Alianza Petrolera, Club Olimpi</p><p><a href="/es/jugadores/f84cf786/Jaime-Diaz"><strong>Jaime Díaz</strong></a> 2022-2024&nbsp;· DF&nbsp;· Jaguares de Córdoba</p><p><a href="/es/jugadores/ec27d954/Jefferson-Diaz"><strong>Jefferson Díaz</strong></a> 2023-2025&nbsp;· DF&nbsp;· Minnesota United, Deportivo Cali</p><p><a href="/es/jugadores/1137e64a/Jesus-Diaz"><strong>Jesus Diaz</strong></a> 2025&nbsp;· FW&nbsp;· Junior</p><p><a href="/es/jugadores/1388fafd/Jesus-Diaz"><strong>Jesús Díaz</strong></a> 2024-2025&nbsp;· FW&nbsp;· Raków Częstochowa</p><p><a href="/es/jugadores/18dc7803/Jose-Diaz">José Díaz</a> 2015-2016&nbsp;· DF&nbsp;· Boyacá Chicó</p><p><a href="/es/jugadores/36839110/Juan-Diaz"><strong>Juan Díaz</strong></a> 2018-2025&nbsp;· MF&nbsp;· Once Caldas, Independiente Medellín, Patriotas FC, Coritiba</p><p><a href="/es/jugadores/5b1fd84b/Juan-Diaz"><strong>Juan Díaz</strong></a> 2016-2020&nbsp;· FW&nbsp;· Boyacá Chicó</p><p><a href="/es/jugadores/6de2c9dd/Kleber-Diaz"><strong>Kleber Díaz</strong></a> 2025&nbsp;· FW&nbsp;· Unión Magdalena</p><p><a href="/es/jugadores/4a1a9578/Luis-Diaz"><strong>Luis Díaz</strong></a> 2017-2026&nbsp;· FW,MF&nbsp;· Liverpool, Porto, Junior, Colombia</p><p><a href="/es/jugadores/81932e2e/Luis-Diaz"><strong>Luis Díaz</strong></a> 2022-2025&nbsp;· FW,MF&nbsp;· Envigado FC</p><p><a href="/es/jugadores/9780e3e9/Neffer-Diaz">Neffer Díaz</a> 2023&nbsp;· MF</p><p><a href="/es/jugadores/85834f20/Gabriel-Diaz-Rico">Gabriel Díaz Rico</a> 2015-2019&nbsp;· DF&nbsp;· Millonarios</p><p><a href="/es/jugadores/87a10ec3/Juan-Diaz-Sanchez">Juan Díaz Sánchez</a> 2018&nbsp;· MF</p><p><a href="/es/jugadores/fd568e89/Tomas-Diaz">Tomás Díaz</a> 2023&nbsp;· MF&nbsp;· Atlético Huila</p><p><a href="/es/jugadores/edbf289a/Wilmer-Diaz"><strong>Wilmer Díaz</strong></a> 2015-2018&nbsp;· DF&nbsp;· Deportes Tolima, La Equidad, Jaguares de Córdoba, Deportivo Pasto, Once Caldas</p><p><a href="/es/jugadores/8df202f1/Yesid-Diaz"><strong>Yesid Díaz</strong></a> 2019-2025&nbsp;· DF,MF&nbsp;· Fortaleza FC, Independiente Medellín, La Equidad</p><p><a href="/es/jugadores/d2c3e6ac/Yilton-Diaz"><strong>Yilton Díaz</strong></a> 2016-2022&nbsp;· MF&nbsp;· Águilas Doradas, Binacional, Deportivo Pasto, Atlético Huila</p><p><a href="/es/jugadores/790b7597/Juan-Diego-Gonzalez">Juan Diego González</a> 2005-2010&nbsp;· DF&nbsp;· La Equidad, Once Caldas, Santos Laguna, Philadelphia Union</p><p><a href="/es/jugadores/045cb32b/David-Diosa">David Diosa</a> 2014-2022&nbsp;· FW&nbsp;· New York Cosmos, Richmond Kickers</p><p><a href="/es/jugadores/9a001ad9/Jairo-Ditta">Jairo Ditta</a> 2022-2023&nbsp;· FW&nbsp;· Santa Fe</p><p><a href="/es/jugadores/95c2f969/Willer-Ditta"><strong>Willer Ditta</strong></a> 2018-2026&nbsp;· DF&nbsp;· Cruz Azul, Junior, Newell's Old Boys</p><p><a href="/es/jugadores/2911909b/Alvaro-Dominguez">Álvaro Domínguez</a> 2007-2012&nbsp;· MF&nbsp;· Sion, Deportivo Cali, Samsunspor</p><p><a href="/es/jugadores/f7f87e8c/Alvin-Dominguez">Alvin Domínguez</a> 2016-2017&nbsp;· DF&nbsp;· Atlético Nacional</p><p><a href="/es/jugadores/8f354861/Aurelio-Dominguez"><strong>Aurelio Domínguez</strong></a> 2023-2024&nbsp;· DF&nbsp;· Angostura</p><p><a href="/es/jugadores/c7420adc/Yulieth-Dominguez">Yulieth Domínguez</a> 2011-2012&nbsp;· DF&nbsp;· Colombia</p><p><a href="/es/jugadores/197e2007/Francisco-Donzelot">Francisco Donzelot</a> 2020-2021&nbsp;· DF</p><p><a href="/es/jugadores/c82190b5/Bayron-Duarte"><strong>Bayron Duarte</strong></a> 2023-2024&nbsp;· DF&nbsp;· Bucaramanga</p><p><a href="/es/jugadores/0e9284fe/Mauricio-Duarte">Mauricio Duarte</a> 2017-2023&nbsp;· DF&nbsp;· Cúcuta Deportivo, Águilas Doradas, Deportivo Pasto, Cortuluá, Defensa y Justicia</p><p><a href="/es/jugadores/9bee548c/Omar-Duarte">Omar Duarte</a> 2015-2024&nbsp;· FW&nbsp;· Atlético Huila, Jaguares de Córdoba, La Equidad, Atlético Nacional, Nacional Potosí</p><p><a href="/es/jugadores/9d95e065/Jhon-Duque-Arias">Jhon Duque Arias</a> 2016-2024&nbsp;· MF&nbsp;· Millonarios, Atlético Nacional, Fortaleza FC, Atlético San Luis, Santa Fe</p><p><a href="/es/jugadores/49f20f7e/Jefferson-Duque">Jefferson Duque</a> 2014-2024&nbsp;· FW&nbsp;· Atlético Nacional, Atlas, Deportivo Cali, Santa Fe, Deportivo Pereira, Morelia</p><p><a href="/es/jugadores/414184f7/Jader-Duran"><strong>Jáder Durán</strong></a> 2019-2026&nbsp;· FW&nbsp;· Aston Villa, Al-Nassr, Envigado FC, Chicago Fire, Colombia</p><p><a href="/es/jugadores/1bfae0cd/Andres-Dussan"><strong>Andrés Dussan</strong></a> 2018&nbsp;· GK</p><p><a href="/es/jugadores/73c4d9dd/Edwin-Duvan-Rodriguez"><strong>Edwin Duván Rodríguez</strong></a> 2025&nbsp;· FW&nbsp;· Yaracuyanos FC</p><p><a href="/es/jugadores/3c8cc96f/Cristian-Echavarria">Cristian Echavarría</a> 2018-2019&nbsp;· MF&nbsp;· Patriotas FC, Independiente Medellín</p><p><a href="/es/jugadores/98093402/Diego-Echeverri">Diego Echeverri</a> 2016-2024&nbsp;· FW&nbsp;· Boyacá Chicó, Portuguesa, Atlético Huila, Bucaramanga, La Equidad</p><p><a href="/es/jugadores/1007329b/Hector-Echeverri">Hector Echeverri</a> 1962&nbsp;· DF,MF&nbsp;· Colombia</p><p><a href="/es/jugadores/356eedf1/Isabella-Echeverri">Isabella Echeverri</a> 2015-2019&nbsp;· MF&nbsp;· Colombia</p><p><a href="/es/jugadores/78d1465a/Oscar-Echeverry">Oscar Echeverry</a> 2008&nbsp;· FW&nbsp;· Atlético Nacional, New York Red Bulls</p><p><a href="/es/jugadores/651f1da9/John-Edison-Garcia"><strong>John Edison García</strong></a> 2015-2025&nbsp;· DF&nbsp;· Alianza Petrolera, La Equidad, América de Cali, Cúcuta Deportivo</p><p><a href="/es/jugadores/2d0306ef/John-Edison-Hernandez">John Édison Hernández</a> 2015-2021&nbsp;· MF&nbsp;· Independiente Medellín, Cúcuta Deportivo, Bucaramanga, Real Cartagena, Alianza Petrolera, Deportivo </p><p><a href="/es/jugadores/9822c5d6/Luis-Eduardo-Zapata">Luis Eduardo Zapata</a> 2012-2016&nbsp;· DF&nbsp;· Millonarios, Colorado Rapids, Deportivo Pereira, América de Cali, Fort Lauderdale Strikers</p><p><a href="/es/jugadores/18f7aba2/Jhon-Edwar-Valoy">Jhon Edwar Valoy</a> 2014-2015&nbsp;· MF&nbsp;· Deportes Quindío, Atlético Nacional, Once Caldas</p><p><a href="/es/jugadores/98641e73/John-Edward-Hernandez">John Edward Hernández</a> 2015&nbsp;· MF&nbsp;· Independiente Medellín, Patriotas FC</p><p><a href="/es/jugadores/f74159d0/John-Edwin-Montano"><strong>John Edwin Montaño</strong></a> 2023-2025&nbsp;· FW&nbsp;· Lommel SK, Independiente Medellín</p><p><a href="/es/jugadores/f9518030/Campo-Elias-Santacruz">Campo Elías Santacruz</a> 2015-2016&nbsp;· DF&nbsp;· Real Cartagena, Envigado FC, Jaguares de Córdoba</p><p><a href="/es/jugadores/554cf0f0/Juergen-Elitim"><strong>Juergen Elitim</strong></a> 2018-2025&nbsp;· MF&nbsp;· Legia Warsaw, Ponferradina, Racing Santander</p><p><a href="/es/jugadores/5a1ce0cb/Jose-Enamorado"><strong>José Enamorado</strong></a> 2019-2025&nbsp;· MF&nbsp;· Junior, Santa Fe, Deportivo Cali</p><p><a href="/es/jugadores/cc3b4444/Jorge-Enrique-Arias"><strong>Jorge Enrique Arias</strong></a> 2015-2025&nbsp;· DF&nbsp;· Millonarios, Junior, Independiente Medellín, Club Olimpia, Deportivo Cali</p><p><a href="/es/jugadores/14cd6fc4/Luis-Enrique-Delgado">Luis Enrique Delgado</a> 2014-2020&nbsp;· GK&nbsp;· Millonarios, Águilas Doradas, Real Cartagena, Deportivo Pasto, Deportes Tolima, Cúcuta Deportivo, Bu</p><p><a href="/es/jugadores/433cbb27/Luis-Enrique-Ortiz"><strong>Luis Enrique Ortíz</strong></a> 2019&nbsp;· MF&nbsp;· Cúcuta Deportivo</p><p><a href="/es/jugadores/1450f0e3/Daniel-Enrique-Padilla"><strong>Daniel Enrique Padilla</strong></a> 2018-2024&nbsp;· MF&nbsp;· Jaguares de Córdoba, La Equidad</p><p><a href="/es/jugadores/39c52d54/Luis-Enrique-Quinones"><strong>Luis Enrique Quiñones</strong></a> 2015-2025&nbsp;· FW,MF&nbsp;· Tigres UANL, Puebla, Águilas Doradas, Santa Fe, Toluca, UNAM, Lobos BUAP, Patriotas FC</p><p><a href="/es/jugadores/c5dc1be3/Carlos-Enrique-Renteria"><strong>Carlos Enrique Renteria</strong></a> 2015-2020&nbsp;· MF&nbsp;· Deportes Tolima, Deportivo Cali, Botafogo (RJ)</p><p><a href="/es/jugadores/be405c86/Jose-Erick-Correa"><strong>José Erick Correa</strong></a> 2012-2024&nbsp;· FW&nbsp;· Royal Parí, Chivas USA, Independiente Petrolero, Boyacá Chicó, Alianza Petrolera, Deportes Tolima, N</p><p><a href="/es/jugadores/c62260ab/Luis-Erney-Vasquez"><strong>Luis Erney Vasquez</strong></a> 2015-2025&nbsp;· GK&nbsp;· Bucaramanga, Independiente Medellín, Atlético Huila</p><p><a href="/es/jugadores/3269ca1a/Leiner-Escalante"><strong>Léiner Escalante</strong></a> 2015-2025&nbsp;· FW,MF&nbsp;· Comerciantes Unidos, Junior, Deportivo Pasto, Carlos A. Mannucci, Real Potosí, La Equidad, Jaguares </p><p><a href="/es/jugadores/59f68a40/Omer-Escalante">Omer Escalante</a> 2017&nbsp;· DF&nbsp;· Expreso Rojo</p><p><a href="/es/jugadores/bead6105/Andres-Escobar">Andrés Escobar</a> 2022&nbsp;· MF&nbsp;· Unión Magdalena</p><p><a href="/es/jugadores/caa05e8f/Andres-Escobar">Andrés Escobar</a> 2013-2020&nbsp;· FW,MF&nbsp;· Deportivo Cali, Millonarios, FC Dallas, Atlético Nacional, Vasco da Gama, Deportes Tolima, Evian, Cú</p><p><a href="/es/jugadores/f3cd738f/Andres-Escobar">Andrés Escobar</a> 1990-1994&nbsp;· DF&nbsp;· Colombia</p><p><a href="/es/jugadores/91b4b408/Bairon-Escobar">Bairon Escobar</a> 2022&nbsp;· DF&nbsp;· Cortuluá</p><p><a href="/es/jugadores/c4e81809/Eusebio-Escobar">Eusebio Escobar</a> 1962&nbsp;· FW</p><p><a href="/es/jugadores/5e1c1da9/Jacobo-Escobar">Jacobo Escobar</a> 2019-2022&nbsp;· FW&nbsp;· Águilas Doradas, Deportivo Pasto, Patriotas FC</p><p><a href="/es/jugadores/ab9b2e29/Jhojan-Escobar"><strong>Jhojan Escobar</strong></a> 2024-2025&nbsp;· DF&nbsp;· Águilas Doradas</p><p><a href="/es/jugadores/c584a69b/Jhon-Escobar">Jhon Escobar</a> 2019-2022&nbsp;· FW&nbsp;· Universidad Central, Llaneros</p><p><a href="/es/jugadores/5768f04a/Josen-Escobar"><strong>Josen Escobar</strong></a> 2023-2025&nbsp;· MF&nbsp;· Al-Ettifaq, América de Cali</p><p><a href="/es/jugadores/e13288c6/Matias-Escobar">Matias Escobar</a> 2022&nbsp;· GK</p><p><a href="/es/jugadores/6872e363/Sebastian-Escobar">Sebastián Escobar</a> 2015&nbsp;· MF&nbsp;· Deportivo Cali</p><p><a href="/es/jugadores/15c551e8/Leonardo-Escorcia"><strong>Leonardo Escorcia</strong></a> 2015-2024&nbsp;· DF&nbsp;· Jaguares de Córdoba, Atlético Huila, Uniautónoma FC</p><p><a href="/es/jugadores/08667826/Luis-Escorcia"><strong>Luis Escorcia</strong></a> 2024-2025&nbsp;· DF&nbsp;· Independiente Medellín</p><p><a href="/es/jugadores/700b7244/Julio-Espana">Julio España</a> 2024&nbsp;· MF</p><p><a href="/es/jugadores/b9814cda/Rubio-Espana">Rubio España</a> 2022-2024&nbsp;· MF&nbsp;· Envigado FC</p><p><a href="/es/jugadores/b0a38e00/Wilson-Espana">Wilson España</a> 2021&nbsp;· FW&nbsp;· Deportes Quindío</p><p><a href="/es/jugadores/9dec573b/Carlos-Esparragoza">Carlos Esparragoza</a> 2022-2024&nbsp;· MF&nbsp;· Deportes Tolima, Junior</p><p><a href="/es/jugadores/ab43fc7d/Freddy-Espinal"><strong>Freddy Espinal</strong></a> 2023-2025&nbsp;· MF&nbsp;· Llaneros, Jaguares de Córdoba, Envigado FC</p><p><a href="/es/jugadores/965988c2/Marco-Espindola"><strong>Marco Espíndola</strong></a> 2024&nbsp;· GK&nbsp;· Deportivo Pasto</p><p><a href="/es/jugadores/70fc2795/Diego-Espinel">Diego Espinel</a> 2015&nbsp;· MF&nbsp;· Cúcuta Deportivo</p><p><a href="/es/jugadores/4242011c/Bernardo-Espinosa"><strong>Bernardo Espinosa</strong></a> 2007-2025&nbsp;· DF&nbsp;· Marbella, Girona, Sporting Gijón, Espanyol, Racing Santander, Sevilla Atlético, Middlesbrough, Atlét</p><p><a href="/es/jugadores/751d47c2/Eliecer-Espinosa">Eliécer Espinosa</a> 2015-2022&nbsp;· FW&nbsp;· Carabobo, Deportivo Lara, Leones FC</p><p><a href="/es/jugadores/eca2af41/Otoniel-Espinosa">Otoniel Espinosa</a> 2016-2018&nbsp;· FW&nbsp;· Trujillanos, Estudiantes de Caracas</p><p><a href="/es/jugadores/0bacf12c/Jeison-Espitia">Jeison Espitia</a> 2022-2023&nbsp;· DF&nbsp;· Miami United FC</p><p><a href="/es/jugadores/b4a17e14/Juan-Espitia"><strong>Juan Espitia</strong></a> 2019-2024&nbsp;· GK&nbsp;· Santa Fe</p><p><a href="/es/jugadores/0677b1d9/Adrian-Estacio"><strong>Adrián Estacio</strong></a> 2018-2025&nbsp;· MF&nbsp;· Deportivo Pereira, Deportivo Pasto, Águilas Doradas, Once Caldas</p><p><a href="/es/jugadores/47893d19/Luis-Estacio">Luis Estacio</a> 2015-2021&nbsp;· GK&nbsp;· Atlético Huila, Cúcuta Deportivo, Boyacá Chicó, Deportes Quindío, Águilas Doradas, Deportivo Pasto, </p><p><a href="/es/jugadores/71398664/Luis-Estarita">Luis Estarita</a> 2017&nbsp;· DF</p><p><a href="/es/jugadores/de144a9b/Johan-Esteban-Beltran"><strong>Johan Esteban Beltrán</strong></a> 2021-2025&nbsp;· MF&nbsp;· Once Caldas</p><p><a href="/es/jugadores/19139c55/Juan-Esteban-Gutierrez">Juan Esteban Gutierrez</a> 2024&nbsp;· DF</p><p><a href="/es/jugadores/18e0c7f6/Juan-Esteban-Ortiz">Juan Esteban Ortiz</a> 2014-2021&nbsp;· MF&nbsp;· Independiente Medellín, Atlético Huila, Estudiantes de Mérida, Águilas Doradas, FC Dallas, Unión Mag</p><p><a href="/es/jugadores/af4a9326/Sergio-Esteban-Romero">Sergio Esteban Romero</a> 2015-2020&nbsp;· FW&nbsp;· Once Caldas, Bucaramanga, Deportivo Cali, Alianza Petrolera, Jaguares de Córdoba, Millonarios</p><p><a href="/es/jugadores/da8f7049/Carlos-Esterilla">Carlos Esterilla</a> 2018&nbsp;· DF&nbsp;· Boyacá Chicó</p><p><a href="/es/jugadores/4ba28471/Julian-Estiven-Velez">Julián Estiven Vélez</a> 2014&nbsp;· DF,MF&nbsp;· Ulsan Hyundai FC, Atlético Nacional, Vissel Kobe, Deportivo Pereira, Tokushima Vortis, Jeju United F</p><p><a href="/es/jugadores/f3751431/Daniel-Estivent-Castano">Daniel Estivent Castaño</a> 2016&nbsp;· MF</p><p><a href="/es/jugadores/75e33b0a/Andres-Estrada">Andrés Estrada</a> 1998&nbsp;· MF</p><p><a href="/es/jugadores/5e9d68eb/Carlos-Estrada">Carlos Estrada</a> 1990&nbsp;· FW,MF&nbsp;· Colombia</p><p><a href="/es/jugadores/8873a3e2/Jonathan-Estrada">Jonathan Estrada</a> 2009-2019&nbsp;· MF&nbsp;· Millonarios, Envigado FC, Deportes Tolima, Patriotas FC, Independiente Medellín, Avaí, Real Sociedad</p><p><a href="/es/jugadores/efa41f67/Sergio-Estrada">Sergio Estrada</a> 2016&nbsp;· GK</p><p><a href="/es/jugadores/53e46b86/Andrey-Estupinan"><strong>Andrey Estupiñán</strong></a> 2018-2025&nbsp;· FW,MF&nbsp;· Deportivo Cali, Deportes Tolima, Deportivo Pasto, Santa Fe, Junior</p><p><a href="/es/jugadores/5418b6cf/Harold-Estupinan">Harold Estupiñán</a> 2019&nbsp;· MF&nbsp;· Jaguares de Córdoba</p><p><a href="/es/jugadores/c2c93d34/Jeison-Estupinan">Jeison Estupiñán</a> 2015&nbsp;· FW&nbsp;· Alianza Petrolera</p><p><a href="/es/jugadores/e09a51d7/Jose-Estupinan">José Estupiñán</a> 2020-2022&nbsp;· MF&nbsp;· La Equidad, Independiente Medellín</p><p><a href="/es/jugadores/213ab9bb/Oscar-Estupinan"><strong>Oscar Estupiñan</strong></a> 2015-2025&nbsp;· FW,MF&nbsp;· Hull City, FC Juárez, Vitória Guimarães, Once Caldas, Denizlispor, Bahia, Barcelona, Metz</p><p><a href="/es/jugadores/a824c1ba/Franco-Ezequiel-Aragon">Franco Ezequiel Aragón</a> 2020&nbsp;· MF</p><p><a href="/es/jugadores/feccb595/Frank-Fabra"><strong>Frank Fabra</strong></a> 2014-2026&nbsp;· DF&nbsp;· Boca Juniors, Envigado FC, Colombia, Deportivo Cali, Independiente Medellín</p><p><a href="/es/jugadores/2f0c7961/Daniel-Fajardo">Daniel Fajardo</a> 2020&nbsp;· GK</p><p><a href="/es/jugadores/861d8462/Luis-Fajardo">Luis Fajardo</a> 1990&nbsp;· MF</p><p><a href="/es/jugadores/66116290/Radamel-Falcao"><strong>Radamel Falcao</strong></a> 2009-2025&nbsp;· FW&nbsp;· Millonarios, Monaco, River Plate, Atlético Madrid, Rayo Vallecano, Porto, Colombia, Galatasaray, Man</p><p><a href="/es/jugadores/5eac9d41/Juan-Farias"><strong>Juan Farías</strong></a> 2024&nbsp;· MF</p><p><a href="/es/jugadores/0444b4b2/Cesar-Fawcett">Cesar Fawcett</a> 2015&nbsp;· DF&nbsp;· Junior, Santa Fe, Deportivo Pereira, Uniautónoma FC</p><p><a href="/es/jugadores/72898527/Juan-Felipe-Aguirre"><strong>Juan Felipe Aguirre</strong></a> 2018-2025&nbsp;· DF&nbsp;· Atlético Nacional, Montevideo Wanderers, Leones FC</p><p><a href="/es/jugadores/839d2755/Andres-Felipe-Alvarez">Andrés Felipe Álvarez</a> 2015-2018&nbsp;· DF&nbsp;· Alianza Petrolera, Independiente Medellín, Deportivo Pasto, Once Caldas</p><p><a href="/es/jugadores/2f29cfe8/Andres-Felipe-Amaya"><strong>Andrés Felipe Amaya</strong></a> 2017-2024&nbsp;· FW,MF&nbsp;· Atlético Huila, Deportivo Pasto</p><p><a href="/es/jugadores/fcece3d7/Andres-Felipe-Arboleda">Andrés Felipe Arboleda</a> 2015-2019&nbsp;· MF&nbsp;· Jaguares de Córdoba, Patriotas FC, América de Cali, Cortuluá, Cúcuta Deportivo, Deportivo Pereira</p><p><a href="/es/jugadores/9eb9f021/Luis-Felipe-Chara">Luis Felipe Chará</a> 2015-2017&nbsp;· MF&nbsp;· Atlético Nacional, Águilas Doradas, Deportivo Cali</p><p><a href="/es/jugadores/4bd04667/Andres-Felipe-Correa">Andrés Felipe Correa</a> 2015-2023&nbsp;· DF&nbsp;· Once Caldas, Águilas Doradas, Junior, Atlético Huila, Deportivo Pereira, Bucaramanga</p><p><a href="/es/jugadores/5b595b8f/Luis-Felipe-Riascos">Luis Felipe Riascos</a> 2024&nbsp;· FW</p><p><a href="/es/jugadores/9abe871c/Andres-Felipe-Rivera">Andrés Felipe Rivera</a> 2022-2023&nbsp;· DF&nbsp;· Atlético Huila, Cortuluá</p><p><a href="/es/jugadores/8986fdd8/Andres-Felipe-Roman"><strong>Andrés Felipe Román</strong></a> 2017-2026&nbsp;· DF,FW&nbsp;· Atlético Nacional, Millonarios</p><p><a href="/es/jugadores/ef680eba/Maria-Fernanda-Agudelo">María Fernanda Agudelo</a> 2021&nbsp;· FW</p><p><a href="/es/jugadores/37c90338/Cristian-Fernandes"><strong>Cristian Fernándes</strong></a> 2015-2024&nbsp;· FW&nbsp;· Once Caldas, La Equidad, Deportivo Lara, Irvine Zeta FC</p><p><a href="/es/jugadores/4b111056/Brayan-Fernandez"><strong>Brayan Fernández</strong></a> 2017-2025&nbsp;· FW&nbsp;· Real Tomayapo, Bucaramanga, Patriotas FC, Alianza Petrolera, Cortuluá, La Equidad, Binacional, Águil</p><p><a href="/es/jugadores/548d8753/Omar-Fernandez-Frasica"><strong>Omar Fernández Frasica</strong></a> 2015-2025&nbsp;· FW,MF&nbsp;· Santa Fe, Puebla, Melgar, León, Everton</p><p><a href="/es/jugadores/b04df630/Juan-Fernando-Caicedo">Juan Fernando Caicedo</a> 2015-2023&nbsp;· FW&nbsp;· Independiente Medellín, Deportes Tolima, Deportes Quindío, New England Revolution, Santa Fe, Atlétic</p><p><a href="/es/jugadores/4fd079af/Luis-Fernando-Herrera">Luis Fernando Herrera</a> 1990-1994&nbsp;· DF&nbsp;· Colombia</p><p><a href="/es/jugadores/09af36f3/David-Fernando-Lemos"><strong>David Fernando Lemos</strong></a> 2016-2025&nbsp;· FW,MF&nbsp;· Águilas Doradas, Once Caldas, América de Cali</p><p><a href="/es/jugadores/d0986396/Luis-Fernando-Mosquera">Luis Fernando Mosquera</a> 2009-2019&nbsp;· MF&nbsp;· Independiente Medellín, Atlético Nacional, Santa Fe, Deportes Quindío, Chiapas, Deportivo Cali, Alia</p><p><a href="/es/jugadores/5220e8b2/Nelson-Fernando-Ramos">Nelson Fernando Ramos</a> 2014-2019&nbsp;· GK&nbsp;· Deportivo Pasto, Millonarios, La Equidad, Fortaleza FC, Deportivo Quito, América de Cali, Bucaramang</p><p><a href="/es/jugadores/253ba116/Miguel-Fernando-Vargas">Miguel Fernando Vargas</a> 2015&nbsp;· GK&nbsp;· Cúcuta Deportivo</p><p><a href="/es/jugadores/e6cc0bf5/Alan-Ferney-Navarro">Alan Ferney Navarro</a> 2015&nbsp;· MF&nbsp;· Patriotas FC</p><p><a href="/es/jugadores/05816e19/Juan-Ferney-Otero"><strong>Juan Ferney Otero</strong></a> 2016-2025&nbsp;· FW,MF&nbsp;· Sporting Gijón, Amiens, Estudiantes–LP, Santos Laguna, Fortaleza FC, América</p><p><a href="/es/jugadores/60cc075d/Luis-Ferney-Rios">Luis Ferney Ríos</a> 2018&nbsp;· FW&nbsp;· Águilas Doradas, Estudiantes de Caracas, Deportivo Cali</p><p><a href="/es/jugadores/9d259853/David-Ferreira">David Ferreira</a> 2009-2019&nbsp;· MF&nbsp;· Athletico Paranaense, FC Dallas, Atlético Huila, Unión Magdalena, América de Cali</p><p><a href="/es/jugadores/d0641c4d/Luis-Ferreira">Luis Ferreira</a> 2019&nbsp;· MF</p><p><a href="/es/jugadores/83923362/Santiago-Ferreira">Santiago Ferreira</a> 2021&nbsp;· MF</p><p><a href="/es/jugadores/23d1a4bb/Gianfranco-Ferrero">Gianfranco Ferrero</a> 2016-2017&nbsp;· MF&nbsp;· Atlético de Rafaela</p><p><a href="/es/jugadores/ae827953/Andres-Ferrin"><strong>Andrés Ferrín</strong></a> 2020-2025&nbsp;· MF&nbsp;· FC Naples</p><p><a href="/es/jugadores/9517405b/Anier-Figueroa">Anier Figueroa</a> 2015-2021&nbsp;· DF&nbsp;· Sport Huancayo, Royal Parí, Millonarios, Cusco, Cortuluá, Deportivo Pasto, América de Cali</p><p><a href="/es/jugadores/85718be8/Jesus-Figueroa"><strong>Jesús Figueroa</strong></a> 2021-2025&nbsp;· DF&nbsp;· Alianza Petrolera, Deportivo Pasto, Deportes Quindío</p><p><a href="/es/jugadores/4f6a4d48/Jhon-Figueroa"><strong>Jhon Figueroa</strong></a> 2023-2024&nbsp;· GK&nbsp;· Atlético Huila, Jaguares de Córdoba</p><p><a href="/es/jugadores/467cec8b/Julian-Figueroa">Julián Figueroa</a> 2022-2024&nbsp;· MF&nbsp;· Internacional de Barinas, Deportivo Táchira, Envigado FC, Monagas</p><p><a href="/es/jugadores/27726b19/Yilmar-Filigrana">Yilmar Filigrana</a> 2017-2023&nbsp;· FW&nbsp;· Deportes Quindío, Bucaramanga, Técnico Universitario, Coritiba</p><p><a href="/es/jugadores/b8ebdee8/Cristian-Florez">Cristian Florez</a> 2014-2023&nbsp;· DF&nbsp;· Alianza Petrolera, Sport Boys, Deportivo Pereira, Bucaramanga, Once Caldas, Deportivo Pasto, América</p><p><a href="/es/jugadores/d455f9d5/Freddy-Florez"><strong>Freddy Flórez</strong></a> 2017-2024&nbsp;· MF&nbsp;· Alianza Petrolera</p><p><a href="/es/jugadores/e83e0af4/Javier-Florez">Javier Flórez</a> 2015&nbsp;· MF&nbsp;· Junior, Cúcuta Deportivo, Boyacá Chicó</p><p><a href="/es/jugadores/8a253cce/Jose-Florez">José Florez</a> 2022&nbsp;· MF&nbsp;· Estudiantes de Mérida</p><p><a href="/es/jugadores/b86c59bc/Kelvin-Florez"><strong>Kelvin Flórez</strong></a> 2024-2025&nbsp;· MF&nbsp;· Fortaleza FC</p><p><a href="/es/jugadores/2178177d/Reinaldo-Fontalvo">Reinaldo Fontalvo</a> 2020-2023&nbsp;· GK</p><p><a href="/es/jugadores/9799ad2e/Juan-Forero"><strong>Juan Forero</strong></a> 2020-2021&nbsp;· DF&nbsp;· Boyacá Chicó</p><p><a href="/es/jugadores/616519ee/Diego-Fori"><strong>Diego Fori</strong></a> 2017&nbsp;· DF</p><p><a href="/es/jugadores/faf827ca/Jimer-Fory"><strong>Jimer Fory</strong></a> 2020-2025&nbsp;· DF,MF&nbsp;· Portland Timbers, Deportivo Pereira, Independiente Medellín, Atlético Nacional</p><p><a href="/es/jugadores/1c3f8b0e/Luis-Fragozo"><strong>Luis Fragozo</strong></a> 2025&nbsp;· FW&nbsp;· Emelec</p><p><a href="/es/jugadores/0ec402ca/Juan-Franco"><strong>Juan Franco</strong></a> 2021-2025&nbsp;· DF&nbsp;· Deportivo Pasto, Deportivo Cali</p><p><a href="/es/jugadores/d15a9cdb/Otto-Franco">Otto Franco</a> 2015-2016&nbsp;· FW&nbsp;· Envigado FC</p><p><a href="/es/jugadores/78bf31cf/Pedro-Franco"><strong>Pedro Franco</strong></a> 2013-2025&nbsp;· DF,MF&nbsp;· Alianza Petrolera, Millonarios, Beşiktaş, América de Cali, Colombia, San Lorenzo, Blooming</p><p><a href="/es/jugadores/312b5f91/Jean-Franco-Sarmiento"><strong>Jean Franco Sarmiento</strong></a> 2016-2025&nbsp;· DF&nbsp;· Radomiak Radom</p><p><a href="/es/jugadores/8a20caf8/Yuberney-Franco">Yuberney Franco</a> 2015-2018&nbsp;· FW&nbsp;· Uniautónoma FC, Envigado FC, Estudiantes de Caracas, Expreso Rojo, Jaguares de Córdoba, Deportivo Pe</p><p><a href="/es/jugadores/0d1105ff/John-Freddy-Perez"><strong>John Freddy Pérez</strong></a> 2015-2024&nbsp;· MF&nbsp;· Bucaramanga, Alianza Petrolera, Royal Parí, Jaguares de Córdoba, Águilas Doradas, Deportivo Cali</p><p><a href="/es/jugadores/bf78c71a/Jhon-Fredy-Hurtado">Jhon Fredy Hurtado</a> 2015&nbsp;· MF&nbsp;· Deportes Tolima, Deportivo Pasto, Cúcuta Deportivo</p><p><a href="/es/jugadores/d3dafa47/Jhon-Fredy-Miranda">Jhon Fredy Miranda</a> 2015-2022&nbsp;· FW&nbsp;· Patriotas FC, Santa Fe, Águilas Doradas</p><p><a href="/es/jugadores/457e8ce5/John-Fredy-Salazar"><strong>John Fredy Salazar</strong></a> 2015-2025&nbsp;· FW,MF&nbsp;· Águilas Doradas, Once Caldas, Patriotas FC, Santa Fe</p><p><a href="/es/jugadores/67d34403/Brayan-Freire-Cardenas">Brayan Freire Cárdenas</a> 2015&nbsp;· DF</p><p><a href="/es/jugadores/02ed7288/Breyder-Frias">Breyder Frías</a> 2016-2018&nbsp;· MF</p><p><a href="/es/jugadores/3846f644/Matteo-Frigerio"><strong>Matteo Frigerio</strong></a> 2024&nbsp;· FW</p><p><a href="/es/jugadores/bb23a0e7/Gabriel-Fuentes"><strong>Gabriel Fuentes</strong></a> 2018-2024&nbsp;· DF&nbsp;· Junior, Zaragoza, Fluminense</p><p><a href="/es/jugadores/8f4c5abd/Jairo-Fuentes">Jairo Fuentes</a> 2023&nbsp;· FW</p><p><a href="/es/jugadores/944a900a/Jeinner-Fuentes">Jeinner Fuentes</a> 2023-2024&nbsp;· FW&nbsp;· Deportes Tolima</p><p><a href="/es/jugadores/b8e1cf4a/Juanda-Fuentes"><strong>Juanda Fuentes</strong></a> 2023-2025&nbsp;· MF&nbsp;· Andorra, Oostende</p><p><a href="/es/jugadores/a037e225/Oliver-Fula">Oliver Fula</a> 2016-2017&nbsp;· DF&nbsp;· La Equidad, Once Caldas, Envigado FC, Alianza Petrolera</p><p><a href="/es/jugadores/07ca21ea/Luis-Gabriel-Rey">Luis Gabriel Rey</a> 2003-2017&nbsp;· FW&nbsp;· Morelia, Atlante, Chiapas, América, Puebla, Pachuca</p><p><a href="/es/jugadores/5538fd79/Ana-Gabriela-Huertas"><strong>Ana Gabriela Huertas</strong></a> 2018-2024&nbsp;· MF&nbsp;· Real Brasília FC, Colombia</p><p><a href="/es/jugadores/4b79aaee/Natalia-Gaitan">Natalia Gaitán</a> 2011-2016&nbsp;· DF&nbsp;· Colombia</p><p><a href="/es/jugadores/4ac47e7d/Jean-Galindo"><strong>Jean Galindo</strong></a> 2024-2025&nbsp;· FW&nbsp;· Deportivo Cali</p><p><a href="/es/jugadores/67bdd667/Laura-Galindo">Laura Galindo</a> 2019&nbsp;· GK</p><p><a href="/es/jugadores/64b7d6f0/Oscar-Galindo">Oscar Galindo</a> 2015&nbsp;· FW&nbsp;· Boyacá Chicó</p><p><a href="/es/jugadores/08bbbac9/Juan-Gallego">Juan Gallego</a> 2021-2024&nbsp;· MF&nbsp;· Independiente Medellín, La Equidad</p><p><a href="/es/jugadores/4c9ea9de/Juan-Gallego"><strong>Juan Gallego</strong></a> 2023-2025&nbsp;· GK&nbsp;· Once Caldas</p><p><a href="/es/jugadores/2751632d/Cristian-Gamboa">Cristian Gamboa</a> 2022&nbsp;· FW</p><p><a href="/es/jugadores/fc06761b/Delio-Gamboa">Delio Gamboa</a> 1962&nbsp;· FW</p><p><a href="/es/jugadores/b1612ec3/Jhon-Gamboa"><strong>Jhon Gamboa</strong></a> 2025&nbsp;· DF&nbsp;· Envigado FC</p><p><a href="/es/jugadores/90b823cd/Mateo-Garavito"><strong>Mateo Garavito</strong></a> 2021-2024&nbsp;· DF&nbsp;· Deportivo Pasto, Santa Fe, Águilas Doradas, Deportes Quindío</p><p><a href="/es/jugadores/49e96d92/Jonathan-Garay">Jonathan Garay</a> 2017&nbsp;· MF&nbsp;· Expreso Rojo</p><p><a href="/es/jugadores/03c94eec/Bayron-Garces"><strong>Bayron Garces</strong></a> 2019-2025&nbsp;· FW,MF&nbsp;· Envigado FC, Alianza Petrolera, Atlético Huila, Bucaramanga, Independiente Medellín</p><p><a href="/es/jugadores/d8eb21b7/Carlos-Garces"><strong>Carlos Garcés</strong></a> 2021-2025&nbsp;· DF&nbsp;· LA Galaxy, Deportivo Pereira</p><p><a href="/es/jugadores/164b4bae/Yojan-Garces"><strong>Yojan Garcés</strong></a> 2023-2024&nbsp;· FW&nbsp;· América de Cali</p><p><a href="/es/jugadores/a0f0e472/Alejandro-Garcia"><strong>Alejandro García</strong></a> 2017-2025&nbsp;· MF&nbsp;· Once Caldas</p><p><a href="/es/jugadores/a039efd9/Andres-Garcia">Andrés García</a> 2017&nbsp;· GK</p><p><a href="/es/jugadores/e4305119/Antony-Garcia"><strong>Antony García</strong></a> 2019-2025&nbsp;· FW&nbsp;· Anzoátegui, Angostura</p><p><a href="/es/jugadores/bdfeacdb/Brayner-Garcia">Brayner García</a> 2015-2019&nbsp;· DF&nbsp;· Junior, Cúcuta Deportivo, Universitario, Bucaramanga, Águilas Doradas</p><p><a href="/es/jugadores/4caa93dd/Daniel-Garcia">Daniel García</a> 2022-2023&nbsp;· FW&nbsp;· Santa Fe</p><p><a href="/es/jugadores/08aad011/Felix-Garcia">Félix García</a> 2004-2018&nbsp;· DF&nbsp;· Deportivo Pasto, Bucaramanga, La Equidad, Boyacá Chicó, Iraklis Thessaloniki</p><p><a href="/es/jugadores/88fe1153/Ferlys-Garcia">Ferlys García</a> 2021-2023&nbsp;· FW&nbsp;· Alianza Petrolera, Junior</p><p><a href="/es/jugadores/d283458e/Gilberto-Garcia">Gilberto García</a> 2013-2023&nbsp;· DF,MF&nbsp;· Deportivo Pasto, Atlético Nacional, Once Caldas, Deportes Tolima, Deportivo Pereira, Cúcuta Deportiv</p><p><a href="/es/jugadores/d15fd431/Jose-Garcia-Herrera">José García Herrera</a> 2015&nbsp;· DF&nbsp;· Uniautónoma FC</p><p><a href="/es/jugadores/3f214907/Javier-Garcia">Javier García</a> 2020-2021&nbsp;· FW&nbsp;· Deportivo Pereira</p><p><a href="/es/jugadores/4dc13e74/Jhon-Garcia">Jhon García</a> 2019&nbsp;· MF</p><p><a href="/es/jugadores/5dcd267b/John-Garcia">John García</a> 2017-2018&nbsp;· FW</p><p><a href="/es/jugadores/bd6ba56c/Jordan-Garcia"><strong>Jordan García</strong></a> 2024-2025&nbsp;· GK&nbsp;· Fortaleza FC</p><p><a href="/es/jugadores/ea36e829/Jose-Garcia"><strong>José García</strong></a> 2022-2025&nbsp;· DF&nbsp;· Bucaramanga, Patriotas FC</p><p><a href="/es/jugadores/b1a673e2/Juan-Garcia"><strong>Juan García</strong></a> 2019-2025&nbsp;· MF&nbsp;· Once Caldas, Millonarios, Jaguares de Córdoba</p><p><a href="/es/jugadores/4df1eee9/Leonel-Garcia">Leonel García</a> 2015&nbsp;· FW&nbsp;· Uniautónoma FC</p><p><a href="/es/jugadores/1e4a0a74/Marino-Garcia">Marino García</a> 2015&nbsp;· DF&nbsp;· Bucaramanga, Deportivo Pasto, Santa Fe, Jaguares de Córdoba, Deportes Tolima, Independiente Medellín</p><p><a href="/es/jugadores/e36a6f20/Marlon-Garcia"><strong>Marlon García</strong></a> 2024-2025&nbsp;· DF&nbsp;· Estudiantes de Mérida</p><p><a href="/es/jugadores/c36dc6dd/Martin-Garcia">Martín García</a> 2007-2015&nbsp;· FW&nbsp;· Millonarios, Club Olimpia, Unión Comercio, Sport Boys, Cúcuta Deportivo, Cienciano, São Caetano, Vas</p><p><a href="/es/jugadores/492f7668/Mateo-Garcia"><strong>Mateo García</strong></a> 2018-2025&nbsp;· MF&nbsp;· Once Caldas, Deportivo Pasto, Unión Magdalena</p><p><a href="/es/jugadores/bb79726b/Mauricio-Garcia">Mauricio García</a> 2023&nbsp;· DF&nbsp;· Boyacá Chicó</p><p><a href="/es/jugadores/2375dd75/Mender-Garcia"><strong>Mender García</strong></a> 2017-2025&nbsp;· FW,MF&nbsp;· Independiente Medellín, Once Caldas, Minnesota United</p><p><a href="/es/jugadores/0774527a/Olmes-Garcia">Olmes García</a> 2013-2024&nbsp;· FW&nbsp;· Real Salt Lake, Deportes Quindío, América de Cali, Jaguares de Córdoba, Gualaceo Sporting Club, Roya</p><p><a href="/es/jugadores/8ee8cd91/Over-Garcia">Over Garcia</a> 2016-2018&nbsp;· FW&nbsp;· Caracas, Portuguesa, Aragua</p><p><a href="/es/jugadores/3847af81/Restrepo-Garcia">Restrepo García</a> 2015&nbsp;· DF</p><p><a href="/es/jugadores/571de68b/Romario-Garcia">Romario García</a> 2016&nbsp;· MF</p><p><a href="/es/jugadores/38ea8145/Santiago-Garcia">Santiago García</a> 2015-2017&nbsp;· DF&nbsp;· Expreso Rojo</p><p><a href="/es/jugadores/b027ebdd/Simon-Garcia"><strong>Simon Garcia</strong></a> 2023-2025&nbsp;· DF&nbsp;· Atlético Nacional</p><p><a href="/es/jugadores/f94dff8d/Sofia-Garcia">Sofía García</a> 2019&nbsp;· DF</p><p><a href="/es/jugadores/35d2eff3/Stiwar-Garcia">Stiwar García</a> 2015-2021&nbsp;· MF&nbsp;· Jaguares de Córdoba, Nacional Potosí, Alianza Petrolera, Patriotas FC, Bucaramanga, KuPS, Atlético N</p><p><a href="/es/jugadores/9b0bf6e7/Ivan-Garrido">Iván Garrido</a> 2015&nbsp;· DF&nbsp;· Bucaramanga, Atlético Huila, Uniautónoma FC, Santa Fe</p><p><a href="/es/jugadores/99484bc2/Santiago-Garzon">Santiago Garzón</a> 2021&nbsp;· MF</p><p><a href="/es/jugadores/a24e2c1a/Frank-Gaviria">Frank Gaviria</a> 2022&nbsp;· FW&nbsp;· RGV FC Toros</p><p><a href="/es/jugadores/020fae08/Hernan-Gaviria">Hernán Gaviria</a> 1994&nbsp;· MF</p><p><a href="/es/jugadores/fdfd7b6b/Jhoan-Gaviria">Jhoan Gaviria</a> 2021&nbsp;· DF</p><p><a href="/es/jugadores/e3edcd26/Dani-Geliz">Dani Géliz</a> 2017&nbsp;· FW&nbsp;· Atlético Socopó</p><p><a href="/es/jugadores/f2eade09/Ibarbo-Gerrero">Ibarbo Gerrero</a> 2015&nbsp;· MF</p><p><a href="/es/jugadores/ea868537/Faber-Gil"><strong>Faber Gil</strong></a> 2016-2025&nbsp;· FW,MF&nbsp;· Atlético Nacional, Pachuca, Atlético Huila, Deportivo Pereira, La Equidad, Envigado FC</p><p><a href="/es/jugadores/c94f8ba5/Juan-Gil">Juan Gil</a> 2018-2021&nbsp;· GK</p><p><a href="/es/jugadores/48d7077c/Nicolas-Gil"><strong>Nicolás Gil</strong></a> 2016-2024&nbsp;· DF&nbsp;· Unión Magdalena, Deportivo Pasto, Santa Fe</p><p><a href="/es/jugadores/40d3d4af/Juan-Gilberto-Nunez">Juan Gilberto Núñez</a> 2016-2017&nbsp;· FW,MF&nbsp;· Boyacá Chicó, Deportes Quindío, Deportivo Pasto, La Equidad, Atlético Huila, Junior</p><p><a href="/es/jugadores/f9a62e23/Carlos-Giraldo">Carlos Giraldo</a> 2016-2018&nbsp;· MF&nbsp;· Deportivo Pasto, Bucaramanga, Once Caldas</p><p><a href="/es/jugadores/51ef046d/Cesar-Giraldo">César Giraldo</a> 2017-2019&nbsp;· GK&nbsp;· Expreso Rojo, Unión Magdalena</p><p><a href="/es/jugadores/ed8489d1/Daniel-Giraldo"><strong>Daniel Giraldo</strong></a> 2016-2025&nbsp;· DF,MF&nbsp;· Juventude, Millonarios, Deportivo Cali, Santa Fe, Junior, Deportivo Pasto</p><p><a href="/es/jugadores/0e1cb1ea/Esteban-Giraldo"><strong>Esteban Giraldo</strong></a> 2015-2021&nbsp;· GK&nbsp;· Deportivo Pereira</p><p><a href="/es/jugadores/5cf28a07/Fabio-Giraldo">Fabio Giraldo</a> 2019&nbsp;· FW</p><p><a href="/es/jugadores/50bf4076/Jaime-Giraldo"><strong>Jaime Giraldo</strong></a> 2017-2025&nbsp;· DF&nbsp;· Operário, Independiente Medellín, Atlético Huila, Deportivo Pasto</p><p><a href="/es/jugadores/22b6aa0e/Juan-Giraldo"><strong>Juan Giraldo</strong></a> 2016-2025&nbsp;· MF&nbsp;· Unión Magdalena, Águilas Doradas, Caracas</p><p><a href="/es/jugadores/2585c281/Juan-Giraldo">Juan Giraldo</a> 2017-2022&nbsp;· MF</p><p><a href="/es/jugadores/abbe7065/Mateo-Giraldo">Mateo Giraldo</a> 2017-2018&nbsp;· MF&nbsp;· Envigado FC</p><p><a href="/es/jugadores/f8bbbea7/Natalia-Giraldo">Natalia Giraldo</a> 2019-2024&nbsp;· GK&nbsp;· Colombia</p><p><a href="/es/jugadores/32484ad4/Nicolas-Giraldo"><strong>Nicolás Giraldo</strong></a> 2014-2025&nbsp;· DF,MF&nbsp;· Millonarios, Envigado FC, América de Cali, Once Caldas, Deportivo Pereira, Deportes Tolima, Rentista</p><p><a href="/es/jugadores/c5eeb1c6/Victor-Giraldo">Víctor Giraldo</a> 2014-2020&nbsp;· DF&nbsp;· La Equidad, Atlético Nacional, Deportivo Cali, Santa Fe, Deportes Tolima, Boyacá Chicó, Atlético Hui</p><p><a href="/es/jugadores/53b8853a/Yeiler-Goez"><strong>Yeiler Goez</strong></a> 2018-2024&nbsp;· MF&nbsp;· Águilas Doradas, Colón, Deportivo Pereira, Santa Fe, Atlético Nacional</p><p><a href="/es/jugadores/7a79e3dc/Breidy-Golu"><strong>Breidy Golú</strong></a> 2017-2022&nbsp;· FW&nbsp;· Carabobo</p><p><a href="/es/jugadores/e43c8d72/Yeimar-Gomez-Andrade"><strong>Yeimar Gómez Andrade</strong></a> 2014-2025&nbsp;· DF&nbsp;· Seattle Sounders, Unión, Rosario Central</p><p><a href="/es/jugadores/a9845072/Brahyan-Gomez">Brahyan Gómez</a> 2017&nbsp;· GK</p><p><a href="/es/jugadores/5b96fc8b/Brayan-Gomez">Brayan Gómez</a> 2019-2023&nbsp;· MF&nbsp;· Real Monarchs</p><p><a href="/es/jugadores/a8da85e0/Brayan-Gomez">Brayan Gómez</a> 2023&nbsp;· DF</p><p><a href="/es/jugadores/76a82373/Carlos-Gomez"><strong>Carlos Gómez</strong></a> 2022-2026&nbsp;· FW,MF&nbsp;· Rennes, Real Salt Lake, Millonarios</p><p><a href="/es/jugadores/114727fc/Denis-Gomez">Denis Gómez</a> 2015-2018&nbsp;· DF&nbsp;· Jaguares de Córdoba, Águilas Doradas, Atlético Huila, América de Cali</p><p><a href="/es/jugadores/3a99ba36/Edson-Gomez">Edson Gómez</a> 2015-2019&nbsp;· MF</p><p><a href="/es/jugadores/e17c21c4/Edward-Gomez">Edward Gomez</a> 2020&nbsp;· GK</p><p><a href="/es/jugadores/d43c278a/Gildardo-Gomez">Gildardo Gómez</a> 1990&nbsp;· DF&nbsp;· Colombia</p><p><a href="/es/jugadores/1596e74f/Guillermo-Gomez"><strong>Guillermo Gómez</strong></a> 2022-2025&nbsp;· GK&nbsp;· Unión Magdalena, Cortuluá</p><p><a href="/es/jugadores/3f8f1626/Harold-Gomez">Harold Gómez</a> 2015-2022&nbsp;· DF&nbsp;· Bucaramanga, Deportivo Cali, Once Caldas, Santa Fe, Cúcuta Deportivo, Deportes Tolima, Jaguares de C</p><p><a href="/es/jugadores/cb1cec2a/Jefferson-Gomez">Jefferson Gómez</a> 2015-2022&nbsp;· DF&nbsp;· Envigado FC, Junior, Bucaramanga</p><p><a href="/es/jugadores/35ac36b2/Jhon-Gomez"><strong>Jhon Gomez</strong></a> 2021&nbsp;· DF</p><p><a href="/es/jugadores/030f52e7/Johan-Gomez">Johan Gómez</a> 2019-2021&nbsp;· FW&nbsp;· Jaguares de Córdoba</p><p><a href="/es/jugadores/63a95a03/Jose-Gomez">José Gómez</a> 2022&nbsp;· DF&nbsp;· Unión Magdalena</p><p><a href="/es/jugadores/6ccc52b7/Jossymar-Gomez">Jossymar Gómez</a> 2015-2023&nbsp;· MF&nbsp;· Junior, La Equidad, Bucaramanga, Boyacá Chicó, Unión Magdalena</p><p><a href="/es/jugadores/5781a992/Juan-Gomez">Juan Gómez</a> 2018&nbsp;· FW</p><p><a href="/es/jugadores/f17fbfe0/Julian-Gomez">Julian Gómez</a> 2000&nbsp;· FW&nbsp;· MetroStars</p><p><a href="/es/jugadores/2c3f6ad2/Luis-Gomez">Luis Gómez</a> 2023&nbsp;· FW&nbsp;· Envigado FC</p><p><a href="/es/jugadores/e41c025a/Luis-Gomez"><strong>Luis Gómez</strong></a> 2018-2025&nbsp;· FW&nbsp;· América de Cali, Leones FC, Santa Clara</p><p><a href="/es/jugadores/72748d5f/Mario-Gomez">Mario Gomez</a> 2014&nbsp;· MF&nbsp;· Santa Fe, Deportivo Pasto</p><p><a href="/es/jugadores/dde92e3a/Michael-Gomez"><strong>Michael Gómez</strong></a> 2015-2024&nbsp;· FW&nbsp;· Envigado FC, Boyacá Chicó</p><p><a href="/es/jugadores/61416b8c/Nestor-Gomez">Néstor Gómez</a> 2017&nbsp;· FW</p><p><a href="/es/jugadores/a1e24bac/Paula-Gomez">Paula Gómez</a> 2019&nbsp;· DF</p><p><a href="/es/jugadores/4527095e/Mauricio-Gomez-Sanchez"><strong>Mauricio Gómez Sánchez</strong></a> 2015-2024&nbsp;· MF&nbsp;· Patriotas FC, Águilas Doradas, Independiente Medellín, Santa Fe, América de Cali, Once Caldas</p><p><a href="/es/jugadores/e1b38c72/Santiago-Gomez"><strong>Santiago Gómez</strong></a> 2018-2025&nbsp;· MF&nbsp;· La Equidad, Deportivo Pasto</p><p><a href="/es/jugadores/233de573/Sebastian-Gomez"><strong>Sebastián Gómez</strong></a> 2018-2026&nbsp;· MF&nbsp;· Coritiba, Atlético Nacional, Leones FC</p><p><a href="/es/jugadores/4a3541d5/Yimy-Gomez"><strong>Yimy Gómez</strong></a> 2017-2025&nbsp;· GK&nbsp;· Independiente Medellín</p><p><a href="/es/jugadores/f6c48b15/Yulian-Gomez"><strong>Yulián Gómez</strong></a> 2017-2025&nbsp;· DF&nbsp;· Deportivo Cali, Independiente Medellín, Unión Magdalena</p><p><a href="/es/jugadores/77145f64/Eduar-Gongora">Eduar Góngora</a> 2015&nbsp;· MF&nbsp;· Deportivo Pasto</p><p><a href="/es/jugadores/e8e5e962/Jerson-Gongora">Jerson Góngora</a> 2015&nbsp;· DF</p><p><a href="/es/jugadores/b7bfb5bb/Arneth-Gonzalez">Arneth González</a> 2023&nbsp;· MF&nbsp;· Unión Magdalena</p><p><a href="/es/jugadores/0502f084/Jarvinson-Gonzalez-Castro">Jarvinson González Castro</a> 2015-2016&nbsp;· MF&nbsp;· Atlético Huila</p><p><a href="/es/jugadores/0ef2c95e/Dairin-Gonzalez">Dairín González</a> 2017-2019&nbsp;· DF&nbsp;· La Equidad, Bucaramanga, Unión Magdalena, Guabirá</p><p><a href="/es/jugadores/3eea25ca/David-Gonzalez">David González</a> 2007-2020&nbsp;· GK&nbsp;· Independiente Medellín, Deportivo Cali, Çaykur Rizespor, Aberdeen, Deportivo Pasto, Barnsley</p><p><a href="/es/jugadores/fa9a0cb8/German-Gonzalez-Duque">Germán González Duque</a> 2016&nbsp;· FW&nbsp;· Fortaleza FC</p><p><a href="/es/jugadores/07a26b1e/Duvan-Gonzalez">Duván González</a> 2018-2021&nbsp;· MF&nbsp;· Boyacá Chicó, Leones FC</p><p><a href="/es/jugadores/36667699/Elvis-Gonzalez">Elvis González</a> 2015-2021&nbsp;· DF&nbsp;· Cúcuta Deportivo, Jaguares de Córdoba, Atlético Huila, La Equidad, Deportivo Pereira, Águilas Dorada</p><p><a href="/es/jugadores/af50d7de/Ethan-Gonzalez">Ethan González</a> 2017-2022&nbsp;· FW&nbsp;· La Equidad, Unión Magdalena, Jaguares de Córdoba, Expreso Rojo</p><p><a href="/es/jugadores/f02c1b79/Hector-Gonzalez-Garzon">Héctor González Garzón</a> 1962&nbsp;· FW</p><p><a href="/es/jugadores/0059241d/Jaime-Gonzalez">Jaime González</a> 1962&nbsp;· DF&nbsp;· Colombia</p><p><a href="/es/jugadores/bf2ac20f/Jasond-Gonzalez"><strong>Jasond González</strong></a> 2023-2025&nbsp;· FW&nbsp;· Always Ready, Real Santa Cruz, Kaizer Chiefs</p><p><a href="/es/jugadores/681989c2/Jersson-Gonzalez"><strong>Jersson González</strong></a> 2020-2025&nbsp;· MF&nbsp;· Deportes Tolima, Santa Fe, Independiente Medellín</p><p><a href="/es/jugadores/aa1e5ffa/Jhoan-Gonzalez">Jhoan González</a> 2019&nbsp;· MF</p><p><a href="/es/jugadores/74a1785b/Jhon-Gonzalez">Jhon González</a> 2016-2020&nbsp;· MF&nbsp;· Deportivo JBL, Boyacá Chicó</p><p><a href="/es/jugadores/8f66d554/Jhon-Gonzalez">Jhon González</a> 2019&nbsp;· MF</p><p><a href="/es/jugadores/7da353fd/Jhonatan-Gonzalez">Jhonatan González</a> 2023-2024&nbsp;· GK</p><p><a href="/es/jugadores/9324c359/Jose-Gonzalez">José González</a> 2015&nbsp;· MF</p><p><a href="/es/jugadores/13f73eda/Juan-Gonzalez"><strong>Juan González</strong></a> 2022-2025&nbsp;· DF&nbsp;· Estrela, Deportivo Cali</p><p><a href="/es/jugadores/2be7ab3a/Juan-Gonzalez">Juan González</a> 2021&nbsp;· FW</p><p><a href="/es/jugadores/5fb70d9a/Fabian-Gonzalez-Lasso"><strong>Fabián González Lasso</strong></a> 2015-2025&nbsp;· FW,MF&nbsp;· Omiya Ardija, Cantolao, Júbilo Iwata, Millonarios, Atlético Nacional, Ventforet Kofu, Ayacucho, La E</p><p><a href="/es/jugadores/f504e4f3/Manuela-Gonzalez">Manuela González</a> 2015-2018&nbsp;· FW&nbsp;· Colombia</p><p><a href="/es/jugadores/eae9355f/Diego-Gonzalez-Marroquin">Diego González Marroquín</a> 2015&nbsp;· FW&nbsp;· Boyacá Chicó</p><p><a href="/es/jugadores/e437e450/Mauricio-Gonzalez">Mauricio González</a> 2015&nbsp;· FW&nbsp;· Jaguares de Córdoba</p><p><a href="/es/jugadores/e5835d23/Valentina-Gonzalez">Valentina González</a> 2021&nbsp;· GK</p><p><a href="/es/jugadores/4cd2c7a5/Wilmar-Gonzalez">Wilmar González</a> 2021-2024&nbsp;· FW&nbsp;· Internacional de Barinas</p><p><a href="/es/jugadores/c6c88c7d/Yony-Gonzalez"><strong>Yony González</strong></a> 2015-2025&nbsp;· FW,MF&nbsp;· Águilas Doradas, Junior, Fluminense, Envigado FC, Deportivo Cali, Ceará, Portimonense, LA Galaxy, At</p><p><a href="/es/jugadores/8f2ed127/Yeison-Gordillo"><strong>Yeison Gordillo</strong></a> 2015-2025&nbsp;· MF&nbsp;· Deportivo Cali, Santa Fe, Boyacá Chicó, Deportes Tolima, San Lorenzo, Unión, Junior, Vélez Sarsfield</p><p><a href="/es/jugadores/42e1a556/Cristian-Graciano"><strong>Cristian Graciano</strong></a> 2023-2025&nbsp;· DF&nbsp;· Deportivo Cali, Independiente Medellín</p><p><a href="/es/jugadores/b1eedfb3/Jefferson-Granado"><strong>Jefferson Granado</strong></a> 2023-2024&nbsp;· DF&nbsp;· FK Levski 2005</p><p><a href="/es/jugadores/83282b8d/Yoximar-Granado">Yoximar Granado</a> 2011-2012&nbsp;· MF&nbsp;· Fort Lauderdale Strikers</p><p><a href="/es/jugadores/2c7a22ac/Lina-Granados">Lina Granados</a> 2015-2020&nbsp;· DF</p><p><a href="/es/jugadores/7ef5d8a8/Pier-Graziani"><strong>Pier Graziani</strong></a> 2015-2024&nbsp;· GK&nbsp;· Alianza Petrolera</p><p><a href="/es/jugadores/a659447e/Jaminthon-Grueso">Jaminthon Grueso</a> 2018-2020&nbsp;· FW&nbsp;· Boyacá Chicó</p><p><a href="/es/jugadores/c36ef7e9/Fredy-Guarin">Fredy Guarín</a> 2006-2021&nbsp;· MF&nbsp;· Internazionale, Porto, Shanghai Shenhua, Saint-Étienne, Colombia, Vasco da Gama, Millonarios</p><p><a href="/es/jugadores/020dd26e/Victor-Guaza-Lucumi">Víctor Guazá Lucumí</a> 2015-2016&nbsp;· FW&nbsp;· Universidad Técnica de Cajamarca, Atlético Huila, La Equidad, Boyacá Chicó, Zob Ahan, Maracaibo</p><p><a href="/es/jugadores/c2a977d6/Edgar-Guerra"><strong>Edgar Guerra</strong></a> 2020-2025&nbsp;· MF&nbsp;· León, Millonarios</p><p><a href="/es/jugadores/e1ec43bf/Ingrid-Guerra">Ingrid Guerra</a> 2021-2023&nbsp;· FW&nbsp;· CA Mineiro, Colombia</p><p><a href="/es/jugadores/f836ed3a/Jose-Guerra">José Guerra</a> 2021&nbsp;· MF</p><p><a href="/es/jugadores/c28ea4de/Omar-Guerra">Omar Guerra</a> 2015&nbsp;· MF&nbsp;· Macará, Deportivo Cuenca, Universidad Católica, Técnico Universitario, Uniautónoma FC, Deportivo Qui</p><p><a href="/es/jugadores/e42fc6d8/Sebastian-Guerra"><strong>Sebastian Guerra</strong></a> 2019-2025&nbsp;· GK&nbsp;· Águilas Doradas</p><p><a href="/es/jugadores/d004893e/Alain-Guerrero">Alain Guerrero</a> 2022-2023&nbsp;· DF&nbsp;· Unión Magdalena</p><p><a href="/es/jugadores/dd2688df/Andres-Guerrero">Andrés Guerrero</a> 2016-2018&nbsp;· DF</p><p><a href="/es/jugadores/ae2e9552/David-Guerrero"><strong>David Guerrero</strong></a> 2024&nbsp;· MF</p><p><a href="/es/jugadores/6d6b74a7/Exneyder-Guerrero"><strong>Exneyder Guerrero</strong></a> 2021-2024&nbsp;· MF&nbsp;· Jaguares de Córdoba, Atlético Huila, Santa Fe</p><p><a href="/es/jugadores/4c61e2c8/Fabian-Guerrero">Fabián Guerrero</a> 2021&nbsp;· MF</p><p><a href="/es/jugadores/9c520755/Jhomier-Guerrero"><strong>Jhomier Guerrero</strong></a> 2024-2025&nbsp;· DF&nbsp;· Junior, Patriotas FC</p><p><a href="/es/jugadores/79dac9a6/Julian-Guerrero">Julián Guerrero</a> 2016&nbsp;· DF</p><p><a href="/es/jugadores/92609e0e/Mario-Guerrero">Mario Guerrero</a> 2019&nbsp;· MF</p><p><a href="/es/jugadores/ddd8c2db/Miguel-Guerrero">Miguel Guerrero</a> 1990-1999&nbsp;· FW&nbsp;· Bari, Mérida</p><p><a href="/es/jugadores/869b895e/Juan-Guevara"><strong>Juan Guevara</strong></a> 2024-2025&nbsp;· DF&nbsp;· Bastia, Fortaleza FC</p><p><a href="/es/jugadores/a00da954/Julian-Guevara"><strong>Julián Guevara</strong></a> 2018-2023&nbsp;· MF&nbsp;· Alianza Petrolera, Jaguares de Córdoba, América de Cali, Deportivo Pasto, PS Kemi Kings, Inter Turku</p><p><a href="/es/jugadores/c0622dba/Julian-Guevara">Julián Guevara</a> 2017&nbsp;· MF&nbsp;· PS Kemi Kings</p><p><a href="/es/jugadores/1d3789c9/Jorge-Guillen">Jorge Guillén</a> 2015&nbsp;· MF</p><p><a href="/es/jugadores/967c9de0/Juan-Guillermo-Arboleda">Juan Guillermo Arboleda</a> 2015-2023&nbsp;· DF&nbsp;· Alianza Petrolera, Deportes Tolima, Independiente Medellín, Deportivo Pasto, Atlético Nacional</p><p><a href="/es/jugadores/af8ca2cc/Juan-Guillermo-Dominguez">Juan Guillermo Domínguez</a> 2015-2019&nbsp;· DF,MF&nbsp;· Deportivo Cali, Millonarios, Junior, Colo-Colo, Real Cartagena, Estudiantes–LP, Newell's Old Boys, A</p><p><a href="/es/jugadores/22e23f64/Julian-Guillermo">Julián Guillermo</a> 2015-2018&nbsp;· MF&nbsp;· Deportivo Pasto, Independiente Medellín, Banfield, Once Caldas, Santa Fe</p><p><a href="/es/jugadores/ed17e30e/Juan-Guillermo-Velez">Juan Guillermo Vélez</a> 2015-2016&nbsp;· FW&nbsp;· Alianza Atlético, Santa Fe, Deportivo Pasto</p><p><a href="/es/jugadores/74c69dfd/Wilder-Guisao">Wilder Guisao</a> 2014-2023&nbsp;· FW,MF&nbsp;· Jaguares de Córdoba, Atlético Nacional, Envigado FC, Unión Magdalena, Toluca, Cúcuta Deportivo, Cort</p><p><a href="/es/jugadores/05200fe1/Aldair-Gutierrez"><strong>Aldair Gutiérrez</strong></a> 2016-2025&nbsp;· DF&nbsp;· Bucaramanga, Deportivo Cali, Deportivo Pereira, Cortuluá</p><p><a href="/es/jugadores/64d96d39/Alejandro-Gutierrez"><strong>Alejandro Gutiérrez</strong></a> 2022&nbsp;· DF&nbsp;· Santa Fe</p><p><a href="/es/jugadores/46903289/Anderson-Gutierrez">Anderson Gutiérrez</a> 2022&nbsp;· FW</p><p><a href="/es/jugadores/5aaed9b4/Eduard-Gutierrez">Eduard Gutiérrez</a> 2015-2017&nbsp;· DF&nbsp;· Atlético Huila</p><p><a href="/es/jugadores/19fa85b3/Santiago-Gutierrez">Santiago Gutiérrez</a> 2023&nbsp;· GK</p><p><a href="/es/jugadores/e45832eb/Sebastian-Gutierrez"><strong>Sebastián Gutiérrez</strong></a> 2016-2025&nbsp;· MF&nbsp;· Churchill Brothers, York United, Patriotas FC</p><p><a href="/es/jugadores/165afe13/Teofilo-Gutierrez"><strong>Teófilo Gutiérrez</strong></a> 2009-2025&nbsp;· FW,MF&nbsp;· Junior, Deportivo Cali, River Plate, Racing Club, Sporting CP, Colombia, Rosario Central, Trabzonspo</p><p><a href="/es/jugadores/b3c07e26/Thomas-Gutierrez"><strong>Thomas Gutiérrez</strong></a> 2022-2026&nbsp;· DF&nbsp;· Libertad, Sportivo Ameliano</p><p><a href="/es/jugadores/b41e77ce/Tony-Gutierrez">Tony Gutiérrez</a> 2022&nbsp;· FW&nbsp;· Técnico Universitario</p><p><a href="/es/jugadores/d9adc056/Victor-Gutierrez">Victor Gutierrez</a> 2017&nbsp;· MF</p><p><a href="/es/jugadores/8d5a8340/Ana-Maria-Guzman"><strong>Ana María Guzmán</strong></a> 2021-2025&nbsp;· DF&nbsp;· Bayern Munich, Colombia</p><p><a href="/es/jugadores/b5a33344/Andres-Guzman">Andrés Guzmán</a> 2019&nbsp;· MF</p><p><a href="/es/jugadores/2555700c/Aldair-Guzman-Chaverra">Aldair Guzmán Chaverra</a> 2016&nbsp;· FW&nbsp;· Cortuluá</p><p><a href="/es/jugadores/415996f1/Jose-Guzman">José Guzmán</a> 2016-2022&nbsp;· MF&nbsp;· Patriotas FC</p><p><a href="/es/jugadores/352ccb4b/Sebastian-Guzman"><strong>Sebastián Guzmán</strong></a> 2018-2025&nbsp;· MF&nbsp;· Atlético Nacional, Once Caldas</p><p><a href="/es/jugadores/31e0d112/Yeison-Guzman"><strong>Yeison Guzmán</strong></a> 2017-2024&nbsp;· FW,MF&nbsp;· Envigado FC, Deportes Tolima, Atlético Nacional</p><p><a href="/es/jugadores/8ef35029/Yilmer-Guzman">Yilmer Guzmán</a> 2017&nbsp;· MF</p><p><a href="/es/jugadores/94ccf890/John-Harold-Lozano">John Harold Lozano</a> 1994-2004&nbsp;· MF&nbsp;· Valladolid, Mallorca, Pachuca, Colombia</p><p><a href="/es/jugadores/3b8ca750/Robert-Harrys">Robert Harrys</a> 2021-2022&nbsp;· MF&nbsp;· Independiente Medellín</p><p><a href="/es/jugadores/bc115c92/Cesar-Haydar"><strong>Cesar Haydar</strong></a> 2019-2025&nbsp;· DF&nbsp;· Kawasaki Frontale, Deportes Tolima, Junior, Red Bull Bragantino</p><p><a href="/es/jugadores/bf3758d2/Carlos-Henao"><strong>Carlos Henao</strong></a> 2015-2025&nbsp;· DF&nbsp;· Bucaramanga, Santa Fe, Millonarios, Patriotas FC, Deportivo Pasto, Águilas Doradas</p><p><a href="/es/jugadores/bd9e6fea/Harrison-Henao">Hárrison Henao</a> 2012-2019&nbsp;· MF&nbsp;· Once Caldas, Millonarios, Alianza Petrolera, Atlético Huila</p><p><a href="/es/jugadores/c41ca98b/Juan-Henao">Juan Henao</a> 2023</p><p><a href="/es/jugadores/d15420c9/Alexis-Henriquez">Alexis Henriquez</a> 2014-2019&nbsp;· DF&nbsp;· Atlético Nacional, Once Caldas</p><p><a href="/es/jugadores/76605c08/Carlos-Henriquez">Carlos Henriquez</a> 2023&nbsp;· DF</p><p><a href="/es/jugadores/fdea7679/Oswaldo-Henriquez">Oswaldo Henríquez</a> 2012-2022&nbsp;· DF&nbsp;· Millonarios, Vasco da Gama, Sport Recife, Águilas Doradas, Querétaro, Criciúma</p><p><a href="/es/jugadores/f20bff1b/Jhon-Henry-Sanchez"><strong>Jhon Henry Sánchez</strong></a> 2016-2025&nbsp;· MF&nbsp;· Boyacá Chicó, Leones FC, Alianza Petrolera, RGV FC Toros, Deportivo Pasto</p><p><a href="/es/jugadores/c78eb31f/Diego-Herazo"><strong>Diego Herazo</strong></a> 2015-2025&nbsp;· FW&nbsp;· Nacional, Deportes Tolima, Millonarios, Independiente Medellín, La Equidad, Bucaramanga, San Lorenzo</p><p><a href="/es/jugadores/47697b93/Luis-Hernan-Mosquera">Luis Hernán Mosquera</a> 2014-2019&nbsp;· DF,MF&nbsp;· Millonarios, Águilas Doradas, Deportivo Pasto, Atlético Huila</p><p><a href="/es/jugadores/0e89355f/Aldayr-Hernandez"><strong>Aldayr Hernández</strong></a> 2020-2023&nbsp;· DF&nbsp;· FC Honka, Helsinki IFK, TPS</p><p><a href="/es/jugadores/23d24389/Daniel-Hernandez">Daniel Hernandez</a> 2023&nbsp;· MF</p><p><a href="/es/jugadores/b80b6c60/Diego-Hernandez"><strong>Diego Hernández</strong></a> 2023-2025&nbsp;· DF&nbsp;· Águilas Doradas, Deportivo Pereira, Santa Fe</p><p><a href="/es/jugadores/09c524a0/Esteban-Hernandez">Esteban Hernández</a> 2015&nbsp;· DF&nbsp;· Deportivo Pasto</p><p><a href="/es/jugadores/2117851a/Fabian-Hernandez">Fabián Hernández</a> 2016&nbsp;· FW</p><p><a href="/es/jugadores/059b7737/Giovanni-Hernandez">Giovanni Hernández</a> 2003&nbsp;· MF&nbsp;· Junior, Colón, Colo-Colo, Independiente Medellín, Colombia</p><p><a href="/es/jugadores/6871037c/Henry-Hernandez">Henry Hernández</a> 2015&nbsp;· FW&nbsp;· Cúcuta Deportivo, Boyacá Chicó, La Equidad, Bucaramanga, Deportivo Pasto</p><p><a href="/es/jugadores/89b071b9/Hernan-Hernandez">Hernán Hernández</a> 2018-2019&nbsp;· MF&nbsp;· Atlético Huila</p><p><a href="/es/jugadores/6697cafb/Jhoan-Hernandez"><strong>Jhoan Hernández</strong></a> 2023-2024&nbsp;· DF&nbsp;· Millonarios</p><p><a href="/es/jugadores/49231a0d/Junior-Hernandez"><strong>Junior Hernández</strong></a> 2019-2025&nbsp;· DF,MF&nbsp;· Deportes Tolima</p><p><a href="/es/jugadores/86046c18/Nicolas-Hernandez"><strong>Nicolás Hernández</strong></a> 2017-2024&nbsp;· DF&nbsp;· Athletico Paranaense, Internacional, Atlético Nacional, Banfield, Santa Fe, San Lorenzo</p><p><a href="/es/jugadores/39733c14/Sebastian-Hernandez">Sebastián Hernández</a> 2012-2018&nbsp;· MF&nbsp;· Atlético Huila, Deportes Quindío, Millonarios, Once Caldas, Ludogorets Razgrad, Independiente Medell</p><p><a href="/es/jugadores/8e6bda11/Sebastian-Hernandez">Sebastián Hernández</a> 2014-2023&nbsp;· MF&nbsp;· Junior, Atlético Huila, Once Caldas, Independiente Medellín</p><p><a href="/es/jugadores/c9a41f9c/Vladimir-Hernandez"><strong>Vladimir Hernández</strong></a> 2015-2024&nbsp;· FW,MF&nbsp;· Junior, Atlético Nacional, Independiente Medellín, Santos</p><p><a href="/es/jugadores/327e1a94/Wilmar-Hernandez">Wilmar Hernandez</a> 2016&nbsp;· MF</p><p><a href="/es/jugadores/409d71ac/Luis-Hernando-Mena">Luis Hernando Mena</a> 2015-2024&nbsp;· DF,FW&nbsp;· Boyacá Chicó, Bucaramanga, Independiente Medellín, Oriente Petrolero, Estudiantes de Mérida</p><p><a href="/es/jugadores/a8d44b26/Luis-Hernando-Velez">Luis Hernando Vélez</a> 2018&nbsp;· MF&nbsp;· Cúcuta Deportivo, Leones FC</p><p><a href="/es/jugadores/f45e4955/Juan-Herran-Rojas">Juan Herrán Rojas</a> 2015&nbsp;· DF</p><p><a href="/es/jugadores/07e9e1a0/Anderson-Herrera">Anderson Herrera</a> 2016&nbsp;· FW</p><p><a href="/es/jugadores/4675fb02/Sebastian-Herrera-Cardona"><strong>Sebastian Herrera Cardona</strong></a> 2020-2025&nbsp;· DF&nbsp;· Borac Banja Luka, MTK Budapest</p><p><a href="/es/jugadores/7d9b6879/Duman-Herrera">Duman Herrera</a> 2015-2017&nbsp;· FW&nbsp;· Patriotas FC</p><p><a href="/es/jugadores/3c00b4c7/Edwin-Herrera"><strong>Edwin Herrera</strong></a> 2018-2025&nbsp;· DF&nbsp;· Junior, Santa Fe, Famalicão</p><p><a href="/es/jugadores/1f877381/Jarol-Herrera">Jarol Herrera</a> 2014-2017&nbsp;· MF&nbsp;· Deportivo Cali, Aragua, Cúcuta Deportivo</p><p><a href="/es/jugadores/fe914ab5/Jonathan-Herrera"><strong>Jonathan Herrera</strong></a> 2015-2025&nbsp;· DF&nbsp;· Boyacá Chicó, Santa Fe, Alianza Petrolera, Atlético Huila, Rampla Juniors</p><p><a href="/es/jugadores/35c0ab55/Jorge-Herrera">Jorge Herrera</a> 2011-2019&nbsp;· FW,MF&nbsp;· Charlotte Independence, Charlotte Eagles, Atlético Huila, Guaraní, Millonarios</p><p><a href="/es/jugadores/43b8d7e4/Juan-Herrera"><strong>Juan Herrera</strong></a> 2024&nbsp;· FW&nbsp;· Jaguares de Córdoba</p><p><a href="/es/jugadores/c03cb335/Maikoll-Herrera">Maikoll Herrera</a> 2022&nbsp;· MF&nbsp;· Cortuluá</p><p><a href="/es/jugadores/68e00332/Miguel-Herrera">Miguel Herrera</a> 2018&nbsp;· DF&nbsp;· La Equidad</p><p><a href="/es/jugadores/41a76a8a/Sergio-Herrera">Sergio Herrera</a> 2010-2016&nbsp;· FW&nbsp;· Deportivo Cali, Deportivo Táchira, Once Caldas, Athletico Paranaense, Deportes Quindío</p><p><a href="/es/jugadores/0f31b38b/Cristian-Higuita"><strong>Cristian Higuita</strong></a> 2015-2021&nbsp;· MF&nbsp;· Orlando City, Junior, Deportivo Cali, Once Caldas</p><p><a href="/es/jugadores/a45cdb7e/Rene-Higuita">René Higuita</a> 1990-1992&nbsp;· GK&nbsp;· Deportivo Pereira, Valladolid, Colombia</p><p><a href="/es/jugadores/61da8a79/Jose-Hincapie">Jose Hincapie</a> 2019&nbsp;· MF</p><p><a href="/es/jugadores/23e165a3/Juan-Hincapie">Juan Hincapié</a> 2023&nbsp;· MF</p><p><a href="/es/jugadores/4c622ae8/Alexis-Hinestroza">Alexis Hinestroza</a> 2016-2022&nbsp;· MF&nbsp;· Jaguares de Córdoba, Nacional Potosí, Cortuluá, Deportivo Cali, Cúcuta Deportivo, Millonarios, Águil</p><p><a href="/es/jugadores/bf84e929/Cesar-Hinestroza"><strong>César Hinestroza</strong></a> 2015-2024&nbsp;· DF,MF&nbsp;· Atlético Huila, Cortuluá, Fortaleza FC, Patriotas FC, Alianza Petrolera</p><p><a href="/es/jugadores/fa7f8259/Cristian-Hinestroza">Cristián Hinestroza</a> 2018-2019&nbsp;· DF&nbsp;· América de Cali</p><p><a href="/es/jugadores/ac330d8c/Fredy-Hinestroza"><strong>Fredy Hinestroza</strong></a> 2014-2025&nbsp;· DF,MF&nbsp;· Bucaramanga, Junior, La Equidad, Getafe, Águilas Doradas, Zaragoza, Santos Laguna, Veracruz</p><p><a href="/es/jugadores/64511074/Jhoaho-Hinestroza">Jhoaho Hinestroza</a> 2016-2020&nbsp;· FW&nbsp;· Alianza Petrolera, Expreso Rojo, Torque, Envigado FC, América de Cali, Once Caldas, Jaguares de Córd</p><p><a href="/es/jugadores/b99fd6c8/Johan-Hinestroza"><strong>Johan Hinestroza</strong></a> 2025&nbsp;· MF&nbsp;· Envigado FC</p><p><a href="/es/jugadores/f397ba12/Marino-Hinestroza"><strong>Marino Hinestroza</strong></a> 2019-2026&nbsp;· MF&nbsp;· Atlético Nacional, Pachuca, Columbus Crew</p><p><a href="/es/jugadores/c43d9594/Yonni-Hinestroza">Yonni Hinestroza</a> 2015-2018&nbsp;· DF&nbsp;· Cortuluá, Deportivo Pereira, Deportivo Pasto, Once Caldas, La Equidad, Real Cartagena</p><p><a href="/es/jugadores/5f827542/Deiver-Hinojosa">Deiver Hinojosa</a> 2018&nbsp;· DF</p><p><a href="/es/jugadores/4a203a6d/Roberto-Hinojosa"><strong>Roberto Hinojosa</strong></a> 2019-2025&nbsp;· MF&nbsp;· Llaneros, Unión Magdalena, Junior</p><p><a href="/es/jugadores/25e20762/Juan-Holguin"><strong>Juan Holguín</strong></a> 2024-2025&nbsp;· DF&nbsp;· Envigado FC</p><p><a href="/es/jugadores/7fd219a6/Jorge-Horacio-Serna">Jorge Horacio Serna</a> 2002-2003&nbsp;· FW&nbsp;· Envigado FC, Deportes Tolima, Colo-Colo, Alianza Lima, Atlético Huila, Deportes Quindío, Independien</p><p><a href="/es/jugadores/01e9e4bf/Carlos-Hoyos">Carlos Hoyos</a> 1990&nbsp;· DF</p><p><a href="/es/jugadores/321ec5d3/Santiago-Hoyos">Santiago Hoyos</a> 2021-2022&nbsp;· FW</p><p><a href="/es/jugadores/bc43148f/Jose-Huber-Escobar">José Húber Escobar</a> 2015-2023&nbsp;· GK&nbsp;· Boyacá Chicó, Jaguares de Córdoba, Cúcuta Deportivo, Once Caldas</p><p><a href="/es/jugadores/31443188/Julian-Huertas">Julián Huertas</a> 2021-2024&nbsp;· GK</p><p><a href="/es/jugadores/4a7f3d58/Victor-Hugo-Ocampo">Víctor Hugo Ocampo</a> 2015-2017&nbsp;· MF&nbsp;· Deportes Tolima</p><p><a href="/es/jugadores/ef424ced/Victor-Hugo-Soto">Víctor Hugo Soto</a> 2018-2024&nbsp;· GK&nbsp;· Envigado FC, Boyacá Chicó, Aucas</p><p><a href="/es/jugadores/2da65a2b/Alvaro-Hungria">Álvaro Hungría</a> 2016&nbsp;· DF&nbsp;· Deportivo Cali, Once Caldas</p><p><a href="/es/jugadores/ca153160/Anuar-Hurtado">Anuar Hurtado</a> 2017&nbsp;· MF&nbsp;· Atlético Huila, Boyacá Chicó</p><p><a href="/es/jugadores/398d0616/Arlex-Hurtado">Arlex Hurtado</a> 2021&nbsp;· FW&nbsp;· Deportivo Pasto, Atlético Huila</p><p><a href="/es/jugadores/4641e9a2/Aviles-Hurtado"><strong>Avilés Hurtado</strong></a> 2012-2025&nbsp;· FW,MF&nbsp;· FC Juárez, Pachuca, Monterrey, Chiapas, Atlético Nacional, Tijuana, América de Cali</p><p><a href="/es/jugadores/0d49cf72/Cristian-Hurtado">Cristian Hurtado</a> 2024&nbsp;· DF</p><p><a href="/es/jugadores/1a4e6d4b/Diego-Hurtado">Diego Hurtado</a> 2017&nbsp;· MF</p><p><a href="/es/jugadores/3a73a386/Haiderson-Hurtado"><strong>Haiderson Hurtado</strong></a> 2020-2025&nbsp;· DF&nbsp;· Jablonec, Paraná</p><p><a href="/es/jugadores/b8978baf/Jardi-Hurtado">Jardi Hurtado</a> 2015&nbsp;· DF</p><p><a href="/es/jugadores/69c78e08/Jefferson-Hurtado">Jefferson Hurtado</a> 2015&nbsp;· FW&nbsp;· Boyacá Chicó</p><p><a href="/es/jugadores/daff5ae4/Jhonier-Hurtado">Jhonier Hurtado</a> 2023-2024&nbsp;· FW&nbsp;· Deportivo Pasto</p><p><a href="/es/jugadores/2d514b18/Jose-Hurtado">José Hurtado</a> 2020-2023&nbsp;· MF&nbsp;· Boyacá Chicó</p><p><a href="/es/jugadores/119d4294/Juan-Hurtado">Juan Hurtado</a> 2018-2023&nbsp;· MF</p><p><a href="/es/jugadores/42769eec/Julian-Hurtado">Julián Hurtado</a> 2015&nbsp;· DF&nbsp;· Deportes Tolima, Cúcuta Deportivo, Once Caldas, La Equidad</p><p><a href="/es/jugadores/17124030/Luis-Hurtado">Luis Hurtado</a> 2014-2022&nbsp;· GK&nbsp;· Patriotas FC, Deportivo Cali, Deportivo La Guaira</p><p><a href="/es/jugadores/a822a357/Matheo-Hurtado">Matheo Hurtado</a> 2020&nbsp;· DF</p><p><a href="/es/jugadores/dcbfc8f4/Nelson-Hurtado">Nelson Hurtado</a> 2023&nbsp;· FW</p><p><a href="/es/jugadores/cb8b052e/Haiderson-Hurtado-Palomino">Haiderson Hurtado Palomino</a> 2023-2024&nbsp;· DF&nbsp;· Jablonec</p><p><a href="/es/jugadores/1d87fd34/Quelmer-Hurtado">Quelmer Hurtado</a> 2023&nbsp;· DF&nbsp;· Boyacá Chicó</p><p><a href="/es/jugadores/91115004/William-Hurtado"><strong>William Hurtado</strong></a> 2021-2025&nbsp;· MF&nbsp;· Envigado FC</p><p><a href="/es/jugadores/43af66fe/Yhormar-Hurtado"><strong>Yhormar Hurtado</strong></a> 2016-2025&nbsp;· DF,MF&nbsp;· Deportes Tolima, Alianza Petrolera, Águilas Doradas, Deportivo Pasto</p><p><a href="/es/jugadores/7995ef97/Ivan-Ibanez">Iván Ibañez</a> 2018-2020&nbsp;· FW&nbsp;· Deportivo Cali</p><p><a href="/es/jugadores/552d1e41/Victor-Ibarbo">Víctor Ibarbo</a> 2011-2024&nbsp;· FW,MF&nbsp;· Cagliari, Atlético Nacional, V-Varen Nagasaki, Sagan Tosu, América de Cali, Panathinaikos, Roma, Col</p><p><a href="/es/jugadores/7e88757f/Andres-Ibarguen">Andrés Ibargüen</a> 2015-2024&nbsp;· FW,MF&nbsp;· Deportes Tolima, América, Atlético Nacional, Independiente Medellín, Deportivo Pereira, Santos Lagun</p><p><a href="/es/jugadores/b83bfdff/Carlos-Ibarguen">Carlos Ibargüen</a> 2015-2021&nbsp;· FW&nbsp;· Cortuluá, Santa Fe, Bucaramanga, La Equidad, Independiente Medellín</p><p><a href="/es/jugadores/071616e4/Eddie-Ibarguen">Eddie Ibargüen</a> 2019&nbsp;· MF&nbsp;· Atlético Huila</p><p><a href="/es/jugadores/82ea9c81/Edis-Ibarguen">Edis Ibargüen</a> 2016-2020&nbsp;· FW&nbsp;· Patriotas FC, The Strongest, Jaguares de Córdoba, Deportivo Pasto, Once Caldas</p><p><a href="/es/jugadores/b8cbe6ff/Fernei-Ibarguen">Fernei Ibargüen</a> 2017-2021&nbsp;· DF&nbsp;· Águilas Doradas</p><p><a href="/es/jugadores/a85cfd4e/Jhon-Ibarguen"><strong>Jhon Ibargüen</strong></a> 2025&nbsp;· DF&nbsp;· Alianza Universidad</p><p><a href="/es/jugadores/330a670b/Kelly-Ibarguen">Kelly Ibargüen</a> 2021&nbsp;· DF</p><p><a href="/es/jugadores/b3614c56/Sandra-Ibarguen"><strong>Sandra Ibargüen</strong></a> 2024-2025&nbsp;· FW&nbsp;· Western United</p><p><a href="/es/jugadores/27d92ecd/Yair-Ibarguen">Yair Ibargüen</a> 2016&nbsp;· DF&nbsp;· Boyacá Chicó</p><p><a href="/es/jugadores/7e9dd2b7/Yehider-Ibarguen"><strong>Yehider Ibargüen</strong></a> 2025&nbsp;· DF&nbsp;· Universidad Técnica de Cajamarca</p><p><a href="/es/jugadores/c3d35a1b/Alexander-Ibarra">Alexander Ibarra</a> 2015&nbsp;· FW&nbsp;· Jaguares de Córdoba</p><p><a href="/es/jugadores/caa1c05a/Davinson-Ibarra">Davinson Ibarra</a> 2022-2023&nbsp;· MF&nbsp;· Santa Fe</p><p><a href="/es/jugadores/704da959/Arnoldo-Iguaran">Arnoldo Iguarán</a> 1990&nbsp;· FW&nbsp;· Colombia</p><p><a href="/es/jugadores/ba5db38d/Harold-Isaza">Harold Isaza</a> 2016&nbsp;· MF&nbsp;· Once Caldas</p><p><a href="/es/jugadores/eecfbbaa/Manuel-Isaza">Manuel Isaza</a> 2018&nbsp;· MF&nbsp;· Atlético Huila</p><p><a href="/es/jugadores/2f758497/Oscar-Ivan-Balanta">Óscar Iván Balanta</a> 2015-2019&nbsp;· DF,FW&nbsp;· Boyacá Chicó, Patriotas FC</p><p><a href="/es/jugadores/a16ac36b/Oscar-Ivan-Mendez">Óscar Iván Méndez</a> 2015&nbsp;· FW&nbsp;· Real Cartagena, Deportivo Pasto, Once Caldas</p><p><a href="/es/jugadores/4b3208f0/Jorge-Ivan-Soto"><strong>Jorge Iván Soto</strong></a> 2015-2025&nbsp;· GK&nbsp;· América de Cali, Jaguares de Córdoba, Deportivo Pasto, Envigado FC</p><p><a href="/es/jugadores/e42430ca/Heisen-Izquierdo">Heisen Izquierdo</a> 2016&nbsp;· MF&nbsp;· Cortuluá</p><p><a href="/es/jugadores/41163049/Ilana-Izquierdo"><strong>Ilana Izquierdo</strong></a> 2019-2024&nbsp;· MF&nbsp;· Colombia</p><p><a href="/es/jugadores/ca2bc3df/Jose-Izquierdo">José Izquierdo</a> 2014-2022&nbsp;· FW,MF&nbsp;· Club Brugge, Brighton &amp; Hove Albion, Deportivo Pereira, Once Caldas, Brighton &amp; Hove Albion U23, Col</p><p><a href="/es/jugadores/7ecab5b8/Phil-Jackson-Ibarguen">Phil Jackson Ibargüen</a> 2006-2007&nbsp;· FW</p><p><a href="/es/jugadores/a5d1e3c8/Jose-Jaimes">José Jaimes</a> 2017-2018&nbsp;· MF</p><p><a href="/es/jugadores/fbdf8725/John-Jairo-Castillo">John Jairo Castillo</a> 2015&nbsp;· FW&nbsp;· Cortuluá, Everton, Colo-Colo, Deportes Tolima, Águilas Doradas, Universidad Técnica de Cajamarca</p><p><a href="/es/jugadores/89b4ea8f/John-Jairo-Lozano">John Jairo Lozano</a> 2012-2018&nbsp;· DF&nbsp;· Deportivo Pereira, Atlético Huila, América de Cali, Cúcuta Deportivo, Deportivo Cali</p><p><a href="/es/jugadores/72aef5c4/John-Jairo-Montano">John Jairo Montaño</a> 2015&nbsp;· DF,MF&nbsp;· Deportivo Pasto, Boyacá Chicó, Cortuluá, Millonarios, Cúcuta Deportivo, Deportivo Cali</p><p><a href="/es/jugadores/f7c65b60/John-Jairo-Palacios">John Jairo Palacios</a> 2017&nbsp;· FW&nbsp;· Atlético Socopó</p><p><a href="/es/jugadores/0a0f6a71/John-Jairo-Trellez">John Jairo Tréllez</a> 1999&nbsp;· FW&nbsp;· Dallas Burn</p><p><a href="/es/jugadores/0023571b/Felipe-Jaramillo"><strong>Felipe Jaramillo</strong></a> 2018-2025&nbsp;· DF,MF&nbsp;· Deportivo Pasto, Envigado FC, Leones FC, Millonarios, La Serena, América de Cali, Águilas Doradas</p><p><a href="/es/jugadores/34bd874e/Gabriel-Jaime-Gomez-Jaramillo">Gabriel Jaime Gómez Jaramillo</a> 1990-1994&nbsp;· MF&nbsp;· Colombia</p><p><a href="/es/jugadores/430b7851/Jackson-Jaramillo">Jackson Jaramillo</a> 2023&nbsp;· FW&nbsp;· Envigado FC</p><p><a href="/es/jugadores/211e0ebf/Juan-Jaramillo">Juan Jaramillo</a> 2020&nbsp;· GK</p><p><a href="/es/jugadores/bd8b18ef/Andres-Javier-Mosquera">Andrés Javier Mosquera</a> 2015-2017&nbsp;· FW&nbsp;· Portuguesa, Envigado FC</p><p><a href="/es/jugadores/40e8b100/John-Javier-Restrepo">John Javier Restrepo</a> 2003-2017&nbsp;· MF&nbsp;· Independiente Medellín, Águilas Doradas, Cruz Azul, UANL, Veracruz</p><p><a href="/es/jugadores/eeba07f8/Luis-Javier-Suarez"><strong>Luis Javier Suárez</strong></a> 2017-2025&nbsp;· FW&nbsp;· Almería, Granada, Zaragoza, Gimnàstic, Marseille, Colombia</p><p><a href="/es/jugadores/e0bc54d3/Stevenson-Jerez">Stevenson Jérez</a> 2020-2023&nbsp;· DF&nbsp;· Bucaramanga</p><p><a href="/es/jugadores/fdb1a2d6/Edwards-Jimenez">Edwards Jiménez</a> 2015-2016&nbsp;· FW&nbsp;· Real Cartagena, Bucaramanga, Deportivo Pasto, Once Caldas, Boyacá Chicó, Junior, Cúcuta Deportivo, Á</p><p><a href="/es/jugadores/ecca771a/Johan-Jimenez">Johan Jiménez</a> 2017-2019&nbsp;· FW&nbsp;· Águilas Doradas</p><p><a href="/es/jugadores/42b683ba/Juan-Jimenez">Juan Jiménez</a> 2015-2019&nbsp;· GK</p><p><a href="/es/jugadores/8681d9ed/Juan-Jimenez"><strong>Juan Jiménez</strong></a> 2016-2025&nbsp;· MF&nbsp;· Técnico Universitario, Bucaramanga, Fortaleza FC</p><p><a href="/es/jugadores/65d1576b/Junior-Jimenez"><strong>Junior Jiménez</strong></a> 2024-2025&nbsp;· MF&nbsp;· Alianza Petrolera</p><p><a href="/es/jugadores/a3f53eb9/Leiton-Jimenez">Leiton Jiménez</a> 2012-2021&nbsp;· DF&nbsp;· Veracruz, Atlas, Independiente Medellín, Tijuana, Chiapas, Lobos BUAP</p><p><a href="/es/jugadores/f57cbad7/Luis-Jimenez">Luis Jiménez</a> 2017-2024&nbsp;· MF&nbsp;· Carabobo</p><p><a href="/es/jugadores/637be30b/Santiago-Jimenez"><strong>Santiago Jiménez</strong></a> 2016-2025&nbsp;· DF&nbsp;· Bucaramanga, Envigado FC, Once Caldas</p><p><a href="/es/jugadores/3a83a4e5/Yesinguer-Jimenez">Yesinguer Jiménez</a> 2015&nbsp;· MF&nbsp;· Once Caldas, Boyacá Chicó</p><p><a href="/es/jugadores/1616ef42/Jose-Johan-Silva">Jose Johan Silva</a> 2014-2023&nbsp;· GK&nbsp;· Santa Fe, Deportivo Cali</p><p><a href="/es/jugadores/8325187d/Jhonny-Jordan"><strong>Jhonny Jordán</strong></a> 2024&nbsp;· MF&nbsp;· Deportivo Pereira</p><p><a href="/es/jugadores/40ce7b3c/Wilmar-Jordan"><strong>Wilmar Jordán</strong></a> 2013-2025&nbsp;· FW&nbsp;· Chennaiyin, Litex Lovech, Gyeongnam FC, Portuguesa, Envigado FC, Punjab, Leones FC, Atlético Huila, </p><p><a href="/es/jugadores/b67e02f7/Yonatan-Jordan">Yonatan Jordan</a> 2017-2018&nbsp;· FW&nbsp;· Juventud de Las Piedras, Atenas de San Carlos</p><p><a href="/es/jugadores/802c62ad/Juan-Jose-Mezu">Juan José Mezú</a> 2015-2019&nbsp;· MF&nbsp;· Jaguares de Córdoba, Águilas Doradas</p><p><a href="/es/jugadores/f922d4f6/Walter-Jose-Moreno">Walter José Moreno</a> 2015&nbsp;· DF&nbsp;· Cúcuta Deportivo, Atlético Nacional, Unión Comercio, Deportivo Táchira</p><p><a href="/es/jugadores/a312f6cd/Pablo-Jose-Rojas"><strong>Pablo José Rojas</strong></a> 2015-2025&nbsp;· FW,MF&nbsp;· Anzoátegui, Jaguares de Córdoba, Once Caldas, Uniautónoma FC, Bucaramanga, Junior, Santa Fe</p><p><a href="/es/jugadores/1835f053/Juan-Jose-Sanchez"><strong>Juan José Sánchez</strong></a> 2018-2025&nbsp;· DF&nbsp;· Tigres UANL, Atlanta United</p><p><a href="/es/jugadores/d2133232/Carlos-Jose-Sierra"><strong>Carlos José Sierra</strong></a> 2017-2025&nbsp;· MF&nbsp;· Llaneros, América de Cali, Deportivo Lara, Junior, Universidad Central, Atlético Nacional, Deportes </p><p><a href="/es/jugadores/ec81ad5b/Juancho"><strong>Juancho</strong></a> 2015-2025&nbsp;· FW&nbsp;· UD Salamanca B, Granada</p><p><a href="/es/jugadores/d7f762f6/Miguel-Julio">Miguel Julio</a> 2016-2017&nbsp;· MF&nbsp;· Independiente Medellín</p><p><a href="/es/jugadores/dbcbdb5a/Fatjon-Jusufi">Fatjon Jusufi</a> 2021&nbsp;· MF&nbsp;· Alianza Petrolera</p><p><a href="/es/jugadores/6f8f7e61/Jhon-Kennedy-Hurtado">Jhon Kennedy Hurtado</a> 2009-2014&nbsp;· DF&nbsp;· Seattle Sounders FC, Real Cartagena, Deportivo Cali, Chicago Fire, Chivas USA</p><p><a href="/es/jugadores/f05f858c/Marino-Klinger">Marino Klinger</a> 1962&nbsp;· FW&nbsp;· Colombia</p><p><a href="/es/jugadores/de4786eb/Ketier-Kury">Ketier Kury</a> 2020-2021&nbsp;· DF&nbsp;· Deportivo Pereira</p><p><a href="/es/jugadores/664cac36/Jose-de-la-Cuesta">José de la Cuesta</a> 2003-2018&nbsp;· DF&nbsp;· Cádiz, Albacete, Once Caldas, Deportivo Pasto, Valladolid</p><p><a href="/es/jugadores/56a86152/Luis-Carlos-de-la-Hoz">Luis Carlos de la Hoz</a> 2015&nbsp;· FW&nbsp;· Junior</p><p><a href="/es/jugadores/9b2b93b8/Wilfrido-de-la-Rosa-Mendoza">Wilfrido de la Rosa Mendoza</a> 2015-2024&nbsp;· FW,MF&nbsp;· Deportivo Pereira, Santa Fe, Envigado FC, Deportivo Pasto, Atlético Huila, Deportes Tolima, Águilas </p><p><a href="/es/jugadores/ba995f07/Ricardo-Laborde">Ricardo Laborde</a> 2013-2018&nbsp;· MF&nbsp;· Krasnodar, Atlético Huila</p><p><a href="/es/jugadores/c6c18f77/Haider-Landazuri">Haider Landázuri</a> 2021-2022&nbsp;· DF</p><p><a href="/es/jugadores/1d153744/Kevin-Lara">Kevin Lara</a> 2018-2019&nbsp;· DF</p><p><a href="/es/jugadores/fcb3c7c9/Nicolas-Lara"><strong>Nicolás Lara</strong></a> 2022-2025&nbsp;· DF&nbsp;· Águilas Doradas</p><p><a href="/es/jugadores/001b4019/Jhon-Largacha"><strong>Jhon Largacha</strong></a> 2024-2025&nbsp;· FW&nbsp;· Deportivo Pereira, Millonarios</p><p><a href="/es/jugadores/df7c1a42/Carlos-Lasso">Carlos Lasso</a> 2017&nbsp;· DF&nbsp;· Expreso Rojo</p><p><a href="/es/jugadores/908d0687/Cristian-Lasso">Cristian Lasso</a> 2017-2020&nbsp;· FW,MF&nbsp;· Cantolao, Unión Comercio, Deportivo Cali, Atlético Grau, Macará</p><p><a href="/es/jugadores/d5a70688/Jhildrey-Lasso"><strong>Jhildrey Lasso</strong></a> 2023-2025&nbsp;· MF&nbsp;· Llaneros, Deportivo Cali</p><p><a href="/es/jugadores/ec58ca3b/Jose-Lasso">José Lasso</a> 2022&nbsp;· GK</p><p><a href="/es/jugadores/c5604e31/Manuel-Lasso"><strong>Manuel Lasso</strong></a> 2025&nbsp;· DF&nbsp;· Fortaleza FC</p><p><a href="/es/jugadores/169840c1/Leonardo-Lazaro">Leonardo Lázaro</a> 2017-2023&nbsp;· MF</p><p><a href="/es/jugadores/2b0b1304/Aldo-Leao-Ramirez">Aldo Leão Ramírez</a> 2007-2020&nbsp;· MF&nbsp;· Morelia, Atlético Nacional, Atlas, Cruz Azul, Águilas Doradas, Colombia</p><p><a href="/es/jugadores/364d5b25/Julian-Lemos">Julián Lemos</a> 2018&nbsp;· DF</p><p><a href="/es/jugadores/86d13ca0/Davison-Lemus">Davison Lemus</a> 2016-2018&nbsp;· DF&nbsp;· Atlético Huila</p><p><a href="/es/jugadores/55fa1713/Nelson-Lemus">Nelson Lemus</a> 2015-2019&nbsp;· DF&nbsp;· Envigado FC, Deportes Tolima, Atlético Huila, Patriotas FC</p><p><a href="/es/jugadores/73c2b479/Roger-Lemus">Roger Lemus</a> 2018-2021&nbsp;· MF&nbsp;· Leones FC, Bucaramanga, Jaguares de Córdoba</p><p><a href="/es/jugadores/22a54d73/Julian-Lenis">Julian Lenis</a> 2024&nbsp;· MF</p><p><a href="/es/jugadores/5739dde6/Reinaldo-Lenis">Reinaldo Lenis</a> 2015-2023&nbsp;· FW,MF&nbsp;· Argentinos Juniors, Sport Recife, Ionikos, Al-Adalah, Atlético Nacional, Banfield, Universidad de Ch</p><p><a href="/es/jugadores/9d68842d/Brayan-Leon"><strong>Brayan Léon</strong></a> 2021-2025&nbsp;· FW&nbsp;· Independiente Medellín, Deportivo Pereira, Junior</p><p><a href="/es/jugadores/9b5ce51a/Jefferson-Lerma"><strong>Jefferson Lerma</strong></a> 2015-2026&nbsp;· MF&nbsp;· Crystal Palace, Bournemouth, Levante, Colombia, Atlético Huila</p><p><a href="/es/jugadores/9e3f8c40/Jhon-Lerma"><strong>Jhon Lerma</strong></a> 2023-2025&nbsp;· DF&nbsp;· Junior, Atlético Huila</p><p><a href="/es/jugadores/249c27cc/Dahwling-Leudo">Dahwling Leudo</a> 2014-2022&nbsp;· DF,MF&nbsp;· La Equidad, Melgar, Binacional, Millonarios, Deportivo Pasto, Atlético Grau</p><p><a href="/es/jugadores/21f41dc2/Alexandro-Licona"><strong>Alexandro Licona</strong></a> 2023&nbsp;· FW&nbsp;· Atlético Nacional</p><p><a href="/es/jugadores/dd50010e/Mauricio-Linan">Mauricio Liñán</a> 2023-2024&nbsp;· FW&nbsp;· Boyacá Chicó</p><p><a href="/es/jugadores/2b123aba/Mafe-Linares"><strong>Mafe Linares</strong></a> 2024&nbsp;· DF</p><p><a href="/es/jugadores/ebc99769/Carlos-Lizarazo">Carlos Lizarazo</a> 2014-2022&nbsp;· MF&nbsp;· Deportivo Cali, América de Cali, Alianza Petrolera, Once Caldas, FC Dallas, Santa Fe</p><p><a href="/es/jugadores/7a93d24e/Johan-Lizarralde"><strong>Johan Lizarralde</strong></a> 2023-2024&nbsp;· GK&nbsp;· El Farolito</p><p><a href="/es/jugadores/ef081b1c/Rodrigo-Llano"><strong>Rodrigo Llano</strong></a> 2022-2025&nbsp;· FW&nbsp;· Real Oruro, FC Universitario</p><p><a href="/es/jugadores/ce3041e5/Andres-Llinas"><strong>Andrés Llinás</strong></a> 2019-2025&nbsp;· DF&nbsp;· Millonarios, Colombia</p><p><a href="/es/jugadores/2e8694ce/Daniel-Lloreda">Daniel Lloreda</a> 2017-2019&nbsp;· FW&nbsp;· Águilas Doradas</p><p><a href="/es/jugadores/3b3b51f6/David-Loaiza">David Loaiza</a> 2021-2023&nbsp;· MF&nbsp;· Independiente Medellín</p><p><a href="/es/jugadores/4d10fe76/Juan-Loaiza">Juan Loaiza</a> 2022&nbsp;· GK</p><p><a href="/es/jugadores/0de39e04/Manuel-Loaiza">Manuel Loaiza</a> 2015-2018&nbsp;· GK</p><p><a href="/es/jugadores/94ec1c0a/Raul-Loaiza"><strong>Raúl Loaiza</strong></a> 2015-2024&nbsp;· MF&nbsp;· Lanús, Patriotas FC, Defensa y Justicia, Atlético Nacional, San Lorenzo</p><p><a href="/es/jugadores/fbb09a7e/Juan-Lobo">Juan Lobo</a> 2022&nbsp;· MF&nbsp;· Cortuluá</p><p><a href="/es/jugadores/c93694db/Eisner-Loboa">Eisner Loboa</a> 2012-2020&nbsp;· DF,FW&nbsp;· León, Deportivo Cali, Atlas, Puebla, Shanghai Shenhua, Morelia, América de Cali, Olmedo, América (MG</p><p><a href="/es/jugadores/c69fe270/Daniel-Londono"><strong>Daniel Londoño</strong></a> 2015-2025&nbsp;· DF&nbsp;· Independiente Medellín, Envigado FC, Atlético Nacional, Atlético Huila</p><p><a href="/es/jugadores/5a0a81f0/Emanuel-Londono"><strong>Emanuel Londoño</strong></a> 2025&nbsp;· MF&nbsp;· Envigado FC</p><p><a href="/es/jugadores/c3d3449c/Flabian-Londono"><strong>Flabián Londoño</strong></a> 2022-2025&nbsp;· FW&nbsp;· Carabobo, Arsenal de Sarandí, Patriotas FC, Tigre</p><p><a href="/es/jugadores/124bf0cc/Kevin-Londono"><strong>Kevin Londoño</strong></a> 2021-2025&nbsp;· MF&nbsp;· Boyacá Chicó</p><p><a href="/es/jugadores/cfc0c4ad/Kevin-Londono"><strong>Kevin Londoño</strong></a> 2016-2025&nbsp;· FW,MF&nbsp;· Bucaramanga, Once Caldas, Jaguares de Córdoba, Deportivo Pasto, Alianza Petrolera, La Equidad, Indep</p><p><a href="/es/jugadores/15b9c14b/Santiago-Londono">Santiago Londoño</a> 2015-2023&nbsp;· GK&nbsp;· Envigado FC, Deportivo Pereira</p><p><a href="/es/jugadores/f7703759/Santiago-Londono"><strong>Santiago Londoño</strong></a> 2024-2025&nbsp;· FW&nbsp;· Envigado FC</p><p><a href="/es/jugadores/fab169bf/Santiago-Londono">Santiago Londoño</a> 2023-2024&nbsp;· DF</p><p><a href="/es/jugadores/51c8bdfd/Yeiner-Londono"><strong>Yeiner Londoño</strong></a> 2024-2025&nbsp;· MF&nbsp;· Tudelano, Fortaleza FC</p><p><a href="/es/jugadores/8a8f9207/Jonathan-Lopera">Jonathan Lopera</a> 2015-2023&nbsp;· DF&nbsp;· Once Caldas, Independiente Medellín, Águilas Doradas, Unión Magdalena, Envigado FC, Atlético Huila, </p><p><a href="/es/jugadores/fda91f0a/Alfonso-Lopez">Alfonso López</a> 2021&nbsp;· MF&nbsp;· Gran Valencia Maracay</p><p><a href="/es/jugadores/7ab52d2b/Andres-Lopez"><strong>Andrés López</strong></a> 2025&nbsp;· MF&nbsp;· Llaneros</p><p><a href="/es/jugadores/758a85c8/Jorge-Lopez-Caballero">Jorge López Caballero</a> 2003&nbsp;· MF&nbsp;· Boyacá Chicó, Colombia, Deportivo Cali</p><p><a href="/es/jugadores/2fe89894/Carlos-Lopez"><strong>Carlos López</strong></a> 2018-2025&nbsp;· MF&nbsp;· Sport Boys, CDC Santa Rosa, Millonarios</p><p><a href="/es/jugadores/74446a18/Darwin-Lopez"><strong>Darwin López</strong></a> 2015-2025&nbsp;· FW,MF&nbsp;· Macará, Jaguares de Córdoba, Patriotas FC, Deportes Tolima, Deportivo Pasto</p><p><a href="/es/jugadores/05a4c22b/Edison-Lopez"><strong>Edison López</strong></a> 2018-2025&nbsp;· MF&nbsp;· Envigado FC</p><p><a href="/es/jugadores/70e49e09/Edwar-Lopez"><strong>Edwar López</strong></a> 2018-2025&nbsp;· FW,MF&nbsp;· Santa Fe, Deportivo Pasto, Atlético Huila, Estudiantes–LP, Independiente Medellín, América de Cali, </p><p><a href="/es/jugadores/6cc67806/Ivan-Lopez">Iván López</a> 2001-2014&nbsp;· DF&nbsp;· Girona, Millonarios, Real Murcia</p><p><a href="/es/jugadores/6d5b7358/Johan-Lopez"><strong>Johan Lopez</strong></a> 2025&nbsp;· GK&nbsp;· Independiente Petrolero</p><p><a href="/es/jugadores/1dcc08ff/Jonis-Lopez">Jonis López</a> 2015&nbsp;· DF&nbsp;· Cortuluá</p><p><a href="/es/jugadores/55f5779f/Jose-Lopez">José López</a> 2021-2022&nbsp;· MF&nbsp;· Šibenik</p><p><a href="/es/jugadores/55eeee20/Juan-Lopez">Juan López</a> 2017-2019&nbsp;· FW&nbsp;· Águilas Doradas</p><p><a href="/es/jugadores/f8c4b2ff/Juan-Lopez">Juan López</a> 2021&nbsp;· DF&nbsp;· Patriotas FC</p><p><a href="/es/jugadores/2a8c97de/Kevin-Lopez"><strong>Kevin Lopez</strong></a> 2022-2025&nbsp;· GK&nbsp;· Deportivo Pasto</p><p><a href="/es/jugadores/53527776/Leonardo-Lopez">Leonardo López</a> 2015&nbsp;· MF&nbsp;· Boyacá Chicó, Atlético Huila, La Equidad, San Lorenzo, Junior, Universidad Técnica de Cajamarca</p><p><a href="/es/jugadores/fdcb9f13/Luis-Lopez">Luis López</a> 2022&nbsp;· MF</p><p><a href="/es/jugadores/c99f42b3/Luis-Fernando-Fernandez-Lopez">Luis Fernando Fernández López</a> 2014-2020&nbsp;· GK&nbsp;· LDU Loja, Aucas, Mushuc Runa, Fuerza Amarilla Sporting Club, Atlético Huila, Deportivo Pereira, La E</p><p><a href="/es/jugadores/3784b67f/Michael-Lopez">Michael López</a> 2016-2019&nbsp;· FW,MF&nbsp;· Envigado FC, Cúcuta Deportivo</p><p><a href="/es/jugadores/8de93a46/Oscar-Lopez">Óscar López</a> 1962&nbsp;· DF&nbsp;· Colombia</p><p><a href="/es/jugadores/49aee467/Rinson-Lopez">Rinson López</a> 2016-2017&nbsp;· DF&nbsp;· El Nacional</p><p><a href="/es/jugadores/ac5a06e9/Javier-Lopez-Rodriguez">Javier López Rodríguez</a> 2014-2019&nbsp;· DF&nbsp;· Santa Fe, Águilas Doradas, Cúcuta Deportivo</p><p><a href="/es/jugadores/39cf1d2d/Santiago-Lopez"><strong>Santiago López</strong></a> 2023-2025&nbsp;· MF&nbsp;· La Equidad</p><p><a href="/es/jugadores/90264974/Ronaldo-Lora">Ronaldo Lora</a> 2019-2024&nbsp;· DF&nbsp;· Unión Magdalena, Macará</p><p><a href="/es/jugadores/9301991e/Dylan-Lozano"><strong>Dylan Lozano</strong></a> 2021-2025&nbsp;· DF&nbsp;· Águilas Doradas, Atlético Huila</p><p><a href="/es/jugadores/8695162f/Frank-Lozano"><strong>Frank Lozano</strong></a> 2020-2025&nbsp;· MF&nbsp;· Boyacá Chicó</p><p><a href="/es/jugadores/cea3f86b/Jesus-Lozano">Jesús Lozano</a> 2019&nbsp;· DF</p><p><a href="/es/jugadores/ba12bc25/Juan-Lozano">Juan Lozano</a> 2021&nbsp;· MF</p><p><a href="/es/jugadores/c9eb9853/Neyder-Lozano">Neyder Lozano</a> 2018-2023&nbsp;· DF&nbsp;· Elche, Lugo</p><p><a href="/es/jugadores/8d7ea1d6/Sebastian-Lozano">Sebastián Lozano</a> 2017&nbsp;· DF</p><p><a href="/es/jugadores/c139743a/Jean-Lucas-Rivera"><strong>Jean Lucas Rivera</strong></a> 2017-2024&nbsp;· MF&nbsp;· Envigado FC, Atlético Nacional, Monagas, Rayo Zuliano</p><p><a href="/es/jugadores/0dc2f4db/Delly-Lucero">Delly Lucero</a> 2019-2021&nbsp;· FW&nbsp;· Cruzeiro EC, Audax</p><p><a href="/es/jugadores/985b47d4/Brayan-Lucumi"><strong>Brayan Lucumi</strong></a> 2017-2025&nbsp;· FW&nbsp;· Comerciantes Unidos, Deportivo Pasto, Portuguesa, Envigado FC, Coritiba</p><p><a href="/es/jugadores/530f6972/Carlos-Lucumi"><strong>Carlos Lucumi</strong></a> 2020-2025&nbsp;· FW&nbsp;· Fortaleza FC, Always Ready, Deportivo Cali, Atlético Huila</p><p><a href="/es/jugadores/60df0676/Jan-Lucumi-Gonzalez"><strong>Jan Lucumí González</strong></a> 2024-2025&nbsp;· FW&nbsp;· América de Cali, Fluminense</p><p><a href="/es/jugadores/8abefbcf/Jeison-Lucumi"><strong>Jeison Lucumí</strong></a> 2017-2024&nbsp;· FW,MF&nbsp;· Deportes Tolima, Atlético Nacional, América de Cali, Querétaro, Elche</p><p><a href="/es/jugadores/80490d7f/Jhon-Lucumi"><strong>Jhon Lucumí</strong></a> 2015-2026&nbsp;· DF&nbsp;· Bologna, Genk, Deportivo Cali, Colombia</p><p><a href="/es/jugadores/15b2a92a/Juan-Lucumi"><strong>Juan Lucumí</strong></a> 2024-2025&nbsp;· FW&nbsp;· Ayacucho</p><p><a href="/es/jugadores/41bcc000/Stiven-Lucumi">Stiven Lucumí</a> 2019&nbsp;· MF&nbsp;· Patriotas FC</p><p><a href="/es/jugadores/195e3d9a/Jose-Lugo">José Lugo</a> 2019&nbsp;· FW</p><p><a href="/es/jugadores/a669b1cc/Kevin-Lugo">Kevin Lugo</a> 2021-2022&nbsp;· MF&nbsp;· Alianza Atlético, Deportivo Pereira</p><p><a href="/es/jugadores/37a4ef2c/Michell-Lugo">Michell Lugo</a> 2021-2024&nbsp;· GK</p><p><a href="/es/jugadores/0a71c4da/Steven-Lugo">Steven Lugo</a> 2023&nbsp;· DF</p><p><a href="/es/jugadores/40455fe0/Eduardo-Luis-Carrillo">Eduardo Luis Carrillo</a> 2016-2018&nbsp;· MF&nbsp;· Real Cartagena, Jaguares de Córdoba, Deportivo Anzoátegui</p><p><a href="/es/jugadores/c2f03d53/Jose-Luis-Chunga"><strong>José Luis Chunga</strong></a> 2015-2026&nbsp;· GK&nbsp;· Alianza Petrolera, Junior, Independiente Medellín, Jaguares de Córdoba, Colombia</p><p><a href="/es/jugadores/502d05d8/Jorge-Luis-Lozano">Jorge Luis Lozano</a> 2017-2019&nbsp;· DF&nbsp;· Expreso Rojo, Santa Fe, Jaguares de Córdoba</p><p><a href="/es/jugadores/604b56c6/Jorge-Luis-Ramos"><strong>Jorge Luis Ramos</strong></a> 2015-2024&nbsp;· FW&nbsp;· Atlético Huila, Santa Fe, Uniautónoma FC, Real Cartagena, Deportes Tolima, La Equidad, Águilas Dorad</p><p><a href="/es/jugadores/41bddc56/Jose-Luis-Sinisterra"><strong>José Luis Sinisterra</strong></a> 2018-2025&nbsp;· FW&nbsp;· Oakland Roots, Deportivo Pereira, Blooming, Sportivo Trinidense, Platense, Lanús</p><p><a href="/es/jugadores/410b16e3/Daniel-Luna"><strong>Daniel Luna</strong></a> 2021-2025&nbsp;· MF&nbsp;· Cartagena, Mallorca, Deportivo Cali, Mirandés</p><p><a href="/es/jugadores/ca6e2543/Hernan-Luna">Hernán Luna</a> 2019-2023&nbsp;· MF&nbsp;· Unión Magdalena, Ilves, Jaguares de Córdoba</p><p><a href="/es/jugadores/93b6f774/Ivan-Luquetta">Iván Luquetta</a> 2019-2022&nbsp;· DF&nbsp;· Charlotte Independence, Cantolao, Patriotas FC</p><p><a href="/es/jugadores/e7f69a30/David-Macalister-Silva"><strong>David Macalister Silva</strong></a> 2015-2025&nbsp;· MF&nbsp;· Millonarios, Deportes Tolima, Real Cartagena</p><p><a href="/es/jugadores/394c1cec/Daniel-Machacon">Daniel Machacón</a> 2015&nbsp;· FW,MF&nbsp;· Uniautónoma FC, Junior, Bucaramanga, Atlético Huila</p><p><a href="/es/jugadores/ebd8cbec/Anderson-Machado">Anderson Machado</a> 2016-2017&nbsp;· MF&nbsp;· Jaguares de Córdoba</p><p><a href="/es/jugadores/b3f8bdef/Deiver-Machado"><strong>Deiver Machado</strong></a> 2015-2026&nbsp;· DF,MF&nbsp;· Lens, Millonarios, Atlético Nacional, Toulouse, Gent, Colombia</p><p><a href="/es/jugadores/aeaf3a05/Freddy-Machado">Freddy Machado</a> 2016&nbsp;· DF&nbsp;· Deportivo Pereira, Alianza Petrolera, Deportivo Pasto, Real Cartagena</p><p><a href="/es/jugadores/829ae42b/Sebastian-Macias-Correa">Sebastián Macías Correa</a> 2015-2021&nbsp;· DF&nbsp;· Independiente Medellín, Deportivo Pasto</p><p><a href="/es/jugadores/05ef6778/Harold-Macias">Harold Macías</a> 2015&nbsp;· DF&nbsp;· Real Cartagena, Junior, Patriotas FC</p><p><a href="/es/jugadores/b0b46e92/Juan-Madrid">Juan Madrid</a> 2021-2023&nbsp;· FW</p><p><a href="/es/jugadores/f379bc1e/Christian-Mafla"><strong>Christian Mafla</strong></a> 2016-2025&nbsp;· DF&nbsp;· Santa Fe, Deportivo Pasto, Atlético Nacional, Bucaramanga, Deportivo Cali, New England Revolution, N</p><p><a href="/es/jugadores/d2415f74/Jerson-Malagon"><strong>Jerson Malagón</strong></a> 2015-2025&nbsp;· DF&nbsp;· Once Caldas, Deportivo Pasto, Patriotas FC, Expreso Rojo, Santa Fe, Deportivo La Guaira, América de </p><p><a href="/es/jugadores/18ae7a05/Luis-Malagon">Luis Malagón</a> 2016&nbsp;· MF</p><p><a href="/es/jugadores/5842f260/Camilo-Mancilla"><strong>Camilo Mancilla</strong></a> 2015-2022&nbsp;· DF&nbsp;· Binacional, La Equidad, Envigado FC, Bucaramanga, Atlético Huila, Uniautónoma FC, Once Caldas</p><p><a href="/es/jugadores/b9dc2643/Farid-Mancilla">Farid Mancilla</a> 2023&nbsp;· MF</p><p><a href="/es/jugadores/e12ad8f7/Harrinson-Mancilla"><strong>Harrinson Mancilla</strong></a> 2017-2025&nbsp;· MF&nbsp;· Águilas Doradas, Cúcuta Deportivo, Expreso Rojo, Gimnasia y Esgrima (LP), Sarmiento</p><p><a href="/es/jugadores/cb6d237e/John-Mancilla">John Mancilla</a> 2021&nbsp;· MF</p><p><a href="/es/jugadores/e328f42a/Omar-Mancilla">Omar Mancilla</a> 2015-2019&nbsp;· DF&nbsp;· Deportivo Pasto, Llaneros</p><p><a href="/es/jugadores/91773fdb/Omar-Manjarres-Noriega">Omar Manjarrés Noriega</a> 2015-2016&nbsp;· MF&nbsp;· Alianza Petrolera</p><p><a href="/es/jugadores/e0da723c/Ruben-Manjarres"><strong>Rubén Manjarrés</strong></a> 2021-2025&nbsp;· MF&nbsp;· Alianza Petrolera, Santa Fe, Junior</p><p><a href="/es/jugadores/89a5efd3/Mauro-Manotas"><strong>Mauro Manotas</strong></a> 2015-2025&nbsp;· FW&nbsp;· Atlas, Houston Dynamo, Tijuana, Uniautónoma FC, Rio Grande Valley Toros</p><p><a href="/es/jugadores/007be212/Daniel-Mantilla"><strong>Daniel Mantilla</strong></a> 2018-2025&nbsp;· FW,MF&nbsp;· Millonarios, Atlético Nacional, La Equidad, Patriotas FC, Deportivo Cali, Leones FC, Necaxa</p><p><a href="/es/jugadores/3c9d192d/Kevin-Mantilla"><strong>Kevin Mantilla</strong></a> 2022-2025&nbsp;· DF&nbsp;· Talleres, Independiente Medellín, Santa Fe</p><p><a href="/es/jugadores/8275d8d5/Juan-Manuel-Leyton">Juan Manuel Leyton</a> 2015-2017&nbsp;· GK&nbsp;· Santa Fe</p><p><a href="/es/jugadores/e6a6379d/Luis-Manuel-Orejuela">Luis Manuel Orejuela</a> 2015-2024&nbsp;· DF&nbsp;· Deportivo Cali, Independiente Medellín, Cruzeiro, Grêmio, Athletico Paranaense, Jong Ajax, São Paulo</p><p><a href="/es/jugadores/7f50c23b/Juan-Manuel-Valencia"><strong>Juan Manuel Valencia</strong></a> 2016-2024&nbsp;· MF&nbsp;· Cortuluá, Deportivo Cali, Deportes Tolima</p><p><a href="/es/jugadores/d249f0df/Victor-Manuel-Zapata">Víctor Manuel Zapata</a> 2015-2017&nbsp;· MF&nbsp;· Deportivo Pasto, Águilas Doradas, Bucaramanga, Alianza Atlético, Atlético Huila, Jaguares de Córdoba</p><p><a href="/es/jugadores/6e159787/Alexis-Manyoma"><strong>Alexis Manyoma</strong></a> 2022-2025&nbsp;· MF&nbsp;· Estudiantes–LP, Cortuluá</p><p><a href="/es/jugadores/9c6a71b1/Jader-Manyoma">Jader Manyoma</a> 2023&nbsp;· MF</p><p><a href="/es/jugadores/2f073bc8/Cesar-Manzano">César Manzano</a> 2020&nbsp;· DF</p><p><a href="/es/jugadores/24ec1b5a/Juan-Marcelin"><strong>Juan Marcelin</strong></a> 2021-2025&nbsp;· MF&nbsp;· Boyacá Chicó, Bucaramanga</p><p><a href="/es/jugadores/5f5c28af/Ana-Maria-Bohorquez">Ana María Bohórquez</a> 2019-2021&nbsp;· DF</p><p><a href="/es/jugadores/c40d75ca/Ana-Maria-Montoya">Ana María Montoya</a> 2012&nbsp;· MF</p><p><a href="/es/jugadores/a5562fc6/Jose-Maria-Pazo">José María Pazo</a> 1994&nbsp;· GK</p><p><a href="/es/jugadores/0b0bf5a0/Jesus-Marimon">Jesús Marimón</a> 2015-2021&nbsp;· MF&nbsp;· Once Caldas, Mineros</p><p><a href="/es/jugadores/1684fe95/Luis-Marimon"><strong>Luis Marimón</strong></a> 2025&nbsp;· FW&nbsp;· Millonarios</p><p><a href="/es/jugadores/4ffa2611/Alejandro-Marin">Alejandro Marín</a> 2022&nbsp;· MF</p><p><a href="/es/jugadores/b7fed1d7/Bryan-Marin">Bryan Marín</a> 2021&nbsp;· FW</p><p><a href="/es/jugadores/198e7cbe/Juan-Marin">Juan Marín</a> 2019-2020&nbsp;· MF&nbsp;· Cúcuta Deportivo</p><p><a href="/es/jugadores/a958b2ad/Juan-Marin">Juan Marín</a> 2019&nbsp;· FW&nbsp;· La Equidad</p><p><a href="/es/jugadores/1ac1af1d/Mauricio-Marin">Mauricio Marín</a> 2015&nbsp;· MF&nbsp;· Cúcuta Deportivo</p><p><a href="/es/jugadores/33ff4e8f/Vladimir-Marin">Vladimir Marín</a> 2009-2017&nbsp;· DF,MF&nbsp;· Libertad, Sportivo Luqueño, Club Olimpia, Deportivo Cali, Toluca, Atlético Nacional, Águilas Doradas</p><p><a href="/es/jugadores/75656d73/Carlos-Mario-Arboleda"><strong>Carlos Mario Arboleda</strong></a> 2014-2024&nbsp;· DF&nbsp;· Águilas Doradas, Santa Fe, La Equidad, Envigado FC</p><p><a href="/es/jugadores/813fdbd5/Carlos-Mario-Rodriguez">Carlos Mario Rodríguez</a> 2016-2023&nbsp;· MF&nbsp;· Fortaleza FC, Deportivo Cali, La Equidad, Unión Magdalena</p><p><a href="/es/jugadores/6c3b37c2/Hernan-Marquez">Hernán Márquez</a> 2017-2018&nbsp;· DF</p><p><a href="/es/jugadores/b8381493/Ricardo-Marquez"><strong>Ricardo Márquez</strong></a> 2019-2025&nbsp;· FW&nbsp;· Unión Magdalena, Millonarios, Bucaramanga</p><p><a href="/es/jugadores/9db32a90/Luis-Marquines"><strong>Luis Marquines</strong></a> 2021-2025&nbsp;· GK&nbsp;· Atlético Nacional</p><p><a href="/es/jugadores/baa6295e/Christian-Marrugo">Christian Marrugo</a> 2012-2023&nbsp;· MF&nbsp;· Deportes Tolima, Independiente Medellín, Santa Fe, Águilas Doradas, Puebla, Millonarios, Atlético Na</p><p><a href="/es/jugadores/9c6443e2/Luis-Marrugo">Luis Marrugo</a> 2022-2023&nbsp;· MF</p><p><a href="/es/jugadores/37e16a3f/Jorge-Marsiglia">Jorge Marsiglia</a> 2018-2022&nbsp;· DF&nbsp;· Deportivo Cali</p><p><a href="/es/jugadores/fb32bcfc/Alvaro-Martinez">Alvaro Martinez</a> 2021-2022&nbsp;· MF</p><p><a href="/es/jugadores/a84cb081/Danovis-Martinez">Danovis Martínez</a> 2021-2022&nbsp;· FW</p><p><a href="/es/jugadores/1831403a/Edwin-Martinez">Edwin Martínez</a> 2022&nbsp;· FW</p><p><a href="/es/jugadores/4c39ab5e/Edwin-Martinez">Edwin Martínez</a> 2022&nbsp;· MF</p><p><a href="/es/jugadores/7763bf91/Etilso-Martinez">Etilso Martínez</a> 2018&nbsp;· MF</p><p><a href="/es/jugadores/0c0b1959/Geiner-Martinez"><strong>Geiner Martínez</strong></a> 2025&nbsp;· DF&nbsp;· Juventud de Las Piedras</p><p><a href="/es/jugadores/b4b0a409/Gilmar-Martinez">Gilmar Martínez</a> 2023&nbsp;· FW&nbsp;· Racing</p><p><a href="/es/jugadores/9d60dd7c/Giovanny-Martinez">Giovanny Martínez</a> 2015-2021&nbsp;· MF&nbsp;· Sport Huancayo, Deportivo Pasto, Águilas Doradas, Cortuluá, Deportes Quindío</p><p><a href="/es/jugadores/66b813e6/Gonzalo-Martinez">Gonzalo Martínez</a> 2001-2015&nbsp;· DF&nbsp;· Atlético Huila, Patriotas FC, Millonarios, Napoli, Deportivo Cali, D.C. United, Udinese, Real Cartag</p><p><a href="/es/jugadores/6b627de8/Homer-Martinez"><strong>Homer Martínez</strong></a> 2016-2025&nbsp;· DF,MF&nbsp;· Independiente Medellín, Junior, Bucaramanga</p><p><a href="/es/jugadores/69cdc95a/Duban-Martinez-Ibarra">Duban Martínez Ibarra</a> 2016&nbsp;· FW&nbsp;· Fortaleza FC</p><p><a href="/es/jugadores/89fbacc3/Jackson-Martinez">Jackson Martínez</a> 2009-2020&nbsp;· FW&nbsp;· Porto, Independiente Medellín, Chiapas, Portimonense, Atlético Madrid, Colombia, Guangzhou Evergrand</p><p><a href="/es/jugadores/3d3e8fc7/Jarol-Martinez">Jarol Martínez</a> 2015-2020&nbsp;· DF,MF&nbsp;· Atlético Nacional, Millonarios, Deportivo Cali, Bucaramanga, Boyacá Chicó, Deportivo Pasto, América </p><p><a href="/es/jugadores/6129132f/Jefferson-Martinez"><strong>Jefferson Martinez</strong></a> 2015-2025&nbsp;· GK&nbsp;· Junior, Envigado FC, Bucaramanga, Millonarios</p><p><a href="/es/jugadores/4d2b35b5/Jhon-Martinez"><strong>Jhon Martínez</strong></a> 2024-2025&nbsp;· FW&nbsp;· Fortaleza FC</p><p><a href="/es/jugadores/51b200ab/Johan-Martinez">Johan Martínez</a> 2022-2023&nbsp;· MF&nbsp;· Independiente Medellín</p><p><a href="/es/jugadores/836cdf5b/Jose-Martinez">José Martínez</a> 2018&nbsp;· DF</p><p><a href="/es/jugadores/2d5a07ab/Juan-Martinez">Juan Martínez</a> 2017&nbsp;· MF</p><p><a href="/es/jugadores/4c756ece/Kevin-Martinez">Kevin Martínez</a> 2019&nbsp;· FW</p><p><a href="/es/jugadores/e044208c/Levid-Martinez">Levid Martínez</a> 2015-2016&nbsp;· GK&nbsp;· Mushuc Runa, Deportivo Cuenca</p><p><a href="/es/jugadores/d60d4c64/Misael-Martinez"><strong>Misael Martínez</strong></a> 2019-2025&nbsp;· FW&nbsp;· Alianza Petrolera, Patriotas FC, Bucaramanga</p><p><a href="/es/jugadores/cdd4dbf4/Neco-Martinez">Neco Martinez</a> 2003-2017&nbsp;· GK&nbsp;· Once Caldas, Sakaryaspor, Atlético Nacional, Santa Fe, Envigado FC</p><p><a href="/es/jugadores/6f0d613a/Roger-Martinez"><strong>Roger Martínez</strong></a> 2015-2026&nbsp;· FW,MF&nbsp;· Al-Taawoun, América, Racing Club, Jiangsu, Colombia, Aldosivi, Villarreal</p><p><a href="/es/jugadores/f91f58ac/Santiago-Martinez"><strong>Santiago Martínez</strong></a> 2024&nbsp;· DF&nbsp;· Jaguares de Córdoba</p><p><a href="/es/jugadores/c2a75a4e/Sara-Martinez">Sara Martínez</a> 2019-2021&nbsp;· MF&nbsp;· Colombia</p><p><a href="/es/jugadores/8ec27641/Yair-Martinez">Yair Martínez</a> 2015&nbsp;· MF</p><p><a href="/es/jugadores/e566f0c0/Yaliston-Martinez"><strong>Yaliston Martínez</strong></a> 2021-2025&nbsp;· MF&nbsp;· Boyacá Chicó, América de Cali</p><p><a href="/es/jugadores/6befd0f3/Yesith-Martinez">Yesith Martínez</a> 2021-2022&nbsp;· MF&nbsp;· Deportivo Pasto</p><p><a href="/es/jugadores/1f133504/Luis-Martinez-Zapata">Luis Martínez Zapata</a> 2016-2018&nbsp;· MF&nbsp;· Atlético Venezuela, Portuguesa</p><p><a href="/es/jugadores/1dc7970f/Jonathan-Marulanda">Jonathan Marulanda</a> 2018-2024&nbsp;· DF&nbsp;· Deportes Tolima, Independiente Medellín, Deportivo Cali, Atlético Nacional, Leones FC</p><p><a href="/es/jugadores/73ec2d5e/Jose-Marulanda">José Marulanda</a> 2019-2020&nbsp;· FW&nbsp;· Llaneros</p><p><a href="/es/jugadores/8c424d50/Miguel-Marulanda"><strong>Miguel Marulanda</strong></a> 2025&nbsp;· MF&nbsp;· Envigado FC</p><p><a href="/es/jugadores/f0b9a116/Wilson-Mateo-Lopez">Wilson Mateo López</a> 2015-2019&nbsp;· MF&nbsp;· Independiente Medellín</p><p><a href="/es/jugadores/0be15d72/Debinson-Mateus">Debinson Mateus</a> 2021-2023&nbsp;· GK</p><p><a href="/es/jugadores/284df08c/Ervin-Maturana">Ervin Maturana</a> 2015&nbsp;· DF&nbsp;· Atlético Huila, Deportes Tolima, Águilas Doradas, Once Caldas, Junior, La Equidad</p><p><a href="/es/jugadores/901f9ed8/Kevin-Maya">Kevin Maya</a> 2021&nbsp;· MF</p><p><a href="/es/jugadores/46b51fbf/Tomas-Maya">Tomás Maya</a> 2016-2024&nbsp;· DF&nbsp;· Charlotte Independence, Deportivo Pasto, Envigado FC, Atlético Nacional, Atlético Huila, Cúcuta Depo</p><p><a href="/es/jugadores/c8110448/Samir-Mayo"><strong>Samir Mayo</strong></a> 2023-2025&nbsp;· MF&nbsp;· La Equidad</p><p><a href="/es/jugadores/a8299513/Jonatan-Mayorga"><strong>Jonatan Mayorga</strong></a> 2025&nbsp;· FW&nbsp;· Llaneros</p><p><a href="/es/jugadores/0c7d1a19/Jader-Maza"><strong>Jáder Maza</strong></a> 2019-2024&nbsp;· MF&nbsp;· Envigado FC, Zamora, Bucaramanga, Jaguares de Córdoba, Deportivo Pereira</p><p><a href="/es/jugadores/0f3d26f2/Brayan-Mazo">Brayan Mazo</a> 2015-2016&nbsp;· FW&nbsp;· Deportes Tolima</p><p><a href="/es/jugadores/d37dec76/Cristian-Mazo">Cristian Mazo</a> 2016-2017&nbsp;· MF&nbsp;· Deportes Tolima</p><p><a href="/es/jugadores/7366a2f1/Hollman-McCormick">Hollman McCormick</a> 2020-2023&nbsp;· FW&nbsp;· Santa Fe</p><p><a href="/es/jugadores/6e15c550/Brayan-Medina"><strong>Brayan Medina</strong></a> 2022-2025&nbsp;· DF&nbsp;· América de Cali, Atlético Huila</p><p><a href="/es/jugadores/f94eb3da/Jeison-Medina"><strong>Jeison Medina</strong></a> 2018-2025&nbsp;· FW&nbsp;· Independiente del Valle, Deportivo Pasto, Aucas, América de Cali, Leones FC, PAS Lamia, Zaragoza</p><p><a href="/es/jugadores/ea0e9524/Junior-Medina">Junior Medina</a> 2015&nbsp;· MF&nbsp;· Deportivo Pasto</p><p><a href="/es/jugadores/89c63f8c/Kevin-Medina"><strong>Kevin Medina</strong></a> 2020-2025&nbsp;· DF&nbsp;· Qarabağ</p><p><a href="/es/jugadores/21ec0db7/Maicol-Medina"><strong>Maicol Medina</strong></a> 2015-2025&nbsp;· MF&nbsp;· Llaneros, Deportivo Pereira, Patriotas FC</p><p><a href="/es/jugadores/1b257774/Paula-Medina">Paula Medina</a> 2022&nbsp;· MF</p><p><a href="/es/jugadores/a7104778/Stefan-Medina"><strong>Stefan Medina</strong></a> 2014-2025&nbsp;· DF&nbsp;· Monterrey, Atlético Nacional, Pachuca, Colombia</p><p><a href="/es/jugadores/27d50bc6/Wilder-Medina">Wilder Medina</a> 2015-2016&nbsp;· FW&nbsp;· Deportes Tolima, Santa Fe, Sport Boys Warnes, Barcelona</p><p><a href="/es/jugadores/7623215c/Yeisson-Medina">Yeisson Medina</a> 2016-2017&nbsp;· FW&nbsp;· Aragua</p><p><a href="/es/jugadores/1e3b5e4f/Jhostin-Medranda"><strong>Jhostín Medranda</strong></a> 2021-2025&nbsp;· FW&nbsp;· Deportivo Pereira, Deportes Quindío</p><p><a href="/es/jugadores/6f7ac622/Jimmy-Medranda"><strong>Jimmy Medranda</strong></a> 2013-2025&nbsp;· DF,MF&nbsp;· San Antonio FC, Sporting KC, Seattle Sounders, Columbus Crew, OKC Energy, Swope Park Rangers</p><p><a href="/es/jugadores/d2dd5429/Antony-Medrano">Antony Medrano</a> 2023&nbsp;· FW</p><p><a href="/es/jugadores/3a1a3a31/Edgar-Medrano"><strong>Edgar Medrano</strong></a> 2023-2024&nbsp;· FW&nbsp;· Jaguares de Córdoba</p><p><a href="/es/jugadores/7a5aeccd/Alejandro-Mejia">Alejandro Mejía</a> 2023-2024&nbsp;· DF&nbsp;· Boyacá Chicó</p><p><a href="/es/jugadores/ab365692/Alexander-Mejia">Alexander Mejía</a> 2014-2024&nbsp;· MF&nbsp;· Atlético Nacional, Deportes Quindío, Libertad, León, Once Caldas, Deportivo Cali, Unión Magdalena, C</p><p><a href="/es/jugadores/0db9b945/Brayan-Mejia"><strong>Brayan Mejía</strong></a> 2022-2025&nbsp;· DF&nbsp;· Las Rozas CF</p><p><a href="/es/jugadores/4817ebe3/Cristian-Mejia">Cristian Mejía</a> 2009-2015&nbsp;· MF&nbsp;· Uniautónoma FC, Deportes Tolima, Peñarol, Atlético Huila, Envigado FC, Junior, Danubio, Politehnica </p><p><a href="/es/jugadores/3d17c570/David-Mejia">David Mejía</a> 2021-2022&nbsp;· DF</p><p><a href="/es/jugadores/a3b3ad0c/Ivan-Mejia"><strong>Ivan Mejia</strong></a> 2023&nbsp;· MF</p><p><a href="/es/jugadores/ed841685/Johar-Mejia"><strong>Johar Mejia</strong></a> 2022-2025&nbsp;· FW&nbsp;· Tudelano, Once Caldas, Cortuluá</p><p><a href="/es/jugadores/8fb27205/Josep-Mejia">Josep Mejia</a> 2022&nbsp;· MF</p><p><a href="/es/jugadores/6a3c222c/Robert-Mejia"><strong>Robert Mejía</strong></a> 2020-2025&nbsp;· MF&nbsp;· FC Khimki, Once Caldas, Atlético Nacional, Giresunspor</p><p><a href="/es/jugadores/13500a9c/Ronaldo-Mejia">Ronaldo Mejía</a> 2023&nbsp;· DF</p><p><a href="/es/jugadores/7dfd29f5/Victor-Mejia"><strong>Víctor Mejía</strong></a> 2019-2025&nbsp;· MF&nbsp;· Deportivo Cali, Bucaramanga, Deportivo Pasto, Estudiantes de Caracas, Zulia, Monagas</p><p><a href="/es/jugadores/7bf561de/Yulian-Mejia">Yulián Mejía</a> 2015-2020&nbsp;· MF&nbsp;· Envigado FC, Unión Española, Sporting Cristal, Bucaramanga, Atlético Nacional, Independiente Medellí</p><p><a href="/es/jugadores/e9646d62/Alvaro-Melendez"><strong>Álvaro Meléndez</strong></a> 2020-2024&nbsp;· MF&nbsp;· Bucaramanga, Deportes Tolima, Patriotas FC, Deportivo Pasto, Alianza Petrolera</p><p><a href="/es/jugadores/cb566222/John-Melendez"><strong>John Meléndez</strong></a> 2023-2025&nbsp;· DF&nbsp;· Santa Fe</p><p><a href="/es/jugadores/7e22dc1a/Daniel-Melo">Daniel Melo</a> 2021-2023&nbsp;· GK</p><p><a href="/es/jugadores/3867cd0f/Camilo-Mena"><strong>Camilo Mena</strong></a> 2020-2025&nbsp;· MF&nbsp;· Lechia Gdańsk, Deportivo Pereira, Jagiellonia</p><p><a href="/es/jugadores/940bec5a/Cesar-Mena">César Mena</a> 2015-2020&nbsp;· DF&nbsp;· San José, Unión Comercio, Total Chalaco, Jaguares de Córdoba, Cúcuta Deportivo, Águilas Doradas, Dep</p><p><a href="/es/jugadores/8cef4578/Cristhian-Mena">Cristhian Mena</a> 2021-2022&nbsp;· MF</p><p><a href="/es/jugadores/a99edcfb/Daley-Mena">Daley Mena</a> 2011-2016&nbsp;· FW&nbsp;· Danubio, Colón, Querétaro, Boyacá Chicó, Unión Comercio</p><p><a href="/es/jugadores/b0818269/Esneyder-Mena"><strong>Esneyder Mena</strong></a> 2017-2025&nbsp;· DF,MF&nbsp;· América de Cali, Deportivo Pasto, Bucaramanga, Patriotas FC, Jaguares de Córdoba</p><p><a href="/es/jugadores/c625140c/Fabian-Mena">Fabian Mena</a> 2015-2016&nbsp;· FW&nbsp;· Patriotas FC</p><p><a href="/es/jugadores/f1664309/Harry-Mena">Harry Mena</a> 2016&nbsp;· DF&nbsp;· Ureña</p><p><a href="/es/jugadores/663690a1/Howell-Mena"><strong>Howell Mena</strong></a> 2023-2025&nbsp;· DF&nbsp;· Junior</p><p><a href="/es/jugadores/16f61115/Javier-Mena"><strong>Javier Mena</strong></a> 2023-2025&nbsp;· FW&nbsp;· Deportivo Pereira</p><p><a href="/es/jugadores/9cadd116/Javier-Mena"><strong>Javier Mena</strong></a> 2024-2025&nbsp;· DF&nbsp;· Águilas Doradas</p><p><a href="/es/jugadores/fd931198/Jefferson-Mena"><strong>Jefferson Mena</strong></a> 2015-2025&nbsp;· DF&nbsp;· Bucaramanga, Independiente Medellín, New York City FC, Barcelona, La Equidad, Águilas Doradas, Aldos</p><p><a href="/es/jugadores/1706f2cd/Jhon-Mena"><strong>Jhon Mena</strong></a> 2019-2020&nbsp;· DF&nbsp;· Boyacá Chicó</p><p><a href="/es/jugadores/fff106a3/Jhon-Mena">Jhon Mena</a> 2016&nbsp;· MF</p><p><a href="/es/jugadores/eb6f0ab8/Jhonny-Mena">Jhonny Mena</a> 2022&nbsp;· DF&nbsp;· Carlos Stein</p><p><a href="/es/jugadores/0448d45a/Kleyner-Mena">Kleyner Mena</a> 2015&nbsp;· MF&nbsp;· Colorado Springs Switchbacks</p><p><a href="/es/jugadores/ab34351e/Yair-Mena-Palacios"><strong>Yair Mena Palacios</strong></a> 2019-2025&nbsp;· FW&nbsp;· AVS Futebol, Atlético Nacional</p><p><a href="/es/jugadores/c02a5ede/Sergio-Mena">Sergio Mena</a> 2019&nbsp;· DF</p><p><a href="/es/jugadores/c3c65bf4/Stiwar-Mena">Stiwar Mena</a> 2022-2023&nbsp;· DF&nbsp;· Unión Magdalena, Binacional</p><p><a href="/es/jugadores/0c56cf3b/Wilson-Mena">Wilson Mena</a> 2015-2021&nbsp;· FW&nbsp;· Once Caldas, Estudiantes de Mérida, Expreso Rojo, Deportivo Pereira, Boyacá Chicó, Jaguares de Córdo</p><p><a href="/es/jugadores/ee45ebce/Yeison-Mena">Yeison Mena</a> 2017-2024&nbsp;· FW&nbsp;· Caracas</p><p><a href="/es/jugadores/104c2dad/Yessi-Mena">Yessi Mena</a> 2015-2019&nbsp;· FW&nbsp;· Águilas Doradas, La Equidad, Junior, Envigado FC, KPV, Leones FC</p><p><a href="/es/jugadores/531f091c/Yorleys-Mena"><strong>Yorleys Mena</strong></a> 2014-2025&nbsp;· FW&nbsp;· Alianza Universidad, Universidad César Vallejo, Independiente Medellín, Morelia, América de Cali, Ju</p><p><a href="/es/jugadores/cb347ea8/Dennis-Mena-Zapata">Dennis Mena Zapata</a> 2018-2021&nbsp;· DF&nbsp;· Boyacá Chicó, Envigado FC</p><p><a href="/es/jugadores/08125763/Jeison-Mendez">Jeison Méndez</a> 2021-2023&nbsp;· GK</p><p><a href="/es/jugadores/bff50581/Jhon-Mendez">Jhon Méndez</a> 2015-2019&nbsp;· MF&nbsp;· Deportes Tolima, Envigado FC, Cortuluá, Alianza Atlético, Jaguares de Córdoba, Carabobo, Guabirá</p><p><a href="/es/jugadores/9b3eba10/John-Mendez">John Méndez</a> 2021-2023&nbsp;· FW&nbsp;· Atlético Huila</p><p><a href="/es/jugadores/4796a494/Jorman-Mendoza"><strong>Jorman Mendoza </strong></a> 2024-2025&nbsp;· GK&nbsp;· Envigado FC</p><p><a href="/es/jugadores/8d45dbe9/Alexis-Mendoza">Alexis Mendoza</a> 1990-1994&nbsp;· DF</p><p><a href="/es/jugadores/21831538/Diego-Mendoza"><strong>Diego Mendoza</strong></a> 2023-2025&nbsp;· DF&nbsp;· Alianza Petrolera, Junior</p><p><a href="/es/jugadores/228fdd31/Humberto-Mendoza">Humberto Mendoza</a> 2019-2020&nbsp;· DF&nbsp;· Atlético Nacional, Envigado FC, Real Cartagena, Llacuabamba, Santa Fe, Colón</p><p><a href="/es/jugadores/7fae3753/Jonathan-Mendoza">Jonathan Mendoza</a> 2013-2017&nbsp;· MF&nbsp;· Rochester Rhinos, Orlando City B, Harrisburg City Islanders, Orlando City</p><p><a href="/es/jugadores/2232850c/Jorge-Mendoza">Jorge Mendoza</a> 2021-2022&nbsp;· FW&nbsp;· Patriotas FC</p><p><a href="/es/jugadores/8ce5b3f2/Jose-Mendoza">José Mendoza</a> 2023&nbsp;· FW&nbsp;· Jaguares de Córdoba</p><p><a href="/es/jugadores/e68f2cb4/Stiven-Mendoza"><strong>Stiven Mendoza</strong></a> 2015-2025&nbsp;· FW,MF&nbsp;· León, Amiens, Ceará, Bahia, Santos, New York City FC, Corinthians, Cúcuta Deportivo, Adana Demirspor</p><p><a href="/es/jugadores/ec652843/Edgar-Meneses">Edgar Meneses</a> 2015&nbsp;· MF&nbsp;· Deportivo Pasto</p><p><a href="/es/jugadores/fb7e49e7/John-Meneses">John Meneses</a> 2017-2018&nbsp;· GK&nbsp;· Deportivo Cali, América de Cali</p><p><a href="/es/jugadores/928f11ad/Yadir-Meneses">Yadir Meneses</a> 2018-2022&nbsp;· MF&nbsp;· Envigado FC</p><p><a href="/es/jugadores/c180d967/Daniel-Mera"><strong>Daniel Mera</strong></a> 2025&nbsp;· DF&nbsp;· Unión Magdalena</p><p><a href="/es/jugadores/389ad8d2/Deiner-Mera">Deiner Mera</a> 2015-2017&nbsp;· DF&nbsp;· Atlético Huila, Trujillanos</p><p><a href="/es/jugadores/489474ef/German-Mera">Germán Mera</a> 2013-2024&nbsp;· DF&nbsp;· Deportivo Cali, Junior, Mechelen, Cienciano, Colorado Rapids</p><p><a href="/es/jugadores/15b0fa57/Jose-Mera">José Mera</a> 2003&nbsp;· DF&nbsp;· Millonarios, Deportivo Pasto, Independiente Medellín, Deportivo Cali, Caracas</p><p><a href="/es/jugadores/dc9565b7/Juan-Mera"><strong>Juan Mera</strong></a> 2022-2024&nbsp;· DF&nbsp;· Deportes Tolima</p><p><a href="/es/jugadores/6959a3a1/Santiago-Mera"><strong>Santiago Mera</strong></a> 2022-2024&nbsp;· FW&nbsp;· Once Caldas</p><p><a href="/es/jugadores/e57183e4/Cristian-Mercado-Curiel">Cristian Mercado Curiel</a> 2015&nbsp;· FW</p><p><a href="/es/jugadores/66b82923/Esteban-Mercado">Esteban Mercado</a> 2022&nbsp;· FW</p><p><a href="/es/jugadores/9726bcd1/Feiver-Mercado">Feiver Mercado</a> 2017-2023&nbsp;· FW,MF&nbsp;· Cortuluá, Deportivo Cali, Deportivo Pasto, Deportes Quindío, Jaguares de Córdoba</p><p><a href="/es/jugadores/b70042be/Jose-Mercado"><strong>José Mercado</strong></a> 2022-2025&nbsp;· DF&nbsp;· Unión Magdalena</p><p><a href="/es/jugadores/7f73befd/Daniel-Merino">Daniel Meriño</a> 2024&nbsp;· MF</p><p><a href="/es/jugadores/9dbed1bb/Carlos-Mestre">Carlos Mestre</a> 2016&nbsp;· MF&nbsp;· Fortaleza FC</p><p><a href="/es/jugadores/f4e2e9a2/Ever-Meza"><strong>Ever Meza</strong></a> 2023-2024&nbsp;· MF&nbsp;· Alianza Petrolera, Envigado FC</p><p><a href="/es/jugadores/05540190/Francisco-Meza"><strong>Francisco Meza</strong></a> 2015-2025&nbsp;· DF&nbsp;· Deportivo Cali, Santa Fe, UANL, Bucaramanga</p><p><a href="/es/jugadores/6c721927/Jhonny-Meza">Jhonny Meza</a> 2015-2017&nbsp;· DF&nbsp;· Águilas Doradas</p><p><a href="/es/jugadores/d68fa9d4/Jimmy-Mican">Jimmy Mican</a> 2016&nbsp;· MF&nbsp;· Fortaleza FC</p><p><a href="/es/jugadores/786c2e9e/Felix-Micolta">Félix Micolta</a> 2014-2021&nbsp;· DF,MF&nbsp;· Once Caldas, Atlético Nacional, Puebla, Deportivo Cali, Bucaramanga, Chiapas, Santa Fe, América de C</p><p><a href="/es/jugadores/ea471391/Joider-Micolta"><strong>Joider Micolta</strong></a> 2022-2025&nbsp;· FW&nbsp;· América de Cali, Bucaramanga</p><p><a href="/es/jugadores/8a5c4850/Kevin-Mier"><strong>Kevin Mier</strong></a> 2019-2026&nbsp;· GK&nbsp;· Cruz Azul, Atlético Nacional</p><p><a href="/es/jugadores/04a58604/Donald-Millan">Donald Millán</a> 2014-2024&nbsp;· MF&nbsp;· Universidad Técnica de Cajamarca, Universidad César Vallejo, Atlético Huila, Binacional, La Equidad,</p><p><a href="/es/jugadores/a92e9820/Julian-Millan"><strong>Julián Millán</strong></a> 2016-2025&nbsp;· DF&nbsp;· Nacional, Santa Fe, Cortuluá, Patriotas FC</p><p><a href="/es/jugadores/79442ee2/Christian-Mina">Christian Mina</a> 2019-2020&nbsp;· MF&nbsp;· Cúcuta Deportivo</p><p><a href="/es/jugadores/8a15b570/Cristian-Mina">Cristian Mina</a> 2019&nbsp;· FW</p><p><a href="/es/jugadores/fe460951/David-Mina"><strong>David Mina</strong></a> 2020-2025&nbsp;· DF&nbsp;· América de Cali, Šibenik</p><p><a href="/es/jugadores/11381d4d/Duvan-Mina">Duvan Mina</a> 2021-2023&nbsp;· FW&nbsp;· Deportivo Cali</p><p><a href="/es/jugadores/ee42e509/Jaison-Mina"><strong>Jaison Mina</strong></a> 2022-2025&nbsp;· DF&nbsp;· Llaneros, La Equidad, Cortuluá</p><p><a href="/es/jugadores/3b5411f5/Luis-Mina"><strong>Luis Mina</strong></a> 2024-2025&nbsp;· DF&nbsp;· Estudiantes de Mérida</p><p><a href="/es/jugadores/ee04583b/Luis-Mina"><strong>Luis Mina</strong></a> 2021-2022&nbsp;· FW&nbsp;· Macará, Deportes Quindío</p><p><a href="/es/jugadores/d1e4ab21/Mancilla-Mina">Mancilla Mina</a> 2015&nbsp;· FW</p><p><a href="/es/jugadores/0bf0b7c2/Pablo-Mina">Pablo Mina</a> 2015-2022&nbsp;· GK&nbsp;· Cortuluá, Boyacá Chicó, Deportivo Cali, Jaguares de Córdoba</p><p><a href="/es/jugadores/1309025e/Stiven-Mina">Stiven Mina</a> 2015-2018&nbsp;· MF&nbsp;· Atlético Socopó</p><p><a href="/es/jugadores/6d5701f2/Yerry-Mina"><strong>Yerry Mina</strong></a> 2015-2026&nbsp;· DF&nbsp;· Cagliari, Everton, Santa Fe, Colombia, Palmeiras, Deportivo Pasto, Fiorentina, Barcelona</p><p><a href="/es/jugadores/86581d01/Victor-Minota"><strong>Victor Minota</strong></a> 2023&nbsp;· FW</p><p><a href="/es/jugadores/9b2de88c/Yirleidys-Minota"><strong>Yirleidys Minota</strong></a> 2024&nbsp;· FW&nbsp;· Colombia</p><p><a href="/es/jugadores/bfb7e69b/Luis-Miranda"><strong>Luis Miranda</strong></a> 2019-2025&nbsp;· MF&nbsp;· Deportes Tolima, Cúcuta Deportivo, Once Caldas</p><p><a href="/es/jugadores/1f80ef16/Anderson-Mojica"><strong>Anderson Mojica</strong></a> 2019-2025&nbsp;· MF&nbsp;· Llaneros, Deportivo Cali, Boyacá Chicó</p><p><a href="/es/jugadores/d23d3439/Harrison-Mojica">Harrison Mojica</a> 2015-2023&nbsp;· FW,MF&nbsp;· Jaguares de Córdoba, Deportivo Cali, Alianza Petrolera, Millonarios, Bucaramanga, Club 9 de Octubre,</p><p><a href="/es/jugadores/608f2092/Johan-Mojica"><strong>Johan Mojica</strong></a> 2013-2026&nbsp;· DF,MF&nbsp;· Mallorca, Girona, Valladolid, Elche, Colombia, Osasuna, Villarreal, Rayo Vallecano, Deportivo Cali, </p><p><a href="/es/jugadores/2b5f2087/Jairo-Molina"><strong>Jairo Molina</strong></a> 2017-2025&nbsp;· FW&nbsp;· Boyacá Chicó, Alianza Petrolera, Deportivo Pereira, Jaguares de Córdoba, Deportivo Pasto, Atlético H</p><p><a href="/es/jugadores/6c254873/Luis-Molina">Luis Molina</a> 2022-2024&nbsp;· MF</p><p><a href="/es/jugadores/e6e11f33/Mauricio-Molina">Mauricio Molina</a> 2003-2017&nbsp;· MF&nbsp;· FC Seoul, Independiente Medellín, Santos, Seongnam FC, Morelia, San Lorenzo, Club Olimpia, Red Star</p><p><a href="/es/jugadores/3c9d4458/Tomas-Molina"><strong>Tomas Molina</strong></a> 2023-2025&nbsp;· Santa Fe</p><p><a href="/es/jugadores/4f5a5f84/Michel-Molinari">Michel Molinari</a> 2018&nbsp;· MF</p><p><a href="/es/jugadores/cbd99275/Faryd-Mondragon">Faryd Mondragón</a> 1994-2014&nbsp;· GK&nbsp;· Galatasaray, Köln, Deportivo Cali, Metz, Philadelphia Union, Zaragoza, Colombia</p><p><a href="/es/jugadores/2f4d4e0a/Jose-Mondragon">José Mondragón</a> 2015&nbsp;· DF&nbsp;· Jaguares de Córdoba</p><p><a href="/es/jugadores/524f9189/Camilo-Monroy">Camilo Monroy</a> 2017-2023&nbsp;· FW&nbsp;· Rio Grande Valley Toros</p><p><a href="/es/jugadores/4883f46c/Davinson-Monsalve">Davinson Monsalve</a> 2015-2019&nbsp;· DF&nbsp;· Deportes Tolima, Patriotas FC, Once Caldas, Atlético Huila, Bucaramanga</p><p><a href="/es/jugadores/a5d6fbbf/Jonathan-Monsalve"><strong>Jonathan Monsalve</strong></a> 2025&nbsp;· FW&nbsp;· Real Oruro</p><p><a href="/es/jugadores/a2f7f47c/Miguel-Monsalve"><strong>Miguel Monsalve</strong></a> 2020-2025&nbsp;· MF&nbsp;· Grêmio, Independiente Medellín</p><p><a href="/es/jugadores/c0087fa9/Charles-Monsalvo">Charles Monsalvo</a> 2015-2022&nbsp;· FW&nbsp;· Boyacá Chicó, Sport Huancayo, Deportes Tolima, Envigado FC, Águilas Doradas, América de Cali, Indepe</p><p><a href="/es/jugadores/222454b6/Jefferson-Montanez">Jefferson Montañez</a> 2015-2021&nbsp;· FW&nbsp;· Jaguares de Córdoba, Cúcuta Deportivo</p><p><a href="/es/jugadores/520d9ebb/Alvaro-Montano"><strong>Álvaro Montaño</strong></a> 2023-2024&nbsp;· MF&nbsp;· Once Caldas</p><p><a href="/es/jugadores/3128ba4e/Brayan-Montano">Brayan Montaño</a> 2016&nbsp;· DF&nbsp;· Patriotas FC, Once Caldas</p><p><a href="/es/jugadores/c76c3c23/Brayan-Montano"><strong>Brayan Montaño</strong></a> 2019-2025&nbsp;· DF&nbsp;· La Equidad, Deportivo Cali</p><p><a href="/es/jugadores/c7be313e/Cristian-Montano"><strong>Cristian Montaño</strong></a> 2011-2025&nbsp;· DF,FW&nbsp;· Livingston, Port Vale, Bristol Rovers, Oldham Athletic, Notts County, Dagenham &amp; Redbridge, Oxford U</p><p><a href="/es/jugadores/d9571fc5/Edward-Montano">Edward Montaño</a> 2017&nbsp;· DF&nbsp;· Expreso Rojo</p><p><a href="/es/jugadores/b6575ba5/Erick-Montano">Erick Montaño</a> 2019&nbsp;· MF</p><p><a href="/es/jugadores/74bb094f/Jackson-Montano">Jackson Montaño</a> 2018-2022&nbsp;· DF&nbsp;· Deportes Quindío, Bucaramanga, Alianza Petrolera</p><p><a href="/es/jugadores/2809cc5f/Jhon-Montano"><strong>Jhon Montaño</strong></a> 2018&nbsp;· MF&nbsp;· Rio Grande Valley Toros</p><p><a href="/es/jugadores/3b7077e1/Johnnier-Montano">Johnnier Montaño</a> 1999-2019&nbsp;· MF&nbsp;· Alianza Lima, Sport Boys, Universidad San Martín, Melgar, Cantolao, Konyaspor, Parma, Piacenza, Hell</p><p><a href="/es/jugadores/e45af75c/Miguel-Montano">Miguel Montaño</a> 2010-2014&nbsp;· FW,MF&nbsp;· Seattle Sounders FC, Montreal Impact, Montreal Impact, Quilmes</p><p><a href="/es/jugadores/ca41a2fb/Omar-Montano">Omar Montaño</a> 2019-2021&nbsp;· FW</p><p><a href="/es/jugadores/bcd514bc/Victor-Montano">Víctor Montaño</a> 2004-2016&nbsp;· FW&nbsp;· Rennes, Montpellier, Istres, Toluca</p><p><a href="/es/jugadores/a464c920/Eduardo-Montenegro">Eduardo Montenegro</a> 2018&nbsp;· MF</p><p><a href="/es/jugadores/bc5b5be5/Fredy-Montero">Fredy Montero</a> 2009-2024&nbsp;· FW&nbsp;· Seattle Sounders FC, Sporting CP, Vancouver Whitecaps FC, Deportivo Cali, Atlético Huila, Tianjin Ji</p><p><a href="/es/jugadores/5ecd1e26/Geovan-Montes"><strong>Geovan Montes</strong></a> 2015-2025&nbsp;· DF&nbsp;· Llaneros, Atlético Huila, Águilas Doradas, América de Cali</p><p><a href="/es/jugadores/dbcdac65/Jose-Montes">José Montes</a> 2023&nbsp;· FW</p><p><a href="/es/jugadores/a7bbf943/Daniela-Montoya"><strong>Daniela Montoya</strong></a> 2011-2024&nbsp;· MF&nbsp;· Colombia</p><p><a href="/es/jugadores/991e140d/David-Montoya">David Montoya</a> 2022&nbsp;· GK</p><p><a href="/es/jugadores/b211ee48/David-Montoya">David Montoya</a> 2018-2020&nbsp;· DF&nbsp;· Leones FC, La Serena</p><p><a href="/es/jugadores/c5a34997/Jhoan-Montoya"><strong>Jhoan Montoya</strong></a> 2023-2024&nbsp;· MF</p><p><a href="/es/jugadores/1b1aa942/Santiago-Montoya">Santiago Montoya</a> 2015-2022&nbsp;· MF&nbsp;· Deportes Tolima, Millonarios, Bucaramanga, All Boys, Deportivo Pereira, Vasco da Gama, Vitória Guima</p><p><a href="/es/jugadores/8db37e15/Santiago-Montoya">Santiago Montoya</a> 2022-2023&nbsp;· MF&nbsp;· Botev Vratsa</p><p><a href="/es/jugadores/f6e57bd9/Wilfer-Montoya">Wilfer Montoya</a> 2016&nbsp;· FW&nbsp;· Petare</p><p><a href="/es/jugadores/d3a9c3fd/Alyair-Mora">Alyair Mora</a> 2016&nbsp;· GK</p><p><a href="/es/jugadores/ecbb6b2b/Angel-Mora"><strong>Ángel Mora</strong></a> 2024&nbsp;· FW</p><p><a href="/es/jugadores/88671318/Anyelo-Mora">Anyelo Mora</a> 2017-2018&nbsp;· MF</p><p><a href="/es/jugadores/0c75f638/Jaime-Mora"><strong>Jaime Mora</strong></a> 2021-2025&nbsp;· GK&nbsp;· Zamora, Alianza Petrolera</p><p><a href="/es/jugadores/0b8c605a/Jhan-Mora">Jhan Mora</a> 2018&nbsp;· FW&nbsp;· Boyacá Chicó</p><p><a href="/es/jugadores/0238ff4b/Julio-Mora">Julio Mora</a> 2018&nbsp;· DF&nbsp;· Zamora</p><p><a href="/es/jugadores/88bafdc8/Andres-Morales">Andrés Morales</a> 2021-2024&nbsp;· MF&nbsp;· Alianza Petrolera</p><p><a href="/es/jugadores/17124ae3/Kendy-Morales">Kendy Morales</a> 2023-2024&nbsp;· MF&nbsp;· FC Lustenau/FC Dornbirn</p><p><a href="/es/jugadores/f1cb9ba6/Maria-Morales">María Morales</a> 2021-2022&nbsp;· MF&nbsp;· Colombia</p><p><a href="/es/jugadores/6fa15d17/Ramiro-Morales"><strong>Ramiro Morales</strong></a> 2025&nbsp;· DF&nbsp;· Deportivo Pasto</p><p><a href="/es/jugadores/a0dabe24/Alejandro-Moralez"><strong>Alejandro Moralez</strong></a> 2019-2025&nbsp;· DF&nbsp;· Bucaramanga, Fortaleza FC, Santa Fe</p><p><a href="/es/jugadores/47474d61/Leyder-Moran"><strong>Leyder Moran</strong></a> 2022-2024&nbsp;· DF&nbsp;· Once Caldas</p><p><a href="/es/jugadores/4cb35b2b/Luis-Moran">Luis Morán</a> 2017&nbsp;· MF</p><p><a href="/es/jugadores/2e7f2fed/Neider-Morantes">Neider Morantes</a> 2016&nbsp;· MF&nbsp;· Envigado FC, Independiente Medellín, Boyacá Chicó</p><p><a href="/es/jugadores/a4a182c7/Jesus-Morelo-Meza">Jesus Morelo Meza</a> 2019-2020&nbsp;· MF</p><p><a href="/es/jugadores/30a66b02/Wilson-Morelo"><strong>Wilson Morelo</strong></a> 2013-2025&nbsp;· FW&nbsp;· Águilas Doradas, Santa Fe, América de Cali, La Equidad, Colón, Atlético Huila, Jaguares de Córdoba, </p><p><a href="/es/jugadores/ef88f778/Alfredo-Morelos"><strong>Alfredo Morelos</strong></a> 2015-2025&nbsp;· FW&nbsp;· Atlético Nacional, Rangers, HJK Helsinki, Colombia, Santos, Independiente Medellín</p><p><a href="/es/jugadores/bbc6ed5c/Alex-Moreno"><strong>Alex Moreno</strong></a> 2022-2024&nbsp;· DF&nbsp;· Millonarios</p><p><a href="/es/jugadores/33c21071/Danilo-Moreno-Asprilla"><strong>Danilo Moreno Asprilla</strong></a> 2013-2024&nbsp;· FW,MF&nbsp;· Litex Lovech, Al-Fayha, Al-Shabab, Rampla Juniors, CSKA Sofia, Al-Qadsiah, Patriotas FC, Santa Fe</p><p><a href="/es/jugadores/ad3f6c56/Brayan-Moreno"><strong>Brayan Moreno</strong></a> 2019-2024&nbsp;· FW&nbsp;· CSKA Sofia, Atlético Huila</p><p><a href="/es/jugadores/ebbab4bb/Brayan-Moreno"><strong>Brayan Moreno</strong></a> 2019-2024&nbsp;· FW&nbsp;· Boyacá Chicó, Real Santa Cruz, Atlético Huila</p><p><a href="/es/jugadores/47848490/Carlos-Moreno">Carlos Moreno</a> 2022&nbsp;· DF</p><p><a href="/es/jugadores/56f7fcf6/Daniel-Moreno"><strong>Daniel Moreno</strong></a> 2018-2024&nbsp;· FW,MF&nbsp;· Deportivo Pasto, Junior, Alianza Petrolera, Santa Fe, Deportes Tolima</p><p><a href="/es/jugadores/65077f7a/Daniel-Moreno">Daniel Moreno</a> 2018&nbsp;· MF&nbsp;· Atlético Huila</p><p><a href="/es/jugadores/cfaf9525/Dayro-Moreno"><strong>Dayro Moreno</strong></a> 2007-2025&nbsp;· FW,MF&nbsp;· Once Caldas, Tijuana, Atlético Nacional, Steaua București, Bucaramanga, Junior, Talleres, Millonario</p><p><a href="/es/jugadores/71849534/Didier-Moreno"><strong>Didier Moreno</strong></a> 2015-2025&nbsp;· MF&nbsp;· Junior, Independiente Medellín, Santa Fe, Deportivo La Coruña, Atlético Huila</p><p><a href="/es/jugadores/5aee3078/Diego-Moreno"><strong>Diego Moreno</strong></a> 2015-2025&nbsp;· MF&nbsp;· Independiente Medellín, Envigado FC, Atlético Huila, Marítimo</p><p><a href="/es/jugadores/30141962/Eber-Moreno"><strong>Eber Moreno</strong></a> 2022-2025&nbsp;· DF,MF&nbsp;· Deportivo Pereira, América de Cali</p><p><a href="/es/jugadores/61e21869/Ederson-Moreno"><strong>Ederson Moreno</strong></a> 2018-2024&nbsp;· MF&nbsp;· La Equidad, Deportivo Pasto, Deportivo Pereira</p><p><a href="/es/jugadores/918e1545/Erik-Moreno">Erik Moreno</a> 2013-2017&nbsp;· FW&nbsp;· Millonarios, Tondela, Panetolikos, Deportivo Pereira, Braga</p><p><a href="/es/jugadores/317bcbf5/Freilin-Moreno">Freilin Moreno</a> 2023-2024&nbsp;· MF&nbsp;· Deportivo Cali</p><p><a href="/es/jugadores/edb709d9/Giovanni-Moreno">Giovanni Moreno</a> 2014-2022&nbsp;· FW,MF&nbsp;· Shanghai Shenhua, Atlético Nacional, Racing Club, Envigado FC, Colombia</p><p><a href="/es/jugadores/8446d5fa/Jaider-Moreno"><strong>Jaider Moreno</strong></a> 2023-2024&nbsp;· FW&nbsp;· Deportivo Cali</p><p><a href="/es/jugadores/4d3c6e9f/Joiner-Moreno">Joiner Moreno</a> 2020-2024&nbsp;· DF&nbsp;· La Equidad</p><p><a href="/es/jugadores/3666c8e2/Jose-Luis-Mosquera-Moreno">José Luis Mosquera Moreno</a> 2018&nbsp;· DF&nbsp;· Boyacá Chicó</p><p><a href="/es/jugadores/854f50a4/Juan-Moreno">Juan Moreno</a> 2019-2023&nbsp;· DF&nbsp;· Deportivo Pasto, Deportivo Pereira, Independiente Medellín</p><p><a href="/es/jugadores/a2e07050/Juan-Moreno"><strong>Juan Moreno</strong></a> 2017-2025&nbsp;· GK&nbsp;· Miramar Misiones, Millonarios</p><p><a href="/es/jugadores/c480aee3/Juan-Moreno"><strong>Juan Moreno</strong></a> 2025&nbsp;· FW&nbsp;· Charlotte Independence</p><p><a href="/es/jugadores/9c577f31/Kevin-Moreno"><strong>Kevin Moreno</strong></a> 2018-2025&nbsp;· DF&nbsp;· Alianza Petrolera, Deportivo Cali</p><p><a href="/es/jugadores/f9eafea9/Kliver-Moreno"><strong>Kliver Moreno</strong></a> 2020-2025&nbsp;· MF&nbsp;· Deportivo Cuenca, Millonarios, River Plate</p><p><a href="/es/jugadores/8499c713/Marlos-Moreno"><strong>Marlos Moreno</strong></a> 2015-2025&nbsp;· FW,MF&nbsp;· Tenerife, Konyaspor, Atlético Nacional, Kortrijk, Flamengo, Lommel SK, Deportivo La Coruña, Portimon</p><p><a href="/es/jugadores/71af7baf/Miller-Moreno">Miller Moreno</a> 2016&nbsp;· FW</p><p><a href="/es/jugadores/f4772abc/Jose-Moreno-Mora">José Moreno Mora</a> 2006-2015&nbsp;· FW&nbsp;· América de Cali, Independiente, Steaua București, La Equidad, Once Caldas, Atlético Huila, Jaguares </p><p><a href="/es/jugadores/37baed03/Yeison-Moreno-Murillo"><strong>Yeison Moreno Murillo</strong></a> 2016-2024&nbsp;· FW&nbsp;· Bucaramanga, Envigado FC, Santa Fe, Cortuluá</p><p><a href="/es/jugadores/7fdcf661/Neyder-Moreno"><strong>Neyder Moreno</strong></a> 2017-2025&nbsp;· MF&nbsp;· Auckland FC, Envigado FC, Santa Fe, Atlético Nacional</p><p><a href="/es/jugadores/3261d0e4/Santiago-Moreno"><strong>Santiago Moreno</strong></a> 2019-2025&nbsp;· FW,MF&nbsp;· Portland Timbers, América de Cali</p><p><a href="/es/jugadores/7df1d4ff/Sebastian-Moreno"><strong>Sebastian Moreno</strong></a> 2024&nbsp;· FW&nbsp;· Patriotas FC</p><p><a href="/es/jugadores/ba5c401a/Tressor-Moreno">Tressor Moreno</a> 2000-2012&nbsp;· FW,MF&nbsp;· San Luis, Metz, Veracruz, Necaxa, Independiente Medellín, Santiago Wande, Junior, Atlético Huila, Sa</p><p><a href="/es/jugadores/8a1ce21b/Victor-Moreno"><strong>Víctor Moreno</strong></a> 2019-2025&nbsp;· DF&nbsp;· Santa Fe, Independiente Medellín, Atlético Huila, Águilas Doradas, Alianza Petrolera</p><p><a href="/es/jugadores/9eb9fdec/Yairo-Moreno">Yairo Moreno</a> 2015-2024&nbsp;· DF,MF&nbsp;· León, Independiente Medellín, Envigado FC, Pachuca, La Equidad, Colombia, Junior</p><p><a href="/es/jugadores/2f0dcbb7/Yeferson-Moreno"><strong>Yeferson Moreno</strong></a> 2023-2025&nbsp;· DF&nbsp;· Junior</p><p><a href="/es/jugadores/abd331dc/Alejandro-Mosquera">Alejandro Mosquera</a> 2018-2021&nbsp;· FW&nbsp;· Atlético Huila</p><p><a href="/es/jugadores/5fa138e3/Andres-Mosquera">Andrés Mosquera</a> 2003&nbsp;· DF&nbsp;· Millonarios, Once Caldas, Deportivo Pasto, Sporting Cristal, Independiente Medellín, Atlético Nacion</p><p><a href="/es/jugadores/a393a5c2/Anibal-Mosquera">Aníbal Mosquera</a> 2016-2019&nbsp;· MF&nbsp;· Bucaramanga, Unión Magdalena</p><p><a href="/es/jugadores/e8624833/Aquivaldo-Mosquera">Aquivaldo Mosquera</a> 2005-2017&nbsp;· DF&nbsp;· América, Pachuca, Sevilla, Deportivo Cali, Chiapas, Colombia</p><p><a href="/es/jugadores/94ecb655/Arbey-Mosquera">Arbey Mosquera</a> 2018&nbsp;· FW&nbsp;· La Equidad</p><p><a href="/es/jugadores/078882db/Carlos-Mosquera">Carlos Mosquera</a> 2017-2024&nbsp;· GK&nbsp;· Patriotas FC, Alianza Petrolera, Always Ready, Atlético Huila, Deportivo Pasto, Expreso Rojo</p><p><a href="/es/jugadores/2c422832/Cristian-Mosquera"><strong>Cristián Mosquera</strong></a> 2022-2025&nbsp;· MF&nbsp;· Fortaleza FC, Cortuluá</p><p><a href="/es/jugadores/33b8aafe/Dairon-Mosquera"><strong>Dairon Mosquera</strong></a> 2015-2025&nbsp;· DF&nbsp;· Santa Fe, Unión Magdalena, Independiente Medellín</p><p><a href="/es/jugadores/091b9eb8/Daniel-Mosquera"><strong>Daniel Mosquera</strong></a> 2021-2025&nbsp;· FW&nbsp;· Hellas Verona, América de Cali, Bucaramanga, Universidad Central</p><p><a href="/es/jugadores/72ed58c9/Daniel-Mosquera">Daniel Mosquera</a> 2016&nbsp;· DF</p><p><a href="/es/jugadores/41b3609b/Danilson-Mosquera">Danilson Mosquera</a> 2019&nbsp;· MF</p><p><a href="/es/jugadores/04db5ed4/Dayro-Mosquera">Dayro Mosquera</a> 2016-2018&nbsp;· MF&nbsp;· Leones FC, Atlético Nacional</p><p><a href="/es/jugadores/a01f3c7b/Duvan-Mosquera"><strong>Duván Mosquera</strong></a> 2023-2025&nbsp;· MF&nbsp;· Llaneros, Águilas Doradas</p><p><a href="/es/jugadores/dca8889e/Duvier-Mosquera">Duvier Mosquera</a> 2017-2018&nbsp;· Santa Fe</p><p><a href="/es/jugadores/15cda5f6/Edwin-Mosquera"><strong>Edwin Mosquera</strong></a> 2019-2025&nbsp;· MF&nbsp;· Atlanta United, Independiente Medellín, Aldosivi, Defensa y Justicia</p><p><a href="/es/jugadores/742b04ff/Elkin-Mosquera">Elkin Mosquera</a> 2015-2023&nbsp;· DF&nbsp;· Boyacá Chicó, Jaguares de Córdoba, Independiente Medellín, Deportes Tolima</p><p><a href="/es/jugadores/d95cd1eb/Elvis-Mosquera"><strong>Elvis Mosquera</strong></a> 2014-2023&nbsp;· DF&nbsp;· Once Caldas, América de Cali, Envigado FC, La Equidad, Independiente Medellín, Águilas Doradas, Jagu</p><p><a href="/es/jugadores/ce9f7066/Fabian-Mosquera"><strong>Fabián Mosquera</strong></a> 2017-2025&nbsp;· DF,MF&nbsp;· Deportes Tolima, Jaguares de Córdoba, Expreso Rojo</p><p><a href="/es/jugadores/ff480f8a/Felipe-Mosquera"><strong>Felipe Mosquera</strong></a> 2022-2025&nbsp;· MF&nbsp;· Deportivo Pereira, América de Cali, Jaguares de Córdoba, Alianza Petrolera</p><p><a href="/es/jugadores/55b0aa01/Franklin-Mosquera"><strong>Franklin Mosquera</strong></a> 2022-2025&nbsp;· GK&nbsp;· Deportivo Pereira</p><p><a href="/es/jugadores/d9392cf2/Freddy-Mosquera">Freddy Mosquera</a> 2020-2021&nbsp;· GK</p><p><a href="/es/jugadores/9cacb8e1/Andres-Mosquera-Guardia"><strong>Andrés Mosquera Guardia</strong></a> 2015-2025&nbsp;· DF&nbsp;· América de Cali, Independiente Medellín, León, Toluca</p><p><a href="/es/jugadores/ed45c6fb/Hanyer-Mosquera">Hanyer Mosquera</a> 2012-2021&nbsp;· DF&nbsp;· Águilas Doradas, Deportes Quindío, La Equidad, Portland Timbers, Once Caldas, Cúcuta Deportivo, Alia</p><p><a href="/es/jugadores/a70e9b7e/Heiler-Mosquera">Heiler Mosquera</a> 2023&nbsp;· MF&nbsp;· Envigado FC</p><p><a href="/es/jugadores/be206004/Henry-Mosquera"><strong>Henry Mosquera</strong></a> 2022-2025&nbsp;· FW,MF&nbsp;· Red Bull Bragantino, Envigado FC</p><p><a href="/es/jugadores/ac4d978a/Jair-Mosquera">Jair Mosquera</a> 2015-2017&nbsp;· GK&nbsp;· Junior</p><p><a href="/es/jugadores/b6cd3e76/Jelinson-Mosquera">Jelinson Mosquera</a> 2016&nbsp;· FW</p><p><a href="/es/jugadores/5da52e88/Jherson-Mosquera"><strong>Jherson Mosquera</strong></a> 2020-2025&nbsp;· DF,MF&nbsp;· Independiente Medellín, Deportivo Pereira, Newell's Old Boys</p><p><a href="/es/jugadores/736157b7/Jhon-Mosquera"><strong>Jhon Mosquera</strong></a> 2014-2025&nbsp;· MF&nbsp;· Viktoria Plzeň, Dukla Prague, Bohemians 1905, Deportivo Cali, Atlético Nacional, Slovan Liberec</p><p><a href="/es/jugadores/7f323f98/Jhon-Mosquera">Jhon Mosquera</a> 2015-2019&nbsp;· FW&nbsp;· Águilas Doradas, Jaguares de Córdoba, Sport Boys</p><p><a href="/es/jugadores/4fa2e528/Jhonatan-Mosquera"><strong>Jhonatan Mosquera</strong></a> 2023-2024&nbsp;· DF&nbsp;· El Farolito</p><p><a href="/es/jugadores/c4ebf909/John-Mosquera">John Mosquera</a> 2005-2022&nbsp;· FW&nbsp;· Union Berlin, Royal Parí, SønderjyskE, Wacker Burghausen, Guabirá, Energie Cottbus, Always Ready, Gi</p><p><a href="/es/jugadores/fcc1ac2d/Jonny-Mosquera">Jonny Mosquera</a> 2013-2022&nbsp;· MF&nbsp;· Envigado FC, América de Cali, Livorno, Avaí, Cortuluá, Águilas Doradas</p><p><a href="/es/jugadores/3b67af18/Jorge-Mosquera">Jorge Mosquera</a> 2010-2011&nbsp;· FW&nbsp;· Deportivo Pasto, Paderborn 07, 2 de Mayo</p><p><a href="/es/jugadores/3b89ba2a/Juan-Mosquera">Juan Mosquera</a> 2015-2021&nbsp;· MF&nbsp;· Envigado FC, Bucaramanga</p><p><a href="/es/jugadores/e21931d8/Juan-Mosquera"><strong>Juan Mosquera</strong></a> 2021&nbsp;· DF&nbsp;· Deportivo Pereira</p><p><a href="/es/jugadores/60413431/Kleimar-Mosquera">Kleimar Mosquera</a> 2021-2023&nbsp;· DF&nbsp;· Jaguares de Córdoba</p><p><a href="/es/jugadores/45de7679/Andres-Mosquera-Marmolejo"><strong>Andrés Mosquera Marmolejo</strong></a> 2016-2025&nbsp;· GK&nbsp;· Santa Fe, Independiente Medellín, Deportivo Pasto, Bucaramanga</p><p><a href="/es/jugadores/63663a38/Carlos-Mosquera-Marmolejo">Carlos Mosquera Marmolejo</a> 2017-2021&nbsp;· GK</p><p><a href="/es/jugadores/787dfcb0/Miller-Mosquera">Miller Mosquera</a> 2014-2023&nbsp;· DF,GK&nbsp;· Patriotas FC, Atlético Nacional, Bucaramanga, La Equidad</p><p><a href="/es/jugadores/01eb50ee/Santiago-Mosquera"><strong>Santiago Mosquera</strong></a> 2025&nbsp;· MF&nbsp;· Deportivo Pereira</p><p><a href="/es/jugadores/41d46d40/Sebastian-Mosquera"><strong>Sebastián Mosquera</strong></a> 2025&nbsp;· FW&nbsp;· Millonarios</p><p><a href="/es/jugadores/95902737/Sergio-Mosquera"><strong>Sergio Mosquera</strong></a> 2015-2025&nbsp;· DF&nbsp;· Millonarios, Deportes Tolima, Envigado FC, Atlético Nacional</p><p><a href="/es/jugadores/fb5ddc09/Sergio-Mosquera">Sergio Mosquera</a> 2022&nbsp;· FW</p><p><a href="/es/jugadores/46a3c995/Stefano-Mosquera">Stefano Mosquera</a> 2017&nbsp;· DF</p><p><a href="/es/jugadores/23410ac7/Wilder-Mosquera">Wilder Mosquera</a> 2015-2021&nbsp;· GK&nbsp;· Jaguares de Córdoba, Atlético Huila, Cúcuta Deportivo</p><p><a href="/es/jugadores/2b1af1e9/Yan-Mosquera"><strong>Yan Mosquera</strong></a> 2024&nbsp;· FW</p><p><a href="/es/jugadores/49d1b030/Yeiler-Mosquera"><strong>Yéiler Mosquera</strong></a> 2023-2024&nbsp;· DF&nbsp;· Boyacá Chicó</p><p><a href="/es/jugadores/7f13c388/Yeimar-Mosquera"><strong>Yeimar Mosquera</strong></a> 2024-2025&nbsp;· DF&nbsp;· Aston Villa U21</p><p><a href="/es/jugadores/3a8e501f/Yeison-Mosquera">Yeison Mosquera</a> 2016&nbsp;· FW</p><p><a href="/es/jugadores/1e159d70/Yerson-Mosquera"><strong>Yerson Mosquera</strong></a> 2020-2026&nbsp;· DF&nbsp;· Wolverhampton Wanderers, FC Cincinnati, Atlético Nacional, Villarreal, Wolverhampton Wanderers U23, </p><p><a href="/es/jugadores/da22887c/Yilmar-Mosquera">Yilmar Mosquera</a> 2015-2016&nbsp;· GK</p><p><a href="/es/jugadores/520f5981/Yilson-Mosquera"><strong>Yilson Mosquera</strong></a> 2021-2024&nbsp;· DF&nbsp;· Envigado FC, Jaguares de Córdoba</p><p><a href="/es/jugadores/a5b660fe/Yohn-Mosquera">Yohn Mosquera</a> 2014-2019&nbsp;· MF&nbsp;· Águilas Doradas, Jaguares de Córdoba, Independiente Medellín</p><p><a href="/es/jugadores/0727631f/Yoni-Mosquera">Yoni Mosquera</a> 2022-2023&nbsp;· MF&nbsp;· Águilas Doradas</p><p><a href="/es/jugadores/e116737f/Yuber-Mosquera">Yuber Mosquera</a> 2015-2023&nbsp;· DF&nbsp;· Universidad Católica, Deportivo Táchira, Atlético Huila, Deportivo Lara</p><p><a href="/es/jugadores/e80b8557/Johnny-Mostasilla">Johnny Mostasilla</a> 2015-2019&nbsp;· DF&nbsp;· Boyacá Chicó, Oriente Petrolero, Deportes Tolima</p><p><a href="/es/jugadores/9dae2135/Stalin-Motta">Stalin Motta</a> 2014-2022&nbsp;· MF&nbsp;· La Equidad, Atlético Nacional, Barcelona</p><p><a href="/es/jugadores/9655be06/Edwin-Movil">Edwin Móvil</a> 2015-2020&nbsp;· MF&nbsp;· Boyacá Chicó, Cúcuta Deportivo, Deportivo Pereira</p><p><a href="/es/jugadores/319fb87a/Oscar-Movil">Oscar Móvil</a> 2015&nbsp;· FW&nbsp;· Boyacá Chicó, Ayacucho</p><p><a href="/es/jugadores/01a1b868/Cristian-Moya">Cristian Moya</a> 2016-2022&nbsp;· MF&nbsp;· Atlético Nacional, Jaguares de Córdoba</p><p><a href="/es/jugadores/57cbdb1d/Jose-Moya"><strong>José Moya</strong></a> 2016-2025&nbsp;· DF&nbsp;· Deportivo Pereira, Santa Fe, Deportes Tolima, Guaraní, Cortuluá, Huracán</p><p><a href="/es/jugadores/f2b170ae/Jose-Mulato"><strong>José Mulato</strong></a> 2020-2025&nbsp;· FW&nbsp;· Spartak Subotica, San Antonio FC, FC Dallas, Deportivo Cali</p><p><a href="/es/jugadores/c47e25d4/Carlos-Munera">Carlos Múnera</a> 2015&nbsp;· MF&nbsp;· Atlético Nacional</p><p><a href="/es/jugadores/f754b237/Eder-Muniver">Eder Muniver</a> 2021-2023&nbsp;· MF&nbsp;· Envigado FC, Unión Magdalena, Atlético Huila</p><p><a href="/es/jugadores/778ef829/Daniel-Munoz"><strong>Daniel Muñoz</strong></a> 2017-2026&nbsp;· DF,MF&nbsp;· Crystal Palace, Genk, Águilas Doradas, Colombia, Atlético Nacional</p><p><a href="/es/jugadores/cc850aa0/Jesus-Munoz"><strong>Jesús Muñoz</strong></a> 2022-2025&nbsp;· MF&nbsp;· Alianza Petrolera</p><p><a href="/es/jugadores/d079c317/Jhonathan-Munoz">Jhonathan Muñoz</a> 2015-2021&nbsp;· DF&nbsp;· Cortuluá, Boyacá Chicó, Once Caldas</p><p><a href="/es/jugadores/268953e4/Johan-Munoz">Johan Muñoz</a> 2017&nbsp;· MF&nbsp;· Expreso Rojo</p><p><a href="/es/jugadores/cf21f93e/Mateo-Munoz">Mateo Muñoz</a> 2018-2019&nbsp;· MF&nbsp;· Leones FC, Cúcuta Deportivo</p><p><a href="/es/jugadores/f1331020/Santiago-Munoz">Santiago Múñoz</a> 2018-2023&nbsp;· FW&nbsp;· Envigado FC, Once Caldas</p><p><a href="/es/jugadores/f72fa297/Nicolas-Murcia">Nicolás Murcia</a> 2018&nbsp;· MF&nbsp;· Millonarios</p><p><a href="/es/jugadores/cca0d673/Juan-Muriel"><strong>Juan Muriel</strong></a> 2015-2024&nbsp;· DF&nbsp;· Estudiantes de Mérida, Caracas, Internacional de Barinas, Deportivo Pasto</p><p><a href="/es/jugadores/eb2fe5b6/Luis-Muriel"><strong>Luis Muriel</strong></a> 2010-2025&nbsp;· FW&nbsp;· Orlando City, Atalanta, Sampdoria, Sevilla, Udinese, Colombia, Lecce, Fiorentina, Deportivo Cali, Gr</p><p><a href="/es/jugadores/9d185a7f/Andres-Murillo"><strong>Andrés Murillo</strong></a> 2015-2024&nbsp;· DF&nbsp;· La Equidad, Millonarios, Deportivo Táchira</p><p><a href="/es/jugadores/4396dc9c/Brayan-Murillo"><strong>Brayan Murillo</strong></a> 2024-2025&nbsp;· DF&nbsp;· Envigado FC</p><p><a href="/es/jugadores/57ab1af4/Daniel-Murillo">Daniel Murillo</a> 2018-2019&nbsp;· GK</p><p><a href="/es/jugadores/86a38abb/Daniel-Murillo">Daniel Murillo</a> 2016-2024&nbsp;· DF</p><p><a href="/es/jugadores/410f8bdc/David-Murillo"><strong>David Murillo</strong></a> 2015-2025&nbsp;· DF&nbsp;· Unión Magdalena, Junior, Once Caldas, Boyacá Chicó, Deportivo Pereira</p><p><a href="/es/jugadores/a8c23e09/Elkin-Murillo">Elkin Murillo</a> 2003&nbsp;· MF&nbsp;· Atlético Nacional, LDU Quito, Deportes Quindío, Técnico Universitario, Deportes Tolima, Sporting Cri</p><p><a href="/es/jugadores/65f57d87/Ewil-Murillo"><strong>Ewil Murillo</strong></a> 2020-2025&nbsp;· MF&nbsp;· Santa Fe, Deportivo Pereira, Atlético Nacional</p><p><a href="/es/jugadores/997816fb/Guillermo-Murillo">Guillermo Murillo</a> 2017-2022&nbsp;· FW&nbsp;· Cortuluá, Santa Fe, América de Cali</p><p><a href="/es/jugadores/9bb72128/Hilton-Murillo">Hilton Murillo</a> 2015-2016&nbsp;· MF&nbsp;· Deportes Quindío, Águilas Doradas, Deportes Tolima</p><p><a href="/es/jugadores/4f0cf249/Jefferson-Murillo"><strong>Jefferson Murillo</strong></a> 2015-2020&nbsp;· FW,MF&nbsp;· Deportivo Cali, Veracruz, Cúcuta Deportivo, América de Cali</p><p><a href="/es/jugadores/b233e8e4/Jeison-Murillo"><strong>Jeison Murillo</strong></a> 2012-2023&nbsp;· DF&nbsp;· Celta Vigo, Internazionale, Granada, Las Palmas, Sampdoria, Colombia, Valencia, Barcelona</p><p><a href="/es/jugadores/fc91c060/Jesus-Murillo">Jesús Murillo</a> 2018-2023&nbsp;· DF&nbsp;· Patriotas FC, Jaguares de Córdoba, Deportivo Pereira</p><p><a href="/es/jugadores/2b587e53/John-Murillo">John Murillo</a> 2021&nbsp;· GK</p><p><a href="/es/jugadores/8849cb12/Jorge-Murillo"><strong>Jorge Murillo</strong></a> 2020-2024&nbsp;· MF&nbsp;· Deportivo Pereira, El Farolito</p><p><a href="/es/jugadores/c23122c9/Manuel-Murillo">Manuel Murillo</a> 2016-2018&nbsp;· FW&nbsp;· Portuguesa, Trujillanos</p><p><a href="/es/jugadores/372c2df8/Oscar-Murillo">Óscar Murillo</a> 2014-2023&nbsp;· DF&nbsp;· Pachuca, Atlético Nacional, Deportes Quindío, Colombia, Deportivo Pereira</p><p><a href="/es/jugadores/4e1cd80c/Raul-Murillo">Raúl Murillo</a> 2015&nbsp;· DF</p><p><a href="/es/jugadores/9f447d98/Roger-Murillo"><strong>Roger Murillo</strong></a> 2020-2024&nbsp;· FW&nbsp;· Fortaleza FC, Deportivo Cali</p><p><a href="/es/jugadores/8ec7a0db/Wilson-Murillo">Wilson Murillo</a> 2017&nbsp;· MF&nbsp;· Atlético Socopó</p><p><a href="/es/jugadores/52f63ca1/Yair-Murillo">Yair Murillo</a> 2018&nbsp;· MF</p><p><a href="/es/jugadores/80620663/Yaison-Murillo"><strong>Yaison Murillo</strong></a> 2024-2025&nbsp;· DF&nbsp;· Deportivo Riestra</p><p><a href="/es/jugadores/f03b08d5/Yonatan-Murillo"><strong>Yonatan Murillo</strong></a> 2015-2025&nbsp;· DF&nbsp;· Sport Huancayo, Binacional, Envigado FC, Patriotas FC, La Equidad, Atlético Huila, Once Caldas, Jagu</p><p><a href="/es/jugadores/4e06a832/Francisco-Najera">Francisco Nájera</a> 2006-2018&nbsp;· DF&nbsp;· Atlético Nacional, Santa Fe, Club Olimpia, La Equidad, Unión Española, Querétaro</p><p><a href="/es/jugadores/4fddece0/Jose-Najera">José Nájera</a> 2016&nbsp;· MF&nbsp;· Real Cartagena, La Equidad</p><p><a href="/es/jugadores/31e85493/Javier-Narvaez">Javier Narváez</a> 2023&nbsp;· FW&nbsp;· Jaguares de Córdoba</p><p><a href="/es/jugadores/485e4939/Juanjo-Narvaez"><strong>Juanjo Narváez</strong></a> 2013-2024&nbsp;· FW,MF&nbsp;· Zaragoza, Cartagena, Almería, Las Palmas, Córdoba, Leganés, Betis, Valladolid, Real Madrid Castilla</p><p><a href="/es/jugadores/f22b3f46/Luis-Narvaez">Luis Narváez</a> 2015-2019&nbsp;· MF&nbsp;· Junior, Cúcuta Deportivo</p><p><a href="/es/jugadores/6acc0b39/Efrain-Navarro"><strong>Efraín Navarro</strong></a> 2018-2025&nbsp;· DF&nbsp;· Alianza Petrolera, Bucaramanga</p><p><a href="/es/jugadores/6b7baf49/Franklin-Navarro"><strong>Franklin Navarro</strong></a> 2022-2025&nbsp;· FW&nbsp;· Unión Magdalena, Carabobo</p><p><a href="/es/jugadores/bff517d0/Gerson-Navarro">Gerson Navarro</a> 2018&nbsp;· DF&nbsp;· Boyacá Chicó</p><p><a href="/es/jugadores/5dfc9034/Carlos-Navarro-Montoya">Carlos Navarro Montoya</a> 1996-1999&nbsp;· GK&nbsp;· Chacarita Juniors, Independiente, Gimnasia y Esgrima (LP), Mérida, Extremadura, Nueva Chicago, Tener</p><p><a href="/es/jugadores/fbfe2f6b/Rafael-Navarro">Rafael Navarro</a> 2020-2021&nbsp;· MF&nbsp;· Deportivo Pereira</p><p><a href="/es/jugadores/e5cf6aeb/Sander-Navarro"><strong>Sander Navarro</strong></a> 2023-2025&nbsp;· DF&nbsp;· Millonarios</p><p><a href="/es/jugadores/4e2c6749/Sebastian-Navarro"><strong>Sebastián Navarro</strong></a> 2024-2025&nbsp;· MF&nbsp;· América de Cali, Fortaleza FC</p><p><a href="/es/jugadores/8fefde24/Jhon-Navia"><strong>Jhon Navia</strong></a> 2024-2025&nbsp;· DF&nbsp;· Junior</p><p><a href="/es/jugadores/0ce4ac74/Cristian-Nazarit">Cristian Nazarit</a> 2011-2017&nbsp;· FW&nbsp;· Santa Fe, Deportivo Pasto, Deportivo Cali, Águilas Doradas, Independiente Medellín, Chicago Fire, Am</p><p><a href="/es/jugadores/49d6d3ce/Miguel-Nazarit">Miguel Nazarit</a> 2017-2022&nbsp;· DF&nbsp;· Once Caldas, Deportivo Cali, Inter Turku, Santa Fe</p><p><a href="/es/jugadores/fd2a4f6c/Juan-Nazarith">Juan Nazarith</a> 2023&nbsp;· FW</p><p><a href="/es/jugadores/807cdab4/Franco-Neira"><strong>Franco Neira</strong></a> 2024&nbsp;· MF</p><p><a href="/es/jugadores/fe504667/Juan-Nieto"><strong>Juan Nieto</strong></a> 2015-2025&nbsp;· MF&nbsp;· Deportes Tolima, Atlético Nacional, Alianza Petrolera, Once Caldas</p><p><a href="/es/jugadores/99297d4d/Kevin-Nieto">Kevin Nieto</a> 2015&nbsp;· FW</p><p><a href="/es/jugadores/14384294/Juan-Nieva"><strong>Juan Nieva</strong></a> 2018-2024&nbsp;· MF&nbsp;· América de Cali, Deportivo Pasto</p><p><a href="/es/jugadores/255064c5/Armando-Nieves">Armando Nieves</a> 2014-2015&nbsp;· DF&nbsp;· Junior</p><p><a href="/es/jugadores/5785bc52/Eduardo-Nino">Eduardo Niño</a> 1990&nbsp;· GK</p><p><a href="/es/jugadores/ef84c56f/Felix-Noguera">Félix Noguera</a> 2015-2017&nbsp;· DF&nbsp;· Deportes Tolima, Deportivo Pereira, Junior, Santa Fe</p><p><a href="/es/jugadores/970b7db1/Santiago-Norena"><strong>Santiago Noreña</strong></a> 2018-2024&nbsp;· DF&nbsp;· Envigado FC</p><p><a href="/es/jugadores/ebaa3683/Diego-Novoa"><strong>Diego Novoa</strong></a> 2015-2025&nbsp;· GK&nbsp;· Millonarios, La Equidad, América de Cali</p><p><a href="/es/jugadores/16f4fb02/Jeysen-Nunez">Jeysen Núñez</a> 2015-2019&nbsp;· MF&nbsp;· Boyacá Chicó, Cúcuta Deportivo, Carabobo, Jaguares de Córdoba, Deportivo Pasto, Unión Comercio</p><p><a href="/es/jugadores/c2858ed3/Kevin-Nunez">Kevin Núñez</a> 2021&nbsp;· MF</p><p><a href="/es/jugadores/9ff55b56/Luis-Nunez">Luis Núñez</a> 2015&nbsp;· MF&nbsp;· Uniautónoma FC</p><p><a href="/es/jugadores/a72bcaf1/Henry-Obando">Henry Obando</a> 2015-2021&nbsp;· DF&nbsp;· Deportes Tolima, Bucaramanga, Cúcuta Deportivo, Alianza Petrolera</p><p><a href="/es/jugadores/1441ea27/Fausto-Obeso">Fausto Obeso</a> 2015-2016&nbsp;· DF&nbsp;· Deportivo Pasto, Boyacá Chicó, Jaguares de Córdoba, Once Caldas</p><p><a href="/es/jugadores/df79a000/Jhon-Obregon">Jhon Obregón</a> 2016-2018&nbsp;· FW&nbsp;· Ayacucho, Boyacá Chicó</p><p><a href="/es/jugadores/8017a694/Jorge-Obregon"><strong>Jorge Obregón</strong></a> 2015-2024&nbsp;· FW&nbsp;· Rijeka, Varaždin, Deportivo Municipal, Santa Fe, Jaguares de Córdoba</p><p><a href="/es/jugadores/1471b2a8/Jader-Obrian"><strong>Jáder Obrian</strong></a> 2015-2025&nbsp;· FW,MF&nbsp;· Austin FC, FC Dallas, Águilas Doradas, Deportes Tolima, Uniautónoma FC</p><p><a href="/es/jugadores/a2484ef5/Edier-Ocampo"><strong>Édier Ocampo</strong></a> 2023-2025&nbsp;· DF&nbsp;· Vancouver Whitecaps FC, Atlético Nacional</p><p><a href="/es/jugadores/8903f31c/Esteban-Ocampo">Esteban Ocampo</a> 2017-2019&nbsp;· MF</p><p><a href="/es/jugadores/cec550a2/Deiby-Ochoa"><strong>Deiby Ochoa</strong></a> 2022-2025&nbsp;· DF&nbsp;· Real Ávila CF, Arandina</p><p><a href="/es/jugadores/124e0430/Deiro-Ochoa"><strong>Deiro Ochoa</strong></a> 2025&nbsp;· Envigado FC</p><p><a href="/es/jugadores/92c0df50/Juan-Ochoa">Juan Ochoa</a> 2017-2018&nbsp;· DF&nbsp;· Envigado FC</p><p><a href="/es/jugadores/5f0a3d59/Lewis-Ochoa">Lewis Ochoa</a> 2014-2019&nbsp;· DF&nbsp;· Millonarios, Atlético Huila, Independiente Medellín, Bucaramanga, Once Caldas, Junior</p><p><a href="/es/jugadores/351315b6/Daniel-Ojeda">Daniel Ojeda</a> 2008&nbsp;· DF&nbsp;· Puerto Rico Islanders</p><p><a href="/es/jugadores/80f84307/Daniel-Ojeda">Daniel Ojeda</a> 2024&nbsp;· DF</p><p><a href="/es/jugadores/807d2bac/Jamison-Olave">Jámison Olave</a> 2008-2016&nbsp;· DF&nbsp;· Real Salt Lake, Deportivo Cali, New York Red Bulls</p><p><a href="/es/jugadores/4d54c92e/Auli-Oliveros"><strong>Auli Oliveros</strong></a> 2020-2025&nbsp;· MF&nbsp;· Águilas Doradas, Cúcuta Deportivo, Santa Fe</p><p><a href="/es/jugadores/39383556/Carlos-Ordonez"><strong>Carlos Ordóñez</strong></a> 2021-2025&nbsp;· DF&nbsp;· Progreso, Envigado FC, Sportivo Trinidense</p><p><a href="/es/jugadores/614a23a3/Diego-Ordonez-Copete">Diego Ordoñez Copete</a> 2019&nbsp;· DF&nbsp;· Once Caldas, Jaguares de Córdoba</p><p><a href="/es/jugadores/d0833e8d/Janer-Ordonez"><strong>Janer Ordóñez</strong></a> 2017-2025&nbsp;· DF&nbsp;· Yaracuyanos FC</p><p><a href="/es/jugadores/f1426793/Michael-Ordonez">Michael Ordoñez</a> 2015-2021&nbsp;· MF&nbsp;· Atlético Huila, Patriotas FC, Deportivo Pasto, Once Caldas, Deportivo Pereira, Sport Boys Warnes</p><p><a href="/es/jugadores/f1cca481/Willian-Ordonez"><strong>Willian Ordóñez</strong></a> 2021-2025&nbsp;· MF&nbsp;· Deportivo Pasto, Atlético Huila</p><p><a href="/es/jugadores/5394f040/Eder-Orjuela"><strong>Eder Orjuela</strong></a> 2023-2024&nbsp;· GK&nbsp;· Boyacá Chicó</p><p><a href="/es/jugadores/17335d85/Luis-Orlando-Hurtado"><strong>Luis Orlando Hurtado</strong></a> 2016-2019&nbsp;· FW&nbsp;· Águilas Doradas, Bucaramanga</p><p><a href="/es/jugadores/31035690/Jose-Orlando-Perez">José Orlando Pérez</a> 2016-2023&nbsp;· DF&nbsp;· Jaguares de Córdoba, Cúcuta Deportivo, Técnico Universitario</p><p><a href="/es/jugadores/b10ce6ce/Jamell-Orlando-Ramos">Jamell Orlando Ramos</a> 2015&nbsp;· DF&nbsp;· Independiente Medellín, Once Caldas, Cúcuta Deportivo, Deportivo Cali, Club Olimpia, Junior, Deporti</p><p><a href="/es/jugadores/96f66ca8/Javier-Orobio">Javier Orobio</a> 2016-2019&nbsp;· GK&nbsp;· Portuguesa</p><p><a href="/es/jugadores/0c7c7f49/Andres-Orozco">Andrés Orozco</a> 2004-2017&nbsp;· DF&nbsp;· Envigado FC, Sinaloa, Racing Club, Atlético Nacional, Morelia, Internacional</p><p><a href="/es/jugadores/e5e78d3e/Brayan-Orozco">Brayan Orozco</a> 2019-2021&nbsp;· MF&nbsp;· Atlético Huila</p><p><a href="/es/jugadores/019370f7/Esteban-Orozco">Esteban Orozco</a> 2016-2018&nbsp;· DF&nbsp;· Águilas Doradas</p><p><a href="/es/jugadores/60d4f6bb/Pablo-Orozco-Isaza">Pablo Orozco Isaza</a> 2015-2016&nbsp;· DF</p><p><a href="/es/jugadores/95f89963/Laura-Orozco">Laura Orozco</a> 2019&nbsp;· MF</p><p><a href="/es/jugadores/6eeab3b2/Santiago-Orozco"><strong>Santiago Orozco</strong></a> 2020-2025&nbsp;· MF&nbsp;· La Equidad, Alianza Petrolera, Patriotas FC, Deportivo Pasto</p><p><a href="/es/jugadores/e71f4dbd/Yeiner-Orozco">Yeiner Orozco</a> 2019&nbsp;· MF&nbsp;· Alianza Petrolera</p><p><a href="/es/jugadores/b0c7fd93/Edwin-Ortega">Edwin Ortega</a> 2019&nbsp;· GK</p><p><a href="/es/jugadores/e5d46564/Michael-Ortega"><strong>Michael Ortega</strong></a> 2010-2025&nbsp;· MF&nbsp;· Aurora, The Strongest, Deportivo Cali, Junior, Once Caldas, Atlas, Deportivo Pasto, Bochum, Bayer Le</p><p><a href="/es/jugadores/a87ce679/Rafael-Ortega">Rafael Ortega</a> 2018&nbsp;· MF</p><p><a href="/es/jugadores/e3116e41/Yonaider-Ortega">Yonaider Ortega</a> 2015&nbsp;· DF&nbsp;· Águilas Doradas, Jaguares de Córdoba</p><p><a href="/es/jugadores/e98d36b9/Breiner-Ortiz">Bréiner Ortiz</a> 2012-2013&nbsp;· MF&nbsp;· Carolina RailHawks</p><p><a href="/es/jugadores/5d7e1e31/Dilan-Ortiz"><strong>Dilan Ortíz</strong></a> 2025&nbsp;· DF&nbsp;· Unión Magdalena</p><p><a href="/es/jugadores/db354046/Dilan-Ortiz"><strong>Dilan Ortiz</strong></a> 2019-2025&nbsp;· FW&nbsp;· Radnički Kragujevac, Mladost Lučani, Mačva Šabac, Proleter Novi Sad, Slaven Belupo, Ufa, Čukarički</p><p><a href="/es/jugadores/17695ed9/Domingo-Ortiz">Domingo Ortíz</a> 2016-2017&nbsp;· FW&nbsp;· La Equidad</p><p><a href="/es/jugadores/ea1acb28/Javier-Ortiz">Javier Ortíz</a> 2021-2022&nbsp;· MF&nbsp;· América de Cali</p><p><a href="/es/jugadores/8604fb0b/Jerry-Ortiz">Jerry Ortiz</a> 2015-2018&nbsp;· MF&nbsp;· Envigado FC, Once Caldas, Atlético Huila, Harrisburg City Islanders, Cortuluá</p><p><a href="/es/jugadores/7e0815bc/Jose-Ortiz"><strong>José Ortiz</strong></a> 2017-2025&nbsp;· DF&nbsp;· Independiente Medellín, Deportivo Pasto, Santa Fe, Junior, Mazatlán, Morelia</p><p><a href="/es/jugadores/99fc44eb/Jhon-Ortiz-Manriquez">Jhon Ortíz Manríquez</a> 2019-2021&nbsp;· MF</p><p><a href="/es/jugadores/07fa6716/Manuel-Ortiz">Manuel Ortiz</a> 2022-2024&nbsp;· GK</p><p><a href="/es/jugadores/5ed4bf70/Melissa-Ortiz">Melissa Ortiz</a> 2012&nbsp;· FW</p><p><a href="/es/jugadores/83817495/Nestor-Ortiz">Néstor Ortiz</a> 1994&nbsp;· DF</p><p><a href="/es/jugadores/daf2b2ad/Pablo-Ortiz"><strong>Pablo Ortiz</strong></a> 2020-2024&nbsp;· DF&nbsp;· América de Cali, FK Pardubice, Midtjylland</p><p><a href="/es/jugadores/515e09a7/Daniel-Osorio">Daniel Osorio</a> 2018&nbsp;· DF&nbsp;· Leones FC</p><p><a href="/es/jugadores/72ada906/Humberto-Osorio"><strong>Humberto Osorio</strong></a> 2013-2023&nbsp;· FW&nbsp;· Jorge Wilstermann, San Martín de San Juan, Águilas Doradas, Ayacucho, Santa Fe, América de Cali, Mil</p><p><a href="/es/jugadores/40f9dd3b/Joan-Osorio">Joan Osorio</a> 2022&nbsp;· MF&nbsp;· Deportivo Pereira</p><p><a href="/es/jugadores/00ef2d26/Joiner-Osorio">Joiner Osorio</a> 2016&nbsp;· MF</p><p><a href="/es/jugadores/1247ace9/Kelvin-Osorio"><strong>Kelvin Osorio</strong></a> 2015-2025&nbsp;· MF&nbsp;· Deportivo Pereira, Santa Fe, Patriotas FC, Deportivo Cali, Cortuluá, Cuiabá, Mushuc Runa</p><p><a href="/es/jugadores/2e161fbe/Sebastian-Osorio">Sebastián Osorio</a> 2016&nbsp;· MF&nbsp;· Fortaleza FC</p><p><a href="/es/jugadores/d543fb48/Jeronimo-Osorno">Jeronimo Osorno</a> 2023&nbsp;· GK</p><p><a href="/es/jugadores/82b1198a/David-Ospina"><strong>David Ospina</strong></a> 2008-2026&nbsp;· GK&nbsp;· Atlético Nacional, Nice, Napoli, Colombia, Arsenal, Al-Nassr</p><p><a href="/es/jugadores/42f7baea/Diana-Ospina">Diana Ospina</a> 2011-2023&nbsp;· MF&nbsp;· Colombia</p><p><a href="/es/jugadores/3724b8c1/Juan-Ospina"><strong>Juan Ospina</strong></a> 2020-2021&nbsp;· MF&nbsp;· Independiente Medellín</p><p><a href="/es/jugadores/972a1c60/Luciano-Ospina">Luciano Ospina</a> 2015-2024&nbsp;· DF&nbsp;· Alianza Petrolera, Fortaleza FC, Huracán, Boyacá Chicó</p><p><a href="/es/jugadores/75647efa/Neider-Ospina"><strong>Néider Ospina</strong></a> 2023-2025&nbsp;· FW&nbsp;· Orense, Deportivo Cali</p><p><a href="/es/jugadores/54570516/Miguel-Ospino">Miguel Ospino</a> 2019&nbsp;· GK</p><p><a href="/es/jugadores/1e96147e/Alexis-Ossa">Alexis Ossa</a> 2015-2016&nbsp;· MF&nbsp;· Cúcuta Deportivo, Llaneros</p><p><a href="/es/jugadores/88e9da40/Juan-Ostos"><strong>Juan Ostos</strong></a> 2023-2024&nbsp;· MF&nbsp;· Boyacá Chicó</p><p><a href="/es/jugadores/892d0071/David-Otalvaro">David Otálvaro</a> 2016&nbsp;· DF</p><p><a href="/es/jugadores/7344079c/Harrison-Otalvaro">Harrison Otálvaro</a> 2006-2021&nbsp;· MF&nbsp;· Millonarios, América de Cali, León de Huánuco, Once Caldas, Cúcuta Deportivo, Atlético Nacional, Dep</p><p><a href="/es/jugadores/92611ae3/Juan-Otalvaro">Juan Otálvaro</a> 2017-2023&nbsp;· MF&nbsp;· Águilas Doradas, Deportivo Pasto</p><p><a href="/es/jugadores/0d0113e7/Sergio-Otalvaro"><strong>Sergio Otálvaro</strong></a> 2015-2024&nbsp;· DF&nbsp;· Club Olimpia, Santa Fe, Deportes Tolima, Junior, Nacional, Sportivo Luqueño</p><p><a href="/es/jugadores/18b757b7/Alejandro-Otero">Alejandro Otero</a> 2015-2019&nbsp;· GK&nbsp;· Deportes Quindío, Patriotas FC, Bucaramanga</p><p><a href="/es/jugadores/92b4721f/Antony-Otero">Antony Otero</a> 2016-2022&nbsp;· FW&nbsp;· Leones FC, Santa Fe, Águilas Doradas</p><p><a href="/es/jugadores/7eee4112/Willian-Ovalle">Willian Ovalle</a> 2023-2024&nbsp;· MF&nbsp;· Santa Fe</p><p><a href="/es/jugadores/742105cb/Frankie-Oviedo">Frankie Oviedo</a> 2003-2007&nbsp;· MF&nbsp;· América, Puebla, Boyacá Chicó, Necaxa, Pachuca</p><p><a href="/es/jugadores/35fc9029/Oscar-Oviedo">Oscar Oviedo</a> 2015-2016&nbsp;· FW</p><p><a href="/es/jugadores/f0848ae1/Juan-Pablo-Angel">Juan Pablo Ángel</a> 2000-2014&nbsp;· FW&nbsp;· Aston Villa, New York Red Bulls, Atlético Nacional, Chivas USA, LA Galaxy</p><p><a href="/es/jugadores/596ba335/Juan-Pablo-Pino">Juan Pablo Pino</a> 2006-2016&nbsp;· FW,MF&nbsp;· Monaco, Independiente Medellín, Galatasaray, Al-Nassr, Universitario, Bastia, Charleroi, Olympiacos</p><p><a href="/es/jugadores/20a17a29/Juan-Pablo-Ramirez">Juan Pablo Ramírez</a> 2016-2022&nbsp;· MF&nbsp;· Atlético Nacional, América (MG), Bahia, Deportivo Pasto, Leones FC</p><p><a href="/es/jugadores/12d9e631/Juan-Pablo-Zuluaga"><strong>Juan Pablo Zuluaga</strong></a> 2016-2025&nbsp;· DF,MF&nbsp;· Operário, Jaguares de Córdoba, Deportivo Pereira, Santa Fe, Bucaramanga, Petare, América de Cali, In</p><p><a href="/es/jugadores/4eb45683/Dorlan-Pabon"><strong>Dorlan Pabón</strong></a> 2012-2025&nbsp;· FW,MF&nbsp;· Envigado FC, Monterrey, Atlético Nacional, Betis, Valencia, Parma, São Paulo, Colombia</p><p><a href="/es/jugadores/4f612f54/Ronaldo-Pabon"><strong>Ronaldo Pabón</strong></a> 2021&nbsp;· FW&nbsp;· Yaracuyanos FC</p><p><a href="/es/jugadores/2fc79121/Sergio-Pabon">Sergio Pabón</a> 2018-2019&nbsp;· GK</p><p><a href="/es/jugadores/af8493da/Frank-Pacheco">Frank Pacheco</a> 2015&nbsp;· MF&nbsp;· Deportivo Pasto, Boyacá Chicó, Real Cartagena, La Equidad, Atlético Huila, Club Olimpo, América de C</p><p><a href="/es/jugadores/5e9d0e32/Luis-Alberto-Garcia-Pacheco">Luis Alberto García Pacheco</a> 2016-2023&nbsp;· GK&nbsp;· Ponferradina</p><p><a href="/es/jugadores/4b1869ba/Victor-Pacheco">Víctor Pacheco</a> 2003-2006&nbsp;· MF&nbsp;· Atlante, Boyacá Chicó, América de Cali, Bucaramanga, Junior, Deportivo Pasto</p><p><a href="/es/jugadores/69e016b7/Walmer-Pacheco"><strong>Walmer Pacheco</strong></a> 2015-2025&nbsp;· DF,MF&nbsp;· Deportivo Pereira, La Equidad, Junior, Uniautónoma FC</p><p><a href="/es/jugadores/bfae96a3/Julian-Pachon">Julián Pachón</a> 2015&nbsp;· DF&nbsp;· Real Cartagena, Boyacá Chicó</p><p><a href="/es/jugadores/2a8ba339/Alfredo-Padilla">Alfredo Padilla</a> 2017&nbsp;· FW&nbsp;· Junior, Metropolitanos, Boyacá Chicó, Atlético Huila</p><p><a href="/es/jugadores/e7139043/Kevin-Padilla"><strong>Kevin Padilla</strong></a> 2022-2024&nbsp;· MF&nbsp;· Jaguares de Córdoba, Fortaleza FC, Junior</p><p><a href="/es/jugadores/4445281f/Cristian-Paez">Cristian Páez</a> 2020-2021&nbsp;· FW&nbsp;· Boyacá Chicó</p><p><a href="/es/jugadores/caca94f5/Diego-Paez">Diego Paez</a> 2021-2024&nbsp;· DF&nbsp;· Maldonado</p><p><a href="/es/jugadores/d73e5fdf/Carlos-Pajaro"><strong>Carlos Pájaro</strong></a> 2019-2024&nbsp;· DF&nbsp;· Jaguares de Córdoba, Once Caldas</p><p><a href="/es/jugadores/ee2b4146/Miguel-Pajaro"><strong>Miguel Pajaro</strong></a> 2025&nbsp;· DF&nbsp;· AV Alta FC</p><p><a href="/es/jugadores/4ac2b0a5/Ronaldo-Pajaro"><strong>Ronaldo Pájaro</strong></a> 2024-2025&nbsp;· MF&nbsp;· Fortaleza FC</p><p><a href="/es/jugadores/2e46b7e3/Jhon-Pajoy"><strong>Jhon Pajoy</strong></a> 2013-2024&nbsp;· FW,MF&nbsp;· Once Caldas, Atlético Nacional, Junior, Santa Fe, Al-Hazem, Puebla, Bucaramanga, Deportivo Pasto, In</p><p><a href="/es/jugadores/d333822a/Lionard-Pajoy">Lionard Pajoy</a> 2012-2020&nbsp;· FW&nbsp;· Cúcuta Deportivo, Alianza Lima, Alianza Universidad, Boyacá Chicó, Unión Comercio, D.C. United, Águi</p><p><a href="/es/jugadores/17f4616a/Benigno-Palacio">Benigno Palacio</a> 2021&nbsp;· FW</p><p><a href="/es/jugadores/7f63001b/Darwin-Palacio">Darwin Palacio</a> 2023&nbsp;· FW</p><p><a href="/es/jugadores/c89626ce/Duban-Palacio"><strong>Duban Palacio</strong></a> 2016-2025&nbsp;· MF&nbsp;· Nacional Potosí, Comerciantes Unidos, Deportivo Pereira, Deportivo Pasto, Bucaramanga, Santa Fe</p><p><a href="/es/jugadores/89864ec6/Julian-Palacio"><strong>Julián Palacio</strong></a> 2021-2025&nbsp;· DF&nbsp;· Envigado FC</p><p><a href="/es/jugadores/a80d92fe/Nelson-Palacio"><strong>Nelson Palacio</strong></a> 2021-2025&nbsp;· MF&nbsp;· Real Salt Lake, Atlético Nacional</p><p><a href="/es/jugadores/62823f22/Aly-Palacios"><strong>Aly Palacios</strong></a> 2023-2024&nbsp;· FW&nbsp;· Envigado FC</p><p><a href="/es/jugadores/e114caca/Arley-Palacios">Arley Palacios</a> 1998-1999&nbsp;· DF&nbsp;· MetroStars, Macará, Boyacá Chicó, Bucaramanga, Miami Fusion</p><p><a href="/es/jugadores/d1fbb221/Arnol-Palacios">Arnol Palacios</a> 2015-2018&nbsp;· DF,MF&nbsp;· Atlético Huila, América de Cali, Deportivo Pasto</p><p><a href="/es/jugadores/d73ed533/Boris-Palacios">Boris Palacios</a> 2021&nbsp;· MF&nbsp;· Boyacá Chicó</p><p><a href="/es/jugadores/61a05353/Brahian-Palacios"><strong>Brahian Palacios</strong></a> 2022-2024&nbsp;· MF&nbsp;· Atlético Nacional, Atlético Mineiro</p><p><a href="/es/jugadores/0b8bbcaa/Brayam-Palacios">Brayam Palacios</a> 2022-2023&nbsp;· DF&nbsp;· Bucaramanga, Unión Magdalena</p><p><a href="/es/jugadores/f91df2cf/Clemente-Palacios">Clemente Palacios</a> 2016-2017&nbsp;· FW&nbsp;· Once Caldas, Alianza Petrolera, Junior</p><p><a href="/es/jugadores/6efeb59f/Dager-Palacios">Dager Palacios</a> 2015-2019&nbsp;· MF&nbsp;· La Equidad, Monagas, Boyacá Chicó, Independiente Medellín</p><p><a href="/es/jugadores/e943d11e/Denilson-Palacios">Denilson Palacios</a> 2018&nbsp;· DF</p><p><a href="/es/jugadores/29da4a50/Didier-Palacios"><strong>Didier Palacios</strong></a> 2024-2025&nbsp;· DF&nbsp;· Envigado FC</p><p><a href="/es/jugadores/34d74b00/Erick-Palacios">Erick Palacios</a> 2017-2018&nbsp;· MF</p><p><a href="/es/jugadores/688e374f/Ever-Palacios">Ever Palacios</a> 1998&nbsp;· DF&nbsp;· Boyacá Chicó, Kashiwa Reysol, Colombia</p><p><a href="/es/jugadores/712a9f33/Fabricio-Palacios">Fabricio Palacios</a> 2023&nbsp;· MF&nbsp;· Real Santa Cruz</p><p><a href="/es/jugadores/9e880595/Hayen-Palacios"><strong>Hayen Palacios</strong></a> 2018-2025&nbsp;· DF&nbsp;· Athletico Paranaense, Fortaleza FC, Atlético Nacional, Alianza Petrolera, Envigado FC, Águilas Dorad</p><p><a href="/es/jugadores/ac8b2421/Helibelton-Palacios"><strong>Helibelton Palacios</strong></a> 2014-2025&nbsp;· DF&nbsp;· Millonarios, Deportivo Cali, Atlético Nacional, Elche, Club Brugge, Cruzeiro, Colombia</p><p><a href="/es/jugadores/c8b71ebc/Jackson-Palacios">Jackson Palacios</a> 2015-2016&nbsp;· MF&nbsp;· Atlético Huila</p><p><a href="/es/jugadores/05fbbdc4/Jair-Palacios">Jair Palacios</a> 2016-2020&nbsp;· DF&nbsp;· Millonarios, Bucaramanga</p><p><a href="/es/jugadores/fa40f782/Jamillacson-Palacios">Jamillacson Palacios</a> 2015-2017&nbsp;· FW&nbsp;· Expreso Rojo, Patriotas FC, Alianza Atlético, Envigado FC</p><p><a href="/es/jugadores/44014034/Jeison-Palacios"><strong>Jeison Palacios</strong></a> 2015-2025&nbsp;· DF&nbsp;· Nashville SC, Alianza Petrolera, Santa Fe, Bucaramanga, América de Cali</p><p><a href="/es/jugadores/b7094236/Jeisson-Palacios">Jeisson Palacios</a> 2018&nbsp;· DF&nbsp;· Estudiantes de Mérida</p><p><a href="/es/jugadores/562e420a/Jhon-Palacios"><strong>Jhon Palacios</strong></a> 2021-2025&nbsp;· DF&nbsp;· Independiente Medellín, Deportivo Pereira, La Equidad, América de Cali</p><p><a href="/es/jugadores/d99ee497/Jhon-Palacios">Jhon Palacios</a> 2017&nbsp;· FW</p><p><a href="/es/jugadores/3ada1496/Jonathan-Palacios">Jonathan Palacios</a> 2015-2018&nbsp;· FW&nbsp;· Alianza Atlético, Cúcuta Deportivo</p><p><a href="/es/jugadores/be9d2c29/Jose-Palacios">José Palacios</a> 2016-2022&nbsp;· MF&nbsp;· Cortuluá</p><p><a href="/es/jugadores/b6666f09/Junior-Palacios"><strong>Junior Palacios</strong></a> 2021-2024&nbsp;· DF,MF&nbsp;· Miami FC, Union Omaha</p><p><a href="/es/jugadores/1974fc49/Kevin-Palacios"><strong>Kevin Palacios</strong></a> 2021-2025&nbsp;· MF&nbsp;· Millonarios, Cortuluá, Atlético Huila, Deportivo Pereira</p><p><a href="/es/jugadores/8f7dd23d/Kevin-Palacios">Kevin Palacios</a> 2022&nbsp;· MF</p><p><a href="/es/jugadores/1680bb3c/Luis-Palacios"><strong>Luis Palacios</strong></a> 2021-2025&nbsp;· MF&nbsp;· Once Caldas, La Equidad</p><p><a href="/es/jugadores/260c9091/Luis-Palacios">Luis Palacios</a> 2024&nbsp;· FW</p><p><a href="/es/jugadores/29977988/Malcom-Palacios"><strong>Málcom Palacios</strong></a> 2023-2025&nbsp;· DF&nbsp;· Columbus Crew 2, Independiente Medellín</p><p><a href="/es/jugadores/a8106e71/Manuel-Palacios"><strong>Manuel Palacios</strong></a> 2017-2025&nbsp;· FW,MF&nbsp;· Wuhan Three Towns, Pohang Steelers, Alianza Petrolera, Chengdu Rongcheng, Patriotas FC, Seongnam FC</p><p><a href="/es/jugadores/36a9d7de/Mateo-Palacios">Mateo Palacios</a> 2015-2021&nbsp;· MF&nbsp;· Boyacá Chicó, Alianza Petrolera, Deportivo Pasto</p><p><a href="/es/jugadores/d20a1dd6/Nicolas-Palacios">Nicolás Palacios</a> 2015-2023&nbsp;· DF,MF&nbsp;· Deportivo Pasto, Bucaramanga, Patriotas FC, Unión Comercio, Deportes Tolima, Alianza Petrolera, La E</p><p><a href="/es/jugadores/e47c977a/Sergio-Palacios">Sergio Palacios</a> 2023-2024&nbsp;· DF&nbsp;· Once Caldas</p><p><a href="/es/jugadores/239176ac/William-Palacios">William Palacios</a> 2015-2021&nbsp;· FW&nbsp;· Jaguares de Córdoba, Comerciantes Unidos, Universidad San Martín, Club Sol de América, Santa Fe, Onc</p><p><a href="/es/jugadores/f1fe4c6c/William-Palacios"><strong>William Palacios</strong></a> 2018-2019&nbsp;· MF</p><p><a href="/es/jugadores/18a12a62/Wilmer-Palacios">Wilmer Palacios</a> 2021&nbsp;· DF&nbsp;· Deportes Quindío</p><p><a href="/es/jugadores/04d506e6/Francisco-Palma">Francisco Palma</a> 2015-2016&nbsp;· DF&nbsp;· Uniautónoma FC</p><p><a href="/es/jugadores/49f87705/Juan-Palma">Juan Palma</a> 2018-2024&nbsp;· DF&nbsp;· Charleston Battery, Once Caldas</p><p><a href="/es/jugadores/3bbf1bdf/Carlos-Palomeque">Carlos Palomeque</a> 2016&nbsp;· FW</p><p><a href="/es/jugadores/5cd0a073/Cristian-Palomeque">Cristian Palomeque</a> 2015-2021&nbsp;· FW,MF&nbsp;· Alianza Petrolera, Mushuc Runa, La Equidad, Jaguares de Córdoba, Colón</p><p><a href="/es/jugadores/dced84c7/Darwin-Palomeque"><strong>Darwin Palomeque</strong></a> 2025&nbsp;· DF&nbsp;· Unión Magdalena</p><p><a href="/es/jugadores/bd354619/Ezequiel-Palomeque">Ezequiel Palomeque</a> 2016-2021&nbsp;· DF&nbsp;· Deportivo Cali, Al-Raed, Unión Española, Atlético Nacional, Cortuluá</p><p><a href="/es/jugadores/d98b481e/Steven-Palomeque">Steven Palomeque</a> 2023&nbsp;· MF</p><p><a href="/es/jugadores/b519ae2a/Edinson-Palomino">Edinson Palomino</a> 2014-2020&nbsp;· MF&nbsp;· Atlético Huila, Real Cartagena, Águilas Doradas, Boyacá Chicó, Bucaramanga, Deportivo Pasto</p><p><a href="/es/jugadores/8efce18d/Jairo-Palomino">Jairo Palomino</a> 2014-2023&nbsp;· DF,MF&nbsp;· Atlético Nacional, Envigado FC, Unión Magdalena, Al-Ahli, Once Caldas, Atlético Tucumán</p><p><a href="/es/jugadores/d6797b51/Andres-Palomique">Andrés Palomique</a> 2019-2020&nbsp;· FW</p><p><a href="/es/jugadores/c46fc1c2/Alberto-Pardo">Alberto Pardo</a> 2015&nbsp;· MF&nbsp;· Uniautónoma FC</p><p><a href="/es/jugadores/5f956fcf/Felipe-Pardo"><strong>Felipe Pardo</strong></a> 2013-2025&nbsp;· FW,MF&nbsp;· Alianza Petrolera, Independiente Medellín, Olympiacos, Braga, Toluca, Atlético Huila, Pachuca, Depor</p><p><a href="/es/jugadores/3454a744/Luis-Paredes"><strong>Luis Paredes</strong></a> 2023-2025&nbsp;· FW&nbsp;· San Antonio FC, Millonarios</p><p><a href="/es/jugadores/372d841e/Oscar-Pareja">Óscar Pareja</a> 1998-2005&nbsp;· MF&nbsp;· Dallas Burn, New England Revolution</p><p><a href="/es/jugadores/080b1041/Adrian-Parra"><strong>Adrián Parra</strong></a> 2016-2025&nbsp;· FW&nbsp;· Deportes Tolima, Fortaleza FC, Deportivo Cali, Atlético Huila</p><p><a href="/es/jugadores/5716e8c7/Deiver-Parra">Deiver Parra</a> 2015-2017&nbsp;· DF&nbsp;· Patriotas FC, Jaguares de Córdoba</p><p><a href="/es/jugadores/64b12717/Joan-Parra"><strong>Joan Parra</strong></a> 2020-2025&nbsp;· GK&nbsp;· Once Caldas, Envigado FC</p><p><a href="/es/jugadores/95a2b962/Johan-Parra"><strong>Johan Parra</strong></a> 2024-2025&nbsp;· FW&nbsp;· Alianza Petrolera</p><p><a href="/es/jugadores/6c948caf/Juan-Parra">Juan Parra</a> 2020-2021&nbsp;· DF&nbsp;· North Texas, Independiente Medellín</p><p><a href="/es/jugadores/d536f608/Kevin-Parra"><strong>Kevin Parra</strong></a> 2022-2025&nbsp;· MF&nbsp;· Atlético Nacional, Patriotas FC</p><p><a href="/es/jugadores/dbc0ffd4/William-Parra-Sinisterra"><strong>William Parra Sinisterra</strong></a> 2016-2023&nbsp;· DF,MF&nbsp;· Independiente Medellín, Deportes Tolima, La Equidad, Envigado FC, HJK Helsinki, Always Ready</p><p><a href="/es/jugadores/b06de6d9/Camilo-Paternina"><strong>Camilo Paternina</strong></a> 2020-2025&nbsp;· FW&nbsp;· La Equidad, Envigado FC, Patriotas FC</p><p><a href="/es/jugadores/6ecebcba/Jairo-Patino">Jairo Patiño</a> 2003-2009&nbsp;· MF&nbsp;· Atlético Nacional, River Plate, Banfield, San Luis, Newell's Old Boys, Cúcuta Deportivo, Colombia</p><p><a href="/es/jugadores/2b6a34b1/Juan-Patino"><strong>Juan Patiño</strong></a> 2019-2025&nbsp;· DF&nbsp;· Once Caldas, Alianza Petrolera</p><p><a href="/es/jugadores/6f987eac/Juan-Patino">Juan Patiño</a> 2016&nbsp;· GK</p><p><a href="/es/jugadores/dc945f43/Juan-Patino">Juan Patiño</a> 2020&nbsp;· MF&nbsp;· Universidad de Concepción</p><p><a href="/es/jugadores/7f546610/Octavio-Patino">Octavio Patiño</a> 2018-2019&nbsp;· GK</p><p><a href="/es/jugadores/e3e94590/Jean-Paul-Garcia">Jean Paul Garcia</a> 2019-2020&nbsp;· GK</p><p><a href="/es/jugadores/54528208/Manuela-Pavi"><strong>Manuela Paví</strong></a> 2019-2025&nbsp;· FW&nbsp;· West Ham United, Colombia, CA Mineiro</p><p><a href="/es/jugadores/dd770777/Carlos-Payares">Carlos Payares</a> 2022&nbsp;· FW</p><p><a href="/es/jugadores/398a18ed/Luis-Payares"><strong>Luis Payares</strong></a> 2014-2024&nbsp;· DF&nbsp;· Deportivo Pasto, Patriotas FC, Bucaramanga, Cúcuta Deportivo, Millonarios, Deportes Tolima, Deportiv</p><p><a href="/es/jugadores/685fbdf3/Martin-Payares"><strong>Martín Payares</strong></a> 2015-2025&nbsp;· DF&nbsp;· Unión Magdalena, La Equidad, Patriotas FC, Bucaramanga, Cortuluá, Deportivo Pasto, El Paso Locomotiv</p><p><a href="/es/jugadores/8c28c35a/Brayan-Paz">Brayan Paz</a> 2016&nbsp;· DF</p><p><a href="/es/jugadores/c8389a4c/Breiner-Paz"><strong>Breiner Paz</strong></a> 2018-2025&nbsp;· DF&nbsp;· Zamora, Millonarios, Jaguares de Córdoba</p><p><a href="/es/jugadores/9bc49f36/Jose-Paz">José Paz</a> 2015&nbsp;· GK</p><p><a href="/es/jugadores/6c671716/Luis-Paz">Luis Paz</a> 1962&nbsp;· MF</p><p><a href="/es/jugadores/b1d7dba8/Yeferson-Paz"><strong>Yeferson Paz</strong></a> 2021-2025&nbsp;· DF&nbsp;· Sassuolo, Perugia</p><p><a href="/es/jugadores/8c417cae/Juan-Pedroza"><strong>Juan Pedroza</strong></a> 2019-2025&nbsp;· MF&nbsp;· Al Okhdood SC, Santa Fe, Al-Batin</p><p><a href="/es/jugadores/61dacddd/Kelis-Peduzine">Kelis Peduzine</a> 2011-2012&nbsp;· DF&nbsp;· Colombia</p><p><a href="/es/jugadores/8c417e64/Anuar-Pelaez"><strong>Anuar Peláez</strong></a> 2021-2025&nbsp;· FW&nbsp;· Spokane Velocity FC, Internacional de Barinas, Oakland Roots</p><p><a href="/es/jugadores/055dab78/Brandon-Pena">Brandon Peña</a> 2023&nbsp;· MF&nbsp;· Independiente Petrolero</p><p><a href="/es/jugadores/02827eca/Gianfranco-Pena"><strong>Gianfranco Peña</strong></a> 2022-2025&nbsp;· FW&nbsp;· Deportivo Pereira, América de Cali, Patriotas FC, Atlético Nacional</p><p><a href="/es/jugadores/73a221b1/Jermein-Pena"><strong>Jermein Peña</strong></a> 2019-2024&nbsp;· DF&nbsp;· Junior, Unión Magdalena</p><p><a href="/es/jugadores/30bc42ff/Jessica-Pena"><strong>Jessica Peña</strong></a> 2022-2024&nbsp;· MF&nbsp;· Grêmio FBPA</p><p><a href="/es/jugadores/fc8d3d2e/Jhon-Pena">Jhon Peña</a> 2016-2018&nbsp;· DF&nbsp;· Boyacá Chicó</p><p><a href="/es/jugadores/50583102/Jose-Luis-Moreno-Pena"><strong>José Luis Moreno Peña</strong></a> 2015-2025&nbsp;· DF&nbsp;· Churchill Brothers, Once Caldas, Patriotas FC, Millonarios, River Plate Asunción</p><p><a href="/es/jugadores/28e0aa95/Raul-Pena">Raul Peña</a> 2015-2016&nbsp;· MF&nbsp;· Boyacá Chicó</p><p><a href="/es/jugadores/78ca7e71/Tardelis-Pena">Tardelis Peña</a> 2016&nbsp;· DF&nbsp;· Cienciano, Fortaleza FC, Deportivo Pasto</p><p><a href="/es/jugadores/be5886f5/Daniel-Penaloza">Daniel Peñaloza</a> 2017&nbsp;· FW</p><p><a href="/es/jugadores/96b82656/Juan-Penaloza">Juan Peñaloza</a> 2019-2023&nbsp;· MF&nbsp;· Águilas Doradas, Deportivo Pereira</p><p><a href="/es/jugadores/6c2e1bee/Alejandro-Penaranda">Alejandro Peñaranda</a> 2017&nbsp;· FW&nbsp;· Cortuluá</p><p><a href="/es/jugadores/e7ea6447/Raul-Penaranda">Raúl Peñaranda</a> 2015-2018&nbsp;· FW&nbsp;· Deportivo Anzoátegui, Once Caldas, Jaguares de Córdoba</p><p><a href="/es/jugadores/9770115d/Cristian-Penuela">Cristian Peñuela</a> 2017&nbsp;· MF</p><p><a href="/es/jugadores/b711a21e/Andrea-Peralta">Andrea Peralta</a> 2011-2019&nbsp;· DF&nbsp;· Audax</p><p><a href="/es/jugadores/796dce81/Diego-Peralta">Diego Peralta</a> 2014-2021&nbsp;· DF&nbsp;· Cúcuta Deportivo, Deportivo Cali, Once Caldas, Atlético Nacional, Deportivo Pereira, Bucaramanga, De</p><p><a href="/es/jugadores/d6fa0612/Jaime-Peralta"><strong>Jaime Peralta</strong></a> 2024-2025&nbsp;· FW&nbsp;· San Lorenzo, Independiente Medellín</p><p><a href="/es/jugadores/33c138db/Anderson-Perea">Anderson Perea</a> 2019-2020&nbsp;· MF&nbsp;· Llaneros</p><p><a href="/es/jugadores/a499b56d/Brayan-Perea"><strong>Brayan Perea</strong></a> 2013-2025&nbsp;· FW&nbsp;· Botev Vratsa, Deportivo Cali, Lazio, Perugia, Lugo, Troyes, Santa Fe</p><p><a href="/es/jugadores/9785c0a0/Brian-Perea">Brian Perea</a> 2021-2022&nbsp;· MF&nbsp;· Cerrito</p><p><a href="/es/jugadores/9ccf9bc9/Carlos-Andres-Mosquera-Perea"><strong>Carlos Andrés Mosquera Perea</strong></a> 2017-2024&nbsp;· FW,MF&nbsp;· Patriotas FC, Técnico Universitario, Bucaramanga, Cúcuta Deportivo, Atlético Huila, Cienciano</p><p><a href="/es/jugadores/10ddeb04/Diego-Perea"><strong>Diego Perea</strong></a> 2023&nbsp;· FW&nbsp;· San Lorenzo</p><p><a href="/es/jugadores/4079294e/Edixon-Perea">Edixon Perea</a> 2005-2014&nbsp;· FW&nbsp;· Bordeaux, Grêmio, Cruz Azul, Deportivo Cali, Atlético Madrid, Changchun Yatai, Las Palmas, Honvéd</p><p><a href="/es/jugadores/a9235301/Geisson-Perea"><strong>Geisson Perea</strong></a> 2018-2024&nbsp;· DF&nbsp;· Atlético Nacional, Deportivo Pasto, Deportivo Pereira, Once Caldas, Universidad César Vallejo, Santa</p><p><a href="/es/jugadores/6075ce03/Juan-Perea"><strong>Juan Perea</strong></a> 2024-2025&nbsp;· FW&nbsp;· Lokomotiv Plovdiv</p><p><a href="/es/jugadores/ff3d391c/Juan-Perea"><strong>Juan Perea</strong></a> 2019-2025&nbsp;· FW&nbsp;· Zürich, Hansa Rostock, PAS Giannina, Volos N.F.C., Panathinaikos, Stuttgart</p><p><a href="/es/jugadores/57bc72ea/Oscar-Perea"><strong>Óscar Perea</strong></a> 2022-2025&nbsp;· FW&nbsp;· Strasbourg, Atlético Nacional</p><p><a href="/es/jugadores/9d3da55a/Santiago-Perea">Santiago Perea</a> 2022-2023&nbsp;· DF</p><p><a href="/es/jugadores/90a000c5/Victor-Perea">Víctor Perea</a> 2023-2024&nbsp;· DF&nbsp;· Boyacá Chicó, Rayo Zuliano</p><p><a href="/es/jugadores/14c35d1a/Alexis-Perez"><strong>Alexis Pérez</strong></a> 2015-2023&nbsp;· DF&nbsp;· Giresunspor, Querétaro, Junior, Lanús, Uniautónoma FC</p><p><a href="/es/jugadores/15794f0e/Andres-Perez"><strong>Andrés Pérez</strong></a> 2019-2025&nbsp;· GK&nbsp;· La Equidad</p><p><a href="/es/jugadores/f6d2eb7b/Andres-Perez">Andrés Pérez</a> 2014-2021&nbsp;· MF&nbsp;· Deportivo Cali, Santa Fe, Quilmes, Millonarios, Arsenal de Sarandí, San Lorenzo</p><p><a href="/es/jugadores/00d07011/Camilo-Perez">Camilo Pérez</a> 2015-2021&nbsp;· DF&nbsp;· Atlético Nacional, Envigado FC, Águilas Doradas, La Equidad, Boyacá Chicó, Once Caldas, América de C</p><p><a href="/es/jugadores/42a833ab/Sebastian-Perez-Cardona"><strong>Sebastián Pérez Cardona</strong></a> 2014-2025&nbsp;· MF&nbsp;· Boavista, Atlético Nacional, Barcelona, Boca Juniors, Colombia</p><p><a href="/es/jugadores/6bd07ecb/Carlos-Perez"><strong>Carlos Pérez</strong></a> 2016-2024&nbsp;· DF&nbsp;· Alianza Petrolera, Técnico Universitario, Fortaleza FC</p><p><a href="/es/jugadores/465ec16e/Catalina-Perez">Catalina Pérez</a> 2015-2024&nbsp;· GK&nbsp;· Colombia, Napoli, Avaí</p><p><a href="/es/jugadores/d44f5312/David-Perez">David Pérez</a> 2016-2020&nbsp;· MF&nbsp;· Patriotas FC</p><p><a href="/es/jugadores/de4d8ba1/Dayron-Perez">Dayron Pérez</a> 2015-2016&nbsp;· MF&nbsp;· Once Caldas, Boyacá Chicó, Cúcuta Deportivo, Jaguares de Córdoba, Atlético Huila, Águilas Doradas, D</p><p><a href="/es/jugadores/19c171dd/Erwin-Perez">Erwin Pérez</a> 2015&nbsp;· FW</p><p><a href="/es/jugadores/dc040f8a/Esteban-Perez">Esteban Pérez</a> 2017&nbsp;· MF</p><p><a href="/es/jugadores/062614be/Ignacio-Perez">Ignacio Pérez</a> 1962&nbsp;· MF</p><p><a href="/es/jugadores/c861a1ab/Jean-Perez">Jean Perez</a> 2022&nbsp;· GK</p><p><a href="/es/jugadores/7c750821/Jhonatan-Perez">Jhonatan Pérez</a> 2023&nbsp;· MF</p><p><a href="/es/jugadores/f23ebbcc/Jhonatan-Perez">Jhonatan Pérez</a> 2018-2024&nbsp;· DF&nbsp;· América de Cali, Cortuluá, Alianza Petrolera, Atlético Huila</p><p><a href="/es/jugadores/ff94c3e2/Juan-Perez"><strong>Juan Pérez</strong></a> 2023-2025&nbsp;· MF&nbsp;· Godoy Cruz, Emelec, Deportivo Pereira</p><p><a href="/es/jugadores/4398f594/Kevin-Perez"><strong>Kevin Pérez</strong></a> 2019-2025&nbsp;· MF&nbsp;· Deportes Tolima, Bucaramanga</p><p><a href="/es/jugadores/dd02f975/Luis-Perez"><strong>Luis Pérez</strong></a> 2021-2025&nbsp;· MF&nbsp;· Alianza Petrolera, Once Caldas, ADT Tarma, Patriotas FC, Deportivo Pasto</p><p><a href="/es/jugadores/4c7b298f/Maireth-Perez">Maireth Pérez</a> 2019&nbsp;· FW</p><p><a href="/es/jugadores/2264e79b/Marco-Perez"><strong>Marco Pérez</strong></a> 2010-2025&nbsp;· FW,MF&nbsp;· Junior, Deportes Tolima, Águilas Doradas, Boyacá Chicó, Al-Raed, Gimnasia y Esgrima (LP), Independie</p><p><a href="/es/jugadores/af56155e/Oidel-Perez">Oidel Pérez</a> 2015-2016&nbsp;· DF&nbsp;· Junior, Deportes Tolima</p><p><a href="/es/jugadores/be83af89/Rafa-Perez"><strong>Rafa Pérez</strong></a> 2014-2025&nbsp;· DF&nbsp;· Unión Magdalena, Junior, Talleres, Real Cartagena, San Lorenzo, Litex Lovech, CSKA Sofia, Independie</p><p><a href="/es/jugadores/7a711310/Ricardo-Perez">Ricardo Pérez</a> 2003-2004&nbsp;· FW&nbsp;· Académica</p><p><a href="/es/jugadores/81967fe3/Sebastian-Perez"><strong>Sebastian Pérez</strong></a> 2025&nbsp;· MF&nbsp;· Deportes Tolima</p><p><a href="/es/jugadores/57030b15/William-Perez">William Pérez</a> 2016&nbsp;· MF</p><p><a href="/es/jugadores/bbd87eb5/Wilson-Perez">Wilson Pérez</a> 1994&nbsp;· DF&nbsp;· Colombia</p><p><a href="/es/jugadores/f7f77b05/Baldomero-Perlaza"><strong>Baldomero Perlaza</strong></a> 2015-2025&nbsp;· MF&nbsp;· Independiente Medellín, Santa Fe, Atlético Nacional, Colón, Atlético Huila</p><p><a href="/es/jugadores/6c647ddd/Elvis-Perlaza"><strong>Elvis Perlaza</strong></a> 2015-2025&nbsp;· DF&nbsp;· Santa Fe, Millonarios, Atlético Huila, Boyacá Chicó, Envigado FC, Independiente Medellín, Jaguares d</p><p><a href="/es/jugadores/c2b25fce/Jhonatan-Perlaza">Jhonatan Perlaza</a> 2022-2023&nbsp;· MF&nbsp;· Universitario de Sucre</p><p><a href="/es/jugadores/bdcf2e49/Jonathan-Perlaza">Jonathan Perlaza</a> 2022-2024&nbsp;· MF&nbsp;· Deportivo Pasto</p><p><a href="/es/jugadores/fdf6d980/Jorge-Perlaza">Jorge Perlaza</a> 2011-2012&nbsp;· FW&nbsp;· Deportes Tolima, Portland Timbers, Millonarios, Deportes Quindío</p><p><a href="/es/jugadores/6f9cef61/Victor-Perlaza">Víctor Perlaza</a> 2021-2024&nbsp;· FW,MF&nbsp;· Sport Huancayo, Universidad Técnica de Cajamarca, ADT Tarma, Alianza Atlético</p><p><a href="/es/jugadores/a0d09bc0/Yeicar-Perlaza"><strong>Yeicar Perlaza</strong></a> 2022-2025&nbsp;· DF&nbsp;· Santa Fe, Atlético Nacional</p><p><a href="/es/jugadores/789d2b18/Carlos-Andres-Medrano-Pernett">Carlos Andrés Medrano Pernett</a> 2016&nbsp;· MF&nbsp;· Monagas</p><p><a href="/es/jugadores/fe2a0979/Hernan-Pertuz">Hernán Pertúz</a> 2012-2022&nbsp;· DF&nbsp;· Independiente Medellín, FC Dallas, Deportivo Pasto, Deportivo La Guaira</p><p><a href="/es/jugadores/b3243a8e/Juan-Pertuz">Juan Pertuz</a> 2024&nbsp;· DF</p><p><a href="/es/jugadores/be8a645b/Jean-Pestana"><strong>Jean Pestaña</strong></a> 2017-2025&nbsp;· DF&nbsp;· América de Cali, Águilas Doradas, Atlético Huila, Deportivo Pereira, La Equidad, Deportes Tolima</p><p><a href="/es/jugadores/a022d43b/Leonardo-Pico"><strong>Leonardo Pico</strong></a> 2015-2025&nbsp;· MF&nbsp;· Fortaleza FC, Junior, Patriotas FC, Santa Fe, Once Caldas</p><p><a href="/es/jugadores/d07dab60/Alejandro-Piedrahita"><strong>Alejandro Piedrahita</strong></a> 2020-2025&nbsp;· MF&nbsp;· Gimnasia y Esgrima (LP), Deportivo Pereira, Banfield</p><p><a href="/es/jugadores/97501326/Marlon-Piedrahita">Marlon Piedrahita</a> 2015-2023&nbsp;· DF,MF&nbsp;· Junior, Atlético Nacional, Once Caldas, Independiente Medellín, Deportivo Pasto, Águilas Doradas, En</p><p><a href="/es/jugadores/625abc5a/Jacobo-Pimentel"><strong>Jacobo Pimentel</strong></a> 2020-2025&nbsp;· FW&nbsp;· Boyacá Chicó</p><p><a href="/es/jugadores/d0c4c98c/Erik-Pineda">Erik Pineda</a> 2021&nbsp;· GK</p><p><a href="/es/jugadores/e667f114/Jaen-Pineda"><strong>Jaen Pineda</strong></a> 2020-2025&nbsp;· MF&nbsp;· Águilas Doradas, Independiente Medellín, Cúcuta Deportivo</p><p><a href="/es/jugadores/03fdf0c4/Mildrey-Pineda">Mildrey Pineda</a> 2015-2016&nbsp;· MF</p><p><a href="/es/jugadores/36236dea/Joel-Pineres">Joel Piñeres</a> 2023&nbsp;· MF</p><p><a href="/es/jugadores/2bab55c8/Jeison-Pinillo">Jeison Pinillo</a> 2019-2020&nbsp;· GK</p><p><a href="/es/jugadores/72644759/Cristian-Pinillos">Cristian Pinillos</a> 2015&nbsp;· GK</p><p><a href="/es/jugadores/5f6976ab/Anderson-Pino">Anderson Pino</a> 2016&nbsp;· MF</p><p><a href="/es/jugadores/e5f3537c/Didier-Pino"><strong>Didier Pino</strong></a> 2021-2024&nbsp;· MF&nbsp;· Deportivo Pasto, Jaguares de Córdoba, América de Cali, Deportes Quindío</p><p><a href="/es/jugadores/29ab8c26/Julian-Pino">Julián Pino</a> 2017&nbsp;· FW&nbsp;· Atlético Socopó</p><p><a href="/es/jugadores/69e32e61/Jhoan-Pinto"><strong>Jhoan Pinto</strong></a> 2025&nbsp;· MF&nbsp;· Unión Magdalena</p><p><a href="/es/jugadores/c3adf304/Cristian-Pinzon">Cristian Pinzón</a> 2015&nbsp;· GK&nbsp;· Alianza Atlético, Deportes Quindío, Real Cartagena, La Equidad</p><p><a href="/es/jugadores/3e20e946/Anderson-Plata"><strong>Anderson Plata</strong></a> 2014-2025&nbsp;· FW,MF&nbsp;· Águilas Doradas, Santa Fe, Deportes Tolima, Independiente Medellín, Daejeon Citizen FC, Atlético Hui</p><p><a href="/es/jugadores/47d1e0dd/Daniel-Polanco"><strong>Daniel Polanco</strong></a> 2022-2025&nbsp;· DF&nbsp;· La Equidad</p><p><a href="/es/jugadores/8829812e/Carlos-Polo">Carlos Polo</a> 2016-2019&nbsp;· MF</p><p><a href="/es/jugadores/e80cd0c7/Boris-Polo-Mosquera">Boris Polo Mosquera</a> 2014-2016&nbsp;· MF&nbsp;· Once Caldas</p><p><a href="/es/jugadores/fc08cd7c/Ciro-Porras">Ciro Porras</a> 2019-2021&nbsp;· DF&nbsp;· Santa Fe</p><p><a href="/es/jugadores/f0cac219/Jorge-Posada">Jorge Posada</a> 2020-2022&nbsp;· DF&nbsp;· Patriotas FC, Deportivo Pereira</p><p><a href="/es/jugadores/5bd8f6ae/Prada">Prada</a> 2023-2024&nbsp;· GK</p><p><a href="/es/jugadores/0631dbe9/Vicente-Prado">Vicente Prado</a> 2019-2023&nbsp;· FW&nbsp;· Jaguares de Córdoba, Deportivo Pasto</p><p><a href="/es/jugadores/5815a1e6/Carlos-Preciado"><strong>Carlos Preciado</strong></a> 2024-2025&nbsp;· FW&nbsp;· Nacional Potosí, San Antonio Bulo Bulo</p><p><a href="/es/jugadores/96d12fdf/Carlos-Preciado">Carlos Preciado</a> 2015-2020&nbsp;· FW,MF&nbsp;· América de Cali, Deportivo Pereira, Alianza Lima, Ayacucho, Envigado FC, Millonarios, Sport Huancayo</p><p><a href="/es/jugadores/5300af73/Harold-Preciado">Harold Preciado</a> 2015-2024&nbsp;· FW&nbsp;· Deportivo Cali, Santos Laguna, Shenzhen FC, Colombia</p><p><a href="/es/jugadores/f37a5b51/Leider-Preciado">Léider Preciado</a> 1998-2001&nbsp;· FW&nbsp;· Santa Fe, Racing Santander, Deportivo Quito, Deportes Quindío, América de Cali, Colombia</p><p><a href="/es/jugadores/5bf7f2a5/Stiven-Pretel-Castillo">Stiven Pretel Castillo</a> 2015&nbsp;· MF&nbsp;· Cortuluá</p><p><a href="/es/jugadores/1ef525d1/Julian-Pretel">Julián Pretel</a> 2017-2018&nbsp;· DF&nbsp;· Patriotas FC</p><p><a href="/es/jugadores/a813082f/Dylan-Prieto">Dylan Prieto</a> 2022-2023&nbsp;· DF</p><p><a href="/es/jugadores/5bf858f2/Alejandro-Prisco">Alejandro Prisco</a> 2022&nbsp;· FW&nbsp;· Deportes Tolima</p><p><a href="/es/jugadores/c01bef5f/Emmanuel-Prisco">Emmanuel Prisco</a> 2015-2016&nbsp;· MF&nbsp;· Ayacucho, Jaguares de Córdoba</p><p><a href="/es/jugadores/2c08cab0/Gustavo-Puerta"><strong>Gustavo Puerta</strong></a> 2022-2025&nbsp;· MF&nbsp;· Hull City, Leverkusen</p><p><a href="/es/jugadores/a7be6c95/Mateo-Puerta"><strong>Mateo Puerta</strong></a> 2016-2025&nbsp;· DF&nbsp;· Águilas Doradas, Cortuluá, Deportivo Cali</p><p><a href="/es/jugadores/6bdd789f/Cristian-Pulido">Cristian Pulido</a> 2015-2016&nbsp;· FW&nbsp;· Real Potosí</p><p><a href="/es/jugadores/53c480da/John-Pulido">John Pulido</a> 2006-2009&nbsp;· MF&nbsp;· Miami FC</p><p><a href="/es/jugadores/4a3ce9a5/Francisco-Pungo">Francisco Pungo</a> 2019&nbsp;· FW</p><p><a href="/es/jugadores/171f5be4/Andres-Quejada">Andrés Quejada</a> 2015&nbsp;· DF&nbsp;· Cortuluá, América de Cali</p><p><a href="/es/jugadores/fb65fbe1/Kevin-Quejada"><strong>Kevin Quejada</strong></a> 2022-2023&nbsp;· FW&nbsp;· Barracas Central</p><p><a href="/es/jugadores/afbe7d75/Juan-Quiceno"><strong>Juan Quiceno</strong></a> 2024-2025&nbsp;· MF&nbsp;· Boyacá Chicó</p><p><a href="/es/jugadores/1abb8ce1/Cristian-Quinones">Cristian Quiñones</a> 2011&nbsp;· DF&nbsp;· Santa Fe</p><p><a href="/es/jugadores/bff68b94/Cristian-Quinones">Cristian Quiñones</a> 2023&nbsp;· GK</p><p><a href="/es/jugadores/a5708270/Daniel-Quinones"><strong>Daniel Quiñones</strong></a> 2019-2025&nbsp;· DF&nbsp;· Once Caldas, América de Cali, Deportivo Pasto</p><p><a href="/es/jugadores/19ac49bd/Elicer-Quinones"><strong>Elicer Quiñones</strong></a> 2016-2021&nbsp;· MF&nbsp;· Millonarios, Águilas Doradas, Alianza Petrolera, Bucaramanga, Cúcuta Deportivo, Deportes Quindío</p><p><a href="/es/jugadores/3c5d2488/Hector-Quinones">Héctor Quiñones</a> 2012-2021&nbsp;· DF&nbsp;· América de Cali, Penafiel, Deportivo Cali, Junior, Paços de Ferreira, Millonarios</p><p><a href="/es/jugadores/7665ca53/Jader-Quinones"><strong>Jader Quiñónes</strong></a> 2021-2025&nbsp;· MF&nbsp;· Deportes Tolima, América de Cali, Águilas Doradas, Deportes Quindío</p><p><a href="/es/jugadores/20b4af88/Jeison-Quinones">Jeison Quiñónes</a> 2015-2017&nbsp;· FW&nbsp;· Club Petrolero, Atlético Huila, Deportes Tolima, Cúcuta Deportivo, León de Huánuco</p><p><a href="/es/jugadores/1b3d2510/Jeisson-Quinones"><strong>Jeisson Quiñones</strong></a> 2018-2025&nbsp;· DF&nbsp;· Yokohama F. Marinos, Águilas Doradas, Bucaramanga, Deportivo Pasto</p><p><a href="/es/jugadores/02ee4c85/Jhon-Quinones"><strong>Jhon Quiñónes</strong></a> 2024-2025&nbsp;· DF&nbsp;· Deportes Tolima</p><p><a href="/es/jugadores/04db250f/Jhon-Quinones">Jhon Quiñones</a> 2018-2023&nbsp;· MF&nbsp;· América de Cali</p><p><a href="/es/jugadores/1fc2e562/Jose-Quinones">José Quiñónes</a> 2015-2018&nbsp;· DF&nbsp;· Boyacá Chicó, Jaguares de Córdoba</p><p><a href="/es/jugadores/32356724/Jose-Quinones"><strong>José Quiñones</strong></a> 2023-2025&nbsp;· MF&nbsp;· Mushuc Runa</p><p><a href="/es/jugadores/6305f06f/Jose-Quinones">José Quiñones</a> 2016&nbsp;· MF</p><p><a href="/es/jugadores/66b336e1/Mairon-Quinones">Mairon Quiñónes</a> 2015-2021&nbsp;· DF&nbsp;· Deportivo Pasto</p><p><a href="/es/jugadores/a295f0b3/Nelson-Quinones">Nelson Quiñones</a> 2021-2023&nbsp;· FW,MF&nbsp;· Houston Dynamo, Once Caldas</p><p><a href="/es/jugadores/2dc11862/Rodin-Quinones">Rodin Quiñónes</a> 2015-2024&nbsp;· FW,MF&nbsp;· Atlético Nacional, Patriotas FC, Zamora, Independiente Medellín, Bucaramanga</p><p><a href="/es/jugadores/3d18ea9c/Sergio-Quinones">Sergio Quiñónes</a> 2015&nbsp;· FW&nbsp;· Boyacá Chicó</p><p><a href="/es/jugadores/f4ce2c37/Yuber-Quinones"><strong>Yuber Quiñones</strong></a> 2021-2025&nbsp;· MF&nbsp;· Deportivo Pereira, Millonarios</p><p><a href="/es/jugadores/af4e4379/Dannovi-Quinonez"><strong>Dannovi Quiñonez</strong></a> 2021-2025&nbsp;· MF&nbsp;· Llaneros, Once Caldas, Rosario Central</p><p><a href="/es/jugadores/011b2621/Deiner-Quinonez"><strong>Deiner Quiñónez</strong></a> 2016-2025&nbsp;· FW,MF&nbsp;· Deportivo Pasto, Independiente Medellín, América de Cali, Deportes Tolima, Atlético Nacional, Santos</p><p><a href="/es/jugadores/68310812/Ederson-Quinonez"><strong>Ederson Quiñónez</strong></a> 2021-2023&nbsp;· GK&nbsp;· Deportivo Pasto</p><p><a href="/es/jugadores/9898d6e2/Stiven-Quinonez">Stiven Quiñónez</a> 2016-2017&nbsp;· DF&nbsp;· Atlético Huila</p><p><a href="/es/jugadores/1cefb6a6/Yosimar-Quinonez"><strong>Yosimar Quiñónez</strong></a> 2016-2024&nbsp;· DF&nbsp;· Royal Parí, Unión Comercio, Club Vaca Díez, Envigado FC, Atlético Huila, Deportivo Pasto</p><p><a href="/es/jugadores/0c855cba/Aldair-Quintana"><strong>Aldair Quintana</strong></a> 2016-2025&nbsp;· GK&nbsp;· Bucaramanga, Atlético Nacional, Deportivo Pereira, Atlético Huila</p><p><a href="/es/jugadores/94bf9441/Juan-Quintana"><strong>Juan Quintana</strong></a> 2024-2025&nbsp;· DF&nbsp;· Pacific FC</p><p><a href="/es/jugadores/b949f6ea/Rubiel-Quintana">Rubiel Quintana</a> 2003-2004&nbsp;· DF,MF&nbsp;· Boyacá Chicó, Belgrano, Deportivo Pereira</p><p><a href="/es/jugadores/4b7066cb/Carlos-Quintero">Carlos Quintero</a> 2023&nbsp;· FW</p><p><a href="/es/jugadores/6dd8344c/Cesar-Quintero">César Quintero</a> 2009-2022&nbsp;· DF,MF&nbsp;· Pápa, Deportivo Pasto, Once Caldas, Bucaramanga, Deportes Tolima</p><p><a href="/es/jugadores/0cc00553/Darwin-Quintero"><strong>Darwin Quintero</strong></a> 2007-2025&nbsp;· FW,MF&nbsp;· Deportivo Pereira, Santos Laguna, América, Houston Dynamo, Minnesota United, Deportes Tolima, Améric</p><p><a href="/es/jugadores/0cf7ab69/David-Quintero"><strong>David Quintero</strong></a> 2019-2024&nbsp;· GK</p><p><a href="/es/jugadores/1b2b9cc1/Jarlin-Quintero"><strong>Jarlín Quintero</strong></a> 2015-2025&nbsp;· FW&nbsp;· Universidad Técnica de Cajamarca, Sport Huancayo, Cantolao, Jaguares de Córdoba, Carabobo, Deportivo</p><p><a href="/es/jugadores/540d0b37/Juan-Quintero"><strong>Juan Quintero</strong></a> 2012-2026&nbsp;· FW,MF&nbsp;· América de Cali, River Plate, Porto, Racing Club, Envigado FC, Colombia, Independiente Medellín, Atl</p><p><a href="/es/jugadores/afbfddfa/Juan-Quintero"><strong>Juan Quintero</strong></a> 2015-2025&nbsp;· DF&nbsp;· Deportivo Cali, Fortaleza, Deportivo Pereira, Vasco da Gama, Vila Nova, Juventude, Sporting Gijón</p><p><a href="/es/jugadores/3e4ad648/Luis-Quintero">Luis Quintero</a> 2023-2024&nbsp;· MF&nbsp;· Amorebieta</p><p><a href="/es/jugadores/7cb8a603/Miguel-Quintero">Miguel Quintero</a> 2019&nbsp;· DF</p><p><a href="/es/jugadores/a23ce55f/Yani-Quintero"><strong>Yani Quintero</strong></a> 2021-2025&nbsp;· MF&nbsp;· Junior, Deportes Quindío, Red Bull Bragantino</p><p><a href="/es/jugadores/0b56bdc8/Jhon-Quinto">Jhon Quinto</a> 2020-2021&nbsp;· FW&nbsp;· Deportivo Pereira</p><p><a href="/es/jugadores/1c31f21d/Brayan-Quiroga">Brayan Quiroga</a> 2015&nbsp;· DF</p><p><a href="/es/jugadores/12ddc664/Juan-Quitana">Juan Quitana</a> 2016&nbsp;· MF</p><p><a href="/es/jugadores/abf21b2b/Antonio-Rada">Antonio Rada</a> 1962&nbsp;· MF</p><p><a href="/es/jugadores/22884bf4/Alex-Rambal"><strong>Alex Rambal</strong></a> 2019-2025&nbsp;· DF&nbsp;· Always Ready, ADT Tarma, Millonarios, Deportivo Garcilaso, La Equidad</p><p><a href="/es/jugadores/395936af/Jose-Ramirez-Agudelo">José Ramírez Agudelo</a> 2015-2023&nbsp;· MF&nbsp;· Patriotas FC, Atlético Huila, Nueva Chicago</p><p><a href="/es/jugadores/c3b448e4/Carlos-Ramirez">Carlos Ramírez</a> 2020&nbsp;· FW&nbsp;· Patriotas FC</p><p><a href="/es/jugadores/7f54b9f6/Cristian-Ramirez">Cristian Ramírez</a> 2017-2018&nbsp;· DF</p><p><a href="/es/jugadores/2536c97d/David-Ramirez"><strong>David Ramírez</strong></a> 2021-2025&nbsp;· DF&nbsp;· Santa Fe</p><p><a href="/es/jugadores/811e2e8e/Delio-Ramirez"><strong>Delio Ramírez</strong></a> 2020-2025&nbsp;· MF&nbsp;· Boyacá Chicó, Deportivo Pereira</p><p><a href="/es/jugadores/599ac821/Duvan-Ramirez">Duván Ramírez</a> 2016-2017&nbsp;· MF</p><p><a href="/es/jugadores/bc4f972d/Edwin-Ramirez">Edwin Ramírez</a> 2016&nbsp;· FW</p><p><a href="/es/jugadores/8731b5f5/Harlin-Ramirez">Harlin Ramírez</a> 2019&nbsp;· MF</p><p><a href="/es/jugadores/babcc0b7/Joan-Ramirez">Joan Ramírez</a> 2021-2022&nbsp;· MF&nbsp;· Deportivo Cali</p><p><a href="/es/jugadores/d2bbe4b0/Jose-Ramirez">José Ramírez</a> 2017-2022&nbsp;· DF&nbsp;· Deportivo Pereira, Cantolao, Once Caldas</p><p><a href="/es/jugadores/375f0e11/Juan-Ramirez">Juan Ramírez</a> 2016-2017&nbsp;· MF</p><p><a href="/es/jugadores/8475cbe2/Juan-Ramirez"><strong>Juan Ramírez</strong></a> 2025&nbsp;· MF&nbsp;· Deportivo Pereira</p><p><a href="/es/jugadores/c8d5ac07/Juan-Ramirez">Juan Ramírez</a> 2024&nbsp;· MF&nbsp;· Millonarios</p><p><a href="/es/jugadores/5caf97e0/Mario-Ramirez"><strong>Mario Ramírez</strong></a> 2018-2020&nbsp;· MF&nbsp;· Alianza Universidad, Pirata, Universidad Técnica de Cajamarca, Patriotas FC</p><p><a href="/es/jugadores/d56f226f/Mateo-Ramirez">Mateo Ramírez</a> 2021&nbsp;· FW</p><p><a href="/es/jugadores/61478cfd/Mayra-Ramirez"><strong>Mayra Ramírez</strong></a> 2019-2025&nbsp;· FW&nbsp;· Chelsea, Levante, Colombia</p><p><a href="/es/jugadores/ba4de9db/Nilzo-Ramirez"><strong>Nilzo Ramirez</strong></a> 2024-2025&nbsp;· DF&nbsp;· Envigado FC</p><p><a href="/es/jugadores/2dbfa586/Daniel-Ramirez-Ramirez">Daniel Ramírez Ramirez</a> 2015-2022&nbsp;· DF&nbsp;· Once Caldas</p><p><a href="/es/jugadores/381fd37f/Winston-Ramirez">Winston Ramírez</a> 2020&nbsp;· FW&nbsp;· Cúcuta Deportivo</p><p><a href="/es/jugadores/90aa02c1/Yhonny-Ramirez">Yhonny Ramírez</a> 2015-2016&nbsp;· MF&nbsp;· Boyacá Chicó, Millonarios, Envigado FC, Junior, Real Cartagena</p><p><a href="/es/jugadores/c693cf7c/Adrian-Ramos">Adrián Ramos</a> 2009-2024&nbsp;· FW&nbsp;· América de Cali, Hertha BSC, Granada, Borussia Dortmund, Santa Fe, Colombia</p><p><a href="/es/jugadores/f5feeeb6/Edgar-Ramos">Edgar Ramos</a> 2003&nbsp;· DF,MF&nbsp;· Boyacá Chicó</p><p><a href="/es/jugadores/a8f32dc4/Edwin-Ramos"><strong>Edwin Ramos</strong></a> 2021-2025&nbsp;· MF&nbsp;· FC Tulsa, Beroe, Once Caldas, Cortuluá, Metropolitanos</p><p><a href="/es/jugadores/a9a540f8/Mauricio-Ramos-Florian">Mauricio Ramos Florian</a> 2018&nbsp;· DF</p><p><a href="/es/jugadores/070aad77/Jefferson-Ramos">Jefferson Ramos</a> 2020-2024&nbsp;· FW&nbsp;· Deportivo Cali, Deportivo Pasto, Cúcuta Deportivo, Envigado FC</p><p><a href="/es/jugadores/8e00887a/Jhon-Ramos">Jhon Ramos</a> 2017&nbsp;· FW</p><p><a href="/es/jugadores/a985cc77/Jhon-Ramos"><strong>Jhon Ramos</strong></a> 2025&nbsp;· FW&nbsp;· Portuguesa</p><p><a href="/es/jugadores/0c46ef06/Monica-Ramos"><strong>Mónica Ramos</strong></a> 2021-2024&nbsp;· MF&nbsp;· Grêmio FBPA, Colombia</p><p><a href="/es/jugadores/dfbbae79/Oscar-Ramos-Preciado">Óscar Ramos Preciado</a> 2021&nbsp;· GK&nbsp;· Deportivo Pasto, Jaguares de Córdoba</p><p><a href="/es/jugadores/8033faf3/Useche-Ramos">Useche Ramos</a> 2015&nbsp;· DF</p><p><a href="/es/jugadores/d3bb8071/Junior-Rangel-Cordon">Junior Rangel Cordón</a> 2015&nbsp;· MF</p><p><a href="/es/jugadores/be8fc30a/Michael-Rangel"><strong>Michael Rangel</strong></a> 2015-2025&nbsp;· FW&nbsp;· Llaneros, Junior, Alianza Petrolera, Bucaramanga, Deportes Tolima, Millonarios, América de Cali, Maz</p><p><a href="/es/jugadores/210b2e5d/Bryam-Rebellon">Bryam Rebellón</a> 2017-2023&nbsp;· DF,MF&nbsp;· El Paso Locomotive, Indy Eleven, Swope Park Rangers, Jacksonville Armada</p><p><a href="/es/jugadores/3df8a1da/Bryam-Rebellon">Bryam Rebellón</a> 2016&nbsp;· MF&nbsp;· LA Galaxy II</p><p><a href="/es/jugadores/473f424b/Bernardo-Redin">Bernardo Redín</a> 1990&nbsp;· MF&nbsp;· Colombia</p><p><a href="/es/jugadores/2baf9124/Nicole-Regnier">Nicole Regnier</a> 2016&nbsp;· FW</p><p><a href="/es/jugadores/f14768e7/Harold-Reina"><strong>Harold Reina</strong></a> 2015-2025&nbsp;· FW&nbsp;· Llaneros, Nacional Potosí, The Strongest, Cúcuta Deportivo, Deportivo Pasto, Deportivo Cali, Cortulu</p><p><a href="/es/jugadores/d9190bbf/Javier-Reina"><strong>Javier Reina</strong></a> 2014-2025&nbsp;· FW,MF&nbsp;· Deportivo Cali, Independiente Medellín, Seongnam FC, Bucaramanga, Once Caldas, América de Cali, Oper</p><p><a href="/es/jugadores/0ef7a259/Sergio-Reina">Sergio Reina</a> 2009-2015&nbsp;· DF&nbsp;· Zagłębie Lubin, Ayacucho, Sport Loreto, Patriotas FC</p><p><a href="/es/jugadores/2915d682/Jhon-Rendon">Jhon Rendón</a> 2016&nbsp;· MF&nbsp;· Once Caldas</p><p><a href="/es/jugadores/59bdb22b/Kevin-Rendon"><strong>Kevin Rendón</strong></a> 2015-2025&nbsp;· MF&nbsp;· Deportivo Pasto, Patriotas FC, Valour FC, Millonarios, Leones FC</p><p><a href="/es/jugadores/02cb6aec/Jorge-Rengifo">Jorge Rengifo</a> 2019-2023&nbsp;· MF&nbsp;· Millonarios, Águilas Doradas</p><p><a href="/es/jugadores/5cea17b9/Juan-Rengifo">Juan Rengifo</a> 2019&nbsp;· FW</p><p><a href="/es/jugadores/54cea58c/Nicolas-Rengifo"><strong>Nicolas Rengifo</strong></a> 2024-2025&nbsp;· MF&nbsp;· Deportivo Pereira</p><p><a href="/es/jugadores/c34e94fc/Ronal-Rengifo">Ronal Rengifo</a> 2015-2018&nbsp;· FW</p><p><a href="/es/jugadores/ab5723f1/Sergio-Rengifo">Sergio Rengifo</a> 2017&nbsp;· MF&nbsp;· Envigado FC</p><p><a href="/es/jugadores/4320d3a1/Andres-Renteria">Andrés Rentería</a> 2020-2021&nbsp;· DF&nbsp;· Alianza Petrolera</p><p><a href="/es/jugadores/d076c70c/Andres-Renteria"><strong>Andrés Rentería</strong></a> 2012-2025&nbsp;· FW,MF&nbsp;· Alianza Petrolera, Santos Laguna, Atlético Nacional, Jaguares de Córdoba, Águilas Doradas, Querétaro</p><p><a href="/es/jugadores/eba30808/Carlos-Renteria">Carlos Rentería</a> 2015&nbsp;· FW&nbsp;· Atlético Nacional, Real Cartagena, La Equidad, Atlético Huila, Patriotas FC, Junior</p><p><a href="/es/jugadores/f5b9009a/Darwin-Renteria">Darwin Rentería</a> 2017&nbsp;· MF&nbsp;· Deportivo JBL</p><p><a href="/es/jugadores/12ef651e/Davis-Renteria">Davis Rentería</a> 2024&nbsp;· DF</p><p><a href="/es/jugadores/a2e327d1/Dixon-Renteria"><strong>Dixon Rentería</strong></a> 2019-2021&nbsp;· DF&nbsp;· Santa Fe, Central Córdoba–SdE, Unión Magdalena</p><p><a href="/es/jugadores/77e5a20b/Edy-Renteria">Edy Rentería</a> 2015-2022&nbsp;· DF,MF&nbsp;· Unión Comercio, Sport Boys, Once Caldas</p><p><a href="/es/jugadores/c325f655/Kenier-Renteria">Kenier Rentería</a> 2015&nbsp;· MF</p><p><a href="/es/jugadores/a070e362/Luis-Renteria"><strong>Luis Renteria</strong></a> 2023-2024&nbsp;· MF</p><p><a href="/es/jugadores/da669483/Richard-Renteria">Richard Rentería</a> 2015-2023&nbsp;· DF&nbsp;· Deportivo Cali, Alianza Petrolera, Chattanooga Red Wolves, Guaraní</p><p><a href="/es/jugadores/1ff8c2a6/Stiven-Renteria">Stiven Rentería</a> 2017-2021&nbsp;· FW&nbsp;· Jaguares de Córdoba, Metropolitanos, Deportivo Cali</p><p><a href="/es/jugadores/b32d7f5b/Victor-Renteria-Tovar">Víctor Rentería Tovar</a> 2016&nbsp;· FW&nbsp;· Ureña</p><p><a href="/es/jugadores/6ab3e391/Wason-Renteria">Wason Rentería</a> 2006-2017&nbsp;· FW&nbsp;· Millonarios, Braga, Internacional, Strasbourg, Once Caldas, La Equidad, Boyacá Chicó, Atlético Minei</p><p><a href="/es/jugadores/de3f8ca0/Cristian-Restrepo">Cristian Restrepo</a> 2015-2017&nbsp;· MF&nbsp;· Atlético Huila, Independiente Medellín, Jaguares de Córdoba</p><p><a href="/es/jugadores/bf4e0242/Daniel-Restrepo">Daniel Restrepo</a> 2017-2022&nbsp;· MF&nbsp;· Deportivo Pereira, Bucaramanga, Independiente Medellín, Deportivo Pasto, Envigado FC, Cúcuta Deporti</p><p><a href="/es/jugadores/8f848aa4/Edisson-Restrepo"><strong>Edisson Restrepo</strong></a> 2018-2025&nbsp;· DF&nbsp;· Nacional Potosí, Leones FC, Deportivo Táchira, Unión Magdalena, Atlético Huila, Deportivo Pereira</p><p><a href="/es/jugadores/c746f192/Eyder-Restrepo"><strong>Eyder Restrepo</strong></a> 2025&nbsp;· MF&nbsp;· Llaneros</p><p><a href="/es/jugadores/e3da5fca/Jonathan-Restrepo">Jonathan Restrepo</a> 2015&nbsp;· MF</p><p><a href="/es/jugadores/99d7ca2b/Kelly-Restrepo"><strong>Kelly Restrepo</strong></a> 2024&nbsp;· FW</p><p><a href="/es/jugadores/a2e95272/Marcela-Restrepo"><strong>Marcela Restrepo</strong></a> 2018-2024&nbsp;· MF&nbsp;· Colombia</p><p><a href="/es/jugadores/c09c0e3c/Mauricio-Restrepo">Mauricio Restrepo</a> 2015-2020&nbsp;· MF&nbsp;· La Equidad, Águilas Doradas, Once Caldas, Patriotas FC</p><p><a href="/es/jugadores/d35c95f9/Valentina-Restrepo">Valentina Restrepo</a> 2018&nbsp;· FW&nbsp;· Colombia</p><p><a href="/es/jugadores/5fe1f3ac/Valery-Restrepo">Valery Restrepo</a> 2021&nbsp;· GK</p><p><a href="/es/jugadores/7720f7b1/Walter-Restrepo">Wálter Restrepo</a> 2011-2019&nbsp;· MF&nbsp;· Fort Lauderdale Strikers, New York Cosmos, San Antonio FC, San Antonio Scorpions, Tampa Bay Rowdies,</p><p><a href="/es/jugadores/51935346/Juan-Rey"><strong>Juan Rey</strong></a> 2024&nbsp;· FW</p><p><a href="/es/jugadores/1f1c9ff0/Kenner-Rey">Kenner Rey</a> 2015&nbsp;· DF</p><p><a href="/es/jugadores/36ab14f5/Andres-Reyes"><strong>Andrés Reyes</strong></a> 2018-2025&nbsp;· DF&nbsp;· San Diego FC, New York Red Bulls, Atlético Nacional, Inter Miami, New York Red Bulls II</p><p><a href="/es/jugadores/0aa20714/Hugo-Reyes">Hugo Reyes</a> 2017&nbsp;· FW</p><p><a href="/es/jugadores/c90a7278/Maria-Reyes">María Reyes</a> 2019-2024&nbsp;· MF&nbsp;· Colombia</p><p><a href="/es/jugadores/b0ca94df/Nelson-Reyes">Nelson Reyes</a> 2023-2024&nbsp;· MF&nbsp;· Bucaramanga, Alianza Petrolera</p><p><a href="/es/jugadores/feaa919c/Victor-Reyes"><strong>Victor Reyes</strong></a> 2025&nbsp;· MF&nbsp;· Deportes Tolima</p><p><a href="/es/jugadores/e60d17c2/Brayan-Riascos"><strong>Brayan Riascos</strong></a> 2016-2024&nbsp;· FW,MF&nbsp;· CD Nacional, Qingdao West Coast, Gaziantep FK, Marítimo, Grasshopper, Al-Khaleej, Atlético Huila</p><p><a href="/es/jugadores/44e52b84/Carlos-Riascos">Carlos Riascos</a> 2015-2019&nbsp;· DF&nbsp;· Alianza Petrolera, Atlético Huila</p><p><a href="/es/jugadores/52365f23/Duvan-Riascos">Duvan Riascos</a> 2023-2024&nbsp;· FW&nbsp;· Deportivo Pasto</p><p><a href="/es/jugadores/4e42d741/Duvier-Riascos">Duvier Riascos</a> 2011-2022&nbsp;· FW&nbsp;· Tijuana, Shanghai Shenhua, Vasco da Gama, Morelia, Millonarios, Pachuca, Puebla, Deportivo Pasto, De</p><p><a href="/es/jugadores/ac436673/Jhojan-Riascos"><strong>Jhojan Riascos</strong></a> 2025&nbsp;· FW&nbsp;· Manta Fútbol Club</p><p><a href="/es/jugadores/37b46c42/Kevin-Riascos"><strong>Kevin Riascos</strong></a> 2019-2025&nbsp;· DF&nbsp;· Boyacá Chicó, Deportivo Pasto, Jaguares de Córdoba, Charlotte Independence, Deportivo Cali</p><p><a href="/es/jugadores/bf19153a/Leider-Riascos"><strong>Léider Riascos</strong></a> 2020-2025&nbsp;· DF&nbsp;· La Equidad, Deportes Tolima</p><p><a href="/es/jugadores/0fe649bb/Misael-Riascos">Misael Riascos</a> 2015-2020&nbsp;· MF&nbsp;· Boyacá Chicó, Al-Batin, América de Cali, Peñarol</p><p><a href="/es/jugadores/0dcd6cf5/Weiner-Riascos">Weiner Riascos</a> 2016-2017&nbsp;· FW</p><p><a href="/es/jugadores/e08d8909/Hamilton-Ricard">Hámilton Ricard</a> 1998-2006&nbsp;· FW&nbsp;· Middlesbrough, Danubio, Deportes Quindío, Numancia</p><p><a href="/es/jugadores/c7528589/Jose-Ricardo-Cortes"><strong>José Ricardo Cortés</strong></a> 2017-2024&nbsp;· FW&nbsp;· Destroyers, Carlos A. Mannucci, Diósgyőr, Bucaramanga</p><p><a href="/es/jugadores/e848e971/Elan-Ricardo"><strong>Elan Ricardo</strong></a> 2023-2025&nbsp;· MF&nbsp;· La Equidad, Beşiktaş</p><p><a href="/es/jugadores/84939c95/Jose-Ricardo-Perez">José Ricardo Pérez</a> 1990&nbsp;· DF,MF</p><p><a href="/es/jugadores/948e255b/Yobani-Ricardo">Yobani Ricardo</a> 2015-2017&nbsp;· FW&nbsp;· Jaguares de Córdoba, Atlético Huila, Envigado FC</p><p><a href="/es/jugadores/4db5b8cb/Andres-Ricaurte"><strong>Andrés Ricaurte</strong></a> 2015-2025&nbsp;· MF&nbsp;· Fortaleza FC, Independiente Medellín, Atlético Huila, FC Dallas, Águilas Doradas, Emelec</p><p><a href="/es/jugadores/e2a382c9/Freddy-Rincon">Freddy Rincón</a> 1990-1998&nbsp;· MF&nbsp;· Napoli, Real Madrid, Colombia, Corinthians</p><p><a href="/es/jugadores/dbc1ce65/Nicolas-Rincon"><strong>Nicolas Rincon</strong></a> 2022-2025&nbsp;· MF&nbsp;· Columbus Crew 2, North Carolina FC</p><p><a href="/es/jugadores/683b919f/Sebastian-Rincon">Sebastián Rincón</a> 2014-2022&nbsp;· FW,MF&nbsp;· Tigre, Aldosivi, Barracas Central, Vitória Guimarães, Huracán, Sarmiento</p><p><a href="/es/jugadores/4992a935/Yoreli-Rincon"><strong>Yoreli Rincón</strong></a> 2011-2023&nbsp;· FW,MF&nbsp;· Sampdoria, Internazionale, Colombia, Iranduba</p><p><a href="/es/jugadores/b0aff02d/Joyce-Rios"><strong>Joyce Rios</strong></a> 2023-2025&nbsp;· DF&nbsp;· Deportivo Pasto, Fortaleza FC, América de Cali</p><p><a href="/es/jugadores/5eed9d2d/Juan-Rios">Juan Ríos</a> 2018&nbsp;· DF</p><p><a href="/es/jugadores/6189dbdc/Juan-Rios">Juan Ríos</a> 2015-2021&nbsp;· DF&nbsp;· Club Petrolero, Real Tomayapo, Universitario de Sucre</p><p><a href="/es/jugadores/72da065d/Richard-Rios"><strong>Richard Ríos</strong></a> 2020-2026&nbsp;· MF&nbsp;· Palmeiras, Colombia, Guarani, Mazatlán</p><p><a href="/es/jugadores/41cddd16/Jaider-Riquett"><strong>Jáider Riquett</strong></a> 2017-2025&nbsp;· DF&nbsp;· Once Caldas, La Equidad, Alianza Petrolera</p><p><a href="/es/jugadores/c57d4fc3/Avimiled-Rivas">Avimiled Rivas</a> 2003-2018&nbsp;· MF&nbsp;· Deportes Tolima, América de Cali, Boyacá Chicó, Once Caldas, Patriotas FC, Atlético Huila, Deportes </p><p><a href="/es/jugadores/e5b24385/Brahyan-Rivas">Brahyan Rivas</a> 2016-2018&nbsp;· MF&nbsp;· Atlético Huila</p><p><a href="/es/jugadores/02832bd0/Carlos-Rivas">Carlos Rivas</a> 2014-2024&nbsp;· FW&nbsp;· Orlando City, La Equidad, Atlético Nacional, Once Caldas, Deportivo Cali, Deportivo Cuenca, New York</p><p><a href="/es/jugadores/a700cb44/Carlos-Rivas">Carlos Rivas</a> 2019&nbsp;· MF</p><p><a href="/es/jugadores/f5277538/Rodrigo-Rivas-Gonzalez"><strong>Rodrigo Rivas Gonzalez</strong></a> 2017-2024&nbsp;· FW&nbsp;· Universidad Católica, Orense, Academia Puerto Cabello, Técnico Universitario</p><p><a href="/es/jugadores/6f45d594/Ivan-Rivas"><strong>Iván Rivas</strong></a> 2015-2024&nbsp;· FW,MF&nbsp;· Patriotas FC, La Equidad, Expreso Rojo, Águilas Doradas, Junior, Deportivo Pasto, Santa Fe, Cúcuta D</p><p><a href="/es/jugadores/d8cb591c/Janeiler-Rivas">Janeiler Rivas</a> 2015-2022&nbsp;· DF&nbsp;· Alianza Atlético, Carlos Stein, Boyacá Chicó, Millonarios, Atlético Huila</p><p><a href="/es/jugadores/d33ae8b9/Jesus-Rivas"><strong>Jesús Rivas</strong></a> 2017-2025&nbsp;· MF&nbsp;· Águilas Doradas</p><p><a href="/es/jugadores/b1cbf6a3/Kevin-Rivas">Kevin Rivas</a> 2018&nbsp;· DF&nbsp;· América de Cali</p><p><a href="/es/jugadores/6c49ca2e/Luis-Rivas"><strong>Luis Rivas</strong></a> 2023-2025&nbsp;· FW&nbsp;· Zamora</p><p><a href="/es/jugadores/a17aa07d/Luis-Rivas"><strong>Luis Rivas</strong></a> 2017-2018&nbsp;· GK</p><p><a href="/es/jugadores/3cb719d8/Mauricio-Rivas">Mauricio Rivas</a> 2016&nbsp;· DF</p><p><a href="/es/jugadores/b1be1e0e/Nelson-Rivas">Nelson Rivas</a> 2007-2012&nbsp;· DF&nbsp;· Deportivo Cali, Internazionale, Livorno, River Plate, Montreal Impact</p><p><a href="/es/jugadores/d189a8a2/Jeferson-Rivas-Tirado">Jeferson Rivas Tirado</a> 2022-2023&nbsp;· FW&nbsp;· Santa Fe, Águilas Doradas</p><p><a href="/es/jugadores/fce28605/Wilmar-Rivas">Wilmar Rivas</a> 2024&nbsp;· MF&nbsp;· El Paso Locomotive</p><p><a href="/es/jugadores/7c094b1a/Christian-Rivera"><strong>Christian Rivera</strong></a> 2016-2025&nbsp;· MF&nbsp;· Tijuana, Sport Recife, Deportivo Cali, Deportivo Pasto, Querétaro</p><p><a href="/es/jugadores/c5443ac8/Daniel-Rivera"><strong>Daniel Rivera</strong></a> 2024-2025&nbsp;· DF&nbsp;· Junior, Fortaleza FC</p><p><a href="/es/jugadores/27fc0e2b/Jorge-Rivera-Galindo">Jorge Rivera Galindo</a> 2015&nbsp;· GK&nbsp;· Alianza Atlético, Unión Huaral, León de Huánuco, Sport Huancayo, Sport Loreto, O'Higgins, Juan Auric</p><p><a href="/es/jugadores/1b2d5570/Harold-Rivera"><strong>Harold Rivera</strong></a> 2015-2025&nbsp;· MF&nbsp;· Junior, Santa Fe, Jaguares de Córdoba, América de Cali, Patriotas FC, Atlético Huila, Alianza Petrol</p><p><a href="/es/jugadores/84ee78d4/Janny-Rivera">Janny Rivera</a> 2014&nbsp;· MF&nbsp;· Atlanta Silverbacks</p><p><a href="/es/jugadores/71353259/Yamilson-Rivera">Yamilson Rivera</a> 2014-2019&nbsp;· FW&nbsp;· Santa Fe, Cúcuta Deportivo, Deportivo Pasto, América de Cali, León, Envigado FC</p><p><a href="/es/jugadores/9c18e72f/Elkin-Rivero"><strong>Elkin Rivero</strong></a> 2025&nbsp;· MF&nbsp;· Atlético Nacional</p><p><a href="/es/jugadores/6578eb0a/Santiago-Riveros">Santiago Riveros</a> 2022&nbsp;· MF</p><p><a href="/es/jugadores/7dcb8cb2/Andres-Roa"><strong>Andrés Roa</strong></a> 2015-2025&nbsp;· FW,MF&nbsp;· Panetolikos, Deportivo Cali, Independiente, Huracán, Argentinos Juniors, Al-Batin</p><p><a href="/es/jugadores/dc238a5d/Nicolas-Roa">Nicolás Roa</a> 2017-2020&nbsp;· DF,MF&nbsp;· Expreso Rojo, Bucaramanga, Deportivo Pasto, Atlético Huila, Deportivo Cali</p><p><a href="/es/jugadores/da89dfcd/Santiago-Roa"><strong>Santiago Roa</strong></a> 2017-2024&nbsp;· DF&nbsp;· Patriotas FC, Expreso Rojo, Alianza Petrolera, Once Caldas</p><p><a href="/es/jugadores/47a27738/Luis-Robayo">Luis Robayo</a> 2015&nbsp;· MF</p><p><a href="/es/jugadores/9f761ae1/Rafael-Robayo">Rafael Robayo</a> 2012-2019&nbsp;· MF&nbsp;· Millonarios, Deportes Tolima, Bucaramanga, Patriotas FC, Chicago Fire</p><p><a href="/es/jugadores/271ad457/Jose-Robin-Gonzalez">José Robín González</a> 2016&nbsp;· MF&nbsp;· Atlético Huila</p><p><a href="/es/jugadores/b48a6ed4/Gisela-Robledo">Gisela Robledo</a> 2019-2023&nbsp;· FW&nbsp;· Colombia</p><p><a href="/es/jugadores/956b2952/Leider-Robledo"><strong>Leider Robledo</strong></a> 2024&nbsp;· FW&nbsp;· Envigado FC</p><p><a href="/es/jugadores/e19b8fa6/Carlos-Robles-Rocha">Carlos Robles Rocha</a> 2016-2024&nbsp;· MF&nbsp;· Atlético Huila, Deportes Tolima, Deportes Quindío, Deportivo Cali, Deportivo Táchira, The Strongest,</p><p><a href="/es/jugadores/03ea5bee/Carmen-Rodallega">Carmen Rodallega</a> 2011-2012&nbsp;· FW&nbsp;· Colombia</p><p><a href="/es/jugadores/9683d0b2/Hugo-Rodallega"><strong>Hugo Rodallega</strong></a> 2005-2025&nbsp;· FW&nbsp;· Santa Fe, Wigan Athletic, Fulham, Trabzonspor, Denizlispor, Akhisar Belediyespor, Necaxa, Bahia, Mon</p><p><a href="/es/jugadores/9ae70269/Yeferson-Rodallega"><strong>Yeferson Rodallega</strong></a> 2020-2025&nbsp;· DF&nbsp;· Independiente Medellín, Envigado FC</p><p><a href="/es/jugadores/15ddd65f/Carlos-Rodas">Carlos Rodas</a> 2015&nbsp;· FW&nbsp;· Deportes Quindío, Deportivo Pasto, Cortuluá, Once Caldas, Deportivo Pereira</p><p><a href="/es/jugadores/e0edb46c/Mateo-Rodas"><strong>Mateo Rodas</strong></a> 2017-2025&nbsp;· DF&nbsp;· Once Caldas, Patriotas FC, Orlando City B, Alianza Petrolera</p><p><a href="/es/jugadores/06473301/Oscar-Rodas">Óscar Rodas</a> 2014-2018&nbsp;· FW&nbsp;· Santa Fe, Águilas Doradas, Deportes Tolima, Once Caldas, Boyacá Chicó, Zamora</p><p><a href="/es/jugadores/d839e34f/Santiago-Rodas">Santiago Rodas</a> 2015-2018&nbsp;· GK&nbsp;· Aragua</p><p><a href="/es/jugadores/1376fea2/Ali-Rodolfo-Reyes">Alí Rodolfo Reyes</a> 2015-2017&nbsp;· MF&nbsp;· Cortuluá</p><p><a href="/es/jugadores/60c2f483/Jose-Rodrigo-Castillo">José Rodrigo Castillo</a> 2015-2016&nbsp;· MF</p><p><a href="/es/jugadores/9043dc26/Ronny-Rodriguez"><strong>Ronny Rodríguez </strong></a> 2015-2025&nbsp;· MF&nbsp;· Rajasthan United FC, Libertad Gran Mamoré FC, Boyacá Chicó</p><p><a href="/es/jugadores/a09cb100/Alejandro-Rodriguez"><strong>Alejandro Rodríguez</strong></a> 2021-2025&nbsp;· GK&nbsp;· Deportivo Cali</p><p><a href="/es/jugadores/0e9ea6cf/Angelo-Rodriguez"><strong>Angelo Rodríguez</strong></a> 2015-2025&nbsp;· FW&nbsp;· Santa Fe, Deportivo Cali, Deportes Tolima, Minnesota United, Deportivo Pereira, Alianza Petrolera, R</p><p><a href="/es/jugadores/c4e26bcb/Arley-Rodriguez"><strong>Arley Rodríguez</strong></a> 2015-2024&nbsp;· FW,MF&nbsp;· Alianza Lima, Atlético Nacional, Deportivo Pereira, Santa Fe, Alianza Petrolera, Carlos A. Mannucci,</p><p><a href="/es/jugadores/5bd16bf0/Cristian-Rodriguez">Cristian Rodríguez</a> 2021&nbsp;· MF</p><p><a href="/es/jugadores/9455e863/Daniel-Rodriguez">Daniel Rodríguez</a> 2016-2017&nbsp;· GK&nbsp;· Cortuluá</p><p><a href="/es/jugadores/513e32a4/Darwin-Rodriguez">Darwin Rodríguez</a> 2019-2020&nbsp;· MF&nbsp;· El Nacional</p><p><a href="/es/jugadores/eea09b76/Diego-Rodriguez">Diego Rodríguez</a> 2021-2023&nbsp;· MF&nbsp;· Envigado FC, Deportes Quindío</p><p><a href="/es/jugadores/b9f0bcaa/Eduardo-Rodriguez">Eduardo Rodríguez</a> 2016-2017&nbsp;· MF&nbsp;· Deportivo JBL</p><p><a href="/es/jugadores/09e5ae16/Emerson-Rodriguez"><strong>Emerson Rodríguez</strong></a> 2020-2025&nbsp;· MF&nbsp;· Ludogorets Razgrad, Millonarios, Inter Miami, Santos Laguna, Vasco da Gama</p><p><a href="/es/jugadores/59e3eaf9/Fabio-Rodriguez">Fabio Rodríguez</a> 2014-2021&nbsp;· DF&nbsp;· Deportes Quindío, Águilas Doradas, Bucaramanga, Deportivo Pereira</p><p><a href="/es/jugadores/7f6ecb67/Gabriela-Rodriguez">Gabriela Rodríguez</a> 2021-2022&nbsp;· FW&nbsp;· Colombia</p><p><a href="/es/jugadores/f70ab512/Francisco-Rodriguez-Ibarra">Francisco Rodríguez Ibarra</a> 2015-2023&nbsp;· DF,MF&nbsp;· Águilas Doradas, Bucaramanga, Deportivo Pasto, Boyacá Chicó, Atlético Venezuela</p><p><a href="/es/jugadores/715bf047/James-Rodriguez"><strong>James Rodríguez</strong></a> 2010-2026&nbsp;· FW,MF&nbsp;· León, Rayo Vallecano, Real Madrid, Colombia, Porto, Bayern Munich, Banfield, Monaco, Everton, Olympi</p><p><a href="/es/jugadores/81695d49/Jamil-Rodriguez">Jamil Rodriguez</a> 2019&nbsp;· DF</p><p><a href="/es/jugadores/d2e5e83e/Jesus-Rodriguez">Jesús Rodríguez</a> 2016&nbsp;· FW&nbsp;· Junior</p><p><a href="/es/jugadores/84b7c924/Joao-Rodriguez"><strong>Joao Rodríguez</strong></a> 2014-2024&nbsp;· FW,MF&nbsp;· América de Cali, Patriotas FC, Central Córdoba–SdE, Tenerife, Sint-Truiden, Necaxa, Jaguares de Córd</p><p><a href="/es/jugadores/c6b8595a/Julian-Rodriguez">Julián Rodríguez</a> 2023&nbsp;· DF</p><p><a href="/es/jugadores/84b997c6/Kevin-Rodriguez">Kevin Rodríguez</a> 2023&nbsp;· FW</p><p><a href="/es/jugadores/082ba04b/Luis-Rodriguez"><strong>Luis Rodríguez</strong></a> 2017-2025&nbsp;· DF&nbsp;· Aizawl, Envigado FC, South Georgia Tormenta FC</p><p><a href="/es/jugadores/ca4ed14e/Milton-Rodriguez">Milton Rodríguez</a> 2006-2011&nbsp;· FW&nbsp;· Atlético Huila, Millonarios, Deportivo Cali, Envigado FC, FC Dallas, Newcastle Jets, Deportes Tolima</p><p><a href="/es/jugadores/718c76da/Nicolas-Rodriguez"><strong>Nicolás Rodríguez</strong></a> 2024-2025&nbsp;· MF&nbsp;· Orlando City, Fortaleza FC</p><p><a href="/es/jugadores/3ff1d854/Omar-Rodriguez">Omar Rodríguez</a> 2018-2023&nbsp;· GK&nbsp;· Santa Fe</p><p><a href="/es/jugadores/f1bf0cbc/Dario-Rodriguez-Parra">Dario Rodríguez Parra</a> 2015-2021&nbsp;· FW,MF&nbsp;· Santa Fe, Deportivo Pasto, Bucaramanga, Once Caldas, Fortaleza FC, Deportes Quindío</p><p><a href="/es/jugadores/6ae17961/Yesid-Rodriguez-Sanes">Yesid Rodríguez Sanes</a> 2016&nbsp;· DF</p><p><a href="/es/jugadores/ee6ef201/Saramys-Rodriguez">Saramys Rodríguez</a> 2017&nbsp;· MF</p><p><a href="/es/jugadores/256ec872/Sebastian-Rodriguez"><strong>Sebastian Rodríguez</strong></a> 2002-2025&nbsp;· DF,MF&nbsp;· Águilas Doradas, Pogoń Szczecin</p><p><a href="/es/jugadores/5f81b419/Sebastian-Rodriguez">Sebastián Rodriguez</a> 2017&nbsp;· DF</p><p><a href="/es/jugadores/3ddf8cb9/Steven-Rodriguez"><strong>Steven Rodríguez</strong></a> 2019-2025&nbsp;· FW&nbsp;· Junior, Alianza Petrolera, Independiente Medellín, Envigado FC</p><p><a href="/es/jugadores/b743019d/Daniel-Rojano">Daniel Rojano</a> 2016-2021&nbsp;· MF&nbsp;· Once Caldas, Deportivo Pasto</p><p><a href="/es/jugadores/afa75271/Alejandro-Rojas">Alejandro Rojas</a> 2015&nbsp;· MF</p><p><a href="/es/jugadores/eb189764/Alexei-Rojas"><strong>Alexei Rojas</strong></a> 2022-2025&nbsp;· GK&nbsp;· Arsenal U21, Arsenal</p><p><a href="/es/jugadores/fdf6a758/Carlos-Rojas">Carlos Rojas</a> 2017-2018&nbsp;· FW&nbsp;· Envigado FC</p><p><a href="/es/jugadores/29507b18/Cristian-Rojas">Cristian Rojas</a> 2018&nbsp;· FW</p><p><a href="/es/jugadores/e996f6fb/Gustavo-Rojas">Gustavo Rojas</a> 2015&nbsp;· DF&nbsp;· Millonarios, Atlético Huila, Cortuluá</p><p><a href="/es/jugadores/331ed14a/Henry-Rojas">Henry Rojas</a> 2015-2022&nbsp;· MF&nbsp;· Millonarios, Deportivo Pereira, Atlético Huila, Once Caldas, Atlético Nacional, Deportes Tolima, Dep</p><p><a href="/es/jugadores/08b1c6d9/Ivan-Rojas"><strong>Iván Rojas</strong></a> 2016-2025&nbsp;· MF&nbsp;· Once Caldas, Envigado FC, Santa Fe</p><p><a href="/es/jugadores/f338069c/Johan-Rojas"><strong>Johan Rojas</strong></a> 2022-2025&nbsp;· FW,MF&nbsp;· Monterrey, Necaxa, La Equidad</p><p><a href="/es/jugadores/20185c45/Juan-Rojas">Juan Rojas</a> 2022-2024&nbsp;· MF&nbsp;· The Villages SC</p><p><a href="/es/jugadores/d1f2760e/Julian-Rojas">Julian Rojas</a> 2020&nbsp;· DF</p><p><a href="/es/jugadores/0513704e/Kevin-Rojas">Kevin Rojas</a> 2015-2017&nbsp;· MF&nbsp;· Cortuluá</p><p><a href="/es/jugadores/bd991448/David-Rojas-Mena">David Rojas Mena</a> 2013-2014&nbsp;· DF</p><p><a href="/es/jugadores/cca919b1/Alejandro-Rojo">Alejandro Rojo</a> 2024&nbsp;· GK</p><p><a href="/es/jugadores/7b46cd50/Sergio-Roman-Palacios"><strong>Sergio Roman Palacios</strong></a> 2015-2024&nbsp;· GK&nbsp;· La Equidad, Once Caldas</p><p><a href="/es/jugadores/90e03ee5/Santiago-Roman">Santiago Román</a> 2015-2017&nbsp;· FW</p><p><a href="/es/jugadores/be49c8e1/Carlos-Romana"><strong>Carlos Romaña</strong></a> 2018-2025&nbsp;· DF&nbsp;· Bucaramanga, Danubio, Boyacá Chicó</p><p><a href="/es/jugadores/99280e18/Enrique-Romana">Enrique Romaña</a> 2014&nbsp;· DF&nbsp;· Manta Fútbol Club</p><p><a href="/es/jugadores/7fb7023f/Harold-Romana">Harold Romaña</a> 2016&nbsp;· MF</p><p><a href="/es/jugadores/4e32c2d6/Jhohan-Romana"><strong>Jhohan Romaña</strong></a> 2016-2025&nbsp;· DF&nbsp;· San Lorenzo, Austin FC, Guaraní, Club Olimpia</p><p><a href="/es/jugadores/90926664/Ramon-Romana">Ramón Romaña</a> 2017&nbsp;· MF</p><p><a href="/es/jugadores/1e73a595/Roameth-Romana"><strong>Roameth Romaña</strong></a> 2025&nbsp;· GK&nbsp;· Llaneros</p><p><a href="/es/jugadores/42cfd57f/Camilo-Romero">Camilo Romero</a> 2021-2024&nbsp;· GK</p><p><a href="/es/jugadores/c19799ab/Farid-Romero"><strong>Farid Romero</strong></a> 2025&nbsp;· DF&nbsp;· Universidad Técnica de Cajamarca</p><p><a href="/es/jugadores/3953a9d2/Jessica-Romero">Jessica Romero</a> 2021&nbsp;· DF</p><p><a href="/es/jugadores/b62b61f8/Joel-Romero"><strong>Joel Romero</strong></a> 2025&nbsp;· MF&nbsp;· América de Cali</p><p><a href="/es/jugadores/320b469b/Juan-Romero">Juan Romero</a> 2023&nbsp;· FW</p><p><a href="/es/jugadores/e257f400/Kena-Romero">Kena Romero</a> 2021&nbsp;· FW</p><p><a href="/es/jugadores/64652f6b/Mauricio-Romero">Mauricio Romero</a> 2006-2007&nbsp;· MF&nbsp;· Deportes Quindío, Cúcuta Deportivo, Bucaramanga, Cienciano, Junior, Castellón, América de Cali</p><p><a href="/es/jugadores/e7435d8b/Ricardo-Rosales"><strong>Ricardo Rosales</strong></a> 2021-2024&nbsp;· FW&nbsp;· Millonarios</p><p><a href="/es/jugadores/43cc220a/Yilson-Rosales"><strong>Yilson Rosales</strong></a> 2018-2025&nbsp;· DF&nbsp;· Alianza Petrolera, Deportivo Pasto, Deportes Tolima</p><p><a href="/es/jugadores/1c886b0e/Daniel-Rosero"><strong>Daniel Rosero</strong></a> 2015-2025&nbsp;· DF&nbsp;· Sporting Kansas City, Junior, Deportivo Cali, Patriotas FC, Arsenal de Sarandí</p><p><a href="/es/jugadores/ae8a1745/Francisco-Rosero">Francisco Rosero</a> 2016&nbsp;· MF</p><p><a href="/es/jugadores/fbb5101d/Kevin-Rosero"><strong>Kevin Rosero</strong></a> 2021-2025&nbsp;· FW,MF&nbsp;· Necaxa, PAS Giannina, Volos N.F.C.</p><p><a href="/es/jugadores/d8efa014/Rene-Rosero">René Rosero</a> 2015&nbsp;· MF&nbsp;· Deportivo Pasto</p><p><a href="/es/jugadores/59d17998/Pablo-Rosso">Pablo Rosso</a> 2024&nbsp;· MF</p><p><a href="/es/jugadores/6cf6f67f/Brayan-Rovira"><strong>Brayan Rovira</strong></a> 2015-2025&nbsp;· FW,MF&nbsp;· Deportes Tolima, Atlético Nacional, Bucaramanga, Envigado FC, Universidad Católica</p><p><a href="/es/jugadores/10d35fa6/Daniel-Rovira"><strong>Daniel Rovira</strong></a> 2019-2024&nbsp;· DF,MF&nbsp;· Pittsburgh Riverhounds</p><p><a href="/es/jugadores/92b6b2ad/Jairo-Roy-Castillo">Jairo Roy Castillo</a> 2016-2021&nbsp;· FW&nbsp;· Deportes Quindío, Bucaramanga</p><p><a href="/es/jugadores/baec4f99/Ronaldo-Royero">Ronaldo Royero</a> 2021&nbsp;· MF&nbsp;· Atlético Huila</p><p><a href="/es/jugadores/d3fc03fb/Carlos-Rua">Carlos Rúa</a> 2017-2018&nbsp;· MF&nbsp;· Expreso Rojo, Deportivo Pasto</p><p><a href="/es/jugadores/e12d5141/Claudio-Rubiano">Claudio Rubiano</a> 2016-2017&nbsp;· MF&nbsp;· Atlético Huila</p><p><a href="/es/jugadores/0d72f134/Juan-Rubiano">Juan Rubiano</a> 2022-2023&nbsp;· FW&nbsp;· Deportes Tolima</p><p><a href="/es/jugadores/dbf7fd67/Nicolas-Rubiano">Nicolas Rubiano</a> 2021&nbsp;· MF</p><p><a href="/es/jugadores/2f05c5f2/Juan-Rubio">Juan Rubio</a> 2023&nbsp;· MF</p><p><a href="/es/jugadores/09f70edf/Julieth-Rubio">Julieth Rubio</a> 2019&nbsp;· DF</p><p><a href="/es/jugadores/2716f169/Nicolas-Rubio">Nicolás Rubio</a> 2015-2023&nbsp;· MF&nbsp;· Envigado FC</p><p><a href="/es/jugadores/b5ea2587/Pablo-Rubio">Pablo Rubio</a> 2023&nbsp;· MF&nbsp;· Boyacá Chicó</p><p><a href="/es/jugadores/ceb09cc5/Luther-Rueda">Luther Rueda</a> 2024&nbsp;· FW</p><p><a href="/es/jugadores/f9b481c9/Yorman-Rueda-Munoz">Yorman Rueda Muñoz</a> 2016&nbsp;· MF&nbsp;· Fortaleza FC</p><p><a href="/es/jugadores/2edc3482/Carlos-Rueda-Rodriguez">Carlos Rueda Rodríguez</a> 2016&nbsp;· FW&nbsp;· Fortaleza FC</p><p><a href="/es/jugadores/bd420a51/Carlos-Ruiz">Carlos Ruiz</a> 2018&nbsp;· MF&nbsp;· Boyacá Chicó</p><p><a href="/es/jugadores/e8e30788/Deimer-Ruiz">Deimer Ruiz</a> 2015-2016&nbsp;· DF&nbsp;· Boyacá Chicó</p><p><a href="/es/jugadores/cf6c938a/Diego-Ruiz"><strong>Diego Ruíz</strong></a> 2019-2025&nbsp;· DF&nbsp;· Fortaleza FC, Patriotas FC, Unión Magdalena</p><p><a href="/es/jugadores/149d6923/Esteban-Ruiz">Esteban Ruiz</a> 2016-2021&nbsp;· GK&nbsp;· La Equidad, Millonarios</p><p><a href="/es/jugadores/c36d5c16/Juan-Ruiz">Juan Ruiz</a> 2019-2024&nbsp;· MF&nbsp;· Envigado FC</p><p><a href="/es/jugadores/5ed6bf7a/Leonardo-Ruiz"><strong>Leonardo Ruíz</strong></a> 2017-2024&nbsp;· FW&nbsp;· Rio Ave, UD Logroñés, Estoril, Zorya Luhansk</p><p><a href="/es/jugadores/65766650/Daniel-Ruiz-Rivera"><strong>Daniel Ruiz Rivera</strong></a> 2021-2025&nbsp;· MF&nbsp;· Millonarios, Santos</p><p><a href="/es/jugadores/5c459125/Santiago-Ruiz">Santiago Ruiz</a> 2015-2023&nbsp;· DF&nbsp;· Envigado FC, Alianza Petrolera, Patriotas FC</p><p><a href="/es/jugadores/7630fa3c/Sebastain-Ruiz">Sebastáin Ruiz</a> 2022&nbsp;· MF</p><p><a href="/es/jugadores/fadbfb5d/Carlos-Saa">Carlos Saa</a> 2015&nbsp;· DF&nbsp;· Millonarios, América de Cali, Deportivo Pasto, Jaguares de Córdoba</p><p><a href="/es/jugadores/852c4df2/Jhesuad-Salamanca">Jhesuad Salamanca</a> 2019&nbsp;· MF</p><p><a href="/es/jugadores/ea1e43c6/Jhoiner-Salas"><strong>Jhoiner Salas</strong></a> 2024-2025&nbsp;· FW&nbsp;· Fortaleza FC</p><p><a href="/es/jugadores/b627a33f/Joel-Salas">Joel Salas</a> 2015&nbsp;· DF&nbsp;· Uniautónoma FC</p><p><a href="/es/jugadores/a243a2a6/Andres-Salazar"><strong>Andrés Salazar</strong></a> 2023-2025&nbsp;· MF&nbsp;· Atlético Nacional, Heart of Midlothian</p><p><a href="/es/jugadores/e637e7c6/Andres-Salazar"><strong>Andrés Salazar</strong></a> 2024&nbsp;· GK</p><p><a href="/es/jugadores/9f82ac14/Carlos-Salazar">Carlos Salazar</a> 2013-2014&nbsp;· MF&nbsp;· Fort Lauderdale Strikers, Deportivo Pereira, Colo-Colo, Deportivo Pasto, Atlético Huila</p><p><a href="/es/jugadores/df530d93/Edwin-Salazar">Edwin Salazar</a> 2017&nbsp;· FW&nbsp;· PS Kemi Kings</p><p><a href="/es/jugadores/1c7f09a3/Jacobo-Salazar">Jacobo Salazar</a> 2022&nbsp;· DF</p><p><a href="/es/jugadores/6f3dd1b0/Juan-Salazar"><strong>Juan Salazar</strong></a> 2018-2025&nbsp;· MF&nbsp;· Panserraikos, Millonarios, Águilas Doradas, San Lorenzo</p><p><a href="/es/jugadores/df6e6ef1/Juan-Salazar">Juan Salazar</a> 2018&nbsp;· FW&nbsp;· Boyacá Chicó</p><p><a href="/es/jugadores/1a61993c/Kevin-Salazar">Kevin Salazar</a> 2022-2024&nbsp;· MF&nbsp;· Deportivo Cali, La Equidad</p><p><a href="/es/jugadores/27faab2c/Kevin-Salazar">Kevin Salazar</a> 2018-2021&nbsp;· MF&nbsp;· Atlético Huila</p><p><a href="/es/jugadores/d97d42fa/Kevin-Salazar"><strong>Kevin Salazar</strong></a> 2016-2025&nbsp;· MF&nbsp;· Fortaleza FC, La Equidad, Santa Fe, Águilas Doradas, Jaguares de Córdoba, Bucaramanga, Atlético Huil</p><p><a href="/es/jugadores/ee203078/Liana-Salazar"><strong>Liana Salazar</strong></a> 2011-2024&nbsp;· MF&nbsp;· Colombia, Corinthians</p><p><a href="/es/jugadores/ce80c9de/Luis-Salazar"><strong>Luis Salazar</strong></a> 2017-2020&nbsp;· DF&nbsp;· Paraná</p><p><a href="/es/jugadores/3b05b777/Norbey-Salazar">Norbey Salazar</a> 2015-2019&nbsp;· MF&nbsp;· Patriotas FC, Santa Fe, Expreso Rojo</p><p><a href="/es/jugadores/dad532d9/Roddy-Salazar">Roddy Salazar</a> 2021&nbsp;· DF&nbsp;· Manta Fútbol Club</p><p><a href="/es/jugadores/8548109c/Sebastian-Salazar"><strong>Sebastian Salazar</strong></a> 2015-2025&nbsp;· MF&nbsp;· Boyacá Chicó, Santa Fe, Jaguares de Córdoba</p><p><a href="/es/jugadores/96a34f48/Tomas-Salazar"><strong>Tomas Salazar</strong></a> 2019-2025&nbsp;· MF&nbsp;· Águilas Doradas</p><p><a href="/es/jugadores/5f21e0b8/Victor-Salazar">Víctor Salazar</a> 2015-2016&nbsp;· FW&nbsp;· Millonarios, Bucaramanga</p><p><a href="/es/jugadores/8628cbe9/Wilder-Salazar">Wilder Salazar</a> 2015-2019&nbsp;· MF&nbsp;· Nacional Potosí, Real Potosí, Jaguares de Córdoba</p><p><a href="/es/jugadores/5fe3e7c7/Juan-Salcedo">Juan Salcedo</a> 2019&nbsp;· FW&nbsp;· Once Caldas</p><p><a href="/es/jugadores/7f2adda5/Leonardo-Saldana"><strong>Leonardo Saldaña</strong></a> 2015-2025&nbsp;· DF&nbsp;· Alianza Petrolera, Jaguares de Córdoba</p><p><a href="/es/jugadores/4e7f1b2a/Alveiro-Sanchez">Alveiro Sánchez</a> 2015-2016&nbsp;· FW&nbsp;· Deportivo Pasto</p><p><a href="/es/jugadores/827c54f6/Andres-Sanchez">Andrés Sánchez</a> 2023&nbsp;· MF&nbsp;· Delfín</p><p><a href="/es/jugadores/a398e6fc/Bairon-Sanchez">Bairon Sanchez</a> 2016&nbsp;· MF</p><p><a href="/es/jugadores/8186dd34/Brayan-Sanchez"><strong>Brayan Sánchez</strong></a> 2025&nbsp;· MF&nbsp;· Deportivo Pasto</p><p><a href="/es/jugadores/50b51fac/Carlos-Sanchez">Carlos Sánchez</a> 2007-2024&nbsp;· DF,MF&nbsp;· Valenciennes, Aston Villa, Fiorentina, Colombia, Santa Fe, San Lorenzo, Elche, River Plate, West Ham</p><p><a href="/es/jugadores/da7b447d/Davinson-Sanchez"><strong>Davinson Sánchez</strong></a> 2015-2026&nbsp;· DF&nbsp;· Galatasaray, Tottenham Hotspur, Colombia, Ajax, Atlético Nacional</p><p><a href="/es/jugadores/08ae1073/Diego-Sanchez"><strong>Diego Sánchez</strong></a> 2018-2024&nbsp;· DF&nbsp;· Cúcuta Deportivo, Deportivo Pasto, Deportivo Pereira, Boyacá Chicó, Leones FC, Águilas Doradas, Atlé</p><p><a href="/es/jugadores/fdc05e0f/Duvan-Sanchez">Duvan Sánchez</a> 2016-2021&nbsp;· MF&nbsp;· Cortuluá</p><p><a href="/es/jugadores/a6e630b0/Efrain-Sanchez">Efraín Sánchez</a> 1962&nbsp;· GK&nbsp;· Colombia</p><p><a href="/es/jugadores/5e354356/Gustavo-Sanchez">Gustavo Sánchez</a> 2019-2021&nbsp;· GK</p><p><a href="/es/jugadores/afcca759/Huberth-Sanchez"><strong>Huberth Sánchez</strong></a> 2020-2025&nbsp;· DF&nbsp;· San Antonio Bulo Bulo, Aurora</p><p><a href="/es/jugadores/381a31b2/James-Sanchez">James Sánchez</a> 2015-2022&nbsp;· MF&nbsp;· Junior, Uniautónoma FC, Unión Magdalena, Independiente Medellín, Alianza Petrolera</p><p><a href="/es/jugadores/72c796e9/Jefferson-Sanchez">Jefferson Sánchez</a> 2021&nbsp;· GK&nbsp;· Deportes Quindío</p><p><a href="/es/jugadores/582ab359/Juan-Sanchez">Juan Sánchez</a> 2024</p><p><a href="/es/jugadores/eedac811/Luis-Sanchez"><strong>Luis Sánchez</strong></a> 2018-2025&nbsp;· MF&nbsp;· Fortaleza FC, América de Cali, Central Córdoba–SdE</p><p><a href="/es/jugadores/eea44bab/Miguel-Sanchez">Miguel Sánchez</a> 2022-2023&nbsp;· GK&nbsp;· Deportivo Cali</p><p><a href="/es/jugadores/c8784e81/Neymar-Sanchez">Neymar Sánchez</a> 2023&nbsp;· MF&nbsp;· Bucaramanga</p><p><a href="/es/jugadores/5978ec66/Ramiro-Sanchez">Ramiro Sanchez</a> 2015-2023&nbsp;· GK&nbsp;· Unión Magdalena, Millonarios</p><p><a href="/es/jugadores/e85d97ff/Keimer-Sandoval"><strong>Keimer Sandoval</strong></a> 2024-2025&nbsp;· DF&nbsp;· Red Star</p><p><a href="/es/jugadores/f35f3f91/Luis-Sandoval"><strong>Luis Sandoval</strong></a> 2016-2025&nbsp;· FW&nbsp;· Independiente Medellín, Junior, Deportivo Cali, Águilas Doradas</p><p><a href="/es/jugadores/ef63873b/Miguel-Sandoval">Miguel Sandoval</a> 2022</p><p><a href="/es/jugadores/081efe36/Daniel-Santa">Daniel Santa</a> 2015-2018&nbsp;· MF&nbsp;· Alianza Petrolera, Atlético Nacional</p><p><a href="/es/jugadores/c742e517/Jose-Santa">José Santa</a> 1998&nbsp;· DF</p><p><a href="/es/jugadores/c66a9679/Jhon-Santacruz">Jhon Santacruz</a> 2018-2022&nbsp;· FW&nbsp;· Macará, Mushuc Runa</p><p><a href="/es/jugadores/67f4d1c2/Santiago-Santacruz">Santiago Santacruz</a> 2024&nbsp;· MF</p><p><a href="/es/jugadores/56c5716e/David-Santiago-Agudelo">David Santiago Agudelo</a> 2017-2023&nbsp;· GK</p><p><a href="/es/jugadores/ffb9cca6/Camilo-Santiago">Camilo Santiago</a> 2017&nbsp;· MF</p><p><a href="/es/jugadores/08eb094b/Duban-Santiago-Erazo">Dubán Santiago Erazo</a> 2017-2024&nbsp;· DF</p><p><a href="/es/jugadores/8343dd81/Omar-Santiago-Molina">Omar Santiago Molina</a> 2016&nbsp;· MF</p><p><a href="/es/jugadores/bca135e8/Harold-Santiago-Mosquera"><strong>Harold Santiago Mosquera</strong></a> 2016-2025&nbsp;· FW,MF&nbsp;· Santa Fe, FC Dallas, Millonarios, OFI Crete, Deportivo Cali, Pachuca</p><p><a href="/es/jugadores/26186c82/Juan-Santos">Juan Santos</a> 2015&nbsp;· MF</p><p><a href="/es/jugadores/36e74d61/Leicy-Santos"><strong>Leicy Santos</strong></a> 2015-2025&nbsp;· MF&nbsp;· Washington Spirit, Atlético Madrid, Colombia</p><p><a href="/es/jugadores/c7986078/Danny-Santoya">Danny Santoya</a> 2016-2021&nbsp;· FW,MF&nbsp;· Deportes Quindío, Deportes Tolima, Once Caldas, Estudiantes de Mérida, Independiente Medellín, Depor</p><p><a href="/es/jugadores/7f0ec66c/Carlos-Sarabia"><strong>Carlos Sarabia</strong></a> 2024-2025&nbsp;· DF&nbsp;· Millonarios</p><p><a href="/es/jugadores/c73dea58/Oscar-Saraz">Oscar Saráz</a> 2017&nbsp;· DF&nbsp;· Expreso Rojo</p><p><a href="/es/jugadores/751faa38/Andres-Sarmiento"><strong>Andrés Sarmiento</strong></a> 2016-2025&nbsp;· MF&nbsp;· Atlético Nacional, América de Cali, Bucaramanga, Alianza Petrolera, Vizela, Cúcuta Deportivo, Excel </p><p><a href="/es/jugadores/683af390/Jannenson-Sarmiento"><strong>Jannenson Sarmiento</strong></a> 2023-2025&nbsp;· MF&nbsp;· Unión Magdalena, Danubio</p><p><a href="/es/jugadores/1c02b494/Juan-Sarmiento">Juan Sarmiento</a> 2024&nbsp;· MF</p><p><a href="/es/jugadores/fec20f18/Juan-Sarmiento">Juan Sarmiento</a> 2023&nbsp;· GK</p><p><a href="/es/jugadores/3ff9c550/Estiven-Sarria">Estiven Sarria</a> 2021-2024&nbsp;· FW&nbsp;· Patriotas FC, Metropolitanos</p><p><a href="/es/jugadores/acdcb910/Kevin-Saucedo">Kevin Saucedo</a> 2021-2023&nbsp;· DF&nbsp;· Real Monarchs, Deportivo Cali</p><p><a href="/es/jugadores/d745dce7/Ivan-Scarpeta"><strong>Iván Scarpeta</strong></a> 2020-2025&nbsp;· DF&nbsp;· Santa Fe, Jaguares de Córdoba, Junior</p><p><a href="/es/jugadores/59b878de/Hans-Schomberger">Hans Schomberger</a> 2001-2002</p><p><a href="/es/jugadores/7d58dd17/Jahir-Scott">Jahir Scott</a> 2019-2022&nbsp;· MF&nbsp;· Unión Magdalena</p><p><a href="/es/jugadores/a2fdee73/Sebas">Sebas</a> 2018-2021&nbsp;· DF&nbsp;· UD Mutilvera</p><p><a href="/es/jugadores/37744766/Juan-Sebastian-Duque">Juan Sebastián Duque</a> 2016&nbsp;· GK&nbsp;· Fortaleza FC</p><p><a href="/es/jugadores/e443cde3/Juan-Sebastian-Herrera"><strong>Juan Sebastián Herrera</strong></a> 2015-2025&nbsp;· FW&nbsp;· Sacramento Republic, Macará, Alianza Petrolera, Deportivo Pasto, Junior, Cortuluá, Atlético Huila, J</p><p><a href="/es/jugadores/b520cf0a/Juan-Sebastian-Mancilla">Juan Sebastián Mancilla</a> 2019-2022&nbsp;· MF&nbsp;· Alianza Petrolera, Jaguares de Córdoba</p><p><a href="/es/jugadores/39d76513/Juan-Sebastian-Serrano">Juan Sebastián Serrano</a> 2019-2021&nbsp;· GK&nbsp;· Alianza Petrolera</p><p><a href="/es/jugadores/c70e3fe0/Eddie-Segura"><strong>Eddie Segura</strong></a> 2017-2025&nbsp;· DF&nbsp;· Los Angeles FC, Atlético Huila</p><p><a href="/es/jugadores/e5daf8b6/Jonathan-Segura">Jonathan Segura</a> 2015-2024&nbsp;· DF,MF&nbsp;· Universidad Técnica de Cajamarca, Unión Comercio, Patriotas FC, Unión Magdalena</p><p><a href="/es/jugadores/8e8f978b/Jorge-Segura"><strong>Jorge Segura</strong></a> 2015-2025&nbsp;· DF&nbsp;· Lokomotiv Plovdiv, Independiente Medellín, Envigado FC, América de Cali, Atlas, Atlético Nacional</p><p><a href="/es/jugadores/337ae5a1/Luis-Segura">Luis Segura</a> 2022&nbsp;· MF</p><p><a href="/es/jugadores/37b0b872/Oscar-Segura">Oscar Segura</a> 2022-2023&nbsp;· MF&nbsp;· Deportivo Cali</p><p><a href="/es/jugadores/6015ab9e/Julian-Sepulveda">Julian Sepulveda</a> 2020&nbsp;· MF</p><p><a href="/es/jugadores/0b1ed0ad/Carlos-Sepulveda-Morelo">Carlos Sepúlveda Morelo</a> 2016-2018&nbsp;· MF&nbsp;· Jaguares de Córdoba</p><p><a href="/es/jugadores/984c12ed/Oscar-Sepulveda">Óscar Sepúlveda</a> 2024&nbsp;· MF</p><p><a href="/es/jugadores/95910eb3/Sandra-Sepulveda"><strong>Sandra Sepúlveda</strong></a> 2011-2024&nbsp;· GK&nbsp;· Colombia</p><p><a href="/es/jugadores/23f599fe/Maicol-Sequeda">Maicol Sequeda</a> 2023&nbsp;· MF&nbsp;· Atlético Huila</p><p><a href="/es/jugadores/3d0ce7ad/Enrique-Serje"><strong>Enrique Serje</strong></a> 2016-2025&nbsp;· MF&nbsp;· Everton, Junior, Jaguares de Córdoba, Santa Fe, Once Caldas</p><p><a href="/es/jugadores/ab7ba08f/Alexis-Serna"><strong>Alexis Serna</strong></a> 2019-2025&nbsp;· MF&nbsp;· Independiente Medellín, Alianza Petrolera, Deportes Quindío</p><p><a href="/es/jugadores/0a4c38f2/Cristian-Serna">Cristian Serna</a> 2018&nbsp;· MF&nbsp;· Leones FC</p><p><a href="/es/jugadores/e515afbe/Diego-Serna">Diego Serna</a> 1998-2009&nbsp;· FW&nbsp;· Miami Fusion, Macará, Miami FC, LA Galaxy, MetroStars, New England Revolution</p><p><a href="/es/jugadores/f3cc4a6e/Kevin-Serna"><strong>Kevin Serna</strong></a> 2019-2025&nbsp;· MF&nbsp;· Fluminense, ADT Tarma, Alianza Lima, Sportivo Luqueño</p><p><a href="/es/jugadores/ab57ed6a/Liced-Serna">Liced Serna</a> 2022-2024&nbsp;· MF&nbsp;· Valencia</p><p><a href="/es/jugadores/0a3caaa8/Lucas-Serna-Marin">Lucas Serna Marín</a> 2023&nbsp;· MF</p><p><a href="/es/jugadores/80125b2b/Mauricio-Serna">Mauricio Serna</a> 1994-1998&nbsp;· MF&nbsp;· Boca Juniors, Talleres, Chacarita Juniors, Colombia</p><p><a href="/es/jugadores/116b962a/Janer-Serpa">Janer Serpa</a> 2015-2016&nbsp;· GK&nbsp;· Deportes Tolima, Envigado FC</p><p><a href="/es/jugadores/f9c9d728/Jesus-Serrano">Jesús Serrano</a> 2018&nbsp;· MF&nbsp;· Estudiantes de Mérida, Estudiantes de Caracas</p><p><a href="/es/jugadores/37eb7061/Rolando-Serrano">Rolando Serrano</a> 1962&nbsp;· MF</p><p><a href="/es/jugadores/97e1e94d/Duvan-Sevillano">Duván Sevillano</a> 2016-2017&nbsp;· MF</p><p><a href="/es/jugadores/1d0bd125/Rodrigo-Sevillano">Rodrigo Sevillano</a> 2015&nbsp;· DF&nbsp;· Deportivo Pasto, Boyacá Chicó, Cúcuta Deportivo</p><p><a href="/es/jugadores/9c7296c4/Jaime-Sierra">Jaime Sierra</a> 2015-2016&nbsp;· MF&nbsp;· Deportivo Pereira, Once Caldas</p><p><a href="/es/jugadores/9c9dc751/Juan-Sierra"><strong>Juan Sierra</strong></a> 2024&nbsp;· DF</p><p><a href="/es/jugadores/041f862d/Marlon-Sierra"><strong>Marlon Sierra</strong></a> 2020-2025&nbsp;· MF&nbsp;· Llaneros, Jaguares de Córdoba</p><p><a href="/es/jugadores/0d9f6337/Tomas-Sierra">Tomás Sierra</a> 2016&nbsp;· FW&nbsp;· Boyacá Chicó</p><p><a href="/es/jugadores/656c8765/Juan-Silgado"><strong>Juan Silgado</strong></a> 2018-2025&nbsp;· DF&nbsp;· Anzoátegui, Jaguares de Córdoba, Angostura</p><p><a href="/es/jugadores/d8fb4cbd/Brayan-Silva">Brayan Silva</a> 2015-2017&nbsp;· GK</p><p><a href="/es/jugadores/36e7edea/Gerbian-Silva">Gerbian Silva</a> 2024&nbsp;· MF</p><p><a href="/es/jugadores/2ff552b5/Jaime-Silva-Gomez">Jaime Silva Gómez</a> 1962&nbsp;· MF</p><p><a href="/es/jugadores/55822a27/Uriel-Silva">Uriel Silva</a> 2016&nbsp;· GK</p><p><a href="/es/jugadores/0e15594c/Aldair-Simanca"><strong>Aldair Simanca</strong></a> 2022&nbsp;· DF&nbsp;· Universidad Central</p><p><a href="/es/jugadores/5f871699/Alfonso-Simarra"><strong>Alfonso Simarra</strong></a> 2021-2025&nbsp;· DF&nbsp;· Universidad Central, Alianza Petrolera, Junior, Deportes Tolima</p><p><a href="/es/jugadores/03909279/Bryan-Sinisterra">Bryan Sinisterra</a> 2022&nbsp;· FW&nbsp;· Envigado FC</p><p><a href="/es/jugadores/38a05eed/Carlos-Sinisterra">Carlos Sinisterra</a> 2016-2020&nbsp;· MF&nbsp;· Águilas Doradas, Técnico Universitario, Independiente Medellín</p><p><a href="/es/jugadores/2775f0d4/Jean-Sinisterra"><strong>Jean Sinisterra</strong></a> 2019&nbsp;· MF</p><p><a href="/es/jugadores/ab179896/Jesus-Sinisterra">Jésus Sinisterra</a> 2002-2006&nbsp;· DF,MF&nbsp;· Banfield, Deportivo Pereira, Arminia Bielefeld, Boyacá Chicó, Deportes Tolima, Deportivo Pasto, Eint</p><p><a href="/es/jugadores/ee3e875a/Juan-Sinisterra">Juan Sinisterra</a> 2021&nbsp;· MF&nbsp;· Jaguares de Córdoba</p><p><a href="/es/jugadores/0d00ed9e/Lewis-Sinisterra">Lewis Sinisterra</a> 2022&nbsp;· MF&nbsp;· Cortuluá</p><p><a href="/es/jugadores/8e16dd48/Luis-Sinisterra"><strong>Luis Sinisterra</strong></a> 2016-2026&nbsp;· FW,MF&nbsp;· Bournemouth, Feyenoord, Once Caldas, Leeds United, Colombia</p><p><a href="/es/jugadores/c8764028/Andres-Solano">Andrés Solano</a> 2018-2023&nbsp;· DF&nbsp;· Rijeka</p><p><a href="/es/jugadores/4cc140c5/Hector-Solano">Hector Solano</a> 2020-2021&nbsp;· MF&nbsp;· Patriotas FC, Cúcuta Deportivo</p><p><a href="/es/jugadores/13666729/Henry-Solis">Henry Solís</a> 2015-2016&nbsp;· FW&nbsp;· Universidad Técnica de Cajamarca</p><p><a href="/es/jugadores/1282939a/Jhon-Solis"><strong>Jhon Solis</strong></a> 2022-2025&nbsp;· MF&nbsp;· Girona, Atlético Nacional</p><p><a href="/es/jugadores/49b4a3b3/Marlon-Solis">Marlon Solis</a> 2016&nbsp;· DF</p><p><a href="/es/jugadores/2fcee1c3/Miguel-Solis">Miguel Solís</a> 2016-2019&nbsp;· GK&nbsp;· Santa Fe, Atlético Huila</p><p><a href="/es/jugadores/3e9037dc/Jordin-Soraca">Jordin Soracá</a> 2015&nbsp;· DF</p><p><a href="/es/jugadores/5c44f448/Almir-Soto"><strong>Almir Soto</strong></a> 2015-2025&nbsp;· MF&nbsp;· San Antonio FC, Santa Fe, Deportivo Pasto, Deportivo La Guaira, Fortaleza FC, Patriotas FC</p><p><a href="/es/jugadores/47bf23f2/Elkin-Soto">Elkin Soto</a> 2006-2019&nbsp;· MF&nbsp;· Mainz 05, Once Caldas, Barcelona</p><p><a href="/es/jugadores/758a7b9e/Herlbert-Soto"><strong>Herlbert Soto</strong></a> 2016-2024&nbsp;· MF&nbsp;· Boyacá Chicó, Deportivo Lara, Trujillanos, Metropolitanos, El Farolito</p><p><a href="/es/jugadores/1ee02ca8/Hugo-Soto">Hugo Soto</a> 2015-2018&nbsp;· DF&nbsp;· La Equidad, Atlético Nacional, Carabobo, Atlético Huila, Aragua</p><p><a href="/es/jugadores/3f740aa4/Tomas-Soto"><strong>Tomás Soto</strong></a> 2025&nbsp;· MF&nbsp;· Envigado FC</p><p><a href="/es/jugadores/9a9a8375/Ricardo-Steer">Ricardo Steer</a> 2017-2019&nbsp;· FW&nbsp;· Changchun Yatai, Jaguares de Córdoba, Once Caldas</p><p><a href="/es/jugadores/f327e5a1/Diego-Steven-Gomez">Diego Steven Gómez</a> 2017-2022&nbsp;· FW,MF&nbsp;· Atlético Huila, Expreso Rojo, La Equidad, Patriotas FC</p><p><a href="/es/jugadores/c67b3538/Jhon-Steven">Jhon Steven</a> 2016-2019&nbsp;· DF,MF&nbsp;· Sport Boys, Osasuna, Leones FC</p><p><a href="/es/jugadores/592e4e1b/John-Steven-Rivera">John Steven Rivera</a> 2018&nbsp;· MF</p><p><a href="/es/jugadores/e0ffcd7f/Michael-Stiven-Lopez">Michael Stiven López</a> 2018-2019&nbsp;· MF&nbsp;· Atlético Huila</p><p><a href="/es/jugadores/03e980ff/Alejandro-Suarez">Alejandro Suárez</a> 2021&nbsp;· GK</p><p><a href="/es/jugadores/e86b5553/Harlin-Suarez">Harlin Suárez</a> 2017-2022&nbsp;· MF&nbsp;· Atlético Huila, Bucaramanga, Deportivo Pereira, Once Caldas, Alianza Petrolera</p><p><a href="/es/jugadores/03a04d29/Jeison-Suarez"><strong>Jeison Suarez</strong></a> 2015-2025&nbsp;· DF&nbsp;· Deportivo Pereira, Deportivo Cali</p><p><a href="/es/jugadores/d982d66e/Jorge-Suarez">Jorge Suárez</a> 2018-2019&nbsp;· FW&nbsp;· Alianza Petrolera</p><p><a href="/es/jugadores/002a5b2f/Juan-Suarez">Juan Suárez</a> 2020&nbsp;· FW</p><p><a href="/es/jugadores/0b4b9313/Juan-Suarez">Juan Suárez</a> 2020-2022&nbsp;· MF&nbsp;· Envigado FC</p><p><a href="/es/jugadores/53db898d/Kalazan-Suarez"><strong>Kalazán Suárez</strong></a> 2022-2025&nbsp;· DF&nbsp;· Alianza Petrolera, Cortuluá</p><p><a href="/es/jugadores/02533935/Nelson-Suarez"><strong>Nelson Suárez</strong></a> 2025&nbsp;· GK&nbsp;· Fortaleza FC</p><p><a href="/es/jugadores/37cdcde4/Cristhian-Subero">Cristhian Subero</a> 2019-2023&nbsp;· DF,MF&nbsp;· Bucaramanga, Unión Magdalena, Millonarios</p><p><a href="/es/jugadores/7fb2eef0/Juan-Suescun">Juan Suescún</a> 2017&nbsp;· FW&nbsp;· Envigado FC, Águilas Doradas</p><p><a href="/es/jugadores/83440eb4/Cesar-Tajan">César Taján</a> 2015-2018&nbsp;· FW&nbsp;· River Plate, Fénix</p><p><a href="/es/jugadores/d5317d7a/Mario-Tajima">Mario Tajima</a> 2015-2023&nbsp;· MF&nbsp;· Cantolao, Cienciano, Carlos A. Mannucci, Sport Boys, Universidad San Martín, Ayacucho, Deportivo Mun</p><p><a href="/es/jugadores/7d6d3cfd/Dylan-Talero">Dylan Talero</a> 2020-2024&nbsp;· FW</p><p><a href="/es/jugadores/2e2172db/Gulfran-Tamara">Gulfran Támara</a> 2016-2018&nbsp;· DF&nbsp;· Junior, Destroyers</p><p><a href="/es/jugadores/78fe36ce/Sebastian-Tamara"><strong>Sebastián Támara</strong></a> 2015-2025&nbsp;· FW,MF&nbsp;· La Equidad, Boyacá Chicó, Atlético Nacional</p><p><a href="/es/jugadores/be7bbd53/Kevin-Tamayo"><strong>Kevin Tamayo</strong></a> 2024&nbsp;· DF&nbsp;· Envigado FC</p><p><a href="/es/jugadores/933355c7/Santiago-Tamayo">Santiago Tamayo</a> 2022&nbsp;· MF</p><p><a href="/es/jugadores/3c256bb1/Devan-Tanton"><strong>Devan Tanton</strong></a> 2021-2025&nbsp;· DF&nbsp;· Fulham U21, Chesterfield, Fulham U23</p><p><a href="/es/jugadores/abdc1acb/Anthony-Tapia">Anthony Tapia</a> 2015-2017&nbsp;· MF&nbsp;· Boyacá Chicó, Deportivo Cali, Santa Fe, Once Caldas, Deportivo Pasto, Sport Boys Warnes, Cortuluá</p><p><a href="/es/jugadores/362cabad/Daniel-Tapia">Daniel Tapia</a> 2015&nbsp;· MF</p><p><a href="/es/jugadores/64c2c005/John-Tapia">John Tapia</a> 2017-2018&nbsp;· DF&nbsp;· Sport Rosario, Comerciantes Unidos</p><p><a href="/es/jugadores/38e3f2cf/Katherine-Tapia"><strong>Katherine Tapia</strong></a> 2021-2024&nbsp;· GK&nbsp;· Palmeiras, Colombia</p><p><a href="/es/jugadores/c397e277/Nelino-Tapia">Nelino Tapia</a> 2015-2023&nbsp;· DF,MF&nbsp;· Boyacá Chicó, Jaguares de Córdoba, Uniautónoma FC, Deportes Tolima, Deportivo Pasto</p><p><a href="/es/jugadores/e75626c1/Rafael-Tapia">Rafael Tapia</a> 2019-2020&nbsp;· FW&nbsp;· Deportivo Cali</p><p><a href="/es/jugadores/18cad0fa/Stiven-Tapiero"><strong>Stiven Tapiero</strong></a> 2020-2025&nbsp;· MF&nbsp;· Mushuc Runa, Técnico Universitario, Aucas</p><p><a href="/es/jugadores/b359ae66/Jefferson-Tarifa">Jefferson Tarifa</a> 2016&nbsp;· FW</p><p><a href="/es/jugadores/ed0e8d29/Ronaldo-Tavera"><strong>Ronaldo Tavera</strong></a> 2015-2023&nbsp;· MF&nbsp;· Atlético Huila, Bucaramanga, Deportivo Pereira</p><p><a href="/es/jugadores/2a43dbd2/Pedro-Tavima">Pedro Tavima</a> 2015-2017&nbsp;· DF&nbsp;· América de Cali, Real Cartagena, Boyacá Chicó, Alianza Petrolera</p><p><a href="/es/jugadores/2ff0b40b/Guillermo-Tegue"><strong>Guillermo Tegue</strong></a> 2018-2025&nbsp;· DF&nbsp;· La Equidad, Independiente Medellín, Guaraní</p><p><a href="/es/jugadores/94679aef/Juan-Tegue">Juan Tegue</a> 2022&nbsp;· FW&nbsp;· Envigado FC</p><p><a href="/es/jugadores/92b0f9a1/Carlos-Tejedor">Carlos Tejedor</a> 2022&nbsp;· MF</p><p><a href="/es/jugadores/5f951ef1/Andres-Tello"><strong>Andrés Tello</strong></a> 2015-2025&nbsp;· FW,MF&nbsp;· Salernitana, Benevento, Bari, Cagliari, Empoli</p><p><a href="/es/jugadores/3a47e5cc/Edier-Tello">Edier Tello</a> 2015-2016&nbsp;· FW&nbsp;· Jaguares de Córdoba, Millonarios</p><p><a href="/es/jugadores/98206852/Juan-Tello"><strong>Juan Tello</strong></a> 2021-2025&nbsp;· MF&nbsp;· Unión Magdalena, Deportivo Cali</p><p><a href="/es/jugadores/5bd429f2/Jonathan-Tenorio">Jonathan Tenorio</a> 2020-2021&nbsp;· FW</p><p><a href="/es/jugadores/324509e2/Carlos-Teran"><strong>Carlos Terán</strong></a> 2019-2025&nbsp;· DF&nbsp;· Chicago Fire, Envigado FC</p><p><a href="/es/jugadores/6537cc71/Johan-Terranova">Johan Terranova</a> 2020-2023&nbsp;· DF</p><p><a href="/es/jugadores/6c4f744d/William-Tesillo"><strong>William Tesillo</strong></a> 2015-2025&nbsp;· DF&nbsp;· Atlético Nacional, León, Deportes Quindío, Santa Fe, Junior, Colombia</p><p><a href="/es/jugadores/8a43d9c8/Luis-Tipton">Luis Tipton</a> 2015-2020&nbsp;· DF&nbsp;· Independiente Medellín, Envigado FC, Atlético Huila</p><p><a href="/es/jugadores/b5fab331/Alejandro-Tirado">Alejandro Tirado</a> 2015-2016&nbsp;· FW</p><p><a href="/es/jugadores/8fc13cd2/Tommy-Tobar"><strong>Tommy Tobar</strong></a> 2015-2025&nbsp;· FW&nbsp;· FC Universitario, Nacional Potosí, Carabobo, Atlético Venezuela, Cúcuta Deportivo, Patriotas FC, Mil</p><p><a href="/es/jugadores/e8605928/Yilber-Tobar">Yilber Tobar</a> 2018&nbsp;· MF&nbsp;· Boyacá Chicó</p><p><a href="/es/jugadores/60aebae8/Juan-Toja">Juan Toja</a> 2007-2013&nbsp;· MF&nbsp;· Steaua București, Aris, FC Dallas, New England Revolution</p><p><a href="/es/jugadores/144a9189/Yeison-Tolosa"><strong>Yeison Tolosa</strong></a> 2018-2024&nbsp;· FW&nbsp;· Deportivo Cali, Deportivo Pasto, Boyacá Chicó</p><p><a href="/es/jugadores/6b147422/Edison-Toloza">Edison Toloza</a> 2011-2019&nbsp;· FW,MF&nbsp;· Junior, Santa Fe, Deportes Quindío, América de Cali, Millonarios, Independiente Medellín, Deportivo </p><p><a href="/es/jugadores/b1fadb1f/Luis-Toloza">Luis Toloza</a> 2018&nbsp;· DF&nbsp;· Boyacá Chicó</p><p><a href="/es/jugadores/748f0c75/Fainer-Torijano"><strong>Fainer Torijano</strong></a> 2015-2024&nbsp;· DF&nbsp;· Deportes Tolima, Santa Fe, Deportes Quindío, Once Caldas, Independiente Medellín, Deportivo Cali</p><p><a href="/es/jugadores/67339b5d/Amaury-Torralvo"><strong>Amaury Torralvo</strong></a> 2015-2025&nbsp;· DF,FW&nbsp;· La Equidad</p><p><a href="/es/jugadores/310a9b1d/Angel-Torres"><strong>Ángel Torres</strong></a> 2023-2024&nbsp;· MF&nbsp;· Central Coast Mariners</p><p><a href="/es/jugadores/5586e953/Brayhan-Torres">Brayhan Torres</a> 2016-2022&nbsp;· DF&nbsp;· La Equidad, Deportivo Pasto, Fortaleza FC</p><p><a href="/es/jugadores/efb83f83/Camilo-Torres">Camilo Torres</a> 2017&nbsp;· MF</p><p><a href="/es/jugadores/d5262a5b/Carlos-Torres"><strong>Carlos Torres</strong></a> 2020-2025&nbsp;· FW&nbsp;· Šibenik, Envigado FC</p><p><a href="/es/jugadores/87882adc/Daniel-Torres"><strong>Daniel Torres</strong></a> 2015-2025&nbsp;· MF&nbsp;· Santa Fe, Independiente Medellín, Alavés, Albacete, Colombia, Zaragoza, Atlético Nacional</p><p><a href="/es/jugadores/9d13f710/Diego-Torres">Diego Torres</a> 2023&nbsp;· FW</p><p><a href="/es/jugadores/c90a476c/Duvan-Torres">Duvan Torres</a> 2015-2016&nbsp;· FW&nbsp;· Deportivo Pasto</p><p><a href="/es/jugadores/96d199ca/Edwin-Torres"><strong>Edwin Torres</strong></a> 2016-2025&nbsp;· FW,MF&nbsp;· Alianza Petrolera, Atlético Nacional, Arsenal de Sarandí</p><p><a href="/es/jugadores/e0d2c82a/Gustavo-Torres"><strong>Gustavo Torres</strong></a> 2017-2025&nbsp;· FW,MF&nbsp;· Deportivo Pasto, Atlético Nacional, Bucaramanga, Once Caldas, Unión Magdalena, América de Cali, Vasc</p><p><a href="/es/jugadores/a6c62d04/Jefferson-Torres">Jefferson Torres</a> 2017-2018&nbsp;· MF&nbsp;· Bucaramanga</p><p><a href="/es/jugadores/ff39ec15/Jhan-Torres"><strong>Jhan Torres</strong></a> 2024&nbsp;· DF&nbsp;· Brusque</p><p><a href="/es/jugadores/aa431f87/Johan-Torres"><strong>Johan Torres</strong></a> 2022-2025&nbsp;· MF&nbsp;· Santa Fe</p><p><a href="/es/jugadores/262b47fb/Juan-Torres"><strong>Juan Torres</strong></a> 2023-2025&nbsp;· MF&nbsp;· Charleston Battery, Millonarios</p><p><a href="/es/jugadores/65a4f166/Juan-Torres">Juan Torres</a> 2019&nbsp;· MF</p><p><a href="/es/jugadores/c99007ef/Juan-Torres"><strong>Juan Torres</strong></a> 2022-2025&nbsp;· DF&nbsp;· Atlético Nacional</p><p><a href="/es/jugadores/fe5f9ec2/Karla-Torres"><strong>Karla Torres</strong></a> 2024-2025&nbsp;· FW&nbsp;· Leicester City</p><p><a href="/es/jugadores/99c6d6ce/Kevin-Torres">Kevin Torres</a> 2023-2024&nbsp;· MF&nbsp;· Alianza Petrolera</p><p><a href="/es/jugadores/f29a81ff/Macnelly-Torres">Macnelly Torres</a> 2011-2024&nbsp;· MF&nbsp;· Atlético Nacional, Cúcuta Deportivo, Colo-Colo, Libertad, Al-Shabab, Junior, Deportivo Cali, San Lui</p><p><a href="/es/jugadores/3a3f66c4/Marlon-Torres"><strong>Marlon Torres</strong></a> 2017-2025&nbsp;· DF&nbsp;· Deportes Tolima, América de Cali, Bucaramanga, Santa Fe</p><p><a href="/es/jugadores/d177f718/Marlon-Torres"><strong>Marlon Torres</strong></a> 2019-2025&nbsp;· FW&nbsp;· Binacional, Alianza Petrolera</p><p><a href="/es/jugadores/bcff253f/Teobaldo-Torres-Quesedo">Teobaldo Torres Quesedo</a> 2016&nbsp;· FW&nbsp;· Jaguares de Córdoba</p><p><a href="/es/jugadores/6248bd60/Roger-Torres"><strong>Róger Torres</strong></a> 2010-2025&nbsp;· MF&nbsp;· Binacional, Alianza Petrolera, Alianza Atlético, Philadelphia Union, La Equidad, Bucaramanga, Junior</p><p><a href="/es/jugadores/1a1c206f/Yosimarc-Torres">Yosimarc Torres</a> 2019-2023&nbsp;· DF&nbsp;· Atlético Huila, Deportivo Pasto</p><p><a href="/es/jugadores/2dc26eeb/Kilian-Toscano"><strong>Kilian Toscano</strong></a> 2022-2025&nbsp;· FW&nbsp;· Atlético Nacional</p><p><a href="/es/jugadores/c722fe0f/Andres-Tovar"><strong>Andrés Tovar</strong></a> 2023-2025&nbsp;· GK&nbsp;· Envigado FC</p><p><a href="/es/jugadores/6788a24d/Carlos-Tovar"><strong>Carlos Tovar</strong></a> 2024&nbsp;· DF</p><p><a href="/es/jugadores/1d3ba8a5/Cristian-Tovar"><strong>Cristian Tovar</strong></a> 2017-2025&nbsp;· DF&nbsp;· América de Cali, Deportivo Pasto, FC Sheriff Tiraspol, Deportes Tolima</p><p><a href="/es/jugadores/2d4d11b7/Hernando-Tovar">Hernando Tovar</a> 1962&nbsp;· MF</p><p><a href="/es/jugadores/ad150094/Juan-Tovar">Juan Tovar</a> 2021&nbsp;· FW</p><p><a href="/es/jugadores/cdad8a1d/Julian-Tovar"><strong>Julián Tovar</strong></a> 2024-2025&nbsp;· DF&nbsp;· Oțelul Galați</p><p><a href="/es/jugadores/6b7be049/Mateo-Trejos">Mateo Trejos</a> 2016-2017&nbsp;· MF&nbsp;· Cortuluá</p><p><a href="/es/jugadores/2446ac6b/Santiago-Trellez"><strong>Santiago Tréllez</strong></a> 2012-2024&nbsp;· FW&nbsp;· Independiente Medellín, Deportivo Pasto, São Paulo, Vitória, Sport Recife, La Equidad, San Luis, Mor</p><p><a href="/es/jugadores/89dd3276/Camilo-Triana"><strong>Camilo Triana</strong></a> 2017&nbsp;· FW</p><p><a href="/es/jugadores/94af91aa/Cristian-Trujillo"><strong>Cristian Trujillo</strong></a> 2020-2025&nbsp;· MF&nbsp;· Deportes Tolima</p><p><a href="/es/jugadores/723cffbb/Ivan-Trujillo">Iván Trujillo</a> 2008&nbsp;· FW&nbsp;· La Equidad, Deportivo Cali, Kansas City Wizards, Once Caldas, Deportes Quindío</p><p><a href="/es/jugadores/fca7c1af/Jefrey-Trujillo"><strong>Jefrey Trujillo</strong></a> 2022-2025&nbsp;· MF&nbsp;· Unión Magdalena</p><p><a href="/es/jugadores/de266550/Juan-Trujillo">Juan Trujillo</a> 2016&nbsp;· GK</p><p><a href="/es/jugadores/5d17cd5f/Jeison-Truque">Jeison Truque</a> 2018-2020&nbsp;· GK</p><p><a href="/es/jugadores/cd6bf3d7/Arlenzon-Ucros">Arlenzon Ucrós</a> 2015-2019&nbsp;· MF&nbsp;· Cortuluá, Llaneros</p><p><a href="/es/jugadores/2ef98fdc/Duvan-Urango"><strong>Duván Urango</strong></a> 2019-2024&nbsp;· MF&nbsp;· Jaguares de Córdoba, Zamora</p><p><a href="/es/jugadores/83811662/Cristian-Uribe"><strong>Cristian Uribe</strong></a> 2025&nbsp;· DF&nbsp;· Atlético Nacional</p><p><a href="/es/jugadores/024b5ac4/David-Uribe">David Uribe</a> 2017&nbsp;· DF&nbsp;· Expreso Rojo</p><p><a href="/es/jugadores/cec4c774/Fernando-Uribe">Fernando Uribe</a> 2010-2024&nbsp;· FW&nbsp;· Millonarios, Toluca, Atlético Nacional, Once Caldas, Deportivo Pereira, Flamengo, Junior, Chievo, Sa</p><p><a href="/es/jugadores/a8eeb499/Franky-Uribe">Franky Uribe</a> 2016-2017&nbsp;· DF</p><p><a href="/es/jugadores/8c74ff17/Juan-Uribe">Juan Uribe</a> 2022&nbsp;· GK</p><p><a href="/es/jugadores/b997c3de/Mateus-Uribe"><strong>Mateus Uribe</strong></a> 2015-2026&nbsp;· MF&nbsp;· Atlético Nacional, Porto, Colombia, Envigado FC, América, Deportes Tolima</p><p><a href="/es/jugadores/b52bfc94/Neymar-Uribe"><strong>Neymar Uribe</strong></a> 2024-2025&nbsp;· DF&nbsp;· Envigado FC</p><p><a href="/es/jugadores/be40d974/Hector-Urrego"><strong>Héctor Urrego</strong></a> 2015-2022&nbsp;· DF&nbsp;· Santa Fe, Jaguares de Córdoba, Independiente Medellín, Club Sol de América, Deportes Tolima, Curicó </p><p><a href="/es/jugadores/bc87d0a0/Bryan-Uruena"><strong>Bryan Urueña</strong></a> 2016-2025&nbsp;· MF&nbsp;· Llaneros, Cortuluá, Boyacá Chicó, Deportes Quindío</p><p><a href="/es/jugadores/b1ea041a/Catalina-Usme"><strong>Catalina Usme</strong></a> 2011-2025&nbsp;· FW,MF&nbsp;· Galatasaray, Colombia</p><p><a href="/es/jugadores/52a0c641/Efrain-Ustariz">Efrain Ustariz</a> 2022-2023&nbsp;· GK</p><p><a href="/es/jugadores/0651336b/Albeiro-Usuriaga">Albeiro Usuriaga</a> 1989-1990&nbsp;· FW&nbsp;· Málaga</p><p><a href="/es/jugadores/6fa05f7c/Juan-Vacca-Gonzalez">Juan Vacca González</a> 2019-2022&nbsp;· DF&nbsp;· Unión Magdalena, La Equidad</p><p><a href="/es/jugadores/4d9b10a3/Dilan-Vahos">Dilan Vahos</a> 2019&nbsp;· MF</p><p><a href="/es/jugadores/fcfb0ed4/Katherine-Valbuena">Katherine Valbuena</a> 2021&nbsp;· MF</p><p><a href="/es/jugadores/97003f7e/Sebastian-Valbuena">Sebastián Valbuena</a> 2019&nbsp;· MF</p><p><a href="/es/jugadores/aa52f7ec/Yhojan-Valbuena">Yhojan Valbuena</a> 2018-2023&nbsp;· MF&nbsp;· Botev Vratsa, Independiente Medellín, Envigado FC</p><p><a href="/es/jugadores/56a959c9/Jefferson-Valdeblanquez">Jefferson Valdeblanquez</a> 2017-2018&nbsp;· MF</p><p><a href="/es/jugadores/e4e05432/Daniel-Valdelamar">Daniel Valdelamar</a> 2017-2018&nbsp;· MF&nbsp;· Santa Fe</p><p><a href="/es/jugadores/2592bae1/Carlos-Valderrama">Carlos Valderrama</a> 1990-2002&nbsp;· MF&nbsp;· Tampa Bay Mutiny, Colorado Rapids, Miami Fusion, Valladolid, Colombia</p><p><a href="/es/jugadores/284aa70c/Juan-Valderrama">Juan Valderrama</a> 2022&nbsp;· DF</p><p><a href="/es/jugadores/9beb653a/Carlos-Valdes">Carlos Valdés</a> 2011-2015&nbsp;· DF&nbsp;· América de Cali, Santa Fe, Philadelphia Union, San Lorenzo, Nacional, Colombia</p><p><a href="/es/jugadores/f95a075f/Diego-Valdes-Giraldo">Diego Valdés Giraldo</a> 2018-2023&nbsp;· FW&nbsp;· Deportes Tolima, Boyacá Chicó, Once Caldas, Santa Fe, La Equidad, Águilas Doradas, Alianza Petrolera</p><p><a href="/es/jugadores/1b68b729/Omar-Valdes">Omar Valdés</a> 2015&nbsp;· MF</p><p><a href="/es/jugadores/75b60710/Adolfo-Valencia">Adolfo Valencia</a> 1993-2001&nbsp;· FW&nbsp;· MetroStars, Bayern Munich, Atlético Madrid, Reggiana, Colombia</p><p><a href="/es/jugadores/48a179ed/Adrian-Valencia"><strong>Adrián Valencia</strong></a> 2024&nbsp;· MF&nbsp;· Boyacá Chicó</p><p><a href="/es/jugadores/52224ae2/Carlos-Valencia">Carlos Valencia</a> 2015-2017&nbsp;· DF&nbsp;· Independiente Medellín, Sportivo Luqueño, Godoy Cruz, Bucaramanga</p><p><a href="/es/jugadores/0fd87187/Carmelo-Valencia">Carmelo Valencia</a> 2017-2022&nbsp;· FW&nbsp;· Junior, La Equidad, Atlético Nacional, Santa Fe, Millonarios, Tianjin Jinmen Tiger, Cúcuta Deportivo</p><p><a href="/es/jugadores/4d8fef83/Cristian-Valencia"><strong>Cristian Valencia</strong></a> 2016-2025&nbsp;· DF&nbsp;· Llaneros, SJK, AC Oulu, Cúcuta Deportivo, Cortuluá</p><p><a href="/es/jugadores/e7d7f45a/Dairon-Valencia"><strong>Dairon Valencia</strong></a> 2020-2024&nbsp;· FW&nbsp;· Bucaramanga, Jaguares de Córdoba, Deportivo Cali</p><p><a href="/es/jugadores/480e798d/David-Valencia">David Valencia</a> 2015-2022&nbsp;· DF&nbsp;· Alianza Petrolera, Nacional Potosí, Once Caldas, Águilas Doradas</p><p><a href="/es/jugadores/5f436fe1/Edwin-Valencia">Edwin Valencia</a> 2014-2017&nbsp;· DF,MF&nbsp;· Athletico Paranaense, Fluminense, América de Cali, Atlético Nacional, Colombia, Santos</p><p><a href="/es/jugadores/31f3c281/Ever-Valencia"><strong>Ever Valencia</strong></a> 2015-2025&nbsp;· MF&nbsp;· Deportes Tolima, Independiente Medellín, Deportivo Pereira, América de Cali, Envigado FC, Santa Fe, </p><p><a href="/es/jugadores/008b5c0c/Fredy-Valencia">Fredy Valencia</a> 2020-2023&nbsp;· MF</p><p><a href="/es/jugadores/920c35c5/Fredy-Valencia">Fredy Valencia</a> 2023&nbsp;· FW&nbsp;· Deportivo Pasto</p><p><a href="/es/jugadores/de00f130/Gerson-Valencia">Gerson Valencia</a> 2017&nbsp;· DF&nbsp;· Independiente Medellín</p><p><a href="/es/jugadores/5cdf8fec/Hamilton-Valencia">Hamilton Valencia</a> 2016-2017&nbsp;· MF&nbsp;· Atlético Huila</p><p><a href="/es/jugadores/314c5aa4/Jackson-Valencia">Jackson Valencia</a> 2015&nbsp;· MF&nbsp;· Deportes Tolima</p><p><a href="/es/jugadores/e7037a4f/Jader-Valencia"><strong>Jader Valencia</strong></a> 2017-2025&nbsp;· FW,MF&nbsp;· Millonarios</p><p><a href="/es/jugadores/321ceee9/Jhan-Valencia"><strong>Jhan Valencia</strong></a> 2017-2019&nbsp;· DF</p><p><a href="/es/jugadores/3fbe573e/Jhojan-Valencia"><strong>Jhojan Valencia</strong></a> 2015-2025&nbsp;· MF&nbsp;· Universidad Católica, Austin FC, Deportivo Cali, Unión Magdalena</p><p><a href="/es/jugadores/96d4285f/Jhon-Valencia">Jhon Valencia</a> 2015-2017&nbsp;· FW,MF&nbsp;· América de Cali, Alianza Atlético, Once Caldas, Juan Aurich, Santa Fe, Deportivo Pereira, Atlético N</p><p><a href="/es/jugadores/4352ced7/Kammel-Valencia">Kammel Valencia</a> 2015&nbsp;· MF&nbsp;· Boyacá Chicó</p><p><a href="/es/jugadores/b5fc3578/Kener-Valencia"><strong>Kener Valencia</strong></a> 2022-2025&nbsp;· FW&nbsp;· Llaneros, Cortuluá, Deportivo Pereira, Independiente Medellín</p><p><a href="/es/jugadores/5712cb42/Maicol-Valencia">Maicol Valencia</a> 2023&nbsp;· DF</p><p><a href="/es/jugadores/18e71d81/Mateo-Valencia">Mateo Valencia</a> 2023-2024&nbsp;· GK</p><p><a href="/es/jugadores/e19a02e7/Ronald-Valencia"><strong>Ronald Valencia</strong></a> 2025&nbsp;· MF&nbsp;· Boyacá Chicó</p><p><a href="/es/jugadores/ff710fb6/Sebastian-Valencia">Sebastián Valencia</a> 2016&nbsp;· MF</p><p><a href="/es/jugadores/37ff9a99/Stiven-Valencia"><strong>Stiven Valencia</strong></a> 2022-2024&nbsp;· DF&nbsp;· Cortuluá, Patriotas FC</p><p><a href="/es/jugadores/2f9a3027/Yeiler-Valencia"><strong>Yeiler Valencia</strong></a> 2023-2025&nbsp;· DF&nbsp;· Once Caldas</p><p><a href="/es/jugadores/782f0d6d/Ivan-Valenciano">Iván Valenciano</a> 1992-1994&nbsp;· FW&nbsp;· Junior, Atalanta</p><p><a href="/es/jugadores/954817da/Arnulfo-Valentierra">Arnulfo Valentierra</a> 2003&nbsp;· MF&nbsp;· Once Caldas, Cienciano, Peñarol, Colombia</p><p><a href="/es/jugadores/6755ddbd/Sebastian-Valenzuela">Sebastián Valenzuela</a> 2018-2021&nbsp;· FW&nbsp;· Deportivo Pasto</p><p><a href="/es/jugadores/e2096946/Marvin-Vallecilla">Marvin Vallecilla</a> 2017-2020&nbsp;· DF,MF&nbsp;· Bucaramanga, Atlético Huila, Deportivo Pasto</p><p><a href="/es/jugadores/9e776549/Oscar-Vallecilla">Oscar Vallecilla</a> 2022-2023&nbsp;· FW&nbsp;· Deportes Tolima</p><p><a href="/es/jugadores/d949cc0d/Alveiro-Vallejo">Alveiro Vallejo</a> 2019&nbsp;· FW&nbsp;· Llaneros</p><p><a href="/es/jugadores/75b0200c/Gerardo-Vallejo">Gerardo Vallejo</a> 2003-2014&nbsp;· DF&nbsp;· Deportes Tolima, Águilas Doradas, Colombia</p><p><a href="/es/jugadores/f2c97754/Yoshan-Valois"><strong>Yoshan Valois</strong></a> 2025&nbsp;· MF&nbsp;· Zamora</p><p><a href="/es/jugadores/11eb6754/Cesar-Valoyes">César Valoyes</a> 2015-2017&nbsp;· FW&nbsp;· Independiente Medellín, Ayacucho, Santa Fe, Patriotas FC, Juan Aurich, Atlético Huila, Real Cartagen</p><p><a href="/es/jugadores/79e75919/Diego-Valoyes"><strong>Diego Valoyes</strong></a> 2015-2025&nbsp;· FW,MF&nbsp;· FC Juárez, Talleres, La Equidad, Colombia</p><p><a href="/es/jugadores/015a1808/Jhon-Valoyes">Jhon Valoyes</a> 2024&nbsp;· FW</p><p><a href="/es/jugadores/91ec8fd7/Jimmy-Valoyes"><strong>Jimmy Valoyes</strong></a> 2017-2025&nbsp;· DF&nbsp;· Cienciano, Sport Huancayo, Pirata, Cortuluá, Universidad Técnica de Cajamarca, Deportivo Pasto</p><p><a href="/es/jugadores/e5cf10e8/Pedro-Valoyes">Pedro Valoyes</a> 2016-2022&nbsp;· DF&nbsp;· Once Caldas, Deportivo Pasto, Águilas Doradas</p><p><a href="/es/jugadores/3e872d47/Zamir-Valoyes">Zamir Valoyes</a> 2015-2018&nbsp;· FW&nbsp;· Deportivo La Guaira, Metropolitanos, Caracas, Deportes Tolima, Junior, Deportivo Lara, Deportivo Cal</p><p><a href="/es/jugadores/7bc9579b/Manuela-Vanegas"><strong>Manuela Vanegas</strong></a> 2018-2025&nbsp;· DF&nbsp;· Real Sociedad, Colombia</p><p><a href="/es/jugadores/36c7457a/Oscar-Vanegas"><strong>Oscar Vanegas</strong></a> 2020-2025&nbsp;· DF&nbsp;· Unión Magdalena, Patriotas FC, Millonarios, Toluca, Jaguares de Córdoba</p><p><a href="/es/jugadores/aecff6f2/Ray-Vanegas"><strong>Ray Vanegas</strong></a> 2015-2025&nbsp;· FW,MF&nbsp;· Deportivo Pasto, Jaguares de Córdoba, Once Caldas, Envigado FC, Sport Recife, Universidad César Vall</p><p><a href="/es/jugadores/0b3371ba/Roberto-Vanegas">Roberto Vanegas</a> 2019-2022&nbsp;· MF&nbsp;· Unión Magdalena</p><p><a href="/es/jugadores/bdecb071/Samuel-Vanegas">Samuel Vanegas</a> 2014-2015&nbsp;· DF&nbsp;· Once Caldas, Independiente Medellín, Águilas Doradas, Junior, Barcelona</p><p><a href="/es/jugadores/b030fa90/John-Varela">John Varela</a> 2015-2017&nbsp;· FW&nbsp;· River Plate, Cortuluá, Deportivo Pasto, Águilas Doradas</p><p><a href="/es/jugadores/ba29287e/Andres-Vargas"><strong>Andrés Vargas</strong></a> 2024-2025&nbsp;· MF&nbsp;· Envigado FC</p><p><a href="/es/jugadores/a2659604/Armando-Vargas">Armando Vargas</a> 2015-2019&nbsp;· MF&nbsp;· Santa Fe, La Equidad, Deportes Tolima, Atlético Huila, Deportivo Pasto</p><p><a href="/es/jugadores/004e3d0f/Camilo-Vargas"><strong>Camilo Vargas</strong></a> 2014-2026&nbsp;· GK&nbsp;· Atlas, Santa Fe, Deportivo Cali, Colombia, Atlético Nacional, Argentinos Juniors</p><p><a href="/es/jugadores/954a7d51/Camilo-Vargas"><strong>Camilo Vargas</strong></a> 2025&nbsp;· MF&nbsp;· Yaracuyanos FC</p><p><a href="/es/jugadores/fd952627/Christian-Vargas"><strong>Christian Vargas</strong></a> 2014-2023&nbsp;· GK&nbsp;· Atlético Nacional, Bucaramanga, Millonarios, Deportes Tolima, Atlético Huila, Águilas Doradas</p><p><a href="/es/jugadores/7887fa26/Eder-Vargas">Eder Vargas</a> 2015&nbsp;· MF</p><p><a href="/es/jugadores/37a8a372/Fabian-Vargas">Fabián Vargas</a> 2009-2018&nbsp;· MF&nbsp;· Boca Juniors, La Equidad, Almería, Independiente, Millonarios, AEK Athens, Internacional, Barcelona</p><p><a href="/es/jugadores/4b5d64b9/Gustavo-Vargas">Gustavo Vargas</a> 2022&nbsp;· DF</p><p><a href="/es/jugadores/758de7b4/Kerwin-Vargas"><strong>Kerwin Vargas</strong></a> 2022-2025&nbsp;· FW,MF&nbsp;· Charlotte FC</p><p><a href="/es/jugadores/52a6f8c6/Leandro-Vargas">Leandro Vargas</a> 2015-2016&nbsp;· FW&nbsp;· Junior, Cúcuta Deportivo, Llaneros</p><p><a href="/es/jugadores/2666e9cb/Yeiner-Vargas">Yeiner Vargas</a> 2021-2023&nbsp;· MF&nbsp;· Atlético Huila</p><p><a href="/es/jugadores/6c22ed4b/Andres-Varon">Andrés Varon</a> 2018&nbsp;· DF&nbsp;· Boyacá Chicó</p><p><a href="/es/jugadores/028baa15/Yineth-Varon">Yineth Varón</a> 2011&nbsp;· GK</p><p><a href="/es/jugadores/d2754705/Juan-Vasco">Juan Vasco</a> 2022&nbsp;· MF</p><p><a href="/es/jugadores/6d2b0812/Anllelo-Vasquez">Anllelo Vásquez</a> 2023&nbsp;· DF</p><p><a href="/es/jugadores/fb32f91e/Anthony-Vasquez"><strong>Anthony Vásquez</strong></a> 2021-2025&nbsp;· FW&nbsp;· Águilas Doradas</p><p><a href="/es/jugadores/e5b1d154/Breiner-Vasquez">Breiner Vásquez</a> 2022&nbsp;· DF</p><p><a href="/es/jugadores/6fe69504/Canchila-Vasquez">Canchila Vásquez</a> 2016&nbsp;· DF&nbsp;· Fortaleza FC</p><p><a href="/es/jugadores/fac1f795/Devis-Vasquez"><strong>Devis Vásquez</strong></a> 2016-2026&nbsp;· GK&nbsp;· Empoli, Guaraní, Sheffield Wednesday, Ascoli</p><p><a href="/es/jugadores/b6832e5e/Jhon-Vasquez"><strong>Jhon Vasquez</strong></a> 2015-2025&nbsp;· FW,MF&nbsp;· Bucaramanga, Deportivo Cali, Alianza Petrolera, Independiente Medellín, Goiás, Ceará, Junior</p><p><a href="/es/jugadores/acd8601f/Juan-Vasquez">Juan Vásquez</a> 2021&nbsp;· GK</p><p><a href="/es/jugadores/f205b7b9/Juan-Vasquez"><strong>Juan Vásquez</strong></a> 2022-2025&nbsp;· FW&nbsp;· Llaneros, Deportivo Pasto</p><p><a href="/es/jugadores/b9a0ee18/Omar-Vasquez"><strong>Omar Vásquez</strong></a> 2012-2025&nbsp;· MF&nbsp;· Alianza Universidad, Millonarios, Patriotas FC, Royal Parí, Águilas Doradas, La Equidad, Querétaro</p><p><a href="/es/jugadores/7d340d03/Oscar-Vega"><strong>Oscar Vega</strong></a> 2025&nbsp;· DF&nbsp;· Llaneros</p><p><a href="/es/jugadores/cbed8f9e/Stiven-Vega"><strong>Stiven Vega</strong></a> 2015-2025&nbsp;· DF,MF&nbsp;· Millonarios</p><p><a href="/es/jugadores/35b18244/Ivan-Velandia-Hoyos"><strong>Ivan Velandia Hoyos</strong></a> 2018-2025&nbsp;· GK&nbsp;· ESA Linas-Montlhéry</p><p><a href="/es/jugadores/5adb19ad/Edwin-Velasco"><strong>Edwin Velasco</strong></a> 2015-2025&nbsp;· DF&nbsp;· Deportivo Pasto, América de Cali, Cortuluá, Junior, Atlético Nacional, Once Caldas</p><p><a href="/es/jugadores/fd56fdcf/Jeyson-Velasco">Jeyson Velasco</a> 2023&nbsp;· MF&nbsp;· Once Caldas</p><p><a href="/es/jugadores/77991675/Kevin-Velasco"><strong>Kevin Velasco</strong></a> 2018-2025&nbsp;· DF,MF&nbsp;· Puebla, Athletico Paranaense, Deportivo Cali</p><p><a href="/es/jugadores/a28e5005/Jhon-Velasquez"><strong>Jhon Velásquez</strong></a> 2015-2025&nbsp;· MF&nbsp;· Farense, Santa Fe, Patriotas FC</p><p><a href="/es/jugadores/de253239/Orianica-Velasquez">Oriánica Velásquez</a> 2011-2021&nbsp;· FW&nbsp;· Colombia</p><p><a href="/es/jugadores/14a8c907/Samuel-Velasquez"><strong>Samuel Velásquez</strong></a> 2022-2025&nbsp;· DF&nbsp;· Deportes Tolima, Atlético Nacional</p><p><a href="/es/jugadores/3477901e/Sebastian-Velasquez"><strong>Sebastián Velásquez</strong></a> 2012-2025&nbsp;· MF&nbsp;· Greenville Triumph, Real Monarchs, Real Salt Lake, El Paso Locomotive, Indy Eleven, Rayo OKC, New Yo</p><p><a href="/es/jugadores/7fedbb9c/Yilmar-Velasquez"><strong>Yílmar Velásquez</strong></a> 2019-2025&nbsp;· MF&nbsp;· Santa Fe, Deportivo Pereira, Atlético Nacional</p><p><a href="/es/jugadores/261f4132/Franco-Velazquez">Franco Velázquez</a> 2017-2018&nbsp;· MF&nbsp;· Envigado FC</p><p><a href="/es/jugadores/2da4efb8/Ivan-Velez">Iván Vélez</a> 2015-2018&nbsp;· DF&nbsp;· América de Cali, Junior, Deportes Quindío, Once Caldas, Independiente</p><p><a href="/es/jugadores/c40fd3bb/Jhon-Velez"><strong>Jhon Vélez</strong></a> 2023-2025&nbsp;· MF&nbsp;· Junior</p><p><a href="/es/jugadores/2be70041/Juan-Velez">Juan Vélez</a> 2021&nbsp;· MF&nbsp;· Alianza Petrolera</p><p><a href="/es/jugadores/5b9e4dc8/Isaac-Venecia"><strong>Isaac Venecia</strong></a> 2025&nbsp;· DF&nbsp;· Deportivo Cali</p><p><a href="/es/jugadores/408b59ae/Edwin-Vente"><strong>Edwin Venté</strong></a> 2019-2020&nbsp;· DF&nbsp;· Gil Vicente</p><p><a href="/es/jugadores/80c718dd/Brayan-Vera"><strong>Brayan Vera</strong></a> 2018-2025&nbsp;· DF&nbsp;· Real Salt Lake, América de Cali, Cosenza, Lecce</p><p><a href="/es/jugadores/567cd772/Jefferson-Verdecia">Jefferson Verdecia</a> 2015&nbsp;· DF&nbsp;· Boyacá Chicó</p><p><a href="/es/jugadores/0deb24a5/Cristian-Vergara"><strong>Cristian Vergara</strong></a> 2025&nbsp;· FW&nbsp;· Alianza Petrolera</p><p><a href="/es/jugadores/7faaf973/Duvan-Vergara"><strong>Duván Vergara</strong></a> 2015-2025&nbsp;· FW,MF&nbsp;· América de Cali, Envigado FC, Monterrey, Santos Laguna, Rosario Central</p><p><a href="/es/jugadores/04798d17/Hasan-Vergara">Hasan Vergara</a> 2019-2023&nbsp;· FW&nbsp;· Deportivo Pasto</p><p><a href="/es/jugadores/cdff3cac/Jherson-Vergara">Jherson Vergara</a> 2014-2017&nbsp;· DF&nbsp;· Livorno, Arsenal Tula, Avellino</p><p><a href="/es/jugadores/a4ec89ab/Juan-Vergara">Juan Vergara</a> 2018&nbsp;· MF</p><p><a href="/es/jugadores/7d66ef2b/Luis-Vergara">Luis Vergara</a> 2015-2020&nbsp;· DF&nbsp;· Cúcuta Deportivo</p><p><a href="/es/jugadores/70143bad/Rodrigo-Vergara">Rodrigo Vergara</a> 2015&nbsp;· FW</p><p><a href="/es/jugadores/6707921a/Santiago-Vergara">Santiago Vergara</a> 2022&nbsp;· DF&nbsp;· Cortuluá</p><p><a href="/es/jugadores/2956b247/Duvan-Viafara">Duvan Viáfara</a> 2021-2024&nbsp;· DF&nbsp;· Once Caldas, Jaguares de Córdoba</p><p><a href="/es/jugadores/d50dee5c/Efrain-Viafara">Efraín Viáfara</a> 2015-2016&nbsp;· FW&nbsp;· Águilas Doradas, La Equidad, Sport Áncash, Boyacá Chicó, Deportes Tolima, Santa Fe, Deportivo Pasto,</p><p><a href="/es/jugadores/c54a80ba/Fabian-Viafara"><strong>Fabián Viáfara</strong></a> 2014-2025&nbsp;· DF&nbsp;· Deportivo Cali, Junior, Águilas Doradas, Santa Fe, Deportivo Pasto, La Equidad</p><p><a href="/es/jugadores/79344ebf/Jhon-Viafara">Jhon Viáfara</a> 2005-2015&nbsp;· MF&nbsp;· Southampton, La Equidad, Once Caldas, Independiente Medellín, Deportivo Cali, Deportivo Pereira, Por</p><p><a href="/es/jugadores/9bae8633/Dewar-Victoria"><strong>Dewar Victoria</strong></a> 2022-2025&nbsp;· MF&nbsp;· Millonarios, Patriotas FC</p><p><a href="/es/jugadores/a0a919dc/Gustavo-Victoria">Gustavo Victoria</a> 2001-2008&nbsp;· DF,MF&nbsp;· Çaykur Rizespor, Deportivo Pereira, Ayacucho, Galatasaray, Gaziantepspor, América de Cali</p><p><a href="/es/jugadores/bfc2273b/Gerson-Vidal">Gerson Vidal</a> 2016&nbsp;· FW&nbsp;· Jaguares de Córdoba, Deportivo Cali</p><p><a href="/es/jugadores/4212b240/Ingrid-Vidal"><strong>Ingrid Vidal</strong></a> 2011-2016&nbsp;· FW&nbsp;· Colombia</p><p><a href="/es/jugadores/175dffbf/Juan-Vidal">Juan Vidal</a> 2021&nbsp;· FW</p><p><a href="/es/jugadores/0e76b022/Mayer-Vidal">Mayer Vidal</a> 2019-2022&nbsp;· FW&nbsp;· Patriotas FC</p><p><a href="/es/jugadores/3b783b0b/Nicolas-Vidal">Nicolás Vidal</a> 2017-2018&nbsp;· GK</p><p><a href="/es/jugadores/82b24a44/Onel-Vidal">Onel Vidal</a> 2016&nbsp;· FW&nbsp;· Jaguares de Córdoba</p><p><a href="/es/jugadores/f17530e6/Leon-Villa">León Villa</a> 1990&nbsp;· DF</p><p><a href="/es/jugadores/98a4ee7b/Matias-Villa"><strong>Matías Villa</strong></a> 2025&nbsp;· GK&nbsp;· Envigado FC</p><p><a href="/es/jugadores/df454699/Sebastian-Villa"><strong>Sebastián Villa</strong></a> 2016-2025&nbsp;· FW,MF&nbsp;· Independiente Rivadavia, Boca Juniors, Deportes Tolima, Beroe, Colombia</p><p><a href="/es/jugadores/6dac85f8/Oswaldo-Villada">Oswaldo Villada</a> 2015&nbsp;· GK</p><p><a href="/es/jugadores/136e3878/Breider-Villalobos">Breider Villalobos</a> 2022&nbsp;· MF&nbsp;· Cortuluá</p><p><a href="/es/jugadores/0747e704/Elian-Villalobos"><strong>Elian Villalobos</strong></a> 2022-2024&nbsp;· MF&nbsp;· Jaguares de Córdoba</p><p><a href="/es/jugadores/4e40d555/Alejandro-Villareal"><strong>Alejandro Villareal</strong></a> 2023-2024&nbsp;· FW</p><p><a href="/es/jugadores/8c81112f/Sergio-Villareal"><strong>Sergio Villareal</strong></a> 2015-2022&nbsp;· MF&nbsp;· Millonarios</p><p><a href="/es/jugadores/f1ec5823/Ricardo-Villarraga">Ricardo Villarraga</a> 2015-2017&nbsp;· DF&nbsp;· Santa Fe, Deportivo Pasto, Atlético Huila</p><p><a href="/es/jugadores/9200fab7/Neiser-Villarreal"><strong>Néiser Villarreal</strong></a> 2024-2025&nbsp;· FW&nbsp;· Millonarios</p><p><a href="/es/jugadores/e64efff6/Charly-Villegas"><strong>Charly Villegas</strong></a> 2025&nbsp;· FW&nbsp;· Alianza Petrolera</p><p><a href="/es/jugadores/ffce4626/Paul-Villero"><strong>Paul Villero</strong></a> 2023&nbsp;· FW&nbsp;· Ponte Preta</p><p><a href="/es/jugadores/752d6892/Sebastian-Villota">Sebastián Villota</a> 2015-2021&nbsp;· MF&nbsp;· Deportivo Pasto, Jaguares de Córdoba, La Equidad, Patriotas FC, Unión Magdalena, Oriente Petrolero</p><p><a href="/es/jugadores/b78cc65d/Kleyverson-Viloria">Kleyverson Viloria</a> 2022&nbsp;· MF</p><p><a href="/es/jugadores/6c774d22/Achito-Vivas">Achito Vivas</a> 1962&nbsp;· GK</p><p><a href="/es/jugadores/0f550d9d/Jose-Vivas">José Vivas</a> 2019&nbsp;· MF</p><p><a href="/es/jugadores/b4d9dbde/Alexander-Viveros">Alexander Viveros</a> 2002-2006&nbsp;· DF,MF&nbsp;· Deportivo Cali, Racing Club, Boyacá Chicó, Nantes, Boavista, Grasshopper</p><p><a href="/es/jugadores/9259ee80/Jefferson-Viveros">Jefferson Viveros</a> 2017&nbsp;· FW&nbsp;· Comerciantes Unidos</p><p><a href="/es/jugadores/01653a29/Jhonier-Viveros"><strong>Jhonier Viveros</strong></a> 2016-2024&nbsp;· MF&nbsp;· Jaguares de Córdoba, Once Caldas, Bucaramanga, Cortuluá, América de Cali, Patriotas FC, Sport Huanca</p><p><a href="/es/jugadores/f40b94ba/Kevin-Viveros"><strong>Kevin Viveros</strong></a> 2018-2025&nbsp;· FW&nbsp;· Atlético Nacional, Carabobo, La Equidad, Deportivo Cali, América de Cali</p><p><a href="/es/jugadores/7dc863c0/Sebastian-Viveros"><strong>Sebastián Viveros</strong></a> 2024-2025&nbsp;· MF&nbsp;· San Antonio Bulo Bulo</p><p><a href="/es/jugadores/13be0fd2/Johan-Wallens"><strong>Johan Wallens</strong></a> 2016-2025&nbsp;· GK,MF&nbsp;· Alianza Petrolera, Deportivo Cali</p><p><a href="/es/jugadores/e6013b41/John-Wilmar-Perez">John Wilmar Pérez</a> 1998-2002&nbsp;· DF,MF&nbsp;· Columbus Crew</p><p><a href="/es/jugadores/7d4fb645/Sebastian-Yabur"><strong>Sebastián Yabur</strong></a> 2018-2024&nbsp;· MF&nbsp;· Metropolitanos, Atlético Nacional, El Farolito</p><p><a href="/es/jugadores/89934724/Luis-Yanes">Luis Yanes</a> 2007-2008&nbsp;· FW&nbsp;· Santa Fe, Junior, Boyacá Chicó, La Equidad</p><p><a href="/es/jugadores/78d1d687/Victor-Yanez">Víctor Yánez</a> 2022-2023&nbsp;· DF&nbsp;· Deportivo Pasto</p><p><a href="/es/jugadores/63b5dd66/Angie-Yanten"><strong>Angie Yantén</strong></a> 2022-2024&nbsp;· DF</p><p><a href="/es/jugadores/a7562b55/Mario-Yepes">Mario Yepes</a> 2001-2015&nbsp;· DF&nbsp;· Paris Saint-Germain, Nantes, Chievo, Milan, San Lorenzo, Atalanta, Colombia, River Plate</p><p><a href="/es/jugadores/76362ee2/Yesid-Yepes">Yesid Yepes</a> 2021&nbsp;· MF</p><p><a href="/es/jugadores/8867819a/Ignacio-Yepez"><strong>Ignacio Yepez</strong></a> 2020-2025&nbsp;· FW&nbsp;· Miramar Misiones, Cerro</p><p><a href="/es/jugadores/2d925364/Jorge-Yepez">Jorge Yepez</a> 2015-2016&nbsp;· MF&nbsp;· Guayaquil City</p><p><a href="/es/jugadores/85222ee5/Jesus-Zabala">Jesús Zabala</a> 2021-2022&nbsp;· FW</p><p><a href="/es/jugadores/b2b59592/Yeison-Zabaleta">Yeison Zabaleta</a> 2018&nbsp;· MF&nbsp;· Leones FC</p><p><a href="/es/jugadores/23ddd638/Carlos-Zambrano"><strong>Carlos Zambrano</strong></a> 2024&nbsp;· MF</p><p><a href="/es/jugadores/38e0dd9d/Henry-Zambrano">Henry Zambrano</a> 1999-2002&nbsp;· FW&nbsp;· Boyacá Chicó, Colorado Rapids, La Serena, MetroStars, D.C. United</p><p><a href="/es/jugadores/2bfd8568/Brayan-Zamora">Brayan Zamora</a> 2018&nbsp;· MF</p><p><a href="/es/jugadores/905e95ba/Damir-Zamora">Damir Zamora</a> 2017&nbsp;· DF</p><p><a href="/es/jugadores/ae8f76c6/Alexis-Zapata"><strong>Alexis Zapata</strong></a> 2014-2025&nbsp;· MF&nbsp;· Santa Fe, Emelec, Envigado FC, América de Cali, Perugia, Millonarios</p><p><a href="/es/jugadores/26687837/Anderson-Zapata">Anderson Zapata</a> 2014-2018&nbsp;· DF,MF&nbsp;· Águilas Doradas, Patriotas FC, América de Cali, Millonarios</p><p><a href="/es/jugadores/85f5e742/William-Zapata-Brand">William Zapata Brand</a> 2015&nbsp;· FW&nbsp;· América de Cali, Independiente Medellín, Santa Fe, Cúcuta Deportivo, Cienciano, Boyacá Chicó, Jaguar</p><p><a href="/es/jugadores/36883310/Breyner-Zapata">Breyner Zapata</a> 2020&nbsp;· MF&nbsp;· Patriotas FC</p><p><a href="/es/jugadores/b1deecf8/Cristian-Zapata"><strong>Cristián Zapata</strong></a> 2005-2025&nbsp;· DF&nbsp;· Bucaramanga, Udinese, Milan, San Lorenzo, Atlético Nacional, Colombia, Genoa, Villarreal</p><p><a href="/es/jugadores/dc98a279/Daniel-Zapata"><strong>Daniel Zapata</strong></a> 2023-2024&nbsp;· FW&nbsp;· Envigado FC</p><p><a href="/es/jugadores/d3de9af0/Duvan-Zapata"><strong>Duván Zapata</strong></a> 2013-2025&nbsp;· FW&nbsp;· Torino, Atalanta, Udinese, América de Cali, Napoli, Estudiantes–LP, Colombia, Sampdoria</p><p><a href="/es/jugadores/d261f23e/Edgar-Zapata">Edgar Zapata</a> 2005-2007&nbsp;· DF&nbsp;· Deportivo Cali, Necaxa, Atlético Nacional, Veracruz</p><p><a href="/es/jugadores/a3ecaa06/Eduardo-Zapata"><strong>Eduardo Zapata</strong></a> 2019-2025&nbsp;· FW&nbsp;· Metropolitanos</p><p><a href="/es/jugadores/590cdede/Hansel-Zapata">Hansel Zapata</a> 2017-2023&nbsp;· FW,MF&nbsp;· La Equidad, Aluminium Arak, Slaven Belupo, Millonarios, Once Caldas</p><p><a href="/es/jugadores/f08505db/Jefry-Zapata"><strong>Jefry Zapata</strong></a> 2024-2025&nbsp;· MF&nbsp;· Once Caldas</p><p><a href="/es/jugadores/98029498/Juan-Zapata">Juan Zapata</a> 2019&nbsp;· MF&nbsp;· Jaguares de Córdoba</p><p><a href="/es/jugadores/fea73077/Juan-Zapata"><strong>Juan Zapata</strong></a> 2019-2025&nbsp;· MF&nbsp;· Atlético Nacional, Envigado FC, Atlas</p><p><a href="/es/jugadores/2f0af88a/Oscar-Zapata">Oscar Zapata</a> 2018&nbsp;· DF</p><p><a href="/es/jugadores/fa1ad923/Robinson-Zapata">Róbinson Zapata</a> 2007-2020&nbsp;· GK&nbsp;· Steaua București, Santa Fe, Cúcuta Deportivo, Águilas Doradas, Jaguares de Córdoba, Deportivo Pereir</p><p><a href="/es/jugadores/2d6a53ad/Yorman-Zapata"><strong>Yorman Zapata</strong></a> 2023-2025&nbsp;· FW&nbsp;· O'Higgins, Deportes Magallanes, Defensa y Justicia</p><p><a href="/es/jugadores/de99f409/Carlos-Zarama">Carlos Zarama</a> 2019&nbsp;· MF</p><p><a href="/es/jugadores/6548e1f1/Aldair-Zarate"><strong>Aldair Zárate</strong></a> 2023-2025&nbsp;· MF&nbsp;· Bucaramanga</p><p><a href="/es/jugadores/a5a8b562/Eduard-Zea">Eduard Zea</a> 2015-2017&nbsp;· DF&nbsp;· Deportes Quindío, PS Kemi Kings, Arizona United, La Equidad, América de Cali</p><p><a href="/es/jugadores/4d601806/Jhon-Zea">Jhon Zea</a> 2015-2016&nbsp;· DF&nbsp;· Envigado FC, Águilas Doradas, Atlético Huila, La Equidad</p><p><a href="/es/jugadores/4b642d16/Joseph-Zea"><strong>Joseph Zea</strong></a> 2025&nbsp;· FW&nbsp;· Santa Fe</p><p><a href="/es/jugadores/47c0fcef/Julian-Zea">Julián Zea</a> 2018-2022&nbsp;· FW&nbsp;· Alianza Petrolera, Deportivo Cali</p><p><a href="/es/jugadores/9e6e9b96/Diego-Zipa">Diego Zipa</a> 2017&nbsp;· MF</p><p><a href="/es/jugadores/881fe7e6/Jorge-Zules">Jorge Zules</a> 2019-2020&nbsp;· DF</p><p><a href="/es/jugadores/e6146ab5/Isaac-Zuleta">Isaac Zuleta</a> 2023-2024&nbsp;· MF</p><p><a href="/es/jugadores/2b2c7d68/Mateo-Zuleta"><strong>Mateo Zuleta</strong></a> 2024-2025&nbsp;· FW&nbsp;· Once Caldas, América de Cali, Atlético Goianiense</p><p><a href="/es/jugadores/bac9d763/Alejandro-Zuluaga">Alejandro Zuluaga</a> 2016&nbsp;· DF&nbsp;· Once Caldas</p><p><a href="/es/jugadores/a6cd7110/Francisco-Zuluaga">Francisco Zuluaga</a> 1962&nbsp;· DF</p><p><a href="/es/jugadores/77f03dbc/Jefferson-Zuluaga">Jefferson Zuluaga</a> 2022&nbsp;· DF</p><p><a href="/es/jugadores/a29a1195/Cristian-Zuniga"><strong>Cristian Zuñiga</strong></a> 2020&nbsp;· FW&nbsp;· Alianza Lima</p><p><a href="/es/jugadores/af89c75e/Jose-Zuniga"><strong>José Zúñiga</strong></a> 2022-2025&nbsp;· FW&nbsp;· Tijuana, Querétaro</p><p><a href="/es/jugadores/06b34f37/Juan-Zuniga">Juan Zúñiga</a> 2008-2018&nbsp;· DF,MF&nbsp;· Napoli, Atlético Nacional, Siena, Watford, Colombia, Bologna</p><p><a href="/es/jugadores/c0af4334/Juan-Carlos-Moreno-Zuniga">Juan Carlos Moreno Zúñiga</a> 2016&nbsp;· MF&nbsp;· Fortaleza FC</p>
-		
-    </div>
-    """
+from roster_crawler import crawl_rosters, escribir_csv, escribir_db, parse_roster
 
-soup = BeautifulSoup(html_content, 'html.parser')
+# El directorio de jugadores se descarga y parsea en streaming (roster_crawler.py)
+# en lugar de pegar aquí el HTML de la página a mano.
 
-jugadores_activos = []
-for p in soup.find_all('p'):
-    strong = p.find('strong')
-    if strong:
-        a = p.find('a')
-        if a:
-            nombre = strong.get_text(strip=True)
-            href = a['href']
-            jugadores_activos.append({'nombre': nombre, 'href': "https://fbref.com"+href})
+def leer_html_local(ruta, chunk_size=64 * 1024):
+    """Trozos de una página de directorio guardada en disco"""
+    with open(ruta, encoding='utf-8') as f:
+        while True:
+            chunk = f.read(chunk_size)
+            if not chunk:
+                break
+            yield chunk
 
-# Imprimir los resultados
-print(f"Jugadores activos encontrados: {len(jugadores_activos)}")
-for jugador in jugadores_activos:
-    print(f"{jugador['nombre']}: {jugador['href']}")
+def cli(argv=None, prog=None):
+    parser = argparse.ArgumentParser(prog=prog, description="Genera el CSV de jugadores desde el directorio de fbref")
+    parser.add_argument('--paises', nargs='+', default=['COL'], help="códigos de país de fbref")
+    parser.add_argument('--todos', action='store_true', help="incluir jugadores no activos")
+    parser.add_argument('--html', help="página de directorio guardada (sin descargar)")
+    parser.add_argument('--csv', default='jugadores_activos_colombianos.csv')
+    parser.add_argument('--db', help="además guarda los jugadores en la tabla roster de esta base")
+    args = parser.parse_args(argv)
 
-# Guardar en un archivo CSV
-import pandas as pd
-df = pd.DataFrame(jugadores_activos)
-df.to_csv('jugadores_activos_colombianos.csv', index=False)
+    if args.html:
+        jugadores = (j for j in parse_roster(leer_html_local(args.html), args.paises[0])
+                     if j.activo or args.todos)
+    else:
+        jugadores = crawl_rosters(args.paises, solo_activos=not args.todos)
+
+    if args.db:
+        jugadores = list(jugadores)
+        print(f"Jugadores guardados en roster: {escribir_db(jugadores, args.db)}")
+    total = escribir_csv(jugadores, args.csv)
+    print(f"Jugadores activos encontrados: {total}" if not args.todos else f"Jugadores encontrados: {total}")
+    print(f"✔ CSV guardado en {args.csv}")
+
+if __name__ == "__main__":
+    cli()